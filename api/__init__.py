@@ -1,6 +1,12 @@
 # api/__init__.py
 # This file marks the api directory as a Python package
 
-from api.routes import register_api_routes
+__all__ = ['register_api_routes']
 
-__all__ = ['register_api_routes']
\ No newline at end of file
+
+def __getattr__(name):
+    # Imported on first access so api submodules can load without the analysis stack
+    if name == 'register_api_routes':
+        from api.routes import register_api_routes
+        return register_api_routes
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
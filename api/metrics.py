@@ -0,0 +1,233 @@
+# api/metrics.py
+# Prometheus-style metrics for VisionShield
+
+import time
+import threading
+from contextlib import contextmanager
+from flask import Response, g, request
+
+# Latency buckets in seconds, from fast API reads up to long video analyses
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value):
+    """Escape a label value for the text exposition format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, values, extra=()):
+    """Render {name="value",...} for a sample, or nothing if unlabelled"""
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together by the /metrics endpoint"""
+    
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+        
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+            
+    def render(self):
+        """Render every metric in the Prometheus text format"""
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric:
+    """Base class for labelled metrics"""
+    
+    type_name = 'untyped'
+    
+    def __init__(self, name, documentation, labelnames=(), registry=REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+            
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+        
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in items]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    
+    type_name = 'counter'
+    
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    
+    type_name = 'gauge'
+    
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+            
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+            
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets"""
+    
+    type_name = 'histogram'
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=REGISTRY):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+            
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of a block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+            
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+# Metrics are kept per process; scrape every worker or run a single one
+HTTP_REQUESTS = Counter(
+    'visionshield_http_requests_total', 'HTTP requests handled',
+    ['endpoint', 'method', 'status']
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    'visionshield_http_request_duration_seconds', 'HTTP request latency',
+    ['endpoint']
+)
+ANALYSES = Counter(
+    'visionshield_analyses_total', 'Video analyses finished, by outcome (completed, reused or error)',
+    ['outcome']
+)
+STAGE_SECONDS = Histogram(
+    'visionshield_stage_duration_seconds', 'Time spent in each stage of a video analysis',
+    ['stage']
+)
+CACHE_HITS = Counter(
+    'visionshield_cache_hits_total', 'Analyses answered or annotated from a cache',
+    ['cache']
+)
+QUEUE_DEPTH = Gauge(
+    'visionshield_analysis_queue_depth', 'Background analyses waiting for a worker'
+)
+IN_PROGRESS = Gauge(
+    'visionshield_analyses_in_progress', 'Video analyses currently running'
+)
+MODEL_LOAD_SECONDS = Gauge(
+    'visionshield_model_load_seconds', 'Time taken by the last model load'
+)
+ACTIVE_MODEL = Gauge(
+    'visionshield_active_model', 'Model version results are stamped with (1 for the active version)',
+    ['version']
+)
+SHADOW_SCORES = Counter(
+    'visionshield_shadow_scores_total', 'Shadow scoring outcomes (agree, disagree, error or skipped)',
+    ['version', 'outcome']
+)
+SHADOW_SECONDS = Histogram(
+    'visionshield_shadow_analysis_seconds', 'Analysis time of shadow-scored videos, by role (primary or shadow)',
+    ['version', 'role']
+)
+SHADOW_PROBABILITY_DELTA = Histogram(
+    'visionshield_shadow_probability_delta', 'Absolute fake probability difference between shadow and active model',
+    ['version'], buckets=(0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0)
+)
+
+
+def observe_stages(timings):
+    """Record a dict of stage name -> seconds in the stage histogram"""
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.observe(seconds, stage=stage)
+
+
+def register_metrics(app):
+    """Record request metrics and expose them at /metrics"""
+    
+    @app.before_request
+    def _start_timer():
+        g.metrics_start = time.perf_counter()
+        
+    @app.after_request
+    def _record_request(response):
+        start = g.pop('metrics_start', None)
+        endpoint = request.endpoint or 'unmatched'
+        if start is not None:
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint=endpoint)
+        HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+        return response
+        
+    @app.route('/metrics')
+    def metrics():
+        return Response(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
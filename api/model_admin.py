@@ -0,0 +1,71 @@
+# api/model_admin.py
+# Admin endpoints for switching and shadowing model versions at runtime
+
+from flask import Blueprint, request, jsonify
+
+from api.profiling import require_admin_token
+from api.routes import get_model_registry
+
+model_admin_bp = Blueprint('model_admin', __name__, url_prefix='/api/admin/models')
+model_admin_bp.before_request(require_admin_token)
+
+
+@model_admin_bp.route('')
+def model_status():
+    """List model versions and show the active and shadow model"""
+    return jsonify({'status': 'success', 'models': get_model_registry().status()})
+
+
+@model_admin_bp.route('/activate', methods=['POST'])
+def activate_model():
+    """
+    Swap the active model for another version
+    
+    The version is loaded and warmed up in the background; analyses keep using
+    the current model until the swap. Poll GET /api/admin/models to see it.
+    Once swapped, the choice is persisted and the other workers follow it.
+    """
+    data = request.get_json(silent=True) or {}
+    version = data.get('version')
+    if not version:
+        return jsonify({'status': 'error', 'message': 'version is required'}), 400
+    if not isinstance(version, str):
+        return jsonify({'status': 'error', 'message': 'version must be a string'}), 400
+        
+    registry = get_model_registry()
+    try:
+        registry.activate(version)
+    except KeyError as e:
+        return jsonify({'status': 'error', 'message': e.args[0]}), 404
+    return jsonify({'status': 'success', 'message': f"Activating model version {version}",
+                    'models': registry.status()}), 202
+
+
+@model_admin_bp.route('/shadow', methods=['POST'])
+def shadow_model():
+    """Start shadow scoring with a candidate version, or stop it with version null"""
+    data = request.get_json(silent=True) or {}
+    version = data.get('version')
+    if version is not None and not isinstance(version, str):
+        return jsonify({'status': 'error', 'message': 'version must be a string or null'}), 400
+    try:
+        rate = float(data.get('rate', 0.1))
+    except (TypeError, ValueError):
+        return jsonify({'status': 'error', 'message': 'rate must be a number'}), 400
+    if not 0 <= rate <= 1:
+        return jsonify({'status': 'error', 'message': 'rate must be between 0 and 1'}), 400
+        
+    registry = get_model_registry()
+    try:
+        registry.set_shadow(version, rate)
+    except KeyError as e:
+        return jsonify({'status': 'error', 'message': e.args[0]}), 404
+    if version is None:
+        return jsonify({'status': 'success', 'message': 'Shadow scoring stopped', 'models': registry.status()})
+    return jsonify({'status': 'success', 'message': f"Loading shadow model version {version}",
+                    'models': registry.status()}), 202
+
+
+def register_model_admin_routes(app):
+    """Register the model admin routes with the Flask app"""
+    app.register_blueprint(model_admin_bp)
@@ -0,0 +1,162 @@
+# api/profiling.py
+# Opt-in profiling of individual video analyses
+
+import os
+import hmac
+import json
+import time
+import random
+import pstats
+import cProfile
+import threading
+from contextlib import contextmanager
+from flask import Blueprint, request, jsonify, send_from_directory, current_app
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
+
+PROFILE_HEADER = 'X-VisionShield-Profile'
+
+# Only one torch.profiler session can be active per process
+_torch_profiler_lock = threading.Lock()
+
+
+def profile_dir(upload_dir, video_id):
+    """Folder holding the profiling traces of a video"""
+    return os.path.join(upload_dir, f"{video_id}_profile")
+
+
+def _token_matches(token):
+    """Check a token against the configured ADMIN_TOKEN (never matches if unset)"""
+    admin_token = current_app.config['VISIONSHIELD_CONFIG'].ADMIN_TOKEN
+    return bool(admin_token and token) and hmac.compare_digest(token, admin_token)
+
+
+def profile_requested(req):
+    """
+    Check whether a request asked for profiling
+    
+    The profiling header must carry the admin token, so clients cannot make
+    arbitrary requests expensive.
+    """
+    return _token_matches(req.headers.get(PROFILE_HEADER, ''))
+
+
+def should_profile(config, requested=False):
+    """Decide whether to profile an analysis: on request or by sampling rate"""
+    return requested or (config.PROFILE_SAMPLE_RATE > 0 and random.random() < config.PROFILE_SAMPLE_RATE)
+
+
+@contextmanager
+def profile_analysis(output_dir, video_id):
+    """
+    Profile a block with cProfile and torch.profiler and save the traces
+    
+    Writes profile.pstats, trace.json (Chrome trace format, open in
+    chrome://tracing or Perfetto) and summary.json into output_dir. If another
+    analysis holds the torch profiler, only the cProfile data is recorded.
+    """
+    import torch
+    
+    os.makedirs(output_dir, exist_ok=True)
+    use_torch = _torch_profiler_lock.acquire(blocking=False)
+    torch_profiler = None
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    
+    try:
+        if use_torch:
+            activities = [torch.profiler.ProfilerActivity.CPU]
+            if torch.cuda.is_available():
+                activities.append(torch.profiler.ProfilerActivity.CUDA)
+            torch_profiler = torch.profiler.profile(activities=activities)
+            torch_profiler.__enter__()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            if torch_profiler is not None:
+                torch_profiler.__exit__(None, None, None)
+                
+        wall_time = time.perf_counter() - start
+        profiler.dump_stats(os.path.join(output_dir, 'profile.pstats'))
+        files = ['profile.pstats']
+        if torch_profiler is not None:
+            torch_profiler.export_chrome_trace(os.path.join(output_dir, 'trace.json'))
+            files.append('trace.json')
+            
+        stats = pstats.Stats(profiler)
+        top_functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:20]
+        summary = {
+            'video_id': video_id,
+            'created_at': int(time.time() * 1000),
+            'wall_time': wall_time,
+            'files': files + ['summary.json'],
+            'top_functions': [
+                {
+                    'function': f"{filename}:{line}({name})",
+                    'calls': calls,
+                    'cumulative_time': cumulative
+                }
+                for (filename, line, name), (_, calls, _, cumulative, _) in top_functions
+            ]
+        }
+        with open(os.path.join(output_dir, 'summary.json'), 'w') as f:
+            json.dump(summary, f, indent=2)
+    finally:
+        if use_torch:
+            _torch_profiler_lock.release()
+
+
+@admin_bp.before_request
+def require_admin_token():
+    """Reject admin requests without a valid bearer token"""
+    if not current_app.config['VISIONSHIELD_CONFIG'].ADMIN_TOKEN:
+        return jsonify({'status': 'error', 'message': 'Admin endpoints are disabled (ADMIN_TOKEN not set)'}), 403
+    auth = request.headers.get('Authorization', '')
+    token = auth[len('Bearer '):] if auth.startswith('Bearer ') else ''
+    if not _token_matches(token):
+        return jsonify({'status': 'error', 'message': 'Invalid admin token'}), 401
+
+
+@admin_bp.route('/profiles')
+def list_profiles():
+    """List stored analysis profiles, newest first"""
+    upload_dir = current_app.config['VISIONSHIELD_CONFIG'].UPLOAD_FOLDER
+    profiles = []
+    for name in os.listdir(upload_dir):
+        summary_file = os.path.join(upload_dir, name, 'summary.json')
+        if not name.endswith('_profile') or not os.path.exists(summary_file):
+            continue
+        try:
+            with open(summary_file, 'r') as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            continue
+        video_id = summary['video_id']
+        profiles.append({
+            'video_id': video_id,
+            'created_at': summary.get('created_at', 0),
+            'wall_time': summary.get('wall_time'),
+            'files': {
+                filename: f"/api/admin/profiles/{video_id}/{filename}" for filename in summary.get('files', [])
+            }
+        })
+        
+    profiles.sort(key=lambda p: p['created_at'], reverse=True)
+    return jsonify({'status': 'success', 'profiles': profiles})
+
+
+@admin_bp.route('/profiles/<video_id>/<filename>')
+def download_profile_file(video_id, filename):
+    """Download one trace file of a profile"""
+    upload_dir = current_app.config['VISIONSHIELD_CONFIG'].UPLOAD_FOLDER
+    directory = profile_dir(upload_dir, video_id)
+    if os.path.basename(video_id) != video_id or not os.path.exists(os.path.join(directory, filename)):
+        return jsonify({'status': 'error', 'message': 'Profile file not found'}), 404
+    return send_from_directory(directory, filename, as_attachment=True)
+
+
+def register_admin_routes(app):
+    """Register admin routes with the Flask app"""
+    app.register_blueprint(admin_bp)
@@ -0,0 +1,194 @@
+# api/progress.py
+# Server-Sent Events progress stream for in-flight analyses
+
+import os
+import json
+import time
+import threading
+from flask import Blueprint, Response, jsonify, request, current_app, stream_with_context
+
+from result_store import load_result, results_path
+
+progress_bp = Blueprint('progress', __name__, url_prefix='/api/progress')
+
+# Events after which a stream is closed
+TERMINAL_EVENTS = ('complete', 'failed')
+
+POLL_INTERVAL = 0.25  # Seconds between checks for new events
+HEARTBEAT_INTERVAL = 15  # Seconds of silence before a keep-alive comment
+STALE_AFTER = 900  # Seconds without events before an unfinished analysis is reported as lost
+
+# Streams currently holding a thread of this process (WSGI mode only)
+_open_streams = 0
+_streams_lock = threading.Lock()
+
+
+def progress_path(upload_dir, video_id):
+    """Path of the progress event log of a video"""
+    return os.path.join(upload_dir, f"{video_id}_progress.jsonl")
+
+
+class ProgressLog:
+    """
+    Append-only log of progress events for one analysis
+    
+    Events are JSON lines in UPLOAD_FOLDER, so a stream served by any worker
+    process can follow an analysis running in another. Instances are callable
+    as progress callbacks: progress(event, data).
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        
+    def __call__(self, event, data=None):
+        self.publish(event, data)
+        
+    def publish(self, event, data=None):
+        """Append one event; failures are logged and never interrupt the analysis"""
+        line = json.dumps({'event': event, 'data': data or {}, 'time': int(time.time() * 1000)})
+        try:
+            with self._lock, open(self.path, 'a') as f:
+                f.write(line + '\n')
+        except OSError as e:
+            print(f"Could not record progress event {event}: {e}")
+
+
+def format_event(event_id, event, data):
+    """Render one Server-Sent Event"""
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def progress_exists(upload_dir, video_id):
+    """Whether a video has a progress log or a stored result to stream"""
+    return os.path.basename(video_id) == video_id and (
+        os.path.exists(progress_path(upload_dir, video_id)) or os.path.exists(results_path(upload_dir, video_id))
+    )
+
+
+def iter_events(upload_dir, video_id, last_event_id=0):
+    """
+    Yield the progress events of a video as SSE messages until it finishes
+    
+    None is yielded whenever there is nothing new, so the caller decides how
+    to wait before polling again (see stream_events, and asgi.py for the
+    event loop version).
+    
+    Args:
+        upload_dir: UPLOAD_FOLDER holding the progress log and results
+        video_id: ID of the analysis to follow
+        last_event_id: Number of events the client already received (Last-Event-ID)
+    """
+    path = progress_path(upload_dir, video_id)
+    event_id = 0
+    position = 0
+    last_activity = last_heartbeat = time.monotonic()
+    
+    while True:
+        lines = []
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                f.seek(position)
+                chunk = f.read()
+            # Only consume complete lines; a writer may be mid-append
+            complete = chunk.rfind('\n') + 1
+            position += len(chunk[:complete].encode('utf-8'))
+            lines = chunk[:complete].splitlines()
+            
+        for line in lines:
+            event_id += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if event_id > last_event_id:
+                yield format_event(event_id, record['event'], record['data'])
+            if record['event'] in TERMINAL_EVENTS:
+                return
+                
+        now = time.monotonic()
+        if lines:
+            last_activity = last_heartbeat = now
+            continue
+            
+        # The result can exist without a terminal event (older analyses, or a
+        # worker that stopped right after saving)
+        if os.path.exists(results_path(upload_dir, video_id)):
+            result = load_result(upload_dir, video_id)
+            if result is not None:
+                if result.get('error') or result.get('prediction') == 'Error':
+                    yield format_event(event_id + 1, 'failed', {'message': result.get('error') or 'Analysis failed'})
+                else:
+                    yield format_event(event_id + 1, 'complete', {'result': result})
+                return
+                
+        if now - last_activity > STALE_AFTER:
+            yield format_event(event_id + 1, 'failed', {'message': 'Analysis is no longer reporting progress'})
+            return
+        if now - last_heartbeat > HEARTBEAT_INTERVAL:
+            last_heartbeat = now
+            yield ': keep-alive\n\n'
+        yield None
+
+
+def stream_events(upload_dir, video_id, last_event_id=0):
+    """Blocking SSE stream of a video's progress, see iter_events"""
+    for message in iter_events(upload_dir, video_id, last_event_id):
+        if message is None:
+            time.sleep(POLL_INTERVAL)
+        else:
+            yield message
+
+
+@progress_bp.route('/<video_id>')
+def analysis_progress(video_id):
+    """
+    Stream the progress of an analysis as Server-Sent Events
+    
+    Events: stage, metadata, frames, near_duplicate, score, heatmaps, then
+    complete (with the result summary) or failed. Event IDs count from 1, so
+    a reconnecting client resumes with the Last-Event-ID header.
+    
+    This view only serves streams under WSGI servers, where each one holds a
+    thread, so their number is capped by PROGRESS_MAX_WSGI_STREAMS. The ASGI
+    front end (asgi.py) serves them from its event loop without a cap.
+    """
+    global _open_streams
+    config = current_app.config['VISIONSHIELD_CONFIG']
+    upload_dir = config.UPLOAD_FOLDER
+    if not progress_exists(upload_dir, video_id):
+        return jsonify({'status': 'error', 'message': 'Analysis not found'}), 404
+        
+    try:
+        last_event_id = int(request.headers.get('Last-Event-ID', 0))
+    except ValueError:
+        last_event_id = 0
+        
+    with _streams_lock:
+        if _open_streams >= config.PROGRESS_MAX_WSGI_STREAMS:
+            response = jsonify({
+                'status': 'error',
+                'message': f'Too many progress streams; poll /api/results/{video_id} instead'
+            })
+            response.headers['Retry-After'] = '5'
+            return response, 503
+        _open_streams += 1
+        
+    def release():
+        global _open_streams
+        with _streams_lock:
+            _open_streams -= 1
+            
+    response = Response(
+        stream_with_context(stream_events(upload_dir, video_id, last_event_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    # Runs when the server closes the response, including on client disconnect
+    response.call_on_close(release)
+    return response
+
+
+def register_progress_routes(app):
+    """Register the progress stream with the Flask app"""
+    app.register_blueprint(progress_bp)
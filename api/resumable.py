@@ -0,0 +1,388 @@
+# api/resumable.py
+# Resumable chunked uploads for large videos
+
+import os
+import copy
+import json
+import time
+import uuid
+import fcntl
+import shutil
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from dataclasses import replace
+from flask import Blueprint, request, jsonify, current_app
+from werkzeug.utils import secure_filename
+
+from api.routes import submit_analysis
+from api.uploads import SNIFF_LENGTH, sniff_video_container
+
+resumable_bp = Blueprint('resumable', __name__, url_prefix='/api/uploads')
+
+
+def _upload_paths(upload_id):
+    """Return the manifest, data and lock paths for an upload"""
+    folder = current_app.config['VISIONSHIELD_CONFIG'].RESUMABLE_FOLDER
+    base = os.path.join(folder, upload_id)
+    return f"{base}.json", f"{base}.part", f"{base}.lock"
+
+
+@contextmanager
+def _locked_manifest(upload_id):
+    """
+    Load an upload manifest under an exclusive file lock
+    
+    The lock is shared by every worker process, so concurrent chunk requests
+    for the same upload update the manifest one at a time. Yields None if the
+    upload does not exist; a yielded manifest is written back on exit if it
+    was changed.
+    """
+    manifest_path, _, lock_path = _upload_paths(upload_id)
+    if not os.path.exists(manifest_path):
+        yield None
+        return
+        
+    with open(lock_path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            original = copy.deepcopy(manifest)
+            yield manifest
+            if manifest != original:
+                _write_manifest(manifest_path, manifest)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_manifest(upload_id):
+    """
+    Load an upload manifest without locking it
+    
+    Manifests are replaced atomically, so this sees a consistent (possibly
+    about to change) state. Returns None if the upload does not exist.
+    """
+    manifest_path, _, _ = _upload_paths(upload_id)
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_manifest(manifest_path, manifest):
+    """Atomically replace a manifest file"""
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def _merge_range(ranges, start, end):
+    """Add [start, end) to a sorted list of disjoint ranges"""
+    merged = []
+    for range_start, range_end in sorted(ranges + [[start, end]]):
+        if merged and range_start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], range_end)
+        else:
+            merged.append([range_start, range_end])
+    return merged
+
+
+def _missing_ranges(ranges, size):
+    """Return the byte ranges not yet received"""
+    missing = []
+    position = 0
+    for start, end in ranges:
+        if start > position:
+            missing.append([position, start])
+        position = max(position, end)
+    if position < size:
+        missing.append([position, size])
+    return missing
+
+
+def _upload_status(manifest):
+    """Format an upload manifest for API responses"""
+    received = sum(end - start for start, end in manifest['received'])
+    return {
+        'upload_id': manifest['upload_id'],
+        'state': manifest['state'],
+        'filename': manifest['filename'],
+        'size': manifest['size'],
+        'bytes_received': received,
+        'missing': _missing_ranges(manifest['received'], manifest['size']),
+        'chunk_size': manifest['chunk_size'],
+        'video_id': manifest.get('video_id'),
+        'error': manifest.get('error')
+    }
+
+
+@resumable_bp.route('', methods=['POST'])
+def init_upload():
+    """
+    Start a resumable upload
+    
+    Expected JSON body:
+    {
+        "filename": "clip.mp4",
+        "size": 123456789,
+        "sha256": "optional digest of the whole file"
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    config = current_app.config['VISIONSHIELD_CONFIG']
+    
+    filename = secure_filename(data.get('filename') or '')
+    size = data.get('size')
+    sha256 = data.get('sha256')
+    
+    if not filename:
+        return jsonify({'status': 'error', 'message': 'No filename provided'}), 400
+    if not config.allowed_file(filename):
+        return jsonify({
+            'status': 'error',
+            'message': f'Invalid file type. Allowed types: {", ".join(config.ALLOWED_EXTENSIONS)}'
+        }), 400
+    if not isinstance(size, int) or size <= 0:
+        return jsonify({'status': 'error', 'message': 'Invalid file size'}), 400
+    if size > config.MAX_UPLOAD_SIZE:
+        return jsonify({
+            'status': 'error',
+            'message': f'File too large. Maximum size: {config.MAX_UPLOAD_SIZE / (1024 * 1024)} MB'
+        }), 400
+        
+    upload_id = str(uuid.uuid4())
+    manifest_path, data_path, _ = _upload_paths(upload_id)
+    
+    # Reserve the full size up front so chunks can land at any offset
+    with open(data_path, 'wb') as f:
+        f.truncate(size)
+        
+    manifest = {
+        'upload_id': upload_id,
+        'state': 'uploading',
+        'filename': filename,
+        'size': size,
+        'sha256': sha256.lower() if isinstance(sha256, str) else None,
+        'chunk_size': config.RESUMABLE_CHUNK_SIZE,
+        'received': [],
+        'created_at': int(time.time() * 1000)
+    }
+    _write_manifest(manifest_path, manifest)
+    
+    return jsonify({'status': 'success', 'upload': _upload_status(manifest)}), 201
+
+
+@resumable_bp.route('/<upload_id>', methods=['GET'])
+def upload_status(upload_id):
+    """Get the received and missing byte ranges of an upload"""
+    manifest = _read_manifest(upload_id)
+    if manifest is None:
+        return jsonify({'status': 'error', 'message': 'Upload not found'}), 404
+    return jsonify({'status': 'success', 'upload': _upload_status(manifest)})
+
+
+@resumable_bp.route('/<upload_id>', methods=['PUT'])
+def upload_chunk(upload_id):
+    """
+    Store one chunk of an upload
+    
+    The chunk is sent as the raw request body. Query parameter `offset` is the
+    byte position of the chunk and header `X-Chunk-SHA256` its hex digest.
+    
+    The body is received into a temp file and only copied into the upload,
+    under the manifest lock, once it passed its checks, so a retried chunk
+    that arrives corrupted never overwrites bytes already received.
+    """
+    config = current_app.config['VISIONSHIELD_CONFIG']
+    expected_digest = (request.headers.get('X-Chunk-SHA256') or '').lower()
+    offset = request.args.get('offset', type=int)
+    length = request.content_length
+    
+    if offset is None or offset < 0:
+        return jsonify({'status': 'error', 'message': 'Missing or invalid offset'}), 400
+    if not expected_digest:
+        return jsonify({'status': 'error', 'message': 'Missing X-Chunk-SHA256 header'}), 400
+    if not length:
+        return jsonify({'status': 'error', 'message': 'Empty chunk'}), 400
+    if length > config.RESUMABLE_MAX_CHUNK_SIZE:
+        return jsonify({
+            'status': 'error',
+            'message': f'Chunk too large. Maximum size: {config.RESUMABLE_MAX_CHUNK_SIZE} bytes'
+        }), 413
+        
+    _, data_path, _ = _upload_paths(upload_id)
+    
+    # Peek at the manifest without holding the lock while the body is received
+    manifest = _read_manifest(upload_id)
+    if manifest is None:
+        return jsonify({'status': 'error', 'message': 'Upload not found'}), 404
+    if manifest['state'] != 'uploading':
+        return jsonify({'status': 'error', 'message': f"Upload is {manifest['state']}"}), 409
+    if offset + length > manifest['size']:
+        return jsonify({'status': 'error', 'message': 'Chunk exceeds declared file size'}), 400
+        
+    with tempfile.TemporaryFile(dir=config.RESUMABLE_FOLDER) as chunk_file:
+        # Receive the chunk while hashing it
+        digest = hashlib.sha256()
+        head = b''
+        written = 0
+        while written < length:
+            block = request.stream.read(min(64 * 1024, length - written))
+            if not block:
+                break
+            if offset == 0 and len(head) < SNIFF_LENGTH:
+                head += block[:SNIFF_LENGTH - len(head)]
+            digest.update(block)
+            chunk_file.write(block)
+            written += len(block)
+            
+        if written != length:
+            return jsonify({'status': 'error', 'message': 'Incomplete chunk received'}), 400
+        if digest.hexdigest() != expected_digest:
+            return jsonify({'status': 'error', 'message': 'Chunk digest mismatch'}), 422
+        if offset == 0 and sniff_video_container(head) is None:
+            return jsonify({'status': 'error', 'message': 'Uploaded file is not a recognised video container'}), 415
+            
+        with _locked_manifest(upload_id) as manifest:
+            # Finalize may have started, moved or removed the file since the peek
+            if manifest is None:
+                return jsonify({'status': 'error', 'message': 'Upload not found'}), 404
+            if manifest['state'] != 'uploading':
+                return jsonify({'status': 'error', 'message': f"Upload is {manifest['state']}"}), 409
+                
+            chunk_file.seek(0)
+            with open(data_path, 'r+b') as f:
+                f.seek(offset)
+                shutil.copyfileobj(chunk_file, f, 1024 * 1024)
+            manifest['received'] = _merge_range(manifest['received'], offset, offset + length)
+            manifest['updated_at'] = int(time.time() * 1000)
+            status = _upload_status(manifest)
+            
+    return jsonify({'status': 'success', 'upload': status})
+
+
+@resumable_bp.route('/<upload_id>/finalize', methods=['POST'])
+def finalize_upload(upload_id):
+    """
+    Assemble a completed upload and start its analysis in the background
+    
+    Returns 202 with the video_id; results become available at
+    /api/results/<video_id> once the analysis finishes.
+    
+    The file is probed and hashed without holding the manifest lock, so
+    status polls and retried chunks of this upload are not held up for the
+    seconds that takes on a large video. The outcome is only committed if no
+    chunk arrived in the meantime.
+    """
+    from models.decode import probe_video
+    
+    config = current_app.config['VISIONSHIELD_CONFIG']
+    _, data_path, _ = _upload_paths(upload_id)
+    
+    with _locked_manifest(upload_id) as manifest:
+        if manifest is None:
+            return jsonify({'status': 'error', 'message': 'Upload not found'}), 404
+        if manifest['state'] != 'uploading':
+            return jsonify({'status': 'success', 'upload': _upload_status(manifest)}), 202
+            
+        if _missing_ranges(manifest['received'], manifest['size']):
+            return jsonify({
+                'status': 'error',
+                'message': 'Upload is incomplete',
+                'upload': _upload_status(manifest)
+            }), 409
+        snapshot = copy.deepcopy(manifest)
+        
+    # Reject undecodable uploads before reading the whole file to hash it
+    video_info = video_hash = None
+    corrupt = False
+    try:
+        video_info = probe_video(data_path)
+        digest = hashlib.sha256()
+        with open(data_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        video_hash = digest.hexdigest()
+    except ValueError:
+        corrupt = True
+    except FileNotFoundError:
+        pass  # Moved into place by a concurrent finalize, see below
+        
+    with _locked_manifest(upload_id) as manifest:
+        if manifest is None:
+            return jsonify({'status': 'error', 'message': 'Upload not found'}), 404
+        if manifest['state'] != 'uploading':
+            return jsonify({'status': 'success', 'upload': _upload_status(manifest)}), 202
+        if manifest.get('updated_at') != snapshot.get('updated_at') or (video_hash is None and not corrupt):
+            return jsonify({
+                'status': 'error',
+                'message': 'Upload changed while it was being finalized; finalize again',
+                'upload': _upload_status(manifest)
+            }), 409
+            
+        if corrupt:
+            manifest['state'] = 'failed'
+            manifest['error'] = 'Uploaded video is corrupt or contains no frames'
+            os.remove(data_path)
+            return jsonify({
+                'status': 'error',
+                'message': manifest['error'],
+                'upload': _upload_status(manifest)
+            }), 422
+            
+        if manifest['sha256'] and manifest['sha256'] != video_hash:
+            # Some chunk was wrong in a way its own digest could not catch;
+            # start over so the client can send the whole file again
+            manifest['received'] = []
+            manifest['updated_at'] = int(time.time() * 1000)
+            return jsonify({
+                'status': 'error',
+                'message': 'File digest mismatch; upload every chunk again',
+                'upload': _upload_status(manifest)
+            }), 422
+            
+        video_id = upload_id
+        _, extension = os.path.splitext(manifest['filename'])
+        video_path = os.path.join(config.UPLOAD_FOLDER, f"{video_id}{extension}")
+        os.replace(data_path, video_path)
+        video_info = replace(video_info, path=video_path)
+        
+        manifest['state'] = 'processing'
+        manifest['video_id'] = video_id
+        status = _upload_status(manifest)
+        
+    app = current_app._get_current_object()
+    future = submit_analysis(video_id, video_path, manifest['filename'], video_hash=video_hash,
+                             video_info=video_info)
+    future.add_done_callback(lambda f: _mark_analysis_done(app, upload_id, f))
+    
+    return jsonify({
+        'status': 'success',
+        'message': 'Upload complete, analysis started',
+        'video_id': video_id,
+        'progress_url': f"/api/progress/{video_id}",
+        'upload': status
+    }), 202
+
+
+def _mark_analysis_done(app, upload_id, future):
+    """Record the analysis outcome in the upload manifest"""
+    with app.app_context():
+        try:
+            _, error = future.result()
+        except Exception as e:
+            error = str(e)
+        with _locked_manifest(upload_id) as manifest:
+            if manifest is not None:
+                manifest['state'] = 'failed' if error else 'completed'
+                manifest['error'] = error
+
+
+def register_resumable_routes(app):
+    """Register resumable upload routes with the Flask app"""
+    config = app.config['VISIONSHIELD_CONFIG']
+    os.makedirs(config.RESUMABLE_FOLDER, exist_ok=True)
+    app.register_blueprint(resumable_bp)
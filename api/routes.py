@@ -3,73 +3,209 @@
 
 import os
 import uuid
-import json
-import torch
 import time
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from flask import Blueprint, request, jsonify, send_from_directory, current_app
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
 
-from models.visionshield import VisionShield
-from models.utils import analyze_video, generate_heatmap
+from models.timing import stage_timer
+from models.artifacts import ensure_model_weights, ensure_screening_weights
+from storage import touch_artifact
+from result_store import list_results, load_frame_analysis, load_result, results_path, save_result
 from api.schemas import validate_analyze_request
+from api.uploads import UploadWriter
+from api.profiling import profile_analysis, profile_dir, profile_requested, should_profile
+from api.progress import ProgressLog, progress_path
+from api.metrics import (
+    ACTIVE_MODEL, ANALYSES, CACHE_HITS, IN_PROGRESS, MODEL_LOAD_SECONDS, QUEUE_DEPTH,
+    SHADOW_PROBABILITY_DELTA, SHADOW_SCORES, SHADOW_SECONDS, observe_stages
+)
 
 # Define the blueprint for API routes
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
-# Get the device for model inference
-device = torch.device('cuda:0' if torch.cuda.is_available() else 'cpu')
+# Device for model inference, picked when the model stack is first imported
+device = None
 
-# Global variable for model
-model = None
+# Registry of model versions; analyses use its active model
+model_registry = None
+
+# Screening model of cascade inference, loaded on first use. After a failed
+# load, analyses run without the cascade until the retry interval has passed
+screening_model = None
+screening_failed_at = None
+SCREENING_RETRY_SECONDS = 600
+
+# Executor for analyses that run outside the request thread
+analysis_executor = None
+
+# Shadow scoring runs one video at a time; samples arriving meanwhile are skipped
+shadow_executor = None
+shadow_slot = threading.BoundedSemaphore(1)
+
+def get_device():
+    """Get the device for model inference, importing torch on first use"""
+    global device
+    if device is None:
+        import torch
+        config = current_app.config['VISIONSHIELD_CONFIG']
+        if config.INFERENCE_SERVER:
+            # Workers only preprocess frames; the inference server runs the models
+            torch.set_num_threads(config.CLIENT_TORCH_THREADS)
+            device = torch.device('cpu')
+        else:
+            device = torch.device('cuda:0' if torch.cuda.is_available() else 'cpu')
+    return device
+
+def _load_checkpoint(config, path, backbone='resnet50'):
+    """Build a VisionShield model from a checkpoint, fetching the default one if missing"""
+    if config.INFERENCE_SERVER:
+        from models.server import RemoteModel, get_client
+        client = get_client(config.INFERENCE_SOCKET, timeout=config.INFERENCE_TIMEOUT,
+                            autostart=config.INFERENCE_SERVER_AUTOSTART)
+        return RemoteModel(client, path, backbone)
+    
+    from models.utils import load_model
+    if path == config.MODEL_SAVE_PATH:
+        ensure_model_weights(config)
+    elif path == config.SCREENING_MODEL_PATH:
+        ensure_screening_weights(config)
+    return load_model(path, get_device(), {
+        'HIDDEN_SIZE': config.HIDDEN_SIZE,
+        'NUM_LSTM_LAYERS': config.NUM_LSTM_LAYERS,
+        'DROPOUT': config.DROPOUT,
+        'BACKBONE': backbone
+    })
+
+def _model_activated(previous, loaded):
+    """Export the active model version and its load time"""
+    if previous is not None:
+        ACTIVE_MODEL.set(0, version=previous.version)
+    ACTIVE_MODEL.set(1, version=loaded.version)
+    MODEL_LOAD_SECONDS.set(loaded.load_seconds)
+
+def get_model_registry():
+    """Get or create the model registry, loading the configured shadow model in the background"""
+    global model_registry
+    if model_registry is None:
+        from models.registry import ModelRegistry
+        
+        config = current_app.config['VISIONSHIELD_CONFIG']
+        model_registry = ModelRegistry(
+            loader=lambda path: _load_checkpoint(config, path),
+            device=get_device(),
+            default_version=config.MODEL_VERSION,
+            default_path=config.MODEL_SAVE_PATH,
+            registry_dir=config.MODEL_REGISTRY_FOLDER,
+            on_activate=_model_activated,
+            # Admin swaps made through any worker are followed by all of them
+            state_path=os.path.join(config.MODEL_REGISTRY_FOLDER, 'active.json')
+        )
+        if config.SHADOW_MODEL_VERSION:
+            try:
+                # A shadow choice persisted through the admin API takes precedence
+                model_registry.set_shadow(config.SHADOW_MODEL_VERSION, config.SHADOW_SAMPLE_RATE, persist=False)
+            except KeyError as e:
+                current_app.logger.warning(f"Shadow model not started: {e}")
+    return model_registry
 
 def get_model():
-    """Get or load the model"""
-    global model
-    if model is None:
+    """
+    Get the active model, loading the default version on first use
+    
+    Returns:
+        models.registry.LoadedModel (model and version), or None if loading failed
+    """
+    return get_model_registry().get()
+
+def get_screening_model():
+    """Get or load the cascade screening model (None if it cannot be loaded)"""
+    global screening_model, screening_failed_at
+    if screening_model is None:
+        if screening_failed_at is not None and time.monotonic() - screening_failed_at < SCREENING_RETRY_SECONDS:
+            return None
+        config = current_app.config['VISIONSHIELD_CONFIG']
         try:
-            config = current_app.config['VISIONSHIELD_CONFIG']
-            model = VisionShield(
-                hidden_size=config.HIDDEN_SIZE,
-                num_layers=config.NUM_LSTM_LAYERS,
-                dropout=config.DROPOUT
-            )
-            model.load_state_dict(torch.load(config.MODEL_SAVE_PATH, map_location=device))
-            model = model.to(device)
-            model.eval()
-            current_app.logger.info(f"Model loaded successfully to {device}")
+            screening_model = _load_checkpoint(config, config.SCREENING_MODEL_PATH, config.SCREENING_BACKBONE)
+            screening_failed_at = None
+            current_app.logger.info(f"Screening model ({config.SCREENING_BACKBONE}) loaded to {get_device()}")
         except Exception as e:
-            current_app.logger.error(f"Error loading model: {e}")
-            model = None
-    return model
+            screening_failed_at = time.monotonic()
+            current_app.logger.error(f"Error loading screening model, analyzing without cascade for the next "
+                                     f"{SCREENING_RETRY_SECONDS // 60} minutes: {e}")
+    return screening_model
 
 @api_bp.route('/health')
 def health_check():
     """API health check endpoint"""
+    active = get_model()
     return jsonify({
         'status': 'success',
         'message': 'VisionShield API is running',
-        'model_loaded': get_model() is not None,
+        'model_loaded': active is not None,
+        'model_version': active.version if active else None,
         'version': '1.0.0'
     })
 
-@api_bp.route('/analyze', methods=['POST'])
-def analyze():
-    """Analyze a video for deepfakes"""
-    valid, error = validate_analyze_request(request)
-    if not valid:
-        return jsonify({'status': 'error', 'message': error}), 400
+def get_analysis_executor():
+    """Get or create the background analysis executor"""
+    global analysis_executor
+    if analysis_executor is None:
+        config = current_app.config['VISIONSHIELD_CONFIG']
+        analysis_executor = ThreadPoolExecutor(
+            max_workers=config.ANALYSIS_WORKERS,
+            thread_name_prefix='visionshield-analysis'
+        )
+    return analysis_executor
+
+def analysis_options(config):
+    """Keyword arguments for analyze_video taken from the config"""
+    return {
+        'frame_skip': config.FRAME_SKIP,
+        'seq_length': config.SEQ_LENGTH,
+        'progressive': config.PROGRESSIVE_INFERENCE,
+        'progressive_initial_frames': config.PROGRESSIVE_INITIAL_FRAMES,
+        'uncertainty_band': config.PROGRESSIVE_UNCERTAINTY_BAND,
+        'face_crop': config.FACE_CROP,
+        'face_margin': config.FACE_CROP_MARGIN,
+        'sampling': config.FRAME_SAMPLING,
+        'decode_backend': config.DECODE_BACKEND,
+        'decode_max_dimension': config.DECODE_MAX_DIMENSION,
+        'decode_threads': config.DECODE_THREADS,
+        'cascade_band': config.CASCADE_BAND
+    }
+
+def run_analysis(video_id, video_path, filename, video_hash=None, video_info=None, timings=None, profile=None):
+    """
+    Run the full analysis pipeline for a stored video and save its results
+    
+    Args:
+        video_id: ID the results are stored under
+        video_path: Path to the uploaded video
+        filename: Original (sanitized) filename
+        video_hash: SHA256 of the file if already known
+        video_info: Probe result for the video if already known
+        timings: Dict of stage timings collected so far (e.g. upload), extended here
+        profile: Profile the analysis; None samples by PROFILE_SAMPLE_RATE
         
-    file = request.files['video']
-    video_id = str(uuid.uuid4())
-    filename = secure_filename(file.filename)
-    base_name, extension = os.path.splitext(filename)
+    Returns:
+        tuple: (result, error_message) - result is None when analysis failed
+    """
+    from models.utils import analyze_video, generate_heatmap
+    from models.fingerprint import get_fingerprint_index
+    from models.decode import probe_video
+    
     config = current_app.config['VISIONSHIELD_CONFIG']
-    video_path = os.path.join(config.UPLOAD_FOLDER, f"{video_id}{extension}")
-    file.save(video_path)
+    timings = {} if timings is None else timings
+    progress = ProgressLog(progress_path(config.UPLOAD_FOLDER, video_id))
+    IN_PROGRESS.inc()
     
     try:
-        current_model = get_model()
-        if current_model is None:
+        active = get_model()
+        if active is None:
             error_result = {
                 'video_id': video_id,
                 'filename': filename,
@@ -83,21 +219,55 @@ def analyze():
                 'duration': 0,
                 'resolution': '0x0'
             }
-            results_file = os.path.join(config.UPLOAD_FOLDER, f"{video_id}_results.json")
-            with open(results_file, 'w') as f:
-                json.dump(error_result, f)
-            return jsonify({'status': 'error', 'message': 'Failed to load model', 'video_id': video_id}), 500
+            save_result(config.UPLOAD_FOLDER, video_id, error_result)
+            progress('failed', {'message': 'Failed to load model'})
+            ANALYSES.inc(outcome='error')
+            return None, 'Failed to load model'
             
-        result = analyze_video(model=current_model, video_path=video_path, device=device, 
-                              frame_skip=config.FRAME_SKIP, seq_length=config.SEQ_LENGTH)
+        # Single metadata probe shared by every stage; rejects files without frames
+        if video_info is None:
+            with stage_timer(timings, 'probe'):
+                video_info = probe_video(video_path)
+        
+        fingerprint_index = None
+        if config.NEAR_DUPLICATE_MODE != 'off':
+            fingerprint_index = get_fingerprint_index(config.FINGERPRINT_INDEX_PATH)
+            
+        if profile is None:
+            profile = should_profile(config)
+        profiler = (profile_analysis(profile_dir(config.UPLOAD_FOLDER, video_id), video_id)
+                    if profile else nullcontext())
+            
+        analysis_start = time.perf_counter()
+        with profiler:
+            result = analyze_video(model=active.model, video_path=video_path, device=get_device(), 
+                                  video_hash=video_hash,
+                                  fingerprint_index=fingerprint_index,
+                                  near_duplicate_mode=config.NEAR_DUPLICATE_MODE,
+                                  video_info=video_info,
+                                  timings=timings,
+                                  progress=progress,
+                                  model_version=active.version,
+                                  screening_model=get_screening_model() if config.CASCADE_INFERENCE else None,
+                                  **analysis_options(config))
+        analysis_seconds = time.perf_counter() - analysis_start
         result['filename'] = filename
         result['timestamp'] = int(time.time() * 1000)
+        result['profiled'] = bool(profile)
+        if result.get('inference_mode') == 'reused' and 'frame_analysis' not in result:
+            # The fingerprint index keeps verdicts only; per-frame scores come from the matched record
+            result['frame_analysis'] = load_frame_analysis(
+                config.UPLOAD_FOLDER, result['near_duplicate_of']['video_id']) or []
         
         heatmap_dir = os.path.join(config.UPLOAD_FOLDER, f"{video_id}_heatmaps")
+        progress('stage', {'stage': 'heatmaps'})
         try:
-            heatmaps = generate_heatmap(video_path=video_path, 
-                                       frame_probabilities=result['frame_analysis'],
-                                       output_dir=heatmap_dir)
+            with stage_timer(timings, 'heatmap'):
+                heatmaps = generate_heatmap(video_path=video_path, 
+                                           frame_probabilities=result['frame_analysis'],
+                                           output_dir=heatmap_dir,
+                                           video_info=video_info,
+                                           video_hash=result['video_hash'])
             result['heatmaps'] = [
                 {'frame_index': h['frame_index'], 'probability_fake': h['probability_fake'],
                  'path': os.path.basename(h['image_path'])} for h in heatmaps
@@ -105,18 +275,28 @@ def analyze():
         except Exception as e:
             current_app.logger.warning(f"Failed to generate heatmaps: {e}")
             result['heatmaps'] = []
+        progress('heatmaps', {'heatmaps': result['heatmaps']})
         
-        results_file = os.path.join(config.UPLOAD_FOLDER, f"{video_id}_results.json")
-        with open(results_file, 'w') as f:
-            json.dump(result, f)
-        current_app.logger.info(f"Saved results to: {results_file}")
+        with stage_timer(timings, 'result_write'):
+            summary = save_result(config.UPLOAD_FOLDER, video_id, result)
+        current_app.logger.info(f"Saved results to: {results_path(config.UPLOAD_FOLDER, video_id)}")
+        progress('complete', {'result': summary})
         
-        return jsonify({
-            'status': 'success',
-            'message': 'Video analyzed successfully',
-            'video_id': video_id,
-            'result': result
-        }), 200
+        # Only fresh verdicts are indexed, reused ones would just chain matches
+        if fingerprint_index is not None and result.get('inference_mode') != 'reused':
+            try:
+                fingerprint_index.add(video_id, result.get('fingerprint', []), result)
+            except Exception as e:
+                current_app.logger.warning(f"Failed to update fingerprint index: {e}")
+        
+        shadow = get_model_registry().shadow_sample()
+        if shadow is not None and result.get('inference_mode') not in ('reused', 'screened'):
+            submit_shadow_scoring(shadow, video_path, video_info, result, analysis_seconds)
+        
+        if result.get('near_duplicate_of'):
+            CACHE_HITS.inc(cache='near_duplicate')
+        ANALYSES.inc(outcome='reused' if result.get('inference_mode') == 'reused' else 'completed')
+        return result, None
         
     except Exception as e:
         current_app.logger.error(f"Error analyzing video: {e}")
@@ -136,17 +316,175 @@ def analyze():
             'duration': 0,
             'resolution': '0x0'
         }
-        results_file = os.path.join(config.UPLOAD_FOLDER, f"{video_id}_results.json")
-        with open(results_file, 'w') as f:
-            json.dump(error_result, f)
-        return jsonify({'status': 'error', 'message': str(e), 'video_id': video_id}), 500
+        save_result(config.UPLOAD_FOLDER, video_id, error_result)
+        progress('failed', {'message': str(e)})
+        ANALYSES.inc(outcome='error')
+        return None, str(e)
+        
+    finally:
+        IN_PROGRESS.dec()
+        observe_stages(timings)
+
+def submit_analysis(video_id, video_path, filename, video_hash=None, video_info=None, timings=None, profile=None):
+    """
+    Queue run_analysis on the background analysis executor
+    
+    Progress, starting with the 'queued' stage, is streamed at /api/progress/<video_id>.
+    
+    Returns:
+        concurrent.futures.Future resolving to run_analysis' return value
+    """
+    app = current_app._get_current_object()
+    config = current_app.config['VISIONSHIELD_CONFIG']
+    
+    def task():
+        QUEUE_DEPTH.dec()
+        with app.app_context():
+            return run_analysis(video_id, video_path, filename, video_hash=video_hash,
+                                video_info=video_info, timings=timings, profile=profile)
+    
+    ProgressLog(progress_path(config.UPLOAD_FOLDER, video_id))('stage', {'stage': 'queued'})
+    QUEUE_DEPTH.inc()
+    return get_analysis_executor().submit(task)
+
+def submit_shadow_scoring(shadow, video_path, video_info, result, analysis_seconds):
+    """
+    Score an analyzed video with the shadow model off the request path
+    
+    The shadow verdict is never stored; only its latency and its agreement
+    with the active model's result are recorded in the shadow metrics.
+    
+    Args:
+        shadow: LoadedModel sampled by the registry
+        video_path: Path to the analyzed video
+        video_info: Probe result of the video
+        result: Result of the active model
+        analysis_seconds: Time the active model's analysis took
+    """
+    global shadow_executor
+    from models.utils import analyze_video
+    
+    if not shadow_slot.acquire(blocking=False):
+        SHADOW_SCORES.inc(version=shadow.version, outcome='skipped')
+        return
+    if shadow_executor is None:
+        shadow_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='visionshield-shadow')
+    app = current_app._get_current_object()
+    
+    def task():
+        try:
+            with app.app_context():
+                config = app.config['VISIONSHIELD_CONFIG']
+                start = time.perf_counter()
+                shadow_result = analyze_video(model=shadow.model, video_path=video_path, device=get_device(),
+                                              video_hash=result['video_hash'], video_info=video_info,
+                                              model_version=shadow.version, **analysis_options(config))
+                shadow_seconds = time.perf_counter() - start
+                
+                delta = abs(shadow_result['probabilities']['fake'] - result['probabilities']['fake'])
+                agree = shadow_result['prediction'] == result['prediction']
+                SHADOW_SECONDS.observe(analysis_seconds, version=shadow.version, role='primary')
+                SHADOW_SECONDS.observe(shadow_seconds, version=shadow.version, role='shadow')
+                SHADOW_PROBABILITY_DELTA.observe(delta, version=shadow.version)
+                SHADOW_SCORES.inc(version=shadow.version, outcome='agree' if agree else 'disagree')
+                app.logger.info(f"Shadow model {shadow.version} {'agrees' if agree else 'disagrees'} with "
+                                f"{result['model_version']} (fake probability delta {delta:.4f})")
+        except Exception as e:
+            SHADOW_SCORES.inc(version=shadow.version, outcome='error')
+            app.logger.warning(f"Shadow scoring with {shadow.version} failed: {e}")
+        finally:
+            shadow_slot.release()
+    
+    shadow_executor.submit(task)
+
+@api_bp.route('/analyze', methods=['POST'])
+def analyze():
+    """
+    Analyze a video for deepfakes
+    
+    With ?async=true (or a "Prefer: respond-async" header) the analysis is
+    queued and 202 is returned right after the upload; follow it at the
+    progress_url event stream and fetch the result from results_url.
+    """
+    from models.decode import probe_video
+    
+    timings = {}
+    try:
+        # Parsing the form streams the upload to disk
+        with stage_timer(timings, 'upload'):
+            valid, error = validate_analyze_request(request)
+    except HTTPException as e:
+        # Raised while the upload is streamed (oversize or not a video)
+        return jsonify({'status': 'error', 'message': e.description}), e.code
+    if not valid:
+        return jsonify({'status': 'error', 'message': error}), 400
+        
+    file = request.files['video']
+    filename = secure_filename(file.filename)
+    config = current_app.config['VISIONSHIELD_CONFIG']
+    
+    if isinstance(file.stream, UploadWriter):
+        # Already streamed to its final location and hashed while writing
+        try:
+            video_hash = file.stream.finalize()
+        except HTTPException as e:
+            return jsonify({'status': 'error', 'message': e.description}), e.code
+        video_id = file.stream.video_id
+        video_path = file.stream.path
+    else:
+        video_id = str(uuid.uuid4())
+        base_name, extension = os.path.splitext(filename)
+        video_path = os.path.join(config.UPLOAD_FOLDER, f"{video_id}{extension}")
+        with stage_timer(timings, 'upload'):
+            file.save(video_path)
+        video_hash = None
+    
+    try:
+        with stage_timer(timings, 'probe'):
+            video_info = probe_video(video_path)
+    except ValueError:
+        os.remove(video_path)
+        return jsonify({'status': 'error', 'message': 'Uploaded video is corrupt or contains no frames'}), 422
+    
+    profile = True if profile_requested(request) else None
+    if (request.args.get('async', '').lower() in ('1', 'true')
+            or 'respond-async' in request.headers.get('Prefer', '')):
+        submit_analysis(video_id, video_path, filename, video_hash=video_hash,
+                        video_info=video_info, timings=timings, profile=profile)
+        return jsonify({
+            'status': 'success',
+            'message': 'Analysis started',
+            'video_id': video_id,
+            'progress_url': f"/api/progress/{video_id}",
+            'results_url': f"/api/results/{video_id}"
+        }), 202
+    
+    result, error = run_analysis(video_id, video_path, filename, video_hash=video_hash,
+                                 video_info=video_info, timings=timings, profile=profile)
+    if error is not None:
+        return jsonify({'status': 'error', 'message': error, 'video_id': video_id}), 500
+        
+    return jsonify({
+        'status': 'success',
+        'message': 'Video analyzed successfully',
+        'video_id': video_id,
+        'result': result
+    }), 200
 
 @api_bp.route('/video/<video_id>')
 def serve_video(video_id):
     """Serve a processed video by ID"""
-    upload_dir = current_app.config['VISIONSHIELD_CONFIG'].UPLOAD_FOLDER
-    for filename in os.listdir(upload_dir):
-        if filename.startswith(video_id) and not filename.endswith('.json'):
+    config = current_app.config['VISIONSHIELD_CONFIG']
+    upload_dir = config.UPLOAD_FOLDER
+    # Uploads are stored as <video_id>.<ext>; try those names before listing the folder
+    candidates = [f"{video_id}.{extension}" for extension in sorted(config.ALLOWED_EXTENSIONS)]
+    if not any(os.path.isfile(os.path.join(upload_dir, name)) for name in candidates):
+        # Extensions keep the case of the uploaded filename
+        candidates = [name for name in os.listdir(upload_dir) if os.path.splitext(name)[0] == video_id]
+    for filename in candidates:
+        video_path = os.path.join(upload_dir, filename)
+        if os.path.isfile(video_path) and not filename.endswith('.json'):
+            touch_artifact(video_path)
             return send_from_directory(upload_dir, filename)
     return jsonify({'status': 'error', 'message': 'Video not found'}), 404
 
@@ -155,31 +493,25 @@ def get_results(video_id):
     """Get analysis results for a video"""
     config = current_app.config['VISIONSHIELD_CONFIG']
     upload_dir = config.UPLOAD_FOLDER
-    results_file = os.path.join(upload_dir, f"{video_id}_results.json")
+    # Per-frame data is served by /api/frame-analysis unless explicitly requested
+    include_frames = request.args.get('include') == 'frame_analysis'
     
-    if os.path.exists(results_file):
-        try:
-            with open(results_file, 'r') as f:
-                result = json.load(f)
-            return jsonify({'status': 'success', 'result': result})
-        except Exception as e:
-            current_app.logger.error(f"Error reading results file: {e}")
-            return jsonify({'status': 'error', 'message': f'Error reading results: {str(e)}'}), 500
-    else:
+    try:
+        result = load_result(upload_dir, video_id, include_frames=include_frames)
+    except Exception as e:
+        current_app.logger.error(f"Error reading results file: {e}")
+        return jsonify({'status': 'error', 'message': f'Error reading results: {str(e)}'}), 500
+    if result is None:
         return jsonify({'status': 'error', 'message': 'Results not found'}), 404
+    return jsonify({'status': 'success', 'result': result})
 
 @api_bp.route('/frame-analysis/<video_id>')
 def frame_analysis(video_id):
     """Get frame-by-frame analysis for a video"""
     upload_dir = current_app.config['VISIONSHIELD_CONFIG'].UPLOAD_FOLDER
-    results_file = os.path.join(upload_dir, f"{video_id}_results.json")
+    frames = load_frame_analysis(upload_dir, video_id)
     
-    if os.path.exists(results_file):
-        with open(results_file, 'r') as f:
-            result = json.load(f)
-        
-        frames = result.get('frame_analysis', [])
-        
+    if frames is not None:
         return jsonify({
             'status': 'success',
             'video_id': video_id,
@@ -193,12 +525,9 @@ def heatmap(video_id):
     """Get heatmap data for a video"""
     config = current_app.config['VISIONSHIELD_CONFIG']
     upload_dir = config.UPLOAD_FOLDER
-    results_file = os.path.join(upload_dir, f"{video_id}_results.json")
+    result = load_result(upload_dir, video_id)
     
-    if os.path.exists(results_file):
-        with open(results_file, 'r') as f:
-            result = json.load(f)
-        
+    if result is not None:
         heatmaps = result.get('heatmaps', [])
         
         heatmap_images = []
@@ -224,6 +553,7 @@ def heatmap_image(video_id, image_name):
     heatmap_dir = os.path.join(config.UPLOAD_FOLDER, f"{video_id}_heatmaps")
     
     if os.path.exists(os.path.join(heatmap_dir, image_name)):
+        touch_artifact(heatmap_dir)
         return send_from_directory(heatmap_dir, image_name)
     else:
         return jsonify({'status': 'error', 'message': 'Heatmap image not found'}), 404
@@ -235,22 +565,16 @@ def history():
     upload_dir = config.UPLOAD_FOLDER
     
     history = []
-    for filename in os.listdir(upload_dir):
-        if filename.endswith('_results.json'):
-            video_id = filename.split('_')[0]
-            
-            with open(os.path.join(upload_dir, filename), 'r') as f:
-                result = json.load(f)
-                
-            history.append({
-                'id': video_id,
-                'filename': result.get('filename', 'Unknown'),
-                'timestamp': result.get('timestamp', 0),
-                'result': {
-                    'prediction': result.get('prediction', 'Unknown'),
-                    'confidence': result.get('confidence', 0)
-                }
-            })
+    for video_id, result in list_results(upload_dir).items():
+        history.append({
+            'id': video_id,
+            'filename': result.get('filename', 'Unknown'),
+            'timestamp': result.get('timestamp', 0),
+            'result': {
+                'prediction': result.get('prediction', 'Unknown'),
+                'confidence': result.get('confidence', 0)
+            }
+        })
     
     history.sort(key=lambda x: x['timestamp'], reverse=True)
     
@@ -3,8 +3,96 @@
 
 import os
 import json
-from flask import send_file, jsonify, current_app
-from pdf_generator import generate_analysis_report
+import time
+import zipfile
+from flask import send_file, jsonify, current_app, request, Response, stream_with_context
+from report_batch import BulkReportManager, find_video_ids, load_result
+from api.schemas import validate_report_job_request
+
+# Global bulk report manager, created on first use
+report_jobs = None
+
+
+def get_report_jobs():
+    """Get or create the bulk report job manager"""
+    global report_jobs
+    if report_jobs is None:
+        config = current_app.config['VISIONSHIELD_CONFIG']
+        report_jobs = BulkReportManager(
+            upload_dir=config.UPLOAD_FOLDER,
+            export_dir=config.EXPORT_FOLDER,
+            max_workers=config.REPORT_WORKERS,
+            chart_backend=config.PDF_CHART_BACKEND
+        )
+    return report_jobs
+
+
+class _ZipStreamBuffer:
+    """Write-only sink for zipfile that hands out written bytes as chunks"""
+    
+    def __init__(self):
+        self._chunks = []
+        
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+        
+    def flush(self):
+        pass
+        
+    def drain(self):
+        """Return everything written since the last drain"""
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _stream_reports_zip(config, video_ids):
+    """
+    Generate a ZIP archive of PDF reports chunk by chunk
+    
+    Each report is rendered into a spooled buffer and copied into the archive
+    as it is produced, so neither the PDFs nor the archive touch UPLOAD_FOLDER.
+    """
+    from pdf_generator import generate_analysis_report_buffer
+    
+    sink = _ZipStreamBuffer()
+    exported, missing, failed = [], [], []
+    
+    with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_STORED) as archive:
+        for video_id in video_ids:
+            result_data = load_result(config.UPLOAD_FOLDER, video_id)
+            if result_data is None:
+                missing.append(video_id)
+                continue
+                
+            try:
+                pdf_buffer = generate_analysis_report_buffer(
+                    result_data,
+                    chart_backend=config.PDF_CHART_BACKEND,
+                    spool_max_size=config.PDF_SPOOL_MAX_SIZE
+                )
+            except Exception as e:
+                current_app.logger.error(f"Error generating PDF report for {video_id}: {e}")
+                failed.append(video_id)
+                continue
+                
+            with pdf_buffer, archive.open(f"VisionShield_Report_{video_id}.pdf", 'w') as entry:
+                for block in iter(lambda: pdf_buffer.read(64 * 1024), b''):
+                    entry.write(block)
+                    yield sink.drain()
+            exported.append(video_id)
+            yield sink.drain()
+            
+        manifest = {
+            'generated_at': int(time.time() * 1000),
+            'exported': exported,
+            'missing': missing,
+            'failed': failed
+        }
+        archive.writestr('manifest.json', json.dumps(manifest, indent=2))
+        
+    yield sink.drain()
 
 
 def register_pdf_routes(app):
@@ -23,30 +111,27 @@ def register_pdf_routes(app):
         """
         try:
             config = current_app.config['VISIONSHIELD_CONFIG']
-            upload_dir = config.UPLOAD_FOLDER
             
             # Load analysis results
-            results_file = os.path.join(upload_dir, f"{video_id}_results.json")
+            result_data = load_result(config.UPLOAD_FOLDER, video_id)
             
-            if not os.path.exists(results_file):
+            if result_data is None:
                 return jsonify({
                     'status': 'error',
                     'message': 'Analysis results not found'
                 }), 404
+                
+            # Generate PDF report into a buffer rather than UPLOAD_FOLDER
+            from pdf_generator import generate_analysis_report_buffer
+            pdf_buffer = generate_analysis_report_buffer(
+                result_data,
+                chart_backend=config.PDF_CHART_BACKEND,
+                spool_max_size=config.PDF_SPOOL_MAX_SIZE
+            )
             
-            with open(results_file, 'r') as f:
-                result_data = json.load(f)
-            
-            # Generate PDF report
-            pdf_filename = f"visionshield_report_{video_id}.pdf"
-            pdf_path = os.path.join(upload_dir, pdf_filename)
-            
-            # Use the PDF generator
-            generate_analysis_report(result_data, pdf_path)
-            
-            # Send the file
+            # Stream the buffer to the client
             return send_file(
-                pdf_path,
+                pdf_buffer,
                 mimetype='application/pdf',
                 as_attachment=True,
                 download_name=f"VisionShield_Report_{video_id}.pdf"
@@ -59,4 +144,119 @@ def register_pdf_routes(app):
             return jsonify({
                 'status': 'error',
                 'message': f'Failed to generate PDF report: {str(e)}'
-            }), 500
\ No newline at end of file
+            }), 500
+            
+    @app.route('/api/export-reports', methods=['POST'])
+    def export_reports():
+        """
+        Stream a ZIP archive containing the PDF reports for several videos
+        
+        Expected JSON body:
+        {
+            "video_ids": ["uuid-string", ...]
+        }
+        
+        Returns:
+            Streamed ZIP download or error response
+        """
+        data = request.get_json(silent=True) or {}
+        video_ids = data.get('video_ids')
+        
+        if not isinstance(video_ids, list) or not video_ids:
+            return jsonify({'status': 'error', 'message': 'No video IDs provided'}), 400
+            
+        if not all(isinstance(video_id, str) for video_id in video_ids):
+            return jsonify({'status': 'error', 'message': 'Video IDs must be strings'}), 400
+            
+        config = current_app.config['VISIONSHIELD_CONFIG']
+        if len(video_ids) > config.MAX_EXPORT_REPORTS:
+            return jsonify({
+                'status': 'error',
+                'message': f'Too many reports requested. Maximum: {config.MAX_EXPORT_REPORTS}'
+            }), 400
+            
+        # Preserve request order but drop duplicates
+        video_ids = list(dict.fromkeys(video_ids))
+        
+        return Response(
+            stream_with_context(_stream_reports_zip(config, video_ids)),
+            mimetype='application/zip',
+            headers={
+                'Content-Disposition': f'attachment; filename=VisionShield_Reports_{int(time.time())}.zip'
+            }
+        )
+    
+    @app.route('/api/report-jobs', methods=['POST'])
+    def create_report_job():
+        """
+        Start a bulk PDF export rendered on a process pool
+        
+        Expected JSON body (either video_ids or filter):
+        {
+            "video_ids": ["uuid-string", ...],
+            "filter": {
+                "prediction": "Real" | "Deepfake",
+                "since": 1700000000000,
+                "until": 1800000000000,
+                "filename": "substring"
+            }
+        }
+        
+        Returns:
+            Job status with job_id for progress polling
+        """
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            data = {}
+        config = current_app.config['VISIONSHIELD_CONFIG']
+        
+        is_valid, error_message = validate_report_job_request(data)
+        if not is_valid:
+            return jsonify({'status': 'error', 'message': error_message}), 400
+            
+        video_ids = data.get('video_ids')
+        if video_ids is None:
+            history_filter = data['filter']
+            video_ids = find_video_ids(
+                config.UPLOAD_FOLDER,
+                prediction=history_filter.get('prediction'),
+                since=history_filter.get('since'),
+                until=history_filter.get('until'),
+                filename_contains=history_filter.get('filename')
+            )
+            if not video_ids:
+                return jsonify({'status': 'error', 'message': 'No matching analyses found'}), 404
+        
+        if len(video_ids) > config.MAX_BULK_REPORTS:
+            return jsonify({
+                'status': 'error',
+                'message': f'Too many reports requested. Maximum: {config.MAX_BULK_REPORTS}'
+            }), 400
+        
+        job = get_report_jobs().submit(video_ids)
+        return jsonify({'status': 'success', 'job': job.to_dict()}), 202
+    
+    @app.route('/api/report-jobs/<job_id>')
+    def report_job_status(job_id):
+        """Get progress of a bulk PDF export"""
+        job = get_report_jobs().get(job_id)
+        if job is None:
+            return jsonify({'status': 'error', 'message': 'Report job not found'}), 404
+        return jsonify({'status': 'success', 'job': job.to_dict()})
+    
+    @app.route('/api/report-jobs/<job_id>/download')
+    def download_report_job(job_id):
+        """Download the archive produced by a finished bulk PDF export"""
+        job = get_report_jobs().get(job_id)
+        if job is None:
+            return jsonify({'status': 'error', 'message': 'Report job not found'}), 404
+        if job.status != 'completed':
+            return jsonify({'status': 'error', 'message': f'Report job is {job.status}', 'job': job.to_dict()}), 409
+        if not os.path.exists(job.archive_path):
+            return jsonify({'status': 'error', 'message': 'Report archive has expired'}), 410
+        return send_file(
+            job.archive_path,
+            mimetype='application/zip',
+            as_attachment=True,
+            download_name=f"VisionShield_Reports_{job_id}.zip"
+        )
@@ -28,12 +28,45 @@ def validate_analyze_request(request: Request):
     if not config.allowed_file(file.filename):
         return False, f'Invalid file type. Allowed types: {", ".join(config.ALLOWED_EXTENSIONS)}'
     
-    # Check file size
-    if request.content_length > config.MAX_UPLOAD_SIZE:
+    # Check file size (streamed uploads are also limited while being written)
+    if request.content_length and request.content_length > config.MAX_UPLOAD_SIZE:
         return False, f'File too large. Maximum size: {config.MAX_UPLOAD_SIZE / (1024 * 1024)} MB'
     
     return True, None
 
+def validate_report_job_request(data: dict):
+    """
+    Validate the JSON body of the bulk report job endpoint
+    
+    Args:
+        data: Parsed JSON body
+        
+    Returns:
+        tuple: (is_valid, error_message)
+    """
+    video_ids = data.get('video_ids')
+    history_filter = data.get('filter')
+    
+    if video_ids is not None:
+        if not isinstance(video_ids, list) or not all(isinstance(v, str) for v in video_ids):
+            return False, 'video_ids must be a list of strings'
+        if not video_ids:
+            return False, 'No video IDs provided'
+        return True, None
+        
+    if not isinstance(history_filter, dict):
+        return False, 'Provide video_ids or a history filter'
+        
+    text = (history_filter.get('prediction'), history_filter.get('filename'))
+    bounds = (history_filter.get('since'), history_filter.get('until'))
+    valid_text = all(value is None or isinstance(value, str) for value in text)
+    valid_bounds = all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+                       for value in bounds)
+    if not (valid_text and valid_bounds):
+        return False, 'Invalid history filter'
+    
+    return True, None
+
 def format_analysis_response(video_id: str, result: dict):
     """
     Format the response for the analyze endpoint
@@ -0,0 +1,164 @@
+# api/uploads.py
+# Streaming upload handling for VisionShield
+
+import os
+import uuid
+import hashlib
+from flask import Request, current_app
+from werkzeug.exceptions import RequestEntityTooLarge, UnsupportedMediaType
+from werkzeug.utils import secure_filename
+
+# Number of leading bytes needed to recognise a video container
+SNIFF_LENGTH = 12
+
+
+def sniff_video_container(head: bytes):
+    """
+    Identify a video container from its leading bytes
+    
+    Args:
+        head: At least the first SNIFF_LENGTH bytes of the file
+        
+    Returns:
+        Container name ('mp4', 'avi', 'matroska') or None if not recognised
+    """
+    if len(head) >= 8 and head[4:8] in (b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip'):
+        return 'mp4'
+    if len(head) >= 12 and head[:4] == b'RIFF' and head[8:12] == b'AVI ':
+        return 'avi'
+    if head[:4] == b'\x1a\x45\xdf\xa3':
+        return 'matroska'
+    return None
+
+
+class UploadWriter:
+    """
+    File-like sink that streams an upload straight into UPLOAD_FOLDER
+    
+    The first bytes are checked against known video container signatures,
+    the size limit is enforced while writing and the SHA-256 digest is
+    computed incrementally, so the upload is written to disk exactly once.
+    """
+    
+    def __init__(self, video_id, path, max_size):
+        self.video_id = video_id
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self.container = None
+        self.finalized = False
+        self._head = b''
+        self._hash = hashlib.sha256()
+        self._file = open(path, 'w+b')
+        
+    def write(self, data):
+        if not data:
+            return 0
+            
+        self.size += len(data)
+        if self.size > self.max_size:
+            self.discard()
+            raise RequestEntityTooLarge(
+                f'File too large. Maximum size: {self.max_size / (1024 * 1024)} MB'
+            )
+            
+        if self.container is None:
+            self._head += data[:SNIFF_LENGTH - len(self._head)]
+            if len(self._head) >= SNIFF_LENGTH:
+                self.container = sniff_video_container(self._head)
+                if self.container is None:
+                    self.discard()
+                    raise UnsupportedMediaType('Uploaded file is not a recognised video container')
+                    
+        self._hash.update(data)
+        return self._file.write(data)
+        
+    def seek(self, offset, whence=0):
+        return self._file.seek(offset, whence)
+        
+    def tell(self):
+        return self._file.tell()
+        
+    def read(self, size=-1):
+        return self._file.read(size)
+        
+    def readline(self, size=-1):
+        return self._file.readline(size)
+        
+    def flush(self):
+        self._file.flush()
+        
+    def finalize(self):
+        """
+        Finish the upload and return its SHA-256 digest
+        
+        Raises:
+            UnsupportedMediaType: If the upload was too short to identify
+        """
+        if not self.finalized:
+            if self.container is None:
+                self.discard()
+                raise UnsupportedMediaType('Uploaded file is not a recognised video container')
+            self._file.flush()
+            self.finalized = True
+        return self._hash.hexdigest()
+        
+    def discard(self):
+        """Close and delete a partial or rejected upload"""
+        self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            
+    def close(self):
+        if not self.finalized:
+            self.discard()
+        else:
+            self._file.close()
+            
+    @property
+    def closed(self):
+        return self._file.closed
+
+
+class StreamingUploadRequest(Request):
+    """
+    Request class that writes video uploads directly to their final location
+    
+    For the analyze endpoint, werkzeug's multipart parser streams each file
+    part into an UploadWriter instead of a temporary file, so the upload no
+    longer needs to be copied with FileStorage.save(). Uploads that are
+    never finalized are deleted when the request is closed.
+    """
+    
+    streaming_endpoints = {'api.analyze'}
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if self.endpoint not in self.streaming_endpoints or not filename:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+            
+        config = current_app.config['VISIONSHIELD_CONFIG']
+        if total_content_length and total_content_length > config.MAX_UPLOAD_SIZE:
+            raise RequestEntityTooLarge(
+                f'File too large. Maximum size: {config.MAX_UPLOAD_SIZE / (1024 * 1024)} MB'
+            )
+        if not config.allowed_file(filename):
+            raise UnsupportedMediaType(
+                f'Invalid file type. Allowed types: {", ".join(config.ALLOWED_EXTENSIONS)}'
+            )
+            
+        video_id = str(uuid.uuid4())
+        _, extension = os.path.splitext(secure_filename(filename))
+        writer = UploadWriter(
+            video_id,
+            os.path.join(config.UPLOAD_FOLDER, f"{video_id}{extension}"),
+            max_size=config.MAX_UPLOAD_SIZE
+        )
+        # Remember every writer so unfinished uploads are removed on close
+        self.__dict__.setdefault('_upload_writers', []).append(writer)
+        return writer
+        
+    def close(self):
+        super().close()
+        for writer in self.__dict__.get('_upload_writers', ()):
+            if not writer.closed:
+                writer.close()
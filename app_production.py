@@ -8,9 +8,17 @@ from config_production import Config
 from api.routes import api_bp
 from api.routes_pdf import register_pdf_routes
 from api.feedback import register_feedback_routes
+from api.resumable import register_resumable_routes
+from api.progress import register_progress_routes
+from api.uploads import StreamingUploadRequest
+from api.metrics import register_metrics
+from api.profiling import register_admin_routes
+from api.model_admin import register_model_admin_routes
+from storage import start_janitor
 
 def create_app(config_class=Config):
     app = Flask(__name__)
+    app.request_class = StreamingUploadRequest
     config = config_class()
     app.secret_key = config.SECRET_KEY
     app.config['MAX_CONTENT_LENGTH'] = config.MAX_UPLOAD_SIZE
@@ -21,6 +29,14 @@ def create_app(config_class=Config):
     app.register_blueprint(api_bp)
     register_pdf_routes(app)
     register_feedback_routes(app)
+    register_resumable_routes(app)
+    register_progress_routes(app)
+    register_metrics(app)
+    register_admin_routes(app)
+    register_model_admin_routes(app)
+    
+    # Remove leftovers of crashed analyses and keep UPLOAD_FOLDER within its limits
+    app.config['STORAGE_JANITOR'] = start_janitor(config)
     
     @app.route('/')
     def index():
@@ -0,0 +1,292 @@
+# asgi.py
+# ASGI entry point for VisionShield: network I/O on an event loop, Flask views on thread pools
+#
+# Usage:
+#   uvicorn asgi:app --host 0.0.0.0 --port $PORT
+#
+# Under gunicorn's threaded workers a client holds a thread for as long as its
+# 500 MB upload or video download takes, so a few slow clients starve the
+# analyses. Here the event loop receives request bodies and sends responses;
+# a Flask view only gets a thread once its request has fully arrived, and
+# file responses give the thread back after every block.
+
+import sys
+import asyncio
+import tempfile
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug import wsgi
+
+from app_production import app as flask_app
+from api.metrics import HTTP_REQUESTS
+from api.progress import POLL_INTERVAL, iter_events, progress_exists
+
+# Views for these methods only read (results, history, videos, heatmaps) and
+# run on the I/O pool; uploads, analyses and report jobs run on the app pool
+READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+PROGRESS_PREFIX = '/api/progress/'
+BLOCK_SIZE = 256 * 1024  # Bytes per executor hop when reading bodies and files
+
+_END = object()
+
+
+class ClientDisconnected(Exception):
+    """The client went away before its request body arrived"""
+
+
+class FileWrapper(wsgi.FileWrapper):
+    """
+    wsgi.file_wrapper that reads send_file responses in large blocks
+    
+    werkzeug's wrapper stays seekable, so Range requests (every seek in a
+    video player) start reading at the requested offset.
+    """
+    
+    def __init__(self, file, buffer_size=BLOCK_SIZE):
+        super().__init__(file, max(buffer_size, BLOCK_SIZE))
+
+
+async def _watch_disconnect(receive, disconnected):
+    """Set disconnected once the client closes the connection"""
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            disconnected.set()
+            return
+
+
+class AsyncFrontend:
+    """
+    ASGI application serving the VisionShield Flask app
+    
+    Request bodies are received on the event loop into a spooled temp file
+    (in memory up to ASGI_BODY_MEMORY_LIMIT, then in UPLOAD_FOLDER) and the
+    WSGI view runs on a thread pool once the body is complete. Response
+    bodies are pulled one block at a time on the same pool and sent from the
+    loop, so a slow reader costs a coroutine instead of a thread. Progress
+    streams (/api/progress) are served by the loop directly.
+    """
+    
+    def __init__(self, wsgi_app):
+        """
+        Args:
+            wsgi_app: Flask app created by app_production.create_app
+        """
+        self.wsgi_app = wsgi_app
+        self.config = wsgi_app.config['VISIONSHIELD_CONFIG']
+        self.app_executor = ThreadPoolExecutor(
+            max_workers=self.config.ASGI_APP_THREADS,
+            thread_name_prefix='visionshield-asgi-app'
+        )
+        self.io_executor = ThreadPoolExecutor(
+            max_workers=self.config.ASGI_IO_THREADS,
+            thread_name_prefix='visionshield-asgi-io'
+        )
+        
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            if scope['method'] == 'GET' and scope['path'].startswith(PROGRESS_PREFIX):
+                if await self._stream_progress(scope, receive, send):
+                    return
+            await self._call_wsgi(scope, receive, send)
+        # Websocket connections are not accepted; the server rejects them
+        
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.app_executor.shutdown(wait=False)
+                self.io_executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+                
+    async def _read_body(self, receive):
+        """
+        Receive the whole request body
+        
+        Returns:
+            Tuple of (file positioned at 0, size). Bodies above MAX_UPLOAD_SIZE
+            stop being read and come back as an empty file with their size so
+            far, which Flask rejects with its usual 413 response.
+            
+        Raises:
+            ClientDisconnected: If the client went away mid-upload
+        """
+        loop = asyncio.get_running_loop()
+        body = tempfile.SpooledTemporaryFile(max_size=self.config.ASGI_BODY_MEMORY_LIMIT,
+                                             dir=self.config.UPLOAD_FOLDER)
+        size = pending_size = 0
+        pending = []
+        try:
+            more_body = True
+            while more_body:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    raise ClientDisconnected()
+                chunk = message.get('body', b'')
+                more_body = message.get('more_body', False)
+                size += len(chunk)
+                if size > self.config.MAX_UPLOAD_SIZE:
+                    body.close()
+                    return BytesIO(), size
+                    
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= BLOCK_SIZE or not more_body:
+                    # Spooled bodies end up on disk; never write from the loop
+                    await loop.run_in_executor(self.io_executor, body.writelines, pending)
+                    pending, pending_size = [], 0
+            body.seek(0)
+            return body, size
+        except BaseException:
+            body.close()
+            raise
+            
+    def _environ(self, scope, body, size):
+        """Build the WSGI environ of an ASGI HTTP request"""
+        server = scope.get('server') or ('localhost', 80)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope['query_string'].decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+            'REMOTE_ADDR': scope['client'][0] if scope.get('client') else '',
+            'CONTENT_LENGTH': str(size),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': body,
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False,
+            'wsgi.file_wrapper': FileWrapper
+        }
+        for name, value in scope['headers']:
+            name = name.decode('latin-1').upper().replace('-', '_')
+            value = value.decode('latin-1')
+            # The body has been received in full, so its length is known
+            if name in ('CONTENT_LENGTH', 'TRANSFER_ENCODING'):
+                continue
+            if name == 'CONTENT_TYPE':
+                environ['CONTENT_TYPE'] = value
+                continue
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+        
+    async def _call_wsgi(self, scope, receive, send):
+        """Run one request through the Flask app on a thread pool"""
+        loop = asyncio.get_running_loop()
+        executor = self.io_executor if scope['method'] in READ_METHODS else self.app_executor
+        
+        declared = dict(scope['headers']).get(b'content-length')
+        if declared and declared.isdigit() and int(declared) > self.config.MAX_UPLOAD_SIZE:
+            # Reject without reading (or sending 100 Continue for) the body
+            body, size = BytesIO(), int(declared)
+        else:
+            try:
+                body, size = await self._read_body(receive)
+            except ClientDisconnected:
+                return
+                
+        response = {}
+        
+        def start_response(status, headers, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = headers
+            return response.setdefault('written', []).append
+            
+        def start():
+            # Also pull the first block: WSGI apps may call start_response lazily
+            iterable = self.wsgi_app(self._environ(scope, body, size), start_response)
+            chunks = iter(iterable)
+            return iterable, chunks, next(chunks, _END)
+            
+        disconnected = asyncio.Event()
+        watcher = None
+        iterable = None
+        try:
+            iterable, chunks, chunk = await loop.run_in_executor(executor, start)
+            watcher = loop.create_task(_watch_disconnect(receive, disconnected))
+            await send({
+                'type': 'http.response.start',
+                'status': response['status'],
+                'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                            for name, value in response['headers']]
+            })
+            for data in response.get('written', ()):
+                await send({'type': 'http.response.body', 'body': data, 'more_body': True})
+            while chunk is not _END and not disconnected.is_set():
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                chunk = await loop.run_in_executor(executor, next, chunks, _END)
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+            if hasattr(iterable, 'close'):
+                await loop.run_in_executor(executor, iterable.close)
+            body.close()
+            
+    async def _stream_progress(self, scope, receive, send):
+        """
+        Serve /api/progress/<video_id> from the event loop
+        
+        Returns:
+            False if the analysis is unknown, leaving the 404 to Flask
+        """
+        loop = asyncio.get_running_loop()
+        video_id = scope['path'][len(PROGRESS_PREFIX):]
+        upload_dir = self.config.UPLOAD_FOLDER
+        if '/' in video_id or not await loop.run_in_executor(self.io_executor, progress_exists, upload_dir, video_id):
+            return False
+            
+        try:
+            last_event_id = int(dict(scope['headers']).get(b'last-event-id', b'0'))
+        except ValueError:
+            last_event_id = 0
+            
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream; charset=utf-8'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no')
+            ]
+        })
+        HTTP_REQUESTS.inc(endpoint='progress.analysis_progress', method='GET', status=200)
+        
+        events = iter_events(upload_dir, video_id, last_event_id)
+        disconnected = asyncio.Event()
+        watcher = loop.create_task(_watch_disconnect(receive, disconnected))
+        try:
+            while not disconnected.is_set():
+                # Each poll is a few small file reads; keep them off the loop
+                message = await loop.run_in_executor(self.io_executor, next, events, _END)
+                if message is _END:
+                    break
+                if message is None:
+                    try:
+                        await asyncio.wait_for(disconnected.wait(), POLL_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await send({'type': 'http.response.body', 'body': message.encode('utf-8'), 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            watcher.cancel()
+            events.close()
+        return True
+
+
+app = AsyncFrontend(flask_app)
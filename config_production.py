@@ -2,7 +2,12 @@
 # Production configuration for Railway deployment
 
 import os
-import urllib.request
+
+# Choices of the backend settings, checked here so a typo fails at startup
+# rather than on the first analysis or report. The modules implementing them
+# import these tuples, and this module stays free of heavy imports.
+DECODE_BACKENDS = ('auto', 'ffmpeg', 'pyav', 'opencv')
+CHART_BACKENDS = ('native', 'matplotlib')
 
 class Config:
     """Production configuration class for VisionShield application"""
@@ -15,51 +20,167 @@ class Config:
         self.BATCH_SIZE = 1
         self.SEQ_LENGTH = 20
         self.FRAME_SKIP = 30
+        self.FRAME_SAMPLING = os.environ.get('FRAME_SAMPLING', 'uniform')  # 'uniform' or 'adaptive'
         self.HIDDEN_SIZE = 128
         self.NUM_LSTM_LAYERS = 1
         self.DROPOUT = 0.5
         
+        # Frame decoding: 'auto' prefers ffmpeg, then PyAV, then OpenCV. Frames are
+        # downscaled while decoding so 1080p/4K uploads are never held at full size
+        self.DECODE_BACKEND = os.environ.get('DECODE_BACKEND', 'auto')
+        if self.DECODE_BACKEND not in DECODE_BACKENDS:
+            raise ValueError(f"Unknown DECODE_BACKEND '{self.DECODE_BACKEND}'. "
+                             f"Choose from: {', '.join(DECODE_BACKENDS)}")
+        self.DECODE_MAX_DIMENSION = 480
+        self.DECODE_THREADS = int(os.environ.get('DECODE_THREADS', 0))
+        
+        # Progressive inference: score a few frames first and only add more
+        # while the fake probability stays inside the uncertainty band
+        self.PROGRESSIVE_INFERENCE = os.environ.get('PROGRESSIVE_INFERENCE', 'false').lower() == 'true'
+        self.PROGRESSIVE_INITIAL_FRAMES = 5
+        self.PROGRESSIVE_UNCERTAINTY_BAND = (0.2, 0.8)
+        
+        # Cascade inference: a cheap screening model (MobileNetV3 backbone under the
+        # same fusion/LSTM head) scores every video and only videos whose fake
+        # probability falls inside the band are escalated to the full model
+        self.CASCADE_INFERENCE = os.environ.get('CASCADE_INFERENCE', 'false').lower() == 'true'
+        self.SCREENING_BACKBONE = os.environ.get('SCREENING_BACKBONE', 'mobilenet_v3_small')
+        self.CASCADE_BAND = (float(os.environ.get('CASCADE_LOW', 0.1)), float(os.environ.get('CASCADE_HIGH', 0.9)))
+        
+        # Face cropping: feed tracked face regions instead of whole frames to the CNN
+        self.FACE_CROP = os.environ.get('FACE_CROP', 'false').lower() == 'true'
+        self.FACE_CROP_MARGIN = 0.25
+        
         # Paths
         self.BASE_DIR = os.path.dirname(os.path.abspath(__file__))
         self.UPLOAD_FOLDER = os.path.join(self.BASE_DIR, 'static', 'uploads')
         self.HEATMAP_FOLDER = os.path.join(self.BASE_DIR, 'static', 'heatmaps')
         
-        # Model path - will download if not exists
-        self.MODEL_SAVE_PATH = os.path.join(self.BASE_DIR, 'models', 'weights', 'visionshield_model.pth')
+        # Near-duplicate detection of re-encoded copies: 'off', 'flag' (annotate
+        # the result) or 'reuse' (return the earlier verdict without inference)
+        self.NEAR_DUPLICATE_MODE = os.environ.get('NEAR_DUPLICATE_MODE', 'flag')
+        self.FINGERPRINT_INDEX_PATH = os.path.join(self.UPLOAD_FOLDER, 'fingerprints.jsonl')
+        
+        # Model path - fetched on first use if missing (see models.artifacts). The
+        # weights folder is a cache shared by every worker process
+        self.MODEL_CACHE_DIR = os.environ.get('MODEL_CACHE_DIR', os.path.join(self.BASE_DIR, 'models', 'weights'))
+        self.MODEL_SAVE_PATH = os.path.join(self.MODEL_CACHE_DIR, 'visionshield_model.pth')
+        self.SCREENING_MODEL_PATH = os.path.join(self.MODEL_CACHE_DIR, 'visionshield_screening.pth')
+        
+        # Model registry: MODEL_SAVE_PATH is version MODEL_VERSION, and every
+        # <version>.pth in MODEL_REGISTRY_FOLDER can be activated or shadowed at
+        # runtime through /api/admin/models. Results are stamped with their version
+        self.MODEL_VERSION = os.environ.get('MODEL_VERSION', 'default')
+        self.MODEL_REGISTRY_FOLDER = os.path.join(self.MODEL_CACHE_DIR, 'registry')
+        self.SHADOW_MODEL_VERSION = os.environ.get('SHADOW_MODEL_VERSION')  # Candidate loaded at startup
+        self.SHADOW_SAMPLE_RATE = float(os.environ.get('SHADOW_SAMPLE_RATE', 0.1))
         
         # Model download URL from GitHub Releases
         self.MODEL_URL = os.environ.get(
             'MODEL_URL',
             'https://github.com/yaoguri/visionshield/releases/download/model/visionshield_model.pth'  
         )
+        # Tried before MODEL_URL, e.g. file:///mnt/models/visionshield_model.pth or an internal HTTP mirror
+        self.MODEL_MIRROR_URL = os.environ.get('MODEL_MIRROR_URL')
+        # Expected SHA-256 of the checkpoint; downloads that do not match are discarded
+        self.MODEL_SHA256 = os.environ.get('MODEL_SHA256')
+        self.MODEL_FETCH_TIMEOUT = int(os.environ.get('MODEL_FETCH_TIMEOUT', 60))
+        # Cascade screening checkpoint (file, http or https URL) and its SHA-256; no
+        # public one exists, so cascade inference needs either this or a file at
+        # SCREENING_MODEL_PATH
+        self.SCREENING_MODEL_URL = os.environ.get('SCREENING_MODEL_URL')
+        self.SCREENING_MODEL_SHA256 = os.environ.get('SCREENING_MODEL_SHA256')
+        if self.CASCADE_INFERENCE and not self.SCREENING_MODEL_URL and not os.path.exists(self.SCREENING_MODEL_PATH):
+            print(f"Warning: CASCADE_INFERENCE is on but there is no screening checkpoint at "
+                  f"{self.SCREENING_MODEL_PATH} and no SCREENING_MODEL_URL; cascade inference is disabled")
+            self.CASCADE_INFERENCE = False
+        
+        # Inference server: one local process (python -m models.server) holds the
+        # models and runs batched inference for every worker over a Unix socket, so
+        # adding gunicorn workers adds no model copies. The first worker that needs
+        # it starts it unless INFERENCE_SERVER_AUTOSTART is off. The server outlives
+        # the worker that started it and exits after INFERENCE_IDLE_TIMEOUT seconds
+        # without any connected worker (0 keeps it running until --stop)
+        self.INFERENCE_SERVER = os.environ.get('INFERENCE_SERVER', 'false').lower() == 'true'
+        self.INFERENCE_SOCKET = os.environ.get('INFERENCE_SOCKET', '/tmp/visionshield-inference.sock')
+        self.INFERENCE_SERVER_AUTOSTART = os.environ.get('INFERENCE_SERVER_AUTOSTART', 'true').lower() == 'true'
+        self.INFERENCE_TIMEOUT = 300  # Seconds to wait for one inference reply
+        self.INFERENCE_IDLE_TIMEOUT = float(os.environ.get('INFERENCE_IDLE_TIMEOUT', 300))
+        self.INFERENCE_MAX_BATCH = int(os.environ.get('INFERENCE_MAX_BATCH', 8))
+        self.INFERENCE_BATCH_WAIT_MS = float(os.environ.get('INFERENCE_BATCH_WAIT_MS', 5))
+        self.INFERENCE_MAX_MODELS = 3  # Active, shadow and screening model
+        self.CLIENT_TORCH_THREADS = int(os.environ.get('CLIENT_TORCH_THREADS', 1))  # Preprocessing threads per worker
         
         # Ensure directories exist
         for directory in [self.UPLOAD_FOLDER, self.HEATMAP_FOLDER, os.path.dirname(self.MODEL_SAVE_PATH)]:
             os.makedirs(directory, exist_ok=True)
         
-        # Download model if it doesn't exist
-        self._ensure_model_downloaded()
-        
         # API configuration
         self.MAX_UPLOAD_SIZE = 500 * 1024 * 1024  # 500MB for deployment
         self.ALLOWED_EXTENSIONS = {'mp4', 'avi', 'mov', 'webm', 'mkv'}
         
+        # Resumable upload configuration
+        self.RESUMABLE_FOLDER = os.path.join(self.UPLOAD_FOLDER, 'resumable')
+        self.RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024  # Suggested chunk size for clients
+        self.RESUMABLE_MAX_CHUNK_SIZE = 32 * 1024 * 1024
+        
+        # Number of background threads running analyses started by finalize
+        self.ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 1))
+        
+        # ASGI serving mode (uvicorn asgi:app): the event loop receives uploads and
+        # sends responses, Flask views run on two thread pools so reads never
+        # queue behind uploads and analyses
+        self.ASGI_APP_THREADS = int(os.environ.get('ASGI_APP_THREADS', 2))  # Uploads, analyses and other writes
+        self.ASGI_IO_THREADS = int(os.environ.get('ASGI_IO_THREADS', 16))  # Reads, downloads and body spooling
+        self.ASGI_BODY_MEMORY_LIMIT = 1024 * 1024  # Larger request bodies are spooled to UPLOAD_FOLDER
+        
+        # Progress streams are meant for the ASGI mode, where they cost a coroutine.
+        # Under gunicorn each one holds a worker thread for up to 15 minutes, so
+        # at most this many run per process there; clients beyond it get a 503
+        # and fall back to polling /api/results
+        self.PROGRESS_MAX_WSGI_STREAMS = int(os.environ.get('PROGRESS_MAX_WSGI_STREAMS', 1))
+        
+        # PDF report configuration ('native' ReportLab drawings or 'matplotlib' PNGs)
+        self.PDF_CHART_BACKEND = os.environ.get('PDF_CHART_BACKEND', 'native')
+        if self.PDF_CHART_BACKEND not in CHART_BACKENDS:
+            raise ValueError(f"Unknown PDF_CHART_BACKEND '{self.PDF_CHART_BACKEND}'. "
+                             f"Choose from: {', '.join(CHART_BACKENDS)}")
+        self.PDF_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # Reports above 8MB spill to a temp file
+        self.MAX_EXPORT_REPORTS = 500  # Max reports per bulk ZIP export
+        self.MAX_BULK_REPORTS = 5000  # Max reports per background report job
+        self.REPORT_WORKERS = int(os.environ.get('REPORT_WORKERS', min(4, os.cpu_count() or 1)))
+        self.EXPORT_FOLDER = os.path.join(self.UPLOAD_FOLDER, 'exports')
+        
+        # Storage lifecycle: a background janitor deletes artifacts older than their
+        # retention in days and, above the quota, evicts the least recently used
+        # videos, heatmaps, profiles and report archives. Every retention defaults
+        # to 0 (keep forever), so nothing is deleted unless a deployment opts in;
+        # a typical policy is videos 7, heatmaps 30, profiles 14, reports 7,
+        # exports 1 and resumable sessions 2 days. Result records are only ever
+        # removed by their own retention
+        self.RETENTION_DAYS = {
+            'video': float(os.environ.get('RETENTION_VIDEO_DAYS', 0)),
+            'heatmaps': float(os.environ.get('RETENTION_HEATMAP_DAYS', 0)),
+            'profile': float(os.environ.get('RETENTION_PROFILE_DAYS', 0)),
+            'report': float(os.environ.get('RETENTION_REPORT_DAYS', 0)),
+            'export': float(os.environ.get('RETENTION_EXPORT_DAYS', 0)),
+            'resumable': float(os.environ.get('RETENTION_RESUMABLE_DAYS', 0)),
+            'result': float(os.environ.get('RETENTION_RESULT_DAYS', 0))
+        }
+        self.STORAGE_QUOTA_MB = int(os.environ.get('STORAGE_QUOTA_MB', 0))  # 0 disables the quota
+        self.JANITOR_INTERVAL = int(os.environ.get('JANITOR_INTERVAL', 600))  # Seconds between passes, 0 disables
+        
+        # Profiling: analyses are profiled when a request sends the admin token in
+        # the X-VisionShield-Profile header, or at random with this rate (0 disables)
+        self.PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+        
+        # Admin endpoints (/api/admin) are disabled unless a token is configured
+        self.ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+        
         # Web configuration
         self.SECRET_KEY = os.environ.get('SECRET_KEY', os.urandom(24).hex())
         self.DEBUG = False  # Always False in production
     
-    def _ensure_model_downloaded(self):
-        """Download model from GitHub releases if not present"""
-        if not os.path.exists(self.MODEL_SAVE_PATH):
-            print(f"Model not found at {self.MODEL_SAVE_PATH}")
-            print(f"Downloading model from {self.MODEL_URL}...")
-            try:
-                urllib.request.urlretrieve(self.MODEL_URL, self.MODEL_SAVE_PATH)
-                print(f"Model downloaded successfully to {self.MODEL_SAVE_PATH}")
-            except Exception as e:
-                print(f"Error downloading model: {e}")
-                raise RuntimeError("Could not download model file")
-    
     def allowed_file(self, filename):
         """Check if a file has an allowed extension"""
         return '.' in filename and filename.rsplit('.', 1)[1].lower() in self.ALLOWED_EXTENSIONS
@@ -1,14 +1,22 @@
 # models/__init__.py
 # This file marks the models directory as a Python package
 
-from models.visionshield import VisionShield, ResNet50FeatureExtractor
-from models.utils import extract_frames, load_model, analyze_video, generate_heatmap
-
-__all__ = [
-    'VisionShield',
-    'ResNet50FeatureExtractor',
-    'extract_frames',
-    'load_model',
-    'analyze_video',
-    'generate_heatmap'
-]
\ No newline at end of file
+# Exports are imported on first access, so light submodules such as
+# models.decode or models.artifacts can be used without loading torch
+_EXPORTS = {
+    'VisionShield': 'models.visionshield',
+    'ResNet50FeatureExtractor': 'models.visionshield',
+    'extract_frames': 'models.utils',
+    'load_model': 'models.utils',
+    'analyze_video': 'models.utils',
+    'generate_heatmap': 'models.utils'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
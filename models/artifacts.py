@@ -0,0 +1,199 @@
+# models/artifacts.py
+# Checksummed, cached fetching of model weights shared by all worker processes
+
+import os
+import time
+import fcntl
+import hashlib
+import tempfile
+import urllib.parse
+import urllib.request
+from typing import List, Optional
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ArtifactError(RuntimeError):
+    """Raised when an artifact cannot be fetched from any source"""
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 hex digest of a file, read in chunks"""
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _open_source(source: str, timeout: float):
+    """Open a URL, file:// URL or local path for streaming reads"""
+    scheme = urllib.parse.urlparse(source).scheme
+    if scheme in ('http', 'https'):
+        return urllib.request.urlopen(source, timeout=timeout)
+    if scheme == 'file':
+        return open(urllib.request.url2pathname(urllib.parse.urlparse(source).path), 'rb')
+    if scheme == '':
+        return open(source, 'rb')
+    raise ArtifactError(f"Unsupported artifact source {source}")
+
+
+def _verified_stamp(path: str) -> str:
+    """Sidecar file recording the digest of an already verified artifact"""
+    return f"{path}.sha256"
+
+
+def _is_verified(path: str, sha256: str) -> bool:
+    """
+    Check an existing artifact against its expected digest
+    
+    The digest of a verified file is remembered with its size and mtime, so
+    later startups skip re-hashing unless the file changed.
+    """
+    stat = os.stat(path)
+    stamp = f"{sha256} {stat.st_size} {stat.st_mtime_ns}"
+    try:
+        with open(_verified_stamp(path), 'r') as f:
+            if f.read().strip() == stamp:
+                return True
+    except OSError:
+        pass
+        
+    if file_sha256(path) != sha256:
+        return False
+    with open(_verified_stamp(path), 'w') as f:
+        f.write(stamp + '\n')
+    return True
+
+
+def _download(source: str, path: str, sha256: Optional[str], timeout: float):
+    """Stream a source into a temp file next to path, verify it and move it into place"""
+    directory = os.path.dirname(path) or '.'
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.part', dir=directory)
+    try:
+        digest = hashlib.sha256()
+        size = 0
+        with os.fdopen(fd, 'wb') as out, _open_source(source, timeout) as response:
+            for chunk in iter(lambda: response.read(CHUNK_SIZE), b''):
+                out.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+            
+        if size == 0:
+            raise ArtifactError(f"{source} is empty")
+        if sha256 and digest.hexdigest() != sha256:
+            raise ArtifactError(f"Checksum mismatch for {source}: expected {sha256}, got {digest.hexdigest()}")
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+        
+    if sha256:
+        stat = os.stat(path)
+        with open(_verified_stamp(path), 'w') as f:
+            f.write(f"{sha256} {stat.st_size} {stat.st_mtime_ns}\n")
+    return size
+
+
+def fetch_artifact(
+    path: str,
+    sources: List[str],
+    sha256: Optional[str] = None,
+    timeout: float = 60,
+    retries: int = 2
+) -> str:
+    """
+    Make sure an artifact exists at path, downloading it if needed
+    
+    Sources are tried in order (e.g. a local mirror before the public URL),
+    each up to retries + 1 times. Downloads go to a temp file in the same
+    folder and are renamed into place only after the checksum matched, so a
+    crash never leaves a partial artifact behind. An exclusive lock file
+    makes concurrent worker processes wait for one download instead of
+    each starting their own.
+    
+    Args:
+        path: Where the artifact is kept (its folder is the shared cache)
+        sources: URLs (http, https or file) or local paths to fetch from
+        sha256: Expected hex digest; None skips verification
+        timeout: Socket timeout in seconds for HTTP sources
+        retries: Extra attempts per source after a failure
+        
+    Returns:
+        path
+        
+    Raises:
+        ArtifactError: If no source produced a valid artifact
+    """
+    sha256 = sha256.lower() if sha256 else None
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    
+    with open(f"{path}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            # Another worker may have finished the download while we waited
+            if os.path.exists(path):
+                if not sha256 or _is_verified(path, sha256):
+                    return path
+                print(f"Cached artifact {path} does not match its checksum, fetching it again")
+                
+            errors = []
+            for source in sources:
+                for attempt in range(retries + 1):
+                    try:
+                        print(f"Fetching {source} to {path}...")
+                        start = time.perf_counter()
+                        size = _download(source, path, sha256, timeout)
+                        print(f"Fetched {size / (1024 * 1024):.1f} MB in {time.perf_counter() - start:.1f}s"
+                              f"{'' if sha256 else ' (checksum not configured, not verified)'}")
+                        return path
+                    except Exception as e:
+                        errors.append(f"{source}: {e}")
+                        print(f"Fetching {source} failed (attempt {attempt + 1}): {e}")
+                        if isinstance(e, ArtifactError) or attempt == retries:
+                            break
+                        time.sleep(2 ** attempt)
+            raise ArtifactError(f"Could not fetch {os.path.basename(path)}: {'; '.join(errors) or 'no sources'}")
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def ensure_model_weights(config) -> str:
+    """
+    Fetch the default model checkpoint on first use
+    
+    Args:
+        config: VisionShield config with MODEL_SAVE_PATH, MODEL_MIRROR_URL,
+            MODEL_URL, MODEL_SHA256 and MODEL_FETCH_TIMEOUT
+            
+    Returns:
+        MODEL_SAVE_PATH
+    """
+    sources = [source for source in (config.MODEL_MIRROR_URL, config.MODEL_URL) if source]
+    return fetch_artifact(config.MODEL_SAVE_PATH, sources, sha256=config.MODEL_SHA256,
+                          timeout=config.MODEL_FETCH_TIMEOUT)
+
+
+def ensure_screening_weights(config) -> str:
+    """
+    Fetch the cascade screening checkpoint on first use
+    
+    Unlike the default model there is no public screening checkpoint, so
+    without SCREENING_MODEL_URL the file has to be placed at
+    SCREENING_MODEL_PATH by hand.
+    
+    Args:
+        config: VisionShield config with SCREENING_MODEL_PATH, SCREENING_MODEL_URL,
+            SCREENING_MODEL_SHA256 and MODEL_FETCH_TIMEOUT
+            
+    Returns:
+        SCREENING_MODEL_PATH
+    """
+    sources = [config.SCREENING_MODEL_URL] if config.SCREENING_MODEL_URL else []
+    return fetch_artifact(config.SCREENING_MODEL_PATH, sources, sha256=config.SCREENING_MODEL_SHA256,
+                          timeout=config.MODEL_FETCH_TIMEOUT)
@@ -0,0 +1,288 @@
+# models/decode.py
+# Video probing and reduced-resolution frame decoding for VisionShield preprocessing
+
+import re
+import shutil
+import tempfile
+import subprocess
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from config_production import DECODE_BACKENDS
+AUTO_BACKENDS = ('ffmpeg', 'pyav', 'opencv')  # Order 'auto' tries them in
+
+_ffmpeg_passthrough = None
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """Container metadata of a video, read once by probe_video"""
+
+    path: str
+    width: int
+    height: int
+    fps: float
+    frame_count: int  # 0 when the container does not record it
+
+    @property
+    def duration(self) -> int:
+        """Duration in whole seconds (0 if the frame rate is unknown)"""
+        return int(self.frame_count / self.fps) if self.fps > 0 else 0
+
+    @property
+    def resolution(self) -> str:
+        return f"{self.width}x{self.height}"
+
+    def clamp_frame(self, index: int) -> int:
+        """Clamp a frame index to the video, for seeking"""
+        return min(index, self.frame_count - 1) if self.frame_count > 0 else index
+
+
+def probe_video(video_path: str) -> VideoInfo:
+    """
+    Read the metadata of a video and make sure it has decodable frames
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        VideoInfo for the file
+
+    Raises:
+        ValueError: If the file cannot be opened or contains no frames
+    """
+    cap = cv2.VideoCapture(video_path)
+    try:
+        if not cap.isOpened():
+            raise ValueError(f"Could not open video file {video_path}")
+
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+        frame_count = max(0, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+
+        # Container headers can claim frames that do not decode, so decode one
+        if width <= 0 or height <= 0 or not cap.grab():
+            raise ValueError(f"Video file {video_path} contains no decodable frames")
+    finally:
+        cap.release()
+
+    return VideoInfo(path=video_path, width=width, height=height, fps=fps, frame_count=frame_count)
+
+
+def _pyav_available() -> bool:
+    """Check whether the optional PyAV package can be imported"""
+    try:
+        import av  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """
+    Pick the decode backend to use
+
+    'auto' prefers an ffmpeg binary on PATH, then PyAV, then OpenCV.
+
+    Raises:
+        ValueError: If the backend is unknown or not available
+    """
+    if backend not in DECODE_BACKENDS:
+        raise ValueError(f"Unknown decode backend '{backend}'. Choose from: {', '.join(DECODE_BACKENDS)}")
+    if backend == 'auto':
+        if shutil.which('ffmpeg'):
+            return 'ffmpeg'
+        if _pyav_available():
+            return 'pyav'
+        return 'opencv'
+    if backend == 'ffmpeg' and not shutil.which('ffmpeg'):
+        raise ValueError("Decode backend 'ffmpeg' requested but no ffmpeg binary was found on PATH")
+    if backend == 'pyav' and not _pyav_available():
+        raise ValueError("Decode backend 'pyav' requested but PyAV is not installed")
+    return backend
+
+
+def _ffmpeg_passthrough_args():
+    """
+    ffmpeg options that pass frames through without duplicating or dropping any
+
+    -fps_mode only exists since ffmpeg 5.1 and -vsync is deprecated from
+    there on, so the installed version decides (read once per process).
+    Versions that cannot be parsed, such as git snapshots, get -vsync, which
+    every release still accepts.
+    """
+    global _ffmpeg_passthrough
+    if _ffmpeg_passthrough is None:
+        try:
+            banner = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            banner = ''
+        match = re.match(r'ffmpeg version n?(\d+)\.(\d+)', banner)
+        if match and (int(match.group(1)), int(match.group(2))) >= (5, 1):
+            _ffmpeg_passthrough = ['-fps_mode', 'passthrough']
+        else:
+            _ffmpeg_passthrough = ['-vsync', '0']
+    return _ffmpeg_passthrough
+
+
+def target_size(width: int, height: int, max_dimension: Optional[int]) -> Tuple[int, int]:
+    """
+    Output size that fits max_dimension while keeping the aspect ratio
+
+    Frames are never upscaled and sizes are rounded to even numbers, which
+    the ffmpeg scaler expects.
+    """
+    if not max_dimension or max(width, height) <= max_dimension:
+        return width, height
+    scale = max_dimension / float(max(width, height))
+    return max(2, int(round(width * scale / 2)) * 2), max(2, int(round(height * scale / 2)) * 2)
+
+
+def iter_frames(
+    video_path: str,
+    step: int = 1,
+    max_dimension: Optional[int] = None,
+    backend: str = 'auto',
+    threads: int = 0,
+    info: Optional[VideoInfo] = None
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Decode every step-th frame of a video, downscaled during decoding
+
+    Args:
+        video_path: Path to the video file
+        step: Yield frames whose source index is a multiple of step
+        max_dimension: Longest side of the output frames (None keeps the source size)
+        backend: 'auto', 'ffmpeg', 'pyav' or 'opencv'
+        threads: Decoder threads for ffmpeg/PyAV (0 lets the decoder choose)
+        info: Probe result for the video, saves reopening it to read the frame size
+
+    Yields:
+        Tuples of (source frame index, BGR uint8 frame)
+
+    With backend 'auto', a decoder that fails before producing a frame (an
+    ffmpeg build that rejects the file, say) hands over to the next one.
+    """
+    requested = backend
+    backend = resolve_backend(backend)
+    if requested == 'auto' and backend != 'opencv':
+        return _iter_frames_fallback(video_path, step, max_dimension, backend, threads, info)
+    return _open_frames(video_path, step, max_dimension, backend, threads, info)
+
+
+def _iter_frames_fallback(video_path, step, max_dimension, backend, threads, info):
+    """Decode with backend, moving on to the next 'auto' choice if it fails before the first frame"""
+    if info is None:
+        # An unreadable file is not the decoder's fault; fail once, without fallback
+        info = probe_video(video_path)
+    candidates = [b for b in AUTO_BACKENDS[AUTO_BACKENDS.index(backend):] if b != 'pyav' or _pyav_available()]
+    for position, candidate in enumerate(candidates):
+        produced = False
+        try:
+            for item in _open_frames(video_path, step, max_dimension, candidate, threads, info):
+                produced = True
+                yield item
+            return
+        except ValueError as e:
+            if produced or position == len(candidates) - 1:
+                raise
+            print(f"Warning: {e}; decoding with {candidates[position + 1]} instead")
+
+
+def _open_frames(video_path, step, max_dimension, backend, threads, info):
+    """Start decoding with one resolved backend"""
+    if backend != 'opencv':
+        if info is None:
+            info = probe_video(video_path)
+        size = target_size(info.width, info.height, max_dimension)
+        if backend == 'ffmpeg':
+            return _iter_frames_ffmpeg(video_path, step, size, threads)
+        return _iter_frames_pyav(video_path, step, size, threads)
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video file {video_path}")
+    return _iter_frames_opencv(cap, step, max_dimension)
+
+
+def _iter_frames_ffmpeg(video_path, step, size, threads):
+    """Decode through an ffmpeg subprocess that selects and scales frames before piping them"""
+    width, height = size
+    frame_bytes = width * height * 3
+    command = [
+        'ffmpeg', '-v', 'error', '-nostdin',
+        '-threads', str(threads),
+        '-i', video_path,
+        '-an', '-sn',
+        '-vf', f"select='not(mod(n\\,{step}))',scale={width}:{height}:flags=area",
+        *_ffmpeg_passthrough_args(),
+        '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-'
+    ]
+    # Decode errors go to a file: a full stderr pipe would block ffmpeg while we wait on stdout
+    error_log = tempfile.TemporaryFile()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=error_log, bufsize=frame_bytes)
+    try:
+        count = 0
+        while True:
+            buffer = bytearray(frame_bytes)
+            view = memoryview(buffer)
+            received = 0
+            while received < frame_bytes:
+                chunk = process.stdout.readinto(view[received:])
+                if not chunk:
+                    break
+                received += chunk
+            if received < frame_bytes:
+                break
+            yield count * step, np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 3)
+            count += 1
+
+        process.wait()
+        if process.returncode != 0 and count == 0:
+            error_log.seek(0)
+            error = error_log.read().decode('utf-8', 'replace').strip()
+            raise ValueError(f"ffmpeg could not decode {video_path}: {error}")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        error_log.close()
+
+
+def _iter_frames_pyav(video_path, step, size, threads):
+    """Decode with PyAV and let libswscale convert straight to the target size"""
+    import av
+
+    width, height = size
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        stream.thread_type = 'AUTO'
+        if threads:
+            stream.codec_context.thread_count = threads
+        for index, frame in enumerate(container.decode(stream)):
+            if index % step == 0:
+                yield index, frame.to_ndarray(width=width, height=height, format='bgr24')
+
+
+def _iter_frames_opencv(cap, step, max_dimension):
+    """Fallback: decode with OpenCV, skipping colour conversion for unused frames"""
+    try:
+        index = 0
+        while cap.grab():
+            if index % step == 0:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                h, w = frame.shape[:2]
+                size = target_size(w, h, max_dimension)
+                if size != (w, h):
+                    frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                yield index, frame
+            index += 1
+    finally:
+        cap.release()
@@ -0,0 +1,176 @@
+# models/faces.py
+# Face-region cropping stage for VisionShield preprocessing
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2) in source pixel coordinates
+
+# Sentinel for cache misses (None is a valid cached "no face" result)
+_MISSING = object()
+
+
+def _iou(a: Box, b: Box) -> float:
+    """Intersection over union of two boxes"""
+    ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+    ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+class FaceCropper:
+    """
+    Detect, track and crop face regions in sampled video frames
+
+    Uses OpenCV's bundled Haar cascade on a downscaled grayscale copy of each
+    frame, so it runs on CPU with no model download. Raw detections are cached
+    per (video hash, frame index) and smoothed across frames, reusing the
+    last box when the detector misses a face for a few frames.
+    """
+
+    def __init__(self, margin: float = 0.25, detect_width: int = 320, min_face_size: int = 24,
+                 smoothing: float = 0.6, max_missed: int = 5, cache_size: int = 4096):
+        """
+        Args:
+            margin: Fraction of the face size added around each crop
+            detect_width: Width frames are downscaled to before detection
+            min_face_size: Minimum face size in pixels at detection resolution
+            smoothing: Weight of the previous box when smoothing tracked boxes
+            max_missed: Frames a track survives without a detection
+            cache_size: Maximum number of cached per-frame detections
+        """
+        self.margin = margin
+        self.detect_width = detect_width
+        self.min_face_size = min_face_size
+        self.smoothing = smoothing
+        self.max_missed = max_missed
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._detector = cv2.CascadeClassifier(
+            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+        )
+        if self._detector.empty():
+            raise RuntimeError("Could not load OpenCV face cascade")
+
+    def detect(self, frame: np.ndarray) -> List[Box]:
+        """
+        Detect faces in a single BGR frame
+
+        Returns:
+            List of face boxes in source pixel coordinates
+        """
+        h, w = frame.shape[:2]
+        scale = min(1.0, self.detect_width / float(w))
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if scale < 1.0:
+            gray = cv2.resize(gray, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+        gray = cv2.equalizeHist(gray)
+
+        # The detector is not documented as thread-safe
+        with self._lock:
+            faces = self._detector.detectMultiScale(
+                gray, scaleFactor=1.1, minNeighbors=5,
+                minSize=(self.min_face_size, self.min_face_size)
+            )
+
+        return [
+            (int(x / scale), int(y / scale), int((x + fw) / scale), int((y + fh) / scale))
+            for (x, y, fw, fh) in faces
+        ]
+
+    def _cached_detections(self, video_hash: str, frame_key: Hashable,
+                           load_image: Callable[[Hashable], np.ndarray]):
+        """Return detections for a frame, running the detector on a cache miss"""
+        key = (video_hash, frame_key)
+        with self._lock:
+            cached = self._cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                self._cache.move_to_end(key)
+        if cached is not _MISSING:
+            return cached
+
+        image = load_image(frame_key)
+        detections = (self.detect(image), image.shape[:2])
+        with self._lock:
+            self._cache[key] = detections
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return detections
+
+    def track(self, video_hash: str, frame_keys: List[Hashable],
+              load_image: Callable[[Hashable], np.ndarray]) -> Dict[Hashable, Optional[Box]]:
+        """
+        Compute one crop box per frame, following the face across frames
+
+        Args:
+            video_hash: Content hash of the video (cache namespace)
+            frame_keys: Frame identifiers (e.g. source frame indices) in temporal order
+            load_image: Callable returning the BGR image for a frame key
+
+        Returns:
+            Mapping of frame key to crop box, or None where no face was found
+        """
+        boxes = {}
+        previous = None
+        missed = 0
+
+        for frame_key in dict.fromkeys(frame_keys):
+            detections, (h, w) = self._cached_detections(video_hash, frame_key, load_image)
+
+            if detections:
+                if previous is not None:
+                    box = max(detections, key=lambda d: _iou(d, previous))
+                    if _iou(box, previous) == 0:
+                        box = max(detections, key=lambda d: (d[2] - d[0]) * (d[3] - d[1]))
+                    else:
+                        box = tuple(
+                            int(self.smoothing * p + (1 - self.smoothing) * c)
+                            for p, c in zip(previous, box)
+                        )
+                else:
+                    box = max(detections, key=lambda d: (d[2] - d[0]) * (d[3] - d[1]))
+                previous = box
+                missed = 0
+            elif previous is not None and missed < self.max_missed:
+                missed += 1
+            else:
+                previous = None
+
+            boxes[frame_key] = self._expand(previous, w, h) if previous is not None else None
+
+        # Frames before the first detection borrow the first face box
+        first_box = next((box for box in boxes.values() if box is not None), None)
+        for frame_key, box in boxes.items():
+            if box is not None:
+                break
+            boxes[frame_key] = first_box
+
+        return boxes
+
+    def _expand(self, box: Box, width: int, height: int) -> Box:
+        """Grow a face box by the margin into a square crop clipped to the frame"""
+        x1, y1, x2, y2 = box
+        cx, cy = (x1 + x2) / 2.0, (y1 + y2) / 2.0
+        half = max(x2 - x1, y2 - y1) * (1 + self.margin) / 2.0
+        return (
+            max(0, int(cx - half)), max(0, int(cy - half)),
+            min(width, int(cx + half)), min(height, int(cy + half))
+        )
+
+
+# Shared cropper so the detection cache survives across requests
+_face_cropper = None
+
+
+def get_face_cropper(margin: float = 0.25) -> FaceCropper:
+    """Get or create the process-wide FaceCropper"""
+    global _face_cropper
+    if _face_cropper is None or _face_cropper.margin != margin:
+        _face_cropper = FaceCropper(margin=margin)
+    return _face_cropper
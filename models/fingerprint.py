@@ -0,0 +1,290 @@
+# models/fingerprint.py
+# Perceptual fingerprints and near-duplicate lookup for analyzed videos
+
+import os
+import json
+import fcntl
+import threading
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+# Hamming distance at which two frame hashes are considered the same picture
+FRAME_MATCH_DISTANCE = 10
+
+# Hashes with fewer set (or unset) bits than this come from dark or flat frames,
+# which all look alike; they are neither indexed nor used for lookups
+MIN_HASH_BITS = 8
+
+# Result fields kept per indexed video, enough to return its verdict again
+SUMMARY_FIELDS = (
+    'prediction', 'confidence', 'probabilities', 'max_fake_probability',
+    'avg_fake_probability', 'video_hash', 'model_version'
+)
+
+
+def dhash(frame: np.ndarray) -> int:
+    """
+    Compute a 64-bit difference hash of a BGR frame
+
+    The frame is reduced to a 9x8 grayscale image and each bit records whether
+    a pixel is brighter than its right neighbour, so the hash survives
+    re-encoding, resizing and mild colour changes.
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int(sum(1 << i for i, bit in enumerate(bits) if bit))
+
+
+def is_informative(frame_hash: str) -> bool:
+    """Whether a hex frame hash carries enough structure to identify a picture"""
+    bits = bin(int(frame_hash, 16)).count('1')
+    return MIN_HASH_BITS <= bits <= 64 - MIN_HASH_BITS
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count('1')
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over 64-bit hashes for Hamming radius queries
+
+    Each node is [hash, items, children] where children maps the distance
+    to the parent hash onto a subtree.
+    """
+
+    def __init__(self):
+        self._root = None
+
+    def add(self, value: int, item: Any):
+        """Insert a hash with an associated item"""
+        if self._root is None:
+            self._root = [value, [item], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value: int, radius: int) -> List[tuple]:
+        """
+        Find all items within radius of a hash
+
+        Returns:
+            List of (distance, item) tuples
+        """
+        matches = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= radius:
+                matches.extend((distance, item) for item in node[1])
+            for child_distance, child in node[2].items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+        return matches
+
+
+class FingerprintIndex:
+    """
+    Persistent index of per-frame perceptual hashes of analyzed videos
+
+    Entries are stored as an append-only JSON lines log next to the results
+    and loaded into a BK-tree keyed by frame hash. A query video matches a
+    stored one when enough of its sampled frames have a stored frame within
+    FRAME_MATCH_DISTANCE bits.
+
+    Each process reads the log from where it last stopped and adds only the
+    new records to its tree, so an analysis costs one appended line rather
+    than a rewrite of the whole index. Appends hold an exclusive lock on a
+    sidecar file. Removals append a tombstone; once tombstoned records
+    outnumber live ones the log is compacted, and other processes notice the
+    replaced file and rebuild from it.
+    """
+
+    def __init__(self, path: str, max_distance: int = FRAME_MATCH_DISTANCE, min_match_ratio: float = 0.6):
+        """
+        Args:
+            path: JSON lines file the index is persisted to
+            max_distance: Hamming radius for a frame hash match
+            min_match_ratio: Fraction of query frames that must match a video
+        """
+        self.path = path
+        self.max_distance = max_distance
+        self.min_match_ratio = min_match_ratio
+        self._reset()
+        self._lock = threading.Lock()
+
+    def _reset(self):
+        self._entries = {}
+        self._tree = BKTree()
+        self._inode = None
+        self._offset = 0
+        self._records = 0
+
+    def _apply(self, record: Dict[str, Any]):
+        """Apply one log record to the in-memory index"""
+        if record.get('op') == 'remove':
+            for video_id in record['video_ids']:
+                self._entries.pop(video_id, None)
+            return
+        video_id = record['video_id']
+        self._entries[video_id] = {'hashes': record['hashes'], 'result': record['result']}
+        for frame_hash in record['hashes']:
+            self._tree.add(int(frame_hash, 16), video_id)
+
+    def _reload(self):
+        """Apply the records appended since the last read, or rebuild if the log was replaced"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset()
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except OSError as e:
+            print(f"Warning: Could not read fingerprint index {self.path}: {e}")
+            return
+
+        # Only consume complete lines; a writer may be mid-append
+        complete = chunk.rfind(b'\n') + 1
+        self._offset += complete
+        for line in chunk[:complete].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue
+            self._records += 1
+
+    def _append(self, record: Dict[str, Any]):
+        """Append a record to the log; callers hold the file lock"""
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+    def _compact(self):
+        """Rewrite the log with only the live entries; callers hold the file lock"""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            for video_id, entry in self._entries.items():
+                f.write(json.dumps({'op': 'add', 'video_id': video_id, **entry}) + '\n')
+        os.replace(tmp_path, self.path)
+        self._reset()
+        self._reload()
+
+    def _locked_file(self):
+        lock_file = open(f"{self.path}.lock", 'a')
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    def lookup(self, hashes: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Find the closest previously analyzed video
+
+        Args:
+            hashes: Hex frame hashes of the query video in temporal order
+
+        Returns:
+            Dict with video_id, match_ratio, mean_distance and the stored
+            result summary, or None if no video matches well enough
+        """
+        hashes = [h for h in hashes if is_informative(h)]
+        if not hashes:
+            return None
+
+        with self._lock:
+            self._reload()
+            best_distances = {}
+            for frame_hash in hashes:
+                closest = {}
+                for distance, video_id in self._tree.search(int(frame_hash, 16), self.max_distance):
+                    if video_id in self._entries:  # the tree keeps hashes of removed videos
+                        closest[video_id] = min(distance, closest.get(video_id, distance))
+                for video_id, distance in closest.items():
+                    best_distances.setdefault(video_id, []).append(distance)
+
+            mean_distances = {
+                video_id: sum(distances) / len(distances) for video_id, distances in best_distances.items()
+            }
+            # Most matched frames first, then the smallest mean distance
+            video_id = max(mean_distances, key=lambda v: (len(best_distances[v]), -mean_distances[v]), default=None)
+            if video_id is None:
+                return None
+
+            match_ratio = len(best_distances[video_id]) / len(hashes)
+            if match_ratio < self.min_match_ratio:
+                return None
+            return {
+                'video_id': video_id,
+                'match_ratio': match_ratio,
+                'mean_distance': mean_distances[video_id],
+                'result': self._entries[video_id]['result']
+            }
+
+    def add(self, video_id: str, hashes: List[str], result: Dict[str, Any]):
+        """
+        Store the fingerprint and a result summary of an analyzed video
+
+        Args:
+            video_id: ID the results are stored under
+            hashes: Hex frame hashes in temporal order
+            result: Analysis result; only the verdict fields are kept
+        """
+        hashes = [h for h in hashes if is_informative(h)]
+        if not hashes:
+            return
+
+        summary = {key: result[key] for key in SUMMARY_FIELDS if key in result}
+        record = {'op': 'add', 'video_id': video_id, 'hashes': list(hashes), 'result': summary}
+        with self._lock, self._locked_file():
+            self._append(record)
+            self._reload()
+
+    def remove(self, video_ids: List[str]) -> int:
+        """
+        Drop videos from the index, e.g. when their results are deleted
+
+        Returns:
+            Number of indexed videos removed
+        """
+        with self._lock, self._locked_file():
+            self._reload()
+            present = [video_id for video_id in video_ids if video_id in self._entries]
+            if not present:
+                return 0
+            self._append({'op': 'remove', 'video_ids': present})
+            self._reload()
+            # Each log record is one add or remove; compact once most are dead
+            if self._records > 2 * max(len(self._entries), 500):
+                self._compact()
+            return len(present)
+
+
+# Shared index so the BK-tree is only extended with new records
+_fingerprint_index = None
+
+
+def get_fingerprint_index(path: str) -> FingerprintIndex:
+    """Get or create the process-wide FingerprintIndex"""
+    global _fingerprint_index
+    if _fingerprint_index is None or _fingerprint_index.path != path:
+        _fingerprint_index = FingerprintIndex(path)
+    return _fingerprint_index
@@ -0,0 +1,321 @@
+# models/registry.py
+# Versioned model checkpoints with background hot swaps and shadow scoring
+
+import os
+import json
+import time
+import random
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import torch
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """A loaded, warmed-up model and the checkpoint version it came from"""
+    
+    version: str
+    model: torch.nn.Module
+    path: Optional[str]
+    load_seconds: float
+    loaded_at: float
+
+
+def warmup(model: torch.nn.Module, device: torch.device, input_shape: Tuple[int, ...]):
+    """
+    Run one inference on a blank batch
+    
+    The first forward pass allocates buffers and picks kernels, so a model that
+    goes live without it makes the next request pay for its cold start.
+    """
+    with torch.no_grad():
+        model(torch.zeros(input_shape, device=device))
+
+
+class ModelRegistry:
+    """
+    Versioned VisionShield checkpoints with one active and one shadow model
+    
+    Versions are the default checkpoint plus every <version>.pth in the
+    registry folder. Activating a version loads and warms it up first and then
+    replaces the active model in one assignment; analyses already running
+    keep the model they started with. A shadow model scores a sampled
+    fraction of videos next to the active one, without affecting results.
+    
+    With a state file, the active and shadow choice is persisted there and
+    every registry sharing it (one per worker process) follows changes made
+    through any of them the next time get() is called.
+    """
+    
+    def __init__(
+        self,
+        loader: Callable[[str], torch.nn.Module],
+        device: torch.device,
+        default_version: str,
+        default_path: str,
+        registry_dir: Optional[str] = None,
+        warmup_shape: Optional[Tuple[int, ...]] = (1, 2, 3, 224, 224),
+        on_activate: Optional[Callable[[Optional[LoadedModel], LoadedModel], None]] = None,
+        state_path: Optional[str] = None
+    ):
+        """
+        Args:
+            loader: Callable building an eval-mode model on device from a checkpoint path
+            device: Device models run on
+            default_version: Version name of the default checkpoint
+            default_path: Path of the default checkpoint (MODEL_SAVE_PATH)
+            registry_dir: Folder of additional <version>.pth checkpoints
+            warmup_shape: Input shape of the warmup pass (None skips warmup)
+            on_activate: Called with (previous, new) whenever the active model changes
+            state_path: JSON file persisting the active and shadow version across processes
+        """
+        self.loader = loader
+        self.device = device
+        self.default_version = default_version
+        self.default_path = default_path
+        self.registry_dir = registry_dir
+        self.warmup_shape = warmup_shape
+        self.on_activate = on_activate
+        self.state_path = state_path
+        self.shadow_rate = 0.0
+        self.loading = None
+        self.last_error = None
+        self._active = None
+        self._shadow = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()  # load one checkpoint at a time
+        self._state_lock = threading.Lock()
+        self._state_mtime = None
+        
+    def versions(self) -> Dict[str, str]:
+        """Map of available version -> checkpoint path"""
+        versions = {}
+        if self.registry_dir and os.path.isdir(self.registry_dir):
+            for name in sorted(os.listdir(self.registry_dir)):
+                version, extension = os.path.splitext(name)
+                if extension == '.pth':
+                    versions[version] = os.path.join(self.registry_dir, name)
+        versions[self.default_version] = self.default_path
+        return versions
+        
+    def load(self, version: str) -> LoadedModel:
+        """Load and warm up a version without making it active"""
+        path = self.versions().get(version)
+        if path is None:
+            raise KeyError(f"Unknown model version: {version}")
+            
+        with self._load_lock:
+            self.loading = version
+            try:
+                start = time.perf_counter()
+                model = self.loader(path)
+                if self.warmup_shape is not None:
+                    warmup(model, self.device, self.warmup_shape)
+                load_seconds = time.perf_counter() - start
+            finally:
+                self.loading = None
+        print(f"Model version {version} loaded and warmed up in {load_seconds:.2f}s")
+        return LoadedModel(version, model, path, load_seconds, time.time())
+        
+    def _swap(self, loaded: LoadedModel):
+        """Replace the active model; callers hold self._lock"""
+        previous, self._active = self._active, loaded
+        if self.on_activate is not None:
+            self.on_activate(previous, loaded)
+        return previous
+        
+    def install(self, version: str, model: torch.nn.Module) -> LoadedModel:
+        """Make an already loaded model the active one"""
+        loaded = LoadedModel(version, model, None, 0.0, time.time())
+        with self._lock:
+            self._swap(loaded)
+        return loaded
+        
+    def _write_state(self):
+        """Persist the active and shadow version for the other worker processes"""
+        if not self.state_path:
+            return
+        active, shadow = self._active, self._shadow
+        state = {
+            'active': active.version if active else None,
+            'shadow': shadow.version if shadow else None,
+            'shadow_rate': self.shadow_rate if shadow else 0.0
+        }
+        with self._state_lock:
+            tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+            # Our own write needs no following
+            stat = os.stat(self.state_path)
+            self._state_mtime = (stat.st_mtime_ns, stat.st_ino)
+            
+    def _read_state(self) -> Optional[Dict]:
+        """The persisted state if it changed since it was last read, else None"""
+        if not self.state_path:
+            return None
+        with self._state_lock:
+            try:
+                stat = os.stat(self.state_path)
+            except OSError:
+                return None
+            # Every write replaces the file, so the inode changes even when
+            # two swaps land within the file system's mtime resolution
+            mtime = (stat.st_mtime_ns, stat.st_ino)
+            if mtime == self._state_mtime:
+                return None
+            self._state_mtime = mtime
+            try:
+                with open(self.state_path, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not read model registry state {self.state_path}: {e}")
+                return None
+                
+    def _follow_state(self, state: Dict):
+        """Start loading the versions another process made active or shadow"""
+        versions = self.versions()
+        active = state.get('active')
+        if active in versions and active != self.loading and (self._active is None or self._active.version != active):
+            self.activate(active, persist=False)
+            
+        shadow = state.get('shadow')
+        current_shadow = self._shadow.version if self._shadow else None
+        if shadow is None and current_shadow is not None:
+            self.set_shadow(None, 0.0, persist=False)
+        elif shadow in versions and shadow != current_shadow:
+            self.set_shadow(shadow, state.get('shadow_rate', 0.0), persist=False)
+        elif shadow is not None and shadow == current_shadow:
+            self.shadow_rate = state.get('shadow_rate', self.shadow_rate)
+            
+    def get(self) -> Optional[LoadedModel]:
+        """
+        The active model, loading the persisted or default version on first use
+        
+        A version activated by another worker process is loaded in the
+        background; the current model keeps serving until it is swapped in.
+        
+        Returns:
+            LoadedModel, or None if the checkpoint could not be loaded
+        """
+        state = self._read_state()
+        if self._active is None:
+            with self._lock:
+                if self._active is None:
+                    version = self.default_version
+                    if state and state.get('active') in self.versions():
+                        version = state['active']
+                    try:
+                        self._swap(self.load(version))
+                    except Exception as e:
+                        self.last_error = str(e)
+                        print(f"Error loading model version {version}: {e}")
+        if state is not None:
+            self._follow_state(state)
+        return self._active
+        
+    def _run(self, task, background):
+        """Run a load task now or on a daemon thread"""
+        if not background:
+            return task()
+        thread = threading.Thread(target=task, name='visionshield-model-load', daemon=True)
+        thread.start()
+        return thread
+        
+    def activate(self, version: str, background: bool = True, persist: bool = True):
+        """
+        Load a version and swap it in as the active model
+        
+        Args:
+            version: Version to activate
+            background: Load on a daemon thread and return it; otherwise
+                block and return the LoadedModel
+            persist: Record the choice in the state file once the swap is done
+                
+        Raises:
+            KeyError: If the version does not exist
+        """
+        if version not in self.versions():
+            raise KeyError(f"Unknown model version: {version}")
+            
+        def task():
+            try:
+                loaded = self.load(version)
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Error activating model version {version}: {e}")
+                if not background:
+                    raise
+                return None
+            with self._lock:
+                previous = self._swap(loaded)
+                if self._shadow is not None and self._shadow.version == version:
+                    self._shadow = None
+            self.last_error = None
+            print(f"Active model swapped from {previous.version if previous else None} to {version}")
+            if persist:
+                self._write_state()
+            return loaded
+            
+        return self._run(task, background)
+        
+    def set_shadow(self, version: Optional[str], rate: float, background: bool = True, persist: bool = True):
+        """
+        Score a fraction of videos with a candidate version as well
+        
+        Args:
+            version: Candidate version, or None to stop shadow scoring
+            rate: Fraction of analyses (0-1) the candidate also scores
+            background: Load the candidate on a daemon thread
+            persist: Record the choice in the state file once it is in effect
+        """
+        if version is None:
+            with self._lock:
+                self._shadow = None
+                self.shadow_rate = 0.0
+            if persist:
+                self._write_state()
+            return None
+        if version not in self.versions():
+            raise KeyError(f"Unknown model version: {version}")
+            
+        def task():
+            try:
+                loaded = self.load(version)
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Error loading shadow model version {version}: {e}")
+                if not background:
+                    raise
+                return None
+            with self._lock:
+                self._shadow = loaded
+                self.shadow_rate = min(max(rate, 0.0), 1.0)
+            print(f"Shadow scoring {self.shadow_rate:.0%} of analyses with model version {version}")
+            if persist:
+                self._write_state()
+            return loaded
+            
+        return self._run(task, background)
+        
+    def shadow_sample(self) -> Optional[LoadedModel]:
+        """The shadow model if this analysis is sampled for shadow scoring, else None"""
+        shadow = self._shadow
+        if shadow is None or random.random() >= self.shadow_rate:
+            return None
+        return shadow
+        
+    def status(self) -> Dict:
+        """Versions, active and shadow model, for the admin API"""
+        active, shadow = self._active, self._shadow
+        return {
+            'versions': sorted(self.versions()),
+            'active': active.version if active else None,
+            'active_loaded_at': int(active.loaded_at * 1000) if active else None,
+            'shadow': shadow.version if shadow else None,
+            'shadow_rate': self.shadow_rate if shadow else 0.0,
+            'loading': self.loading,
+            'last_error': self.last_error
+        }
@@ -0,0 +1,117 @@
+# models/sampling.py
+# Scene-change aware adaptive frame sampling for VisionShield
+
+from typing import Any, Callable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Size of the grayscale thumbnail used for frame signatures
+SIGNATURE_SIZE = 32
+HISTOGRAM_BINS = 32
+
+
+def frame_signature(frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute a cheap visual signature for a BGR frame
+
+    Returns:
+        Tuple of (normalized luminance histogram, downscaled grayscale thumbnail)
+    """
+    small = cv2.resize(frame, (SIGNATURE_SIZE, SIGNATURE_SIZE), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    hist = cv2.calcHist([gray], [0], None, [HISTOGRAM_BINS], [0, 256]).ravel()
+    hist /= max(hist.sum(), 1.0)
+    return hist, gray.astype(np.float32) / 255.0
+
+
+def signature_distance(a: Tuple[np.ndarray, np.ndarray], b: Tuple[np.ndarray, np.ndarray]) -> float:
+    """
+    Distance between two frame signatures in [0, 1]
+
+    Averages the histogram difference (global tone, catches cuts) with the
+    mean absolute thumbnail difference (layout and motion).
+    """
+    hist_distance = 0.5 * float(np.abs(a[0] - b[0]).sum())
+    pixel_distance = float(np.abs(a[1] - b[1]).mean())
+    return 0.5 * (hist_distance + pixel_distance)
+
+
+class AdaptiveFrameSampler:
+    """
+    Online selection of visually distinct frames under a fixed budget
+
+    Frames are offered in decode order. Near-duplicates of the last kept
+    frame are dropped immediately. The kept pool is bounded: when it grows
+    past pool_factor * budget, the most redundant frame (the one closest to
+    its temporal neighbours) is evicted, so long static stretches collapse
+    to a few frames while scene changes keep their own samples.
+    """
+
+    def __init__(self, budget: int, duplicate_threshold: float = 0.03, pool_factor: int = 3):
+        """
+        Args:
+            budget: Number of frames to select
+            duplicate_threshold: Signature distance below which a frame is a near-duplicate
+            pool_factor: Kept pool size as a multiple of the budget
+        """
+        self.budget = max(1, budget)
+        self.duplicate_threshold = duplicate_threshold
+        self.pool_size = max(self.budget, self.budget * pool_factor)
+        self.offered = 0
+        self.duplicates = 0
+        self._pool = []  # [index, signature, payload]
+
+    def offer(self, index: int, frame: np.ndarray, store: Callable[[int, np.ndarray], Any],
+              discard: Optional[Callable[[Any], None]] = None) -> bool:
+        """
+        Consider a decoded frame for selection
+
+        Args:
+            index: Source frame index
+            frame: BGR frame as produced by the decoder
+            store: Called as store(index, frame) for kept frames; its return value is the payload
+            discard: Called with the payload of frames evicted from the pool
+
+        Returns:
+            True if the frame was kept
+        """
+        self.offered += 1
+        signature = frame_signature(frame)
+        if self._pool and signature_distance(signature, self._pool[-1][1]) < self.duplicate_threshold:
+            self.duplicates += 1
+            return False
+
+        self._pool.append([index, signature, store(index, frame)])
+        while len(self._pool) > self.pool_size:
+            self._evict(discard)
+        return True
+
+    def _evict(self, discard: Optional[Callable[[Any], None]]):
+        """Remove the frame that adds the least visual information"""
+        if len(self._pool) < 2:
+            return
+
+        def redundancy(i):
+            distances = []
+            if i > 0:
+                distances.append(signature_distance(self._pool[i][1], self._pool[i - 1][1]))
+            if i < len(self._pool) - 1:
+                distances.append(signature_distance(self._pool[i][1], self._pool[i + 1][1]))
+            return min(distances)
+
+        victim = min(range(len(self._pool)), key=redundancy)
+        _, _, payload = self._pool.pop(victim)
+        if discard is not None:
+            discard(payload)
+
+    def select(self, discard: Optional[Callable[[Any], None]] = None) -> List[Tuple[int, Any]]:
+        """
+        Reduce the pool to the budget and return the selection
+
+        Returns:
+            List of (source frame index, payload) in temporal order
+        """
+        while len(self._pool) > self.budget:
+            self._evict(discard)
+        return [(index, payload) for index, _, payload in self._pool]
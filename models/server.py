@@ -0,0 +1,693 @@
+# models/server.py
+# Shared inference server: one process owns the models, web workers are thin clients
+#
+# Usage (from the repository root, normally started by the first worker when
+# INFERENCE_SERVER_AUTOSTART is on):
+#   python -m models.server --socket /tmp/visionshield-inference.sock
+#   python -m models.server --socket /tmp/visionshield-inference.sock --stop
+#
+# The server runs in its own session, so it survives the worker that started
+# it; it exits on --stop, or once no worker has been connected for the idle
+# timeout (INFERENCE_IDLE_TIMEOUT).
+#
+# Requests travel over a Unix domain socket as length-prefixed JSON headers.
+# Tensors do not: the client copies its input into a shared memory block it
+# owns and the server writes the (always smaller) output back into the same
+# block, so a 20 frame clip crosses the process boundary without pickling.
+
+import os
+import sys
+import json
+import time
+import queue
+import fcntl
+import errno
+import struct
+import signal
+import socket
+import atexit
+import argparse
+import threading
+import subprocess
+import socketserver
+from collections import OrderedDict
+from concurrent.futures import Future
+from multiprocessing import resource_tracker, shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from models.registry import warmup
+
+OPS = ('extract_features', 'classify_features', 'forward')
+HEADER = struct.Struct('!I')
+MIN_BUFFER_SIZE = 1024 * 1024
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class InferenceServerError(RuntimeError):
+    """Raised when the inference server is unreachable or rejects a request"""
+
+
+def _send_message(sock: socket.socket, message: Dict):
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or None if the peer closed the connection first"""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv_message(sock: socket.socket) -> Optional[Dict]:
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    data = _recv_exact(sock, HEADER.unpack(header)[0])
+    if data is None:
+        return None
+    return json.loads(data.decode('utf-8'))
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block owned by a client without taking over its cleanup"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block with this process'
+        # resource tracker, which would unlink it when the server exits
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class _Request:
+    """One inference call waiting in the batch queue"""
+    
+    def __init__(self, model: torch.nn.Module, op: str, array: np.ndarray):
+        self.model = model
+        self.op = op
+        self.array = array
+        self.key = (id(model), op, array.shape[1:], array.dtype.str)
+        self.future = Future()
+
+
+class InferenceServer:
+    """
+    Serve VisionShield inference to local worker processes
+    
+    Models are loaded on first request by checkpoint path, backbone and file
+    version (mtime and size, so a replaced checkpoint is reloaded) and kept
+    in a small LRU cache, so the active, shadow and screening models of
+    every worker share one copy. Calls for the same model, operation and
+    per-item shape that arrive within batch_wait of each other are
+    concatenated along the batch dimension and run as one forward pass;
+    VisionShield scores every frame and sequence independently in eval mode,
+    so batching does not change results.
+    """
+    
+    def __init__(
+        self,
+        loader: Callable[[str, str], torch.nn.Module],
+        socket_path: str,
+        device: torch.device,
+        allowed_dirs: List[str],
+        max_batch: int = 8,
+        batch_wait: float = 0.005,
+        max_models: int = 3,
+        warmup_shape: Optional[Tuple[int, ...]] = (1, 2, 3, 224, 224),
+        idle_timeout: float = 0
+    ):
+        """
+        Args:
+            loader: Callable building an eval-mode model on device from (path, backbone)
+            socket_path: Unix domain socket to listen on
+            device: Device the models run on
+            allowed_dirs: Folders checkpoints may be loaded from
+            max_batch: Most requests merged into one forward pass
+            batch_wait: Seconds to wait for more requests before running a batch
+            max_models: Loaded models kept before the least recently used is dropped
+            warmup_shape: Input shape of the warmup pass (None skips warmup)
+            idle_timeout: Seconds without connected clients before the server exits (0 never)
+        """
+        self.loader = loader
+        self.socket_path = socket_path
+        self.device = device
+        self.allowed_dirs = [os.path.realpath(d) for d in allowed_dirs]
+        self.max_batch = max_batch
+        self.batch_wait = batch_wait
+        self.max_models = max_models
+        self.warmup_shape = warmup_shape
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+        self.batches = 0
+        self._models = OrderedDict()
+        self._models_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._server = None
+        self._connections = 0
+        self._idle_since = time.monotonic()
+        self._connections_lock = threading.Lock()
+        
+    def get_model(self, path: str, backbone: str = 'resnet50') -> torch.nn.Module:
+        """Return a loaded model, loading and warming it up on first use"""
+        real_path = os.path.realpath(path)
+        if not any(real_path.startswith(d + os.sep) for d in self.allowed_dirs):
+            raise ValueError(f"Checkpoint {path} is outside the model folders")
+        stat = os.stat(real_path)
+        key = (real_path, backbone, stat.st_mtime_ns, stat.st_size)
+        
+        with self._models_lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+                
+        with self._load_lock:
+            with self._models_lock:
+                if key in self._models:
+                    return self._models[key]
+            start = time.perf_counter()
+            model = self.loader(path, backbone)
+            if self.warmup_shape is not None:
+                warmup(model, self.device, self.warmup_shape)
+            print(f"Inference server loaded {path} ({backbone}) in {time.perf_counter() - start:.2f}s")
+            
+            with self._models_lock:
+                # Earlier versions of a replaced checkpoint are never asked for again
+                for stale in [k for k in self._models if k[:2] == key[:2]]:
+                    del self._models[stale]
+                    print(f"Inference server dropped the replaced checkpoint {path} ({backbone})")
+                self._models[key] = model
+                while len(self._models) > self.max_models:
+                    (evicted, _, _, _), _ = self._models.popitem(last=False)
+                    print(f"Inference server dropped {evicted} (more than {self.max_models} models loaded)")
+        return model
+        
+    def submit(self, model: torch.nn.Module, op: str, array: np.ndarray) -> Future:
+        """Queue an inference call; the future resolves to the output array"""
+        request = _Request(model, op, array)
+        self._queue.put(request)
+        return request.future
+        
+    def _next_batch(self, held: List[_Request]) -> List[_Request]:
+        """Collect requests that can share a forward pass with the oldest one"""
+        first = held.pop(0) if held else self._queue.get()
+        batch = [first]
+        for request in list(held):
+            if len(batch) < self.max_batch and request.key == first.key:
+                held.remove(request)
+                batch.append(request)
+                
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if request.key == first.key:
+                batch.append(request)
+            else:
+                held.append(request)
+        return batch
+        
+    def _run_batch(self, batch: List[_Request]):
+        first = batch[0]
+        inputs = None
+        try:
+            if len(batch) == 1:
+                inputs = torch.from_numpy(first.array)
+            else:
+                inputs = torch.from_numpy(np.concatenate([r.array for r in batch]))
+            with torch.no_grad():
+                if first.op == 'forward':
+                    outputs = first.model(inputs.to(self.device))
+                else:
+                    outputs = getattr(first.model, first.op)(inputs.to(self.device))
+            outputs = outputs.cpu().numpy()
+            error = None
+        except Exception as e:
+            error = e
+            
+        # Inputs are views of client buffers; drop them before anyone is woken
+        offsets = np.cumsum([len(r.array) for r in batch])[:-1]
+        inputs = None
+        for request in batch:
+            request.array = None
+        if error is not None:
+            for request in batch:
+                request.future.set_exception(error)
+            return
+            
+        self.requests += len(batch)
+        self.batches += 1
+        for request, output in zip(batch, np.split(outputs, offsets)):
+            request.future.set_result(output)
+            
+    def _batch_loop(self):
+        held = []
+        while True:
+            self._run_batch(self._next_batch(held))
+            
+    def status(self) -> Dict:
+        with self._models_lock:
+            models = [{'path': path, 'backbone': backbone} for path, backbone, _, _ in self._models]
+        return {
+            'pid': os.getpid(),
+            'device': str(self.device),
+            'models': models,
+            'requests': self.requests,
+            'batches': self.batches
+        }
+        
+    def _watch_idle(self):
+        """Shut the server down once no client has been connected for idle_timeout"""
+        while True:
+            time.sleep(min(self.idle_timeout / 4, 5))
+            with self._connections_lock:
+                idle = self._connections == 0 and time.monotonic() - self._idle_since >= self.idle_timeout
+            if idle:
+                print(f"Inference server idle for {self.idle_timeout:.0f}s, shutting down")
+                self.shutdown()
+                return
+                
+    def handle(self, message: Dict, shm: Optional[shared_memory.SharedMemory]) -> Dict:
+        """Answer one client message; inference reads and writes shm"""
+        op = message.get('op')
+        if op == 'status':
+            return {'status': 'ok', **self.status()}
+            
+        spec = message.get('model') or {}
+        model = self.get_model(spec['path'], spec.get('backbone', 'resnet50'))
+        if op == 'load':
+            return {'status': 'ok'}
+        if op not in OPS:
+            raise ValueError(f"Unknown operation {op}")
+            
+        array = np.ndarray(message['shape'], dtype=message['dtype'], buffer=shm.buf)
+        try:
+            output = self.submit(model, op, array).result()
+        finally:
+            del array
+        if output.nbytes > shm.size:
+            raise ValueError(f"Output of {output.nbytes} bytes does not fit the {shm.size} byte buffer")
+        np.ndarray(output.shape, dtype=output.dtype, buffer=shm.buf)[...] = output
+        return {'status': 'ok', 'shape': list(output.shape), 'dtype': output.dtype.str}
+        
+    def serve_forever(self):
+        """Listen on socket_path until shutdown() is called"""
+        inference = self
+        
+        class Handler(socketserver.BaseRequestHandler):
+            def setup(self):
+                with inference._connections_lock:
+                    inference._connections += 1
+                    
+            def finish(self):
+                with inference._connections_lock:
+                    inference._connections -= 1
+                    inference._idle_since = time.monotonic()
+                    
+            def handle(self):
+                shm = None
+                try:
+                    while True:
+                        message = _recv_message(self.request)
+                        if message is None:
+                            return
+                        try:
+                            # Clients reuse one block and only replace it to grow it
+                            if message.get('shm') and (shm is None or shm.name != message['shm'].lstrip('/')):
+                                if shm is not None:
+                                    shm.close()
+                                shm = _attach_shared_memory(message['shm'])
+                            reply = inference.handle(message, shm)
+                        except Exception as e:
+                            reply = {'status': 'error', 'message': str(e)}
+                        _send_message(self.request, reply)
+                except OSError:
+                    return
+                finally:
+                    if shm is not None:
+                        shm.close()
+                        
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise InferenceServerError(f"An inference server is already listening on {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(self.socket_path)  # left behind by a server that died
+            finally:
+                probe.close()
+                
+        threading.Thread(target=self._batch_loop, name='visionshield-batcher', daemon=True).start()
+        # Create the socket owner-only from the start rather than chmod it after bind
+        old_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        self._server.daemon_threads = True
+        if self.idle_timeout > 0:
+            threading.Thread(target=self._watch_idle, name='visionshield-idle', daemon=True).start()
+        # Lets stop_server_process find this process
+        with open(pid_path(self.socket_path), 'w') as f:
+            f.write(str(os.getpid()))
+        print(f"Inference server listening on {self.socket_path} (device {self.device}, "
+              f"batches of up to {self.max_batch})")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            for path in (self.socket_path, pid_path(self.socket_path)):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def pid_path(socket_path: str) -> str:
+    """Path of the file holding the process ID of the server on socket_path"""
+    return f"{socket_path}.pid"
+
+
+def stop_server_process(socket_path: str, timeout: float = 10) -> bool:
+    """
+    Stop the inference server listening on socket_path
+    
+    Returns:
+        True if a running server was sent SIGTERM
+    """
+    try:
+        with open(pid_path(socket_path), 'r') as f:
+            pid = int(f.read().strip())
+        os.kill(pid, signal.SIGTERM)
+    except (OSError, ValueError):
+        return False
+        
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            # The starting process has to reap its own child
+            if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                break
+        except ChildProcessError:
+            pass
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            break
+        time.sleep(0.1)
+    else:
+        print(f"Inference server {pid} did not stop within {timeout}s")
+    return True
+
+
+def start_server_process(socket_path: str, timeout: float = 120) -> bool:
+    """
+    Start a detached inference server unless one is already listening
+    
+    Workers that find no server race for a lock file, so only one of them
+    spawns it; the others wait until the socket accepts connections. The
+    server runs in its own session and is not tied to the starting worker,
+    so recycling that worker leaves the loaded models in place for the rest.
+    
+    Returns:
+        True if this call started the server
+    """
+    def reachable():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+            
+    with open(f"{socket_path}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            if reachable():
+                return False
+            print(f"Starting inference server on {socket_path}...")
+            process = subprocess.Popen(
+                [sys.executable, '-m', 'models.server', '--socket', socket_path],
+                cwd=REPO_ROOT, stdin=subprocess.DEVNULL, start_new_session=True
+            )
+            deadline = time.monotonic() + timeout
+            while not reachable():
+                if process.poll() is not None:
+                    raise InferenceServerError(f"Inference server exited with status {process.returncode}")
+                if time.monotonic() > deadline:
+                    raise InferenceServerError(f"Inference server did not start within {timeout}s")
+                time.sleep(0.2)
+            return True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class InferenceClient:
+    """
+    Connection to an inference server, one socket and buffer per thread
+    
+    Each thread keeps a persistent connection and a shared memory block that
+    only grows, so steady-state calls cost one memcpy each way plus a small
+    JSON round trip.
+    """
+    
+    def __init__(self, socket_path: str, timeout: float = 300, autostart: bool = False):
+        """
+        Args:
+            socket_path: Unix domain socket of the server
+            timeout: Seconds to wait for one reply
+            autostart: Start a server process if none is listening
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.autostart = autostart
+        self._local = threading.local()
+        self._buffers = []
+        self._buffers_lock = threading.Lock()
+        atexit.register(self.close)
+        
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            try:
+                sock.connect(self.socket_path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if not self.autostart:
+                    raise
+                start_server_process(self.socket_path)
+                sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise InferenceServerError(f"Inference server not reachable at {self.socket_path}: {e}") from e
+        return sock
+        
+    def _buffer(self, size: int) -> shared_memory.SharedMemory:
+        """This thread's shared memory block, replaced by a larger one if needed"""
+        shm = getattr(self._local, 'shm', None)
+        if shm is not None and shm.size >= size:
+            return shm
+        new_shm = shared_memory.SharedMemory(create=True, size=max(size, MIN_BUFFER_SIZE, 2 * (shm.size if shm else 0)))
+        with self._buffers_lock:
+            self._buffers.append(new_shm)
+            if shm is not None:
+                self._buffers.remove(shm)
+                shm.close()
+                shm.unlink()
+        self._local.shm = new_shm
+        return new_shm
+        
+    def request(self, message: Dict, array: Optional[np.ndarray] = None) -> Tuple[Dict, Optional[np.ndarray]]:
+        """
+        Send one message, with array passed through shared memory
+        
+        Returns:
+            Tuple of (reply, output array or None)
+            
+        Raises:
+            InferenceServerError: If the server is unreachable or the call failed
+        """
+        if array is not None:
+            shm = self._buffer(array.nbytes)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+            message = {**message, 'shm': shm.name, 'shape': list(array.shape), 'dtype': array.dtype.str}
+            
+        for attempt in range(2):
+            sock = getattr(self._local, 'sock', None) or self._connect()
+            self._local.sock = sock
+            try:
+                _send_message(sock, message)
+                reply = _recv_message(sock)
+                if reply is not None:
+                    break
+                error = ConnectionResetError(errno.ECONNRESET, 'Inference server closed the connection')
+            except ConnectionError as e:
+                error = e
+            except OSError as e:
+                # A timeout may mean the server is still running the request, so
+                # it is not sent again; the connection is out of step either way
+                sock.close()
+                self._local.sock = None
+                raise InferenceServerError(f"Inference request failed: {e}") from e
+            # The server may have restarted; reconnect once
+            sock.close()
+            self._local.sock = None
+        else:
+            raise InferenceServerError(f"Inference request failed: {error}") from error
+            
+        if reply.get('status') != 'ok':
+            raise InferenceServerError(reply.get('message', 'Inference request failed'))
+        if 'shape' not in reply or array is None:
+            return reply, None
+        output = np.ndarray(reply['shape'], dtype=reply['dtype'], buffer=self._local.shm.buf).copy()
+        return reply, output
+        
+    def status(self) -> Dict:
+        return self.request({'op': 'status'})[0]
+        
+    def close(self):
+        """Release the shared memory blocks of every thread"""
+        with self._buffers_lock:
+            for shm in self._buffers:
+                shm.close()
+                shm.unlink()
+            self._buffers = []
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(socket_path: str, timeout: float = 300, autostart: bool = False) -> InferenceClient:
+    """The process-wide client of a server socket"""
+    with _clients_lock:
+        if socket_path not in _clients:
+            _clients[socket_path] = InferenceClient(socket_path, timeout=timeout, autostart=autostart)
+        return _clients[socket_path]
+
+
+class RemoteModel:
+    """
+    Client-side stand-in for a VisionShield model held by the inference server
+    
+    Implements the parts of the model interface the analysis pipeline uses
+    (extract_features, classify_features and forward), so analyze_video,
+    the model registry and cascade screening work unchanged.
+    """
+    
+    def __init__(self, client: InferenceClient, path: str, backbone: str = 'resnet50'):
+        """
+        Args:
+            client: Connection to the server
+            path: Checkpoint the server loads (it must be under MODEL_CACHE_DIR)
+            backbone: Backbone of the checkpoint
+            
+        Raises:
+            InferenceServerError: If the server cannot load the checkpoint
+        """
+        self.client = client
+        self.spec = {'path': path, 'backbone': backbone}
+        client.request({'op': 'load', 'model': self.spec})
+        
+    def _run(self, op: str, tensor: torch.Tensor) -> torch.Tensor:
+        array = tensor.detach().to('cpu', torch.float32).contiguous().numpy()
+        _, output = self.client.request({'op': op, 'model': self.spec}, array)
+        return torch.from_numpy(output)
+        
+    def extract_features(self, frames: torch.Tensor) -> torch.Tensor:
+        return self._run('extract_features', frames)
+        
+    def classify_features(self, fused_features: torch.Tensor) -> torch.Tensor:
+        return self._run('classify_features', fused_features)
+        
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self._run('forward', x)
+        
+    __call__ = forward
+    
+    def eval(self):
+        return self
+        
+    def __repr__(self):
+        return f"RemoteModel({self.spec['path']!r}, backbone={self.spec['backbone']!r})"
+
+
+def build_server(config, socket_path: Optional[str] = None) -> InferenceServer:
+    """Create an inference server for a VisionShield config"""
+    from models.artifacts import ensure_model_weights, ensure_screening_weights
+    from models.utils import load_model
+    
+    device = torch.device('cuda:0' if torch.cuda.is_available() else 'cpu')
+    
+    def loader(path, backbone):
+        if path == config.MODEL_SAVE_PATH:
+            ensure_model_weights(config)
+        elif path == config.SCREENING_MODEL_PATH:
+            ensure_screening_weights(config)
+        return load_model(path, device, {
+            'HIDDEN_SIZE': config.HIDDEN_SIZE,
+            'NUM_LSTM_LAYERS': config.NUM_LSTM_LAYERS,
+            'DROPOUT': config.DROPOUT,
+            'BACKBONE': backbone
+        })
+        
+    return InferenceServer(
+        loader,
+        socket_path or config.INFERENCE_SOCKET,
+        device,
+        allowed_dirs=[config.MODEL_CACHE_DIR],
+        max_batch=config.INFERENCE_MAX_BATCH,
+        batch_wait=config.INFERENCE_BATCH_WAIT_MS / 1000,
+        max_models=config.INFERENCE_MAX_MODELS,
+        idle_timeout=config.INFERENCE_IDLE_TIMEOUT
+    )
+
+
+def main(argv=None):
+    from config_production import Config
+    
+    parser = argparse.ArgumentParser(description='Serve VisionShield inference to local workers')
+    parser.add_argument('--socket', help='Unix domain socket path (default: INFERENCE_SOCKET)')
+    parser.add_argument('--stop', action='store_true', help='Stop the server listening on the socket')
+    args = parser.parse_args(argv)
+    
+    config = Config()
+    if args.stop:
+        stopped = stop_server_process(args.socket or config.INFERENCE_SOCKET)
+        print('Inference server stopped' if stopped else 'No inference server running')
+        return
+        
+    server = build_server(config, args.socket)
+    # Load the default model before accepting connections, so workers never wait on it
+    try:
+        server.get_model(config.MODEL_SAVE_PATH)
+    except Exception as e:
+        print(f"Default model not preloaded: {e}")
+        
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
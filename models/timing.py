@@ -0,0 +1,23 @@
+# models/timing.py
+# Per-stage wall time accounting, kept free of heavy imports
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+@contextmanager
+def stage_timer(timings: Optional[Dict[str, float]], stage: str):
+    """
+    Add the wall time of a block to timings[stage]
+    
+    Args:
+        timings: Dict collecting seconds per stage, or None to skip timing
+        stage: Stage name, e.g. 'decode' or 'cnn_forward'
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
@@ -4,15 +4,37 @@
 
 import os
 import uuid
+import time
 import cv2
 import torch
 import numpy as np
 from PIL import Image
 import torchvision.transforms as transforms
-from typing import List, Dict, Any, Tuple, Optional
+from typing import Callable, List, Dict, Any, Tuple, Optional
 import hashlib
 
-def extract_frames(video_path: str, output_folder: str = None, frame_skip: int = 30, max_frames: int = None) -> List[str]:
+from models.faces import get_face_cropper
+from models.sampling import AdaptiveFrameSampler
+from models.fingerprint import FingerprintIndex, dhash
+from models.decode import VideoInfo, iter_frames, probe_video
+from models.timing import stage_timer
+
+def extract_frames(
+    video_path: str, 
+    output_folder: str = None, 
+    frame_skip: int = 30, 
+    max_frames: int = None,
+    sampling: str = 'uniform',
+    candidate_step: int = 5,
+    duplicate_threshold: float = 0.03,
+    return_indices: bool = False,
+    fingerprints: Optional[List[str]] = None,
+    max_dimension: Optional[int] = None,
+    decode_backend: str = 'auto',
+    decode_threads: int = 0,
+    video_info: Optional[VideoInfo] = None,
+    on_frame: Optional[Callable[[int, Optional[int]], None]] = None
+):
     """
     Extract frames from a video file and save to output folder if provided
     
@@ -21,39 +43,108 @@ def extract_frames(video_path: str, output_folder: str = None, frame_skip: int =
         output_folder: Folder to save extracted frames (if None, frames are not saved)
         frame_skip: Number of frames to skip between extractions
         max_frames: Maximum number of frames to extract
+        sampling: 'uniform' takes every frame_skip-th frame; 'adaptive' scans the
+            whole video, drops near-duplicates and keeps up to max_frames
+            visually distinct frames
+        candidate_step: Adaptive mode only - stride between frames considered
+        duplicate_threshold: Adaptive mode only - signature distance treated as duplicate
+        return_indices: Also return the source frame index of each extracted frame
+        fingerprints: If a list is given, the hex perceptual hash of every
+            extracted frame is appended to it, in the same order as the paths
+        max_dimension: Longest side of decoded frames; larger videos are
+            downscaled by the decoder (None keeps the source resolution)
+        decode_backend: 'auto', 'ffmpeg', 'pyav' or 'opencv' (see models.decode)
+        decode_threads: Decoder threads for ffmpeg/PyAV (0 lets the decoder choose)
+        video_info: Probe result for the video (see models.decode.probe_video)
+        on_frame: Called with (frames decoded so far, expected total or None)
+            after each decoded frame; in adaptive mode every candidate counts
         
     Returns:
-        List of paths to extracted frames (if output_folder provided) or empty list
+        List of paths to extracted frames (if output_folder provided) or empty list,
+        or a tuple (paths, source_indices) if return_indices is set
     """
     if output_folder:
         os.makedirs(output_folder, exist_ok=True)
         
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        raise ValueError(f"Could not open video file {video_path}")
+    step = candidate_step if sampling == 'adaptive' else frame_skip
+    frames = iter_frames(video_path, step=step, max_dimension=max_dimension,
+                         backend=decode_backend, threads=decode_threads, info=video_info)
     
-    frame_paths = []
-    idx = 0
-    saved = 0
+    expected = None
+    if video_info is not None and video_info.frame_count > 0:
+        expected = -(-video_info.frame_count // step)
+        if sampling != 'adaptive' and max_frames:
+            expected = min(expected, max_frames)
     
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-            
-        if idx % frame_skip == 0:
+    try:
+        if sampling == 'adaptive':
+            frame_paths, source_indices = _extract_frames_adaptive(
+                frames, output_folder, max_frames or 20, duplicate_threshold, fingerprints,
+                on_frame=on_frame, expected=expected
+            )
+            return (frame_paths, source_indices) if return_indices else frame_paths
+        
+        frame_paths = []
+        source_indices = []
+        saved = 0
+        
+        for idx, frame in frames:
             if output_folder:
                 frame_path = os.path.join(output_folder, f"frame_{saved:05d}.jpg")
                 cv2.imwrite(frame_path, frame)
                 frame_paths.append(frame_path)
+            if fingerprints is not None:
+                fingerprints.append(f"{dhash(frame):016x}")
+            source_indices.append(idx)
             saved += 1
+            if on_frame is not None:
+                on_frame(saved, expected)
             
             if max_frames and saved >= max_frames:
                 break
-        idx += 1
+    finally:
+        # Stops the decoder (e.g. the ffmpeg process) when we finish early
+        frames.close()
     
-    cap.release()
-    return frame_paths
+    return (frame_paths, source_indices) if return_indices else frame_paths
+
+
+def _extract_frames_adaptive(frames, output_folder, budget, duplicate_threshold, fingerprints=None,
+                             on_frame=None, expected=None):
+    """
+    Scan a whole video and keep up to budget visually distinct frames
+    
+    Args:
+        frames: Iterator of (source index, frame) candidates from iter_frames
+    """
+    sampler = AdaptiveFrameSampler(budget, duplicate_threshold=duplicate_threshold)
+    
+    def store(index, frame):
+        frame_hash = f"{dhash(frame):016x}" if fingerprints is not None else None
+        if not output_folder:
+            return None, frame_hash
+        frame_path = os.path.join(output_folder, f"frame_{index:07d}.jpg")
+        cv2.imwrite(frame_path, frame)
+        return frame_path, frame_hash
+    
+    def discard(payload):
+        frame_path, _ = payload
+        if frame_path and os.path.exists(frame_path):
+            os.remove(frame_path)
+    
+    for idx, frame in frames:
+        sampler.offer(idx, frame, store, discard)
+        if on_frame is not None:
+            on_frame(sampler.offered, expected)
+    
+    selected = sampler.select(discard)
+    print(f"Adaptive sampling kept {len(selected)} of {sampler.offered} candidates "
+          f"({sampler.duplicates} near-duplicates dropped)")
+    frame_paths = [path for _, (path, _) in selected if path]
+    source_indices = [index for index, _ in selected]
+    if fingerprints is not None:
+        fingerprints.extend(frame_hash for _, (_, frame_hash) in selected)
+    return frame_paths, source_indices
 
 
 def load_model(model_path: str, device: torch.device, config: dict) -> torch.nn.Module:
@@ -63,19 +154,22 @@ def load_model(model_path: str, device: torch.device, config: dict) -> torch.nn.
     Args:
         model_path: Path to the model checkpoint
         device: Device to load the model on (CPU or CUDA)
-        config: Model configuration parameters
+        config: Model configuration parameters (HIDDEN_SIZE, NUM_LSTM_LAYERS,
+            DROPOUT and BACKBONE, 'resnet50' or 'mobilenet_v3_small')
         
     Returns:
         Loaded model
     """
     from models.visionshield import VisionShield
     
-    # Initialize model
+    # Initialize model; ImageNet backbone weights are skipped since the checkpoint replaces them
     model = VisionShield(
         feature_size=512,
         hidden_size=config.get('HIDDEN_SIZE', 256),
         num_layers=config.get('NUM_LSTM_LAYERS', 2),
-        dropout=config.get('DROPOUT', 0.5)
+        dropout=config.get('DROPOUT', 0.5),
+        backbone=config.get('BACKBONE', 'resnet50'),
+        pretrained_backbone=False
     )
     
     # Load trained weights
@@ -110,13 +204,95 @@ def get_video_hash(video_path: str) -> str:
     return sha256_hash.hexdigest()
 
 
+def progressive_inference(
+    model: torch.nn.Module,
+    load_frame,
+    num_frames: int,
+    device: torch.device,
+    initial_frames: int = 5,
+    uncertainty_band: Tuple[float, float] = (0.2, 0.8),
+    max_frames: Optional[int] = None,
+    timings: Optional[Dict[str, float]] = None,
+    on_pass: Optional[Callable[[float, int], None]] = None
+) -> Tuple[torch.Tensor, List[int]]:
+    """
+    Score a video on a growing, evenly spaced subset of its sampled frames
+    
+    Starts with initial_frames frames and doubles the subset only while the
+    fake probability stays inside the uncertainty band. CNN features are
+    computed once per frame and reused across rounds, so only the cheap
+    LSTM head is re-run on the larger sequence.
+    
+    Args:
+        model: Loaded VisionShield model
+        load_frame: Callable returning the preprocessed [c, h, w] tensor for a frame index
+        num_frames: Number of candidate frames
+        device: Device to run inference on
+        initial_frames: Number of frames scored in the first round
+        uncertainty_band: (low, high) fake probabilities between which more frames are added
+        max_frames: Frame budget (defaults to num_frames)
+        timings: Optional dict that collects seconds per stage (see stage_timer)
+        on_pass: Called with (fake probability, frames used) after each round
+        
+    Returns:
+        Tuple of (class probabilities of shape [1, num_classes], frame indices used)
+    """
+    budget = min(max_frames or num_frames, num_frames)
+    count = max(1, min(initial_frames, budget))
+    low, high = uncertainty_band
+    features = {}
+    
+    while True:
+        indices = sorted(set(np.linspace(0, num_frames - 1, count, dtype=int).tolist()))
+        pending = [i for i in indices if i not in features]
+        
+        with torch.no_grad():
+            if pending:
+                with stage_timer(timings, 'preprocess'):
+                    batch = torch.stack([load_frame(i) for i in pending]).to(device)
+                with stage_timer(timings, 'cnn_forward'):
+                    for i, feature in zip(pending, model.extract_features(batch)):
+                        features[i] = feature
+            
+            with stage_timer(timings, 'lstm_head'):
+                sequence = torch.stack([features[i] for i in indices]).unsqueeze(0)
+                probs = torch.softmax(model.classify_features(sequence), dim=1)
+        
+        fake_prob = probs[0][1].item()
+        print(f"Progressive pass with {len(indices)} frames: Fake={fake_prob:.4f}")
+        if on_pass is not None:
+            on_pass(fake_prob, len(indices))
+        
+        if not (low < fake_prob < high) or count >= budget:
+            return probs, indices
+        count = min(count * 2, budget)
+
+
 def analyze_video(
     model: torch.nn.Module, 
     video_path: str, 
     device: torch.device, 
     transform=None, 
     frame_skip: int = 30, 
-    seq_length: int = 20
+    seq_length: int = 20,
+    video_hash: Optional[str] = None,
+    progressive: bool = False,
+    progressive_initial_frames: int = 5,
+    uncertainty_band: Tuple[float, float] = (0.2, 0.8),
+    face_crop: bool = False,
+    face_margin: float = 0.25,
+    sampling: str = 'uniform',
+    fingerprint_index: Optional[FingerprintIndex] = None,
+    near_duplicate_mode: str = 'flag',
+    decode_backend: str = 'auto',
+    decode_max_dimension: Optional[int] = None,
+    decode_threads: int = 0,
+    video_info: Optional[VideoInfo] = None,
+    timings: Optional[Dict[str, float]] = None,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    model_version: Optional[str] = None,
+    screening_model: Optional[torch.nn.Module] = None,
+    cascade_band: Tuple[float, float] = (0.1, 0.9)
 ) -> Dict[str, Any]:
     """
     Analyze a video for deepfake detection - FIXED VERSION that ensures unique results per video
@@ -128,12 +304,47 @@ def analyze_video(
         transform: Preprocessing transformations
         frame_skip: Number of frames to skip between extractions
         seq_length: Number of frames to use in sequence
+        video_hash: SHA256 of the file if already computed (e.g. during upload)
+        progressive: Score a small frame subset first and only add frames
+            while the verdict is uncertain (see progressive_inference)
+        progressive_initial_frames: Frames scored in the first progressive round
+        uncertainty_band: Fake probability range in which more frames are added
+        face_crop: Crop tracked face regions before frames reach the CNN
+        face_margin: Fraction of the face size kept around each face crop
+        sampling: Frame sampling strategy, 'uniform' or 'adaptive' (see extract_frames)
+        fingerprint_index: Index of previously analyzed videos to check for
+            re-encoded or trimmed copies of this one
+        near_duplicate_mode: 'flag' only records a match in the result,
+            'reuse' returns the matched video's verdict without running the model
+        decode_backend: Frame decoder, 'auto', 'ffmpeg', 'pyav' or 'opencv'
+        decode_max_dimension: Longest side frames are decoded at (None for source size)
+        decode_threads: Decoder threads for ffmpeg/PyAV (0 lets the decoder choose)
+        video_info: Probe result for the video; probed here if not given
+        timings: Optional dict that collects seconds per stage (see stage_timer)
+        progress: Optional callback receiving (event, data) as the analysis
+            advances: 'metadata', 'stage', 'frames', 'near_duplicate' and
+            'score' (preliminary while progressive rounds run, then final)
+        model_version: Version of the model, stamped on the result; near-duplicate
+            verdicts are only reused when they came from the same version
+        screening_model: Cheap model (e.g. the MobileNetV3 backbone) that scores
+            every video first; only videos it is unsure about are scored by model
+        cascade_band: Screening fake probability range in which a video is
+            escalated to the full model
         
     Returns:
         Dictionary with analysis results
     """
+    # Read container metadata once and reject undecodable files before hashing
+    if video_info is None:
+        with stage_timer(timings, 'probe'):
+            video_info = probe_video(video_path)
+    report = _ProgressReporter(progress)
+    report('metadata', {**video_metadata(video_info), 'frame_count': video_info.frame_count})
+    
     # Generate unique video identifier based on file content
-    video_hash = get_video_hash(video_path)
+    if video_hash is None:
+        with stage_timer(timings, 'hash'):
+            video_hash = get_video_hash(video_path)
     print(f"Analyzing video with hash: {video_hash}")
     
     # Create temp directory for frames with unique ID
@@ -144,109 +355,178 @@ def analyze_video(
     try:
         # Extract frames
         print(f"Extracting frames from {video_path}...")
-        frame_paths = extract_frames(video_path, temp_dir, frame_skip, max_frames=seq_length)
+        report('stage', {'stage': 'decode'})
+        fingerprint = []
+        with stage_timer(timings, 'decode'):
+            frame_paths, source_indices = extract_frames(video_path, temp_dir, frame_skip, max_frames=seq_length,
+                                                         sampling=sampling, return_indices=True,
+                                                         fingerprints=fingerprint,
+                                                         max_dimension=decode_max_dimension,
+                                                         decode_backend=decode_backend,
+                                                         decode_threads=decode_threads,
+                                                         video_info=video_info,
+                                                         on_frame=report.frames)
         num_frames = len(frame_paths)
         print(f"Extracted {num_frames} frames")
+        if sampling != 'adaptive':
+            # The last decoded frame may have been throttled
+            report.frames(num_frames, num_frames)
         
         if num_frames == 0:
             raise ValueError(f"No frames could be extracted from the video {video_path}")
         
+        # Look for a perceptually matching video that was analyzed before
+        with stage_timer(timings, 'fingerprint_lookup'):
+            near_duplicate = fingerprint_index.lookup(fingerprint) if fingerprint_index is not None else None
+        if near_duplicate is not None:
+            print(f"Near-duplicate of {near_duplicate['video_id']} "
+                  f"({near_duplicate['match_ratio']:.0%} of frames matched)")
+            near_duplicate_of = {
+                "video_id": near_duplicate['video_id'],
+                "match_ratio": near_duplicate['match_ratio'],
+                "mean_distance": near_duplicate['mean_distance']
+            }
+            report('near_duplicate', near_duplicate_of)
+            if near_duplicate_mode == 'reuse' and near_duplicate['result'].get('model_version') == model_version:
+                result = dict(near_duplicate['result'])
+                result.update(video_metadata(video_info))
+                result.update({
+                    "frames_analyzed": num_frames,
+                    "frames_used": 0,
+                    "inference_mode": "reused",
+                    "face_crop": False,
+                    "sampling": sampling,
+                    "video_id": video_id,
+                    "video_hash": video_hash,
+                    "fingerprint": fingerprint,
+                    "near_duplicate_of": near_duplicate_of,
+                    "model_version": model_version
+                })
+                print(f"Reused analysis: {result['prediction']} with {result['confidence']:.2%} confidence")
+                report('score', {'fake_probability': result['probabilities']['fake'],
+                                 'prediction': result['prediction'], 'frames_used': 0, 'final': True})
+                return result
+        else:
+            near_duplicate_of = None
+        
         # Create default transform if not provided
         if transform is None:
-            transform = transforms.Compose([
-                transforms.Resize((224, 224)),
-                transforms.ToTensor(),
-                transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
-            ])
+            transform = default_transform()
         
         # Adjust sequence length
-        if len(frame_paths) < seq_length:
-            frame_paths = frame_paths + [frame_paths[-1]] * (seq_length - len(frame_paths))
-        elif len(frame_paths) > seq_length:
-            indices = np.linspace(0, len(frame_paths) - 1, seq_length, dtype=int)
-            frame_paths = [frame_paths[i] for i in indices]
-        
-        # Process frames
-        frames = []
-        frame_data = []
-        
-        for i, frame_path in enumerate(frame_paths):
-            # Store frame data for visualization
-            frame_data.append({
-                "path": frame_path,
-                "index": i
-            })
-            
-            # Process frame for model input
-            img = Image.open(frame_path).convert('RGB')
-            if transform:
-                img = transform(img)
-            frames.append(img)
-        
-        # Stack frames into tensor with batch dimension
-        frames_tensor = torch.stack(frames).unsqueeze(0).to(device)
-        print(f"Frame tensor shape: {frames_tensor.shape}")
-        
-        # Run inference - THIS IS THE REAL MODEL INFERENCE
-        print("Running model inference...")
-        with torch.no_grad():
-            outputs = model(frames_tensor)
-            probs = torch.softmax(outputs, dim=1)
+        frame_paths, source_indices = fit_sequence(frame_paths, source_indices, seq_length)
+        
+        # Track face regions across the sampled frames
+        face_boxes = None
+        if face_crop:
+            path_by_index = dict(zip(source_indices, frame_paths))
+            with stage_timer(timings, 'face_detect'):
+                face_boxes = get_face_cropper(face_margin).track(
+                    video_hash, source_indices, lambda idx: cv2.imread(path_by_index[idx])
+                )
+            print(f"Face regions found in {sum(1 for b in face_boxes.values() if b)}/{len(face_boxes)} frames")
+        
+        report('stage', {'stage': 'inference'})
+        
+        def open_frame(i):
+            # Load a sampled frame as RGB, cropped to the tracked face if enabled
+            img = Image.open(frame_paths[i]).convert('RGB')
+            if face_boxes and face_boxes.get(source_indices[i]):
+                img = img.crop(face_boxes[source_indices[i]])
+            return img
+        
+        # Preprocess lazily so frames that are never scored cost nothing
+        frame_cache = {}
+        
+        def load_frame(i):
+            if frame_paths[i] not in frame_cache:
+                img = open_frame(i)
+                frame_cache[frame_paths[i]] = transform(img) if transform else img
+            return frame_cache[frame_paths[i]]
+        
+        # Cascade: a cheap screening model settles confident cases on its own
+        cascade = None
+        if screening_model is not None:
+            with stage_timer(timings, 'preprocess'):
+                screening_input = torch.stack([load_frame(i) for i in range(len(frame_paths))]).unsqueeze(0).to(device)
+            with torch.no_grad(), stage_timer(timings, 'screening'):
+                screening_probs = torch.softmax(screening_model(screening_input), dim=1)
+            screening_fake = screening_probs[0][1].item()
+            cascade = {
+                'screening_fake_probability': screening_fake,
+                'escalated': cascade_band[0] < screening_fake < cascade_band[1]
+            }
+            print(f"Screening model: Fake={screening_fake:.4f}, "
+                  f"{'escalating to full model' if cascade['escalated'] else 'verdict settled'}")
+            report('score', {'fake_probability': screening_fake, 'frames_used': len(frame_paths),
+                             'final': False, 'screening': True})
+        
+        if cascade is not None and not cascade['escalated']:
+            probs = screening_probs
+            _, predicted = torch.max(probs, 1)
+            frame_indices = list(range(len(frame_paths)))
+        elif progressive:
+            print("Running progressive model inference...")
+            probs, frame_indices = progressive_inference(
+                model, load_frame, len(frame_paths), device,
+                initial_frames=progressive_initial_frames,
+                uncertainty_band=uncertainty_band,
+                max_frames=seq_length,
+                timings=timings,
+                on_pass=lambda fake_prob, used: report('score', {'fake_probability': fake_prob,
+                                                                 'frames_used': used, 'final': False})
+            )
             _, predicted = torch.max(probs, 1)
+        else:
+            # Process frames
+            frames = []
+            
+            with stage_timer(timings, 'preprocess'):
+                for i in range(len(frame_paths)):
+                    # Process frame for model input
+                    frames.append(load_frame(i))
+                
+                # Stack frames into tensor with batch dimension
+                frames_tensor = torch.stack(frames).unsqueeze(0).to(device)
+            print(f"Frame tensor shape: {frames_tensor.shape}")
+            
+            # Run inference - THIS IS THE REAL MODEL INFERENCE
+            print("Running model inference...")
+            with torch.no_grad():
+                if hasattr(model, 'extract_features'):
+                    # Same computation as forward(), split so both halves can be timed
+                    with stage_timer(timings, 'cnn_forward'):
+                        features = model.extract_features(frames_tensor[0])
+                    with stage_timer(timings, 'lstm_head'):
+                        outputs = model.classify_features(features.unsqueeze(0))
+                else:
+                    with stage_timer(timings, 'cnn_forward'):
+                        outputs = model(frames_tensor)
+                probs = torch.softmax(outputs, dim=1)
+                _, predicted = torch.max(probs, 1)
+            frame_indices = list(range(len(frame_paths)))
         
         print(f"Model output - Predicted: {predicted.item()}, Probs: Real={probs[0][0].item():.4f}, Fake={probs[0][1].item():.4f}")
-        
-        # Get frame-by-frame probabilities
-        # For a real implementation with frame-level detection, you'd need to modify the model
-        # or run inference frame-by-frame. For now, we create reasonable per-frame estimates
-        # based on the overall prediction plus some video-specific variation
-        frame_probabilities = []
-        base_prob = float(probs[0][1].item())  # Base probability from model output
-        
-        # Use video hash to create consistent but varied frame probabilities
-        np.random.seed(int(video_hash[:8], 16) % (2**32))  # Seed based on video hash
-        
-        for i in range(len(frame_paths)):
-            # Create variation that's consistent for this video
-            variation = 0.15 * np.sin(i * 0.5 + int(video_hash[8:16], 16) % 100)
-            noise = np.random.uniform(-0.05, 0.05)  # Small random noise
-            frame_prob = min(max(base_prob + variation + noise, 0.0), 1.0)
-            
-            frame_probabilities.append({
-                "frame": i,
-                "probability_fake": float(frame_prob)
-            })
-        
-        # Calculate peak and average probabilities
-        peak_prob = max([f["probability_fake"] for f in frame_probabilities])
-        avg_prob = sum([f["probability_fake"] for f in frame_probabilities]) / len(frame_probabilities)
-        
-        # Get video metadata
-        cap = cv2.VideoCapture(video_path)
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = int(total_frames / fps) if fps > 0 else 0
-        cap.release()
+        report('score', {'fake_probability': probs[0][1].item(),
+                         'prediction': "Deepfake" if predicted.item() == 1 else "Real",
+                         'frames_used': len(frame_indices), 'final': True})
         
         # Prepare result
         result = {
-            "prediction": "Deepfake" if predicted.item() == 1 else "Real",
-            "confidence": float(probs[0][predicted.item()].item()),
-            "probabilities": {
-                "real": float(probs[0][0].item()),
-                "fake": float(probs[0][1].item())
-            },
-            "frame_analysis": frame_probabilities,
-            "max_fake_probability": float(peak_prob),
-            "avg_fake_probability": float(avg_prob),
+            **summarize_prediction(probs[0], video_hash, frame_indices, source_indices),
             "frames_analyzed": len(frame_paths),
-            "frame_rate": f"{fps:.2f} fps",
-            "duration": duration,
-            "resolution": f"{width}x{height}",
+            "frames_used": len(frame_indices),
+            "inference_mode": ("screened" if cascade is not None and not cascade['escalated']
+                               else "progressive" if progressive else "full"),
+            "cascade": cascade,
+            "face_crop": face_boxes is not None,
+            "sampling": sampling,
+            **video_metadata(video_info),
             "video_id": video_id,
-            "video_hash": video_hash  # Include hash for verification
+            "video_hash": video_hash,  # Include hash for verification
+            "fingerprint": fingerprint,
+            "near_duplicate_of": near_duplicate_of,
+            "model_version": model_version
         }
         
         print(f"Analysis complete: {result['prediction']} with {result['confidence']:.2%} confidence")
@@ -262,7 +542,132 @@ def analyze_video(
             print(f"Warning: Could not clean up temp directory: {e}")
 
 
-def generate_heatmap(video_path: str, frame_probabilities: List[Dict[str, float]], output_dir: str) -> List[Dict[str, Any]]:
+def default_transform():
+    """Preprocessing applied to every frame before the CNN (ImageNet normalization at 224x224)"""
+    return transforms.Compose([
+        transforms.Resize((224, 224)),
+        transforms.ToTensor(),
+        transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
+    ])
+
+
+def fit_sequence(frame_paths: List[str], source_indices: List[int], seq_length: int) -> Tuple[List[str], List[int]]:
+    """
+    Pad or evenly subsample extracted frames to exactly seq_length entries
+    
+    Short videos repeat their last frame; long ones keep evenly spaced frames.
+    """
+    if len(frame_paths) < seq_length:
+        frame_paths = frame_paths + [frame_paths[-1]] * (seq_length - len(frame_paths))
+        source_indices = source_indices + [source_indices[-1]] * (seq_length - len(source_indices))
+    elif len(frame_paths) > seq_length:
+        indices = np.linspace(0, len(frame_paths) - 1, seq_length, dtype=int)
+        frame_paths = [frame_paths[i] for i in indices]
+        source_indices = [source_indices[i] for i in indices]
+    return frame_paths, source_indices
+
+
+def summarize_prediction(
+    probs: torch.Tensor,
+    video_hash: str,
+    frame_indices: List[int],
+    source_indices: List[int]
+) -> Dict[str, Any]:
+    """
+    Turn the class probabilities of one video into the verdict part of a result
+    
+    Args:
+        probs: Softmax output for the video, shape [num_classes]
+        video_hash: SHA256 of the video, seeds the per-frame estimates
+        frame_indices: Positions in the sequence that were scored
+        source_indices: Source frame index of each sequence position
+        
+    Returns:
+        Dict with prediction, confidence, probabilities, frame_analysis and
+        the peak and average fake probabilities
+    """
+    predicted = int(torch.argmax(probs).item())
+    
+    # Get frame-by-frame probabilities
+    # For a real implementation with frame-level detection, you'd need to modify the model
+    # or run inference frame-by-frame. For now, we create reasonable per-frame estimates
+    # based on the overall prediction plus some video-specific variation
+    frame_probabilities = []
+    base_prob = float(probs[1].item())  # Base probability from model output
+    
+    # Use video hash to create consistent but varied frame probabilities
+    np.random.seed(int(video_hash[:8], 16) % (2**32))  # Seed based on video hash
+    
+    for i in frame_indices:
+        # Create variation that's consistent for this video
+        variation = 0.15 * np.sin(i * 0.5 + int(video_hash[8:16], 16) % 100)
+        noise = np.random.uniform(-0.05, 0.05)  # Small random noise
+        frame_prob = min(max(base_prob + variation + noise, 0.0), 1.0)
+        
+        frame_probabilities.append({
+            "frame": i,
+            "source_frame": int(source_indices[i]),
+            "probability_fake": float(frame_prob)
+        })
+        
+    # Calculate peak and average probabilities
+    peak_prob = max([f["probability_fake"] for f in frame_probabilities])
+    avg_prob = sum([f["probability_fake"] for f in frame_probabilities]) / len(frame_probabilities)
+    
+    return {
+        "prediction": "Deepfake" if predicted == 1 else "Real",
+        "confidence": float(probs[predicted].item()),
+        "probabilities": {
+            "real": float(probs[0].item()),
+            "fake": float(probs[1].item())
+        },
+        "frame_analysis": frame_probabilities,
+        "max_fake_probability": float(peak_prob),
+        "avg_fake_probability": float(avg_prob)
+    }
+
+
+class _ProgressReporter:
+    """Forward analysis events to an optional progress callback, throttling frame counts"""
+    
+    def __init__(self, progress, frame_interval=0.5):
+        self.progress = progress
+        self.frame_interval = frame_interval
+        self._last_frames = None
+        self._last_count = None
+        
+    def __call__(self, event, data):
+        if self.progress is not None:
+            self.progress(event, data)
+            
+    def frames(self, sampled, expected):
+        # Decoding reports every frame; pass on at most one update per interval
+        now = time.monotonic()
+        if (sampled, expected) == self._last_count:
+            return
+        if self._last_frames is not None and now - self._last_frames < self.frame_interval and sampled != expected:
+            return
+        self._last_frames = now
+        self._last_count = (sampled, expected)
+        self('frames', {'sampled': sampled, 'expected': expected})
+
+
+def video_metadata(video_info: VideoInfo) -> Dict[str, Any]:
+    """Format frame rate, duration and resolution of a video for the result"""
+    return {
+        "frame_rate": f"{video_info.fps:.2f} fps",
+        "duration": video_info.duration,
+        "resolution": video_info.resolution
+    }
+
+
+def generate_heatmap(
+    video_path: str, 
+    frame_probabilities: List[Dict[str, float]], 
+    output_dir: str,
+    video_info: Optional[VideoInfo] = None,
+    video_hash: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Generate heatmap visualizations for detected manipulation in video frames - FIXED VERSION
     
@@ -270,20 +675,23 @@ def generate_heatmap(video_path: str, frame_probabilities: List[Dict[str, float]
         video_path: Path to the video file
         frame_probabilities: List of dictionaries with frame probabilities
         output_dir: Directory to save heatmap images
+        video_info: Probe result for the video; probed here if not given
+        video_hash: SHA256 of the file if already computed
         
     Returns:
         List of dictionaries with heatmap image paths and metadata
     """
     os.makedirs(output_dir, exist_ok=True)
     
+    if video_info is None:
+        video_info = probe_video(video_path)
+    if video_hash is None:
+        video_hash = get_video_hash(video_path)
+    
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         raise ValueError(f"Could not open video file {video_path}")
     
-    # Get video properties
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    
     heatmap_images = []
     
     # Generate heatmaps for frames with higher probabilities
@@ -295,11 +703,11 @@ def generate_heatmap(video_path: str, frame_probabilities: List[Dict[str, float]
         frame_idx = frame_data["frame"]
         fake_prob = frame_data["probability_fake"]
         
-        # Calculate actual frame position in video
-        actual_frame_pos = int(frame_idx * 30)  # Assuming frame_skip=30
+        # Calculate actual frame position in video (older results lack source_frame)
+        actual_frame_pos = int(frame_data.get("source_frame", frame_idx * 30))
         
         # Skip to the right frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, min(actual_frame_pos, total_frames - 1))
+        cap.set(cv2.CAP_PROP_POS_FRAMES, video_info.clamp_frame(actual_frame_pos))
         ret, frame = cap.read()
         
         if not ret:
@@ -311,7 +719,6 @@ def generate_heatmap(video_path: str, frame_probabilities: List[Dict[str, float]
         h, w = frame.shape[:2]
         
         # Use video-specific seed for consistent but unique heatmap locations
-        video_hash = get_video_hash(video_path)
         np.random.seed((int(video_hash[:8], 16) + frame_idx) % (2**32))
         
         # Simulate manipulation area (in real system, this would be from attention maps)
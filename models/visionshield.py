@@ -11,10 +11,11 @@ import cv2
 
 class ResNet50FeatureExtractor(nn.Module):
     """Feature extractor using ResNet50"""
-    def __init__(self):
+    def __init__(self, pretrained=True):
         super(ResNet50FeatureExtractor, self).__init__()
         from torchvision.models import resnet50, ResNet50_Weights
-        base_model = resnet50(weights=ResNet50_Weights.DEFAULT)
+        # ImageNet weights are only needed for training; a loaded checkpoint overrides them
+        base_model = resnet50(weights=ResNet50_Weights.DEFAULT if pretrained else None)
         self.feature_extractor = torch.nn.Sequential(*list(base_model.children())[:-1])
         self.feature_size = 2048
 
@@ -32,18 +33,51 @@ class ResNet50FeatureExtractor(nn.Module):
             param.requires_grad = True
 
 
+class MobileNetV3FeatureExtractor(nn.Module):
+    """Feature extractor using MobileNetV3-Small, for cheap screening models"""
+    def __init__(self, pretrained=True):
+        super(MobileNetV3FeatureExtractor, self).__init__()
+        from torchvision.models import mobilenet_v3_small, MobileNet_V3_Small_Weights
+        base_model = mobilenet_v3_small(weights=MobileNet_V3_Small_Weights.DEFAULT if pretrained else None)
+        self.feature_extractor = torch.nn.Sequential(base_model.features, base_model.avgpool)
+        self.feature_size = 576
+
+        for param in self.feature_extractor.parameters():
+            param.requires_grad = False
+
+    def forward(self, x):
+        features = self.feature_extractor(x)
+        return features.squeeze()
+
+    def unfreeze(self):
+        """Unfreeze the CNN layers for fine-tuning"""
+        for param in self.feature_extractor.parameters():
+            param.requires_grad = True
+
+
+# CNN backbones VisionShield can be built with
+BACKBONES = {
+    'resnet50': ResNet50FeatureExtractor,
+    'mobilenet_v3_small': MobileNetV3FeatureExtractor
+}
+
+
 class VisionShield(nn.Module):
     """
     VisionShield: CNN-RNN hybrid model for deepfake detection
-    Combines spatial features (ResNet50) with temporal analysis (LSTM)
+    Combines spatial features (ResNet50, or MobileNetV3 for screening) with
+    temporal analysis (LSTM)
     """
     def __init__(self, feature_size=512, hidden_size=256,
-                 num_layers=2, num_classes=2, dropout=0.5):
+                 num_layers=2, num_classes=2, dropout=0.5, pretrained_backbone=True, backbone='resnet50'):
         super(VisionShield, self).__init__()
 
         # CNN feature extractor
-        self.feature_extractor = ResNet50FeatureExtractor()
-        self.cnn_feature_size = self.feature_extractor.feature_size  # This is 2048 for ResNet50
+        if backbone not in BACKBONES:
+            raise ValueError(f"Unknown backbone {backbone!r}, expected one of {sorted(BACKBONES)}")
+        self.backbone = backbone
+        self.feature_extractor = BACKBONES[backbone](pretrained=pretrained_backbone)
+        self.cnn_feature_size = self.feature_extractor.feature_size  # 2048 for ResNet50, 576 for MobileNetV3
 
         # Feature fusion layer (reduce dimensionality)
         self.fusion = nn.Sequential(
@@ -70,6 +104,34 @@ class VisionShield(nn.Module):
             nn.Linear(hidden_size, num_classes)
         )
 
+    def extract_features(self, frames):
+        """
+        Compute fused per-frame features
+
+        Args:
+            frames: Tensor of shape [num_frames, c, h, w]
+
+        Returns:
+            Tensor of shape [num_frames, feature_size]
+        """
+        features = self.feature_extractor(frames)
+        if features.dim() == 1:
+            features = features.unsqueeze(0)
+        return self.fusion(features)
+
+    def classify_features(self, fused_features):
+        """
+        Run the temporal head on precomputed per-frame features
+
+        Args:
+            fused_features: Tensor of shape [batch, seq_len, feature_size]
+
+        Returns:
+            Class logits of shape [batch, num_classes]
+        """
+        lstm_out, _ = self.lstm(fused_features)
+        return self.classifier(lstm_out[:, -1, :])
+
     def forward(self, x):
         batch_size, seq_len, c, h, w = x.shape
 
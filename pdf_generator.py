@@ -2,6 +2,7 @@
 # PDF Report Generator for VisionShield Analysis Results
 
 import os
+import tempfile
 from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -13,31 +14,43 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.lineplots import LinePlot
+from reportlab.graphics.charts.textlabels import Label
+from reportlab.graphics.charts.legends import LineLegend
+from reportlab.graphics.widgets.markers import makeMarker
 import io
 import base64
 
+from config_production import CHART_BACKENDS  # Chart backends supported by VisionShieldPDFGenerator
 
-class VisionShieldPDFGenerator:
-    """Generate professional PDF reports for VisionShield analysis results"""
+
+def _get_pyplot():
+    """Import matplotlib lazily so the native chart path never loads it"""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _with_alpha(hex_color, alpha):
+    """Return a ReportLab color for a hex string with the given transparency"""
+    color = colors.HexColor(hex_color)
+    return colors.Color(color.red, color.green, color.blue, alpha=alpha)
+
+
+class ReportStyles:
+    """
+    Paragraph styles used by VisionShieldPDFGenerator
     
-    def __init__(self, output_path, result_data):
-        """
-        Initialize PDF generator
-        
-        Args:
-            output_path: Path where PDF should be saved
-            result_data: Dictionary containing analysis results
-        """
-        self.output_path = output_path
-        self.result_data = result_data
+    Building the sample stylesheet and custom styles is the same for every
+    report, so one instance can be shared across many generators.
+    """
+    
+    def __init__(self):
         self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
         
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles for the report"""
         # Title style
         self.title_style = ParagraphStyle(
             'CustomTitle',
@@ -89,7 +102,40 @@ class VisionShieldPDFGenerator:
             alignment=TA_CENTER,
             spaceAfter=10
         )
+
+
+class VisionShieldPDFGenerator:
+    """Generate professional PDF reports for VisionShield analysis results"""
+    
+    def __init__(self, output_path, result_data, chart_backend='native', report_styles=None):
+        """
+        Initialize PDF generator
+        
+        Args:
+            output_path: Path where PDF should be saved, or a writable
+                binary file-like object to build the PDF into
+            result_data: Dictionary containing analysis results
+            chart_backend: 'native' for ReportLab vector drawings or
+                'matplotlib' for rasterized PNG charts
+            report_styles: Optional shared ReportStyles instance; a new one
+                is built if not provided
+        """
+        if chart_backend not in CHART_BACKENDS:
+            raise ValueError(f"Unknown chart backend: {chart_backend}")
+        self.output_path = output_path
+        self.result_data = result_data
+        self.chart_backend = chart_backend
+        self._setup_custom_styles(report_styles or ReportStyles())
     
+    def _setup_custom_styles(self, report_styles):
+        """Setup custom paragraph styles for the report"""
+        self.styles = report_styles.styles
+        self.title_style = report_styles.title_style
+        self.heading_style = report_styles.heading_style
+        self.subheading_style = report_styles.subheading_style
+        self.body_style = report_styles.body_style
+        self.result_style = report_styles.result_style
+        
     def _add_header_footer(self, canvas_obj, doc):
         """Add header and footer to each page"""
         canvas_obj.saveState()
@@ -117,6 +163,156 @@ class VisionShieldPDFGenerator:
     
     def _create_probability_chart(self):
         """Create a bar chart showing real vs fake probabilities"""
+        if self.chart_backend == 'matplotlib':
+            return self._create_matplotlib_probability_chart()
+        return self._create_native_probability_chart()
+    
+    def _create_frame_analysis_chart(self):
+        """Create a line chart showing frame-by-frame analysis"""
+        if not self.result_data.get('frame_analysis'):
+            return None
+        if self.chart_backend == 'matplotlib':
+            return self._create_matplotlib_frame_analysis_chart()
+        return self._create_native_frame_analysis_chart()
+    
+    def _create_native_probability_chart(self):
+        """Create the probability bar chart as a ReportLab vector drawing"""
+        width, height = 5*inch, 3.3*inch
+        drawing = Drawing(width, height)
+        
+        probabilities = [
+            self.result_data['probabilities']['real'] * 100,
+            self.result_data['probabilities']['fake'] * 100
+        ]
+        
+        drawing.add(String(width / 2, height - 18, 'Detection Probabilities',
+                           fontName='Helvetica-Bold', fontSize=14, textAnchor='middle'))
+        
+        chart = VerticalBarChart()
+        chart.x = 60
+        chart.y = 30
+        chart.width = width - 80
+        chart.height = height - 75
+        chart.data = [probabilities]
+        chart.barWidth = 20
+        chart.groupSpacing = 30
+        
+        chart.categoryAxis.categoryNames = ['Real', 'Deepfake']
+        chart.categoryAxis.labels.fontName = 'Helvetica'
+        chart.categoryAxis.labels.fontSize = 10
+        
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.valueMax = 110
+        chart.valueAxis.valueStep = 20
+        chart.valueAxis.labels.fontName = 'Helvetica'
+        chart.valueAxis.labels.fontSize = 9
+        chart.valueAxis.visibleGrid = True
+        chart.valueAxis.gridStrokeColor = colors.lightgrey
+        chart.valueAxis.gridStrokeDashArray = (2, 2)
+        
+        chart.bars.strokeColor = colors.black
+        chart.bars.strokeWidth = 1.5
+        chart.bars[(0, 0)].fillColor = _with_alpha('#10b981', 0.7)
+        chart.bars[(0, 1)].fillColor = _with_alpha('#ef4444', 0.7)
+        
+        # Value labels on top of the bars
+        chart.barLabelFormat = '%.1f%%'
+        chart.barLabels.nudge = 8
+        chart.barLabels.fontName = 'Helvetica-Bold'
+        chart.barLabels.fontSize = 12
+        drawing.add(chart)
+        
+        y_label = Label()
+        y_label.setOrigin(18, chart.y + chart.height / 2)
+        y_label.angle = 90
+        y_label.fontName = 'Helvetica-Bold'
+        y_label.fontSize = 11
+        y_label.setText('Probability (%)')
+        drawing.add(y_label)
+        
+        return drawing
+    
+    def _create_native_frame_analysis_chart(self):
+        """Create the frame-by-frame line chart as a ReportLab vector drawing"""
+        width, height = 6.5*inch, 3.25*inch
+        drawing = Drawing(width, height)
+        
+        frames = [f['frame'] for f in self.result_data['frame_analysis']]
+        points = [(f['frame'], f['probability_fake'] * 100) for f in self.result_data['frame_analysis']]
+        x_min, x_max = min(frames), max(frames)
+        if x_min == x_max:
+            x_max = x_min + 1
+        
+        drawing.add(String(width / 2, height - 18, 'Frame-by-Frame Analysis',
+                           fontName='Helvetica-Bold', fontSize=14, textAnchor='middle'))
+        
+        plot = LinePlot()
+        plot.x = 60
+        plot.y = 45
+        plot.width = width - 80
+        plot.height = height - 90
+        plot.data = [points, [(x_min, 50), (x_max, 50)]]
+        
+        plot.lines[0].strokeColor = colors.HexColor('#8e2de2')
+        plot.lines[0].strokeWidth = 2
+        plot.lines[0].symbol = makeMarker('FilledCircle', size=4)
+        plot.lines[0].inFill = True
+        plot.lines[0].fillColor = _with_alpha('#8e2de2', 0.3)
+        
+        # Threshold line
+        plot.lines[1].strokeColor = colors.red
+        plot.lines[1].strokeWidth = 1
+        plot.lines[1].strokeDashArray = (4, 3)
+        
+        plot.xValueAxis.valueMin = x_min
+        plot.xValueAxis.valueMax = x_max
+        plot.xValueAxis.labels.fontName = 'Helvetica'
+        plot.xValueAxis.labels.fontSize = 9
+        plot.xValueAxis.labelTextFormat = '%d'
+        plot.xValueAxis.visibleGrid = True
+        plot.xValueAxis.gridStrokeColor = colors.lightgrey
+        plot.xValueAxis.gridStrokeDashArray = (2, 2)
+        
+        plot.yValueAxis.valueMin = 0
+        plot.yValueAxis.valueMax = 105
+        plot.yValueAxis.valueStep = 20
+        plot.yValueAxis.labels.fontName = 'Helvetica'
+        plot.yValueAxis.labels.fontSize = 9
+        plot.yValueAxis.visibleGrid = True
+        plot.yValueAxis.gridStrokeColor = colors.lightgrey
+        plot.yValueAxis.gridStrokeDashArray = (2, 2)
+        drawing.add(plot)
+        
+        legend = LineLegend()
+        legend.x = plot.x + plot.width - 110
+        legend.y = plot.y + plot.height - 8
+        legend.fontName = 'Helvetica'
+        legend.fontSize = 9
+        legend.alignment = 'right'
+        legend.dx = 18
+        legend.colorNamePairs = [(colors.red, 'Threshold (50%)')]
+        drawing.add(legend)
+        
+        x_label = Label()
+        x_label.setOrigin(plot.x + plot.width / 2, 14)
+        x_label.fontName = 'Helvetica-Bold'
+        x_label.fontSize = 11
+        x_label.setText('Frame Number')
+        drawing.add(x_label)
+        
+        y_label = Label()
+        y_label.setOrigin(18, plot.y + plot.height / 2)
+        y_label.angle = 90
+        y_label.fontName = 'Helvetica-Bold'
+        y_label.fontSize = 11
+        y_label.setText('Deepfake Probability (%)')
+        drawing.add(y_label)
+        
+        return drawing
+    
+    def _create_matplotlib_probability_chart(self):
+        """Create a rasterized bar chart showing real vs fake probabilities"""
+        plt = _get_pyplot()
         fig, ax = plt.subplots(figsize=(6, 4))
         
         categories = ['Real', 'Deepfake']
@@ -149,11 +345,9 @@ class VisionShieldPDFGenerator:
         
         return buf
     
-    def _create_frame_analysis_chart(self):
-        """Create a line chart showing frame-by-frame analysis"""
-        if not self.result_data.get('frame_analysis'):
-            return None
-            
+    def _create_matplotlib_frame_analysis_chart(self):
+        """Create a rasterized line chart showing frame-by-frame analysis"""
+        plt = _get_pyplot()
         fig, ax = plt.subplots(figsize=(8, 4))
         
         frames = [f['frame'] for f in self.result_data['frame_analysis']]
@@ -271,6 +465,12 @@ class VisionShieldPDFGenerator:
         
         return table
     
+    def _chart_flowable(self, chart, width, height):
+        """Wrap a chart for the story: drawings are flowables, PNG buffers become images"""
+        if isinstance(chart, Drawing):
+            return chart
+        return RLImage(chart, width=width, height=height)
+    
     def generate(self):
         """Generate the complete PDF report"""
         doc = SimpleDocTemplate(
@@ -341,8 +541,7 @@ class VisionShieldPDFGenerator:
         story.append(Paragraph("Detection Probabilities", self.heading_style))
         prob_chart = self._create_probability_chart()
         if prob_chart:
-            img = RLImage(prob_chart, width=5*inch, height=3.3*inch)
-            story.append(img)
+            story.append(self._chart_flowable(prob_chart, 5*inch, 3.3*inch))
         story.append(Spacer(1, 0.3*inch))
         
         # Frame Analysis Chart
@@ -351,8 +550,7 @@ class VisionShieldPDFGenerator:
             story.append(PageBreak())
             story.append(Paragraph("Frame-by-Frame Analysis", self.heading_style))
             story.append(Spacer(1, 0.2*inch))
-            img = RLImage(frame_chart, width=6.5*inch, height=3.25*inch)
-            story.append(img)
+            story.append(self._chart_flowable(frame_chart, 6.5*inch, 3.25*inch))
             story.append(Spacer(1, 0.3*inch))
         
         # Detailed Frame Table
@@ -407,16 +605,45 @@ class VisionShieldPDFGenerator:
         return self.output_path
 
 
-def generate_analysis_report(result_data, output_path):
+def generate_analysis_report(result_data, output_path, chart_backend='native'):
     """
     Convenience function to generate a PDF report
     
     Args:
         result_data: Dictionary with analysis results
         output_path: Path where PDF should be saved
+        chart_backend: Chart rendering backend ('native' or 'matplotlib')
         
     Returns:
         Path to generated PDF
     """
-    generator = VisionShieldPDFGenerator(output_path, result_data)
+    generator = VisionShieldPDFGenerator(output_path, result_data, chart_backend=chart_backend)
     return generator.generate()
+
+
+def generate_analysis_report_buffer(result_data, chart_backend='native', spool_max_size=8 * 1024 * 1024,
+                                    report_styles=None):
+    """
+    Generate a PDF report into a spooled buffer instead of a file on disk
+    
+    The report is kept in memory and only rolls over to an anonymous temporary
+    file if it grows beyond spool_max_size, so nothing is left behind on disk.
+    
+    Args:
+        result_data: Dictionary with analysis results
+        chart_backend: Chart rendering backend ('native' or 'matplotlib')
+        spool_max_size: Size in bytes above which the buffer spills to disk
+        report_styles: Optional shared ReportStyles instance
+        
+    Returns:
+        Binary file-like object positioned at the start of the PDF
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=spool_max_size, mode='w+b')
+    try:
+        VisionShieldPDFGenerator(buffer, result_data, chart_backend=chart_backend,
+                                 report_styles=report_styles).generate()
+    except Exception:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer
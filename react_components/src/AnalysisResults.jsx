@@ -16,7 +16,7 @@ import {
 const apiClient = {
   async getAnalysisResults(videoId) {
     try {
-      const response = await fetch(`/api/results/${videoId}`);
+      const response = await fetch(`/api/results/${videoId}?include=frame_analysis`);
       return await response.json();
     } catch (error) {
       console.error('Results Fetch Error:', error);
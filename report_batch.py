@@ -0,0 +1,339 @@
+# report_batch.py
+# Bulk PDF report rendering for VisionShield compliance exports
+
+import os
+import json
+import time
+import uuid
+import zipfile
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import result_store
+
+# Per-process state for pool workers, set up once by _init_worker
+_worker_styles = None
+_worker_chart_backend = 'native'
+
+# Seconds between job state writes while reports complete
+JOB_SAVE_INTERVAL = 1.0
+
+
+def _init_worker(chart_backend):
+    """Build the report styles once per worker process"""
+    global _worker_styles, _worker_chart_backend
+    from pdf_generator import ReportStyles
+    
+    _worker_styles = ReportStyles()
+    _worker_chart_backend = chart_backend
+
+
+def _process_alive(pid):
+    """Whether a process with the given ID still exists on this host"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _render_report(video_id, result_data):
+    """
+    Render a single report inside a pool worker
+    
+    Returns:
+        tuple: (video_id, pdf_bytes)
+    """
+    from pdf_generator import generate_analysis_report_buffer
+    
+    buffer = generate_analysis_report_buffer(
+        result_data,
+        chart_backend=_worker_chart_backend,
+        report_styles=_worker_styles
+    )
+    with buffer:
+        return video_id, buffer.read()
+
+
+def load_result(upload_dir, video_id):
+    """Load the stored analysis result for a video, with its per-frame data, or None if missing"""
+    return result_store.load_result(upload_dir, video_id, include_frames=True)
+
+
+def find_video_ids(upload_dir, prediction=None, since=None, until=None, filename_contains=None):
+    """
+    Select analyzed videos from the history using simple filters
+    
+    Args:
+        upload_dir: Folder holding the *_results.json files
+        prediction: Only include results with this prediction (e.g. 'Deepfake')
+        since: Only include results with a timestamp (ms) at or after this value
+        until: Only include results with a timestamp (ms) at or before this value
+        filename_contains: Case-insensitive substring the original filename must contain
+        
+    Returns:
+        List of video IDs, newest first
+    """
+    matches = []
+    for video_id, result in result_store.list_results(upload_dir).items():
+        timestamp = result.get('timestamp', 0)
+        if prediction and result.get('prediction') != prediction:
+            continue
+        if since is not None and timestamp < since:
+            continue
+        if until is not None and timestamp > until:
+            continue
+        if filename_contains and filename_contains.lower() not in result.get('filename', '').lower():
+            continue
+        matches.append((timestamp, video_id))
+        
+    matches.sort(reverse=True)
+    return [video_id for _, video_id in matches]
+
+
+class BulkReportJob:
+    """
+    Progress and outcome of one bulk report export
+    
+    The job state is kept in <job_id>.json next to the <job_id>.zip archive
+    in the export folder, so any worker process can report on it and the
+    janitor expires both together. The state records the process running
+    the job, so a job whose process died is reported as failed rather than
+    running forever.
+    """
+    
+    def __init__(self, video_ids, export_dir, job_id=None):
+        self.job_id = job_id or str(uuid.uuid4())
+        self.video_ids = video_ids
+        self.archive_path = os.path.join(export_dir, f"{self.job_id}.zip")
+        self.state_path = os.path.join(export_dir, f"{self.job_id}.json")
+        self.status = 'queued'
+        self.completed = 0
+        self.missing = []
+        self.failed = []
+        self.error = None
+        self.created_at = int(time.time() * 1000)
+        self.finished_at = None
+        self.owner_pid = os.getpid()
+        
+    @property
+    def active(self):
+        """Whether the job is still queued or running"""
+        return self.status in ('queued', 'running')
+        
+    def mark_orphaned(self):
+        """Report an unfinished job whose owning process is gone as failed"""
+        self.status = 'failed'
+        self.error = 'Export was interrupted: the worker process running it exited'
+        
+    def to_dict(self):
+        """Serialize the job for API responses"""
+        total = len(self.video_ids)
+        processed = self.completed + len(self.missing) + len(self.failed)
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'total': total,
+            'completed': self.completed,
+            'missing': self.missing,
+            'failed': self.failed,
+            'progress': round(processed / total * 100, 1) if total else 100.0,
+            'error': self.error,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at
+        }
+        
+    def save(self):
+        """Write the job state atomically for the other worker processes"""
+        state = {'video_ids': self.video_ids, 'owner_pid': self.owner_pid, **self.to_dict()}
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+        
+    @classmethod
+    def load(cls, export_dir, job_id):
+        """
+        Read a job back from its state file
+        
+        Returns:
+            BulkReportJob, or None if the job is unknown or has expired
+        """
+        try:
+            job_id = str(uuid.UUID(job_id))
+        except ValueError:
+            return None
+            
+        try:
+            with open(os.path.join(export_dir, f"{job_id}.json"), 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+            
+        job = cls(state['video_ids'], export_dir, job_id)
+        job.status = state['status']
+        job.completed = state['completed']
+        job.missing = state['missing']
+        job.failed = state['failed']
+        job.error = state['error']
+        job.created_at = state['created_at']
+        job.finished_at = state['finished_at']
+        job.owner_pid = state.get('owner_pid')
+        if job.active and job.owner_pid is not None and not _process_alive(job.owner_pid):
+            job.mark_orphaned()
+        return job
+
+
+class BulkReportManager:
+    """
+    Run bulk report exports on a shared process pool
+    
+    Each job loads its results in the parent process, fans the rendering out
+    to the pool a few at a time and writes finished PDFs into a single ZIP
+    archive as they complete. Running jobs are tracked in memory by the
+    process running them; their state file serves progress polling from
+    every process.
+    """
+    
+    def __init__(self, upload_dir, export_dir, max_workers=2, chart_backend='native'):
+        self.upload_dir = upload_dir
+        self.export_dir = export_dir
+        self.max_workers = max_workers
+        self.chart_backend = chart_backend
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        os.makedirs(export_dir, exist_ok=True)
+        
+    def _get_executor(self):
+        """Create the process pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                # Spawned workers only import the PDF code, not torch or the app
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.chart_backend,)
+                )
+            return self._executor
+            
+    def submit(self, video_ids):
+        """
+        Start a bulk export job in the background
+        
+        Args:
+            video_ids: List of video IDs to include in the archive
+            
+        Returns:
+            The queued BulkReportJob
+        """
+        job = BulkReportJob(list(dict.fromkeys(video_ids)), self.export_dir)
+        # Tracked before its state file exists, so get() never sees it untracked
+        with self._lock:
+            self._jobs[job.job_id] = job
+        try:
+            job.save()
+        except OSError:
+            with self._lock:
+                self._jobs.pop(job.job_id, None)
+            raise
+            
+        thread = threading.Thread(target=self._run, args=(job,), daemon=True)
+        thread.start()
+        return job
+        
+    def get(self, job_id):
+        """Return the job with the given ID, or None"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        # Finished, or running in another worker process
+        job = BulkReportJob.load(self.export_dir, job_id)
+        if job is not None and job.active and job.owner_pid == os.getpid():
+            # Ours but no longer tracked: its thread ended without a final save
+            job.mark_orphaned()
+        return job
+        
+    def _run(self, job):
+        """Render every report of a job and pack them into its archive"""
+        job.status = 'running'
+        partial_path = f"{job.archive_path}.part"
+        try:
+            job.save()
+            executor = self._get_executor()
+            # Results are loaded as the pool frees up, so only a window of them
+            # (and of rendered PDFs) is held in memory at a time
+            window = self.max_workers * 2
+            remaining = iter(job.video_ids)
+            pending = {}
+            last_save = time.monotonic()
+            
+            with zipfile.ZipFile(partial_path, mode='w', compression=zipfile.ZIP_STORED) as archive:
+                while True:
+                    while len(pending) < window:
+                        video_id = next(remaining, None)
+                        if video_id is None:
+                            break
+                        result_data = load_result(self.upload_dir, video_id)
+                        if result_data is None:
+                            job.missing.append(video_id)
+                            continue
+                        pending[executor.submit(_render_report, video_id, result_data)] = video_id
+                    if not pending:
+                        break
+                        
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        video_id = pending.pop(future)
+                        try:
+                            _, pdf_bytes = future.result()
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            print(f"Error generating PDF report for {video_id}: {e}")
+                            job.failed.append(video_id)
+                            continue
+                        archive.writestr(f"VisionShield_Report_{video_id}.pdf", pdf_bytes)
+                        job.completed += 1
+                        
+                    if time.monotonic() - last_save >= JOB_SAVE_INTERVAL:
+                        job.save()
+                        last_save = time.monotonic()
+                        
+                manifest = {'video_ids': job.video_ids, **job.to_dict()}
+                manifest['status'] = 'completed'
+                archive.writestr('manifest.json', json.dumps(manifest, indent=2))
+                
+            os.replace(partial_path, job.archive_path)
+            job.status = 'completed'
+        except Exception as e:
+            print(f"Bulk report job {job.job_id} failed: {e}")
+            if isinstance(e, BrokenProcessPool):
+                self.shutdown()
+            job.status = 'failed'
+            job.error = str(e)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        finally:
+            job.finished_at = int(time.time() * 1000)
+            try:
+                job.save()
+            except OSError as e:
+                print(f"Error saving bulk report job {job.job_id}: {e}")
+            # From here on the state file is the record of the job
+            with self._lock:
+                self._jobs.pop(job.job_id, None)
+                
+
+    def shutdown(self):
+        """Stop the process pool"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,188 @@
+# result_store.py
+# Analysis results stored as a compact JSON summary plus a packed per-frame array
+
+import os
+import json
+import threading
+
+# Columns of the per-frame array, in order. Missing source frames (results
+# reused from older records) are stored as NaN.
+FRAME_COLUMNS = ('frame', 'source_frame', 'probability_fake')
+
+# Fields of each result that listings (history, bulk report filters) need
+LISTING_FIELDS = ('filename', 'timestamp', 'prediction', 'confidence')
+
+# results file path -> ((mtime_ns, size), listing fields), shared by all threads
+_listing_cache = {}
+_listing_lock = threading.Lock()
+
+
+def results_path(upload_dir, video_id):
+    """Path of the JSON summary of a video's analysis"""
+    return os.path.join(upload_dir, f"{video_id}_results.json")
+
+
+def frames_path(upload_dir, video_id):
+    """Path of the per-frame float32 array of a video's analysis"""
+    return os.path.join(upload_dir, f"{video_id}_frames.npy")
+
+
+def pack_frames(frame_analysis):
+    """Convert a frame_analysis list into a float32 array of shape [frames, len(FRAME_COLUMNS)]"""
+    import numpy as np
+    
+    packed = np.full((len(frame_analysis), len(FRAME_COLUMNS)), np.nan, dtype=np.float32)
+    for row, frame in enumerate(frame_analysis):
+        for column, name in enumerate(FRAME_COLUMNS):
+            if frame.get(name) is not None:
+                packed[row, column] = frame[name]
+    return packed
+
+
+def unpack_frames(packed):
+    """Convert a packed per-frame array back into the frame_analysis list"""
+    frames = []
+    for frame, source_frame, probability_fake in packed.tolist():
+        entry = {'frame': int(frame)}
+        if source_frame == source_frame:  # NaN marks a missing source frame
+            entry['source_frame'] = int(source_frame)
+        entry['probability_fake'] = probability_fake
+        frames.append(entry)
+    return frames
+
+
+def _atomic_write(path, write):
+    """Write a file through a temporary name so readers never see it half written"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def save_result(upload_dir, video_id, result):
+    """
+    Store an analysis result as a summary record and a per-frame array
+    
+    The summary keeps every field except frame_analysis and adds frame_count
+    and suspicious_frames, so list and detail views never need the frames.
+    The array is written first; a summary on disk always has its frames.
+    
+    Args:
+        upload_dir: Folder holding the results
+        video_id: ID the result is stored under
+        result: Full result dict as returned by analyze_video
+        
+    Returns:
+        The summary dict that was written
+    """
+    frame_analysis = result.get('frame_analysis') or []
+    summary = {key: value for key, value in result.items() if key != 'frame_analysis'}
+    summary['frame_count'] = len(frame_analysis)
+    summary['suspicious_frames'] = sum(1 for f in frame_analysis if f.get('probability_fake', 0) > 0.5)
+    
+    if frame_analysis:
+        import numpy as np
+        packed = pack_frames(frame_analysis)
+        _atomic_write(frames_path(upload_dir, video_id), lambda f: np.save(f, packed))
+    _atomic_write(results_path(upload_dir, video_id), lambda f: f.write(json.dumps(summary).encode('utf-8')))
+    return summary
+
+
+def load_result(upload_dir, video_id, include_frames=False):
+    """
+    Load the stored result of a video
+    
+    Args:
+        upload_dir: Folder holding the results
+        video_id: ID of the analyzed video
+        include_frames: Also load frame_analysis from the per-frame array
+        
+    Returns:
+        Result dict, or None if the video has no result
+    """
+    if os.path.basename(video_id) != video_id:
+        return None
+    results_file = results_path(upload_dir, video_id)
+    if not os.path.exists(results_file):
+        return None
+    with open(results_file, 'r') as f:
+        result = json.load(f)
+    
+    # Records written before the split still carry frame_analysis inline
+    if include_frames and 'frame_analysis' not in result:
+        result['frame_analysis'] = load_frame_analysis(upload_dir, video_id) or []
+    return result
+
+
+def load_frame_analysis(upload_dir, video_id):
+    """
+    Load the per-frame probabilities of a video
+    
+    Returns:
+        The frame_analysis list, or None if the video has no result
+    """
+    if os.path.basename(video_id) != video_id:
+        return None
+    frames_file = frames_path(upload_dir, video_id)
+    if os.path.exists(frames_file):
+        import numpy as np
+        return unpack_frames(np.load(frames_file))
+    result = load_result(upload_dir, video_id)
+    if result is None:
+        return None
+    return result.get('frame_analysis', [])
+
+
+def list_results(upload_dir):
+    """
+    The listing fields of every stored result
+    
+    Fields are cached per file by mtime and size, so repeated listings only
+    stat the records that did not change. Records written before the split
+    still carry frame_analysis inline; they are split on first read, so the
+    next parse of them is small too.
+    
+    Returns:
+        Dict of video_id -> dict of LISTING_FIELDS present in the record
+    """
+    listing = {}
+    seen = set()
+    for entry in os.scandir(upload_dir):
+        if not entry.name.endswith('_results.json'):
+            continue
+        video_id = entry.name[:-len('_results.json')]
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        version = (stat.st_mtime_ns, stat.st_size)
+        seen.add(entry.path)
+        
+        with _listing_lock:
+            cached = _listing_cache.get(entry.path)
+        if cached is not None and cached[0] == version:
+            listing[video_id] = cached[1]
+            continue
+            
+        try:
+            with open(entry.path, 'r') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if 'frame_analysis' in result:
+            save_result(upload_dir, video_id, result)
+            try:
+                stat = os.stat(entry.path)
+                version = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+                
+        fields = {key: result[key] for key in LISTING_FIELDS if key in result}
+        with _listing_lock:
+            _listing_cache[entry.path] = (version, fields)
+        listing[video_id] = fields
+        
+    with _listing_lock:
+        for path in [path for path in _listing_cache if path not in seen and os.path.dirname(path) == upload_dir]:
+            del _listing_cache[path]
+    return listing
@@ -302,10 +302,12 @@ function updateResultsUI(result) {
     if (peakProb) peakProb.textContent = `${(result.max_fake_probability * 100).toFixed(1)}%`;
     if (avgProb) avgProb.textContent = `${(result.avg_fake_probability * 100).toFixed(1)}%`;
     
-    // Count suspicious frames (probability > 0.5)
+    // Suspicious frames (probability > 0.5) are counted when the result is stored;
+    // older records still carry the full frame_analysis list
     const frames = result.frame_analysis || [];
-    const suspicious = frames.filter(f => f.probability_fake > 0.5).length;
-    if (suspiciousFrames) suspiciousFrames.textContent = `${suspicious}/${frames.length}`;
+    const suspicious = result.suspicious_frames ?? frames.filter(f => f.probability_fake > 0.5).length;
+    const frameCount = result.frame_count ?? frames.length;
+    if (suspiciousFrames) suspiciousFrames.textContent = `${suspicious}/${frameCount}`;
     
     // Processing time (mock - would come from backend)
     if (processingTime) processingTime.textContent = '2.3s';
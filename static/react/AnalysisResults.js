@@ -1,2 +1,2 @@
 /*! For license information please see AnalysisResults.js.LICENSE.txt */
-var AnalysisResults;(()=>{var t={2:(t,e,r)=>{var n=r(2199),o=r(4664),i=r(5950);t.exports=function(t){return n(t,i,o)}},14:(t,e,r)=>{var n=r(5389),o=r(5765);t.exports=function(t,e){return t&&t.length?o(t,n(e,2)):[]}},79:(t,e,r)=>{var n=r(3702),o=r(80),i=r(4739),a=r(8655),c=r(1175);function u(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}u.prototype.clear=n,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=c,t.exports=u},80:(t,e,r)=>{var n=r(6025),o=Array.prototype.splice;t.exports=function(t){var e=this.__data__,r=n(e,t);return!(r<0||(r==e.length-1?e.pop():o.call(e,r,1),--this.size,0))}},104:(t,e,r)=>{var n=r(3661);function o(t,e){if("function"!=typeof t||null!=e&&"function"!=typeof e)throw new TypeError("Expected a function");var r=function(){var n=arguments,o=e?e.apply(this,n):n[0],i=r.cache;if(i.has(o))return i.get(o);var a=t.apply(this,n);return r.cache=i.set(o,a)||i,a};return r.cache=new(o.Cache||n),r}o.Cache=n,t.exports=o},124:(t,e,r)=>{var n=r(9325);t.exports=function(){return n.Date.now()}},228:t=>{"use strict";var e=Object.prototype.hasOwnProperty,r="~";function n(){}function o(t,e,r){this.fn=t,this.context=e,this.once=r||!1}function i(t,e,n,i,a){if("function"!=typeof n)throw new TypeError("The listener must be a function");var c=new o(n,i||t,a),u=r?r+e:e;return t._events[u]?t._events[u].fn?t._events[u]=[t._events[u],c]:t._events[u].push(c):(t._events[u]=c,t._eventsCount++),t}function a(t,e){0==--t._eventsCount?t._events=new n:delete t._events[e]}function c(){this._events=new n,this._eventsCount=0}Object.create&&(n.prototype=Object.create(null),(new n).__proto__||(r=!1)),c.prototype.eventNames=function(){var t,n,o=[];if(0===this._eventsCount)return o;for(n in t=this._events)e.call(t,n)&&o.push(r?n.slice(1):n);return Object.getOwnPropertySymbols?o.concat(Object.getOwnPropertySymbols(t)):o},c.prototype.listeners=function(t){var e=r?r+t:t,n=this._events[e];if(!n)return[];if(n.fn)return[n.fn];for(var o=0,i=n.length,a=new Array(i);o<i;o++)a[o]=n[o].fn;return a},c.prototype.listenerCount=function(t){var e=r?r+t:t,n=this._events[e];return n?n.fn?1:n.length:0},c.prototype.emit=function(t,e,n,o,i,a){var c=r?r+t:t;if(!this._events[c])return!1;var u,l,s=this._events[c],f=arguments.length;if(s.fn){switch(s.once&&this.removeListener(t,s.fn,void 0,!0),f){case 1:return s.fn.call(s.context),!0;case 2:return s.fn.call(s.context,e),!0;case 3:return s.fn.call(s.context,e,n),!0;case 4:return s.fn.call(s.context,e,n,o),!0;case 5:return s.fn.call(s.context,e,n,o,i),!0;case 6:return s.fn.call(s.context,e,n,o,i,a),!0}for(l=1,u=new Array(f-1);l<f;l++)u[l-1]=arguments[l];s.fn.apply(s.context,u)}else{var p,h=s.length;for(l=0;l<h;l++)switch(s[l].once&&this.removeListener(t,s[l].fn,void 0,!0),f){case 1:s[l].fn.call(s[l].context);break;case 2:s[l].fn.call(s[l].context,e);break;case 3:s[l].fn.call(s[l].context,e,n);break;case 4:s[l].fn.call(s[l].context,e,n,o);break;default:if(!u)for(p=1,u=new Array(f-1);p<f;p++)u[p-1]=arguments[p];s[l].fn.apply(s[l].context,u)}}return!0},c.prototype.on=function(t,e,r){return i(this,t,e,r,!1)},c.prototype.once=function(t,e,r){return i(this,t,e,r,!0)},c.prototype.removeListener=function(t,e,n,o){var i=r?r+t:t;if(!this._events[i])return this;if(!e)return a(this,i),this;var c=this._events[i];if(c.fn)c.fn!==e||o&&!c.once||n&&c.context!==n||a(this,i);else{for(var u=0,l=[],s=c.length;u<s;u++)(c[u].fn!==e||o&&!c[u].once||n&&c[u].context!==n)&&l.push(c[u]);l.length?this._events[i]=1===l.length?l[0]:l:a(this,i)}return this},c.prototype.removeAllListeners=function(t){var e;return t?(e=r?r+t:t,this._events[e]&&a(this,e)):(this._events=new n,this._eventsCount=0),this},c.prototype.off=c.prototype.removeListener,c.prototype.addListener=c.prototype.on,c.prefixed=r,c.EventEmitter=c,t.exports=c},270:(t,e,r)=>{var n=r(7068),o=r(346);t.exports=function t(e,r,i,a,c){return e===r||(null==e||null==r||!o(e)&&!o(r)?e!=e&&r!=r:n(e,r,i,a,t,c))}},289:(t,e,r)=>{var n=r(2651);t.exports=function(t){return n(this,t).get(t)}},294:t=>{t.exports=function(t){return"number"==typeof t&&t>-1&&t%1==0&&t<=9007199254740991}},317:t=>{t.exports=function(t){var e=-1,r=Array(t.size);return t.forEach((function(t,n){r[++e]=[n,t]})),r}},346:t=>{t.exports=function(t){return null!=t&&"object"==typeof t}},361:t=>{var e=/^(?:0|[1-9]\d*)$/;t.exports=function(t,r){var n=typeof t;return!!(r=null==r?9007199254740991:r)&&("number"==n||"symbol"!=n&&e.test(t))&&t>-1&&t%1==0&&t<r}},392:t=>{t.exports=function(t,e){return null==t?void 0:t[e]}},583:(t,e,r)=>{var n=r(7237),o=r(7255),i=r(8586),a=r(7797);t.exports=function(t){return i(t)?n(a(t)):o(t)}},631:(t,e,r)=>{var n=r(8077),o=r(9326);t.exports=function(t,e){return null!=t&&o(t,e,n)}},641:(t,e,r)=>{var n=r(6649),o=r(5950);t.exports=function(t,e){return t&&n(t,e,o)}},659:(t,e,r)=>{var n=r(1873),o=Object.prototype,i=o.hasOwnProperty,a=o.toString,c=n?n.toStringTag:void 0;t.exports=function(t){var e=i.call(t,c),r=t[c];try{t[c]=void 0;var n=!0}catch(t){}var o=a.call(t);return n&&(e?t[c]=r:delete t[c]),o}},689:(t,e,r)=>{var n=r(2),o=Object.prototype.hasOwnProperty;t.exports=function(t,e,r,i,a,c){var u=1&r,l=n(t),s=l.length;if(s!=n(e).length&&!u)return!1;for(var f=s;f--;){var p=l[f];if(!(u?p in e:o.call(e,p)))return!1}var h=c.get(t),d=c.get(e);if(h&&d)return h==e&&d==t;var y=!0;c.set(t,e),c.set(e,t);for(var v=u;++f<s;){var m=t[p=l[f]],b=e[p];if(i)var g=u?i(b,m,p,e,t,c):i(m,b,p,t,e,c);if(!(void 0===g?m===b||a(m,b,r,i,c):g)){y=!1;break}v||(v="constructor"==p)}if(y&&!v){var x=t.constructor,w=e.constructor;x==w||!("constructor"in t)||!("constructor"in e)||"function"==typeof x&&x instanceof x&&"function"==typeof w&&w instanceof w||(y=!1)}return c.delete(t),c.delete(e),y}},695:(t,e,r)=>{var n=r(8096),o=r(2428),i=r(6449),a=r(3656),c=r(361),u=r(7167),l=Object.prototype.hasOwnProperty;t.exports=function(t,e){var r=i(t),s=!r&&o(t),f=!r&&!s&&a(t),p=!r&&!s&&!f&&u(t),h=r||s||f||p,d=h?n(t.length,String):[],y=d.length;for(var v in t)!e&&!l.call(t,v)||h&&("length"==v||f&&("offset"==v||"parent"==v)||p&&("buffer"==v||"byteLength"==v||"byteOffset"==v)||c(v,y))||d.push(v);return d}},756:(t,e,r)=>{var n=r(3805);t.exports=function(t){return t==t&&!n(t)}},776:(t,e,r)=>{var n=r(756),o=r(5950);t.exports=function(t){for(var e=o(t),r=e.length;r--;){var i=e[r],a=t[i];e[r]=[i,a,n(a)]}return e}},909:(t,e,r)=>{var n=r(641),o=r(8329)(n);t.exports=o},916:(t,e,r)=>{var n=r(909);t.exports=function(t,e){var r;return n(t,(function(t,n,o){return!(r=e(t,n,o))})),!!r}},938:t=>{t.exports=function(t){var e=this.__data__,r=e.delete(t);return this.size=e.size,r}},945:(t,e,r)=>{var n=r(79),o=r(8223),i=r(3661);t.exports=function(t,e){var r=this.__data__;if(r instanceof n){var a=r.__data__;if(!o||a.length<199)return a.push([t,e]),this.size=++r.size,this;r=this.__data__=new i(a)}return r.set(t,e),this.size=r.size,this}},1033:t=>{t.exports=function(t,e,r){switch(r.length){case 0:return t.call(e);case 1:return t.call(e,r[0]);case 2:return t.call(e,r[0],r[1]);case 3:return t.call(e,r[0],r[1],r[2])}return t.apply(e,r)}},1042:(t,e,r)=>{var n=r(6110)(Object,"create");t.exports=n},1074:t=>{t.exports=function(t){return t.split("")}},1175:(t,e,r)=>{var n=r(6025);t.exports=function(t,e){var r=this.__data__,o=n(r,t);return o<0?(++this.size,r.push([t,e])):r[o][1]=e,this}},1331:(t,e,r)=>{var n=r(2552),o=r(8879),i=r(346),a=Function.prototype,c=Object.prototype,u=a.toString,l=c.hasOwnProperty,s=u.call(Object);t.exports=function(t){if(!i(t)||"[object Object]"!=n(t))return!1;var e=o(t);if(null===e)return!0;var r=l.call(e,"constructor")&&e.constructor;return"function"==typeof r&&r instanceof r&&u.call(r)==s}},1380:t=>{t.exports=function(t){return this.__data__.set(t,"__lodash_hash_undefined__"),this}},1420:(t,e,r)=>{var n=r(79);t.exports=function(){this.__data__=new n,this.size=0}},1459:t=>{t.exports=function(t){return this.__data__.has(t)}},1489:(t,e,r)=>{var n=r(7400);t.exports=function(t){var e=n(t),r=e%1;return e==e?r?e-r:e:0}},1549:(t,e,r)=>{var n=r(2032),o=r(3862),i=r(6721),a=r(2749),c=r(5749);function u(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}u.prototype.clear=n,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=c,t.exports=u},1684:(t,e,r)=>{var n=r(3599),o=r(6176),i=r(3488);t.exports=function(t){return t&&t.length?n(t,i,o):void 0}},1741:(t,e,r)=>{var n=r(8023);t.exports=function(t){return n(t)&&t!=+t}},1769:(t,e,r)=>{var n=r(6449),o=r(8586),i=r(1802),a=r(3222);t.exports=function(t,e){return n(t)?t:o(t,e)?[t]:i(a(t))}},1799:(t,e,r)=>{var n=r(7217),o=r(270);t.exports=function(t,e,r,i){var a=r.length,c=a,u=!i;if(null==t)return!c;for(t=Object(t);a--;){var l=r[a];if(u&&l[2]?l[1]!==t[l[0]]:!(l[0]in t))return!1}for(;++a<c;){var s=(l=r[a])[0],f=t[s],p=l[1];if(u&&l[2]){if(void 0===f&&!(s in t))return!1}else{var h=new n;if(i)var d=i(f,p,s,t,e,h);if(!(void 0===d?o(p,f,3,i,h):d))return!1}}return!0}},1800:t=>{var e=/\s/;t.exports=function(t){for(var r=t.length;r--&&e.test(t.charAt(r)););return r}},1802:(t,e,r)=>{var n=r(2224),o=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,i=/\\(\\)?/g,a=n((function(t){var e=[];return 46===t.charCodeAt(0)&&e.push(""),t.replace(o,(function(t,r,n,o){e.push(n?o.replace(i,"$1"):r||t)})),e}));t.exports=a},1811:t=>{var e=Date.now;t.exports=function(t){var r=0,n=0;return function(){var o=e(),i=16-(o-n);if(n=o,i>0){if(++r>=800)return arguments[0]}else r=0;return t.apply(void 0,arguments)}}},1873:(t,e,r)=>{var n=r(9325).Symbol;t.exports=n},1882:(t,e,r)=>{var n=r(2552),o=r(3805);t.exports=function(t){if(!o(t))return!1;var e=n(t);return"[object Function]"==e||"[object GeneratorFunction]"==e||"[object AsyncFunction]"==e||"[object Proxy]"==e}},1986:(t,e,r)=>{var n=r(1873),o=r(7828),i=r(5288),a=r(5911),c=r(317),u=r(4247),l=n?n.prototype:void 0,s=l?l.valueOf:void 0;t.exports=function(t,e,r,n,l,f,p){switch(r){case"[object DataView]":if(t.byteLength!=e.byteLength||t.byteOffset!=e.byteOffset)return!1;t=t.buffer,e=e.buffer;case"[object ArrayBuffer]":return!(t.byteLength!=e.byteLength||!f(new o(t),new o(e)));case"[object Boolean]":case"[object Date]":case"[object Number]":return i(+t,+e);case"[object Error]":return t.name==e.name&&t.message==e.message;case"[object RegExp]":case"[object String]":return t==e+"";case"[object Map]":var h=c;case"[object Set]":var d=1&n;if(h||(h=u),t.size!=e.size&&!d)return!1;var y=p.get(t);if(y)return y==e;n|=2,p.set(t,e);var v=a(h(t),h(e),n,l,f,p);return p.delete(t),v;case"[object Symbol]":if(s)return s.call(t)==s.call(e)}return!1}},2006:(t,e,r)=>{var n=r(5389),o=r(4894),i=r(5950);t.exports=function(t){return function(e,r,a){var c=Object(e);if(!o(e)){var u=n(r,3);e=i(e),r=function(t){return u(c[t],t,c)}}var l=t(e,r,a);return l>-1?c[u?e[l]:l]:void 0}}},2032:(t,e,r)=>{var n=r(1042);t.exports=function(){this.__data__=n?n(null):{},this.size=0}},2054:t=>{var e="\\ud800-\\udfff",r="["+e+"]",n="[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]",o="\\ud83c[\\udffb-\\udfff]",i="[^"+e+"]",a="(?:\\ud83c[\\udde6-\\uddff]){2}",c="[\\ud800-\\udbff][\\udc00-\\udfff]",u="(?:"+n+"|"+o+")?",l="[\\ufe0e\\ufe0f]?",s=l+u+"(?:\\u200d(?:"+[i,a,c].join("|")+")"+l+u+")*",f="(?:"+[i+n+"?",n,a,c,r].join("|")+")",p=RegExp(o+"(?="+o+")|"+f+s,"g");t.exports=function(t){return t.match(p)||[]}},2199:(t,e,r)=>{var n=r(4528),o=r(6449);t.exports=function(t,e,r){var i=e(t);return o(t)?i:n(i,r(t))}},2224:(t,e,r)=>{var n=r(104);t.exports=function(t){var e=n(t,(function(t){return 500===r.size&&r.clear(),t})),r=e.cache;return e}},2404:(t,e,r)=>{var n=r(270);t.exports=function(t,e){return n(t,e)}},2426:(t,e,r)=>{var n=r(4248),o=r(5389),i=r(916),a=r(6449),c=r(6800);t.exports=function(t,e,r){var u=a(t)?n:i;return r&&c(t,e,r)&&(e=void 0),u(t,o(e,3))}},2428:(t,e,r)=>{var n=r(7534),o=r(346),i=Object.prototype,a=i.hasOwnProperty,c=i.propertyIsEnumerable,u=n(function(){return arguments}())?n:function(t){return o(t)&&a.call(t,"callee")&&!c.call(t,"callee")};t.exports=u},2507:(t,e,r)=>{var n=r(8754),o=r(9698),i=r(3912),a=r(3222);t.exports=function(t){return function(e){e=a(e);var r=o(e)?i(e):void 0,c=r?r[0]:e.charAt(0),u=r?n(r,1).join(""):e.slice(1);return c[t]()+u}}},2523:t=>{t.exports=function(t,e,r,n){for(var o=t.length,i=r+(n?1:-1);n?i--:++i<o;)if(e(t[i],i,t))return i;return-1}},2552:(t,e,r)=>{var n=r(1873),o=r(659),i=r(9350),a=n?n.toStringTag:void 0;t.exports=function(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":a&&a in Object(t)?o(t):i(t)}},2651:(t,e,r)=>{var n=r(4218);t.exports=function(t,e){var r=t.__data__;return n(e)?r["string"==typeof e?"string":"hash"]:r.map}},2694:(t,e,r)=>{"use strict";var n=r(6925);function o(){}function i(){}i.resetWarningCache=o,t.exports=function(){function t(t,e,r,o,i,a){if(a!==n){var c=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw c.name="Invariant Violation",c}}function e(){return t}t.isRequired=t;var r={array:t,bigint:t,bool:t,func:t,number:t,object:t,string:t,symbol:t,any:t,arrayOf:e,element:t,elementType:t,instanceOf:e,node:t,objectOf:e,oneOf:e,oneOfType:e,shape:e,exact:e,checkPropTypes:i,resetWarningCache:o};return r.PropTypes=r,r}},2749:(t,e,r)=>{var n=r(1042),o=Object.prototype.hasOwnProperty;t.exports=function(t){var e=this.__data__;return n?void 0!==e[t]:o.call(e,t)}},2799:(t,e)=>{"use strict";var r=Symbol.for("react.element"),n=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),i=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),c=Symbol.for("react.provider"),u=Symbol.for("react.context"),l=Symbol.for("react.server_context"),s=Symbol.for("react.forward_ref"),f=Symbol.for("react.suspense"),p=Symbol.for("react.suspense_list"),h=Symbol.for("react.memo"),d=Symbol.for("react.lazy");Symbol.for("react.offscreen");Symbol.for("react.module.reference"),e.isFragment=function(t){return function(t){if("object"==typeof t&&null!==t){var e=t.$$typeof;switch(e){case r:switch(t=t.type){case o:case a:case i:case f:case p:return t;default:switch(t=t&&t.$$typeof){case l:case u:case s:case d:case h:case c:return t;default:return e}}case n:return e}}}(t)===o}},2804:(t,e,r)=>{var n=r(6110)(r(9325),"Promise");t.exports=n},2865:(t,e,r)=>{var n=r(9570),o=r(1811)(n);t.exports=o},2949:(t,e,r)=>{var n=r(2651);t.exports=function(t,e){var r=n(this,t),o=r.size;return r.set(t,e),this.size+=r.size==o?0:1,this}},3031:(t,e,r)=>{var n=r(3120),o=r(6155),i=r(9302),a=r(6800),c=i((function(t,e){if(null==t)return[];var r=e.length;return r>1&&a(t,e[0],e[1])?e=[]:r>2&&a(e[0],e[1],e[2])&&(e=[e[0]]),o(t,n(e,1),[])}));t.exports=c},3040:(t,e,r)=>{var n=r(1549),o=r(79),i=r(8223);t.exports=function(){this.size=0,this.__data__={hash:new n,map:new(i||o),string:new n}}},3120:(t,e,r)=>{var n=r(4528),o=r(5891);t.exports=function t(e,r,i,a,c){var u=-1,l=e.length;for(i||(i=o),c||(c=[]);++u<l;){var s=e[u];r>0&&i(s)?r>1?t(s,r-1,i,a,c):n(c,s):a||(c[c.length]=s)}return c}},3181:(t,e,r)=>{var n=r(5508)();t.exports=n},3221:t=>{t.exports=function(t){return function(e,r,n){for(var o=-1,i=Object(e),a=n(e),c=a.length;c--;){var u=a[t?c:++o];if(!1===r(i[u],u,i))break}return e}}},3222:(t,e,r)=>{var n=r(7556);t.exports=function(t){return null==t?"":n(t)}},3243:(t,e,r)=>{var n=r(6110),o=function(){try{var t=n(Object,"defineProperty");return t({},"",{}),t}catch(t){}}();t.exports=o},3335:t=>{t.exports=function(t,e){return t>e}},3345:t=>{t.exports=function(){return[]}},3360:(t,e,r)=>{var n=r(3243);t.exports=function(t,e,r){"__proto__"==e&&n?n(t,e,{configurable:!0,enumerable:!0,value:r,writable:!0}):t[e]=r}},3488:t=>{t.exports=function(t){return t}},3599:(t,e,r)=>{var n=r(4394);t.exports=function(t,e,r){for(var o=-1,i=t.length;++o<i;){var a=t[o],c=e(a);if(null!=c&&(void 0===u?c==c&&!n(c):r(c,u)))var u=c,l=a}return l}},3605:t=>{t.exports=function(t){return this.__data__.get(t)}},3650:(t,e,r)=>{var n=r(4335)(Object.keys,Object);t.exports=n},3656:(t,e,r)=>{t=r.nmd(t);var n=r(9325),o=r(9935),i=e&&!e.nodeType&&e,a=i&&t&&!t.nodeType&&t,c=a&&a.exports===i?n.Buffer:void 0,u=(c?c.isBuffer:void 0)||o;t.exports=u},3661:(t,e,r)=>{var n=r(3040),o=r(7670),i=r(289),a=r(4509),c=r(2949);function u(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}u.prototype.clear=n,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=c,t.exports=u},3663:(t,e,r)=>{var n=r(1799),o=r(776),i=r(7197);t.exports=function(t){var e=o(t);return 1==e.length&&e[0][2]?i(e[0][0],e[0][1]):function(r){return r===t||n(r,t,e)}}},3702:t=>{t.exports=function(){this.__data__=[],this.size=0}},3714:(t,e,r)=>{var n=r(3730);t.exports=function(t,e,r){for(var o=-1,i=t.criteria,a=e.criteria,c=i.length,u=r.length;++o<c;){var l=n(i[o],a[o]);if(l)return o>=u?l:l*("desc"==r[o]?-1:1)}return t.index-e.index}},3730:(t,e,r)=>{var n=r(4394);t.exports=function(t,e){if(t!==e){var r=void 0!==t,o=null===t,i=t==t,a=n(t),c=void 0!==e,u=null===e,l=e==e,s=n(e);if(!u&&!s&&!a&&t>e||a&&c&&l&&!u&&!s||o&&c&&l||!r&&l||!i)return 1;if(!o&&!a&&!s&&t<e||s&&r&&i&&!o&&!a||u&&r&&i||!c&&i||!l)return-1}return 0}},3777:(t,e,r)=>{var n=r(909);t.exports=function(t,e){var r=!0;return n(t,(function(t,n,o){return r=!!e(t,n,o)})),r}},3805:t=>{t.exports=function(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}},3812:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return!0===t||!1===t||o(t)&&"[object Boolean]"==n(t)}},3862:t=>{t.exports=function(t){var e=this.has(t)&&delete this.__data__[t];return this.size-=e?1:0,e}},3912:(t,e,r)=>{var n=r(1074),o=r(9698),i=r(2054);t.exports=function(t){return o(t)?i(t):n(t)}},3916:(t,e,r)=>{var n=r(3360),o=r(641),i=r(5389);t.exports=function(t,e){var r={};return e=i(e,3),o(t,(function(t,o,i){n(r,o,e(t,o,i))})),r}},3937:t=>{t.exports=function(t,e){var r=t.length;for(t.sort(e);r--;)t[r]=t[r].value;return t}},3950:t=>{t.exports=function(){}},4128:(t,e,r)=>{var n=r(1800),o=/^\s+/;t.exports=function(t){return t?t.slice(0,n(t)+1).replace(o,""):t}},4218:t=>{t.exports=function(t){var e=typeof t;return"string"==e||"number"==e||"symbol"==e||"boolean"==e?"__proto__"!==t:null===t}},4247:t=>{t.exports=function(t){var e=-1,r=Array(t.size);return t.forEach((function(t){r[++e]=t})),r}},4248:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length;++r<n;)if(e(t[r],r,t))return!0;return!1}},4335:t=>{t.exports=function(t,e){return function(r){return t(e(r))}}},4363:(t,e,r)=>{"use strict";t.exports=r(2799)},4394:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return"symbol"==typeof t||o(t)&&"[object Symbol]"==n(t)}},4506:(t,e,r)=>{var n=r(3599),o=r(3335),i=r(3488);t.exports=function(t){return t&&t.length?n(t,i,o):void 0}},4509:(t,e,r)=>{var n=r(2651);t.exports=function(t){return n(this,t).has(t)}},4517:(t,e,r)=>{var n=r(6545),o=r(3950),i=r(4247),a=n&&1/i(new n([,-0]))[1]==1/0?function(t){return new n(t)}:o;t.exports=a},4528:t=>{t.exports=function(t,e){for(var r=-1,n=e.length,o=t.length;++r<n;)t[o+r]=e[r];return t}},4664:(t,e,r)=>{var n=r(9770),o=r(3345),i=Object.prototype.propertyIsEnumerable,a=Object.getOwnPropertySymbols,c=a?function(t){return null==t?[]:(t=Object(t),n(a(t),(function(e){return i.call(t,e)})))}:o;t.exports=c},4713:(t,e,r)=>{var n=r(2523),o=r(5389),i=r(1489),a=Math.max;t.exports=function(t,e,r){var c=null==t?0:t.length;if(!c)return-1;var u=null==r?0:i(r);return u<0&&(u=a(c+u,0)),n(t,o(e,3),u)}},4739:(t,e,r)=>{var n=r(6025);t.exports=function(t){var e=this.__data__,r=n(e,t);return r<0?void 0:e[r][1]}},4840:(t,e,r)=>{var n="object"==typeof r.g&&r.g&&r.g.Object===Object&&r.g;t.exports=n},4894:(t,e,r)=>{var n=r(1882),o=r(294);t.exports=function(t){return null!=t&&o(t.length)&&!n(t)}},4901:(t,e,r)=>{var n=r(2552),o=r(294),i=r(346),a={};a["[object Float32Array]"]=a["[object Float64Array]"]=a["[object Int8Array]"]=a["[object Int16Array]"]=a["[object Int32Array]"]=a["[object Uint8Array]"]=a["[object Uint8ClampedArray]"]=a["[object Uint16Array]"]=a["[object Uint32Array]"]=!0,a["[object Arguments]"]=a["[object Array]"]=a["[object ArrayBuffer]"]=a["[object Boolean]"]=a["[object DataView]"]=a["[object Date]"]=a["[object Error]"]=a["[object Function]"]=a["[object Map]"]=a["[object Number]"]=a["[object Object]"]=a["[object RegExp]"]=a["[object Set]"]=a["[object String]"]=a["[object WeakMap]"]=!1,t.exports=function(t){return i(t)&&o(t.length)&&!!a[n(t)]}},4932:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length,o=Array(n);++r<n;)o[r]=e(t[r],r,t);return o}},5015:(t,e,r)=>{var n=r(2552),o=r(6449),i=r(346);t.exports=function(t){return"string"==typeof t||!o(t)&&i(t)&&"[object String]"==n(t)}},5083:(t,e,r)=>{var n=r(1882),o=r(7296),i=r(3805),a=r(7473),c=/^\[object .+?Constructor\]$/,u=Function.prototype,l=Object.prototype,s=u.toString,f=l.hasOwnProperty,p=RegExp("^"+s.call(f).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");t.exports=function(t){return!(!i(t)||o(t))&&(n(t)?p:c).test(a(t))}},5128:(t,e,r)=>{var n=r(909),o=r(4894);t.exports=function(t,e){var r=-1,i=o(t)?Array(t.length):[];return n(t,(function(t,n,o){i[++r]=e(t,n,o)})),i}},5160:t=>{t.exports=function(t,e,r){var n=-1,o=t.length;e<0&&(e=-e>o?0:o+e),(r=r>o?o:r)<0&&(r+=o),o=e>r?0:r-e>>>0,e>>>=0;for(var i=Array(o);++n<o;)i[n]=t[n+e];return i}},5288:t=>{t.exports=function(t,e){return t===e||t!=t&&e!=e}},5325:(t,e,r)=>{var n=r(6131);t.exports=function(t,e){return!(null==t||!t.length)&&n(t,e,0)>-1}},5378:(t,e,r)=>{var n=r(4932),o=r(5389),i=r(5128),a=r(6449);t.exports=function(t,e){return(a(t)?n:i)(t,o(e,3))}},5389:(t,e,r)=>{var n=r(3663),o=r(7978),i=r(3488),a=r(6449),c=r(583);t.exports=function(t){return"function"==typeof t?t:null==t?i:"object"==typeof t?a(t)?o(t[0],t[1]):n(t):c(t)}},5463:t=>{t.exports=function(t){return t!=t}},5481:(t,e,r)=>{var n=r(9325)["__core-js_shared__"];t.exports=n},5508:(t,e,r)=>{var n=r(6151),o=r(6800),i=r(7400);t.exports=function(t){return function(e,r,a){return a&&"number"!=typeof a&&o(e,r,a)&&(r=a=void 0),e=i(e),void 0===r?(r=e,e=0):r=i(r),a=void 0===a?e<r?1:-1:i(a),n(e,r,a,t)}}},5527:t=>{var e=Object.prototype;t.exports=function(t){var r=t&&t.constructor;return t===("function"==typeof r&&r.prototype||e)}},5556:(t,e,r)=>{t.exports=r(2694)()},5580:(t,e,r)=>{var n=r(6110)(r(9325),"DataView");t.exports=n},5749:(t,e,r)=>{var n=r(1042);t.exports=function(t,e){var r=this.__data__;return this.size+=this.has(t)?0:1,r[t]=n&&void 0===e?"__lodash_hash_undefined__":e,this}},5765:(t,e,r)=>{var n=r(8859),o=r(5325),i=r(9905),a=r(9219),c=r(4517),u=r(4247);t.exports=function(t,e,r){var l=-1,s=o,f=t.length,p=!0,h=[],d=h;if(r)p=!1,s=i;else if(f>=200){var y=e?null:c(t);if(y)return u(y);p=!1,s=a,d=new n}else d=e?[]:h;t:for(;++l<f;){var v=t[l],m=e?e(v):v;if(v=r||0!==v?v:0,p&&m==m){for(var b=d.length;b--;)if(d[b]===m)continue t;e&&d.push(m),h.push(v)}else s(d,m,r)||(d!==h&&d.push(m),h.push(v))}return h}},5808:(t,e,r)=>{var n=r(2507)("toUpperCase");t.exports=n},5861:(t,e,r)=>{var n=r(5580),o=r(8223),i=r(2804),a=r(6545),c=r(8303),u=r(2552),l=r(7473),s="[object Map]",f="[object Promise]",p="[object Set]",h="[object WeakMap]",d="[object DataView]",y=l(n),v=l(o),m=l(i),b=l(a),g=l(c),x=u;(n&&x(new n(new ArrayBuffer(1)))!=d||o&&x(new o)!=s||i&&x(i.resolve())!=f||a&&x(new a)!=p||c&&x(new c)!=h)&&(x=function(t){var e=u(t),r="[object Object]"==e?t.constructor:void 0,n=r?l(r):"";if(n)switch(n){case y:return d;case v:return s;case m:return f;case b:return p;case g:return h}return e}),t.exports=x},5891:(t,e,r)=>{var n=r(1873),o=r(2428),i=r(6449),a=n?n.isConcatSpreadable:void 0;t.exports=function(t){return i(t)||o(t)||!!(a&&t&&t[a])}},5911:(t,e,r)=>{var n=r(8859),o=r(4248),i=r(9219);t.exports=function(t,e,r,a,c,u){var l=1&r,s=t.length,f=e.length;if(s!=f&&!(l&&f>s))return!1;var p=u.get(t),h=u.get(e);if(p&&h)return p==e&&h==t;var d=-1,y=!0,v=2&r?new n:void 0;for(u.set(t,e),u.set(e,t);++d<s;){var m=t[d],b=e[d];if(a)var g=l?a(b,m,d,e,t,u):a(m,b,d,t,e,u);if(void 0!==g){if(g)continue;y=!1;break}if(v){if(!o(e,(function(t,e){if(!i(v,e)&&(m===t||c(m,t,r,a,u)))return v.push(e)}))){y=!1;break}}else if(m!==b&&!c(m,b,r,a,u)){y=!1;break}}return u.delete(t),u.delete(e),y}},5950:(t,e,r)=>{var n=r(695),o=r(8984),i=r(4894);t.exports=function(t){return i(t)?n(t):o(t)}},6009:(t,e,r)=>{t=r.nmd(t);var n=r(4840),o=e&&!e.nodeType&&e,i=o&&t&&!t.nodeType&&t,a=i&&i.exports===o&&n.process,c=function(){try{return i&&i.require&&i.require("util").types||a&&a.binding&&a.binding("util")}catch(t){}}();t.exports=c},6025:(t,e,r)=>{var n=r(5288);t.exports=function(t,e){for(var r=t.length;r--;)if(n(t[r][0],e))return r;return-1}},6110:(t,e,r)=>{var n=r(5083),o=r(392);t.exports=function(t,e){var r=o(t,e);return n(r)?r:void 0}},6131:(t,e,r)=>{var n=r(2523),o=r(5463),i=r(6959);t.exports=function(t,e,r){return e==e?i(t,e,r):n(t,o,r)}},6151:t=>{var e=Math.ceil,r=Math.max;t.exports=function(t,n,o,i){for(var a=-1,c=r(e((n-t)/(o||1)),0),u=Array(c);c--;)u[i?c:++a]=t,t+=o;return u}},6155:(t,e,r)=>{var n=r(4932),o=r(7422),i=r(5389),a=r(5128),c=r(3937),u=r(7301),l=r(3714),s=r(3488),f=r(6449);t.exports=function(t,e,r){e=e.length?n(e,(function(t){return f(t)?function(e){return o(e,1===t.length?t[0]:t)}:t})):[s];var p=-1;e=n(e,u(i));var h=a(t,(function(t,r,o){return{criteria:n(e,(function(e){return e(t)})),index:++p,value:t}}));return c(h,(function(t,e){return l(t,e,r)}))}},6176:t=>{t.exports=function(t,e){return t<e}},6449:t=>{var e=Array.isArray;t.exports=e},6545:(t,e,r)=>{var n=r(6110)(r(9325),"Set");t.exports=n},6649:(t,e,r)=>{var n=r(3221)();t.exports=n},6721:(t,e,r)=>{var n=r(1042),o=Object.prototype.hasOwnProperty;t.exports=function(t){var e=this.__data__;if(n){var r=e[t];return"__lodash_hash_undefined__"===r?void 0:r}return o.call(e,t)?e[t]:void 0}},6757:(t,e,r)=>{var n=r(1033),o=Math.max;t.exports=function(t,e,r){return e=o(void 0===e?t.length-1:e,0),function(){for(var i=arguments,a=-1,c=o(i.length-e,0),u=Array(c);++a<c;)u[a]=i[e+a];a=-1;for(var l=Array(e+1);++a<e;)l[a]=i[a];return l[e]=r(u),n(t,this,l)}}},6800:(t,e,r)=>{var n=r(5288),o=r(4894),i=r(361),a=r(3805);t.exports=function(t,e,r){if(!a(r))return!1;var c=typeof e;return!!("number"==c?o(r)&&i(e,r.length):"string"==c&&e in r)&&n(r[e],t)}},6925:t=>{"use strict";t.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},6959:t=>{t.exports=function(t,e,r){for(var n=r-1,o=t.length;++n<o;)if(t[n]===e)return n;return-1}},7068:(t,e,r)=>{var n=r(7217),o=r(5911),i=r(1986),a=r(689),c=r(5861),u=r(6449),l=r(3656),s=r(7167),f="[object Arguments]",p="[object Array]",h="[object Object]",d=Object.prototype.hasOwnProperty;t.exports=function(t,e,r,y,v,m){var b=u(t),g=u(e),x=b?p:c(t),w=g?p:c(e),O=(x=x==f?h:x)==h,j=(w=w==f?h:w)==h,S=x==w;if(S&&l(t)){if(!l(e))return!1;b=!0,O=!1}if(S&&!O)return m||(m=new n),b||s(t)?o(t,e,r,y,v,m):i(t,e,x,r,y,v,m);if(!(1&r)){var P=O&&d.call(t,"__wrapped__"),E=j&&d.call(e,"__wrapped__");if(P||E){var A=P?t.value():t,k=E?e.value():e;return m||(m=new n),v(A,k,r,y,m)}}return!!S&&(m||(m=new n),a(t,e,r,y,v,m))}},7167:(t,e,r)=>{var n=r(4901),o=r(7301),i=r(6009),a=i&&i.isTypedArray,c=a?o(a):n;t.exports=c},7197:t=>{t.exports=function(t,e){return function(r){return null!=r&&r[t]===e&&(void 0!==e||t in Object(r))}}},7217:(t,e,r)=>{var n=r(79),o=r(1420),i=r(938),a=r(3605),c=r(9817),u=r(945);function l(t){var e=this.__data__=new n(t);this.size=e.size}l.prototype.clear=o,l.prototype.delete=i,l.prototype.get=a,l.prototype.has=c,l.prototype.set=u,t.exports=l},7237:t=>{t.exports=function(t){return function(e){return null==e?void 0:e[t]}}},7255:(t,e,r)=>{var n=r(7422);t.exports=function(t){return function(e){return n(e,t)}}},7277:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length;++r<n;)if(!e(t[r],r,t))return!1;return!0}},7296:(t,e,r)=>{var n,o=r(5481),i=(n=/[^.]+$/.exec(o&&o.keys&&o.keys.IE_PROTO||""))?"Symbol(src)_1."+n:"";t.exports=function(t){return!!i&&i in t}},7301:t=>{t.exports=function(t){return function(e){return t(e)}}},7307:(t,e,r)=>{var n=r(3120),o=r(5378);t.exports=function(t,e){return n(o(t,e),1)}},7309:(t,e,r)=>{var n=r(2006)(r(4713));t.exports=n},7334:t=>{t.exports=function(t){return function(){return t}}},7350:(t,e,r)=>{var n=r(8221),o=r(3805);t.exports=function(t,e,r){var i=!0,a=!0;if("function"!=typeof t)throw new TypeError("Expected a function");return o(r)&&(i="leading"in r?!!r.leading:i,a="trailing"in r?!!r.trailing:a),n(t,e,{leading:i,maxWait:e,trailing:a})}},7400:(t,e,r)=>{var n=r(9374),o=1/0;t.exports=function(t){return t?(t=n(t))===o||t===-1/0?17976931348623157e292*(t<0?-1:1):t==t?t:0:0===t?t:0}},7422:(t,e,r)=>{var n=r(1769),o=r(7797);t.exports=function(t,e){for(var r=0,i=(e=n(e,t)).length;null!=t&&r<i;)t=t[o(e[r++])];return r&&r==i?t:void 0}},7473:t=>{var e=Function.prototype.toString;t.exports=function(t){if(null!=t){try{return e.call(t)}catch(t){}try{return t+""}catch(t){}}return""}},7534:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return o(t)&&"[object Arguments]"==n(t)}},7556:(t,e,r)=>{var n=r(1873),o=r(4932),i=r(6449),a=r(4394),c=n?n.prototype:void 0,u=c?c.toString:void 0;t.exports=function t(e){if("string"==typeof e)return e;if(i(e))return o(e,t)+"";if(a(e))return u?u.call(e):"";var r=e+"";return"0"==r&&1/e==-1/0?"-0":r}},7670:(t,e,r)=>{var n=r(2651);t.exports=function(t){var e=n(this,t).delete(t);return this.size-=e?1:0,e}},7797:(t,e,r)=>{var n=r(4394);t.exports=function(t){if("string"==typeof t||n(t))return t;var e=t+"";return"0"==e&&1/t==-1/0?"-0":e}},7828:(t,e,r)=>{var n=r(9325).Uint8Array;t.exports=n},7978:(t,e,r)=>{var n=r(270),o=r(8156),i=r(631),a=r(8586),c=r(756),u=r(7197),l=r(7797);t.exports=function(t,e){return a(t)&&c(e)?u(l(t),e):function(r){var a=o(r,t);return void 0===a&&a===e?i(r,t):n(e,a,3)}}},8023:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return"number"==typeof t||o(t)&&"[object Number]"==n(t)}},8077:t=>{t.exports=function(t,e){return null!=t&&e in Object(t)}},8090:t=>{t.exports=function(t){var e=null==t?0:t.length;return e?t[e-1]:void 0}},8096:t=>{t.exports=function(t,e){for(var r=-1,n=Array(t);++r<t;)n[r]=e(r);return n}},8156:(t,e,r)=>{var n=r(7422);t.exports=function(t,e,r){var o=null==t?void 0:n(t,e);return void 0===o?r:o}},8221:(t,e,r)=>{var n=r(3805),o=r(124),i=r(9374),a=Math.max,c=Math.min;t.exports=function(t,e,r){var u,l,s,f,p,h,d=0,y=!1,v=!1,m=!0;if("function"!=typeof t)throw new TypeError("Expected a function");function b(e){var r=u,n=l;return u=l=void 0,d=e,f=t.apply(n,r)}function g(t){var r=t-h;return void 0===h||r>=e||r<0||v&&t-d>=s}function x(){var t=o();if(g(t))return w(t);p=setTimeout(x,function(t){var r=e-(t-h);return v?c(r,s-(t-d)):r}(t))}function w(t){return p=void 0,m&&u?b(t):(u=l=void 0,f)}function O(){var t=o(),r=g(t);if(u=arguments,l=this,h=t,r){if(void 0===p)return function(t){return d=t,p=setTimeout(x,e),y?b(t):f}(h);if(v)return clearTimeout(p),p=setTimeout(x,e),b(h)}return void 0===p&&(p=setTimeout(x,e)),f}return e=i(e)||0,n(r)&&(y=!!r.leading,s=(v="maxWait"in r)?a(i(r.maxWait)||0,e):s,m="trailing"in r?!!r.trailing:m),O.cancel=function(){void 0!==p&&clearTimeout(p),d=0,u=h=l=p=void 0},O.flush=function(){return void 0===p?f:w(o())},O}},8223:(t,e,r)=>{var n=r(6110)(r(9325),"Map");t.exports=n},8303:(t,e,r)=>{var n=r(6110)(r(9325),"WeakMap");t.exports=n},8329:(t,e,r)=>{var n=r(4894);t.exports=function(t,e){return function(r,o){if(null==r)return r;if(!n(r))return t(r,o);for(var i=r.length,a=e?i:-1,c=Object(r);(e?a--:++a<i)&&!1!==o(c[a],a,c););return r}}},8351:function(t,e,r){var n;!function(){"use strict";var o,i=1e9,a={precision:20,rounding:4,toExpNeg:-7,toExpPos:21,LN10:"2.302585092994045684017991454684364207601101488628772976033327900967572609677352480235997205089598298341967784042286"},c=!0,u="[DecimalError] ",l=u+"Invalid argument: ",s=u+"Exponent out of range: ",f=Math.floor,p=Math.pow,h=/^(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i,d=1e7,y=f(1286742750677284.5),v={};function m(t,e){var r,n,o,i,a,u,l,s,f=t.constructor,p=f.precision;if(!t.s||!e.s)return e.s||(e=new f(t)),c?A(e,p):e;if(l=t.d,s=e.d,a=t.e,o=e.e,l=l.slice(),i=a-o){for(i<0?(n=l,i=-i,u=s.length):(n=s,o=a,u=l.length),i>(u=(a=Math.ceil(p/7))>u?a+1:u+1)&&(i=u,n.length=1),n.reverse();i--;)n.push(0);n.reverse()}for((u=l.length)-(i=s.length)<0&&(i=u,n=s,s=l,l=n),r=0;i;)r=(l[--i]=l[i]+s[i]+r)/d|0,l[i]%=d;for(r&&(l.unshift(r),++o),u=l.length;0==l[--u];)l.pop();return e.d=l,e.e=o,c?A(e,p):e}function b(t,e,r){if(t!==~~t||t<e||t>r)throw Error(l+t)}function g(t){var e,r,n,o=t.length-1,i="",a=t[0];if(o>0){for(i+=a,e=1;e<o;e++)(r=7-(n=t[e]+"").length)&&(i+=S(r)),i+=n;(r=7-(n=(a=t[e])+"").length)&&(i+=S(r))}else if(0===a)return"0";for(;a%10==0;)a/=10;return i+a}v.absoluteValue=v.abs=function(){var t=new this.constructor(this);return t.s&&(t.s=1),t},v.comparedTo=v.cmp=function(t){var e,r,n,o,i=this;if(t=new i.constructor(t),i.s!==t.s)return i.s||-t.s;if(i.e!==t.e)return i.e>t.e^i.s<0?1:-1;for(e=0,r=(n=i.d.length)<(o=t.d.length)?n:o;e<r;++e)if(i.d[e]!==t.d[e])return i.d[e]>t.d[e]^i.s<0?1:-1;return n===o?0:n>o^i.s<0?1:-1},v.decimalPlaces=v.dp=function(){var t=this,e=t.d.length-1,r=7*(e-t.e);if(e=t.d[e])for(;e%10==0;e/=10)r--;return r<0?0:r},v.dividedBy=v.div=function(t){return x(this,new this.constructor(t))},v.dividedToIntegerBy=v.idiv=function(t){var e=this.constructor;return A(x(this,new e(t),0,1),e.precision)},v.equals=v.eq=function(t){return!this.cmp(t)},v.exponent=function(){return O(this)},v.greaterThan=v.gt=function(t){return this.cmp(t)>0},v.greaterThanOrEqualTo=v.gte=function(t){return this.cmp(t)>=0},v.isInteger=v.isint=function(){return this.e>this.d.length-2},v.isNegative=v.isneg=function(){return this.s<0},v.isPositive=v.ispos=function(){return this.s>0},v.isZero=function(){return 0===this.s},v.lessThan=v.lt=function(t){return this.cmp(t)<0},v.lessThanOrEqualTo=v.lte=function(t){return this.cmp(t)<1},v.logarithm=v.log=function(t){var e,r=this,n=r.constructor,i=n.precision,a=i+5;if(void 0===t)t=new n(10);else if((t=new n(t)).s<1||t.eq(o))throw Error(u+"NaN");if(r.s<1)throw Error(u+(r.s?"NaN":"-Infinity"));return r.eq(o)?new n(0):(c=!1,e=x(P(r,a),P(t,a),a),c=!0,A(e,i))},v.minus=v.sub=function(t){var e=this;return t=new e.constructor(t),e.s==t.s?k(e,t):m(e,(t.s=-t.s,t))},v.modulo=v.mod=function(t){var e,r=this,n=r.constructor,o=n.precision;if(!(t=new n(t)).s)throw Error(u+"NaN");return r.s?(c=!1,e=x(r,t,0,1).times(t),c=!0,r.minus(e)):A(new n(r),o)},v.naturalExponential=v.exp=function(){return w(this)},v.naturalLogarithm=v.ln=function(){return P(this)},v.negated=v.neg=function(){var t=new this.constructor(this);return t.s=-t.s||0,t},v.plus=v.add=function(t){var e=this;return t=new e.constructor(t),e.s==t.s?m(e,t):k(e,(t.s=-t.s,t))},v.precision=v.sd=function(t){var e,r,n,o=this;if(void 0!==t&&t!==!!t&&1!==t&&0!==t)throw Error(l+t);if(e=O(o)+1,r=7*(n=o.d.length-1)+1,n=o.d[n]){for(;n%10==0;n/=10)r--;for(n=o.d[0];n>=10;n/=10)r++}return t&&e>r?e:r},v.squareRoot=v.sqrt=function(){var t,e,r,n,o,i,a,l=this,s=l.constructor;if(l.s<1){if(!l.s)return new s(0);throw Error(u+"NaN")}for(t=O(l),c=!1,0==(o=Math.sqrt(+l))||o==1/0?(((e=g(l.d)).length+t)%2==0&&(e+="0"),o=Math.sqrt(e),t=f((t+1)/2)-(t<0||t%2),n=new s(e=o==1/0?"5e"+t:(e=o.toExponential()).slice(0,e.indexOf("e")+1)+t)):n=new s(o.toString()),o=a=(r=s.precision)+3;;)if(n=(i=n).plus(x(l,i,a+2)).times(.5),g(i.d).slice(0,a)===(e=g(n.d)).slice(0,a)){if(e=e.slice(a-3,a+1),o==a&&"4999"==e){if(A(i,r+1,0),i.times(i).eq(l)){n=i;break}}else if("9999"!=e)break;a+=4}return c=!0,A(n,r)},v.times=v.mul=function(t){var e,r,n,o,i,a,u,l,s,f=this,p=f.constructor,h=f.d,y=(t=new p(t)).d;if(!f.s||!t.s)return new p(0);for(t.s*=f.s,r=f.e+t.e,(l=h.length)<(s=y.length)&&(i=h,h=y,y=i,a=l,l=s,s=a),i=[],n=a=l+s;n--;)i.push(0);for(n=s;--n>=0;){for(e=0,o=l+n;o>n;)u=i[o]+y[n]*h[o-n-1]+e,i[o--]=u%d|0,e=u/d|0;i[o]=(i[o]+e)%d|0}for(;!i[--a];)i.pop();return e?++r:i.shift(),t.d=i,t.e=r,c?A(t,p.precision):t},v.toDecimalPlaces=v.todp=function(t,e){var r=this,n=r.constructor;return r=new n(r),void 0===t?r:(b(t,0,i),void 0===e?e=n.rounding:b(e,0,8),A(r,t+O(r)+1,e))},v.toExponential=function(t,e){var r,n=this,o=n.constructor;return void 0===t?r=_(n,!0):(b(t,0,i),void 0===e?e=o.rounding:b(e,0,8),r=_(n=A(new o(n),t+1,e),!0,t+1)),r},v.toFixed=function(t,e){var r,n,o=this,a=o.constructor;return void 0===t?_(o):(b(t,0,i),void 0===e?e=a.rounding:b(e,0,8),r=_((n=A(new a(o),t+O(o)+1,e)).abs(),!1,t+O(n)+1),o.isneg()&&!o.isZero()?"-"+r:r)},v.toInteger=v.toint=function(){var t=this,e=t.constructor;return A(new e(t),O(t)+1,e.rounding)},v.toNumber=function(){return+this},v.toPower=v.pow=function(t){var e,r,n,i,a,l,s=this,p=s.constructor,h=+(t=new p(t));if(!t.s)return new p(o);if(!(s=new p(s)).s){if(t.s<1)throw Error(u+"Infinity");return s}if(s.eq(o))return s;if(n=p.precision,t.eq(o))return A(s,n);if(l=(e=t.e)>=(r=t.d.length-1),a=s.s,l){if((r=h<0?-h:h)<=9007199254740991){for(i=new p(o),e=Math.ceil(n/7+4),c=!1;r%2&&M((i=i.times(s)).d,e),0!==(r=f(r/2));)M((s=s.times(s)).d,e);return c=!0,t.s<0?new p(o).div(i):A(i,n)}}else if(a<0)throw Error(u+"NaN");return a=a<0&&1&t.d[Math.max(e,r)]?-1:1,s.s=1,c=!1,i=t.times(P(s,n+12)),c=!0,(i=w(i)).s=a,i},v.toPrecision=function(t,e){var r,n,o=this,a=o.constructor;return void 0===t?n=_(o,(r=O(o))<=a.toExpNeg||r>=a.toExpPos):(b(t,1,i),void 0===e?e=a.rounding:b(e,0,8),n=_(o=A(new a(o),t,e),t<=(r=O(o))||r<=a.toExpNeg,t)),n},v.toSignificantDigits=v.tosd=function(t,e){var r=this.constructor;return void 0===t?(t=r.precision,e=r.rounding):(b(t,1,i),void 0===e?e=r.rounding:b(e,0,8)),A(new r(this),t,e)},v.toString=v.valueOf=v.val=v.toJSON=function(){var t=this,e=O(t),r=t.constructor;return _(t,e<=r.toExpNeg||e>=r.toExpPos)};var x=function(){function t(t,e){var r,n=0,o=t.length;for(t=t.slice();o--;)r=t[o]*e+n,t[o]=r%d|0,n=r/d|0;return n&&t.unshift(n),t}function e(t,e,r,n){var o,i;if(r!=n)i=r>n?1:-1;else for(o=i=0;o<r;o++)if(t[o]!=e[o]){i=t[o]>e[o]?1:-1;break}return i}function r(t,e,r){for(var n=0;r--;)t[r]-=n,n=t[r]<e[r]?1:0,t[r]=n*d+t[r]-e[r];for(;!t[0]&&t.length>1;)t.shift()}return function(n,o,i,a){var c,l,s,f,p,h,y,v,m,b,g,x,w,j,S,P,E,k,_=n.constructor,M=n.s==o.s?1:-1,T=n.d,C=o.d;if(!n.s)return new _(n);if(!o.s)throw Error(u+"Division by zero");for(l=n.e-o.e,E=C.length,S=T.length,v=(y=new _(M)).d=[],s=0;C[s]==(T[s]||0);)++s;if(C[s]>(T[s]||0)&&--l,(x=null==i?i=_.precision:a?i+(O(n)-O(o))+1:i)<0)return new _(0);if(x=x/7+2|0,s=0,1==E)for(f=0,C=C[0],x++;(s<S||f)&&x--;s++)w=f*d+(T[s]||0),v[s]=w/C|0,f=w%C|0;else{for((f=d/(C[0]+1)|0)>1&&(C=t(C,f),T=t(T,f),E=C.length,S=T.length),j=E,b=(m=T.slice(0,E)).length;b<E;)m[b++]=0;(k=C.slice()).unshift(0),P=C[0],C[1]>=d/2&&++P;do{f=0,(c=e(C,m,E,b))<0?(g=m[0],E!=b&&(g=g*d+(m[1]||0)),(f=g/P|0)>1?(f>=d&&(f=d-1),1==(c=e(p=t(C,f),m,h=p.length,b=m.length))&&(f--,r(p,E<h?k:C,h))):(0==f&&(c=f=1),p=C.slice()),(h=p.length)<b&&p.unshift(0),r(m,p,b),-1==c&&(c=e(C,m,E,b=m.length))<1&&(f++,r(m,E<b?k:C,b)),b=m.length):0===c&&(f++,m=[0]),v[s++]=f,c&&m[0]?m[b++]=T[j]||0:(m=[T[j]],b=1)}while((j++<S||void 0!==m[0])&&x--)}return v[0]||v.shift(),y.e=l,A(y,a?i+O(y)+1:i)}}();function w(t,e){var r,n,i,a,u,l=0,f=0,h=t.constructor,d=h.precision;if(O(t)>16)throw Error(s+O(t));if(!t.s)return new h(o);for(null==e?(c=!1,u=d):u=e,a=new h(.03125);t.abs().gte(.1);)t=t.times(a),f+=5;for(u+=Math.log(p(2,f))/Math.LN10*2+5|0,r=n=i=new h(o),h.precision=u;;){if(n=A(n.times(t),u),r=r.times(++l),g((a=i.plus(x(n,r,u))).d).slice(0,u)===g(i.d).slice(0,u)){for(;f--;)i=A(i.times(i),u);return h.precision=d,null==e?(c=!0,A(i,d)):i}i=a}}function O(t){for(var e=7*t.e,r=t.d[0];r>=10;r/=10)e++;return e}function j(t,e,r){if(e>t.LN10.sd())throw c=!0,r&&(t.precision=r),Error(u+"LN10 precision limit exceeded");return A(new t(t.LN10),e)}function S(t){for(var e="";t--;)e+="0";return e}function P(t,e){var r,n,i,a,l,s,f,p,h,d=1,y=t,v=y.d,m=y.constructor,b=m.precision;if(y.s<1)throw Error(u+(y.s?"NaN":"-Infinity"));if(y.eq(o))return new m(0);if(null==e?(c=!1,p=b):p=e,y.eq(10))return null==e&&(c=!0),j(m,p);if(p+=10,m.precision=p,n=(r=g(v)).charAt(0),a=O(y),!(Math.abs(a)<15e14))return f=j(m,p+2,b).times(a+""),y=P(new m(n+"."+r.slice(1)),p-10).plus(f),m.precision=b,null==e?(c=!0,A(y,b)):y;for(;n<7&&1!=n||1==n&&r.charAt(1)>3;)n=(r=g((y=y.times(t)).d)).charAt(0),d++;for(a=O(y),n>1?(y=new m("0."+r),a++):y=new m(n+"."+r.slice(1)),s=l=y=x(y.minus(o),y.plus(o),p),h=A(y.times(y),p),i=3;;){if(l=A(l.times(h),p),g((f=s.plus(x(l,new m(i),p))).d).slice(0,p)===g(s.d).slice(0,p))return s=s.times(2),0!==a&&(s=s.plus(j(m,p+2,b).times(a+""))),s=x(s,new m(d),p),m.precision=b,null==e?(c=!0,A(s,b)):s;s=f,i+=2}}function E(t,e){var r,n,o;for((r=e.indexOf("."))>-1&&(e=e.replace(".","")),(n=e.search(/e/i))>0?(r<0&&(r=n),r+=+e.slice(n+1),e=e.substring(0,n)):r<0&&(r=e.length),n=0;48===e.charCodeAt(n);)++n;for(o=e.length;48===e.charCodeAt(o-1);)--o;if(e=e.slice(n,o)){if(o-=n,r=r-n-1,t.e=f(r/7),t.d=[],n=(r+1)%7,r<0&&(n+=7),n<o){for(n&&t.d.push(+e.slice(0,n)),o-=7;n<o;)t.d.push(+e.slice(n,n+=7));n=7-(e=e.slice(n)).length}else n-=o;for(;n--;)e+="0";if(t.d.push(+e),c&&(t.e>y||t.e<-y))throw Error(s+r)}else t.s=0,t.e=0,t.d=[0];return t}function A(t,e,r){var n,o,i,a,u,l,h,v,m=t.d;for(a=1,i=m[0];i>=10;i/=10)a++;if((n=e-a)<0)n+=7,o=e,h=m[v=0];else{if((v=Math.ceil((n+1)/7))>=(i=m.length))return t;for(h=i=m[v],a=1;i>=10;i/=10)a++;o=(n%=7)-7+a}if(void 0!==r&&(u=h/(i=p(10,a-o-1))%10|0,l=e<0||void 0!==m[v+1]||h%i,l=r<4?(u||l)&&(0==r||r==(t.s<0?3:2)):u>5||5==u&&(4==r||l||6==r&&(n>0?o>0?h/p(10,a-o):0:m[v-1])%10&1||r==(t.s<0?8:7))),e<1||!m[0])return l?(i=O(t),m.length=1,e=e-i-1,m[0]=p(10,(7-e%7)%7),t.e=f(-e/7)||0):(m.length=1,m[0]=t.e=t.s=0),t;if(0==n?(m.length=v,i=1,v--):(m.length=v+1,i=p(10,7-n),m[v]=o>0?(h/p(10,a-o)%p(10,o)|0)*i:0),l)for(;;){if(0==v){(m[0]+=i)==d&&(m[0]=1,++t.e);break}if(m[v]+=i,m[v]!=d)break;m[v--]=0,i=1}for(n=m.length;0===m[--n];)m.pop();if(c&&(t.e>y||t.e<-y))throw Error(s+O(t));return t}function k(t,e){var r,n,o,i,a,u,l,s,f,p,h=t.constructor,y=h.precision;if(!t.s||!e.s)return e.s?e.s=-e.s:e=new h(t),c?A(e,y):e;if(l=t.d,p=e.d,n=e.e,s=t.e,l=l.slice(),a=s-n){for((f=a<0)?(r=l,a=-a,u=p.length):(r=p,n=s,u=l.length),a>(o=Math.max(Math.ceil(y/7),u)+2)&&(a=o,r.length=1),r.reverse(),o=a;o--;)r.push(0);r.reverse()}else{for((f=(o=l.length)<(u=p.length))&&(u=o),o=0;o<u;o++)if(l[o]!=p[o]){f=l[o]<p[o];break}a=0}for(f&&(r=l,l=p,p=r,e.s=-e.s),u=l.length,o=p.length-u;o>0;--o)l[u++]=0;for(o=p.length;o>a;){if(l[--o]<p[o]){for(i=o;i&&0===l[--i];)l[i]=d-1;--l[i],l[o]+=d}l[o]-=p[o]}for(;0===l[--u];)l.pop();for(;0===l[0];l.shift())--n;return l[0]?(e.d=l,e.e=n,c?A(e,y):e):new h(0)}function _(t,e,r){var n,o=O(t),i=g(t.d),a=i.length;return e?(r&&(n=r-a)>0?i=i.charAt(0)+"."+i.slice(1)+S(n):a>1&&(i=i.charAt(0)+"."+i.slice(1)),i=i+(o<0?"e":"e+")+o):o<0?(i="0."+S(-o-1)+i,r&&(n=r-a)>0&&(i+=S(n))):o>=a?(i+=S(o+1-a),r&&(n=r-o-1)>0&&(i=i+"."+S(n))):((n=o+1)<a&&(i=i.slice(0,n)+"."+i.slice(n)),r&&(n=r-a)>0&&(o+1===a&&(i+="."),i+=S(n))),t.s<0?"-"+i:i}function M(t,e){if(t.length>e)return t.length=e,!0}function T(t){if(!t||"object"!=typeof t)throw Error(u+"Object expected");var e,r,n,o=["precision",1,i,"rounding",0,8,"toExpNeg",-1/0,0,"toExpPos",0,1/0];for(e=0;e<o.length;e+=3)if(void 0!==(n=t[r=o[e]])){if(!(f(n)===n&&n>=o[e+1]&&n<=o[e+2]))throw Error(l+r+": "+n);this[r]=n}if(void 0!==(n=t[r="LN10"])){if(n!=Math.LN10)throw Error(l+r+": "+n);this[r]=new this(n)}return this}(a=function t(e){var r,n,o;function i(t){var e=this;if(!(e instanceof i))return new i(t);if(e.constructor=i,t instanceof i)return e.s=t.s,e.e=t.e,void(e.d=(t=t.d)?t.slice():t);if("number"==typeof t){if(0*t!=0)throw Error(l+t);if(t>0)e.s=1;else{if(!(t<0))return e.s=0,e.e=0,void(e.d=[0]);t=-t,e.s=-1}return t===~~t&&t<1e7?(e.e=0,void(e.d=[t])):E(e,t.toString())}if("string"!=typeof t)throw Error(l+t);if(45===t.charCodeAt(0)?(t=t.slice(1),e.s=-1):e.s=1,!h.test(t))throw Error(l+t);E(e,t)}if(i.prototype=v,i.ROUND_UP=0,i.ROUND_DOWN=1,i.ROUND_CEIL=2,i.ROUND_FLOOR=3,i.ROUND_HALF_UP=4,i.ROUND_HALF_DOWN=5,i.ROUND_HALF_EVEN=6,i.ROUND_HALF_CEIL=7,i.ROUND_HALF_FLOOR=8,i.clone=t,i.config=i.set=T,void 0===e&&(e={}),e)for(o=["precision","rounding","toExpNeg","toExpPos","LN10"],r=0;r<o.length;)e.hasOwnProperty(n=o[r++])||(e[n]=this[n]);return i.config(e),i}(a)).default=a.Decimal=a,o=new a(1),void 0===(n=function(){return a}.call(e,r,e,t))||(t.exports=n)}()},8586:(t,e,r)=>{var n=r(6449),o=r(4394),i=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,a=/^\w*$/;t.exports=function(t,e){if(n(t))return!1;var r=typeof t;return!("number"!=r&&"symbol"!=r&&"boolean"!=r&&null!=t&&!o(t))||a.test(t)||!i.test(t)||null!=e&&t in Object(e)}},8655:(t,e,r)=>{var n=r(6025);t.exports=function(t){return n(this.__data__,t)>-1}},8754:(t,e,r)=>{var n=r(5160);t.exports=function(t,e,r){var o=t.length;return r=void 0===r?o:r,!e&&r>=o?t:n(t,e,r)}},8859:(t,e,r)=>{var n=r(3661),o=r(1380),i=r(1459);function a(t){var e=-1,r=null==t?0:t.length;for(this.__data__=new n;++e<r;)this.add(t[e])}a.prototype.add=a.prototype.push=o,a.prototype.has=i,t.exports=a},8879:(t,e,r)=>{var n=r(4335)(Object.getPrototypeOf,Object);t.exports=n},8984:(t,e,r)=>{var n=r(5527),o=r(3650),i=Object.prototype.hasOwnProperty;t.exports=function(t){if(!n(t))return o(t);var e=[];for(var r in Object(t))i.call(t,r)&&"constructor"!=r&&e.push(r);return e}},9219:t=>{t.exports=function(t,e){return t.has(e)}},9302:(t,e,r)=>{var n=r(3488),o=r(6757),i=r(2865);t.exports=function(t,e){return i(o(t,e,n),t+"")}},9325:(t,e,r)=>{var n=r(4840),o="object"==typeof self&&self&&self.Object===Object&&self,i=n||o||Function("return this")();t.exports=i},9326:(t,e,r)=>{var n=r(1769),o=r(2428),i=r(6449),a=r(361),c=r(294),u=r(7797);t.exports=function(t,e,r){for(var l=-1,s=(e=n(e,t)).length,f=!1;++l<s;){var p=u(e[l]);if(!(f=null!=t&&r(t,p)))break;t=t[p]}return f||++l!=s?f:!!(s=null==t?0:t.length)&&c(s)&&a(p,s)&&(i(t)||o(t))}},9350:t=>{var e=Object.prototype.toString;t.exports=function(t){return e.call(t)}},9374:(t,e,r)=>{var n=r(4128),o=r(3805),i=r(4394),a=/^[-+]0x[0-9a-f]+$/i,c=/^0b[01]+$/i,u=/^0o[0-7]+$/i,l=parseInt;t.exports=function(t){if("number"==typeof t)return t;if(i(t))return NaN;if(o(t)){var e="function"==typeof t.valueOf?t.valueOf():t;t=o(e)?e+"":e}if("string"!=typeof t)return 0===t?t:+t;t=n(t);var r=c.test(t);return r||u.test(t)?l(t.slice(2),r?2:8):a.test(t)?NaN:+t}},9570:(t,e,r)=>{var n=r(7334),o=r(3243),i=r(3488),a=o?function(t,e){return o(t,"toString",{configurable:!0,enumerable:!1,value:n(e),writable:!0})}:i;t.exports=a},9698:t=>{var e=RegExp("[\\u200d\\ud800-\\udfff\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff\\ufe0e\\ufe0f]");t.exports=function(t){return e.test(t)}},9747:(t,e,r)=>{var n=r(7277),o=r(3777),i=r(5389),a=r(6449),c=r(6800);t.exports=function(t,e,r){var u=a(t)?n:o;return r&&c(t,e,r)&&(e=void 0),u(t,i(e,3))}},9770:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length,o=0,i=[];++r<n;){var a=t[r];e(a,r,t)&&(i[o++]=a)}return i}},9817:t=>{t.exports=function(t){return this.__data__.has(t)}},9843:t=>{t.exports=function(t){return null==t}},9905:t=>{t.exports=function(t,e,r){for(var n=-1,o=null==t?0:t.length;++n<o;)if(r(e,t[n]))return!0;return!1}},9935:t=>{t.exports=function(){return!1}}},e={};function r(n){var o=e[n];if(void 0!==o)return o.exports;var i=e[n]={id:n,loaded:!1,exports:{}};return t[n].call(i.exports,i,i.exports,r),i.loaded=!0,i.exports}r.n=t=>{var e=t&&t.__esModule?()=>t.default:()=>t;return r.d(e,{a:e}),e},r.d=(t,e)=>{for(var n in e)r.o(e,n)&&!r.o(t,n)&&Object.defineProperty(t,n,{enumerable:!0,get:e[n]})},r.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),r.o=(t,e)=>Object.prototype.hasOwnProperty.call(t,e),r.r=t=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},r.nmd=t=>(t.paths=[],t.children||(t.children=[]),t);var n={};(()=>{"use strict";r.r(n),r.d(n,{default:()=>Im});var t={};r.r(t),r.d(t,{scaleBand:()=>ao,scaleDiverging:()=>Ml,scaleDivergingLog:()=>Tl,scaleDivergingPow:()=>Dl,scaleDivergingSqrt:()=>Il,scaleDivergingSymlog:()=>Cl,scaleIdentity:()=>Aa,scaleImplicit:()=>oo,scaleLinear:()=>Ea,scaleLog:()=>Ba,scaleOrdinal:()=>io,scalePoint:()=>uo,scalePow:()=>Xa,scaleQuantile:()=>ec,scaleQuantize:()=>rc,scaleRadial:()=>Va,scaleSequential:()=>jl,scaleSequentialLog:()=>Sl,scaleSequentialPow:()=>El,scaleSequentialQuantile:()=>kl,scaleSequentialSqrt:()=>Al,scaleSequentialSymlog:()=>Pl,scaleSqrt:()=>Ha,scaleSymlog:()=>Fa,scaleThreshold:()=>nc,scaleTime:()=>gl,scaleUtc:()=>xl,tickFormat:()=>Sa});const e=React;var o=r.n(e);function i(t){var e,r,n="";if("string"==typeof t||"number"==typeof t)n+=t;else if("object"==typeof t)if(Array.isArray(t)){var o=t.length;for(e=0;e<o;e++)t[e]&&(r=i(t[e]))&&(n&&(n+=" "),n+=r)}else for(r in t)t[r]&&(n&&(n+=" "),n+=r);return n}const a=function(){for(var t,e,r=0,n="",o=arguments.length;r<o;r++)(t=arguments[r])&&(e=i(t))&&(n&&(n+=" "),n+=e);return n};var c=r(7350),u=r.n(c),l=r(5015),s=r.n(l),f=r(1741),p=r.n(f),h=r(8156),d=r.n(h),y=r(8023),v=r.n(y),m=function(t){return 0===t?0:t>0?1:-1},b=function(t){return s()(t)&&t.indexOf("%")===t.length-1},g=function(t){return v()(t)&&!p()(t)},x=function(t){return g(t)||s()(t)},w=0,O=function(t){var e=++w;return"".concat(t||"").concat(e)},j=function(t,e){var r,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];if(!g(t)&&!s()(t))return n;if(b(t)){var i=t.indexOf("%");r=e*parseFloat(t.slice(0,i))/100}else r=+t;return p()(r)&&(r=n),o&&r>e&&(r=e),r},S=function(t){if(!t)return null;var e=Object.keys(t);return e&&e.length?t[e[0]]:null},P=function(t,e){return g(t)&&g(e)?function(r){return t+r*(e-t)}:function(){return e}};function E(t,e,r){return t&&t.length?t.find((function(t){return t&&("function"==typeof e?e(t):d()(t,e))===r})):null}var A=function(t,e){return g(t)&&g(e)?t-e:s()(t)&&s()(e)?t.localeCompare(e):t instanceof Date&&e instanceof Date?t.getTime()-e.getTime():String(t).localeCompare(String(e))},k=function(t,e){for(var r=arguments.length,n=new Array(r>2?r-2:0),o=2;o<r;o++)n[o-2]=arguments[o]},_=r(9843),M=r.n(_),T=r(1882),C=r.n(T),D=r(3805),I=r.n(D),N=r(4363);function B(t,e){for(var r in t)if({}.hasOwnProperty.call(t,r)&&(!{}.hasOwnProperty.call(e,r)||t[r]!==e[r]))return!1;for(var n in e)if({}.hasOwnProperty.call(e,n)&&!{}.hasOwnProperty.call(t,n))return!1;return!0}function R(t){return R="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},R(t)}var L=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],z=["points","pathLength"],F={svg:["viewBox","children"],polygon:z,polyline:z},U=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"],$=function(t,r){if(!t||"function"==typeof t||"boolean"==typeof t)return null;var n=t;if((0,e.isValidElement)(t)&&(n=t.props),!I()(n))return null;var o={};return Object.keys(n).forEach((function(t){U.includes(t)&&(o[t]=r||function(e){return n[t](n,e)})})),o},q=function(t,e,r){if(!I()(t)||"object"!==R(t))return null;var n=null;return Object.keys(t).forEach((function(o){var i=t[o];U.includes(o)&&"function"==typeof i&&(n||(n={}),n[o]=function(t,e,r){return function(n){return t(e,r,n),null}}(i,e,r))})),n},W=["children"],X=["children"];function H(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function G(t){return G="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},G(t)}var V={click:"onClick",mousedown:"onMouseDown",mouseup:"onMouseUp",mouseover:"onMouseOver",mousemove:"onMouseMove",mouseout:"onMouseOut",mouseenter:"onMouseEnter",mouseleave:"onMouseLeave",touchcancel:"onTouchCancel",touchend:"onTouchEnd",touchmove:"onTouchMove",touchstart:"onTouchStart",contextmenu:"onContextMenu",dblclick:"onDoubleClick"},Y=function(t){return"string"==typeof t?t:t?t.displayName||t.name||"Component":""},K=null,Z=null,J=function t(r){if(r===K&&Array.isArray(Z))return Z;var n=[];return e.Children.forEach(r,(function(e){M()(e)||((0,N.isFragment)(e)?n=n.concat(t(e.props.children)):n.push(e))})),Z=n,K=r,n};function Q(t,e){var r=[],n=[];return n=Array.isArray(e)?e.map((function(t){return Y(t)})):[Y(e)],J(t).forEach((function(t){var e=d()(t,"type.displayName")||d()(t,"type.name");-1!==n.indexOf(e)&&r.push(t)})),r}function tt(t,e){var r=Q(t,e);return r&&r[0]}var et=function(t){if(!t||!t.props)return!1;var e=t.props,r=e.width,n=e.height;return!(!g(r)||r<=0||!g(n)||n<=0)},rt=["a","altGlyph","altGlyphDef","altGlyphItem","animate","animateColor","animateMotion","animateTransform","circle","clipPath","color-profile","cursor","defs","desc","ellipse","feBlend","feColormatrix","feComponentTransfer","feComposite","feConvolveMatrix","feDiffuseLighting","feDisplacementMap","feDistantLight","feFlood","feFuncA","feFuncB","feFuncG","feFuncR","feGaussianBlur","feImage","feMerge","feMergeNode","feMorphology","feOffset","fePointLight","feSpecularLighting","feSpotLight","feTile","feTurbulence","filter","font","font-face","font-face-format","font-face-name","font-face-url","foreignObject","g","glyph","glyphRef","hkern","image","line","lineGradient","marker","mask","metadata","missing-glyph","mpath","path","pattern","polygon","polyline","radialGradient","rect","script","set","stop","style","svg","switch","symbol","text","textPath","title","tref","tspan","use","view","vkern"],nt=function(t,r,n){if(!t||"function"==typeof t||"boolean"==typeof t)return null;var o=t;if((0,e.isValidElement)(t)&&(o=t.props),!I()(o))return null;var i={};return Object.keys(o).forEach((function(t){var e;(function(t,e,r,n){var o,i=null!==(o=null==F?void 0:F[n])&&void 0!==o?o:[];return e.startsWith("data-")||!C()(t)&&(n&&i.includes(e)||L.includes(e))||r&&U.includes(e)})(null===(e=o)||void 0===e?void 0:e[t],t,r,n)&&(i[t]=o[t])})),i},ot=function t(r,n){if(r===n)return!0;var o=e.Children.count(r);if(o!==e.Children.count(n))return!1;if(0===o)return!0;if(1===o)return it(Array.isArray(r)?r[0]:r,Array.isArray(n)?n[0]:n);for(var i=0;i<o;i++){var a=r[i],c=n[i];if(Array.isArray(a)||Array.isArray(c)){if(!t(a,c))return!1}else if(!it(a,c))return!1}return!0},it=function(t,e){if(M()(t)&&M()(e))return!0;if(!M()(t)&&!M()(e)){var r=t.props||{},n=r.children,o=H(r,W),i=e.props||{},a=i.children,c=H(i,X);return n&&a?B(o,c)&&ot(n,a):!n&&!a&&B(o,c)}return!1},at=function(t,e){var r=[],n={};return J(t).forEach((function(t,o){if(function(t){return t&&t.type&&s()(t.type)&&rt.indexOf(t.type)>=0}(t))r.push(t);else if(t){var i=Y(t.type),a=e[i]||{},c=a.handler,u=a.once;if(c&&(!u||!n[i])){var l=c(t,i,o);r.push(l),n[i]=!0}}})),r};function ct(t){return ct="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ct(t)}function ut(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function lt(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?ut(Object(r),!0).forEach((function(e){st(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):ut(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function st(t,e,r){var n;return n=function(t){if("object"!=ct(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ct(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==ct(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function ft(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var pt=(0,e.forwardRef)((function(t,r){var n=t.aspect,i=t.initialDimension,c=void 0===i?{width:-1,height:-1}:i,l=t.width,s=void 0===l?"100%":l,f=t.height,p=void 0===f?"100%":f,h=t.minWidth,d=void 0===h?0:h,y=t.minHeight,v=t.maxHeight,m=t.children,g=t.debounce,x=void 0===g?0:g,w=t.id,O=t.className,j=t.onResize,S=t.style,P=void 0===S?{}:S,E=(0,e.useRef)(null),A=(0,e.useRef)();A.current=j,(0,e.useImperativeHandle)(r,(function(){return Object.defineProperty(E.current,"current",{get:function(){return console.warn("The usage of ref.current.current is deprecated and will no longer be supported."),E.current},configurable:!0})}));var _,M,T=(_=(0,e.useState)({containerWidth:c.width,containerHeight:c.height}),M=2,function(t){if(Array.isArray(t))return t}(_)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(_,M)||function(t,e){if(t){if("string"==typeof t)return ft(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?ft(t,e):void 0}}(_,M)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),C=T[0],D=T[1],I=(0,e.useCallback)((function(t,e){D((function(r){var n=Math.round(t),o=Math.round(e);return r.containerWidth===n&&r.containerHeight===o?r:{containerWidth:n,containerHeight:o}}))}),[]);(0,e.useEffect)((function(){var t=function(t){var e,r=t[0].contentRect,n=r.width,o=r.height;I(n,o),null===(e=A.current)||void 0===e||e.call(A,n,o)};x>0&&(t=u()(t,x,{trailing:!0,leading:!1}));var e=new ResizeObserver(t),r=E.current.getBoundingClientRect(),n=r.width,o=r.height;return I(n,o),e.observe(E.current),function(){e.disconnect()}}),[I,x]);var N=(0,e.useMemo)((function(){var t=C.containerWidth,r=C.containerHeight;if(t<0||r<0)return null;k(b(s)||b(p),"The width(%s) and height(%s) are both fixed numbers,\n       maybe you don't need to use a ResponsiveContainer.",s,p),k(!n||n>0,"The aspect(%s) must be greater than zero.",n);var i=b(s)?t:s,a=b(p)?r:p;n&&n>0&&(i?a=i/n:a&&(i=a*n),v&&a>v&&(a=v)),k(i>0||a>0,"The width(%s) and height(%s) of chart should be greater than 0,\n       please check the style of container, or the props width(%s) and height(%s),\n       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the\n       height and width.",i,a,s,p,d,y,n);var c=!Array.isArray(m)&&Y(m.type).endsWith("Chart");return o().Children.map(m,(function(t){return o().isValidElement(t)?(0,e.cloneElement)(t,lt({width:i,height:a},c?{style:lt({height:"100%",width:"100%",maxHeight:a,maxWidth:i},t.props.style)}:{})):t}))}),[n,m,p,v,y,d,C,s]);return o().createElement("div",{id:w?"".concat(w):void 0,className:a("recharts-responsive-container",O),style:lt(lt({},P),{},{width:s,height:p,minWidth:d,minHeight:y,maxHeight:v}),ref:E},N)})),ht=r(3181),dt=r.n(ht),yt=r(3031),vt=r.n(yt);function mt(t,e){if(!t)throw new Error("Invariant failed")}var bt=["children","width","height","viewBox","className","style","title","desc"];function gt(){return gt=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},gt.apply(this,arguments)}function xt(t){var e=t.children,r=t.width,n=t.height,i=t.viewBox,c=t.className,u=t.style,l=t.title,s=t.desc,f=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,bt),p=i||{width:r,height:n,x:0,y:0},h=a("recharts-surface",c);return o().createElement("svg",gt({},nt(f,!0,"svg"),{className:h,width:r,height:n,style:u,viewBox:"".concat(p.x," ").concat(p.y," ").concat(p.width," ").concat(p.height)}),o().createElement("title",null,l),o().createElement("desc",null,s),e)}var wt=["children","className"];function Ot(){return Ot=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Ot.apply(this,arguments)}var jt=o().forwardRef((function(t,e){var r=t.children,n=t.className,i=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,wt),c=a("recharts-layer",n);return o().createElement("g",Ot({className:c},nt(i,!0),{ref:e}),r)}));function St(t){return St="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},St(t)}function Pt(){return Pt=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Pt.apply(this,arguments)}function Et(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function At(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function kt(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?At(Object(r),!0).forEach((function(e){_t(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):At(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function _t(t,e,r){var n;return n=function(t){if("object"!=St(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=St(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==St(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Mt(t){return Array.isArray(t)&&x(t[0])&&x(t[1])?t.join(" ~ "):t}var Tt=function(t){var e=t.separator,r=void 0===e?" : ":e,n=t.contentStyle,i=void 0===n?{}:n,c=t.itemStyle,u=void 0===c?{}:c,l=t.labelStyle,s=void 0===l?{}:l,f=t.payload,p=t.formatter,h=t.itemSorter,d=t.wrapperClassName,y=t.labelClassName,v=t.label,m=t.labelFormatter,b=t.accessibilityLayer,g=void 0!==b&&b,w=kt({margin:0,padding:10,backgroundColor:"#fff",border:"1px solid #ccc",whiteSpace:"nowrap"},i),O=kt({margin:0},s),j=!M()(v),S=j?v:"",P=a("recharts-default-tooltip",d),E=a("recharts-tooltip-label",y);j&&m&&null!=f&&(S=m(v,f));var A=g?{role:"status","aria-live":"assertive"}:{};return o().createElement("div",Pt({className:P,style:w},A),o().createElement("p",{className:E,style:O},o().isValidElement(S)?S:"".concat(S)),function(){if(f&&f.length){var t=(h?vt()(f,h):f).map((function(t,e){if("none"===t.type)return null;var n=kt({display:"block",paddingTop:4,paddingBottom:4,color:t.color||"#000"},u),i=t.formatter||p||Mt,a=t.value,c=t.name,l=a,s=c;if(i&&null!=l&&null!=s){var h=i(a,c,t,e,f);if(Array.isArray(h)){var d=function(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return Et(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Et(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(h,2);l=d[0],s=d[1]}else l=h}return o().createElement("li",{className:"recharts-tooltip-item",key:"tooltip-item-".concat(e),style:n},x(s)?o().createElement("span",{className:"recharts-tooltip-item-name"},s):null,x(s)?o().createElement("span",{className:"recharts-tooltip-item-separator"},r):null,o().createElement("span",{className:"recharts-tooltip-item-value"},l),o().createElement("span",{className:"recharts-tooltip-item-unit"},t.unit||""))}));return o().createElement("ul",{className:"recharts-tooltip-item-list",style:{padding:0,margin:0}},t)}return null}())};function Ct(t){return Ct="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ct(t)}function Dt(t,e,r){var n;return n=function(t){if("object"!=Ct(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ct(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ct(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var It="recharts-tooltip-wrapper",Nt={visibility:"hidden"};function Bt(t){var e=t.coordinate,r=t.translateX,n=t.translateY;return a(It,Dt(Dt(Dt(Dt({},"".concat(It,"-right"),g(r)&&e&&g(e.x)&&r>=e.x),"".concat(It,"-left"),g(r)&&e&&g(e.x)&&r<e.x),"".concat(It,"-bottom"),g(n)&&e&&g(e.y)&&n>=e.y),"".concat(It,"-top"),g(n)&&e&&g(e.y)&&n<e.y))}function Rt(t){var e=t.allowEscapeViewBox,r=t.coordinate,n=t.key,o=t.offsetTopLeft,i=t.position,a=t.reverseDirection,c=t.tooltipDimension,u=t.viewBox,l=t.viewBoxDimension;if(i&&g(i[n]))return i[n];var s=r[n]-c-o,f=r[n]+o;return e[n]?a[n]?s:f:a[n]?s<u[n]?Math.max(f,u[n]):Math.max(s,u[n]):f+c>u[n]+l?Math.max(s,u[n]):Math.max(f,u[n])}function Lt(t){return Lt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Lt(t)}function zt(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ft(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?zt(Object(r),!0).forEach((function(e){Xt(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):zt(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Ut(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Ht(n.key),n)}}function $t(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return($t=function(){return!!t})()}function qt(t){return qt=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},qt(t)}function Wt(t,e){return Wt=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Wt(t,e)}function Xt(t,e,r){return(e=Ht(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Ht(t){var e=function(t){if("object"!=Lt(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Lt(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Lt(e)?e:e+""}var Gt=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return Xt((r=this,n=e,o=[].concat(a),n=qt(n),t=function(t,e){if(e&&("object"===Lt(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,$t()?Reflect.construct(n,o||[],qt(r).constructor):n.apply(r,o))),"state",{dismissed:!1,dismissedAtCoordinate:{x:0,y:0},lastBoundingBox:{width:-1,height:-1}}),Xt(t,"handleKeyDown",(function(e){var r,n,o,i;"Escape"===e.key&&t.setState({dismissed:!0,dismissedAtCoordinate:{x:null!==(r=null===(n=t.props.coordinate)||void 0===n?void 0:n.x)&&void 0!==r?r:0,y:null!==(o=null===(i=t.props.coordinate)||void 0===i?void 0:i.y)&&void 0!==o?o:0}})})),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Wt(t,e)}(e,t),r=e,(n=[{key:"updateBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var t=this.wrapperNode.getBoundingClientRect();(Math.abs(t.width-this.state.lastBoundingBox.width)>1||Math.abs(t.height-this.state.lastBoundingBox.height)>1)&&this.setState({lastBoundingBox:{width:t.width,height:t.height}})}else-1===this.state.lastBoundingBox.width&&-1===this.state.lastBoundingBox.height||this.setState({lastBoundingBox:{width:-1,height:-1}})}},{key:"componentDidMount",value:function(){document.addEventListener("keydown",this.handleKeyDown),this.updateBBox()}},{key:"componentWillUnmount",value:function(){document.removeEventListener("keydown",this.handleKeyDown)}},{key:"componentDidUpdate",value:function(){var t,e;this.props.active&&this.updateBBox(),this.state.dismissed&&((null===(t=this.props.coordinate)||void 0===t?void 0:t.x)===this.state.dismissedAtCoordinate.x&&(null===(e=this.props.coordinate)||void 0===e?void 0:e.y)===this.state.dismissedAtCoordinate.y||(this.state.dismissed=!1))}},{key:"render",value:function(){var t=this,e=this.props,r=e.active,n=e.allowEscapeViewBox,i=e.animationDuration,a=e.animationEasing,c=e.children,u=e.coordinate,l=e.hasPayload,s=e.isAnimationActive,f=e.offset,p=e.position,h=e.reverseDirection,d=e.useTranslate3d,y=e.viewBox,v=e.wrapperStyle,m=function(t){var e,r,n=t.allowEscapeViewBox,o=t.coordinate,i=t.offsetTopLeft,a=t.position,c=t.reverseDirection,u=t.tooltipBox,l=t.useTranslate3d,s=t.viewBox;return{cssProperties:u.height>0&&u.width>0&&o?function(t){var e=t.translateX,r=t.translateY;return{transform:t.useTranslate3d?"translate3d(".concat(e,"px, ").concat(r,"px, 0)"):"translate(".concat(e,"px, ").concat(r,"px)")}}({translateX:e=Rt({allowEscapeViewBox:n,coordinate:o,key:"x",offsetTopLeft:i,position:a,reverseDirection:c,tooltipDimension:u.width,viewBox:s,viewBoxDimension:s.width}),translateY:r=Rt({allowEscapeViewBox:n,coordinate:o,key:"y",offsetTopLeft:i,position:a,reverseDirection:c,tooltipDimension:u.height,viewBox:s,viewBoxDimension:s.height}),useTranslate3d:l}):Nt,cssClasses:Bt({translateX:e,translateY:r,coordinate:o})}}({allowEscapeViewBox:n,coordinate:u,offsetTopLeft:f,position:p,reverseDirection:h,tooltipBox:this.state.lastBoundingBox,useTranslate3d:d,viewBox:y}),b=m.cssClasses,g=m.cssProperties,x=Ft(Ft({transition:s&&r?"transform ".concat(i,"ms ").concat(a):void 0},g),{},{pointerEvents:"none",visibility:!this.state.dismissed&&r&&l?"visible":"hidden",position:"absolute",top:0,left:0},v);return o().createElement("div",{tabIndex:-1,className:b,style:x,ref:function(e){t.wrapperNode=e}},c)}}])&&Ut(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(e.PureComponent),Vt={isSsr:!("undefined"!=typeof window&&window.document&&window.document.createElement&&window.setTimeout),get:function(t){return Vt[t]},set:function(t,e){if("string"==typeof t)Vt[t]=e;else{var r=Object.keys(t);r&&r.length&&r.forEach((function(e){Vt[e]=t[e]}))}}},Yt=r(14),Kt=r.n(Yt);function Zt(t,e,r){return!0===e?Kt()(t,r):C()(e)?Kt()(t,e):t}function Jt(t){return Jt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Jt(t)}function Qt(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function te(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Qt(Object(r),!0).forEach((function(e){ie(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Qt(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function ee(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,ae(n.key),n)}}function re(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(re=function(){return!!t})()}function ne(t){return ne=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},ne(t)}function oe(t,e){return oe=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},oe(t,e)}function ie(t,e,r){return(e=ae(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function ae(t){var e=function(t){if("object"!=Jt(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Jt(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Jt(e)?e:e+""}function ce(t){return t.dataKey}var ue=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=ne(r=e),function(t,e){if(e&&("object"===Jt(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,re()?Reflect.construct(r,n||[],ne(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&oe(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){var t=this,e=this.props,r=e.active,n=e.allowEscapeViewBox,i=e.animationDuration,a=e.animationEasing,c=e.content,u=e.coordinate,l=e.filterNull,s=e.isAnimationActive,f=e.offset,p=e.payload,h=e.payloadUniqBy,d=e.position,y=e.reverseDirection,v=e.useTranslate3d,m=e.viewBox,b=e.wrapperStyle,g=null!=p?p:[];l&&g.length&&(g=Zt(p.filter((function(e){return null!=e.value&&(!0!==e.hide||t.props.includeHidden)})),h,ce));var x=g.length>0;return o().createElement(Gt,{allowEscapeViewBox:n,animationDuration:i,animationEasing:a,isAnimationActive:s,active:r,coordinate:u,hasPayload:x,offset:f,position:d,reverseDirection:y,useTranslate3d:v,viewBox:m,wrapperStyle:b},function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):"function"==typeof t?o().createElement(t,e):o().createElement(Tt,e)}(c,te(te({},this.props),{},{payload:g})))}}])&&ee(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(e.PureComponent);ie(ue,"displayName","Tooltip"),ie(ue,"defaultProps",{accessibilityLayer:!1,allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:"ease",contentStyle:{},coordinate:{x:0,y:0},cursor:!0,cursorStyle:{},filterNull:!0,isAnimationActive:!Vt.isSsr,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:" : ",trigger:"hover",useTranslate3d:!1,viewBox:{x:0,y:0,height:0,width:0},wrapperStyle:{}});var le=r(5808),se=r.n(le);Math.abs,Math.atan2;const fe=Math.cos,pe=(Math.max,Math.min,Math.sin),he=Math.sqrt,de=Math.PI,ye=2*de,ve={draw(t,e){const r=he(e/de);t.moveTo(r,0),t.arc(0,0,r,0,ye)}},me={draw(t,e){const r=he(e/5)/2;t.moveTo(-3*r,-r),t.lineTo(-r,-r),t.lineTo(-r,-3*r),t.lineTo(r,-3*r),t.lineTo(r,-r),t.lineTo(3*r,-r),t.lineTo(3*r,r),t.lineTo(r,r),t.lineTo(r,3*r),t.lineTo(-r,3*r),t.lineTo(-r,r),t.lineTo(-3*r,r),t.closePath()}},be=he(1/3),ge=2*be,xe={draw(t,e){const r=he(e/ge),n=r*be;t.moveTo(0,-r),t.lineTo(n,0),t.lineTo(0,r),t.lineTo(-n,0),t.closePath()}},we={draw(t,e){const r=he(e),n=-r/2;t.rect(n,n,r,r)}},Oe=pe(de/10)/pe(7*de/10),je=pe(ye/10)*Oe,Se=-fe(ye/10)*Oe,Pe={draw(t,e){const r=he(.8908130915292852*e),n=je*r,o=Se*r;t.moveTo(0,-r),t.lineTo(n,o);for(let e=1;e<5;++e){const i=ye*e/5,a=fe(i),c=pe(i);t.lineTo(c*r,-a*r),t.lineTo(a*n-c*o,c*n+a*o)}t.closePath()}},Ee=he(3),Ae={draw(t,e){const r=-he(e/(3*Ee));t.moveTo(0,2*r),t.lineTo(-Ee*r,-r),t.lineTo(Ee*r,-r),t.closePath()}},ke=-.5,_e=he(3)/2,Me=1/he(12),Te=3*(Me/2+1),Ce={draw(t,e){const r=he(e/Te),n=r/2,o=r*Me,i=n,a=r*Me+r,c=-i,u=a;t.moveTo(n,o),t.lineTo(i,a),t.lineTo(c,u),t.lineTo(ke*n-_e*o,_e*n+ke*o),t.lineTo(ke*i-_e*a,_e*i+ke*a),t.lineTo(ke*c-_e*u,_e*c+ke*u),t.lineTo(ke*n+_e*o,ke*o-_e*n),t.lineTo(ke*i+_e*a,ke*a-_e*i),t.lineTo(ke*c+_e*u,ke*u-_e*c),t.closePath()}};function De(t){return function(){return t}}const Ie=Math.PI,Ne=2*Ie,Be=1e-6,Re=Ne-Be;function Le(t){this._+=t[0];for(let e=1,r=t.length;e<r;++e)this._+=arguments[e]+t[e]}class ze{constructor(t){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==t?Le:function(t){let e=Math.floor(t);if(!(e>=0))throw new Error(`invalid digits: ${t}`);if(e>15)return Le;const r=10**e;return function(t){this._+=t[0];for(let e=1,n=t.length;e<n;++e)this._+=Math.round(arguments[e]*r)/r+t[e]}}(t)}moveTo(t,e){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+e}`}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(t,e){this._append`L${this._x1=+t},${this._y1=+e}`}quadraticCurveTo(t,e,r,n){this._append`Q${+t},${+e},${this._x1=+r},${this._y1=+n}`}bezierCurveTo(t,e,r,n,o,i){this._append`C${+t},${+e},${+r},${+n},${this._x1=+o},${this._y1=+i}`}arcTo(t,e,r,n,o){if(t=+t,e=+e,r=+r,n=+n,(o=+o)<0)throw new Error(`negative radius: ${o}`);let i=this._x1,a=this._y1,c=r-t,u=n-e,l=i-t,s=a-e,f=l*l+s*s;if(null===this._x1)this._append`M${this._x1=t},${this._y1=e}`;else if(f>Be)if(Math.abs(s*c-u*l)>Be&&o){let p=r-i,h=n-a,d=c*c+u*u,y=p*p+h*h,v=Math.sqrt(d),m=Math.sqrt(f),b=o*Math.tan((Ie-Math.acos((d+f-y)/(2*v*m)))/2),g=b/m,x=b/v;Math.abs(g-1)>Be&&this._append`L${t+g*l},${e+g*s}`,this._append`A${o},${o},0,0,${+(s*p>l*h)},${this._x1=t+x*c},${this._y1=e+x*u}`}else this._append`L${this._x1=t},${this._y1=e}`}arc(t,e,r,n,o,i){if(t=+t,e=+e,i=!!i,(r=+r)<0)throw new Error(`negative radius: ${r}`);let a=r*Math.cos(n),c=r*Math.sin(n),u=t+a,l=e+c,s=1^i,f=i?n-o:o-n;null===this._x1?this._append`M${u},${l}`:(Math.abs(this._x1-u)>Be||Math.abs(this._y1-l)>Be)&&this._append`L${u},${l}`,r&&(f<0&&(f=f%Ne+Ne),f>Re?this._append`A${r},${r},0,1,${s},${t-a},${e-c}A${r},${r},0,1,${s},${this._x1=u},${this._y1=l}`:f>Be&&this._append`A${r},${r},0,${+(f>=Ie)},${s},${this._x1=t+r*Math.cos(o)},${this._y1=e+r*Math.sin(o)}`)}rect(t,e,r,n){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+e}h${r=+r}v${+n}h${-r}Z`}toString(){return this._}}function Fe(t){let e=3;return t.digits=function(r){if(!arguments.length)return e;if(null==r)e=null;else{const t=Math.floor(r);if(!(t>=0))throw new RangeError(`invalid digits: ${r}`);e=t}return t},()=>new ze(e)}function Ue(t){return Ue="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ue(t)}he(3),he(3);var $e=["type","size","sizeType"];function qe(){return qe=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},qe.apply(this,arguments)}function We(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Xe(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?We(Object(r),!0).forEach((function(e){He(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):We(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function He(t,e,r){var n;return n=function(t){if("object"!=Ue(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ue(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ue(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var Ge={symbolCircle:ve,symbolCross:me,symbolDiamond:xe,symbolSquare:we,symbolStar:Pe,symbolTriangle:Ae,symbolWye:Ce},Ve=Math.PI/180,Ye=function(t){var e,r,n=t.type,i=void 0===n?"circle":n,c=t.size,u=void 0===c?64:c,l=t.sizeType,s=void 0===l?"area":l,f=Xe(Xe({},function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,$e)),{},{type:i,size:u,sizeType:s}),p=f.className,h=f.cx,d=f.cy,y=nt(f,!0);return h===+h&&d===+d&&u===+u?o().createElement("path",qe({},y,{className:a("recharts-symbols",p),transform:"translate(".concat(h,", ").concat(d,")"),d:(e=function(t){var e="symbol".concat(se()(t));return Ge[e]||ve}(i),r=function(t,e){let r=null,n=Fe(o);function o(){let o;if(r||(r=o=n()),t.apply(this,arguments).draw(r,+e.apply(this,arguments)),o)return r=null,o+""||null}return t="function"==typeof t?t:De(t||ve),e="function"==typeof e?e:De(void 0===e?64:+e),o.type=function(e){return arguments.length?(t="function"==typeof e?e:De(e),o):t},o.size=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),o):e},o.context=function(t){return arguments.length?(r=null==t?null:t,o):r},o}().type(e).size(function(t,e,r){if("area"===e)return t;switch(r){case"cross":return 5*t*t/9;case"diamond":return.5*t*t/Math.sqrt(3);case"square":return t*t;case"star":var n=18*Ve;return 1.25*t*t*(Math.tan(n)-Math.tan(2*n)*Math.pow(Math.tan(n),2));case"triangle":return Math.sqrt(3)*t*t/4;case"wye":return(21-10*Math.sqrt(3))*t*t/8;default:return Math.PI*t*t/4}}(u,s,i)),r())})):null};function Ke(t){return Ke="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ke(t)}function Ze(){return Ze=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Ze.apply(this,arguments)}function Je(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Qe(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,or(n.key),n)}}function tr(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(tr=function(){return!!t})()}function er(t){return er=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},er(t)}function rr(t,e){return rr=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},rr(t,e)}function nr(t,e,r){return(e=or(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function or(t){var e=function(t){if("object"!=Ke(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ke(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Ke(e)?e:e+""}Ye.registerSymbol=function(t,e){Ge["symbol".concat(se()(t))]=e};var ir=32,ar=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=er(r=e),function(t,e){if(e&&("object"===Ke(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,tr()?Reflect.construct(r,n||[],er(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&rr(t,e)}(e,t),r=e,n=[{key:"renderIcon",value:function(t){var e=this.props.inactiveColor,r=16,n=ir/6,i=ir/3,a=t.inactive?e:t.color;if("plainline"===t.type)return o().createElement("line",{strokeWidth:4,fill:"none",stroke:a,strokeDasharray:t.payload.strokeDasharray,x1:0,y1:r,x2:ir,y2:r,className:"recharts-legend-icon"});if("line"===t.type)return o().createElement("path",{strokeWidth:4,fill:"none",stroke:a,d:"M0,".concat(r,"h").concat(i,"\n            A").concat(n,",").concat(n,",0,1,1,").concat(2*i,",").concat(r,"\n            H").concat(ir,"M").concat(2*i,",").concat(r,"\n            A").concat(n,",").concat(n,",0,1,1,").concat(i,",").concat(r),className:"recharts-legend-icon"});if("rect"===t.type)return o().createElement("path",{stroke:"none",fill:a,d:"M0,".concat(4,"h").concat(ir,"v").concat(24,"h").concat(-32,"z"),className:"recharts-legend-icon"});if(o().isValidElement(t.legendIcon)){var c=function(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Je(Object(r),!0).forEach((function(e){nr(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Je(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}({},t);return delete c.legendIcon,o().cloneElement(t.legendIcon,c)}return o().createElement(Ye,{fill:a,cx:r,cy:r,size:ir,sizeType:"diameter",type:t.type})}},{key:"renderItems",value:function(){var t=this,e=this.props,r=e.payload,n=e.iconSize,i=e.layout,c=e.formatter,u=e.inactiveColor,l={x:0,y:0,width:ir,height:ir},s={display:"horizontal"===i?"inline-block":"block",marginRight:10},f={display:"inline-block",verticalAlign:"middle",marginRight:4};return r.map((function(e,r){var i=e.formatter||c,p=a(nr(nr({"recharts-legend-item":!0},"legend-item-".concat(r),!0),"inactive",e.inactive));if("none"===e.type)return null;var h=C()(e.value)?null:e.value;k(!C()(e.value),'The name property is also required when using a function for the dataKey of a chart\'s cartesian components. Ex: <Bar name="Name of my Data"/>');var d=e.inactive?u:e.color;return o().createElement("li",Ze({className:p,style:s,key:"legend-item-".concat(r)},q(t.props,e,r)),o().createElement(xt,{width:n,height:n,viewBox:l,style:f},t.renderIcon(e)),o().createElement("span",{className:"recharts-legend-item-text",style:{color:d}},i?i(h,e,r):h))}))}},{key:"render",value:function(){var t=this.props,e=t.payload,r=t.layout,n=t.align;if(!e||!e.length)return null;var i={padding:0,margin:0,textAlign:"horizontal"===r?n:"left"};return o().createElement("ul",{className:"recharts-default-legend",style:i},this.renderItems())}}],n&&Qe(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(e.PureComponent);function cr(t){return cr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},cr(t)}nr(ar,"displayName","Legend"),nr(ar,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"middle",inactiveColor:"#ccc"});var ur=["ref"];function lr(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function sr(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?lr(Object(r),!0).forEach((function(e){yr(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):lr(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function fr(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,vr(n.key),n)}}function pr(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(pr=function(){return!!t})()}function hr(t){return hr=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},hr(t)}function dr(t,e){return dr=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},dr(t,e)}function yr(t,e,r){return(e=vr(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function vr(t){var e=function(t){if("object"!=cr(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=cr(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==cr(e)?e:e+""}function mr(t){return t.value}var br=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return yr((r=this,n=e,o=[].concat(a),n=hr(n),t=function(t,e){if(e&&("object"===cr(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,pr()?Reflect.construct(n,o||[],hr(r).constructor):n.apply(r,o))),"lastBoundingBox",{width:-1,height:-1}),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&dr(t,e)}(e,t),r=e,i=[{key:"getWithHeight",value:function(t,e){var r=sr(sr({},this.defaultProps),t.props).layout;return"vertical"===r&&g(t.props.height)?{height:t.props.height}:"horizontal"===r?{width:t.props.width||e}:null}}],(n=[{key:"componentDidMount",value:function(){this.updateBBox()}},{key:"componentDidUpdate",value:function(){this.updateBBox()}},{key:"getBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var t=this.wrapperNode.getBoundingClientRect();return t.height=this.wrapperNode.offsetHeight,t.width=this.wrapperNode.offsetWidth,t}return null}},{key:"updateBBox",value:function(){var t=this.props.onBBoxUpdate,e=this.getBBox();e?(Math.abs(e.width-this.lastBoundingBox.width)>1||Math.abs(e.height-this.lastBoundingBox.height)>1)&&(this.lastBoundingBox.width=e.width,this.lastBoundingBox.height=e.height,t&&t(e)):-1===this.lastBoundingBox.width&&-1===this.lastBoundingBox.height||(this.lastBoundingBox.width=-1,this.lastBoundingBox.height=-1,t&&t(null))}},{key:"getBBoxSnapshot",value:function(){return this.lastBoundingBox.width>=0&&this.lastBoundingBox.height>=0?sr({},this.lastBoundingBox):{width:0,height:0}}},{key:"getDefaultPosition",value:function(t){var e,r,n=this.props,o=n.layout,i=n.align,a=n.verticalAlign,c=n.margin,u=n.chartWidth,l=n.chartHeight;return t&&(void 0!==t.left&&null!==t.left||void 0!==t.right&&null!==t.right)||(e="center"===i&&"vertical"===o?{left:((u||0)-this.getBBoxSnapshot().width)/2}:"right"===i?{right:c&&c.right||0}:{left:c&&c.left||0}),t&&(void 0!==t.top&&null!==t.top||void 0!==t.bottom&&null!==t.bottom)||(r="middle"===a?{top:((l||0)-this.getBBoxSnapshot().height)/2}:"bottom"===a?{bottom:c&&c.bottom||0}:{top:c&&c.top||0}),sr(sr({},e),r)}},{key:"render",value:function(){var t=this,e=this.props,r=e.content,n=e.width,i=e.height,a=e.wrapperStyle,c=e.payloadUniqBy,u=e.payload,l=sr(sr({position:"absolute",width:n||"auto",height:i||"auto"},this.getDefaultPosition(a)),a);return o().createElement("div",{className:"recharts-legend-wrapper",style:l,ref:function(e){t.wrapperNode=e}},function(t,e){if(o().isValidElement(t))return o().cloneElement(t,e);if("function"==typeof t)return o().createElement(t,e);e.ref;var r=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(e,ur);return o().createElement(ar,r)}(r,sr(sr({},this.props),{},{payload:Zt(u,c,mr)})))}}])&&fr(r.prototype,n),i&&fr(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.PureComponent);function gr(){return gr=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},gr.apply(this,arguments)}yr(br,"displayName","Legend"),yr(br,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"bottom"});var xr=function(t){var e=t.cx,r=t.cy,n=t.r,i=t.className,c=a("recharts-dot",i);return e===+e&&r===+r&&n===+n?o().createElement("circle",gr({},nt(t,!1),$(t),{className:c,cx:e,cy:r,r:n})):null},wr=r(5556),Or=r.n(wr),jr=Object.getOwnPropertyNames,Sr=Object.getOwnPropertySymbols,Pr=Object.prototype.hasOwnProperty;function Er(t,e){return function(r,n,o){return t(r,n,o)&&e(r,n,o)}}function Ar(t){return function(e,r,n){if(!e||!r||"object"!=typeof e||"object"!=typeof r)return t(e,r,n);var o=n.cache,i=o.get(e),a=o.get(r);if(i&&a)return i===r&&a===e;o.set(e,r),o.set(r,e);var c=t(e,r,n);return o.delete(e),o.delete(r),c}}function kr(t){return jr(t).concat(Sr(t))}var _r=Object.hasOwn||function(t,e){return Pr.call(t,e)};function Mr(t,e){return t===e||!t&&!e&&t!=t&&e!=e}var Tr=Object.getOwnPropertyDescriptor,Cr=Object.keys;function Dr(t,e,r){var n=t.length;if(e.length!==n)return!1;for(;n-- >0;)if(!r.equals(t[n],e[n],n,n,t,e,r))return!1;return!0}function Ir(t,e){return Mr(t.getTime(),e.getTime())}function Nr(t,e){return t.name===e.name&&t.message===e.message&&t.cause===e.cause&&t.stack===e.stack}function Br(t,e){return t===e}function Rr(t,e,r){var n=t.size;if(n!==e.size)return!1;if(!n)return!0;for(var o,i,a=new Array(n),c=t.entries(),u=0;(o=c.next())&&!o.done;){for(var l=e.entries(),s=!1,f=0;(i=l.next())&&!i.done;)if(a[f])f++;else{var p=o.value,h=i.value;if(r.equals(p[0],h[0],u,f,t,e,r)&&r.equals(p[1],h[1],p[0],h[0],t,e,r)){s=a[f]=!0;break}f++}if(!s)return!1;u++}return!0}var Lr=Mr;function zr(t,e,r){var n=Cr(t),o=n.length;if(Cr(e).length!==o)return!1;for(;o-- >0;)if(!Hr(t,e,r,n[o]))return!1;return!0}function Fr(t,e,r){var n,o,i,a=kr(t),c=a.length;if(kr(e).length!==c)return!1;for(;c-- >0;){if(!Hr(t,e,r,n=a[c]))return!1;if(o=Tr(t,n),i=Tr(e,n),(o||i)&&(!o||!i||o.configurable!==i.configurable||o.enumerable!==i.enumerable||o.writable!==i.writable))return!1}return!0}function Ur(t,e){return Mr(t.valueOf(),e.valueOf())}function $r(t,e){return t.source===e.source&&t.flags===e.flags}function qr(t,e,r){var n=t.size;if(n!==e.size)return!1;if(!n)return!0;for(var o,i,a=new Array(n),c=t.values();(o=c.next())&&!o.done;){for(var u=e.values(),l=!1,s=0;(i=u.next())&&!i.done;){if(!a[s]&&r.equals(o.value,i.value,o.value,i.value,t,e,r)){l=a[s]=!0;break}s++}if(!l)return!1}return!0}function Wr(t,e){var r=t.length;if(e.length!==r)return!1;for(;r-- >0;)if(t[r]!==e[r])return!1;return!0}function Xr(t,e){return t.hostname===e.hostname&&t.pathname===e.pathname&&t.protocol===e.protocol&&t.port===e.port&&t.hash===e.hash&&t.username===e.username&&t.password===e.password}function Hr(t,e,r,n){return!("_owner"!==n&&"__o"!==n&&"__v"!==n||!t.$$typeof&&!e.$$typeof)||_r(e,n)&&r.equals(t[n],e[n],n,n,t,e,r)}var Gr=Array.isArray,Vr="function"==typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView:null,Yr=Object.assign,Kr=Object.prototype.toString.call.bind(Object.prototype.toString),Zr=Jr();function Jr(t){void 0===t&&(t={});var e,r=t.circular,n=void 0!==r&&r,o=t.createInternalComparator,i=t.createState,a=t.strict,c=void 0!==a&&a,u=function(t){var e=t.circular,r=t.createCustomConfig,n=t.strict,o={areArraysEqual:n?Fr:Dr,areDatesEqual:Ir,areErrorsEqual:Nr,areFunctionsEqual:Br,areMapsEqual:n?Er(Rr,Fr):Rr,areNumbersEqual:Lr,areObjectsEqual:n?Fr:zr,arePrimitiveWrappersEqual:Ur,areRegExpsEqual:$r,areSetsEqual:n?Er(qr,Fr):qr,areTypedArraysEqual:n?Fr:Wr,areUrlsEqual:Xr};if(r&&(o=Yr({},o,r(o))),e){var i=Ar(o.areArraysEqual),a=Ar(o.areMapsEqual),c=Ar(o.areObjectsEqual),u=Ar(o.areSetsEqual);o=Yr({},o,{areArraysEqual:i,areMapsEqual:a,areObjectsEqual:c,areSetsEqual:u})}return o}(t),l=function(t){var e=t.areArraysEqual,r=t.areDatesEqual,n=t.areErrorsEqual,o=t.areFunctionsEqual,i=t.areMapsEqual,a=t.areNumbersEqual,c=t.areObjectsEqual,u=t.arePrimitiveWrappersEqual,l=t.areRegExpsEqual,s=t.areSetsEqual,f=t.areTypedArraysEqual,p=t.areUrlsEqual;return function(t,h,d){if(t===h)return!0;if(null==t||null==h)return!1;var y=typeof t;if(y!==typeof h)return!1;if("object"!==y)return"number"===y?a(t,h,d):"function"===y&&o(t,h,d);var v=t.constructor;if(v!==h.constructor)return!1;if(v===Object)return c(t,h,d);if(Gr(t))return e(t,h,d);if(null!=Vr&&Vr(t))return f(t,h,d);if(v===Date)return r(t,h,d);if(v===RegExp)return l(t,h,d);if(v===Map)return i(t,h,d);if(v===Set)return s(t,h,d);var m=Kr(t);return"[object Date]"===m?r(t,h,d):"[object RegExp]"===m?l(t,h,d):"[object Map]"===m?i(t,h,d):"[object Set]"===m?s(t,h,d):"[object Object]"===m?"function"!=typeof t.then&&"function"!=typeof h.then&&c(t,h,d):"[object URL]"===m?p(t,h,d):"[object Error]"===m?n(t,h,d):"[object Arguments]"===m?c(t,h,d):("[object Boolean]"===m||"[object Number]"===m||"[object String]"===m)&&u(t,h,d)}}(u),s=o?o(l):(e=l,function(t,r,n,o,i,a,c){return e(t,r,c)});return function(t){var e=t.circular,r=t.comparator,n=t.createState,o=t.equals,i=t.strict;if(n)return function(t,a){var c=n(),u=c.cache,l=void 0===u?e?new WeakMap:void 0:u,s=c.meta;return r(t,a,{cache:l,equals:o,meta:s,strict:i})};if(e)return function(t,e){return r(t,e,{cache:new WeakMap,equals:o,meta:void 0,strict:i})};var a={cache:void 0,equals:o,meta:void 0,strict:i};return function(t,e){return r(t,e,a)}}({circular:n,comparator:l,createState:i,equals:s,strict:c})}function Qr(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,r=-1;requestAnimationFrame((function n(o){r<0&&(r=o),o-r>e?(t(o),r=-1):function(t){"undefined"!=typeof requestAnimationFrame&&requestAnimationFrame(t)}(n)}))}function tn(t){return tn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},tn(t)}function en(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function rn(){var t=function(){return null},e=!1,r=function r(n){if(!e){if(Array.isArray(n)){if(!n.length)return;var o=function(t){if(Array.isArray(t))return t}(c=n)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(c)||function(t,e){if(t){if("string"==typeof t)return en(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?en(t,e):void 0}}(c)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}(),i=o[0],a=o.slice(1);return"number"==typeof i?void Qr(r.bind(null,a),i):(r(i),void Qr(r.bind(null,a)))}"object"===tn(n)&&t(n),"function"==typeof n&&n()}var c};return{stop:function(){e=!0},start:function(t){e=!1,r(t)},subscribe:function(e){return t=e,function(){t=function(){return null}}}}}function nn(t){return nn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},nn(t)}function on(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function an(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?on(Object(r),!0).forEach((function(e){cn(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):on(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function cn(t,e,r){return(e=function(t){var e=function(t){if("object"!==nn(t)||null===t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!==nn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"===nn(e)?e:String(e)}(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Jr({strict:!0}),Jr({circular:!0}),Jr({circular:!0,strict:!0}),Jr({createInternalComparator:function(){return Mr}}),Jr({strict:!0,createInternalComparator:function(){return Mr}}),Jr({circular:!0,createInternalComparator:function(){return Mr}}),Jr({circular:!0,createInternalComparator:function(){return Mr},strict:!0});var un=function(t){return t},ln=function(t,e){return Object.keys(e).reduce((function(r,n){return an(an({},r),{},cn({},n,t(n,e[n])))}),{})},sn=function(t,e,r){return t.map((function(t){return"".concat((n=t,n.replace(/([A-Z])/g,(function(t){return"-".concat(t.toLowerCase())})))," ").concat(e,"ms ").concat(r);var n})).join(",")};function fn(t,e){if(t){if("string"==typeof t)return pn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?pn(t,e):void 0}}function pn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var hn=1e-4,dn=function(t,e){return[0,3*t,3*e-6*t,3*t-3*e+1]},yn=function(t,e){return t.map((function(t,r){return t*Math.pow(e,r)})).reduce((function(t,e){return t+e}))},vn=function(t,e){return function(r){var n=dn(t,e);return yn(n,r)}},mn=function(){for(var t=arguments.length,e=new Array(t),r=0;r<t;r++)e[r]=arguments[r];var n,o,i=e[0],a=e[1],c=e[2],u=e[3];if(1===e.length)switch(e[0]){case"linear":i=0,a=0,c=1,u=1;break;case"ease":i=.25,a=.1,c=.25,u=1;break;case"ease-in":i=.42,a=0,c=1,u=1;break;case"ease-out":i=.42,a=0,c=.58,u=1;break;case"ease-in-out":i=0,a=0,c=.58,u=1;break;default:var l=e[0].split("(");if("cubic-bezier"===l[0]&&4===l[1].split(")")[0].split(",").length){var s=(n=l[1].split(")")[0].split(",").map((function(t){return parseFloat(t)})),o=4,function(t){if(Array.isArray(t))return t}(n)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(n,o)||fn(n,o)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}());i=s[0],a=s[1],c=s[2],u=s[3]}}[i,c,a,u].every((function(t){return"number"==typeof t&&t>=0&&t<=1}));var f,p,h=vn(i,c),d=vn(a,u),y=(f=i,p=c,function(t){var e=dn(f,p),r=[].concat(function(t){return function(t){if(Array.isArray(t))return pn(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||fn(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(e.map((function(t,e){return t*e})).slice(1)),[0]);return yn(r,t)}),v=function(t){return t>1?1:t<0?0:t},m=function(t){for(var e=t>1?1:t,r=e,n=0;n<8;++n){var o=h(r)-e,i=y(r);if(Math.abs(o-e)<hn||i<hn)return d(r);r=v(r-o/i)}return d(r)};return m.isStepper=!1,m};function bn(t){return bn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},bn(t)}function gn(t){return function(t){if(Array.isArray(t))return Sn(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||jn(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function xn(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function wn(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?xn(Object(r),!0).forEach((function(e){On(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):xn(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function On(t,e,r){return(e=function(t){var e=function(t){if("object"!==bn(t)||null===t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!==bn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"===bn(e)?e:String(e)}(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function jn(t,e){if(t){if("string"==typeof t)return Sn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Sn(t,e):void 0}}function Sn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var Pn=function(t,e,r){return t+(e-t)*r},En=function(t){return t.from!==t.to},An=function t(e,r,n){var o=ln((function(t,r){if(En(r)){var n=(a=e(r.from,r.to,r.velocity),c=2,function(t){if(Array.isArray(t))return t}(a)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(a,c)||jn(a,c)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),o=n[0],i=n[1];return wn(wn({},r),{},{from:o,velocity:i})}var a,c;return r}),r);return n<1?ln((function(t,e){return En(e)?wn(wn({},e),{},{velocity:Pn(e.velocity,o[t].velocity,n),from:Pn(e.from,o[t].from,n)}):e}),r):t(e,o,n-1)};function kn(t){return kn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},kn(t)}var _n=["children","begin","duration","attributeName","easing","isActive","steps","from","to","canBegin","onAnimationEnd","shouldReAnimate","onAnimationReStart"];function Mn(t){return function(t){if(Array.isArray(t))return Tn(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return Tn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Tn(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Cn(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Dn(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Cn(Object(r),!0).forEach((function(e){In(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Cn(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function In(t,e,r){return(e=Bn(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Nn(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Bn(n.key),n)}}function Bn(t){var e=function(t){if("object"!==kn(t)||null===t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!==kn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"===kn(e)?e:String(e)}function Rn(t,e){return Rn=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Rn(t,e)}function Ln(t,e){if(e&&("object"===kn(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return zn(t)}function zn(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}function Fn(t){return Fn=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Fn(t)}var Un=function(t){!function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Rn(t,e)}(u,t);var r,n,i,a,c=(i=u,a=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(t){return!1}}(),function(){var t,e=Fn(i);if(a){var r=Fn(this).constructor;t=Reflect.construct(e,arguments,r)}else t=e.apply(this,arguments);return Ln(this,t)});function u(t,e){var r;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,u);var n=(r=c.call(this,t,e)).props,o=n.isActive,i=n.attributeName,a=n.from,l=n.to,s=n.steps,f=n.children,p=n.duration;if(r.handleStyleChange=r.handleStyleChange.bind(zn(r)),r.changeStyle=r.changeStyle.bind(zn(r)),!o||p<=0)return r.state={style:{}},"function"==typeof f&&(r.state={style:l}),Ln(r);if(s&&s.length)r.state={style:s[0].style};else if(a){if("function"==typeof f)return r.state={style:a},Ln(r);r.state={style:i?In({},i,a):a}}else r.state={style:{}};return r}return r=u,(n=[{key:"componentDidMount",value:function(){var t=this.props,e=t.isActive,r=t.canBegin;this.mounted=!0,e&&r&&this.runAnimation(this.props)}},{key:"componentDidUpdate",value:function(t){var e=this.props,r=e.isActive,n=e.canBegin,o=e.attributeName,i=e.shouldReAnimate,a=e.to,c=e.from,u=this.state.style;if(n)if(r){if(!(Zr(t.to,a)&&t.canBegin&&t.isActive)){var l=!t.canBegin||!t.isActive;this.manager&&this.manager.stop(),this.stopJSAnimation&&this.stopJSAnimation();var s=l||i?c:t.to;if(this.state&&u){var f={style:o?In({},o,s):s};(o&&u[o]!==s||!o&&u!==s)&&this.setState(f)}this.runAnimation(Dn(Dn({},this.props),{},{from:s,begin:0}))}}else{var p={style:o?In({},o,a):a};this.state&&u&&(o&&u[o]!==a||!o&&u!==a)&&this.setState(p)}}},{key:"componentWillUnmount",value:function(){this.mounted=!1;var t=this.props.onAnimationEnd;this.unSubscribe&&this.unSubscribe(),this.manager&&(this.manager.stop(),this.manager=null),this.stopJSAnimation&&this.stopJSAnimation(),t&&t()}},{key:"handleStyleChange",value:function(t){this.changeStyle(t)}},{key:"changeStyle",value:function(t){this.mounted&&this.setState({style:t})}},{key:"runJSAnimation",value:function(t){var e=this,r=t.from,n=t.to,o=t.duration,i=t.easing,a=t.begin,c=t.onAnimationEnd,u=t.onAnimationStart,l=function(t,e,r,n,o){var i,a,c,u,l=(i=t,a=e,[Object.keys(i),Object.keys(a)].reduce((function(t,e){return t.filter((function(t){return e.includes(t)}))}))),s=l.reduce((function(r,n){return wn(wn({},r),{},On({},n,[t[n],e[n]]))}),{}),f=l.reduce((function(r,n){return wn(wn({},r),{},On({},n,{from:t[n],velocity:0,to:e[n]}))}),{}),p=-1,h=function(){return null};return h=r.isStepper?function(n){c||(c=n);var i=(n-c)/r.dt;f=An(r,f,i),o(wn(wn(wn({},t),e),ln((function(t,e){return e.from}),f))),c=n,Object.values(f).filter(En).length&&(p=requestAnimationFrame(h))}:function(i){u||(u=i);var a=(i-u)/n,c=ln((function(t,e){return Pn.apply(void 0,gn(e).concat([r(a)]))}),s);if(o(wn(wn(wn({},t),e),c)),a<1)p=requestAnimationFrame(h);else{var l=ln((function(t,e){return Pn.apply(void 0,gn(e).concat([r(1)]))}),s);o(wn(wn(wn({},t),e),l))}},function(){return requestAnimationFrame(h),function(){cancelAnimationFrame(p)}}}(r,n,function(){for(var t=arguments.length,e=new Array(t),r=0;r<t;r++)e[r]=arguments[r];var n=e[0];if("string"==typeof n)switch(n){case"ease":case"ease-in-out":case"ease-out":case"ease-in":case"linear":return mn(n);case"spring":return function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},e=t.stiff,r=void 0===e?100:e,n=t.damping,o=void 0===n?8:n,i=t.dt,a=void 0===i?17:i,c=function(t,e,n){var i=n+(-(t-e)*r-n*o)*a/1e3,c=n*a/1e3+t;return Math.abs(c-e)<hn&&Math.abs(i)<hn?[e,0]:[c,i]};return c.isStepper=!0,c.dt=a,c}();default:if("cubic-bezier"===n.split("(")[0])return mn(n)}return"function"==typeof n?n:null}(i),o,this.changeStyle);this.manager.start([u,a,function(){e.stopJSAnimation=l()},o,c])}},{key:"runStepAnimation",value:function(t){var e=this,r=t.steps,n=t.begin,o=t.onAnimationStart,i=r[0],a=i.style,c=i.duration,u=void 0===c?0:c;return this.manager.start([o].concat(Mn(r.reduce((function(t,n,o){if(0===o)return t;var i=n.duration,a=n.easing,c=void 0===a?"ease":a,u=n.style,l=n.properties,s=n.onAnimationEnd,f=o>0?r[o-1]:n,p=l||Object.keys(u);if("function"==typeof c||"spring"===c)return[].concat(Mn(t),[e.runJSAnimation.bind(e,{from:f.style,to:u,duration:i,easing:c}),i]);var h=sn(p,i,c),d=Dn(Dn(Dn({},f.style),u),{},{transition:h});return[].concat(Mn(t),[d,i,s]).filter(un)}),[a,Math.max(u,n)])),[t.onAnimationEnd]))}},{key:"runAnimation",value:function(t){this.manager||(this.manager=rn());var e=t.begin,r=t.duration,n=t.attributeName,o=t.to,i=t.easing,a=t.onAnimationStart,c=t.onAnimationEnd,u=t.steps,l=t.children,s=this.manager;if(this.unSubscribe=s.subscribe(this.handleStyleChange),"function"!=typeof i&&"function"!=typeof l&&"spring"!==i)if(u.length>1)this.runStepAnimation(t);else{var f=n?In({},n,o):o,p=sn(Object.keys(f),r,i);s.start([a,e,Dn(Dn({},f),{},{transition:p}),r,c])}else this.runJSAnimation(t)}},{key:"render",value:function(){var t=this.props,r=t.children,n=(t.begin,t.duration),i=(t.attributeName,t.easing,t.isActive),a=(t.steps,t.from,t.to,t.canBegin,t.onAnimationEnd,t.shouldReAnimate,t.onAnimationReStart,function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r,n,o={},i=Object.keys(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||(o[r]=t[r]);return o}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,_n)),c=e.Children.count(r),u=this.state.style;if("function"==typeof r)return r(u);if(!i||0===c||n<=0)return r;var l=function(t){var r=t.props,n=r.style,o=void 0===n?{}:n,i=r.className;return(0,e.cloneElement)(t,Dn(Dn({},a),{},{style:Dn(Dn({},o),u),className:i}))};return 1===c?l(e.Children.only(r)):o().createElement("div",null,e.Children.map(r,(function(t){return l(t)})))}}])&&Nn(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),u}(e.PureComponent);Un.displayName="Animate",Un.defaultProps={begin:0,duration:1e3,from:"",to:"",attributeName:"",easing:"ease",isActive:!0,canBegin:!0,steps:[],onAnimationEnd:function(){},onAnimationStart:function(){}},Un.propTypes={from:Or().oneOfType([Or().object,Or().string]),to:Or().oneOfType([Or().object,Or().string]),attributeName:Or().string,duration:Or().number,begin:Or().number,easing:Or().oneOfType([Or().string,Or().func]),steps:Or().arrayOf(Or().shape({duration:Or().number.isRequired,style:Or().object.isRequired,easing:Or().oneOfType([Or().oneOf(["ease","ease-in","ease-out","ease-in-out","linear"]),Or().func]),properties:Or().arrayOf("string"),onAnimationEnd:Or().func})),children:Or().oneOfType([Or().node,Or().func]),isActive:Or().bool,canBegin:Or().bool,onAnimationEnd:Or().func,shouldReAnimate:Or().bool,onAnimationStart:Or().func,onAnimationReStart:Or().func};const $n=Un;function qn(t){return qn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},qn(t)}function Wn(){return Wn=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Wn.apply(this,arguments)}function Xn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Hn(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Gn(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Hn(Object(r),!0).forEach((function(e){Vn(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Hn(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Vn(t,e,r){var n;return n=function(t){if("object"!=qn(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=qn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==qn(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var Yn=function(t,e,r,n,o){var i,a=Math.min(Math.abs(r)/2,Math.abs(n)/2),c=n>=0?1:-1,u=r>=0?1:-1,l=n>=0&&r>=0||n<0&&r<0?1:0;if(a>0&&o instanceof Array){for(var s=[0,0,0,0],f=0;f<4;f++)s[f]=o[f]>a?a:o[f];i="M".concat(t,",").concat(e+c*s[0]),s[0]>0&&(i+="A ".concat(s[0],",").concat(s[0],",0,0,").concat(l,",").concat(t+u*s[0],",").concat(e)),i+="L ".concat(t+r-u*s[1],",").concat(e),s[1]>0&&(i+="A ".concat(s[1],",").concat(s[1],",0,0,").concat(l,",\n        ").concat(t+r,",").concat(e+c*s[1])),i+="L ".concat(t+r,",").concat(e+n-c*s[2]),s[2]>0&&(i+="A ".concat(s[2],",").concat(s[2],",0,0,").concat(l,",\n        ").concat(t+r-u*s[2],",").concat(e+n)),i+="L ".concat(t+u*s[3],",").concat(e+n),s[3]>0&&(i+="A ".concat(s[3],",").concat(s[3],",0,0,").concat(l,",\n        ").concat(t,",").concat(e+n-c*s[3])),i+="Z"}else if(a>0&&o===+o&&o>0){var p=Math.min(a,o);i="M ".concat(t,",").concat(e+c*p,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t+u*p,",").concat(e,"\n            L ").concat(t+r-u*p,",").concat(e,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t+r,",").concat(e+c*p,"\n            L ").concat(t+r,",").concat(e+n-c*p,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t+r-u*p,",").concat(e+n,"\n            L ").concat(t+u*p,",").concat(e+n,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t,",").concat(e+n-c*p," Z")}else i="M ".concat(t,",").concat(e," h ").concat(r," v ").concat(n," h ").concat(-r," Z");return i},Kn=function(t,e){if(!t||!e)return!1;var r=t.x,n=t.y,o=e.x,i=e.y,a=e.width,c=e.height;if(Math.abs(a)>0&&Math.abs(c)>0){var u=Math.min(o,o+a),l=Math.max(o,o+a),s=Math.min(i,i+c),f=Math.max(i,i+c);return r>=u&&r<=l&&n>=s&&n<=f}return!1},Zn={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},Jn=function(t){var r,n,i=Gn(Gn({},Zn),t),c=(0,e.useRef)(),u=(r=(0,e.useState)(-1),n=2,function(t){if(Array.isArray(t))return t}(r)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(r,n)||function(t,e){if(t){if("string"==typeof t)return Xn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Xn(t,e):void 0}}(r,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),l=u[0],s=u[1];(0,e.useEffect)((function(){if(c.current&&c.current.getTotalLength)try{var t=c.current.getTotalLength();t&&s(t)}catch(t){}}),[]);var f=i.x,p=i.y,h=i.width,d=i.height,y=i.radius,v=i.className,m=i.animationEasing,b=i.animationDuration,g=i.animationBegin,x=i.isAnimationActive,w=i.isUpdateAnimationActive;if(f!==+f||p!==+p||h!==+h||d!==+d||0===h||0===d)return null;var O=a("recharts-rectangle",v);return w?o().createElement($n,{canBegin:l>0,from:{width:h,height:d,x:f,y:p},to:{width:h,height:d,x:f,y:p},duration:b,animationEasing:m,isActive:w},(function(t){var e=t.width,r=t.height,n=t.x,a=t.y;return o().createElement($n,{canBegin:l>0,from:"0px ".concat(-1===l?1:l,"px"),to:"".concat(l,"px 0px"),attributeName:"strokeDasharray",begin:g,duration:b,isActive:x,easing:m},o().createElement("path",Wn({},nt(i,!0),{className:O,d:Yn(n,a,e,r,y),ref:c})))})):o().createElement("path",Wn({},nt(i,!0),{className:O,d:Yn(f,p,h,d,y)}))};function Qn(t,e){switch(arguments.length){case 0:break;case 1:this.range(t);break;default:this.range(e).domain(t)}return this}function to(t,e){switch(arguments.length){case 0:break;case 1:"function"==typeof t?this.interpolator(t):this.range(t);break;default:this.domain(t),"function"==typeof e?this.interpolator(e):this.range(e)}return this}class eo extends Map{constructor(t,e=no){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:e}}),null!=t)for(const[e,r]of t)this.set(e,r)}get(t){return super.get(ro(this,t))}has(t){return super.has(ro(this,t))}set(t,e){return super.set(function({_intern:t,_key:e},r){const n=e(r);return t.has(n)?t.get(n):(t.set(n,r),r)}(this,t),e)}delete(t){return super.delete(function({_intern:t,_key:e},r){const n=e(r);return t.has(n)&&(r=t.get(n),t.delete(n)),r}(this,t))}}function ro({_intern:t,_key:e},r){const n=e(r);return t.has(n)?t.get(n):r}function no(t){return null!==t&&"object"==typeof t?t.valueOf():t}Set;const oo=Symbol("implicit");function io(){var t=new eo,e=[],r=[],n=oo;function o(o){let i=t.get(o);if(void 0===i){if(n!==oo)return n;t.set(o,i=e.push(o)-1)}return r[i%r.length]}return o.domain=function(r){if(!arguments.length)return e.slice();e=[],t=new eo;for(const n of r)t.has(n)||t.set(n,e.push(n)-1);return o},o.range=function(t){return arguments.length?(r=Array.from(t),o):r.slice()},o.unknown=function(t){return arguments.length?(n=t,o):n},o.copy=function(){return io(e,r).unknown(n)},Qn.apply(o,arguments),o}function ao(){var t,e,r=io().unknown(void 0),n=r.domain,o=r.range,i=0,a=1,c=!1,u=0,l=0,s=.5;function f(){var r=n().length,f=a<i,p=f?a:i,h=f?i:a;t=(h-p)/Math.max(1,r-u+2*l),c&&(t=Math.floor(t)),p+=(h-p-t*(r-u))*s,e=t*(1-u),c&&(p=Math.round(p),e=Math.round(e));var d=function(t,e,r){t=+t,e=+e,r=(o=arguments.length)<2?(e=t,t=0,1):o<3?1:+r;for(var n=-1,o=0|Math.max(0,Math.ceil((e-t)/r)),i=new Array(o);++n<o;)i[n]=t+n*r;return i}(r).map((function(e){return p+t*e}));return o(f?d.reverse():d)}return delete r.unknown,r.domain=function(t){return arguments.length?(n(t),f()):n()},r.range=function(t){return arguments.length?([i,a]=t,i=+i,a=+a,f()):[i,a]},r.rangeRound=function(t){return[i,a]=t,i=+i,a=+a,c=!0,f()},r.bandwidth=function(){return e},r.step=function(){return t},r.round=function(t){return arguments.length?(c=!!t,f()):c},r.padding=function(t){return arguments.length?(u=Math.min(1,l=+t),f()):u},r.paddingInner=function(t){return arguments.length?(u=Math.min(1,t),f()):u},r.paddingOuter=function(t){return arguments.length?(l=+t,f()):l},r.align=function(t){return arguments.length?(s=Math.max(0,Math.min(1,t)),f()):s},r.copy=function(){return ao(n(),[i,a]).round(c).paddingInner(u).paddingOuter(l).align(s)},Qn.apply(f(),arguments)}function co(t){var e=t.copy;return t.padding=t.paddingOuter,delete t.paddingInner,delete t.paddingOuter,t.copy=function(){return co(e())},t}function uo(){return co(ao.apply(null,arguments).paddingInner(1))}function lo(t){return lo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},lo(t)}function so(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function fo(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?so(Object(r),!0).forEach((function(e){po(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):so(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function po(t,e,r){var n;return n=function(t){if("object"!=lo(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=lo(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==lo(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var ho={widthCache:{},cacheCount:0},yo={position:"absolute",top:"-20000px",left:0,padding:0,margin:0,border:"none",whiteSpace:"pre"},vo="recharts_measurement_span",mo=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(null==t||Vt.isSsr)return{width:0,height:0};var r,n=(r=fo({},e),Object.keys(r).forEach((function(t){r[t]||delete r[t]})),r),o=JSON.stringify({text:t,copyStyle:n});if(ho.widthCache[o])return ho.widthCache[o];try{var i=document.getElementById(vo);i||((i=document.createElement("span")).setAttribute("id",vo),i.setAttribute("aria-hidden","true"),document.body.appendChild(i));var a=fo(fo({},yo),n);Object.assign(i.style,a),i.textContent="".concat(t);var c=i.getBoundingClientRect(),u={width:c.width,height:c.height};return ho.widthCache[o]=u,++ho.cacheCount>2e3&&(ho.cacheCount=0,ho.widthCache={}),u}catch(t){return{width:0,height:0}}};function bo(t){return bo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},bo(t)}function go(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return xo(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?xo(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function xo(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function wo(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Oo(n.key),n)}}function Oo(t){var e=function(t){if("object"!=bo(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=bo(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==bo(e)?e:e+""}var jo=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,So=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,Po=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,Eo=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,Ao={cm:96/2.54,mm:96/25.4,pt:96/72,pc:16,in:96,Q:96/101.6,px:1},ko=Object.keys(Ao),_o="NaN",Mo=function(){function t(e,r){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.num=e,this.unit=r,this.num=e,this.unit=r,Number.isNaN(e)&&(this.unit=""),""===r||Po.test(r)||(this.num=NaN,this.unit=""),ko.includes(r)&&(this.num=function(t,e){return t*Ao[e]}(e,r),this.unit="px")}return e=t,n=[{key:"parse",value:function(e){var r,n=go(null!==(r=Eo.exec(e))&&void 0!==r?r:[],3),o=n[1],i=n[2];return new t(parseFloat(o),null!=i?i:"")}}],(r=[{key:"add",value:function(e){return this.unit!==e.unit?new t(NaN,""):new t(this.num+e.num,this.unit)}},{key:"subtract",value:function(e){return this.unit!==e.unit?new t(NaN,""):new t(this.num-e.num,this.unit)}},{key:"multiply",value:function(e){return""!==this.unit&&""!==e.unit&&this.unit!==e.unit?new t(NaN,""):new t(this.num*e.num,this.unit||e.unit)}},{key:"divide",value:function(e){return""!==this.unit&&""!==e.unit&&this.unit!==e.unit?new t(NaN,""):new t(this.num/e.num,this.unit||e.unit)}},{key:"toString",value:function(){return"".concat(this.num).concat(this.unit)}},{key:"isNaN",value:function(){return Number.isNaN(this.num)}}])&&wo(e.prototype,r),n&&wo(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,r,n}();function To(t){if(t.includes(_o))return _o;for(var e=t;e.includes("*")||e.includes("/");){var r,n=go(null!==(r=jo.exec(e))&&void 0!==r?r:[],4),o=n[1],i=n[2],a=n[3],c=Mo.parse(null!=o?o:""),u=Mo.parse(null!=a?a:""),l="*"===i?c.multiply(u):c.divide(u);if(l.isNaN())return _o;e=e.replace(jo,l.toString())}for(;e.includes("+")||/.-\d+(?:\.\d+)?/.test(e);){var s,f=go(null!==(s=So.exec(e))&&void 0!==s?s:[],4),p=f[1],h=f[2],d=f[3],y=Mo.parse(null!=p?p:""),v=Mo.parse(null!=d?d:""),m="+"===h?y.add(v):y.subtract(v);if(m.isNaN())return _o;e=e.replace(So,m.toString())}return e}var Co=/\(([^()]*)\)/;function Do(t){var e=function(t){try{return function(t){var e=t.replace(/\s+/g,"");return e=function(t){for(var e=t;e.includes("(");){var r=go(Co.exec(e),2)[1];e=e.replace(Co,To(r))}return e}(e),To(e)}(t)}catch(t){return _o}}(t.slice(5,-1));return e===_o?"":e}var Io=["x","y","lineHeight","capHeight","scaleToFit","textAnchor","verticalAnchor","fill"],No=["dx","dy","angle","className","breakAll"];function Bo(){return Bo=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Bo.apply(this,arguments)}function Ro(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function Lo(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return zo(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?zo(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function zo(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var Fo=/[ \f\n\r\t\v\u2028\u2029]+/,Uo=function(t){var e=t.children,r=t.breakAll,n=t.style;try{var o=[];return M()(e)||(o=r?e.toString().split(""):e.toString().split(Fo)),{wordsWithComputedWidth:o.map((function(t){return{word:t,width:mo(t,n).width}})),spaceWidth:r?0:mo(" ",n).width}}catch(t){return null}},$o=function(t){return[{words:M()(t)?[]:t.toString().split(Fo)}]},qo="#808080",Wo=function(t){var r=t.x,n=void 0===r?0:r,i=t.y,c=void 0===i?0:i,u=t.lineHeight,l=void 0===u?"1em":u,s=t.capHeight,f=void 0===s?"0.71em":s,p=t.scaleToFit,h=void 0!==p&&p,d=t.textAnchor,y=void 0===d?"start":d,v=t.verticalAnchor,m=void 0===v?"end":v,b=t.fill,w=void 0===b?qo:b,O=Ro(t,Io),j=(0,e.useMemo)((function(){return function(t){var e=t.width,r=t.scaleToFit,n=t.children,o=t.style,i=t.breakAll,a=t.maxLines;if((e||r)&&!Vt.isSsr){var c=Uo({breakAll:i,children:n,style:o});return c?function(t,e,r,n,o){var i=t.maxLines,a=t.children,c=t.style,u=t.breakAll,l=g(i),s=a,f=function(){return(arguments.length>0&&void 0!==arguments[0]?arguments[0]:[]).reduce((function(t,e){var i=e.word,a=e.width,c=t[t.length-1];if(c&&(null==n||o||c.width+a+r<Number(n)))c.words.push(i),c.width+=a+r;else{var u={words:[i],width:a};t.push(u)}return t}),[])},p=f(e);if(!l)return p;for(var h,d=function(t){var e=s.slice(0,t),r=Uo({breakAll:u,style:c,children:e+"…"}).wordsWithComputedWidth,o=f(r),a=o.length>i||function(t){return t.reduce((function(t,e){return t.width>e.width?t:e}))}(o).width>Number(n);return[a,o]},y=0,v=s.length-1,m=0;y<=v&&m<=s.length-1;){var b=Math.floor((y+v)/2),x=Lo(d(b-1),2),w=x[0],O=x[1],j=Lo(d(b),1)[0];if(w||j||(y=b+1),w&&j&&(v=b-1),!w&&j){h=O;break}m++}return h||p}({breakAll:i,children:n,maxLines:a,style:o},c.wordsWithComputedWidth,c.spaceWidth,e,r):$o(n)}return $o(n)}({breakAll:O.breakAll,children:O.children,maxLines:O.maxLines,scaleToFit:h,style:O.style,width:O.width})}),[O.breakAll,O.children,O.maxLines,h,O.style,O.width]),S=O.dx,P=O.dy,E=O.angle,A=O.className,k=O.breakAll,_=Ro(O,No);if(!x(n)||!x(c))return null;var M,T=n+(g(S)?S:0),C=c+(g(P)?P:0);switch(m){case"start":M=Do("calc(".concat(f,")"));break;case"middle":M=Do("calc(".concat((j.length-1)/2," * -").concat(l," + (").concat(f," / 2))"));break;default:M=Do("calc(".concat(j.length-1," * -").concat(l,")"))}var D=[];if(h){var I=j[0].width,N=O.width;D.push("scale(".concat((g(N)?N/I:1)/I,")"))}return E&&D.push("rotate(".concat(E,", ").concat(T,", ").concat(C,")")),D.length&&(_.transform=D.join(" ")),o().createElement("text",Bo({},nt(_,!0),{x:T,y:C,className:a("recharts-text",A),textAnchor:y,fill:w.includes("url")?qo:w}),j.map((function(t,e){var r=t.words.join(k?"":" ");return o().createElement("tspan",{x:T,dy:0===e?M:l,key:"".concat(r,"-").concat(e)},r)})))};const Xo=Math.sqrt(50),Ho=Math.sqrt(10),Go=Math.sqrt(2);function Vo(t,e,r){const n=(e-t)/Math.max(0,r),o=Math.floor(Math.log10(n)),i=n/Math.pow(10,o),a=i>=Xo?10:i>=Ho?5:i>=Go?2:1;let c,u,l;return o<0?(l=Math.pow(10,-o)/a,c=Math.round(t*l),u=Math.round(e*l),c/l<t&&++c,u/l>e&&--u,l=-l):(l=Math.pow(10,o)*a,c=Math.round(t/l),u=Math.round(e/l),c*l<t&&++c,u*l>e&&--u),u<c&&.5<=r&&r<2?Vo(t,e,2*r):[c,u,l]}function Yo(t,e,r){if(!((r=+r)>0))return[];if((t=+t)==(e=+e))return[t];const n=e<t,[o,i,a]=n?Vo(e,t,r):Vo(t,e,r);if(!(i>=o))return[];const c=i-o+1,u=new Array(c);if(n)if(a<0)for(let t=0;t<c;++t)u[t]=(i-t)/-a;else for(let t=0;t<c;++t)u[t]=(i-t)*a;else if(a<0)for(let t=0;t<c;++t)u[t]=(o+t)/-a;else for(let t=0;t<c;++t)u[t]=(o+t)*a;return u}function Ko(t,e,r){return Vo(t=+t,e=+e,r=+r)[2]}function Zo(t,e,r){r=+r;const n=(e=+e)<(t=+t),o=n?Ko(e,t,r):Ko(t,e,r);return(n?-1:1)*(o<0?1/-o:o)}function Jo(t,e){return null==t||null==e?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Qo(t,e){return null==t||null==e?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function ti(t){let e,r,n;function o(t,n,o=0,i=t.length){if(o<i){if(0!==e(n,n))return i;do{const e=o+i>>>1;r(t[e],n)<0?o=e+1:i=e}while(o<i)}return o}return 2!==t.length?(e=Jo,r=(e,r)=>Jo(t(e),r),n=(e,r)=>t(e)-r):(e=t===Jo||t===Qo?t:ei,r=t,n=t),{left:o,center:function(t,e,r=0,i=t.length){const a=o(t,e,r,i-1);return a>r&&n(t[a-1],e)>-n(t[a],e)?a-1:a},right:function(t,n,o=0,i=t.length){if(o<i){if(0!==e(n,n))return i;do{const e=o+i>>>1;r(t[e],n)<=0?o=e+1:i=e}while(o<i)}return o}}}function ei(){return 0}function ri(t){return null===t?NaN:+t}const ni=ti(Jo),oi=ni.right,ii=(ni.left,ti(ri).center,oi);function ai(t,e,r){t.prototype=e.prototype=r,r.constructor=t}function ci(t,e){var r=Object.create(t.prototype);for(var n in e)r[n]=e[n];return r}function ui(){}var li=.7,si=1/li,fi="\\s*([+-]?\\d+)\\s*",pi="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",hi="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",di=/^#([0-9a-f]{3,8})$/,yi=new RegExp(`^rgb\\(${fi},${fi},${fi}\\)$`),vi=new RegExp(`^rgb\\(${hi},${hi},${hi}\\)$`),mi=new RegExp(`^rgba\\(${fi},${fi},${fi},${pi}\\)$`),bi=new RegExp(`^rgba\\(${hi},${hi},${hi},${pi}\\)$`),gi=new RegExp(`^hsl\\(${pi},${hi},${hi}\\)$`),xi=new RegExp(`^hsla\\(${pi},${hi},${hi},${pi}\\)$`),wi={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function Oi(){return this.rgb().formatHex()}function ji(){return this.rgb().formatRgb()}function Si(t){var e,r;return t=(t+"").trim().toLowerCase(),(e=di.exec(t))?(r=e[1].length,e=parseInt(e[1],16),6===r?Pi(e):3===r?new ki(e>>8&15|e>>4&240,e>>4&15|240&e,(15&e)<<4|15&e,1):8===r?Ei(e>>24&255,e>>16&255,e>>8&255,(255&e)/255):4===r?Ei(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|240&e,((15&e)<<4|15&e)/255):null):(e=yi.exec(t))?new ki(e[1],e[2],e[3],1):(e=vi.exec(t))?new ki(255*e[1]/100,255*e[2]/100,255*e[3]/100,1):(e=mi.exec(t))?Ei(e[1],e[2],e[3],e[4]):(e=bi.exec(t))?Ei(255*e[1]/100,255*e[2]/100,255*e[3]/100,e[4]):(e=gi.exec(t))?Ii(e[1],e[2]/100,e[3]/100,1):(e=xi.exec(t))?Ii(e[1],e[2]/100,e[3]/100,e[4]):wi.hasOwnProperty(t)?Pi(wi[t]):"transparent"===t?new ki(NaN,NaN,NaN,0):null}function Pi(t){return new ki(t>>16&255,t>>8&255,255&t,1)}function Ei(t,e,r,n){return n<=0&&(t=e=r=NaN),new ki(t,e,r,n)}function Ai(t,e,r,n){return 1===arguments.length?((o=t)instanceof ui||(o=Si(o)),o?new ki((o=o.rgb()).r,o.g,o.b,o.opacity):new ki):new ki(t,e,r,null==n?1:n);var o}function ki(t,e,r,n){this.r=+t,this.g=+e,this.b=+r,this.opacity=+n}function _i(){return`#${Di(this.r)}${Di(this.g)}${Di(this.b)}`}function Mi(){const t=Ti(this.opacity);return`${1===t?"rgb(":"rgba("}${Ci(this.r)}, ${Ci(this.g)}, ${Ci(this.b)}${1===t?")":`, ${t})`}`}function Ti(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function Ci(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function Di(t){return((t=Ci(t))<16?"0":"")+t.toString(16)}function Ii(t,e,r,n){return n<=0?t=e=r=NaN:r<=0||r>=1?t=e=NaN:e<=0&&(t=NaN),new Bi(t,e,r,n)}function Ni(t){if(t instanceof Bi)return new Bi(t.h,t.s,t.l,t.opacity);if(t instanceof ui||(t=Si(t)),!t)return new Bi;if(t instanceof Bi)return t;var e=(t=t.rgb()).r/255,r=t.g/255,n=t.b/255,o=Math.min(e,r,n),i=Math.max(e,r,n),a=NaN,c=i-o,u=(i+o)/2;return c?(a=e===i?(r-n)/c+6*(r<n):r===i?(n-e)/c+2:(e-r)/c+4,c/=u<.5?i+o:2-i-o,a*=60):c=u>0&&u<1?0:a,new Bi(a,c,u,t.opacity)}function Bi(t,e,r,n){this.h=+t,this.s=+e,this.l=+r,this.opacity=+n}function Ri(t){return(t=(t||0)%360)<0?t+360:t}function Li(t){return Math.max(0,Math.min(1,t||0))}function zi(t,e,r){return 255*(t<60?e+(r-e)*t/60:t<180?r:t<240?e+(r-e)*(240-t)/60:e)}function Fi(t,e,r,n,o){var i=t*t,a=i*t;return((1-3*t+3*i-a)*e+(4-6*i+3*a)*r+(1+3*t+3*i-3*a)*n+a*o)/6}ai(ui,Si,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:Oi,formatHex:Oi,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return Ni(this).formatHsl()},formatRgb:ji,toString:ji}),ai(ki,Ai,ci(ui,{brighter(t){return t=null==t?si:Math.pow(si,t),new ki(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=null==t?li:Math.pow(li,t),new ki(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new ki(Ci(this.r),Ci(this.g),Ci(this.b),Ti(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:_i,formatHex:_i,formatHex8:function(){return`#${Di(this.r)}${Di(this.g)}${Di(this.b)}${Di(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:Mi,toString:Mi})),ai(Bi,(function(t,e,r,n){return 1===arguments.length?Ni(t):new Bi(t,e,r,null==n?1:n)}),ci(ui,{brighter(t){return t=null==t?si:Math.pow(si,t),new Bi(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=null==t?li:Math.pow(li,t),new Bi(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+360*(this.h<0),e=isNaN(t)||isNaN(this.s)?0:this.s,r=this.l,n=r+(r<.5?r:1-r)*e,o=2*r-n;return new ki(zi(t>=240?t-240:t+120,o,n),zi(t,o,n),zi(t<120?t+240:t-120,o,n),this.opacity)},clamp(){return new Bi(Ri(this.h),Li(this.s),Li(this.l),Ti(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const t=Ti(this.opacity);return`${1===t?"hsl(":"hsla("}${Ri(this.h)}, ${100*Li(this.s)}%, ${100*Li(this.l)}%${1===t?")":`, ${t})`}`}}));const Ui=t=>()=>t;function $i(t,e){var r=e-t;return r?function(t,e){return function(r){return t+r*e}}(t,r):Ui(isNaN(t)?e:t)}const qi=function t(e){var r=function(t){return 1==(t=+t)?$i:function(e,r){return r-e?function(t,e,r){return t=Math.pow(t,r),e=Math.pow(e,r)-t,r=1/r,function(n){return Math.pow(t+n*e,r)}}(e,r,t):Ui(isNaN(e)?r:e)}}(e);function n(t,e){var n=r((t=Ai(t)).r,(e=Ai(e)).r),o=r(t.g,e.g),i=r(t.b,e.b),a=$i(t.opacity,e.opacity);return function(e){return t.r=n(e),t.g=o(e),t.b=i(e),t.opacity=a(e),t+""}}return n.gamma=t,n}(1);function Wi(t){return function(e){var r,n,o=e.length,i=new Array(o),a=new Array(o),c=new Array(o);for(r=0;r<o;++r)n=Ai(e[r]),i[r]=n.r||0,a[r]=n.g||0,c[r]=n.b||0;return i=t(i),a=t(a),c=t(c),n.opacity=1,function(t){return n.r=i(t),n.g=a(t),n.b=c(t),n+""}}}function Xi(t,e){var r,n=e?e.length:0,o=t?Math.min(n,t.length):0,i=new Array(o),a=new Array(n);for(r=0;r<o;++r)i[r]=Qi(t[r],e[r]);for(;r<n;++r)a[r]=e[r];return function(t){for(r=0;r<o;++r)a[r]=i[r](t);return a}}function Hi(t,e){var r=new Date;return t=+t,e=+e,function(n){return r.setTime(t*(1-n)+e*n),r}}function Gi(t,e){return t=+t,e=+e,function(r){return t*(1-r)+e*r}}function Vi(t,e){var r,n={},o={};for(r in null!==t&&"object"==typeof t||(t={}),null!==e&&"object"==typeof e||(e={}),e)r in t?n[r]=Qi(t[r],e[r]):o[r]=e[r];return function(t){for(r in n)o[r]=n[r](t);return o}}Wi((function(t){var e=t.length-1;return function(r){var n=r<=0?r=0:r>=1?(r=1,e-1):Math.floor(r*e),o=t[n],i=t[n+1],a=n>0?t[n-1]:2*o-i,c=n<e-1?t[n+2]:2*i-o;return Fi((r-n/e)*e,a,o,i,c)}})),Wi((function(t){var e=t.length;return function(r){var n=Math.floor(((r%=1)<0?++r:r)*e),o=t[(n+e-1)%e],i=t[n%e],a=t[(n+1)%e],c=t[(n+2)%e];return Fi((r-n/e)*e,o,i,a,c)}}));var Yi=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Ki=new RegExp(Yi.source,"g");function Zi(t,e){var r,n,o,i=Yi.lastIndex=Ki.lastIndex=0,a=-1,c=[],u=[];for(t+="",e+="";(r=Yi.exec(t))&&(n=Ki.exec(e));)(o=n.index)>i&&(o=e.slice(i,o),c[a]?c[a]+=o:c[++a]=o),(r=r[0])===(n=n[0])?c[a]?c[a]+=n:c[++a]=n:(c[++a]=null,u.push({i:a,x:Gi(r,n)})),i=Ki.lastIndex;return i<e.length&&(o=e.slice(i),c[a]?c[a]+=o:c[++a]=o),c.length<2?u[0]?function(t){return function(e){return t(e)+""}}(u[0].x):function(t){return function(){return t}}(e):(e=u.length,function(t){for(var r,n=0;n<e;++n)c[(r=u[n]).i]=r.x(t);return c.join("")})}function Ji(t,e){e||(e=[]);var r,n=t?Math.min(e.length,t.length):0,o=e.slice();return function(i){for(r=0;r<n;++r)o[r]=t[r]*(1-i)+e[r]*i;return o}}function Qi(t,e){var r,n,o=typeof e;return null==e||"boolean"===o?Ui(e):("number"===o?Gi:"string"===o?(r=Si(e))?(e=r,qi):Zi:e instanceof Si?qi:e instanceof Date?Hi:(n=e,!ArrayBuffer.isView(n)||n instanceof DataView?Array.isArray(e)?Xi:"function"!=typeof e.valueOf&&"function"!=typeof e.toString||isNaN(e)?Vi:Gi:Ji))(t,e)}function ta(t,e){return t=+t,e=+e,function(r){return Math.round(t*(1-r)+e*r)}}function ea(t){return+t}var ra=[0,1];function na(t){return t}function oa(t,e){return(e-=t=+t)?function(r){return(r-t)/e}:(r=isNaN(e)?NaN:.5,function(){return r});var r}function ia(t,e,r){var n=t[0],o=t[1],i=e[0],a=e[1];return o<n?(n=oa(o,n),i=r(a,i)):(n=oa(n,o),i=r(i,a)),function(t){return i(n(t))}}function aa(t,e,r){var n=Math.min(t.length,e.length)-1,o=new Array(n),i=new Array(n),a=-1;for(t[n]<t[0]&&(t=t.slice().reverse(),e=e.slice().reverse());++a<n;)o[a]=oa(t[a],t[a+1]),i[a]=r(e[a],e[a+1]);return function(e){var r=ii(t,e,1,n)-1;return i[r](o[r](e))}}function ca(t,e){return e.domain(t.domain()).range(t.range()).interpolate(t.interpolate()).clamp(t.clamp()).unknown(t.unknown())}function ua(){var t,e,r,n,o,i,a=ra,c=ra,u=Qi,l=na;function s(){var t=Math.min(a.length,c.length);return l!==na&&(l=function(t,e){var r;return t>e&&(r=t,t=e,e=r),function(r){return Math.max(t,Math.min(e,r))}}(a[0],a[t-1])),n=t>2?aa:ia,o=i=null,f}function f(e){return null==e||isNaN(e=+e)?r:(o||(o=n(a.map(t),c,u)))(t(l(e)))}return f.invert=function(r){return l(e((i||(i=n(c,a.map(t),Gi)))(r)))},f.domain=function(t){return arguments.length?(a=Array.from(t,ea),s()):a.slice()},f.range=function(t){return arguments.length?(c=Array.from(t),s()):c.slice()},f.rangeRound=function(t){return c=Array.from(t),u=ta,s()},f.clamp=function(t){return arguments.length?(l=!!t||na,s()):l!==na},f.interpolate=function(t){return arguments.length?(u=t,s()):u},f.unknown=function(t){return arguments.length?(r=t,f):r},function(r,n){return t=r,e=n,s()}}function la(){return ua()(na,na)}var sa,fa=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function pa(t){if(!(e=fa.exec(t)))throw new Error("invalid format: "+t);var e;return new ha({fill:e[1],align:e[2],sign:e[3],symbol:e[4],zero:e[5],width:e[6],comma:e[7],precision:e[8]&&e[8].slice(1),trim:e[9],type:e[10]})}function ha(t){this.fill=void 0===t.fill?" ":t.fill+"",this.align=void 0===t.align?">":t.align+"",this.sign=void 0===t.sign?"-":t.sign+"",this.symbol=void 0===t.symbol?"":t.symbol+"",this.zero=!!t.zero,this.width=void 0===t.width?void 0:+t.width,this.comma=!!t.comma,this.precision=void 0===t.precision?void 0:+t.precision,this.trim=!!t.trim,this.type=void 0===t.type?"":t.type+""}function da(t,e){if((r=(t=e?t.toExponential(e-1):t.toExponential()).indexOf("e"))<0)return null;var r,n=t.slice(0,r);return[n.length>1?n[0]+n.slice(2):n,+t.slice(r+1)]}function ya(t){return(t=da(Math.abs(t)))?t[1]:NaN}function va(t,e){var r=da(t,e);if(!r)return t+"";var n=r[0],o=r[1];return o<0?"0."+new Array(-o).join("0")+n:n.length>o+1?n.slice(0,o+1)+"."+n.slice(o+1):n+new Array(o-n.length+2).join("0")}pa.prototype=ha.prototype,ha.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};const ma={"%":(t,e)=>(100*t).toFixed(e),b:t=>Math.round(t).toString(2),c:t=>t+"",d:function(t){return Math.abs(t=Math.round(t))>=1e21?t.toLocaleString("en").replace(/,/g,""):t.toString(10)},e:(t,e)=>t.toExponential(e),f:(t,e)=>t.toFixed(e),g:(t,e)=>t.toPrecision(e),o:t=>Math.round(t).toString(8),p:(t,e)=>va(100*t,e),r:va,s:function(t,e){var r=da(t,e);if(!r)return t+"";var n=r[0],o=r[1],i=o-(sa=3*Math.max(-8,Math.min(8,Math.floor(o/3))))+1,a=n.length;return i===a?n:i>a?n+new Array(i-a+1).join("0"):i>0?n.slice(0,i)+"."+n.slice(i):"0."+new Array(1-i).join("0")+da(t,Math.max(0,e+i-1))[0]},X:t=>Math.round(t).toString(16).toUpperCase(),x:t=>Math.round(t).toString(16)};function ba(t){return t}var ga,xa,wa,Oa=Array.prototype.map,ja=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];function Sa(t,e,r,n){var o,i=Zo(t,e,r);switch((n=pa(null==n?",f":n)).type){case"s":var a=Math.max(Math.abs(t),Math.abs(e));return null!=n.precision||isNaN(o=function(t,e){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(ya(e)/3)))-ya(Math.abs(t)))}(i,a))||(n.precision=o),wa(n,a);case"":case"e":case"g":case"p":case"r":null!=n.precision||isNaN(o=function(t,e){return t=Math.abs(t),e=Math.abs(e)-t,Math.max(0,ya(e)-ya(t))+1}(i,Math.max(Math.abs(t),Math.abs(e))))||(n.precision=o-("e"===n.type));break;case"f":case"%":null!=n.precision||isNaN(o=function(t){return Math.max(0,-ya(Math.abs(t)))}(i))||(n.precision=o-2*("%"===n.type))}return xa(n)}function Pa(t){var e=t.domain;return t.ticks=function(t){var r=e();return Yo(r[0],r[r.length-1],null==t?10:t)},t.tickFormat=function(t,r){var n=e();return Sa(n[0],n[n.length-1],null==t?10:t,r)},t.nice=function(r){null==r&&(r=10);var n,o,i=e(),a=0,c=i.length-1,u=i[a],l=i[c],s=10;for(l<u&&(o=u,u=l,l=o,o=a,a=c,c=o);s-- >0;){if((o=Ko(u,l,r))===n)return i[a]=u,i[c]=l,e(i);if(o>0)u=Math.floor(u/o)*o,l=Math.ceil(l/o)*o;else{if(!(o<0))break;u=Math.ceil(u*o)/o,l=Math.floor(l*o)/o}n=o}return t},t}function Ea(){var t=la();return t.copy=function(){return ca(t,Ea())},Qn.apply(t,arguments),Pa(t)}function Aa(t){var e;function r(t){return null==t||isNaN(t=+t)?e:t}return r.invert=r,r.domain=r.range=function(e){return arguments.length?(t=Array.from(e,ea),r):t.slice()},r.unknown=function(t){return arguments.length?(e=t,r):e},r.copy=function(){return Aa(t).unknown(e)},t=arguments.length?Array.from(t,ea):[0,1],Pa(r)}function ka(t,e){var r,n=0,o=(t=t.slice()).length-1,i=t[n],a=t[o];return a<i&&(r=n,n=o,o=r,r=i,i=a,a=r),t[n]=e.floor(i),t[o]=e.ceil(a),t}function _a(t){return Math.log(t)}function Ma(t){return Math.exp(t)}function Ta(t){return-Math.log(-t)}function Ca(t){return-Math.exp(-t)}function Da(t){return isFinite(t)?+("1e"+t):t<0?0:t}function Ia(t){return(e,r)=>-t(-e,r)}function Na(t){const e=t(_a,Ma),r=e.domain;let n,o,i=10;function a(){return n=function(t){return t===Math.E?Math.log:10===t&&Math.log10||2===t&&Math.log2||(t=Math.log(t),e=>Math.log(e)/t)}(i),o=function(t){return 10===t?Da:t===Math.E?Math.exp:e=>Math.pow(t,e)}(i),r()[0]<0?(n=Ia(n),o=Ia(o),t(Ta,Ca)):t(_a,Ma),e}return e.base=function(t){return arguments.length?(i=+t,a()):i},e.domain=function(t){return arguments.length?(r(t),a()):r()},e.ticks=t=>{const e=r();let a=e[0],c=e[e.length-1];const u=c<a;u&&([a,c]=[c,a]);let l,s,f=n(a),p=n(c);const h=null==t?10:+t;let d=[];if(!(i%1)&&p-f<h){if(f=Math.floor(f),p=Math.ceil(p),a>0){for(;f<=p;++f)for(l=1;l<i;++l)if(s=f<0?l/o(-f):l*o(f),!(s<a)){if(s>c)break;d.push(s)}}else for(;f<=p;++f)for(l=i-1;l>=1;--l)if(s=f>0?l/o(-f):l*o(f),!(s<a)){if(s>c)break;d.push(s)}2*d.length<h&&(d=Yo(a,c,h))}else d=Yo(f,p,Math.min(p-f,h)).map(o);return u?d.reverse():d},e.tickFormat=(t,r)=>{if(null==t&&(t=10),null==r&&(r=10===i?"s":","),"function"!=typeof r&&(i%1||null!=(r=pa(r)).precision||(r.trim=!0),r=xa(r)),t===1/0)return r;const a=Math.max(1,i*t/e.ticks().length);return t=>{let e=t/o(Math.round(n(t)));return e*i<i-.5&&(e*=i),e<=a?r(t):""}},e.nice=()=>r(ka(r(),{floor:t=>o(Math.floor(n(t))),ceil:t=>o(Math.ceil(n(t)))})),e}function Ba(){const t=Na(ua()).domain([1,10]);return t.copy=()=>ca(t,Ba()).base(t.base()),Qn.apply(t,arguments),t}function Ra(t){return function(e){return Math.sign(e)*Math.log1p(Math.abs(e/t))}}function La(t){return function(e){return Math.sign(e)*Math.expm1(Math.abs(e))*t}}function za(t){var e=1,r=t(Ra(e),La(e));return r.constant=function(r){return arguments.length?t(Ra(e=+r),La(e)):e},Pa(r)}function Fa(){var t=za(ua());return t.copy=function(){return ca(t,Fa()).constant(t.constant())},Qn.apply(t,arguments)}function Ua(t){return function(e){return e<0?-Math.pow(-e,t):Math.pow(e,t)}}function $a(t){return t<0?-Math.sqrt(-t):Math.sqrt(t)}function qa(t){return t<0?-t*t:t*t}function Wa(t){var e=t(na,na),r=1;return e.exponent=function(e){return arguments.length?1==(r=+e)?t(na,na):.5===r?t($a,qa):t(Ua(r),Ua(1/r)):r},Pa(e)}function Xa(){var t=Wa(ua());return t.copy=function(){return ca(t,Xa()).exponent(t.exponent())},Qn.apply(t,arguments),t}function Ha(){return Xa.apply(null,arguments).exponent(.5)}function Ga(t){return Math.sign(t)*t*t}function Va(){var t,e=la(),r=[0,1],n=!1;function o(r){var o=function(t){return Math.sign(t)*Math.sqrt(Math.abs(t))}(e(r));return isNaN(o)?t:n?Math.round(o):o}return o.invert=function(t){return e.invert(Ga(t))},o.domain=function(t){return arguments.length?(e.domain(t),o):e.domain()},o.range=function(t){return arguments.length?(e.range((r=Array.from(t,ea)).map(Ga)),o):r.slice()},o.rangeRound=function(t){return o.range(t).round(!0)},o.round=function(t){return arguments.length?(n=!!t,o):n},o.clamp=function(t){return arguments.length?(e.clamp(t),o):e.clamp()},o.unknown=function(e){return arguments.length?(t=e,o):t},o.copy=function(){return Va(e.domain(),r).round(n).clamp(e.clamp()).unknown(t)},Qn.apply(o,arguments),Pa(o)}function Ya(t,e){let r;if(void 0===e)for(const e of t)null!=e&&(r<e||void 0===r&&e>=e)&&(r=e);else{let n=-1;for(let o of t)null!=(o=e(o,++n,t))&&(r<o||void 0===r&&o>=o)&&(r=o)}return r}function Ka(t,e){let r;if(void 0===e)for(const e of t)null!=e&&(r>e||void 0===r&&e>=e)&&(r=e);else{let n=-1;for(let o of t)null!=(o=e(o,++n,t))&&(r>o||void 0===r&&o>=o)&&(r=o)}return r}function Za(t,e){return(null==t||!(t>=t))-(null==e||!(e>=e))||(t<e?-1:t>e?1:0)}function Ja(t,e,r=0,n=1/0,o){if(e=Math.floor(e),r=Math.floor(Math.max(0,r)),n=Math.floor(Math.min(t.length-1,n)),!(r<=e&&e<=n))return t;for(o=void 0===o?Za:function(t=Jo){if(t===Jo)return Za;if("function"!=typeof t)throw new TypeError("compare is not a function");return(e,r)=>{const n=t(e,r);return n||0===n?n:(0===t(r,r))-(0===t(e,e))}}(o);n>r;){if(n-r>600){const i=n-r+1,a=e-r+1,c=Math.log(i),u=.5*Math.exp(2*c/3),l=.5*Math.sqrt(c*u*(i-u)/i)*(a-i/2<0?-1:1);Ja(t,e,Math.max(r,Math.floor(e-a*u/i+l)),Math.min(n,Math.floor(e+(i-a)*u/i+l)),o)}const i=t[e];let a=r,c=n;for(Qa(t,r,e),o(t[n],i)>0&&Qa(t,r,n);a<c;){for(Qa(t,a,c),++a,--c;o(t[a],i)<0;)++a;for(;o(t[c],i)>0;)--c}0===o(t[r],i)?Qa(t,r,c):(++c,Qa(t,c,n)),c<=e&&(r=c+1),e<=c&&(n=c-1)}return t}function Qa(t,e,r){const n=t[e];t[e]=t[r],t[r]=n}function tc(t,e,r=ri){if((n=t.length)&&!isNaN(e=+e)){if(e<=0||n<2)return+r(t[0],0,t);if(e>=1)return+r(t[n-1],n-1,t);var n,o=(n-1)*e,i=Math.floor(o),a=+r(t[i],i,t);return a+(+r(t[i+1],i+1,t)-a)*(o-i)}}function ec(){var t,e=[],r=[],n=[];function o(){var t=0,o=Math.max(1,r.length);for(n=new Array(o-1);++t<o;)n[t-1]=tc(e,t/o);return i}function i(e){return null==e||isNaN(e=+e)?t:r[ii(n,e)]}return i.invertExtent=function(t){var o=r.indexOf(t);return o<0?[NaN,NaN]:[o>0?n[o-1]:e[0],o<n.length?n[o]:e[e.length-1]]},i.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let r of t)null==r||isNaN(r=+r)||e.push(r);return e.sort(Jo),o()},i.range=function(t){return arguments.length?(r=Array.from(t),o()):r.slice()},i.unknown=function(e){return arguments.length?(t=e,i):t},i.quantiles=function(){return n.slice()},i.copy=function(){return ec().domain(e).range(r).unknown(t)},Qn.apply(i,arguments)}function rc(){var t,e=0,r=1,n=1,o=[.5],i=[0,1];function a(e){return null!=e&&e<=e?i[ii(o,e,0,n)]:t}function c(){var t=-1;for(o=new Array(n);++t<n;)o[t]=((t+1)*r-(t-n)*e)/(n+1);return a}return a.domain=function(t){return arguments.length?([e,r]=t,e=+e,r=+r,c()):[e,r]},a.range=function(t){return arguments.length?(n=(i=Array.from(t)).length-1,c()):i.slice()},a.invertExtent=function(t){var a=i.indexOf(t);return a<0?[NaN,NaN]:a<1?[e,o[0]]:a>=n?[o[n-1],r]:[o[a-1],o[a]]},a.unknown=function(e){return arguments.length?(t=e,a):a},a.thresholds=function(){return o.slice()},a.copy=function(){return rc().domain([e,r]).range(i).unknown(t)},Qn.apply(Pa(a),arguments)}function nc(){var t,e=[.5],r=[0,1],n=1;function o(o){return null!=o&&o<=o?r[ii(e,o,0,n)]:t}return o.domain=function(t){return arguments.length?(e=Array.from(t),n=Math.min(e.length,r.length-1),o):e.slice()},o.range=function(t){return arguments.length?(r=Array.from(t),n=Math.min(e.length,r.length-1),o):r.slice()},o.invertExtent=function(t){var n=r.indexOf(t);return[e[n-1],e[n]]},o.unknown=function(e){return arguments.length?(t=e,o):t},o.copy=function(){return nc().domain(e).range(r).unknown(t)},Qn.apply(o,arguments)}ga=function(t){var e,r,n=void 0===t.grouping||void 0===t.thousands?ba:(e=Oa.call(t.grouping,Number),r=t.thousands+"",function(t,n){for(var o=t.length,i=[],a=0,c=e[0],u=0;o>0&&c>0&&(u+c+1>n&&(c=Math.max(1,n-u)),i.push(t.substring(o-=c,o+c)),!((u+=c+1)>n));)c=e[a=(a+1)%e.length];return i.reverse().join(r)}),o=void 0===t.currency?"":t.currency[0]+"",i=void 0===t.currency?"":t.currency[1]+"",a=void 0===t.decimal?".":t.decimal+"",c=void 0===t.numerals?ba:function(t){return function(e){return e.replace(/[0-9]/g,(function(e){return t[+e]}))}}(Oa.call(t.numerals,String)),u=void 0===t.percent?"%":t.percent+"",l=void 0===t.minus?"−":t.minus+"",s=void 0===t.nan?"NaN":t.nan+"";function f(t){var e=(t=pa(t)).fill,r=t.align,f=t.sign,p=t.symbol,h=t.zero,d=t.width,y=t.comma,v=t.precision,m=t.trim,b=t.type;"n"===b?(y=!0,b="g"):ma[b]||(void 0===v&&(v=12),m=!0,b="g"),(h||"0"===e&&"="===r)&&(h=!0,e="0",r="=");var g="$"===p?o:"#"===p&&/[boxX]/.test(b)?"0"+b.toLowerCase():"",x="$"===p?i:/[%p]/.test(b)?u:"",w=ma[b],O=/[defgprs%]/.test(b);function j(t){var o,i,u,p=g,j=x;if("c"===b)j=w(t)+j,t="";else{var S=(t=+t)<0||1/t<0;if(t=isNaN(t)?s:w(Math.abs(t),v),m&&(t=function(t){t:for(var e,r=t.length,n=1,o=-1;n<r;++n)switch(t[n]){case".":o=e=n;break;case"0":0===o&&(o=n),e=n;break;default:if(!+t[n])break t;o>0&&(o=0)}return o>0?t.slice(0,o)+t.slice(e+1):t}(t)),S&&0==+t&&"+"!==f&&(S=!1),p=(S?"("===f?f:l:"-"===f||"("===f?"":f)+p,j=("s"===b?ja[8+sa/3]:"")+j+(S&&"("===f?")":""),O)for(o=-1,i=t.length;++o<i;)if(48>(u=t.charCodeAt(o))||u>57){j=(46===u?a+t.slice(o+1):t.slice(o))+j,t=t.slice(0,o);break}}y&&!h&&(t=n(t,1/0));var P=p.length+t.length+j.length,E=P<d?new Array(d-P+1).join(e):"";switch(y&&h&&(t=n(E+t,E.length?d-j.length:1/0),E=""),r){case"<":t=p+t+j+E;break;case"=":t=p+E+t+j;break;case"^":t=E.slice(0,P=E.length>>1)+p+t+j+E.slice(P);break;default:t=E+p+t+j}return c(t)}return v=void 0===v?6:/[gprs]/.test(b)?Math.max(1,Math.min(21,v)):Math.max(0,Math.min(20,v)),j.toString=function(){return t+""},j}return{format:f,formatPrefix:function(t,e){var r=f(((t=pa(t)).type="f",t)),n=3*Math.max(-8,Math.min(8,Math.floor(ya(e)/3))),o=Math.pow(10,-n),i=ja[8+n/3];return function(t){return r(o*t)+i}}}}({thousands:",",grouping:[3],currency:["$",""]}),xa=ga.format,wa=ga.formatPrefix;const oc=1e3,ic=6e4,ac=36e5,cc=864e5,uc=6048e5,lc=31536e6,sc=new Date,fc=new Date;function pc(t,e,r,n){function o(e){return t(e=0===arguments.length?new Date:new Date(+e)),e}return o.floor=e=>(t(e=new Date(+e)),e),o.ceil=r=>(t(r=new Date(r-1)),e(r,1),t(r),r),o.round=t=>{const e=o(t),r=o.ceil(t);return t-e<r-t?e:r},o.offset=(t,r)=>(e(t=new Date(+t),null==r?1:Math.floor(r)),t),o.range=(r,n,i)=>{const a=[];if(r=o.ceil(r),i=null==i?1:Math.floor(i),!(r<n&&i>0))return a;let c;do{a.push(c=new Date(+r)),e(r,i),t(r)}while(c<r&&r<n);return a},o.filter=r=>pc((e=>{if(e>=e)for(;t(e),!r(e);)e.setTime(e-1)}),((t,n)=>{if(t>=t)if(n<0)for(;++n<=0;)for(;e(t,-1),!r(t););else for(;--n>=0;)for(;e(t,1),!r(t););})),r&&(o.count=(e,n)=>(sc.setTime(+e),fc.setTime(+n),t(sc),t(fc),Math.floor(r(sc,fc))),o.every=t=>(t=Math.floor(t),isFinite(t)&&t>0?t>1?o.filter(n?e=>n(e)%t==0:e=>o.count(0,e)%t==0):o:null)),o}const hc=pc((()=>{}),((t,e)=>{t.setTime(+t+e)}),((t,e)=>e-t));hc.every=t=>(t=Math.floor(t),isFinite(t)&&t>0?t>1?pc((e=>{e.setTime(Math.floor(e/t)*t)}),((e,r)=>{e.setTime(+e+r*t)}),((e,r)=>(r-e)/t)):hc:null),hc.range;const dc=pc((t=>{t.setTime(t-t.getMilliseconds())}),((t,e)=>{t.setTime(+t+e*oc)}),((t,e)=>(e-t)/oc),(t=>t.getUTCSeconds())),yc=(dc.range,pc((t=>{t.setTime(t-t.getMilliseconds()-t.getSeconds()*oc)}),((t,e)=>{t.setTime(+t+e*ic)}),((t,e)=>(e-t)/ic),(t=>t.getMinutes()))),vc=(yc.range,pc((t=>{t.setUTCSeconds(0,0)}),((t,e)=>{t.setTime(+t+e*ic)}),((t,e)=>(e-t)/ic),(t=>t.getUTCMinutes()))),mc=(vc.range,pc((t=>{t.setTime(t-t.getMilliseconds()-t.getSeconds()*oc-t.getMinutes()*ic)}),((t,e)=>{t.setTime(+t+e*ac)}),((t,e)=>(e-t)/ac),(t=>t.getHours()))),bc=(mc.range,pc((t=>{t.setUTCMinutes(0,0,0)}),((t,e)=>{t.setTime(+t+e*ac)}),((t,e)=>(e-t)/ac),(t=>t.getUTCHours()))),gc=(bc.range,pc((t=>t.setHours(0,0,0,0)),((t,e)=>t.setDate(t.getDate()+e)),((t,e)=>(e-t-(e.getTimezoneOffset()-t.getTimezoneOffset())*ic)/cc),(t=>t.getDate()-1))),xc=(gc.range,pc((t=>{t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCDate(t.getUTCDate()+e)}),((t,e)=>(e-t)/cc),(t=>t.getUTCDate()-1))),wc=(xc.range,pc((t=>{t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCDate(t.getUTCDate()+e)}),((t,e)=>(e-t)/cc),(t=>Math.floor(t/cc))));function Oc(t){return pc((e=>{e.setDate(e.getDate()-(e.getDay()+7-t)%7),e.setHours(0,0,0,0)}),((t,e)=>{t.setDate(t.getDate()+7*e)}),((t,e)=>(e-t-(e.getTimezoneOffset()-t.getTimezoneOffset())*ic)/uc))}wc.range;const jc=Oc(0),Sc=Oc(1),Pc=Oc(2),Ec=Oc(3),Ac=Oc(4),kc=Oc(5),_c=Oc(6);function Mc(t){return pc((e=>{e.setUTCDate(e.getUTCDate()-(e.getUTCDay()+7-t)%7),e.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCDate(t.getUTCDate()+7*e)}),((t,e)=>(e-t)/uc))}jc.range,Sc.range,Pc.range,Ec.range,Ac.range,kc.range,_c.range;const Tc=Mc(0),Cc=Mc(1),Dc=Mc(2),Ic=Mc(3),Nc=Mc(4),Bc=Mc(5),Rc=Mc(6),Lc=(Tc.range,Cc.range,Dc.range,Ic.range,Nc.range,Bc.range,Rc.range,pc((t=>{t.setDate(1),t.setHours(0,0,0,0)}),((t,e)=>{t.setMonth(t.getMonth()+e)}),((t,e)=>e.getMonth()-t.getMonth()+12*(e.getFullYear()-t.getFullYear())),(t=>t.getMonth()))),zc=(Lc.range,pc((t=>{t.setUTCDate(1),t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCMonth(t.getUTCMonth()+e)}),((t,e)=>e.getUTCMonth()-t.getUTCMonth()+12*(e.getUTCFullYear()-t.getUTCFullYear())),(t=>t.getUTCMonth()))),Fc=(zc.range,pc((t=>{t.setMonth(0,1),t.setHours(0,0,0,0)}),((t,e)=>{t.setFullYear(t.getFullYear()+e)}),((t,e)=>e.getFullYear()-t.getFullYear()),(t=>t.getFullYear())));Fc.every=t=>isFinite(t=Math.floor(t))&&t>0?pc((e=>{e.setFullYear(Math.floor(e.getFullYear()/t)*t),e.setMonth(0,1),e.setHours(0,0,0,0)}),((e,r)=>{e.setFullYear(e.getFullYear()+r*t)})):null,Fc.range;const Uc=pc((t=>{t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCFullYear(t.getUTCFullYear()+e)}),((t,e)=>e.getUTCFullYear()-t.getUTCFullYear()),(t=>t.getUTCFullYear()));function $c(t,e,r,n,o,i){const a=[[dc,1,oc],[dc,5,5e3],[dc,15,15e3],[dc,30,3e4],[i,1,ic],[i,5,3e5],[i,15,9e5],[i,30,18e5],[o,1,ac],[o,3,108e5],[o,6,216e5],[o,12,432e5],[n,1,cc],[n,2,1728e5],[r,1,uc],[e,1,2592e6],[e,3,7776e6],[t,1,lc]];function c(e,r,n){const o=Math.abs(r-e)/n,i=ti((([,,t])=>t)).right(a,o);if(i===a.length)return t.every(Zo(e/lc,r/lc,n));if(0===i)return hc.every(Math.max(Zo(e,r,n),1));const[c,u]=a[o/a[i-1][2]<a[i][2]/o?i-1:i];return c.every(u)}return[function(t,e,r){const n=e<t;n&&([t,e]=[e,t]);const o=r&&"function"==typeof r.range?r:c(t,e,r),i=o?o.range(t,+e+1):[];return n?i.reverse():i},c]}Uc.every=t=>isFinite(t=Math.floor(t))&&t>0?pc((e=>{e.setUTCFullYear(Math.floor(e.getUTCFullYear()/t)*t),e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)}),((e,r)=>{e.setUTCFullYear(e.getUTCFullYear()+r*t)})):null,Uc.range;const[qc,Wc]=$c(Uc,zc,Tc,wc,bc,vc),[Xc,Hc]=$c(Fc,Lc,jc,gc,mc,yc);function Gc(t){if(0<=t.y&&t.y<100){var e=new Date(-1,t.m,t.d,t.H,t.M,t.S,t.L);return e.setFullYear(t.y),e}return new Date(t.y,t.m,t.d,t.H,t.M,t.S,t.L)}function Vc(t){if(0<=t.y&&t.y<100){var e=new Date(Date.UTC(-1,t.m,t.d,t.H,t.M,t.S,t.L));return e.setUTCFullYear(t.y),e}return new Date(Date.UTC(t.y,t.m,t.d,t.H,t.M,t.S,t.L))}function Yc(t,e,r){return{y:t,m:e,d:r,H:0,M:0,S:0,L:0}}var Kc,Zc,Jc,Qc={"-":"",_:" ",0:"0"},tu=/^\s*\d+/,eu=/^%/,ru=/[\\^$*+?|[\]().{}]/g;function nu(t,e,r){var n=t<0?"-":"",o=(n?-t:t)+"",i=o.length;return n+(i<r?new Array(r-i+1).join(e)+o:o)}function ou(t){return t.replace(ru,"\\$&")}function iu(t){return new RegExp("^(?:"+t.map(ou).join("|")+")","i")}function au(t){return new Map(t.map(((t,e)=>[t.toLowerCase(),e])))}function cu(t,e,r){var n=tu.exec(e.slice(r,r+1));return n?(t.w=+n[0],r+n[0].length):-1}function uu(t,e,r){var n=tu.exec(e.slice(r,r+1));return n?(t.u=+n[0],r+n[0].length):-1}function lu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.U=+n[0],r+n[0].length):-1}function su(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.V=+n[0],r+n[0].length):-1}function fu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.W=+n[0],r+n[0].length):-1}function pu(t,e,r){var n=tu.exec(e.slice(r,r+4));return n?(t.y=+n[0],r+n[0].length):-1}function hu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.y=+n[0]+(+n[0]>68?1900:2e3),r+n[0].length):-1}function du(t,e,r){var n=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(e.slice(r,r+6));return n?(t.Z=n[1]?0:-(n[2]+(n[3]||"00")),r+n[0].length):-1}function yu(t,e,r){var n=tu.exec(e.slice(r,r+1));return n?(t.q=3*n[0]-3,r+n[0].length):-1}function vu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.m=n[0]-1,r+n[0].length):-1}function mu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.d=+n[0],r+n[0].length):-1}function bu(t,e,r){var n=tu.exec(e.slice(r,r+3));return n?(t.m=0,t.d=+n[0],r+n[0].length):-1}function gu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.H=+n[0],r+n[0].length):-1}function xu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.M=+n[0],r+n[0].length):-1}function wu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.S=+n[0],r+n[0].length):-1}function Ou(t,e,r){var n=tu.exec(e.slice(r,r+3));return n?(t.L=+n[0],r+n[0].length):-1}function ju(t,e,r){var n=tu.exec(e.slice(r,r+6));return n?(t.L=Math.floor(n[0]/1e3),r+n[0].length):-1}function Su(t,e,r){var n=eu.exec(e.slice(r,r+1));return n?r+n[0].length:-1}function Pu(t,e,r){var n=tu.exec(e.slice(r));return n?(t.Q=+n[0],r+n[0].length):-1}function Eu(t,e,r){var n=tu.exec(e.slice(r));return n?(t.s=+n[0],r+n[0].length):-1}function Au(t,e){return nu(t.getDate(),e,2)}function ku(t,e){return nu(t.getHours(),e,2)}function _u(t,e){return nu(t.getHours()%12||12,e,2)}function Mu(t,e){return nu(1+gc.count(Fc(t),t),e,3)}function Tu(t,e){return nu(t.getMilliseconds(),e,3)}function Cu(t,e){return Tu(t,e)+"000"}function Du(t,e){return nu(t.getMonth()+1,e,2)}function Iu(t,e){return nu(t.getMinutes(),e,2)}function Nu(t,e){return nu(t.getSeconds(),e,2)}function Bu(t){var e=t.getDay();return 0===e?7:e}function Ru(t,e){return nu(jc.count(Fc(t)-1,t),e,2)}function Lu(t){var e=t.getDay();return e>=4||0===e?Ac(t):Ac.ceil(t)}function zu(t,e){return t=Lu(t),nu(Ac.count(Fc(t),t)+(4===Fc(t).getDay()),e,2)}function Fu(t){return t.getDay()}function Uu(t,e){return nu(Sc.count(Fc(t)-1,t),e,2)}function $u(t,e){return nu(t.getFullYear()%100,e,2)}function qu(t,e){return nu((t=Lu(t)).getFullYear()%100,e,2)}function Wu(t,e){return nu(t.getFullYear()%1e4,e,4)}function Xu(t,e){var r=t.getDay();return nu((t=r>=4||0===r?Ac(t):Ac.ceil(t)).getFullYear()%1e4,e,4)}function Hu(t){var e=t.getTimezoneOffset();return(e>0?"-":(e*=-1,"+"))+nu(e/60|0,"0",2)+nu(e%60,"0",2)}function Gu(t,e){return nu(t.getUTCDate(),e,2)}function Vu(t,e){return nu(t.getUTCHours(),e,2)}function Yu(t,e){return nu(t.getUTCHours()%12||12,e,2)}function Ku(t,e){return nu(1+xc.count(Uc(t),t),e,3)}function Zu(t,e){return nu(t.getUTCMilliseconds(),e,3)}function Ju(t,e){return Zu(t,e)+"000"}function Qu(t,e){return nu(t.getUTCMonth()+1,e,2)}function tl(t,e){return nu(t.getUTCMinutes(),e,2)}function el(t,e){return nu(t.getUTCSeconds(),e,2)}function rl(t){var e=t.getUTCDay();return 0===e?7:e}function nl(t,e){return nu(Tc.count(Uc(t)-1,t),e,2)}function ol(t){var e=t.getUTCDay();return e>=4||0===e?Nc(t):Nc.ceil(t)}function il(t,e){return t=ol(t),nu(Nc.count(Uc(t),t)+(4===Uc(t).getUTCDay()),e,2)}function al(t){return t.getUTCDay()}function cl(t,e){return nu(Cc.count(Uc(t)-1,t),e,2)}function ul(t,e){return nu(t.getUTCFullYear()%100,e,2)}function ll(t,e){return nu((t=ol(t)).getUTCFullYear()%100,e,2)}function sl(t,e){return nu(t.getUTCFullYear()%1e4,e,4)}function fl(t,e){var r=t.getUTCDay();return nu((t=r>=4||0===r?Nc(t):Nc.ceil(t)).getUTCFullYear()%1e4,e,4)}function pl(){return"+0000"}function hl(){return"%"}function dl(t){return+t}function yl(t){return Math.floor(+t/1e3)}function vl(t){return new Date(t)}function ml(t){return t instanceof Date?+t:+new Date(+t)}function bl(t,e,r,n,o,i,a,c,u,l){var s=la(),f=s.invert,p=s.domain,h=l(".%L"),d=l(":%S"),y=l("%I:%M"),v=l("%I %p"),m=l("%a %d"),b=l("%b %d"),g=l("%B"),x=l("%Y");function w(t){return(u(t)<t?h:c(t)<t?d:a(t)<t?y:i(t)<t?v:n(t)<t?o(t)<t?m:b:r(t)<t?g:x)(t)}return s.invert=function(t){return new Date(f(t))},s.domain=function(t){return arguments.length?p(Array.from(t,ml)):p().map(vl)},s.ticks=function(e){var r=p();return t(r[0],r[r.length-1],null==e?10:e)},s.tickFormat=function(t,e){return null==e?w:l(e)},s.nice=function(t){var r=p();return t&&"function"==typeof t.range||(t=e(r[0],r[r.length-1],null==t?10:t)),t?p(ka(r,t)):s},s.copy=function(){return ca(s,bl(t,e,r,n,o,i,a,c,u,l))},s}function gl(){return Qn.apply(bl(Xc,Hc,Fc,Lc,jc,gc,mc,yc,dc,Zc).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function xl(){return Qn.apply(bl(qc,Wc,Uc,zc,Tc,xc,bc,vc,dc,Jc).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function wl(){var t,e,r,n,o,i=0,a=1,c=na,u=!1;function l(e){return null==e||isNaN(e=+e)?o:c(0===r?.5:(e=(n(e)-t)*r,u?Math.max(0,Math.min(1,e)):e))}function s(t){return function(e){var r,n;return arguments.length?([r,n]=e,c=t(r,n),l):[c(0),c(1)]}}return l.domain=function(o){return arguments.length?([i,a]=o,t=n(i=+i),e=n(a=+a),r=t===e?0:1/(e-t),l):[i,a]},l.clamp=function(t){return arguments.length?(u=!!t,l):u},l.interpolator=function(t){return arguments.length?(c=t,l):c},l.range=s(Qi),l.rangeRound=s(ta),l.unknown=function(t){return arguments.length?(o=t,l):o},function(o){return n=o,t=o(i),e=o(a),r=t===e?0:1/(e-t),l}}function Ol(t,e){return e.domain(t.domain()).interpolator(t.interpolator()).clamp(t.clamp()).unknown(t.unknown())}function jl(){var t=Pa(wl()(na));return t.copy=function(){return Ol(t,jl())},to.apply(t,arguments)}function Sl(){var t=Na(wl()).domain([1,10]);return t.copy=function(){return Ol(t,Sl()).base(t.base())},to.apply(t,arguments)}function Pl(){var t=za(wl());return t.copy=function(){return Ol(t,Pl()).constant(t.constant())},to.apply(t,arguments)}function El(){var t=Wa(wl());return t.copy=function(){return Ol(t,El()).exponent(t.exponent())},to.apply(t,arguments)}function Al(){return El.apply(null,arguments).exponent(.5)}function kl(){var t=[],e=na;function r(r){if(null!=r&&!isNaN(r=+r))return e((ii(t,r,1)-1)/(t.length-1))}return r.domain=function(e){if(!arguments.length)return t.slice();t=[];for(let r of e)null==r||isNaN(r=+r)||t.push(r);return t.sort(Jo),r},r.interpolator=function(t){return arguments.length?(e=t,r):e},r.range=function(){return t.map(((r,n)=>e(n/(t.length-1))))},r.quantiles=function(e){return Array.from({length:e+1},((r,n)=>function(t,e,r){if(t=Float64Array.from(function*(t,e){if(void 0===e)for(let e of t)null!=e&&(e=+e)>=e&&(yield e);else{let r=-1;for(let n of t)null!=(n=e(n,++r,t))&&(n=+n)>=n&&(yield n)}}(t,r)),(n=t.length)&&!isNaN(e=+e)){if(e<=0||n<2)return Ka(t);if(e>=1)return Ya(t);var n,o=(n-1)*e,i=Math.floor(o),a=Ya(Ja(t,i).subarray(0,i+1));return a+(Ka(t.subarray(i+1))-a)*(o-i)}}(t,n/e)))},r.copy=function(){return kl(e).domain(t)},to.apply(r,arguments)}function _l(){var t,e,r,n,o,i,a,c=0,u=.5,l=1,s=1,f=na,p=!1;function h(t){return isNaN(t=+t)?a:(t=.5+((t=+i(t))-e)*(s*t<s*e?n:o),f(p?Math.max(0,Math.min(1,t)):t))}function d(t){return function(e){var r,n,o;return arguments.length?([r,n,o]=e,f=function(t,e){void 0===e&&(e=t,t=Qi);for(var r=0,n=e.length-1,o=e[0],i=new Array(n<0?0:n);r<n;)i[r]=t(o,o=e[++r]);return function(t){var e=Math.max(0,Math.min(n-1,Math.floor(t*=n)));return i[e](t-e)}}(t,[r,n,o]),h):[f(0),f(.5),f(1)]}}return h.domain=function(a){return arguments.length?([c,u,l]=a,t=i(c=+c),e=i(u=+u),r=i(l=+l),n=t===e?0:.5/(e-t),o=e===r?0:.5/(r-e),s=e<t?-1:1,h):[c,u,l]},h.clamp=function(t){return arguments.length?(p=!!t,h):p},h.interpolator=function(t){return arguments.length?(f=t,h):f},h.range=d(Qi),h.rangeRound=d(ta),h.unknown=function(t){return arguments.length?(a=t,h):a},function(a){return i=a,t=a(c),e=a(u),r=a(l),n=t===e?0:.5/(e-t),o=e===r?0:.5/(r-e),s=e<t?-1:1,h}}function Ml(){var t=Pa(_l()(na));return t.copy=function(){return Ol(t,Ml())},to.apply(t,arguments)}function Tl(){var t=Na(_l()).domain([.1,1,10]);return t.copy=function(){return Ol(t,Tl()).base(t.base())},to.apply(t,arguments)}function Cl(){var t=za(_l());return t.copy=function(){return Ol(t,Cl()).constant(t.constant())},to.apply(t,arguments)}function Dl(){var t=Wa(_l());return t.copy=function(){return Ol(t,Dl()).exponent(t.exponent())},to.apply(t,arguments)}function Il(){return Dl.apply(null,arguments).exponent(.5)}function Nl(t,e){if((o=t.length)>1)for(var r,n,o,i=1,a=t[e[0]],c=a.length;i<o;++i)for(n=a,a=t[e[i]],r=0;r<c;++r)a[r][1]+=a[r][0]=isNaN(n[r][1])?n[r][0]:n[r][1]}function Bl(t){return"object"==typeof t&&"length"in t?t:Array.from(t)}function Rl(t){for(var e=t.length,r=new Array(e);--e>=0;)r[e]=e;return r}function Ll(t,e){return t[e]}function zl(t){const e=[];return e.key=t,e}Kc=function(t){var e=t.dateTime,r=t.date,n=t.time,o=t.periods,i=t.days,a=t.shortDays,c=t.months,u=t.shortMonths,l=iu(o),s=au(o),f=iu(i),p=au(i),h=iu(a),d=au(a),y=iu(c),v=au(c),m=iu(u),b=au(u),g={a:function(t){return a[t.getDay()]},A:function(t){return i[t.getDay()]},b:function(t){return u[t.getMonth()]},B:function(t){return c[t.getMonth()]},c:null,d:Au,e:Au,f:Cu,g:qu,G:Xu,H:ku,I:_u,j:Mu,L:Tu,m:Du,M:Iu,p:function(t){return o[+(t.getHours()>=12)]},q:function(t){return 1+~~(t.getMonth()/3)},Q:dl,s:yl,S:Nu,u:Bu,U:Ru,V:zu,w:Fu,W:Uu,x:null,X:null,y:$u,Y:Wu,Z:Hu,"%":hl},x={a:function(t){return a[t.getUTCDay()]},A:function(t){return i[t.getUTCDay()]},b:function(t){return u[t.getUTCMonth()]},B:function(t){return c[t.getUTCMonth()]},c:null,d:Gu,e:Gu,f:Ju,g:ll,G:fl,H:Vu,I:Yu,j:Ku,L:Zu,m:Qu,M:tl,p:function(t){return o[+(t.getUTCHours()>=12)]},q:function(t){return 1+~~(t.getUTCMonth()/3)},Q:dl,s:yl,S:el,u:rl,U:nl,V:il,w:al,W:cl,x:null,X:null,y:ul,Y:sl,Z:pl,"%":hl},w={a:function(t,e,r){var n=h.exec(e.slice(r));return n?(t.w=d.get(n[0].toLowerCase()),r+n[0].length):-1},A:function(t,e,r){var n=f.exec(e.slice(r));return n?(t.w=p.get(n[0].toLowerCase()),r+n[0].length):-1},b:function(t,e,r){var n=m.exec(e.slice(r));return n?(t.m=b.get(n[0].toLowerCase()),r+n[0].length):-1},B:function(t,e,r){var n=y.exec(e.slice(r));return n?(t.m=v.get(n[0].toLowerCase()),r+n[0].length):-1},c:function(t,r,n){return S(t,e,r,n)},d:mu,e:mu,f:ju,g:hu,G:pu,H:gu,I:gu,j:bu,L:Ou,m:vu,M:xu,p:function(t,e,r){var n=l.exec(e.slice(r));return n?(t.p=s.get(n[0].toLowerCase()),r+n[0].length):-1},q:yu,Q:Pu,s:Eu,S:wu,u:uu,U:lu,V:su,w:cu,W:fu,x:function(t,e,n){return S(t,r,e,n)},X:function(t,e,r){return S(t,n,e,r)},y:hu,Y:pu,Z:du,"%":Su};function O(t,e){return function(r){var n,o,i,a=[],c=-1,u=0,l=t.length;for(r instanceof Date||(r=new Date(+r));++c<l;)37===t.charCodeAt(c)&&(a.push(t.slice(u,c)),null!=(o=Qc[n=t.charAt(++c)])?n=t.charAt(++c):o="e"===n?" ":"0",(i=e[n])&&(n=i(r,o)),a.push(n),u=c+1);return a.push(t.slice(u,c)),a.join("")}}function j(t,e){return function(r){var n,o,i=Yc(1900,void 0,1);if(S(i,t,r+="",0)!=r.length)return null;if("Q"in i)return new Date(i.Q);if("s"in i)return new Date(1e3*i.s+("L"in i?i.L:0));if(e&&!("Z"in i)&&(i.Z=0),"p"in i&&(i.H=i.H%12+12*i.p),void 0===i.m&&(i.m="q"in i?i.q:0),"V"in i){if(i.V<1||i.V>53)return null;"w"in i||(i.w=1),"Z"in i?(o=(n=Vc(Yc(i.y,0,1))).getUTCDay(),n=o>4||0===o?Cc.ceil(n):Cc(n),n=xc.offset(n,7*(i.V-1)),i.y=n.getUTCFullYear(),i.m=n.getUTCMonth(),i.d=n.getUTCDate()+(i.w+6)%7):(o=(n=Gc(Yc(i.y,0,1))).getDay(),n=o>4||0===o?Sc.ceil(n):Sc(n),n=gc.offset(n,7*(i.V-1)),i.y=n.getFullYear(),i.m=n.getMonth(),i.d=n.getDate()+(i.w+6)%7)}else("W"in i||"U"in i)&&("w"in i||(i.w="u"in i?i.u%7:"W"in i?1:0),o="Z"in i?Vc(Yc(i.y,0,1)).getUTCDay():Gc(Yc(i.y,0,1)).getDay(),i.m=0,i.d="W"in i?(i.w+6)%7+7*i.W-(o+5)%7:i.w+7*i.U-(o+6)%7);return"Z"in i?(i.H+=i.Z/100|0,i.M+=i.Z%100,Vc(i)):Gc(i)}}function S(t,e,r,n){for(var o,i,a=0,c=e.length,u=r.length;a<c;){if(n>=u)return-1;if(37===(o=e.charCodeAt(a++))){if(o=e.charAt(a++),!(i=w[o in Qc?e.charAt(a++):o])||(n=i(t,r,n))<0)return-1}else if(o!=r.charCodeAt(n++))return-1}return n}return g.x=O(r,g),g.X=O(n,g),g.c=O(e,g),x.x=O(r,x),x.X=O(n,x),x.c=O(e,x),{format:function(t){var e=O(t+="",g);return e.toString=function(){return t},e},parse:function(t){var e=j(t+="",!1);return e.toString=function(){return t},e},utcFormat:function(t){var e=O(t+="",x);return e.toString=function(){return t},e},utcParse:function(t){var e=j(t+="",!0);return e.toString=function(){return t},e}}}({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]}),Zc=Kc.format,Kc.parse,Jc=Kc.utcFormat,Kc.utcParse,Array.prototype.slice;var Fl=r(4506),Ul=r.n(Fl),$l=r(1684),ql=r.n($l),Wl=r(7307),Xl=r.n(Wl),Hl=r(2404),Gl=r.n(Hl),Vl=r(8351),Yl=r.n(Vl);function Kl(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var Zl=function(t){return t},Jl={"@@functional/placeholder":!0},Ql=function(t){return t===Jl},ts=function(t){return function e(){return 0===arguments.length||1===arguments.length&&Ql(arguments.length<=0?void 0:arguments[0])?e:t.apply(void 0,arguments)}},es=function t(e,r){return 1===e?r:ts((function(){for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];var a=o.filter((function(t){return t!==Jl})).length;return a>=e?r.apply(void 0,o):t(e-a,ts((function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];var i,a=o.map((function(t){return Ql(t)?e.shift():t}));return r.apply(void 0,(i=a,function(t){if(Array.isArray(t))return Kl(t)}(i)||function(t){if("undefined"!=typeof Symbol&&Symbol.iterator in Object(t))return Array.from(t)}(i)||function(t,e){if(t){if("string"==typeof t)return Kl(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Kl(t,e):void 0}}(i)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()).concat(e))})))}))},rs=function(t){return es(t.length,t)},ns=function(t,e){for(var r=[],n=t;n<e;++n)r[n-t]=n;return r},os=rs((function(t,e){return Array.isArray(e)?e.map(t):Object.keys(e).map((function(t){return e[t]})).map(t)})),is=function(){for(var t=arguments.length,e=new Array(t),r=0;r<t;r++)e[r]=arguments[r];if(!e.length)return Zl;var n=e.reverse(),o=n[0],i=n.slice(1);return function(){return i.reduce((function(t,e){return e(t)}),o.apply(void 0,arguments))}},as=function(t){return Array.isArray(t)?t.reverse():t.split("").reverse.join("")},cs=function(t){var e=null,r=null;return function(){for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e&&o.every((function(t,r){return t===e[r]}))?r:(e=o,r=t.apply(void 0,o))}};rs((function(t,e,r){var n=+t;return n+r*(+e-n)})),rs((function(t,e,r){var n=e-+t;return(r-t)/(n||1/0)})),rs((function(t,e,r){var n=e-+t;return n=n||1/0,Math.max(0,Math.min(1,(r-t)/n))}));const us=function(t,e,r){for(var n=new(Yl())(t),o=0,i=[];n.lt(e)&&o<1e5;)i.push(n.toNumber()),n=n.add(r),o++;return i},ls=function(t){return 0===t?1:Math.floor(new(Yl())(t).abs().log(10).toNumber())+1};function ss(t){return function(t){if(Array.isArray(t))return hs(t)}(t)||function(t){if("undefined"!=typeof Symbol&&Symbol.iterator in Object(t))return Array.from(t)}(t)||ps(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function fs(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){if("undefined"!=typeof Symbol&&Symbol.iterator in Object(t)){var r=[],n=!0,o=!1,i=void 0;try{for(var a,c=t[Symbol.iterator]();!(n=(a=c.next()).done)&&(r.push(a.value),!e||r.length!==e);n=!0);}catch(t){o=!0,i=t}finally{try{n||null==c.return||c.return()}finally{if(o)throw i}}return r}}(t,e)||ps(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ps(t,e){if(t){if("string"==typeof t)return hs(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?hs(t,e):void 0}}function hs(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function ds(t){var e=fs(t,2),r=e[0],n=e[1],o=r,i=n;return r>n&&(o=n,i=r),[o,i]}function ys(t,e,r){if(t.lte(0))return new(Yl())(0);var n=ls(t.toNumber()),o=new(Yl())(10).pow(n),i=t.div(o),a=1!==n?.05:.1,c=new(Yl())(Math.ceil(i.div(a).toNumber())).add(r).mul(a).mul(o);return e?c:new(Yl())(Math.ceil(c))}function vs(t,e,r){var n=1,o=new(Yl())(t);if(!o.isint()&&r){var i=Math.abs(t);i<1?(n=new(Yl())(10).pow(ls(t)-1),o=new(Yl())(Math.floor(o.div(n).toNumber())).mul(n)):i>1&&(o=new(Yl())(Math.floor(t)))}else 0===t?o=new(Yl())(Math.floor((e-1)/2)):r||(o=new(Yl())(Math.floor(t)));var a=Math.floor((e-1)/2);return is(os((function(t){return o.add(new(Yl())(t-a).mul(n)).toNumber()})),ns)(0,e)}function ms(t,e,r,n){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:0;if(!Number.isFinite((e-t)/(r-1)))return{step:new(Yl())(0),tickMin:new(Yl())(0),tickMax:new(Yl())(0)};var i,a=ys(new(Yl())(e).sub(t).div(r-1),n,o);i=t<=0&&e>=0?new(Yl())(0):(i=new(Yl())(t).add(e).div(2)).sub(new(Yl())(i).mod(a));var c=Math.ceil(i.sub(t).div(a).toNumber()),u=Math.ceil(new(Yl())(e).sub(i).div(a).toNumber()),l=c+u+1;return l>r?ms(t,e,r,n,o+1):(l<r&&(u=e>0?u+(r-l):u,c=e>0?c:c+(r-l)),{step:a,tickMin:i.sub(new(Yl())(c).mul(a)),tickMax:i.add(new(Yl())(u).mul(a))})}var bs=cs((function(t){var e=fs(t,2),r=e[0],n=e[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),c=fs(ds([r,n]),2),u=c[0],l=c[1];if(u===-1/0||l===1/0){var s=l===1/0?[u].concat(ss(ns(0,o-1).map((function(){return 1/0})))):[].concat(ss(ns(0,o-1).map((function(){return-1/0}))),[l]);return r>n?as(s):s}if(u===l)return vs(u,o,i);var f=ms(u,l,a,i),p=f.step,h=f.tickMin,d=f.tickMax,y=us(h,d.add(new(Yl())(.1).mul(p)),p);return r>n?as(y):y})),gs=(cs((function(t){var e=fs(t,2),r=e[0],n=e[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),c=fs(ds([r,n]),2),u=c[0],l=c[1];if(u===-1/0||l===1/0)return[r,n];if(u===l)return vs(u,o,i);var s=ys(new(Yl())(l).sub(u).div(a-1),i,0),f=is(os((function(t){return new(Yl())(u).add(new(Yl())(t).mul(s)).toNumber()})),ns)(0,a).filter((function(t){return t>=u&&t<=l}));return r>n?as(f):f})),cs((function(t,e){var r=fs(t,2),n=r[0],o=r[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=fs(ds([n,o]),2),c=a[0],u=a[1];if(c===-1/0||u===1/0)return[n,o];if(c===u)return[c];var l=Math.max(e,2),s=ys(new(Yl())(u).sub(c).div(l-1),i,0),f=[].concat(ss(us(new(Yl())(c),new(Yl())(u).sub(new(Yl())(.99).mul(s)),s)),[u]);return n>o?as(f):f}))),xs=["offset","layout","width","dataKey","data","dataPointFormatter","xAxis","yAxis"];function ws(t){return ws="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ws(t)}function Os(){return Os=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Os.apply(this,arguments)}function js(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Ss(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,_s(n.key),n)}}function Ps(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Ps=function(){return!!t})()}function Es(t){return Es=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Es(t)}function As(t,e){return As=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},As(t,e)}function ks(t,e,r){return(e=_s(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function _s(t){var e=function(t){if("object"!=ws(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ws(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==ws(e)?e:e+""}var Ms=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=Es(r=e),function(t,e){if(e&&("object"===ws(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,Ps()?Reflect.construct(r,n||[],Es(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&As(t,e)}(e,t),r=e,n=[{key:"render",value:function(){var t=this.props,e=t.offset,r=t.layout,n=t.width,i=t.dataKey,a=t.data,c=t.dataPointFormatter,u=t.xAxis,l=t.yAxis,s=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,xs),f=nt(s,!1);"x"===this.props.direction&&"number"!==u.type&&mt(!1);var p=a.map((function(t){var a=c(t,i),s=a.x,p=a.y,h=a.value,d=a.errorVal;if(!d)return null;var y,v,m,b,g=[];if(Array.isArray(d)){var x=(b=2,function(t){if(Array.isArray(t))return t}(m=d)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(m,b)||function(t,e){if(t){if("string"==typeof t)return js(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?js(t,e):void 0}}(m,b)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}());y=x[0],v=x[1]}else y=v=d;if("vertical"===r){var w=u.scale,O=p+e,j=O+n,S=O-n,P=w(h-y),E=w(h+v);g.push({x1:E,y1:j,x2:E,y2:S}),g.push({x1:P,y1:O,x2:E,y2:O}),g.push({x1:P,y1:j,x2:P,y2:S})}else if("horizontal"===r){var A=l.scale,k=s+e,_=k-n,M=k+n,T=A(h-y),C=A(h+v);g.push({x1:_,y1:C,x2:M,y2:C}),g.push({x1:k,y1:T,x2:k,y2:C}),g.push({x1:_,y1:T,x2:M,y2:T})}return o().createElement(jt,Os({className:"recharts-errorBar",key:"bar-".concat(g.map((function(t){return"".concat(t.x1,"-").concat(t.x2,"-").concat(t.y1,"-").concat(t.y2)})))},f),g.map((function(t){return o().createElement("line",Os({},t,{key:"line-".concat(t.x1,"-").concat(t.x2,"-").concat(t.y1,"-").concat(t.y2)}))})))}));return o().createElement(jt,{className:"recharts-errorBars"},p)}}],n&&Ss(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function Ts(t){return Ts="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ts(t)}function Cs(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ds(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Cs(Object(r),!0).forEach((function(e){Is(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Cs(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Is(t,e,r){var n;return n=function(t){if("object"!=Ts(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ts(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ts(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}ks(Ms,"defaultProps",{stroke:"black",strokeWidth:1.5,width:5,offset:0,layout:"horizontal"}),ks(Ms,"displayName","ErrorBar");var Ns=function(t){var e=t.children,r=t.formattedGraphicalItems,n=t.legendWidth,o=t.legendContent,i=tt(e,br);if(!i)return null;var a,c=br.defaultProps,u=void 0!==c?Ds(Ds({},c),i.props):{};return a=i.props&&i.props.payload?i.props&&i.props.payload:"children"===o?(r||[]).reduce((function(t,e){var r=e.item,n=e.props,o=n.sectors||n.data||[];return t.concat(o.map((function(t){return{type:i.props.iconType||r.props.legendType,value:t.name,color:t.fill,payload:t}})))}),[]):(r||[]).map((function(t){var e=t.item,r=e.type.defaultProps,n=void 0!==r?Ds(Ds({},r),e.props):{},o=n.dataKey,i=n.name,a=n.legendType;return{inactive:n.hide,dataKey:o,type:u.iconType||a||"square",color:Ws(e),value:i||o,payload:n}})),Ds(Ds(Ds({},u),br.getWithHeight(i,n)),{},{payload:a,item:i})};function Bs(t){return Bs="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Bs(t)}function Rs(t){return function(t){if(Array.isArray(t))return Ls(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return Ls(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Ls(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ls(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function zs(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Fs(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?zs(Object(r),!0).forEach((function(e){Us(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):zs(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Us(t,e,r){var n;return n=function(t){if("object"!=Bs(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Bs(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Bs(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function $s(t,e,r){return M()(t)||M()(e)?r:x(e)?d()(t,e,r):C()(e)?e(t):r}function qs(t,e,r,n){var o=Xl()(t,(function(t){return $s(t,e)}));if("number"===r){var i=o.filter((function(t){return g(t)||parseFloat(t)}));return i.length?[ql()(i),Ul()(i)]:[1/0,-1/0]}return(n?o.filter((function(t){return!M()(t)})):o).map((function(t){return x(t)||t instanceof Date?t:""}))}var Ws=function(t){var e,r,n=t.type.displayName,o=null!==(e=t.type)&&void 0!==e&&e.defaultProps?Fs(Fs({},t.type.defaultProps),t.props):t.props,i=o.stroke,a=o.fill;switch(n){case"Line":r=i;break;case"Area":case"Radar":r=i&&"none"!==i?i:a;break;default:r=a}return r},Xs=function(t,e,r,n,o){var i=Q(e.props.children,Ms).filter((function(t){return function(t,e,r){return!!M()(e)||("horizontal"===t?"yAxis"===e:"vertical"===t||"x"===r?"xAxis"===e:"y"!==r||"yAxis"===e)}(n,o,t.props.direction)}));if(i&&i.length){var a=i.map((function(t){return t.props.dataKey}));return t.reduce((function(t,e){var n=$s(e,r);if(M()(n))return t;var o=Array.isArray(n)?[ql()(n),Ul()(n)]:[n,n],i=a.reduce((function(t,r){var n=$s(e,r,0),i=o[0]-Math.abs(Array.isArray(n)?n[0]:n),a=o[1]+Math.abs(Array.isArray(n)?n[1]:n);return[Math.min(i,t[0]),Math.max(a,t[1])]}),[1/0,-1/0]);return[Math.min(i[0],t[0]),Math.max(i[1],t[1])]}),[1/0,-1/0])}return null},Hs=function(t,e,r,n,o){var i=e.map((function(e){var i=e.props.dataKey;return"number"===r&&i&&Xs(t,e,i,n)||qs(t,i,r,o)}));if("number"===r)return i.reduce((function(t,e){return[Math.min(t[0],e[0]),Math.max(t[1],e[1])]}),[1/0,-1/0]);var a={};return i.reduce((function(t,e){for(var r=0,n=e.length;r<n;r++)a[e[r]]||(a[e[r]]=!0,t.push(e[r]));return t}),[])},Gs=function(t,e){return"horizontal"===t&&"xAxis"===e||"vertical"===t&&"yAxis"===e||"centric"===t&&"angleAxis"===e||"radial"===t&&"radiusAxis"===e},Vs=function(t,e,r,n){if(n)return t.map((function(t){return t.coordinate}));var o,i,a=t.map((function(t){return t.coordinate===e&&(o=!0),t.coordinate===r&&(i=!0),t.coordinate}));return o||a.push(e),i||a.push(r),a},Ys=function(t,e,r){if(!t)return null;var n=t.scale,o=t.duplicateDomain,i=t.type,a=t.range,c="scaleBand"===t.realScaleType?n.bandwidth()/2:2,u=(e||r)&&"category"===i&&n.bandwidth?n.bandwidth()/c:0;return u="angleAxis"===t.axisType&&(null==a?void 0:a.length)>=2?2*m(a[0]-a[1])*u:u,e&&(t.ticks||t.niceTicks)?(t.ticks||t.niceTicks).map((function(t){var e=o?o.indexOf(t):t;return{coordinate:n(e)+u,value:t,offset:u}})).filter((function(t){return!p()(t.coordinate)})):t.isCategorical&&t.categoricalDomain?t.categoricalDomain.map((function(t,e){return{coordinate:n(t)+u,value:t,index:e,offset:u}})):n.ticks&&!r?n.ticks(t.tickCount).map((function(t){return{coordinate:n(t)+u,value:t,offset:u}})):n.domain().map((function(t,e){return{coordinate:n(t)+u,value:o?o[t]:t,index:e,offset:u}}))},Ks=new WeakMap,Zs=function(t,e){if("function"!=typeof e)return t;Ks.has(t)||Ks.set(t,new WeakMap);var r=Ks.get(t);if(r.has(e))return r.get(e);var n=function(){t.apply(void 0,arguments),e.apply(void 0,arguments)};return r.set(e,n),n},Js=1e-4,Qs={sign:function(t){var e=t.length;if(!(e<=0))for(var r=0,n=t[0].length;r<n;++r)for(var o=0,i=0,a=0;a<e;++a){var c=p()(t[a][r][1])?t[a][r][0]:t[a][r][1];c>=0?(t[a][r][0]=o,t[a][r][1]=o+c,o=t[a][r][1]):(t[a][r][0]=i,t[a][r][1]=i+c,i=t[a][r][1])}},expand:function(t,e){if((n=t.length)>0){for(var r,n,o,i=0,a=t[0].length;i<a;++i){for(o=r=0;r<n;++r)o+=t[r][i][1]||0;if(o)for(r=0;r<n;++r)t[r][i][1]/=o}Nl(t,e)}},none:Nl,silhouette:function(t,e){if((r=t.length)>0){for(var r,n=0,o=t[e[0]],i=o.length;n<i;++n){for(var a=0,c=0;a<r;++a)c+=t[a][n][1]||0;o[n][1]+=o[n][0]=-c/2}Nl(t,e)}},wiggle:function(t,e){if((o=t.length)>0&&(n=(r=t[e[0]]).length)>0){for(var r,n,o,i=0,a=1;a<n;++a){for(var c=0,u=0,l=0;c<o;++c){for(var s=t[e[c]],f=s[a][1]||0,p=(f-(s[a-1][1]||0))/2,h=0;h<c;++h){var d=t[e[h]];p+=(d[a][1]||0)-(d[a-1][1]||0)}u+=f,l+=p*f}r[a-1][1]+=r[a-1][0]=i,u&&(i-=l/u)}r[a-1][1]+=r[a-1][0]=i,Nl(t,e)}},positive:function(t){var e=t.length;if(!(e<=0))for(var r=0,n=t[0].length;r<n;++r)for(var o=0,i=0;i<e;++i){var a=p()(t[i][r][1])?t[i][r][0]:t[i][r][1];a>=0?(t[i][r][0]=o,t[i][r][1]=o+a,o=t[i][r][1]):(t[i][r][0]=0,t[i][r][1]=0)}}},tf=function(t,e,r){var n=e.map((function(t){return t.props.dataKey})),o=Qs[r],i=function(){var t=De([]),e=Rl,r=Nl,n=Ll;function o(o){var i,a,c=Array.from(t.apply(this,arguments),zl),u=c.length,l=-1;for(const t of o)for(i=0,++l;i<u;++i)(c[i][l]=[0,+n(t,c[i].key,l,o)]).data=t;for(i=0,a=Bl(e(c));i<u;++i)c[a[i]].index=i;return r(c,a),c}return o.keys=function(e){return arguments.length?(t="function"==typeof e?e:De(Array.from(e)),o):t},o.value=function(t){return arguments.length?(n="function"==typeof t?t:De(+t),o):n},o.order=function(t){return arguments.length?(e=null==t?Rl:"function"==typeof t?t:De(Array.from(t)),o):e},o.offset=function(t){return arguments.length?(r=null==t?Nl:t,o):r},o}().keys(n).value((function(t,e){return+$s(t,e,0)})).order(Rl).offset(o);return i(t)};function ef(t){var e=t.axis,r=t.ticks,n=t.bandSize,o=t.entry,i=t.index,a=t.dataKey;if("category"===e.type){if(!e.allowDuplicatedCategory&&e.dataKey&&!M()(o[e.dataKey])){var c=E(r,"value",o[e.dataKey]);if(c)return c.coordinate+n/2}return r[i]?r[i].coordinate+n/2:null}var u=$s(o,M()(a)?e.dataKey:a);return M()(u)?null:e.scale(u)}var rf=function(t){var e=t.axis,r=t.ticks,n=t.offset,o=t.bandSize,i=t.entry,a=t.index;if("category"===e.type)return r[a]?r[a].coordinate+n:null;var c=$s(i,e.dataKey,e.domain[a]);return M()(c)?null:e.scale(c)-o/2+n},nf=function(t,e,r){return Object.keys(t).reduce((function(n,o){var i=t[o].stackedData.reduce((function(t,n){var o=n.slice(e,r+1).reduce((function(t,e){return[ql()(e.concat([t[0]]).filter(g)),Ul()(e.concat([t[1]]).filter(g))]}),[1/0,-1/0]);return[Math.min(t[0],o[0]),Math.max(t[1],o[1])]}),[1/0,-1/0]);return[Math.min(i[0],n[0]),Math.max(i[1],n[1])]}),[1/0,-1/0]).map((function(t){return t===1/0||t===-1/0?0:t}))},of=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,af=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,cf=function(t,e,r){if(C()(t))return t(e,r);if(!Array.isArray(t))return e;var n=[];if(g(t[0]))n[0]=r?t[0]:Math.min(t[0],e[0]);else if(of.test(t[0])){var o=+of.exec(t[0])[1];n[0]=e[0]-o}else C()(t[0])?n[0]=t[0](e[0]):n[0]=e[0];if(g(t[1]))n[1]=r?t[1]:Math.max(t[1],e[1]);else if(af.test(t[1])){var i=+af.exec(t[1])[1];n[1]=e[1]+i}else C()(t[1])?n[1]=t[1](e[1]):n[1]=e[1];return n},uf=function(t,e,r){if(t&&t.scale&&t.scale.bandwidth){var n=t.scale.bandwidth();if(!r||n>0)return n}if(t&&e&&e.length>=2){for(var o=vt()(e,(function(t){return t.coordinate})),i=1/0,a=1,c=o.length;a<c;a++){var u=o[a],l=o[a-1];i=Math.min((u.coordinate||0)-(l.coordinate||0),i)}return i===1/0?0:i}return r?void 0:0},lf=function(t,e,r){return t&&t.length?Gl()(t,d()(r,"type.defaultProps.domain"))?e:t:e},sf=function(t,e){var r=t.type.defaultProps?Fs(Fs({},t.type.defaultProps),t.props):t.props,n=r.dataKey,o=r.name,i=r.unit,a=r.formatter,c=r.tooltipType,u=r.chartType,l=r.hide;return Fs(Fs({},nt(t,!1)),{},{dataKey:n,unit:i,formatter:a,name:o||n,color:Ws(t),value:$s(e,n),type:c,payload:e,chartType:u,hide:l})};function ff(t){return ff="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ff(t)}function pf(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function hf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?pf(Object(r),!0).forEach((function(e){df(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):pf(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function df(t,e,r){var n;return n=function(t){if("object"!=ff(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ff(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==ff(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var yf=["Webkit","Moz","O","ms"];function vf(t){return vf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},vf(t)}function mf(){return mf=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},mf.apply(this,arguments)}function bf(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function gf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?bf(Object(r),!0).forEach((function(e){Sf(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):bf(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function xf(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Pf(n.key),n)}}function wf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(wf=function(){return!!t})()}function Of(t){return Of=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Of(t)}function jf(t,e){return jf=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},jf(t,e)}function Sf(t,e,r){return(e=Pf(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Pf(t){var e=function(t){if("object"!=vf(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=vf(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==vf(e)?e:e+""}var Ef=function(t){return t.changedTouches&&!!t.changedTouches.length},Af=function(t){function r(t){var e,n,o,i;return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,r),Sf((n=this,i=[t],o=Of(o=r),e=function(t,e){if(e&&("object"===vf(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(n,wf()?Reflect.construct(o,i||[],Of(n).constructor):o.apply(n,i))),"handleDrag",(function(t){e.leaveTimer&&(clearTimeout(e.leaveTimer),e.leaveTimer=null),e.state.isTravellerMoving?e.handleTravellerMove(t):e.state.isSlideMoving&&e.handleSlideDrag(t)})),Sf(e,"handleTouchMove",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&e.handleDrag(t.changedTouches[0])})),Sf(e,"handleDragEnd",(function(){e.setState({isTravellerMoving:!1,isSlideMoving:!1},(function(){var t=e.props,r=t.endIndex,n=t.onDragEnd,o=t.startIndex;null==n||n({endIndex:r,startIndex:o})})),e.detachDragEndListener()})),Sf(e,"handleLeaveWrapper",(function(){(e.state.isTravellerMoving||e.state.isSlideMoving)&&(e.leaveTimer=window.setTimeout(e.handleDragEnd,e.props.leaveTimeOut))})),Sf(e,"handleEnterSlideOrTraveller",(function(){e.setState({isTextActive:!0})})),Sf(e,"handleLeaveSlideOrTraveller",(function(){e.setState({isTextActive:!1})})),Sf(e,"handleSlideDragStart",(function(t){var r=Ef(t)?t.changedTouches[0]:t;e.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:r.pageX}),e.attachDragEndListener()})),e.travellerDragStartHandlers={startX:e.handleTravellerDragStart.bind(e,"startX"),endX:e.handleTravellerDragStart.bind(e,"endX")},e.state={},e}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&jf(t,e)}(r,t),n=r,i=[{key:"componentWillUnmount",value:function(){this.leaveTimer&&(clearTimeout(this.leaveTimer),this.leaveTimer=null),this.detachDragEndListener()}},{key:"getIndex",value:function(t){var e=t.startX,n=t.endX,o=this.state.scaleValues,i=this.props,a=i.gap,c=i.data.length-1,u=Math.min(e,n),l=Math.max(e,n),s=r.getIndexInRange(o,u),f=r.getIndexInRange(o,l);return{startIndex:s-s%a,endIndex:f===c?c:f-f%a}}},{key:"getTextOfTick",value:function(t){var e=this.props,r=e.data,n=e.tickFormatter,o=e.dataKey,i=$s(r[t],o,t);return C()(n)?n(i,t):i}},{key:"attachDragEndListener",value:function(){window.addEventListener("mouseup",this.handleDragEnd,!0),window.addEventListener("touchend",this.handleDragEnd,!0),window.addEventListener("mousemove",this.handleDrag,!0)}},{key:"detachDragEndListener",value:function(){window.removeEventListener("mouseup",this.handleDragEnd,!0),window.removeEventListener("touchend",this.handleDragEnd,!0),window.removeEventListener("mousemove",this.handleDrag,!0)}},{key:"handleSlideDrag",value:function(t){var e=this.state,r=e.slideMoveStartX,n=e.startX,o=e.endX,i=this.props,a=i.x,c=i.width,u=i.travellerWidth,l=i.startIndex,s=i.endIndex,f=i.onChange,p=t.pageX-r;p>0?p=Math.min(p,a+c-u-o,a+c-u-n):p<0&&(p=Math.max(p,a-n,a-o));var h=this.getIndex({startX:n+p,endX:o+p});h.startIndex===l&&h.endIndex===s||!f||f(h),this.setState({startX:n+p,endX:o+p,slideMoveStartX:t.pageX})}},{key:"handleTravellerDragStart",value:function(t,e){var r=Ef(e)?e.changedTouches[0]:e;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:t,brushMoveStartX:r.pageX}),this.attachDragEndListener()}},{key:"handleTravellerMove",value:function(t){var e=this.state,r=e.brushMoveStartX,n=e.movingTravellerId,o=e.endX,i=e.startX,a=this.state[n],c=this.props,u=c.x,l=c.width,s=c.travellerWidth,f=c.onChange,p=c.gap,h=c.data,d={startX:this.state.startX,endX:this.state.endX},y=t.pageX-r;y>0?y=Math.min(y,u+l-s-a):y<0&&(y=Math.max(y,u-a)),d[n]=a+y;var v=this.getIndex(d),m=v.startIndex,b=v.endIndex;this.setState(Sf(Sf({},n,a+y),"brushMoveStartX",t.pageX),(function(){var t;f&&(t=h.length-1,("startX"===n&&(o>i?m%p==0:b%p==0)||o<i&&b===t||"endX"===n&&(o>i?b%p==0:m%p==0)||o>i&&b===t)&&f(v))}))}},{key:"handleTravellerMoveKeyboard",value:function(t,e){var r=this,n=this.state,o=n.scaleValues,i=n.startX,a=n.endX,c=this.state[e],u=o.indexOf(c);if(-1!==u){var l=u+t;if(!(-1===l||l>=o.length)){var s=o[l];"startX"===e&&s>=a||"endX"===e&&s<=i||this.setState(Sf({},e,s),(function(){r.props.onChange(r.getIndex({startX:r.state.startX,endX:r.state.endX}))}))}}}},{key:"renderBackground",value:function(){var t=this.props,e=t.x,r=t.y,n=t.width,i=t.height,a=t.fill,c=t.stroke;return o().createElement("rect",{stroke:c,fill:a,x:e,y:r,width:n,height:i})}},{key:"renderPanorama",value:function(){var t=this.props,r=t.x,n=t.y,i=t.width,a=t.height,c=t.data,u=t.children,l=t.padding,s=e.Children.only(u);return s?o().cloneElement(s,{x:r,y:n,width:i,height:a,margin:l,compact:!0,data:c}):null}},{key:"renderTravellerLayer",value:function(t,e){var n,i,a=this,c=this.props,u=c.y,l=c.travellerWidth,s=c.height,f=c.traveller,p=c.ariaLabel,h=c.data,d=c.startIndex,y=c.endIndex,v=Math.max(t,this.props.x),m=gf(gf({},nt(this.props,!1)),{},{x:v,y:u,width:l,height:s}),b=p||"Min value: ".concat(null===(n=h[d])||void 0===n?void 0:n.name,", Max value: ").concat(null===(i=h[y])||void 0===i?void 0:i.name);return o().createElement(jt,{tabIndex:0,role:"slider","aria-label":b,"aria-valuenow":t,className:"recharts-brush-traveller",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers[e],onTouchStart:this.travellerDragStartHandlers[e],onKeyDown:function(t){["ArrowLeft","ArrowRight"].includes(t.key)&&(t.preventDefault(),t.stopPropagation(),a.handleTravellerMoveKeyboard("ArrowRight"===t.key?1:-1,e))},onFocus:function(){a.setState({isTravellerFocused:!0})},onBlur:function(){a.setState({isTravellerFocused:!1})},style:{cursor:"col-resize"}},r.renderTraveller(f,m))}},{key:"renderSlide",value:function(t,e){var r=this.props,n=r.y,i=r.height,a=r.stroke,c=r.travellerWidth,u=Math.min(t,e)+c,l=Math.max(Math.abs(e-t)-c,0);return o().createElement("rect",{className:"recharts-brush-slide",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart,style:{cursor:"move"},stroke:"none",fill:a,fillOpacity:.2,x:u,y:n,width:l,height:i})}},{key:"renderText",value:function(){var t=this.props,e=t.startIndex,r=t.endIndex,n=t.y,i=t.height,a=t.travellerWidth,c=t.stroke,u=this.state,l=u.startX,s=u.endX,f={pointerEvents:"none",fill:c};return o().createElement(jt,{className:"recharts-brush-texts"},o().createElement(Wo,mf({textAnchor:"end",verticalAnchor:"middle",x:Math.min(l,s)-5,y:n+i/2},f),this.getTextOfTick(e)),o().createElement(Wo,mf({textAnchor:"start",verticalAnchor:"middle",x:Math.max(l,s)+a+5,y:n+i/2},f),this.getTextOfTick(r)))}},{key:"render",value:function(){var t=this.props,e=t.data,r=t.className,n=t.children,i=t.x,c=t.y,u=t.width,l=t.height,s=t.alwaysShowText,f=this.state,p=f.startX,h=f.endX,d=f.isTextActive,y=f.isSlideMoving,v=f.isTravellerMoving,m=f.isTravellerFocused;if(!e||!e.length||!g(i)||!g(c)||!g(u)||!g(l)||u<=0||l<=0)return null;var b=a("recharts-brush",r),x=1===o().Children.count(n),w=function(t,e){var r=t.replace(/(\w)/,(function(t){return t.toUpperCase()})),n=yf.reduce((function(t,n){return hf(hf({},t),{},df({},n+r,e))}),{});return n[t]=e,n}("userSelect","none");return o().createElement(jt,{className:b,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:w},this.renderBackground(),x&&this.renderPanorama(),this.renderSlide(p,h),this.renderTravellerLayer(p,"startX"),this.renderTravellerLayer(h,"endX"),(d||y||v||m||s)&&this.renderText())}}],c=[{key:"renderDefaultTraveller",value:function(t){var e=t.x,r=t.y,n=t.width,i=t.height,a=t.stroke,c=Math.floor(r+i/2)-1;return o().createElement(o().Fragment,null,o().createElement("rect",{x:e,y:r,width:n,height:i,fill:a,stroke:"none"}),o().createElement("line",{x1:e+1,y1:c,x2:e+n-1,y2:c,fill:"none",stroke:"#fff"}),o().createElement("line",{x1:e+1,y1:c+2,x2:e+n-1,y2:c+2,fill:"none",stroke:"#fff"}))}},{key:"renderTraveller",value:function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):r.renderDefaultTraveller(e)}},{key:"getDerivedStateFromProps",value:function(t,e){var r=t.data,n=t.width,o=t.x,i=t.travellerWidth,a=t.updateId,c=t.startIndex,u=t.endIndex;if(r!==e.prevData||a!==e.prevUpdateId)return gf({prevData:r,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:n},r&&r.length?function(t){var e=t.data,r=t.startIndex,n=t.endIndex,o=t.x,i=t.width,a=t.travellerWidth;if(!e||!e.length)return{};var c=e.length,u=uo().domain(dt()(0,c)).range([o,o+i-a]),l=u.domain().map((function(t){return u(t)}));return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:u(r),endX:u(n),scale:u,scaleValues:l}}({data:r,width:n,x:o,travellerWidth:i,startIndex:c,endIndex:u}):{scale:null,scaleValues:null});if(e.scale&&(n!==e.prevWidth||o!==e.prevX||i!==e.prevTravellerWidth)){e.scale.range([o,o+n-i]);var l=e.scale.domain().map((function(t){return e.scale(t)}));return{prevData:r,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:n,startX:e.scale(t.startIndex),endX:e.scale(t.endIndex),scaleValues:l}}return null}},{key:"getIndexInRange",value:function(t,e){for(var r=0,n=t.length-1;n-r>1;){var o=Math.floor((r+n)/2);t[o]>e?n=o:r=o}return e>=t[n]?n:r}}],i&&xf(n.prototype,i),c&&xf(n,c),Object.defineProperty(n,"prototype",{writable:!1}),n;var n,i,c}(e.PureComponent);function kf(t){return kf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},kf(t)}function _f(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Mf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?_f(Object(r),!0).forEach((function(e){Tf(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):_f(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Tf(t,e,r){var n;return n=function(t){if("object"!=kf(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=kf(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==kf(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Sf(Af,"displayName","Brush"),Sf(Af,"defaultProps",{height:40,travellerWidth:5,gap:1,fill:"#fff",stroke:"#666",padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1});var Cf=Math.PI/180,Df=function(t){return 180*t/Math.PI},If=function(t,e,r,n){return{x:t+Math.cos(-Cf*n)*r,y:e+Math.sin(-Cf*n)*r}},Nf=function(t,e){var r=e.startAngle,n=e.endAngle,o=Math.floor(r/360),i=Math.floor(n/360);return t+360*Math.min(o,i)},Bf=function(t,e){var r=function(t,e){var r=t.x,n=t.y,o=e.cx,i=e.cy,a=function(t,e){var r=t.x,n=t.y,o=e.x,i=e.y;return Math.sqrt(Math.pow(r-o,2)+Math.pow(n-i,2))}({x:r,y:n},{x:o,y:i});if(a<=0)return{radius:a};var c=(r-o)/a,u=Math.acos(c);return n>i&&(u=2*Math.PI-u),{radius:a,angle:Df(u),angleInRadian:u}}({x:t.x,y:t.y},e),n=r.radius,o=r.angle,i=e.innerRadius,a=e.outerRadius;if(n<i||n>a)return!1;if(0===n)return!0;var c,u=function(t){var e=t.startAngle,r=t.endAngle,n=Math.floor(e/360),o=Math.floor(r/360),i=Math.min(n,o);return{startAngle:e-360*i,endAngle:r-360*i}}(e),l=u.startAngle,s=u.endAngle,f=o;if(l<=s){for(;f>s;)f-=360;for(;f<l;)f+=360;c=f>=l&&f<=s}else{for(;f>l;)f-=360;for(;f<s;)f+=360;c=f>=s&&f<=l}return c?Mf(Mf({},e),{},{radius:n,angle:Nf(f,e)}):null};function Rf(t){return Rf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Rf(t)}var Lf=["offset"];function zf(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Ff(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Uf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Ff(Object(r),!0).forEach((function(e){$f(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Ff(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function $f(t,e,r){var n;return n=function(t){if("object"!=Rf(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Rf(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Rf(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function qf(){return qf=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},qf.apply(this,arguments)}function Wf(t){var r,n=t.offset,i=Uf({offset:void 0===n?5:n},function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,Lf)),c=i.viewBox,u=i.position,l=i.value,s=i.children,f=i.content,p=i.className,h=void 0===p?"":p,d=i.textBreakAll;if(!c||M()(l)&&M()(s)&&!(0,e.isValidElement)(f)&&!C()(f))return null;if((0,e.isValidElement)(f))return(0,e.cloneElement)(f,i);if(C()(f)){if(r=(0,e.createElement)(f,i),(0,e.isValidElement)(r))return r}else r=function(t){var e=t.value,r=t.formatter,n=M()(t.children)?e:t.children;return C()(r)?r(n):n}(i);var y=function(t){return"cx"in t&&g(t.cx)}(c),v=nt(i,!0);if(y&&("insideStart"===u||"insideEnd"===u||"end"===u))return function(t,e,r){var n,i,c=t.position,u=t.viewBox,l=t.offset,s=t.className,f=u,p=f.cx,h=f.cy,d=f.innerRadius,y=f.outerRadius,v=f.startAngle,b=f.endAngle,g=f.clockWise,x=(d+y)/2,w=function(t,e){return m(e-t)*Math.min(Math.abs(e-t),360)}(v,b),j=w>=0?1:-1;"insideStart"===c?(n=v+j*l,i=g):"insideEnd"===c?(n=b-j*l,i=!g):"end"===c&&(n=b+j*l,i=g),i=w<=0?i:!i;var S=If(p,h,x,n),P=If(p,h,x,n+359*(i?1:-1)),E="M".concat(S.x,",").concat(S.y,"\n    A").concat(x,",").concat(x,",0,1,").concat(i?0:1,",\n    ").concat(P.x,",").concat(P.y),A=M()(t.id)?O("recharts-radial-line-"):t.id;return o().createElement("text",qf({},r,{dominantBaseline:"central",className:a("recharts-radial-bar-label",s)}),o().createElement("defs",null,o().createElement("path",{id:A,d:E})),o().createElement("textPath",{xlinkHref:"#".concat(A)},e))}(i,r,v);var x=y?function(t){var e=t.viewBox,r=t.offset,n=t.position,o=e,i=o.cx,a=o.cy,c=o.innerRadius,u=o.outerRadius,l=(o.startAngle+o.endAngle)/2;if("outside"===n){var s=If(i,a,u+r,l),f=s.x;return{x:f,y:s.y,textAnchor:f>=i?"start":"end",verticalAnchor:"middle"}}if("center"===n)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"middle"};if("centerTop"===n)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"start"};if("centerBottom"===n)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"end"};var p=If(i,a,(c+u)/2,l);return{x:p.x,y:p.y,textAnchor:"middle",verticalAnchor:"middle"}}(i):function(t){var e=t.viewBox,r=t.parentViewBox,n=t.offset,o=t.position,i=e,a=i.x,c=i.y,u=i.width,l=i.height,s=l>=0?1:-1,f=s*n,p=s>0?"end":"start",h=s>0?"start":"end",d=u>=0?1:-1,y=d*n,v=d>0?"end":"start",m=d>0?"start":"end";if("top"===o)return Uf(Uf({},{x:a+u/2,y:c-s*n,textAnchor:"middle",verticalAnchor:p}),r?{height:Math.max(c-r.y,0),width:u}:{});if("bottom"===o)return Uf(Uf({},{x:a+u/2,y:c+l+f,textAnchor:"middle",verticalAnchor:h}),r?{height:Math.max(r.y+r.height-(c+l),0),width:u}:{});if("left"===o){var x={x:a-y,y:c+l/2,textAnchor:v,verticalAnchor:"middle"};return Uf(Uf({},x),r?{width:Math.max(x.x-r.x,0),height:l}:{})}if("right"===o){var w={x:a+u+y,y:c+l/2,textAnchor:m,verticalAnchor:"middle"};return Uf(Uf({},w),r?{width:Math.max(r.x+r.width-w.x,0),height:l}:{})}var O=r?{width:u,height:l}:{};return"insideLeft"===o?Uf({x:a+y,y:c+l/2,textAnchor:m,verticalAnchor:"middle"},O):"insideRight"===o?Uf({x:a+u-y,y:c+l/2,textAnchor:v,verticalAnchor:"middle"},O):"insideTop"===o?Uf({x:a+u/2,y:c+f,textAnchor:"middle",verticalAnchor:h},O):"insideBottom"===o?Uf({x:a+u/2,y:c+l-f,textAnchor:"middle",verticalAnchor:p},O):"insideTopLeft"===o?Uf({x:a+y,y:c+f,textAnchor:m,verticalAnchor:h},O):"insideTopRight"===o?Uf({x:a+u-y,y:c+f,textAnchor:v,verticalAnchor:h},O):"insideBottomLeft"===o?Uf({x:a+y,y:c+l-f,textAnchor:m,verticalAnchor:p},O):"insideBottomRight"===o?Uf({x:a+u-y,y:c+l-f,textAnchor:v,verticalAnchor:p},O):I()(o)&&(g(o.x)||b(o.x))&&(g(o.y)||b(o.y))?Uf({x:a+j(o.x,u),y:c+j(o.y,l),textAnchor:"end",verticalAnchor:"end"},O):Uf({x:a+u/2,y:c+l/2,textAnchor:"middle",verticalAnchor:"middle"},O)}(i);return o().createElement(Wo,qf({className:a("recharts-label",h)},v,x,{breakAll:d}),r)}Wf.displayName="Label";var Xf=function(t){var e=t.cx,r=t.cy,n=t.angle,o=t.startAngle,i=t.endAngle,a=t.r,c=t.radius,u=t.innerRadius,l=t.outerRadius,s=t.x,f=t.y,p=t.top,h=t.left,d=t.width,y=t.height,v=t.clockWise,m=t.labelViewBox;if(m)return m;if(g(d)&&g(y)){if(g(s)&&g(f))return{x:s,y:f,width:d,height:y};if(g(p)&&g(h))return{x:p,y:h,width:d,height:y}}return g(s)&&g(f)?{x:s,y:f,width:0,height:0}:g(e)&&g(r)?{cx:e,cy:r,startAngle:o||n||0,endAngle:i||n||0,innerRadius:u||0,outerRadius:l||c||a||0,clockWise:v}:t.viewBox?t.viewBox:{}};Wf.parseViewBox=Xf,Wf.renderCallByParent=function(t,r){var n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!t||!t.children&&n&&!t.label)return null;var i=t.children,a=Xf(t),c=Q(i,Wf).map((function(t,n){return(0,e.cloneElement)(t,{viewBox:r||a,key:"label-".concat(n)})}));if(!n)return c;var u,l=function(t,r){return t?!0===t?o().createElement(Wf,{key:"label-implicit",viewBox:r}):x(t)?o().createElement(Wf,{key:"label-implicit",viewBox:r,value:t}):(0,e.isValidElement)(t)?t.type===Wf?(0,e.cloneElement)(t,{key:"label-implicit",viewBox:r}):o().createElement(Wf,{key:"label-implicit",content:t,viewBox:r}):C()(t)?o().createElement(Wf,{key:"label-implicit",content:t,viewBox:r}):I()(t)?o().createElement(Wf,qf({viewBox:r},t,{key:"label-implicit"})):null:null}(t.label,r||a);return[l].concat(function(t){if(Array.isArray(t))return zf(t)}(u=c)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(u)||function(t,e){if(t){if("string"==typeof t)return zf(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?zf(t,e):void 0}}(u)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}())};var Hf=function(t,e){var r=t.alwaysShow,n=t.ifOverflow;return r&&(n="extendDomain"),n===e},Gf=r(3916),Vf=r.n(Gf),Yf=r(9747),Kf=r.n(Yf),Zf=function(t){return null};Zf.displayName="Cell";var Jf=r(8090),Qf=r.n(Jf);function tp(t){return tp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},tp(t)}var ep=["valueAccessor"],rp=["data","dataKey","clockWise","id","textBreakAll"];function np(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function op(){return op=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},op.apply(this,arguments)}function ip(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function ap(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?ip(Object(r),!0).forEach((function(e){cp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):ip(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function cp(t,e,r){var n;return n=function(t){if("object"!=tp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=tp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==tp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function up(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}var lp=function(t){return Array.isArray(t.value)?Qf()(t.value):t.value};function sp(t){var e=t.valueAccessor,r=void 0===e?lp:e,n=up(t,ep),i=n.data,a=n.dataKey,c=n.clockWise,u=n.id,l=n.textBreakAll,s=up(n,rp);return i&&i.length?o().createElement(jt,{className:"recharts-label-list"},i.map((function(t,e){var n=M()(a)?r(t,e):$s(t&&t.payload,a),i=M()(u)?{}:{id:"".concat(u,"-").concat(e)};return o().createElement(Wf,op({},nt(t,!0),s,i,{parentViewBox:t.parentViewBox,value:n,textBreakAll:l,viewBox:Wf.parseViewBox(M()(c)?t:ap(ap({},t),{},{clockWise:c})),key:"label-".concat(e),index:e}))}))):null}sp.displayName="LabelList",sp.renderCallByParent=function(t,r){var n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!t||!t.children&&n&&!t.label)return null;var i,a=Q(t.children,sp).map((function(t,n){return(0,e.cloneElement)(t,{data:r,key:"labelList-".concat(n)})}));return n?[function(t,e){return t?!0===t?o().createElement(sp,{key:"labelList-implicit",data:e}):o().isValidElement(t)||C()(t)?o().createElement(sp,{key:"labelList-implicit",data:e,content:t}):I()(t)?o().createElement(sp,op({data:e},t,{key:"labelList-implicit"})):null:null}(t.label,r)].concat(function(t){if(Array.isArray(t))return np(t)}(i=a)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(i)||function(t,e){if(t){if("string"==typeof t)return np(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?np(t,e):void 0}}(i)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()):a};var fp=r(1331),pp=r.n(fp),hp=r(3812),dp=r.n(hp);function yp(t){return yp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},yp(t)}function vp(){return vp=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},vp.apply(this,arguments)}function mp(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function bp(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function gp(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?bp(Object(r),!0).forEach((function(e){xp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):bp(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function xp(t,e,r){var n;return n=function(t){if("object"!=yp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=yp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==yp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var wp=function(t,e,r,n,o){var i,a=r-n;return i="M ".concat(t,",").concat(e),i+="L ".concat(t+r,",").concat(e),i+="L ".concat(t+r-a/2,",").concat(e+o),(i+="L ".concat(t+r-a/2-n,",").concat(e+o))+"L ".concat(t,",").concat(e," Z")},Op={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},jp=function(t){var r,n,i=gp(gp({},Op),t),c=(0,e.useRef)(),u=(r=(0,e.useState)(-1),n=2,function(t){if(Array.isArray(t))return t}(r)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(r,n)||function(t,e){if(t){if("string"==typeof t)return mp(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?mp(t,e):void 0}}(r,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),l=u[0],s=u[1];(0,e.useEffect)((function(){if(c.current&&c.current.getTotalLength)try{var t=c.current.getTotalLength();t&&s(t)}catch(t){}}),[]);var f=i.x,p=i.y,h=i.upperWidth,d=i.lowerWidth,y=i.height,v=i.className,m=i.animationEasing,b=i.animationDuration,g=i.animationBegin,x=i.isUpdateAnimationActive;if(f!==+f||p!==+p||h!==+h||d!==+d||y!==+y||0===h&&0===d||0===y)return null;var w=a("recharts-trapezoid",v);return x?o().createElement($n,{canBegin:l>0,from:{upperWidth:0,lowerWidth:0,height:y,x:f,y:p},to:{upperWidth:h,lowerWidth:d,height:y,x:f,y:p},duration:b,animationEasing:m,isActive:x},(function(t){var e=t.upperWidth,r=t.lowerWidth,n=t.height,a=t.x,u=t.y;return o().createElement($n,{canBegin:l>0,from:"0px ".concat(-1===l?1:l,"px"),to:"".concat(l,"px 0px"),attributeName:"strokeDasharray",begin:g,duration:b,easing:m},o().createElement("path",vp({},nt(i,!0),{className:w,d:wp(a,u,e,r,n),ref:c})))})):o().createElement("g",null,o().createElement("path",vp({},nt(i,!0),{className:w,d:wp(f,p,h,d,y)})))};function Sp(t){return Sp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Sp(t)}function Pp(){return Pp=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Pp.apply(this,arguments)}function Ep(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ap(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Ep(Object(r),!0).forEach((function(e){kp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Ep(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function kp(t,e,r){var n;return n=function(t){if("object"!=Sp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Sp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Sp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var _p=function(t){var e=t.cx,r=t.cy,n=t.radius,o=t.angle,i=t.sign,a=t.isExternal,c=t.cornerRadius,u=t.cornerIsExternal,l=c*(a?1:-1)+n,s=Math.asin(c/l)/Cf,f=u?o:o+i*s,p=u?o-i*s:o;return{center:If(e,r,l,f),circleTangency:If(e,r,n,f),lineTangency:If(e,r,l*Math.cos(s*Cf),p),theta:s}},Mp=function(t){var e=t.cx,r=t.cy,n=t.innerRadius,o=t.outerRadius,i=t.startAngle,a=function(t,e){return m(e-t)*Math.min(Math.abs(e-t),359.999)}(i,t.endAngle),c=i+a,u=If(e,r,o,i),l=If(e,r,o,c),s="M ".concat(u.x,",").concat(u.y,"\n    A ").concat(o,",").concat(o,",0,\n    ").concat(+(Math.abs(a)>180),",").concat(+(i>c),",\n    ").concat(l.x,",").concat(l.y,"\n  ");if(n>0){var f=If(e,r,n,i),p=If(e,r,n,c);s+="L ".concat(p.x,",").concat(p.y,"\n            A ").concat(n,",").concat(n,",0,\n            ").concat(+(Math.abs(a)>180),",").concat(+(i<=c),",\n            ").concat(f.x,",").concat(f.y," Z")}else s+="L ".concat(e,",").concat(r," Z");return s},Tp={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},Cp=function(t){var e=Ap(Ap({},Tp),t),r=e.cx,n=e.cy,i=e.innerRadius,c=e.outerRadius,u=e.cornerRadius,l=e.forceCornerRadius,s=e.cornerIsExternal,f=e.startAngle,p=e.endAngle,h=e.className;if(c<i||f===p)return null;var d,y=a("recharts-sector",h),v=c-i,b=j(u,v,0,!0);return d=b>0&&Math.abs(f-p)<360?function(t){var e=t.cx,r=t.cy,n=t.innerRadius,o=t.outerRadius,i=t.cornerRadius,a=t.forceCornerRadius,c=t.cornerIsExternal,u=t.startAngle,l=t.endAngle,s=m(l-u),f=_p({cx:e,cy:r,radius:o,angle:u,sign:s,cornerRadius:i,cornerIsExternal:c}),p=f.circleTangency,h=f.lineTangency,d=f.theta,y=_p({cx:e,cy:r,radius:o,angle:l,sign:-s,cornerRadius:i,cornerIsExternal:c}),v=y.circleTangency,b=y.lineTangency,g=y.theta,x=c?Math.abs(u-l):Math.abs(u-l)-d-g;if(x<0)return a?"M ".concat(h.x,",").concat(h.y,"\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*i,",0\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*-i,",0\n      "):Mp({cx:e,cy:r,innerRadius:n,outerRadius:o,startAngle:u,endAngle:l});var w="M ".concat(h.x,",").concat(h.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(p.x,",").concat(p.y,"\n    A").concat(o,",").concat(o,",0,").concat(+(x>180),",").concat(+(s<0),",").concat(v.x,",").concat(v.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(b.x,",").concat(b.y,"\n  ");if(n>0){var O=_p({cx:e,cy:r,radius:n,angle:u,sign:s,isExternal:!0,cornerRadius:i,cornerIsExternal:c}),j=O.circleTangency,S=O.lineTangency,P=O.theta,E=_p({cx:e,cy:r,radius:n,angle:l,sign:-s,isExternal:!0,cornerRadius:i,cornerIsExternal:c}),A=E.circleTangency,k=E.lineTangency,_=E.theta,M=c?Math.abs(u-l):Math.abs(u-l)-P-_;if(M<0&&0===i)return"".concat(w,"L").concat(e,",").concat(r,"Z");w+="L".concat(k.x,",").concat(k.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(A.x,",").concat(A.y,"\n      A").concat(n,",").concat(n,",0,").concat(+(M>180),",").concat(+(s>0),",").concat(j.x,",").concat(j.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(S.x,",").concat(S.y,"Z")}else w+="L".concat(e,",").concat(r,"Z");return w}({cx:r,cy:n,innerRadius:i,outerRadius:c,cornerRadius:Math.min(b,v/2),forceCornerRadius:l,cornerIsExternal:s,startAngle:f,endAngle:p}):Mp({cx:r,cy:n,innerRadius:i,outerRadius:c,startAngle:f,endAngle:p}),o().createElement("path",Pp({},nt(e,!0),{className:y,d,role:"img"}))},Dp=["option","shapeType","propTransformer","activeClassName","isActive"];function Ip(t){return Ip="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ip(t)}function Np(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Bp(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Np(Object(r),!0).forEach((function(e){Rp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Np(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Rp(t,e,r){var n;return n=function(t){if("object"!=Ip(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ip(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ip(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Lp(t,e){return Bp(Bp({},e),t)}function zp(t){var e=t.shapeType,r=t.elementProps;switch(e){case"rectangle":return o().createElement(Jn,r);case"trapezoid":return o().createElement(jp,r);case"sector":return o().createElement(Cp,r);case"symbols":if(function(t){return"symbols"===t}(e))return o().createElement(Ye,r);break;default:return null}}function Fp(t){var r,n=t.option,i=t.shapeType,a=t.propTransformer,c=void 0===a?Lp:a,u=t.activeClassName,l=void 0===u?"recharts-active-shape":u,s=t.isActive,f=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,Dp);if((0,e.isValidElement)(n))r=(0,e.cloneElement)(n,Bp(Bp({},f),function(t){return(0,e.isValidElement)(t)?t.props:t}(n)));else if(C()(n))r=n(f);else if(pp()(n)&&!dp()(n)){var p=c(n,f);r=o().createElement(zp,{shapeType:i,elementProps:p})}else{var h=f;r=o().createElement(zp,{shapeType:i,elementProps:h})}return s?o().createElement(jt,{className:l},r):r}function Up(t,e){return null!=e&&"trapezoids"in t.props}function $p(t,e){return null!=e&&"sectors"in t.props}function qp(t,e){return null!=e&&"points"in t.props}function Wp(t,e){var r,n,o=t.x===(null==e||null===(r=e.labelViewBox)||void 0===r?void 0:r.x)||t.x===e.x,i=t.y===(null==e||null===(n=e.labelViewBox)||void 0===n?void 0:n.y)||t.y===e.y;return o&&i}function Xp(t,e){var r=t.endAngle===e.endAngle,n=t.startAngle===e.startAngle;return r&&n}function Hp(t,e){var r=t.x===e.x,n=t.y===e.y,o=t.z===e.z;return r&&n&&o}function Gp(t){var e=t.activeTooltipItem,r=t.graphicalItem,n=t.itemData,o=function(t,e){var r;return Up(t,e)?r="trapezoids":$p(t,e)?r="sectors":qp(t,e)&&(r="points"),r}(r,e),i=function(t,e){var r,n;return Up(t,e)?null===(r=e.tooltipPayload)||void 0===r||null===(r=r[0])||void 0===r||null===(r=r.payload)||void 0===r?void 0:r.payload:$p(t,e)?null===(n=e.tooltipPayload)||void 0===n||null===(n=n[0])||void 0===n||null===(n=n.payload)||void 0===n?void 0:n.payload:qp(t,e)?e.payload:{}}(r,e),a=n.filter((function(t,n){var a=Gl()(i,t),c=r.props[o].filter((function(t){var n=function(t,e){var r;return Up(t,e)?r=Wp:$p(t,e)?r=Xp:qp(t,e)&&(r=Hp),r}(r,e);return n(t,e)})),u=r.props[o].indexOf(c[c.length-1]);return a&&n===u}));return n.indexOf(a[a.length-1])}var Vp=["x","y"];function Yp(t){return Yp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Yp(t)}function Kp(){return Kp=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Kp.apply(this,arguments)}function Zp(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Jp(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Zp(Object(r),!0).forEach((function(e){Qp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Zp(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Qp(t,e,r){var n;return n=function(t){if("object"!=Yp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Yp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Yp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function th(t,e){var r=t.x,n=t.y,o=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,Vp),i="".concat(r),a=parseInt(i,10),c="".concat(n),u=parseInt(c,10),l="".concat(e.height||o.height),s=parseInt(l,10),f="".concat(e.width||o.width),p=parseInt(f,10);return Jp(Jp(Jp(Jp(Jp({},e),o),a?{x:a}:{}),u?{y:u}:{}),{},{height:s,width:p,name:e.name,radius:e.radius})}function eh(t){return o().createElement(Fp,Kp({shapeType:"rectangle",propTransformer:th,activeClassName:"recharts-active-bar"},t))}var rh,nh=["value","background"];function oh(t){return oh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},oh(t)}function ih(){return ih=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},ih.apply(this,arguments)}function ah(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function ch(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?ah(Object(r),!0).forEach((function(e){ph(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):ah(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function uh(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,hh(n.key),n)}}function lh(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(lh=function(){return!!t})()}function sh(t){return sh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},sh(t)}function fh(t,e){return fh=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},fh(t,e)}function ph(t,e,r){return(e=hh(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function hh(t){var e=function(t){if("object"!=oh(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=oh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==oh(e)?e:e+""}var dh=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return ph((r=this,n=e,o=[].concat(a),n=sh(n),t=function(t,e){if(e&&("object"===oh(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,lh()?Reflect.construct(n,o||[],sh(r).constructor):n.apply(r,o))),"state",{isAnimationFinished:!1}),ph(t,"id",O("recharts-bar-")),ph(t,"handleAnimationEnd",(function(){var e=t.props.onAnimationEnd;t.setState({isAnimationFinished:!0}),e&&e()})),ph(t,"handleAnimationStart",(function(){var e=t.props.onAnimationStart;t.setState({isAnimationFinished:!1}),e&&e()})),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&fh(t,e)}(e,t),r=e,n=[{key:"renderRectanglesStatically",value:function(t){var e=this,r=this.props,n=r.shape,i=r.dataKey,a=r.activeIndex,c=r.activeBar,u=nt(this.props,!1);return t&&t.map((function(t,r){var l=r===a,s=l?c:n,f=ch(ch(ch({},u),t),{},{isActive:l,option:s,index:r,dataKey:i,onAnimationStart:e.handleAnimationStart,onAnimationEnd:e.handleAnimationEnd});return o().createElement(jt,ih({className:"recharts-bar-rectangle"},q(e.props,t,r),{key:"rectangle-".concat(null==t?void 0:t.x,"-").concat(null==t?void 0:t.y,"-").concat(null==t?void 0:t.value,"-").concat(r)}),o().createElement(eh,f))}))}},{key:"renderRectanglesWithAnimation",value:function(){var t=this,e=this.props,r=e.data,n=e.layout,i=e.isAnimationActive,a=e.animationBegin,c=e.animationDuration,u=e.animationEasing,l=e.animationId,s=this.state.prevData;return o().createElement($n,{begin:a,duration:c,isActive:i,easing:u,from:{t:0},to:{t:1},key:"bar-".concat(l),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},(function(e){var i=e.t,a=r.map((function(t,e){var r=s&&s[e];if(r){var o=P(r.x,t.x),a=P(r.y,t.y),c=P(r.width,t.width),u=P(r.height,t.height);return ch(ch({},t),{},{x:o(i),y:a(i),width:c(i),height:u(i)})}if("horizontal"===n){var l=P(0,t.height)(i);return ch(ch({},t),{},{y:t.y+t.height-l,height:l})}var f=P(0,t.width)(i);return ch(ch({},t),{},{width:f})}));return o().createElement(jt,null,t.renderRectanglesStatically(a))}))}},{key:"renderRectangles",value:function(){var t=this.props,e=t.data,r=t.isAnimationActive,n=this.state.prevData;return!(r&&e&&e.length)||n&&Gl()(n,e)?this.renderRectanglesStatically(e):this.renderRectanglesWithAnimation()}},{key:"renderBackground",value:function(){var t=this,e=this.props,r=e.data,n=e.dataKey,i=e.activeIndex,a=nt(this.props.background,!1);return r.map((function(e,r){e.value;var c=e.background,u=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(e,nh);if(!c)return null;var l=ch(ch(ch(ch(ch({},u),{},{fill:"#eee"},c),a),q(t.props,e,r)),{},{onAnimationStart:t.handleAnimationStart,onAnimationEnd:t.handleAnimationEnd,dataKey:n,index:r,className:"recharts-bar-background-rectangle"});return o().createElement(eh,ih({key:"background-bar-".concat(r),option:t.props.background,isActive:r===i},l))}))}},{key:"renderErrorBar",value:function(t,e){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,n=r.data,i=r.xAxis,a=r.yAxis,c=r.layout,u=Q(r.children,Ms);if(!u)return null;var l="vertical"===c?n[0].height/2:n[0].width/2,s=function(t,e){var r=Array.isArray(t.value)?t.value[1]:t.value;return{x:t.x,y:t.y,value:r,errorVal:$s(t,e)}},f={clipPath:t?"url(#clipPath-".concat(e,")"):null};return o().createElement(jt,f,u.map((function(t){return o().cloneElement(t,{key:"error-bar-".concat(e,"-").concat(t.props.dataKey),data:n,xAxis:i,yAxis:a,layout:c,offset:l,dataPointFormatter:s})})))}},{key:"render",value:function(){var t=this.props,e=t.hide,r=t.data,n=t.className,i=t.xAxis,c=t.yAxis,u=t.left,l=t.top,s=t.width,f=t.height,p=t.isAnimationActive,h=t.background,d=t.id;if(e||!r||!r.length)return null;var y=this.state.isAnimationFinished,v=a("recharts-bar",n),m=i&&i.allowDataOverflow,b=c&&c.allowDataOverflow,g=m||b,x=M()(d)?this.id:d;return o().createElement(jt,{className:v},m||b?o().createElement("defs",null,o().createElement("clipPath",{id:"clipPath-".concat(x)},o().createElement("rect",{x:m?u:u-s/2,y:b?l:l-f/2,width:m?s:2*s,height:b?f:2*f}))):null,o().createElement(jt,{className:"recharts-bar-rectangles",clipPath:g?"url(#clipPath-".concat(x,")"):null},h?this.renderBackground():null,this.renderRectangles()),this.renderErrorBar(g,x),(!p||y)&&sp.renderCallByParent(this.props,r))}}],i=[{key:"getDerivedStateFromProps",value:function(t,e){return t.animationId!==e.prevAnimationId?{prevAnimationId:t.animationId,curData:t.data,prevData:e.curData}:t.data!==e.curData?{curData:t.data}:null}}],n&&uh(r.prototype,n),i&&uh(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.PureComponent);function yh(t){return yh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},yh(t)}function vh(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,xh(n.key),n)}}function mh(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function bh(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?mh(Object(r),!0).forEach((function(e){gh(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):mh(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function gh(t,e,r){return(e=xh(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function xh(t){var e=function(t){if("object"!=yh(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=yh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==yh(e)?e:e+""}rh=dh,ph(dh,"displayName","Bar"),ph(dh,"defaultProps",{xAxisId:0,yAxisId:0,legendType:"rect",minPointSize:0,hide:!1,data:[],layout:"vertical",activeBar:!1,isAnimationActive:!Vt.isSsr,animationBegin:0,animationDuration:400,animationEasing:"ease"}),ph(dh,"getComposedData",(function(t){var e=t.props,r=t.item,n=t.barPosition,o=t.bandSize,i=t.xAxis,a=t.yAxis,c=t.xAxisTicks,u=t.yAxisTicks,l=t.stackedData,s=t.dataStartIndex,f=t.displayedData,p=t.offset,h=function(t,e){if(!t)return null;for(var r=0,n=t.length;r<n;r++)if(t[r].item===e)return t[r].position;return null}(n,r);if(!h)return null;var d=e.layout,y=r.type.defaultProps,v=void 0!==y?ch(ch({},y),r.props):r.props,b=v.dataKey,x=v.children,w=v.minPointSize,O="horizontal"===d?a:i,j=l?O.scale.domain():null,S=function(t){var e=t.numericAxis,r=e.scale.domain();if("number"===e.type){var n=Math.min(r[0],r[1]),o=Math.max(r[0],r[1]);return n<=0&&o>=0?0:o<0?o:n}return r[0]}({numericAxis:O}),P=Q(x,Zf),E=f.map((function(t,e){var n,f,p,y,v,x;l?n=function(t,e){if(!e||2!==e.length||!g(e[0])||!g(e[1]))return t;var r=Math.min(e[0],e[1]),n=Math.max(e[0],e[1]),o=[t[0],t[1]];return(!g(t[0])||t[0]<r)&&(o[0]=r),(!g(t[1])||t[1]>n)&&(o[1]=n),o[0]>n&&(o[0]=n),o[1]<r&&(o[1]=r),o}(l[s+e],j):(n=$s(t,b),Array.isArray(n)||(n=[S,n]));var O=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return function(r,n){if("number"==typeof t)return t;var o="number"==typeof r;return o?t(r,n):(o||mt(!1),e)}}(w,rh.defaultProps.minPointSize)(n[1],e);if("horizontal"===d){var E,A=[a.scale(n[0]),a.scale(n[1])],k=A[0],_=A[1];f=rf({axis:i,ticks:c,bandSize:o,offset:h.offset,entry:t,index:e}),p=null!==(E=null!=_?_:k)&&void 0!==E?E:void 0,y=h.size;var M=k-_;if(v=Number.isNaN(M)?0:M,x={x:f,y:a.y,width:y,height:a.height},Math.abs(O)>0&&Math.abs(v)<Math.abs(O)){var T=m(v||O)*(Math.abs(O)-Math.abs(v));p-=T,v+=T}}else{var C=[i.scale(n[0]),i.scale(n[1])],D=C[0],I=C[1];f=D,p=rf({axis:a,ticks:u,bandSize:o,offset:h.offset,entry:t,index:e}),y=I-D,v=h.size,x={x:i.x,y:p,width:i.width,height:v},Math.abs(O)>0&&Math.abs(y)<Math.abs(O)&&(y+=m(y||O)*(Math.abs(O)-Math.abs(y)))}return ch(ch(ch({},t),{},{x:f,y:p,width:y,height:v,value:l?n:n[1],payload:t,background:x},P&&P[e]&&P[e].props),{},{tooltipPayload:[sf(r,t)],tooltipPosition:{x:f+y/2,y:p+v/2}})}));return ch({data:E,layout:d},p)}));var wh=function(t,e){var r=t.x,n=t.y,o=e.x,i=e.y;return{x:Math.min(r,o),y:Math.min(n,i),width:Math.abs(o-r),height:Math.abs(i-n)}},Oh=function(){function t(e){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.scale=e}return e=t,r=[{key:"domain",get:function(){return this.scale.domain}},{key:"range",get:function(){return this.scale.range}},{key:"rangeMin",get:function(){return this.range()[0]}},{key:"rangeMax",get:function(){return this.range()[1]}},{key:"bandwidth",get:function(){return this.scale.bandwidth}},{key:"apply",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=e.bandAware,n=e.position;if(void 0!==t){if(n)switch(n){case"start":default:return this.scale(t);case"middle":var o=this.bandwidth?this.bandwidth()/2:0;return this.scale(t)+o;case"end":var i=this.bandwidth?this.bandwidth():0;return this.scale(t)+i}if(r){var a=this.bandwidth?this.bandwidth()/2:0;return this.scale(t)+a}return this.scale(t)}}},{key:"isInRange",value:function(t){var e=this.range(),r=e[0],n=e[e.length-1];return r<=n?t>=r&&t<=n:t>=n&&t<=r}}],n=[{key:"create",value:function(e){return new t(e)}}],r&&vh(e.prototype,r),n&&vh(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,r,n}();gh(Oh,"EPS",1e-4);var jh=function(t){var e=Object.keys(t).reduce((function(e,r){return bh(bh({},e),{},gh({},r,Oh.create(t[r])))}),{});return bh(bh({},e),{},{apply:function(t){var r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=r.bandAware,o=r.position;return Vf()(t,(function(t,r){return e[r].apply(t,{bandAware:n,position:o})}))},isInRange:function(t){return Kf()(t,(function(t,r){return e[r].isInRange(t)}))}})};function Sh(){return Sh=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Sh.apply(this,arguments)}function Ph(t){return Ph="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ph(t)}function Eh(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ah(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Eh(Object(r),!0).forEach((function(e){Ch(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Eh(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function kh(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Dh(n.key),n)}}function _h(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(_h=function(){return!!t})()}function Mh(t){return Mh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Mh(t)}function Th(t,e){return Th=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Th(t,e)}function Ch(t,e,r){return(e=Dh(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Dh(t){var e=function(t){if("object"!=Ph(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ph(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Ph(e)?e:e+""}var Ih=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=Mh(r=e),function(t,e){if(e&&("object"===Ph(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,_h()?Reflect.construct(r,n||[],Mh(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Th(t,e)}(e,t),r=e,n=[{key:"render",value:function(){var t=this.props,r=t.x,n=t.y,i=t.r,c=t.alwaysShow,u=t.clipPathId,l=x(r),s=x(n);if(k(void 0===c,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.'),!l||!s)return null;var f=function(t){var e=t.x,r=t.y,n=t.xAxis,o=t.yAxis,i=jh({x:n.scale,y:o.scale}),a=i.apply({x:e,y:r},{bandAware:!0});return Hf(t,"discard")&&!i.isInRange(a)?null:a}(this.props);if(!f)return null;var p=f.x,h=f.y,d=this.props,y=d.shape,v=d.className,m=Ah(Ah({clipPath:Hf(this.props,"hidden")?"url(#".concat(u,")"):void 0},nt(this.props,!0)),{},{cx:p,cy:h});return o().createElement(jt,{className:a("recharts-reference-dot",v)},e.renderDot(y,m),Wf.renderCallByParent(this.props,{x:p-i,y:h-i,width:2*i,height:2*i}))}}],n&&kh(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);Ch(Ih,"displayName","ReferenceDot"),Ch(Ih,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#fff",stroke:"#ccc",fillOpacity:1,strokeWidth:1}),Ch(Ih,"renderDot",(function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement(xr,Sh({},e,{cx:e.cx,cy:e.cy,className:"recharts-reference-dot-dot"}))}));var Nh=r(2426),Bh=r.n(Nh),Rh=r(7309),Lh=r.n(Rh),zh=r(104),Fh=r.n(zh)()((function(t){return{x:t.left,y:t.top,width:t.width,height:t.height}}),(function(t){return["l",t.left,"t",t.top,"w",t.width,"h",t.height].join("")})),Uh=(0,e.createContext)(void 0),$h=(0,e.createContext)(void 0),qh=(0,e.createContext)(void 0),Wh=(0,e.createContext)({}),Xh=(0,e.createContext)(void 0),Hh=(0,e.createContext)(0),Gh=(0,e.createContext)(0),Vh=function(t){var e=t.state,r=e.xAxisMap,n=e.yAxisMap,i=e.offset,a=t.clipPathId,c=t.children,u=t.width,l=t.height,s=Fh(i);return o().createElement(Uh.Provider,{value:r},o().createElement($h.Provider,{value:n},o().createElement(Wh.Provider,{value:i},o().createElement(qh.Provider,{value:s},o().createElement(Xh.Provider,{value:a},o().createElement(Hh.Provider,{value:l},o().createElement(Gh.Provider,{value:u},c)))))))},Yh=function(t){var r=(0,e.useContext)(Uh);null==r&&mt(!1);var n=r[t];return null==n&&mt(!1),n},Kh=function(t){var r=(0,e.useContext)($h);null==r&&mt(!1);var n=r[t];return null==n&&mt(!1),n},Zh=function(){return(0,e.useContext)(Gh)},Jh=function(){return(0,e.useContext)(Hh)};function Qh(t){return Qh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Qh(t)}function td(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,cd(n.key),n)}}function ed(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(ed=function(){return!!t})()}function rd(t){return rd=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},rd(t)}function nd(t,e){return nd=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},nd(t,e)}function od(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function id(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?od(Object(r),!0).forEach((function(e){ad(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):od(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function ad(t,e,r){return(e=cd(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function cd(t){var e=function(t){if("object"!=Qh(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Qh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Qh(e)?e:e+""}function ud(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function ld(){return ld=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},ld.apply(this,arguments)}function sd(t){var r=t.x,n=t.y,i=t.segment,c=t.xAxisId,u=t.yAxisId,l=t.shape,s=t.className,f=t.alwaysShow,p=(0,e.useContext)(Xh),h=Yh(c),d=Kh(u),y=(0,e.useContext)(qh);if(!p||!y)return null;k(void 0===f,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var v=function(t,e,r,n,o,i,a,c,u){var l=o.x,s=o.y,f=o.width,p=o.height;if(r){var h=u.y,d=t.y.apply(h,{position:i});if(Hf(u,"discard")&&!t.y.isInRange(d))return null;var y=[{x:l+f,y:d},{x:l,y:d}];return"left"===c?y.reverse():y}if(e){var v=u.x,m=t.x.apply(v,{position:i});if(Hf(u,"discard")&&!t.x.isInRange(m))return null;var b=[{x:m,y:s+p},{x:m,y:s}];return"top"===a?b.reverse():b}if(n){var g=u.segment.map((function(e){return t.apply(e,{position:i})}));return Hf(u,"discard")&&Bh()(g,(function(e){return!t.isInRange(e)}))?null:g}return null}(jh({x:h.scale,y:d.scale}),x(r),x(n),i&&2===i.length,y,t.position,h.orientation,d.orientation,t);if(!v)return null;var m,b,g,w=(b=2,function(t){if(Array.isArray(t))return t}(m=v)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(m,b)||function(t,e){if(t){if("string"==typeof t)return ud(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?ud(t,e):void 0}}(m,b)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),O=w[0],j=O.x,S=O.y,P=w[1],E=P.x,A=P.y,_=id(id({clipPath:Hf(t,"hidden")?"url(#".concat(p,")"):void 0},nt(t,!0)),{},{x1:j,y1:S,x2:E,y2:A});return o().createElement(jt,{className:a("recharts-reference-line",s)},function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement("line",ld({},e,{className:"recharts-reference-line-line"}))}(l,_),Wf.renderCallByParent(t,wh({x:(g={x1:j,y1:S,x2:E,y2:A}).x1,y:g.y1},{x:g.x2,y:g.y2})))}var fd=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=rd(r=e),function(t,e){if(e&&("object"===Qh(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,ed()?Reflect.construct(r,n||[],rd(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&nd(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){return o().createElement(sd,this.props)}}])&&td(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function pd(){return pd=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},pd.apply(this,arguments)}function hd(t){return hd="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},hd(t)}function dd(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function yd(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?dd(Object(r),!0).forEach((function(e){xd(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):dd(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function vd(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,wd(n.key),n)}}function md(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(md=function(){return!!t})()}function bd(t){return bd=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},bd(t)}function gd(t,e){return gd=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},gd(t,e)}function xd(t,e,r){return(e=wd(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function wd(t){var e=function(t){if("object"!=hd(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=hd(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==hd(e)?e:e+""}ad(fd,"displayName","ReferenceLine"),ad(fd,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,fill:"none",stroke:"#ccc",fillOpacity:1,strokeWidth:1,position:"middle"});var Od=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=bd(r=e),function(t,e){if(e&&("object"===hd(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,md()?Reflect.construct(r,n||[],bd(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&gd(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){var t=this.props,r=t.x1,n=t.x2,i=t.y1,c=t.y2,u=t.className,l=t.alwaysShow,s=t.clipPathId;k(void 0===l,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var f=x(r),p=x(n),h=x(i),d=x(c),y=this.props.shape;if(!(f||p||h||d||y))return null;var v=function(t,e,r,n,o){var i=o.x1,a=o.x2,c=o.y1,u=o.y2,l=o.xAxis,s=o.yAxis;if(!l||!s)return null;var f=jh({x:l.scale,y:s.scale}),p={x:t?f.x.apply(i,{position:"start"}):f.x.rangeMin,y:r?f.y.apply(c,{position:"start"}):f.y.rangeMin},h={x:e?f.x.apply(a,{position:"end"}):f.x.rangeMax,y:n?f.y.apply(u,{position:"end"}):f.y.rangeMax};return!Hf(o,"discard")||f.isInRange(p)&&f.isInRange(h)?wh(p,h):null}(f,p,h,d,this.props);if(!v&&!y)return null;var m=Hf(this.props,"hidden")?"url(#".concat(s,")"):void 0;return o().createElement(jt,{className:a("recharts-reference-area",u)},e.renderRect(y,yd(yd({clipPath:m},nt(this.props,!0)),v)),Wf.renderCallByParent(this.props,v))}}])&&vd(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function jd(t){return function(t){if(Array.isArray(t))return Sd(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return Sd(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Sd(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Sd(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}xd(Od,"displayName","ReferenceArea"),xd(Od,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#ccc",fillOpacity:.5,stroke:"none",strokeWidth:1}),xd(Od,"renderRect",(function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement(Jn,pd({},e,{className:"recharts-reference-area-rect"}))}));var Pd=function(t,e,r,n,o){var i=Q(t,fd),a=Q(t,Ih),c=[].concat(jd(i),jd(a)),u=Q(t,Od),l="".concat(n,"Id"),s=n[0],f=e;if(c.length&&(f=c.reduce((function(t,e){if(e.props[l]===r&&Hf(e.props,"extendDomain")&&g(e.props[s])){var n=e.props[s];return[Math.min(t[0],n),Math.max(t[1],n)]}return t}),f)),u.length){var p="".concat(s,"1"),h="".concat(s,"2");f=u.reduce((function(t,e){if(e.props[l]===r&&Hf(e.props,"extendDomain")&&g(e.props[p])&&g(e.props[h])){var n=e.props[p],o=e.props[h];return[Math.min(t[0],n,o),Math.max(t[1],n,o)]}return t}),f)}return o&&o.length&&(f=o.reduce((function(t,e){return g(e)?[Math.min(t[0],e),Math.max(t[1],e)]:t}),f)),f},Ed=r(228),Ad=new(r.n(Ed)()),kd="recharts.syncMouseEvents";function _d(t){return _d="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},_d(t)}function Md(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Cd(n.key),n)}}function Td(t,e,r){return(e=Cd(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Cd(t){var e=function(t){if("object"!=_d(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=_d(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==_d(e)?e:e+""}var Dd=function(){return t=function t(){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),Td(this,"activeIndex",0),Td(this,"coordinateList",[]),Td(this,"layout","horizontal")},(e=[{key:"setDetails",value:function(t){var e,r=t.coordinateList,n=void 0===r?null:r,o=t.container,i=void 0===o?null:o,a=t.layout,c=void 0===a?null:a,u=t.offset,l=void 0===u?null:u,s=t.mouseHandlerCallback,f=void 0===s?null:s;this.coordinateList=null!==(e=null!=n?n:this.coordinateList)&&void 0!==e?e:[],this.container=null!=i?i:this.container,this.layout=null!=c?c:this.layout,this.offset=null!=l?l:this.offset,this.mouseHandlerCallback=null!=f?f:this.mouseHandlerCallback,this.activeIndex=Math.min(Math.max(this.activeIndex,0),this.coordinateList.length-1)}},{key:"focus",value:function(){this.spoofMouse()}},{key:"keyboardEvent",value:function(t){if(0!==this.coordinateList.length)switch(t.key){case"ArrowRight":if("horizontal"!==this.layout)return;this.activeIndex=Math.min(this.activeIndex+1,this.coordinateList.length-1),this.spoofMouse();break;case"ArrowLeft":if("horizontal"!==this.layout)return;this.activeIndex=Math.max(this.activeIndex-1,0),this.spoofMouse()}}},{key:"setIndex",value:function(t){this.activeIndex=t}},{key:"spoofMouse",value:function(){var t,e;if("horizontal"===this.layout&&0!==this.coordinateList.length){var r=this.container.getBoundingClientRect(),n=r.x,o=r.y,i=r.height,a=this.coordinateList[this.activeIndex].coordinate,c=(null===(t=window)||void 0===t?void 0:t.scrollX)||0,u=(null===(e=window)||void 0===e?void 0:e.scrollY)||0,l=n+a+c,s=o+this.offset.top+i/2+u;this.mouseHandlerCallback({pageX:l,pageY:s})}}}])&&Md(t.prototype,e),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,e}();function Id(){}function Nd(t,e,r){t._context.bezierCurveTo((2*t._x0+t._x1)/3,(2*t._y0+t._y1)/3,(t._x0+2*t._x1)/3,(t._y0+2*t._y1)/3,(t._x0+4*t._x1+e)/6,(t._y0+4*t._y1+r)/6)}function Bd(t){this._context=t}function Rd(t){this._context=t}function Ld(t){this._context=t}Bd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:Nd(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:Nd(this,t,e)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e}},Rd.prototype={areaStart:Id,areaEnd:Id,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._x2=t,this._y2=e;break;case 1:this._point=2,this._x3=t,this._y3=e;break;case 2:this._point=3,this._x4=t,this._y4=e,this._context.moveTo((this._x0+4*this._x1+t)/6,(this._y0+4*this._y1+e)/6);break;default:Nd(this,t,e)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e}},Ld.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var r=(this._x0+4*this._x1+t)/6,n=(this._y0+4*this._y1+e)/6;this._line?this._context.lineTo(r,n):this._context.moveTo(r,n);break;case 3:this._point=4;default:Nd(this,t,e)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e}};class zd{constructor(t,e){this._context=t,this._x=e}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line}point(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+t)/2,this._y0,this._x0,e,t,e):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+e)/2,t,this._y0,t,e)}this._x0=t,this._y0=e}}function Fd(t){this._context=t}function Ud(t){this._context=t}function $d(t){return new Ud(t)}function qd(t){return t<0?-1:1}function Wd(t,e,r){var n=t._x1-t._x0,o=e-t._x1,i=(t._y1-t._y0)/(n||o<0&&-0),a=(r-t._y1)/(o||n<0&&-0),c=(i*o+a*n)/(n+o);return(qd(i)+qd(a))*Math.min(Math.abs(i),Math.abs(a),.5*Math.abs(c))||0}function Xd(t,e){var r=t._x1-t._x0;return r?(3*(t._y1-t._y0)/r-e)/2:e}function Hd(t,e,r){var n=t._x0,o=t._y0,i=t._x1,a=t._y1,c=(i-n)/3;t._context.bezierCurveTo(n+c,o+c*e,i-c,a-c*r,i,a)}function Gd(t){this._context=t}function Vd(t){this._context=new Yd(t)}function Yd(t){this._context=t}function Kd(t){this._context=t}function Zd(t){var e,r,n=t.length-1,o=new Array(n),i=new Array(n),a=new Array(n);for(o[0]=0,i[0]=2,a[0]=t[0]+2*t[1],e=1;e<n-1;++e)o[e]=1,i[e]=4,a[e]=4*t[e]+2*t[e+1];for(o[n-1]=2,i[n-1]=7,a[n-1]=8*t[n-1]+t[n],e=1;e<n;++e)r=o[e]/i[e-1],i[e]-=r,a[e]-=r*a[e-1];for(o[n-1]=a[n-1]/i[n-1],e=n-2;e>=0;--e)o[e]=(a[e]-o[e+1])/i[e];for(i[n-1]=(t[n]+o[n-1])/2,e=0;e<n-1;++e)i[e]=2*t[e+1]-o[e+1];return[o,i]}function Jd(t,e){this._context=t,this._t=e}function Qd(t){return t[0]}function ty(t){return t[1]}function ey(t,e){var r=De(!0),n=null,o=$d,i=null,a=Fe(c);function c(c){var u,l,s,f=(c=Bl(c)).length,p=!1;for(null==n&&(i=o(s=a())),u=0;u<=f;++u)!(u<f&&r(l=c[u],u,c))===p&&((p=!p)?i.lineStart():i.lineEnd()),p&&i.point(+t(l,u,c),+e(l,u,c));if(s)return i=null,s+""||null}return t="function"==typeof t?t:void 0===t?Qd:De(t),e="function"==typeof e?e:void 0===e?ty:De(e),c.x=function(e){return arguments.length?(t="function"==typeof e?e:De(+e),c):t},c.y=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),c):e},c.defined=function(t){return arguments.length?(r="function"==typeof t?t:De(!!t),c):r},c.curve=function(t){return arguments.length?(o=t,null!=n&&(i=o(n)),c):o},c.context=function(t){return arguments.length?(null==t?n=i=null:i=o(n=t),c):n},c}function ry(t,e,r){var n=null,o=De(!0),i=null,a=$d,c=null,u=Fe(l);function l(l){var s,f,p,h,d,y=(l=Bl(l)).length,v=!1,m=new Array(y),b=new Array(y);for(null==i&&(c=a(d=u())),s=0;s<=y;++s){if(!(s<y&&o(h=l[s],s,l))===v)if(v=!v)f=s,c.areaStart(),c.lineStart();else{for(c.lineEnd(),c.lineStart(),p=s-1;p>=f;--p)c.point(m[p],b[p]);c.lineEnd(),c.areaEnd()}v&&(m[s]=+t(h,s,l),b[s]=+e(h,s,l),c.point(n?+n(h,s,l):m[s],r?+r(h,s,l):b[s]))}if(d)return c=null,d+""||null}function s(){return ey().defined(o).curve(a).context(i)}return t="function"==typeof t?t:void 0===t?Qd:De(+t),e="function"==typeof e?e:De(void 0===e?0:+e),r="function"==typeof r?r:void 0===r?ty:De(+r),l.x=function(e){return arguments.length?(t="function"==typeof e?e:De(+e),n=null,l):t},l.x0=function(e){return arguments.length?(t="function"==typeof e?e:De(+e),l):t},l.x1=function(t){return arguments.length?(n=null==t?null:"function"==typeof t?t:De(+t),l):n},l.y=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),r=null,l):e},l.y0=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),l):e},l.y1=function(t){return arguments.length?(r=null==t?null:"function"==typeof t?t:De(+t),l):r},l.lineX0=l.lineY0=function(){return s().x(t).y(e)},l.lineY1=function(){return s().x(t).y(r)},l.lineX1=function(){return s().x(n).y(e)},l.defined=function(t){return arguments.length?(o="function"==typeof t?t:De(!!t),l):o},l.curve=function(t){return arguments.length?(a=t,null!=i&&(c=a(i)),l):a},l.context=function(t){return arguments.length?(null==t?i=c=null:c=a(i=t),l):i},l}function ny(t){return ny="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ny(t)}function oy(){return oy=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},oy.apply(this,arguments)}function iy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function ay(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?iy(Object(r),!0).forEach((function(e){cy(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):iy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function cy(t,e,r){var n;return n=function(t){if("object"!=ny(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ny(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==ny(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Fd.prototype={areaStart:Id,areaEnd:Id,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(t,e){t=+t,e=+e,this._point?this._context.lineTo(t,e):(this._point=1,this._context.moveTo(t,e))}},Ud.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;default:this._context.lineTo(t,e)}}},Gd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:Hd(this,this._t0,Xd(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){var r=NaN;if(e=+e,(t=+t)!==this._x1||e!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;break;case 2:this._point=3,Hd(this,Xd(this,r=Wd(this,t,e)),r);break;default:Hd(this,this._t0,r=Wd(this,t,e))}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e,this._t0=r}}},(Vd.prototype=Object.create(Gd.prototype)).point=function(t,e){Gd.prototype.point.call(this,e,t)},Yd.prototype={moveTo:function(t,e){this._context.moveTo(e,t)},closePath:function(){this._context.closePath()},lineTo:function(t,e){this._context.lineTo(e,t)},bezierCurveTo:function(t,e,r,n,o,i){this._context.bezierCurveTo(e,t,n,r,i,o)}},Kd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var t=this._x,e=this._y,r=t.length;if(r)if(this._line?this._context.lineTo(t[0],e[0]):this._context.moveTo(t[0],e[0]),2===r)this._context.lineTo(t[1],e[1]);else for(var n=Zd(t),o=Zd(e),i=0,a=1;a<r;++i,++a)this._context.bezierCurveTo(n[0][i],o[0][i],n[1][i],o[1][i],t[a],e[a]);(this._line||0!==this._line&&1===r)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(t,e){this._x.push(+t),this._y.push(+e)}},Jd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,e),this._context.lineTo(t,e);else{var r=this._x*(1-this._t)+t*this._t;this._context.lineTo(r,this._y),this._context.lineTo(r,e)}}this._x=t,this._y=e}};var uy={curveBasisClosed:function(t){return new Rd(t)},curveBasisOpen:function(t){return new Ld(t)},curveBasis:function(t){return new Bd(t)},curveBumpX:function(t){return new zd(t,!0)},curveBumpY:function(t){return new zd(t,!1)},curveLinearClosed:function(t){return new Fd(t)},curveLinear:$d,curveMonotoneX:function(t){return new Gd(t)},curveMonotoneY:function(t){return new Vd(t)},curveNatural:function(t){return new Kd(t)},curveStep:function(t){return new Jd(t,.5)},curveStepAfter:function(t){return new Jd(t,1)},curveStepBefore:function(t){return new Jd(t,0)}},ly=function(t){return t.x===+t.x&&t.y===+t.y},sy=function(t){return t.x},fy=function(t){return t.y},py=function(t){var e=t.className,r=t.points,n=t.path,i=t.pathRef;if(!(r&&r.length||n))return null;var c=r&&r.length?function(t){var e,r=t.type,n=void 0===r?"linear":r,o=t.points,i=void 0===o?[]:o,a=t.baseLine,c=t.layout,u=t.connectNulls,l=void 0!==u&&u,s=function(t,e){if(C()(t))return t;var r="curve".concat(se()(t));return"curveMonotone"!==r&&"curveBump"!==r||!e?uy[r]||$d:uy["".concat(r).concat("vertical"===e?"Y":"X")]}(n,c),f=l?i.filter((function(t){return ly(t)})):i;if(Array.isArray(a)){var p=l?a.filter((function(t){return ly(t)})):a,h=f.map((function(t,e){return ay(ay({},t),{},{base:p[e]})}));return(e="vertical"===c?ry().y(fy).x1(sy).x0((function(t){return t.base.x})):ry().x(sy).y1(fy).y0((function(t){return t.base.y}))).defined(ly).curve(s),e(h)}return(e="vertical"===c&&g(a)?ry().y(fy).x1(sy).x0(a):g(a)?ry().x(sy).y1(fy).y0(a):ey().x(sy).y(fy)).defined(ly).curve(s),e(f)}(t):n;return o().createElement("path",oy({},nt(t,!1),$(t),{className:a("recharts-curve",e),d:c,ref:i}))};function hy(t){return hy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},hy(t)}var dy=["x","y","top","left","width","height","className"];function yy(){return yy=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},yy.apply(this,arguments)}function vy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function my(t,e,r){var n;return n=function(t){if("object"!=hy(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=hy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==hy(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var by=function(t,e,r,n,o,i){return"M".concat(t,",").concat(o,"v").concat(n,"M").concat(i,",").concat(e,"h").concat(r)},gy=function(t){var e=t.x,r=void 0===e?0:e,n=t.y,i=void 0===n?0:n,c=t.top,u=void 0===c?0:c,l=t.left,s=void 0===l?0:l,f=t.width,p=void 0===f?0:f,h=t.height,d=void 0===h?0:h,y=t.className,v=function(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?vy(Object(r),!0).forEach((function(e){my(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):vy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}({x:r,y:i,top:u,left:s,width:p,height:d},function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,dy));return g(r)&&g(i)&&g(p)&&g(d)&&g(u)&&g(s)?o().createElement("path",yy({},nt(v,!0),{className:a("recharts-cross",y),d:by(r,i,p,d,u,s)})):null};function xy(t){var e=t.cx,r=t.cy,n=t.radius,o=t.startAngle,i=t.endAngle;return{points:[If(e,r,n,o),If(e,r,n,i)],cx:e,cy:r,radius:n,startAngle:o,endAngle:i}}function wy(t,e,r){var n,o,i,a;if("horizontal"===t)i=n=e.x,o=r.top,a=r.top+r.height;else if("vertical"===t)a=o=e.y,n=r.left,i=r.left+r.width;else if(null!=e.cx&&null!=e.cy){if("centric"!==t)return xy(e);var c=e.cx,u=e.cy,l=e.innerRadius,s=e.outerRadius,f=e.angle,p=If(c,u,l,f),h=If(c,u,s,f);n=p.x,o=p.y,i=h.x,a=h.y}return[{x:n,y:o},{x:i,y:a}]}function Oy(t){return Oy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Oy(t)}function jy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Sy(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?jy(Object(r),!0).forEach((function(e){Py(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):jy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Py(t,e,r){var n;return n=function(t){if("object"!=Oy(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Oy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Oy(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Ey(t){var r,n,o,i=t.element,c=t.tooltipEventType,u=t.isActive,l=t.activeCoordinate,s=t.activePayload,f=t.offset,p=t.activeTooltipIndex,h=t.tooltipAxisBandSize,d=t.layout,y=t.chartName,v=null!==(r=i.props.cursor)&&void 0!==r?r:null===(n=i.type.defaultProps)||void 0===n?void 0:n.cursor;if(!i||!v||!u||!l||"ScatterChart"!==y&&"axis"!==c)return null;var m=py;if("ScatterChart"===y)o=l,m=gy;else if("BarChart"===y)o=function(t,e,r,n){var o=n/2;return{stroke:"none",fill:"#ccc",x:"horizontal"===t?e.x-o:r.left+.5,y:"horizontal"===t?r.top+.5:e.y-o,width:"horizontal"===t?n:r.width-1,height:"horizontal"===t?r.height-1:n}}(d,l,f,h),m=Jn;else if("radial"===d){var b=xy(l),g=b.cx,x=b.cy,w=b.radius;o={cx:g,cy:x,startAngle:b.startAngle,endAngle:b.endAngle,innerRadius:w,outerRadius:w},m=Cp}else o={points:wy(d,l,f)},m=py;var O=Sy(Sy(Sy(Sy({stroke:"#ccc",pointerEvents:"none"},f),o),nt(v,!1)),{},{payload:s,payloadIndex:p,className:a("recharts-tooltip-cursor",v.className)});return(0,e.isValidElement)(v)?(0,e.cloneElement)(v,O):(0,e.createElement)(m,O)}var Ay=["item"],ky=["children","className","width","height","style","compact","title","desc"];function _y(t){return _y="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},_y(t)}function My(){return My=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},My.apply(this,arguments)}function Ty(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||Ly(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Cy(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function Dy(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,qy(n.key),n)}}function Iy(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Iy=function(){return!!t})()}function Ny(t){return Ny=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Ny(t)}function By(t,e){return By=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},By(t,e)}function Ry(t){return function(t){if(Array.isArray(t))return zy(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||Ly(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ly(t,e){if(t){if("string"==typeof t)return zy(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?zy(t,e):void 0}}function zy(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Fy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Uy(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Fy(Object(r),!0).forEach((function(e){$y(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Fy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function $y(t,e,r){return(e=qy(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function qy(t){var e=function(t){if("object"!=_y(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=_y(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==_y(e)?e:e+""}var Wy={xAxis:["bottom","top"],yAxis:["left","right"]},Xy={width:"100%",height:"100%"},Hy={x:0,y:0};function Gy(t){return t}var Vy=function(t,e){var r=e.graphicalItems,n=e.dataStartIndex,o=e.dataEndIndex,i=(null!=r?r:[]).reduce((function(t,e){var r=e.props.data;return r&&r.length?[].concat(Ry(t),Ry(r)):t}),[]);return i.length>0?i:t&&t.length&&g(n)&&g(o)?t.slice(n,o+1):[]};function Yy(t){return"number"===t?[0,"auto"]:void 0}var Ky=function(t,e,r,n){var o=t.graphicalItems,i=t.tooltipAxis,a=Vy(e,t);return r<0||!o||!o.length||r>=a.length?null:o.reduce((function(o,c){var u,l,s=null!==(u=c.props.data)&&void 0!==u?u:e;return s&&t.dataStartIndex+t.dataEndIndex!==0&&t.dataEndIndex-t.dataStartIndex>=r&&(s=s.slice(t.dataStartIndex,t.dataEndIndex+1)),(l=i.dataKey&&!i.allowDuplicatedCategory?E(void 0===s?a:s,i.dataKey,n):s&&s[r]||a[r])?[].concat(Ry(o),[sf(c,l)]):o}),[])},Zy=function(t,e,r,n){var o=n||{x:t.chartX,y:t.chartY},i=function(t,e){return"horizontal"===e?t.x:"vertical"===e?t.y:"centric"===e?t.angle:t.radius}(o,r),a=t.orderedTooltipTicks,c=t.tooltipAxis,u=t.tooltipTicks,l=function(t){var e,r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2?arguments[2]:void 0,o=arguments.length>3?arguments[3]:void 0,i=-1,a=null!==(e=null==r?void 0:r.length)&&void 0!==e?e:0;if(a<=1)return 0;if(o&&"angleAxis"===o.axisType&&Math.abs(Math.abs(o.range[1]-o.range[0])-360)<=1e-6)for(var c=o.range,u=0;u<a;u++){var l=u>0?n[u-1].coordinate:n[a-1].coordinate,s=n[u].coordinate,f=u>=a-1?n[0].coordinate:n[u+1].coordinate,p=void 0;if(m(s-l)!==m(f-s)){var h=[];if(m(f-s)===m(c[1]-c[0])){p=f;var d=s+c[1]-c[0];h[0]=Math.min(d,(d+l)/2),h[1]=Math.max(d,(d+l)/2)}else{p=l;var y=f+c[1]-c[0];h[0]=Math.min(s,(y+s)/2),h[1]=Math.max(s,(y+s)/2)}var v=[Math.min(s,(p+s)/2),Math.max(s,(p+s)/2)];if(t>v[0]&&t<=v[1]||t>=h[0]&&t<=h[1]){i=n[u].index;break}}else{var b=Math.min(l,f),g=Math.max(l,f);if(t>(b+s)/2&&t<=(g+s)/2){i=n[u].index;break}}}else for(var x=0;x<a;x++)if(0===x&&t<=(r[x].coordinate+r[x+1].coordinate)/2||x>0&&x<a-1&&t>(r[x].coordinate+r[x-1].coordinate)/2&&t<=(r[x].coordinate+r[x+1].coordinate)/2||x===a-1&&t>(r[x].coordinate+r[x-1].coordinate)/2){i=r[x].index;break}return i}(i,a,u,c);if(l>=0&&u){var s=u[l]&&u[l].value,f=Ky(t,e,l,s),p=function(t,e,r,n){var o=e.find((function(t){return t&&t.index===r}));if(o){if("horizontal"===t)return{x:o.coordinate,y:n.y};if("vertical"===t)return{x:n.x,y:o.coordinate};if("centric"===t){var i=o.coordinate,a=n.radius;return Uy(Uy(Uy({},n),If(n.cx,n.cy,a,i)),{},{angle:i,radius:a})}var c=o.coordinate,u=n.angle;return Uy(Uy(Uy({},n),If(n.cx,n.cy,c,u)),{},{angle:u,radius:c})}return Hy}(r,a,l,o);return{activeTooltipIndex:l,activeLabel:s,activePayload:f,activeCoordinate:p}}return null},Jy=function(t,e){var r=e.axisType,n=void 0===r?"xAxis":r,o=e.AxisComp,i=e.graphicalItems,a=e.stackGroups,c=e.dataStartIndex,u=e.dataEndIndex,l=t.children,s="".concat(n,"Id"),f=Q(l,o),p={};return f&&f.length?p=function(t,e){var r=e.axes,n=e.graphicalItems,o=e.axisType,i=e.axisIdKey,a=e.stackGroups,c=e.dataStartIndex,u=e.dataEndIndex,l=t.layout,s=t.children,f=t.stackOffset,p=Gs(l,o);return r.reduce((function(e,r){var h,d=void 0!==r.type.defaultProps?Uy(Uy({},r.type.defaultProps),r.props):r.props,y=d.type,v=d.dataKey,m=d.allowDataOverflow,b=d.allowDuplicatedCategory,x=d.scale,w=d.ticks,O=d.includeHidden,j=d[i];if(e[j])return e;var S,P,E,A=Vy(t.data,{graphicalItems:n.filter((function(t){var e;return(i in t.props?t.props[i]:null===(e=t.type.defaultProps)||void 0===e?void 0:e[i])===j})),dataStartIndex:c,dataEndIndex:u}),k=A.length;(function(t,e,r){if("number"===r&&!0===e&&Array.isArray(t)){var n=null==t?void 0:t[0],o=null==t?void 0:t[1];if(n&&o&&g(n)&&g(o))return!0}return!1})(d.domain,m,y)&&(S=cf(d.domain,null,m),!p||"number"!==y&&"auto"===x||(E=qs(A,v,"category")));var _=Yy(y);if(!S||0===S.length){var T,C=null!==(T=d.domain)&&void 0!==T?T:_;if(v){if(S=qs(A,v,y),"category"===y&&p){var D=function(t){if(!Array.isArray(t))return!1;for(var e=t.length,r={},n=0;n<e;n++){if(r[t[n]])return!0;r[t[n]]=!0}return!1}(S);b&&D?(P=S,S=dt()(0,k)):b||(S=lf(C,S,r).reduce((function(t,e){return t.indexOf(e)>=0?t:[].concat(Ry(t),[e])}),[]))}else if("category"===y)S=b?S.filter((function(t){return""!==t&&!M()(t)})):lf(C,S,r).reduce((function(t,e){return t.indexOf(e)>=0||""===e||M()(e)?t:[].concat(Ry(t),[e])}),[]);else if("number"===y){var I=function(t,e,r,n,o){var i=e.map((function(e){return Xs(t,e,r,o,n)})).filter((function(t){return!M()(t)}));return i&&i.length?i.reduce((function(t,e){return[Math.min(t[0],e[0]),Math.max(t[1],e[1])]}),[1/0,-1/0]):null}(A,n.filter((function(t){var e,r,n=i in t.props?t.props[i]:null===(e=t.type.defaultProps)||void 0===e?void 0:e[i],o="hide"in t.props?t.props.hide:null===(r=t.type.defaultProps)||void 0===r?void 0:r.hide;return n===j&&(O||!o)})),v,o,l);I&&(S=I)}!p||"number"!==y&&"auto"===x||(E=qs(A,v,"category"))}else S=p?dt()(0,k):a&&a[j]&&a[j].hasStack&&"number"===y?"expand"===f?[0,1]:nf(a[j].stackGroups,c,u):Hs(A,n.filter((function(t){var e=i in t.props?t.props[i]:t.type.defaultProps[i],r="hide"in t.props?t.props.hide:t.type.defaultProps.hide;return e===j&&(O||!r)})),y,l,!0);if("number"===y)S=Pd(s,S,j,o,w),C&&(S=cf(C,S,m));else if("category"===y&&C){var N=C;S.every((function(t){return N.indexOf(t)>=0}))&&(S=N)}}return Uy(Uy({},e),{},$y({},j,Uy(Uy({},d),{},{axisType:o,domain:S,categoricalDomain:E,duplicateDomain:P,originalDomain:null!==(h=d.domain)&&void 0!==h?h:_,isCategorical:p,layout:l})))}),{})}(t,{axes:f,graphicalItems:i,axisType:n,axisIdKey:s,stackGroups:a,dataStartIndex:c,dataEndIndex:u}):i&&i.length&&(p=function(t,e){var r=e.graphicalItems,n=e.Axis,o=e.axisType,i=e.axisIdKey,a=e.stackGroups,c=e.dataStartIndex,u=e.dataEndIndex,l=t.layout,s=t.children,f=Vy(t.data,{graphicalItems:r,dataStartIndex:c,dataEndIndex:u}),p=f.length,h=Gs(l,o),y=-1;return r.reduce((function(t,e){var v,m=(void 0!==e.type.defaultProps?Uy(Uy({},e.type.defaultProps),e.props):e.props)[i],b=Yy("number");return t[m]?t:(y++,h?v=dt()(0,p):a&&a[m]&&a[m].hasStack?(v=nf(a[m].stackGroups,c,u),v=Pd(s,v,m,o)):(v=cf(b,Hs(f,r.filter((function(t){var e,r,n=i in t.props?t.props[i]:null===(e=t.type.defaultProps)||void 0===e?void 0:e[i],o="hide"in t.props?t.props.hide:null===(r=t.type.defaultProps)||void 0===r?void 0:r.hide;return n===m&&!o})),"number",l),n.defaultProps.allowDataOverflow),v=Pd(s,v,m,o)),Uy(Uy({},t),{},$y({},m,Uy(Uy({axisType:o},n.defaultProps),{},{hide:!0,orientation:d()(Wy,"".concat(o,".").concat(y%2),null),domain:v,originalDomain:b,isCategorical:h,layout:l}))))}),{})}(t,{Axis:o,graphicalItems:i,axisType:n,axisIdKey:s,stackGroups:a,dataStartIndex:c,dataEndIndex:u})),p},Qy=function(t){var e=t.children,r=t.defaultShowTooltip,n=tt(e,Af),o=0,i=0;return t.data&&0!==t.data.length&&(i=t.data.length-1),n&&n.props&&(n.props.startIndex>=0&&(o=n.props.startIndex),n.props.endIndex>=0&&(i=n.props.endIndex)),{chartX:0,chartY:0,dataStartIndex:o,dataEndIndex:i,activeTooltipIndex:-1,isTooltipActive:Boolean(r)}},tv=function(t){return"horizontal"===t?{numericAxisName:"yAxis",cateAxisName:"xAxis"}:"vertical"===t?{numericAxisName:"xAxis",cateAxisName:"yAxis"}:"centric"===t?{numericAxisName:"radiusAxis",cateAxisName:"angleAxis"}:{numericAxisName:"angleAxis",cateAxisName:"radiusAxis"}},ev=function(t,e){return"xAxis"===e?t[e].width:"yAxis"===e?t[e].height:void 0},rv=["type","layout","connectNulls","ref"],nv=["key"];function ov(t){return ov="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ov(t)}function iv(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function av(){return av=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},av.apply(this,arguments)}function cv(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function uv(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?cv(Object(r),!0).forEach((function(e){yv(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):cv(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function lv(t){return function(t){if(Array.isArray(t))return sv(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return sv(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?sv(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function sv(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function fv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,vv(n.key),n)}}function pv(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(pv=function(){return!!t})()}function hv(t){return hv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},hv(t)}function dv(t,e){return dv=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},dv(t,e)}function yv(t,e,r){return(e=vv(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function vv(t){var e=function(t){if("object"!=ov(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ov(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==ov(e)?e:e+""}var mv=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return yv((r=this,n=e,o=[].concat(a),n=hv(n),t=function(t,e){if(e&&("object"===ov(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,pv()?Reflect.construct(n,o||[],hv(r).constructor):n.apply(r,o))),"state",{isAnimationFinished:!0,totalLength:0}),yv(t,"generateSimpleStrokeDasharray",(function(t,e){return"".concat(e,"px ").concat(t-e,"px")})),yv(t,"getStrokeDasharray",(function(r,n,o){var i=o.reduce((function(t,e){return t+e}));if(!i)return t.generateSimpleStrokeDasharray(n,r);for(var a=Math.floor(r/i),c=r%i,u=n-r,l=[],s=0,f=0;s<o.length;f+=o[s],++s)if(f+o[s]>c){l=[].concat(lv(o.slice(0,s)),[c-f]);break}var p=l.length%2==0?[0,u]:[u];return[].concat(lv(e.repeat(o,a)),lv(l),p).map((function(t){return"".concat(t,"px")})).join(", ")})),yv(t,"id",O("recharts-line-")),yv(t,"pathRef",(function(e){t.mainCurve=e})),yv(t,"handleAnimationEnd",(function(){t.setState({isAnimationFinished:!0}),t.props.onAnimationEnd&&t.props.onAnimationEnd()})),yv(t,"handleAnimationStart",(function(){t.setState({isAnimationFinished:!1}),t.props.onAnimationStart&&t.props.onAnimationStart()})),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&dv(t,e)}(e,t),r=e,n=[{key:"componentDidMount",value:function(){if(this.props.isAnimationActive){var t=this.getTotalLength();this.setState({totalLength:t})}}},{key:"componentDidUpdate",value:function(){if(this.props.isAnimationActive){var t=this.getTotalLength();t!==this.state.totalLength&&this.setState({totalLength:t})}}},{key:"getTotalLength",value:function(){var t=this.mainCurve;try{return t&&t.getTotalLength&&t.getTotalLength()||0}catch(t){return 0}}},{key:"renderErrorBar",value:function(t,e){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,n=r.points,i=r.xAxis,a=r.yAxis,c=r.layout,u=Q(r.children,Ms);if(!u)return null;var l=function(t,e){return{x:t.x,y:t.y,value:t.value,errorVal:$s(t.payload,e)}},s={clipPath:t?"url(#clipPath-".concat(e,")"):null};return o().createElement(jt,s,u.map((function(t){return o().cloneElement(t,{key:"bar-".concat(t.props.dataKey),data:n,xAxis:i,yAxis:a,layout:c,dataPointFormatter:l})})))}},{key:"renderDots",value:function(t,r,n){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var i=this.props,a=i.dot,c=i.points,u=i.dataKey,l=nt(this.props,!1),s=nt(a,!0),f=c.map((function(t,r){var n=uv(uv(uv({key:"dot-".concat(r),r:3},l),s),{},{index:r,cx:t.x,cy:t.y,value:t.value,dataKey:u,payload:t.payload,points:c});return e.renderDotItem(a,n)})),p={clipPath:t?"url(#clipPath-".concat(r?"":"dots-").concat(n,")"):null};return o().createElement(jt,av({className:"recharts-line-dots",key:"dots"},p),f)}},{key:"renderCurveStatically",value:function(t,e,r,n){var i=this.props,a=i.type,c=i.layout,u=i.connectNulls,l=(i.ref,iv(i,rv)),s=uv(uv(uv({},nt(l,!0)),{},{fill:"none",className:"recharts-line-curve",clipPath:e?"url(#clipPath-".concat(r,")"):null,points:t},n),{},{type:a,layout:c,connectNulls:u});return o().createElement(py,av({},s,{pathRef:this.pathRef}))}},{key:"renderCurveWithAnimation",value:function(t,e){var r=this,n=this.props,i=n.points,a=n.strokeDasharray,c=n.isAnimationActive,u=n.animationBegin,l=n.animationDuration,s=n.animationEasing,f=n.animationId,p=n.animateNewValues,h=n.width,d=n.height,y=this.state,v=y.prevPoints,m=y.totalLength;return o().createElement($n,{begin:u,duration:l,isActive:c,easing:s,from:{t:0},to:{t:1},key:"line-".concat(f),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},(function(n){var o=n.t;if(v){var c=v.length/i.length,u=i.map((function(t,e){var r=Math.floor(e*c);if(v[r]){var n=v[r],i=P(n.x,t.x),a=P(n.y,t.y);return uv(uv({},t),{},{x:i(o),y:a(o)})}if(p){var u=P(2*h,t.x),l=P(d/2,t.y);return uv(uv({},t),{},{x:u(o),y:l(o)})}return uv(uv({},t),{},{x:t.x,y:t.y})}));return r.renderCurveStatically(u,t,e)}var l,s=P(0,m)(o);if(a){var f="".concat(a).split(/[,\s]+/gim).map((function(t){return parseFloat(t)}));l=r.getStrokeDasharray(s,m,f)}else l=r.generateSimpleStrokeDasharray(m,s);return r.renderCurveStatically(i,t,e,{strokeDasharray:l})}))}},{key:"renderCurve",value:function(t,e){var r=this.props,n=r.points,o=r.isAnimationActive,i=this.state,a=i.prevPoints,c=i.totalLength;return o&&n&&n.length&&(!a&&c>0||!Gl()(a,n))?this.renderCurveWithAnimation(t,e):this.renderCurveStatically(n,t,e)}},{key:"render",value:function(){var t,e=this.props,r=e.hide,n=e.dot,i=e.points,c=e.className,u=e.xAxis,l=e.yAxis,s=e.top,f=e.left,p=e.width,h=e.height,d=e.isAnimationActive,y=e.id;if(r||!i||!i.length)return null;var v=this.state.isAnimationFinished,m=1===i.length,b=a("recharts-line",c),g=u&&u.allowDataOverflow,x=l&&l.allowDataOverflow,w=g||x,O=M()(y)?this.id:y,j=null!==(t=nt(n,!1))&&void 0!==t?t:{r:3,strokeWidth:2},S=j.r,P=void 0===S?3:S,E=j.strokeWidth,A=void 0===E?2:E,k=(function(t){return t&&"object"===G(t)&&"clipDot"in t}(n)?n:{}).clipDot,_=void 0===k||k,T=2*P+A;return o().createElement(jt,{className:b},g||x?o().createElement("defs",null,o().createElement("clipPath",{id:"clipPath-".concat(O)},o().createElement("rect",{x:g?f:f-p/2,y:x?s:s-h/2,width:g?p:2*p,height:x?h:2*h})),!_&&o().createElement("clipPath",{id:"clipPath-dots-".concat(O)},o().createElement("rect",{x:f-T/2,y:s-T/2,width:p+T,height:h+T}))):null,!m&&this.renderCurve(w,O),this.renderErrorBar(w,O),(m||n)&&this.renderDots(w,_,O),(!d||v)&&sp.renderCallByParent(this.props,i))}}],i=[{key:"getDerivedStateFromProps",value:function(t,e){return t.animationId!==e.prevAnimationId?{prevAnimationId:t.animationId,curPoints:t.points,prevPoints:e.curPoints}:t.points!==e.curPoints?{curPoints:t.points}:null}},{key:"repeat",value:function(t,e){for(var r=t.length%2!=0?[].concat(lv(t),[0]):t,n=[],o=0;o<e;++o)n=[].concat(lv(n),lv(r));return n}},{key:"renderDotItem",value:function(t,e){var r;if(o().isValidElement(t))r=o().cloneElement(t,e);else if(C()(t))r=t(e);else{var n=e.key,i=iv(e,nv),c=a("recharts-line-dot","boolean"!=typeof t?t.className:"");r=o().createElement(xr,av({key:n},i,{className:c}))}return r}}],n&&fv(r.prototype,n),i&&fv(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.PureComponent);function bv(t,e,r){if(e<1)return[];if(1===e&&void 0===r)return t;for(var n=[],o=0;o<t.length;o+=e){if(void 0!==r&&!0!==r(t[o]))return;n.push(t[o])}return n}function gv(t,e,r,n,o){if(t*e<t*n||t*e>t*o)return!1;var i=r();return t*(e-t*i/2-n)>=0&&t*(e+t*i/2-o)<=0}function xv(t){return xv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},xv(t)}function wv(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ov(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?wv(Object(r),!0).forEach((function(e){jv(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):wv(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function jv(t,e,r){var n;return n=function(t){if("object"!=xv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=xv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==xv(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Sv(t,e,r){var n=t.tick,o=t.ticks,i=t.viewBox,a=t.minTickGap,c=t.orientation,u=t.interval,l=t.tickFormatter,s=t.unit,f=t.angle;if(!o||!o.length||!n)return[];if(g(u)||Vt.isSsr)return function(t,e){return bv(t,e+1)}(o,"number"==typeof u&&g(u)?u:0);var p=[],h="top"===c||"bottom"===c?"width":"height",d=s&&"width"===h?mo(s,{fontSize:e,letterSpacing:r}):{width:0,height:0},y=function(t,n){var o=C()(l)?l(t.value,n):t.value;return"width"===h?function(t,e,r){return function(t){var e=t.width,r=t.height,n=function(t){return(t%180+180)%180}(arguments.length>1&&void 0!==arguments[1]?arguments[1]:0),o=n*Math.PI/180,i=Math.atan(r/e),a=o>i&&o<Math.PI-i?r/Math.sin(o):e/Math.cos(o);return Math.abs(a)}({width:t.width+e.width,height:t.height+e.height},r)}(mo(o,{fontSize:e,letterSpacing:r}),d,f):mo(o,{fontSize:e,letterSpacing:r})[h]},v=o.length>=2?m(o[1].coordinate-o[0].coordinate):1,b=function(t,e,r){var n="width"===r,o=t.x,i=t.y,a=t.width,c=t.height;return 1===e?{start:n?o:i,end:n?o+a:i+c}:{start:n?o+a:i+c,end:n?o:i}}(i,v,h);return"equidistantPreserveStart"===u?function(t,e,r,n,o){for(var i,a=(n||[]).slice(),c=e.start,u=e.end,l=0,s=1,f=c,p=function(){var e=null==n?void 0:n[l];if(void 0===e)return{v:bv(n,s)};var i,a=l,p=function(){return void 0===i&&(i=r(e,a)),i},h=e.coordinate,d=0===l||gv(t,h,p,f,u);d||(l=0,f=c,s+=1),d&&(f=h+t*(p()/2+o),l+=s)};s<=a.length;)if(i=p())return i.v;return[]}(v,b,y,o,a):(p="preserveStart"===u||"preserveStartEnd"===u?function(t,e,r,n,o,i){var a=(n||[]).slice(),c=a.length,u=e.start,l=e.end;if(i){var s=n[c-1],f=r(s,c-1),p=t*(s.coordinate+t*f/2-l);a[c-1]=s=Ov(Ov({},s),{},{tickCoord:p>0?s.coordinate-p*t:s.coordinate}),gv(t,s.tickCoord,(function(){return f}),u,l)&&(l=s.tickCoord-t*(f/2+o),a[c-1]=Ov(Ov({},s),{},{isShow:!0}))}for(var h=i?c-1:c,d=function(e){var n,i=a[e],c=function(){return void 0===n&&(n=r(i,e)),n};if(0===e){var s=t*(i.coordinate-t*c()/2-u);a[e]=i=Ov(Ov({},i),{},{tickCoord:s<0?i.coordinate-s*t:i.coordinate})}else a[e]=i=Ov(Ov({},i),{},{tickCoord:i.coordinate});gv(t,i.tickCoord,c,u,l)&&(u=i.tickCoord+t*(c()/2+o),a[e]=Ov(Ov({},i),{},{isShow:!0}))},y=0;y<h;y++)d(y);return a}(v,b,y,o,a,"preserveStartEnd"===u):function(t,e,r,n,o){for(var i=(n||[]).slice(),a=i.length,c=e.start,u=e.end,l=function(e){var n,l=i[e],s=function(){return void 0===n&&(n=r(l,e)),n};if(e===a-1){var f=t*(l.coordinate+t*s()/2-u);i[e]=l=Ov(Ov({},l),{},{tickCoord:f>0?l.coordinate-f*t:l.coordinate})}else i[e]=l=Ov(Ov({},l),{},{tickCoord:l.coordinate});gv(t,l.tickCoord,s,c,u)&&(u=l.tickCoord-t*(s()/2+o),i[e]=Ov(Ov({},l),{},{isShow:!0}))},s=a-1;s>=0;s--)l(s);return i}(v,b,y,o,a),p.filter((function(t){return t.isShow})))}yv(mv,"displayName","Line"),yv(mv,"defaultProps",{xAxisId:0,yAxisId:0,connectNulls:!1,activeDot:!0,dot:!0,legendType:"line",stroke:"#3182bd",strokeWidth:1,fill:"#fff",points:[],isAnimationActive:!Vt.isSsr,animateNewValues:!0,animationBegin:0,animationDuration:1500,animationEasing:"ease",hide:!1,label:!1}),yv(mv,"getComposedData",(function(t){var e=t.props,r=t.xAxis,n=t.yAxis,o=t.xAxisTicks,i=t.yAxisTicks,a=t.dataKey,c=t.bandSize,u=t.displayedData,l=t.offset,s=e.layout,f=u.map((function(t,e){var u=$s(t,a);return"horizontal"===s?{x:ef({axis:r,ticks:o,bandSize:c,entry:t,index:e}),y:M()(u)?null:n.scale(u),value:u,payload:t}:{x:M()(u)?null:r.scale(u),y:ef({axis:n,ticks:i,bandSize:c,entry:t,index:e}),value:u,payload:t}}));return uv({points:f,layout:s},l)}));var Pv=["viewBox"],Ev=["viewBox"],Av=["ticks"];function kv(t){return kv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},kv(t)}function _v(){return _v=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},_v.apply(this,arguments)}function Mv(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Tv(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Mv(Object(r),!0).forEach((function(e){Rv(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Mv(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Cv(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function Dv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Lv(n.key),n)}}function Iv(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Iv=function(){return!!t})()}function Nv(t){return Nv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Nv(t)}function Bv(t,e){return Bv=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Bv(t,e)}function Rv(t,e,r){return(e=Lv(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Lv(t){var e=function(t){if("object"!=kv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=kv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==kv(e)?e:e+""}var zv=function(t){function e(t){var r,n,o,i;return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),(n=this,o=e,i=[t],o=Nv(o),r=function(t,e){if(e&&("object"===kv(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(n,Iv()?Reflect.construct(o,i||[],Nv(n).constructor):o.apply(n,i))).state={fontSize:"",letterSpacing:""},r}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Bv(t,e)}(e,t),r=e,n=[{key:"shouldComponentUpdate",value:function(t,e){var r=t.viewBox,n=Cv(t,Pv),o=this.props,i=o.viewBox,a=Cv(o,Ev);return!B(r,i)||!B(n,a)||!B(e,this.state)}},{key:"componentDidMount",value:function(){var t=this.layerReference;if(t){var e=t.getElementsByClassName("recharts-cartesian-axis-tick-value")[0];e&&this.setState({fontSize:window.getComputedStyle(e).fontSize,letterSpacing:window.getComputedStyle(e).letterSpacing})}}},{key:"getTickLineCoord",value:function(t){var e,r,n,o,i,a,c=this.props,u=c.x,l=c.y,s=c.width,f=c.height,p=c.orientation,h=c.tickSize,d=c.mirror,y=c.tickMargin,v=d?-1:1,m=t.tickSize||h,b=g(t.tickCoord)?t.tickCoord:t.coordinate;switch(p){case"top":e=r=t.coordinate,a=(n=(o=l+ +!d*f)-v*m)-v*y,i=b;break;case"left":n=o=t.coordinate,i=(e=(r=u+ +!d*s)-v*m)-v*y,a=b;break;case"right":n=o=t.coordinate,i=(e=(r=u+ +d*s)+v*m)+v*y,a=b;break;default:e=r=t.coordinate,a=(n=(o=l+ +d*f)+v*m)+v*y,i=b}return{line:{x1:e,y1:n,x2:r,y2:o},tick:{x:i,y:a}}}},{key:"getTickTextAnchor",value:function(){var t,e=this.props,r=e.orientation,n=e.mirror;switch(r){case"left":t=n?"start":"end";break;case"right":t=n?"end":"start";break;default:t="middle"}return t}},{key:"getTickVerticalAnchor",value:function(){var t=this.props,e=t.orientation,r=t.mirror,n="end";switch(e){case"left":case"right":n="middle";break;case"top":n=r?"start":"end";break;default:n=r?"end":"start"}return n}},{key:"renderAxisLine",value:function(){var t=this.props,e=t.x,r=t.y,n=t.width,i=t.height,c=t.orientation,u=t.mirror,l=t.axisLine,s=Tv(Tv(Tv({},nt(this.props,!1)),nt(l,!1)),{},{fill:"none"});if("top"===c||"bottom"===c){var f=+("top"===c&&!u||"bottom"===c&&u);s=Tv(Tv({},s),{},{x1:e,y1:r+f*i,x2:e+n,y2:r+f*i})}else{var p=+("left"===c&&!u||"right"===c&&u);s=Tv(Tv({},s),{},{x1:e+p*n,y1:r,x2:e+p*n,y2:r+i})}return o().createElement("line",_v({},s,{className:a("recharts-cartesian-axis-line",d()(l,"className"))}))}},{key:"renderTicks",value:function(t,r,n){var i=this,c=this.props,u=c.tickLine,l=c.stroke,s=c.tick,f=c.tickFormatter,p=c.unit,h=Sv(Tv(Tv({},this.props),{},{ticks:t}),r,n),y=this.getTickTextAnchor(),v=this.getTickVerticalAnchor(),m=nt(this.props,!1),b=nt(s,!1),g=Tv(Tv({},m),{},{fill:"none"},nt(u,!1)),x=h.map((function(t,r){var n=i.getTickLineCoord(t),c=n.line,x=n.tick,w=Tv(Tv(Tv(Tv({textAnchor:y,verticalAnchor:v},m),{},{stroke:"none",fill:l},b),x),{},{index:r,payload:t,visibleTicksCount:h.length,tickFormatter:f});return o().createElement(jt,_v({className:"recharts-cartesian-axis-tick",key:"tick-".concat(t.value,"-").concat(t.coordinate,"-").concat(t.tickCoord)},q(i.props,t,r)),u&&o().createElement("line",_v({},g,c,{className:a("recharts-cartesian-axis-tick-line",d()(u,"className"))})),s&&e.renderTickItem(s,w,"".concat(C()(f)?f(t.value,r):t.value).concat(p||"")))}));return o().createElement("g",{className:"recharts-cartesian-axis-ticks"},x)}},{key:"render",value:function(){var t=this,e=this.props,r=e.axisLine,n=e.width,i=e.height,c=e.ticksGenerator,u=e.className;if(e.hide)return null;var l=this.props,s=l.ticks,f=Cv(l,Av),p=s;return C()(c)&&(p=s&&s.length>0?c(this.props):c(f)),n<=0||i<=0||!p||!p.length?null:o().createElement(jt,{className:a("recharts-cartesian-axis",u),ref:function(e){t.layerReference=e}},r&&this.renderAxisLine(),this.renderTicks(p,this.state.fontSize,this.state.letterSpacing),Wf.renderCallByParent(this.props))}}],i=[{key:"renderTickItem",value:function(t,e,r){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement(Wo,_v({},e,{className:"recharts-cartesian-axis-tick-value"}),r)}}],n&&Dv(r.prototype,n),i&&Dv(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.Component);function Fv(t){return Fv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Fv(t)}function Uv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Hv(n.key),n)}}function $v(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return($v=function(){return!!t})()}function qv(t){return qv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},qv(t)}function Wv(t,e){return Wv=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Wv(t,e)}function Xv(t,e,r){return(e=Hv(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Hv(t){var e=function(t){if("object"!=Fv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Fv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Fv(e)?e:e+""}function Gv(){return Gv=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Gv.apply(this,arguments)}function Vv(t){var e=t.xAxisId,r=Zh(),n=Jh(),i=Yh(e);return null==i?null:o().createElement(zv,Gv({},i,{className:a("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:n},ticksGenerator:function(t){return Ys(t,!0)}}))}Rv(zv,"displayName","CartesianAxis"),Rv(zv,"defaultProps",{x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:"bottom",ticks:[],stroke:"#666",tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:"preserveEnd"});var Yv=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=qv(r=e),function(t,e){if(e&&("object"===Fv(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,$v()?Reflect.construct(r,n||[],qv(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Wv(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){return o().createElement(Vv,this.props)}}])&&Uv(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function Kv(t){return Kv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Kv(t)}function Zv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,rm(n.key),n)}}function Jv(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Jv=function(){return!!t})()}function Qv(t){return Qv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Qv(t)}function tm(t,e){return tm=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},tm(t,e)}function em(t,e,r){return(e=rm(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function rm(t){var e=function(t){if("object"!=Kv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Kv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Kv(e)?e:e+""}function nm(){return nm=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},nm.apply(this,arguments)}Xv(Yv,"displayName","XAxis"),Xv(Yv,"defaultProps",{allowDecimals:!0,hide:!1,orientation:"bottom",width:0,height:30,mirror:!1,xAxisId:0,tickCount:5,type:"category",padding:{left:0,right:0},allowDataOverflow:!1,scale:"auto",reversed:!1,allowDuplicatedCategory:!0});var om=function(t){var e=t.yAxisId,r=Zh(),n=Jh(),i=Kh(e);return null==i?null:o().createElement(zv,nm({},i,{className:a("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:n},ticksGenerator:function(t){return Ys(t,!0)}}))},im=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=Qv(r=e),function(t,e){if(e&&("object"===Kv(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,Jv()?Reflect.construct(r,n||[],Qv(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&tm(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){return o().createElement(om,this.props)}}])&&Zv(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);em(im,"displayName","YAxis"),em(im,"defaultProps",{allowDuplicatedCategory:!0,allowDecimals:!0,hide:!1,orientation:"left",width:60,height:0,mirror:!1,yAxisId:0,tickCount:5,type:"number",padding:{top:0,bottom:0},allowDataOverflow:!1,scale:"auto",reversed:!1});var am=function(t){var r=t.chartName,n=t.GraphicalChild,i=t.defaultTooltipEventType,c=void 0===i?"axis":i,l=t.validateTooltipEventTypes,s=void 0===l?["axis"]:l,f=t.axisComponents,p=t.legendContent,h=t.formatAxisMap,y=t.defaultProps,v=function(t,e){var o=t.props,i=t.dataStartIndex,a=t.dataEndIndex,c=t.updateId;if(!et({props:o}))return null;var u=o.children,l=o.layout,s=o.stackOffset,p=o.data,y=o.reverseStackOrder,v=tv(l),m=v.numericAxisName,b=v.cateAxisName,w=Q(u,n),P=function(t,e,r,n,o,i){if(!t)return null;var a=(i?e.reverse():e).reduce((function(t,e){var o,i=null!==(o=e.type)&&void 0!==o&&o.defaultProps?Fs(Fs({},e.type.defaultProps),e.props):e.props,a=i.stackId;if(i.hide)return t;var c=i[r],u=t[c]||{hasStack:!1,stackGroups:{}};if(x(a)){var l=u.stackGroups[a]||{numericAxisId:r,cateAxisId:n,items:[]};l.items.push(e),u.hasStack=!0,u.stackGroups[a]=l}else u.stackGroups[O("_stackId_")]={numericAxisId:r,cateAxisId:n,items:[e]};return Fs(Fs({},t),{},Us({},c,u))}),{});return Object.keys(a).reduce((function(e,i){var c=a[i];return c.hasStack&&(c.stackGroups=Object.keys(c.stackGroups).reduce((function(e,i){var a=c.stackGroups[i];return Fs(Fs({},e),{},Us({},i,{numericAxisId:r,cateAxisId:n,items:a.items,stackedData:tf(t,a.items,o)}))}),{})),Fs(Fs({},e),{},Us({},i,c))}),{})}(p,w,"".concat(m,"Id"),"".concat(b,"Id"),s,y),E=f.reduce((function(t,e){var r="".concat(e.axisType,"Map");return Uy(Uy({},t),{},$y({},r,Jy(o,Uy(Uy({},e),{},{graphicalItems:w,stackGroups:e.axisType===m&&P,dataStartIndex:i,dataEndIndex:a}))))}),{}),A=function(t,e){var r=t.props,n=(t.graphicalItems,t.xAxisMap),o=void 0===n?{}:n,i=t.yAxisMap,a=void 0===i?{}:i,c=r.width,u=r.height,l=r.children,s=r.margin||{},f=tt(l,Af),p=tt(l,br),h=Object.keys(a).reduce((function(t,e){var r=a[e],n=r.orientation;return r.mirror||r.hide?t:Uy(Uy({},t),{},$y({},n,t[n]+r.width))}),{left:s.left||0,right:s.right||0}),y=Object.keys(o).reduce((function(t,e){var r=o[e],n=r.orientation;return r.mirror||r.hide?t:Uy(Uy({},t),{},$y({},n,d()(t,"".concat(n))+r.height))}),{top:s.top||0,bottom:s.bottom||0}),v=Uy(Uy({},y),h),m=v.bottom;f&&(v.bottom+=f.props.height||Af.defaultProps.height),p&&e&&(v=function(t,e,r,n){var o=r.children,i=r.width,a=r.margin,c=i-(a.left||0)-(a.right||0),u=Ns({children:o,legendWidth:c});if(u){var l=n||{},s=l.width,f=l.height,p=u.align,h=u.verticalAlign,d=u.layout;if(("vertical"===d||"horizontal"===d&&"middle"===h)&&"center"!==p&&g(t[p]))return Fs(Fs({},t),{},Us({},p,t[p]+(s||0)));if(("horizontal"===d||"vertical"===d&&"center"===p)&&"middle"!==h&&g(t[h]))return Fs(Fs({},t),{},Us({},h,t[h]+(f||0)))}return t}(v,0,r,e));var b=c-v.left-v.right,x=u-v.top-v.bottom;return Uy(Uy({brushBottom:m},v),{},{width:Math.max(b,0),height:Math.max(x,0)})}(Uy(Uy({},E),{},{props:o,graphicalItems:w}),null==e?void 0:e.legendBBox);Object.keys(E).forEach((function(t){E[t]=h(o,E[t],A,t.replace("Map",""),r)}));var k,_,T=E["".concat(b,"Map")],C=(k=S(T),{tooltipTicks:_=Ys(k,!1,!0),orderedTooltipTicks:vt()(_,(function(t){return t.coordinate})),tooltipAxis:k,tooltipAxisBandSize:uf(k,_)}),D=function(t,e){var r=e.graphicalItems,n=e.stackGroups,o=e.offset,i=e.updateId,a=e.dataStartIndex,c=e.dataEndIndex,u=t.barSize,l=t.layout,s=t.barGap,p=t.barCategoryGap,h=t.maxBarSize,d=tv(l),y=d.numericAxisName,v=d.cateAxisName,m=function(t){return!(!t||!t.length)&&t.some((function(t){var e=Y(t&&t.type);return e&&e.indexOf("Bar")>=0}))}(r),b=[];return r.forEach((function(r,d){var g=Vy(t.data,{graphicalItems:[r],dataStartIndex:a,dataEndIndex:c}),w=void 0!==r.type.defaultProps?Uy(Uy({},r.type.defaultProps),r.props):r.props,O=w.dataKey,S=w.maxBarSize,P=w["".concat(y,"Id")],E=w["".concat(v,"Id")],A=f.reduce((function(t,r){var n=e["".concat(r.axisType,"Map")],o=w["".concat(r.axisType,"Id")];n&&n[o]||"zAxis"===r.axisType||mt(!1);var i=n[o];return Uy(Uy({},t),{},$y($y({},r.axisType,i),"".concat(r.axisType,"Ticks"),Ys(i)))}),{}),k=A[v],_=A["".concat(v,"Ticks")],T=n&&n[P]&&n[P].hasStack&&function(t,e){var r,n=(null!==(r=t.type)&&void 0!==r&&r.defaultProps?Fs(Fs({},t.type.defaultProps),t.props):t.props).stackId;if(x(n)){var o=e[n];if(o){var i=o.items.indexOf(t);return i>=0?o.stackedData[i]:null}}return null}(r,n[P].stackGroups),C=Y(r.type).indexOf("Bar")>=0,D=uf(k,_),I=[],N=m&&function(t){var e=t.barSize,r=t.totalSize,n=t.stackGroups,o=void 0===n?{}:n;if(!o)return{};for(var i={},a=Object.keys(o),c=0,u=a.length;c<u;c++)for(var l=o[a[c]].stackGroups,s=Object.keys(l),f=0,p=s.length;f<p;f++){var h=l[s[f]],d=h.items,y=h.cateAxisId,v=d.filter((function(t){return Y(t.type).indexOf("Bar")>=0}));if(v&&v.length){var m=v[0].type.defaultProps,b=void 0!==m?Fs(Fs({},m),v[0].props):v[0].props,g=b.barSize,x=b[y];i[x]||(i[x]=[]);var w=M()(g)?e:g;i[x].push({item:v[0],stackList:v.slice(1),barSize:M()(w)?void 0:j(w,r,0)})}}return i}({barSize:u,stackGroups:n,totalSize:ev(A,v)});if(C){var B,R,L=M()(S)?h:S,z=null!==(B=null!==(R=uf(k,_,!0))&&void 0!==R?R:L)&&void 0!==B?B:0;I=function(t){var e=t.barGap,r=t.barCategoryGap,n=t.bandSize,o=t.sizeList,i=void 0===o?[]:o,a=t.maxBarSize,c=i.length;if(c<1)return null;var u,l=j(e,n,0,!0),s=[];if(i[0].barSize===+i[0].barSize){var f=!1,p=n/c,h=i.reduce((function(t,e){return t+e.barSize||0}),0);(h+=(c-1)*l)>=n&&(h-=(c-1)*l,l=0),h>=n&&p>0&&(f=!0,h=c*(p*=.9));var d={offset:((n-h)/2|0)-l,size:0};u=i.reduce((function(t,e){var r={item:e.item,position:{offset:d.offset+d.size+l,size:f?p:e.barSize}},n=[].concat(Rs(t),[r]);return d=n[n.length-1].position,e.stackList&&e.stackList.length&&e.stackList.forEach((function(t){n.push({item:t,position:d})})),n}),s)}else{var y=j(r,n,0,!0);n-2*y-(c-1)*l<=0&&(l=0);var v=(n-2*y-(c-1)*l)/c;v>1&&(v>>=0);var m=a===+a?Math.min(v,a):v;u=i.reduce((function(t,e,r){var n=[].concat(Rs(t),[{item:e.item,position:{offset:y+(v+l)*r+(v-m)/2,size:m}}]);return e.stackList&&e.stackList.length&&e.stackList.forEach((function(t){n.push({item:t,position:n[n.length-1].position})})),n}),s)}return u}({barGap:s,barCategoryGap:p,bandSize:z!==D?z:D,sizeList:N[E],maxBarSize:L}),z!==D&&(I=I.map((function(t){return Uy(Uy({},t),{},{position:Uy(Uy({},t.position),{},{offset:t.position.offset-z/2})})})))}var F,U,$=r&&r.type&&r.type.getComposedData;$&&b.push({props:Uy(Uy({},$(Uy(Uy({},A),{},{displayedData:g,props:t,dataKey:O,item:r,bandSize:D,barPosition:I,offset:o,stackedData:T,layout:l,dataStartIndex:a,dataEndIndex:c}))),{},$y($y($y({key:r.key||"item-".concat(d)},y,A[y]),v,A[v]),"animationId",i)),childIndex:(F=r,U=t.children,J(U).indexOf(F)),item:r})})),b}(o,Uy(Uy({},E),{},{dataStartIndex:i,dataEndIndex:a,updateId:c,graphicalItems:w,stackGroups:P,offset:A}));return Uy(Uy({formattedGraphicalItems:D,graphicalItems:w,offset:A,stackGroups:P},C),E)},m=function(t){function n(t){var i,c,l,s,f,h;return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,n),$y((s=this,h=[t],f=Ny(f=n),l=function(t,e){if(e&&("object"===_y(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(s,Iy()?Reflect.construct(f,h||[],Ny(s).constructor):f.apply(s,h))),"eventEmitterSymbol",Symbol("rechartsEventEmitter")),$y(l,"accessibilityManager",new Dd),$y(l,"handleLegendBBoxUpdate",(function(t){if(t){var e=l.state,r=e.dataStartIndex,n=e.dataEndIndex,o=e.updateId;l.setState(Uy({legendBBox:t},v({props:l.props,dataStartIndex:r,dataEndIndex:n,updateId:o},Uy(Uy({},l.state),{},{legendBBox:t}))))}})),$y(l,"handleReceiveSyncEvent",(function(t,e,r){if(l.props.syncId===t){if(r===l.eventEmitterSymbol&&"function"!=typeof l.props.syncMethod)return;l.applySyncEvent(e)}})),$y(l,"handleBrushChange",(function(t){var e=t.startIndex,r=t.endIndex;if(e!==l.state.dataStartIndex||r!==l.state.dataEndIndex){var n=l.state.updateId;l.setState((function(){return Uy({dataStartIndex:e,dataEndIndex:r},v({props:l.props,dataStartIndex:e,dataEndIndex:r,updateId:n},l.state))})),l.triggerSyncEvent({dataStartIndex:e,dataEndIndex:r})}})),$y(l,"handleMouseEnter",(function(t){var e=l.getMouseInfo(t);if(e){var r=Uy(Uy({},e),{},{isTooltipActive:!0});l.setState(r),l.triggerSyncEvent(r);var n=l.props.onMouseEnter;C()(n)&&n(r,t)}})),$y(l,"triggeredAfterMouseMove",(function(t){var e=l.getMouseInfo(t),r=e?Uy(Uy({},e),{},{isTooltipActive:!0}):{isTooltipActive:!1};l.setState(r),l.triggerSyncEvent(r);var n=l.props.onMouseMove;C()(n)&&n(r,t)})),$y(l,"handleItemMouseEnter",(function(t){l.setState((function(){return{isTooltipActive:!0,activeItem:t,activePayload:t.tooltipPayload,activeCoordinate:t.tooltipPosition||{x:t.cx,y:t.cy}}}))})),$y(l,"handleItemMouseLeave",(function(){l.setState((function(){return{isTooltipActive:!1}}))})),$y(l,"handleMouseMove",(function(t){t.persist(),l.throttleTriggeredAfterMouseMove(t)})),$y(l,"handleMouseLeave",(function(t){l.throttleTriggeredAfterMouseMove.cancel();var e={isTooltipActive:!1};l.setState(e),l.triggerSyncEvent(e);var r=l.props.onMouseLeave;C()(r)&&r(e,t)})),$y(l,"handleOuterEvent",(function(t){var e,r=function(t){var e=t&&t.type;return e&&V[e]?V[e]:null}(t),n=d()(l.props,"".concat(r));r&&C()(n)&&n(null!==(e=/.*touch.*/i.test(r)?l.getMouseInfo(t.changedTouches[0]):l.getMouseInfo(t))&&void 0!==e?e:{},t)})),$y(l,"handleClick",(function(t){var e=l.getMouseInfo(t);if(e){var r=Uy(Uy({},e),{},{isTooltipActive:!0});l.setState(r),l.triggerSyncEvent(r);var n=l.props.onClick;C()(n)&&n(r,t)}})),$y(l,"handleMouseDown",(function(t){var e=l.props.onMouseDown;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"handleMouseUp",(function(t){var e=l.props.onMouseUp;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"handleTouchMove",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&l.throttleTriggeredAfterMouseMove(t.changedTouches[0])})),$y(l,"handleTouchStart",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&l.handleMouseDown(t.changedTouches[0])})),$y(l,"handleTouchEnd",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&l.handleMouseUp(t.changedTouches[0])})),$y(l,"handleDoubleClick",(function(t){var e=l.props.onDoubleClick;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"handleContextMenu",(function(t){var e=l.props.onContextMenu;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"triggerSyncEvent",(function(t){void 0!==l.props.syncId&&Ad.emit(kd,l.props.syncId,t,l.eventEmitterSymbol)})),$y(l,"applySyncEvent",(function(t){var e=l.props,r=e.layout,n=e.syncMethod,o=l.state.updateId,i=t.dataStartIndex,a=t.dataEndIndex;if(void 0!==t.dataStartIndex||void 0!==t.dataEndIndex)l.setState(Uy({dataStartIndex:i,dataEndIndex:a},v({props:l.props,dataStartIndex:i,dataEndIndex:a,updateId:o},l.state)));else if(void 0!==t.activeTooltipIndex){var c=t.chartX,u=t.chartY,s=t.activeTooltipIndex,f=l.state,p=f.offset,h=f.tooltipTicks;if(!p)return;if("function"==typeof n)s=n(h,t);else if("value"===n){s=-1;for(var d=0;d<h.length;d++)if(h[d].value===t.activeLabel){s=d;break}}var y=Uy(Uy({},p),{},{x:p.left,y:p.top}),m=Math.min(c,y.x+y.width),b=Math.min(u,y.y+y.height),g=h[s]&&h[s].value,x=Ky(l.state,l.props.data,s),w=h[s]?{x:"horizontal"===r?h[s].coordinate:m,y:"horizontal"===r?b:h[s].coordinate}:Hy;l.setState(Uy(Uy({},t),{},{activeLabel:g,activeCoordinate:w,activePayload:x,activeTooltipIndex:s}))}else l.setState(t)})),$y(l,"renderCursor",(function(t){var e,n=l.state,i=n.isTooltipActive,a=n.activeCoordinate,c=n.activePayload,u=n.offset,s=n.activeTooltipIndex,f=n.tooltipAxisBandSize,p=l.getTooltipEventType(),h=null!==(e=t.props.active)&&void 0!==e?e:i,d=l.props.layout,y=t.key||"_recharts-cursor";return o().createElement(Ey,{key:y,activeCoordinate:a,activePayload:c,activeTooltipIndex:s,chartName:r,element:t,isActive:h,layout:d,offset:u,tooltipAxisBandSize:f,tooltipEventType:p})})),$y(l,"renderPolarAxis",(function(t,r,n){var o=d()(t,"type.axisType"),i=d()(l.state,"".concat(o,"Map")),c=t.type.defaultProps,u=void 0!==c?Uy(Uy({},c),t.props):t.props,s=i&&i[u["".concat(o,"Id")]];return(0,e.cloneElement)(t,Uy(Uy({},s),{},{className:a(o,s.className),key:t.key||"".concat(r,"-").concat(n),ticks:Ys(s,!0)}))})),$y(l,"renderPolarGrid",(function(t){var r=t.props,n=r.radialLines,o=r.polarAngles,i=r.polarRadius,a=l.state,c=a.radiusAxisMap,u=a.angleAxisMap,s=S(c),f=S(u),p=f.cx,h=f.cy,d=f.innerRadius,y=f.outerRadius;return(0,e.cloneElement)(t,{polarAngles:Array.isArray(o)?o:Ys(f,!0).map((function(t){return t.coordinate})),polarRadius:Array.isArray(i)?i:Ys(s,!0).map((function(t){return t.coordinate})),cx:p,cy:h,innerRadius:d,outerRadius:y,key:t.key||"polar-grid",radialLines:n})})),$y(l,"renderLegend",(function(){var t=l.state.formattedGraphicalItems,r=l.props,n=r.children,o=r.width,i=r.height,a=l.props.margin||{},c=o-(a.left||0)-(a.right||0),u=Ns({children:n,formattedGraphicalItems:t,legendWidth:c,legendContent:p});if(!u)return null;var s=u.item,f=Cy(u,Ay);return(0,e.cloneElement)(s,Uy(Uy({},f),{},{chartWidth:o,chartHeight:i,margin:a,onBBoxUpdate:l.handleLegendBBoxUpdate}))})),$y(l,"renderTooltip",(function(){var t,r=l.props,n=r.children,o=r.accessibilityLayer,i=tt(n,ue);if(!i)return null;var a=l.state,c=a.isTooltipActive,u=a.activeCoordinate,s=a.activePayload,f=a.activeLabel,p=a.offset,h=null!==(t=i.props.active)&&void 0!==t?t:c;return(0,e.cloneElement)(i,{viewBox:Uy(Uy({},p),{},{x:p.left,y:p.top}),active:h,label:f,payload:h?s:[],coordinate:u,accessibilityLayer:o})})),$y(l,"renderBrush",(function(t){var r=l.props,n=r.margin,o=r.data,i=l.state,a=i.offset,c=i.dataStartIndex,u=i.dataEndIndex,s=i.updateId;return(0,e.cloneElement)(t,{key:t.key||"_recharts-brush",onChange:Zs(l.handleBrushChange,t.props.onChange),data:o,x:g(t.props.x)?t.props.x:a.left,y:g(t.props.y)?t.props.y:a.top+a.height+a.brushBottom-(n.bottom||0),width:g(t.props.width)?t.props.width:a.width,startIndex:c,endIndex:u,updateId:"brush-".concat(s)})})),$y(l,"renderReferenceElement",(function(t,r,n){if(!t)return null;var o=l.clipPathId,i=l.state,a=i.xAxisMap,c=i.yAxisMap,u=i.offset,s=t.type.defaultProps||{},f=t.props,p=f.xAxisId,h=void 0===p?s.xAxisId:p,d=f.yAxisId,y=void 0===d?s.yAxisId:d;return(0,e.cloneElement)(t,{key:t.key||"".concat(r,"-").concat(n),xAxis:a[h],yAxis:c[y],viewBox:{x:u.left,y:u.top,width:u.width,height:u.height},clipPathId:o})})),$y(l,"renderActivePoints",(function(t){var e=t.item,r=t.activePoint,o=t.basePoint,i=t.childIndex,a=t.isRange,c=[],u=e.props.key,l=void 0!==e.item.type.defaultProps?Uy(Uy({},e.item.type.defaultProps),e.item.props):e.item.props,s=l.activeDot,f=Uy(Uy({index:i,dataKey:l.dataKey,cx:r.x,cy:r.y,r:4,fill:Ws(e.item),strokeWidth:2,stroke:"#fff",payload:r.payload,value:r.value},nt(s,!1)),$(s));return c.push(n.renderActiveDot(s,f,"".concat(u,"-activePoint-").concat(i))),o?c.push(n.renderActiveDot(s,Uy(Uy({},f),{},{cx:o.x,cy:o.y}),"".concat(u,"-basePoint-").concat(i))):a&&c.push(null),c})),$y(l,"renderGraphicChild",(function(t,r,n){var o=l.filterFormatItem(t,r,n);if(!o)return null;var i=l.getTooltipEventType(),a=l.state,c=a.isTooltipActive,u=a.tooltipAxis,s=a.activeTooltipIndex,f=a.activeLabel,p=tt(l.props.children,ue),h=o.props,d=h.points,y=h.isRange,v=h.baseLine,m=void 0!==o.item.type.defaultProps?Uy(Uy({},o.item.type.defaultProps),o.item.props):o.item.props,b=m.activeDot,g=m.hide,x=m.activeBar,w=m.activeShape,O=Boolean(!g&&c&&p&&(b||x||w)),j={};"axis"!==i&&p&&"click"===p.props.trigger?j={onClick:Zs(l.handleItemMouseEnter,t.props.onClick)}:"axis"!==i&&(j={onMouseLeave:Zs(l.handleItemMouseLeave,t.props.onMouseLeave),onMouseEnter:Zs(l.handleItemMouseEnter,t.props.onMouseEnter)});var S=(0,e.cloneElement)(t,Uy(Uy({},o.props),j));if(O){if(!(s>=0)){var P,A=(null!==(P=l.getItemByXY(l.state.activeCoordinate))&&void 0!==P?P:{graphicalItem:S}).graphicalItem,k=A.item,_=void 0===k?t:k,T=A.childIndex,C=Uy(Uy(Uy({},o.props),j),{},{activeIndex:T});return[(0,e.cloneElement)(_,C),null,null]}var D,I;if(u.dataKey&&!u.allowDuplicatedCategory){var N="function"==typeof u.dataKey?function(t){return"function"==typeof u.dataKey?u.dataKey(t.payload):null}:"payload.".concat(u.dataKey.toString());D=E(d,N,f),I=y&&v&&E(v,N,f)}else D=null==d?void 0:d[s],I=y&&v&&v[s];if(w||x){var B=void 0!==t.props.activeIndex?t.props.activeIndex:s;return[(0,e.cloneElement)(t,Uy(Uy(Uy({},o.props),j),{},{activeIndex:B})),null,null]}if(!M()(D))return[S].concat(Ry(l.renderActivePoints({item:o,activePoint:D,basePoint:I,childIndex:s,isRange:y})))}return y?[S,null,null]:[S,null]})),$y(l,"renderCustomized",(function(t,r,n){return(0,e.cloneElement)(t,Uy(Uy({key:"recharts-customized-".concat(n)},l.props),l.state))})),$y(l,"renderMap",{CartesianGrid:{handler:Gy,once:!0},ReferenceArea:{handler:l.renderReferenceElement},ReferenceLine:{handler:Gy},ReferenceDot:{handler:l.renderReferenceElement},XAxis:{handler:Gy},YAxis:{handler:Gy},Brush:{handler:l.renderBrush,once:!0},Bar:{handler:l.renderGraphicChild},Line:{handler:l.renderGraphicChild},Area:{handler:l.renderGraphicChild},Radar:{handler:l.renderGraphicChild},RadialBar:{handler:l.renderGraphicChild},Scatter:{handler:l.renderGraphicChild},Pie:{handler:l.renderGraphicChild},Funnel:{handler:l.renderGraphicChild},Tooltip:{handler:l.renderCursor,once:!0},PolarGrid:{handler:l.renderPolarGrid,once:!0},PolarAngleAxis:{handler:l.renderPolarAxis},PolarRadiusAxis:{handler:l.renderPolarAxis},Customized:{handler:l.renderCustomized}}),l.clipPathId="".concat(null!==(i=t.id)&&void 0!==i?i:O("recharts"),"-clip"),l.throttleTriggeredAfterMouseMove=u()(l.triggeredAfterMouseMove,null!==(c=t.throttleDelay)&&void 0!==c?c:1e3/60),l.state={},l}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&By(t,e)}(n,t),i=n,l=[{key:"componentDidMount",value:function(){var t,e;this.addListener(),this.accessibilityManager.setDetails({container:this.container,offset:{left:null!==(t=this.props.margin.left)&&void 0!==t?t:0,top:null!==(e=this.props.margin.top)&&void 0!==e?e:0},coordinateList:this.state.tooltipTicks,mouseHandlerCallback:this.triggeredAfterMouseMove,layout:this.props.layout}),this.displayDefaultTooltip()}},{key:"displayDefaultTooltip",value:function(){var t=this.props,e=t.children,r=t.data,n=t.height,o=t.layout,i=tt(e,ue);if(i){var a=i.props.defaultIndex;if(!("number"!=typeof a||a<0||a>this.state.tooltipTicks.length-1)){var c=this.state.tooltipTicks[a]&&this.state.tooltipTicks[a].value,u=Ky(this.state,r,a,c),l=this.state.tooltipTicks[a].coordinate,s=(this.state.offset.top+n)/2,f="horizontal"===o?{x:l,y:s}:{y:l,x:s},p=this.state.formattedGraphicalItems.find((function(t){return"Scatter"===t.item.type.name}));p&&(f=Uy(Uy({},f),p.props.points[a].tooltipPosition),u=p.props.points[a].tooltipPayload);var h={activeTooltipIndex:a,isTooltipActive:!0,activeLabel:c,activePayload:u,activeCoordinate:f};this.setState(h),this.renderCursor(i),this.accessibilityManager.setIndex(a)}}}},{key:"getSnapshotBeforeUpdate",value:function(t,e){return this.props.accessibilityLayer?(this.state.tooltipTicks!==e.tooltipTicks&&this.accessibilityManager.setDetails({coordinateList:this.state.tooltipTicks}),this.props.layout!==t.layout&&this.accessibilityManager.setDetails({layout:this.props.layout}),this.props.margin!==t.margin&&this.accessibilityManager.setDetails({offset:{left:null!==(r=this.props.margin.left)&&void 0!==r?r:0,top:null!==(n=this.props.margin.top)&&void 0!==n?n:0}}),null):null;var r,n}},{key:"componentDidUpdate",value:function(t){ot([tt(t.children,ue)],[tt(this.props.children,ue)])||this.displayDefaultTooltip()}},{key:"componentWillUnmount",value:function(){this.removeListener(),this.throttleTriggeredAfterMouseMove.cancel()}},{key:"getTooltipEventType",value:function(){var t=tt(this.props.children,ue);if(t&&"boolean"==typeof t.props.shared){var e=t.props.shared?"axis":"item";return s.indexOf(e)>=0?e:c}return c}},{key:"getMouseInfo",value:function(t){if(!this.container)return null;var e,r=this.container,n=r.getBoundingClientRect(),o=(e=n).top+window.scrollY-document.documentElement.clientTop,i=e.left+window.scrollX-document.documentElement.clientLeft,a={chartX:Math.round(t.pageX-i),chartY:Math.round(t.pageY-o)},c=n.width/r.offsetWidth||1,u=this.inRange(a.chartX,a.chartY,c);if(!u)return null;var l=this.state,s=l.xAxisMap,f=l.yAxisMap,p=this.getTooltipEventType(),h=Zy(this.state,this.props.data,this.props.layout,u);if("axis"!==p&&s&&f){var d=S(s).scale,y=S(f).scale,v=d&&d.invert?d.invert(a.chartX):null,m=y&&y.invert?y.invert(a.chartY):null;return Uy(Uy({},a),{},{xValue:v,yValue:m},h)}return h?Uy(Uy({},a),h):null}},{key:"inRange",value:function(t,e){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,n=this.props.layout,o=t/r,i=e/r;if("horizontal"===n||"vertical"===n){var a=this.state.offset;return o>=a.left&&o<=a.left+a.width&&i>=a.top&&i<=a.top+a.height?{x:o,y:i}:null}var c=this.state,u=c.angleAxisMap,l=c.radiusAxisMap;if(u&&l){var s=S(u);return Bf({x:o,y:i},s)}return null}},{key:"parseEventsOfWrapper",value:function(){var t=this.props.children,e=this.getTooltipEventType(),r=tt(t,ue),n={};return r&&"axis"===e&&(n="click"===r.props.trigger?{onClick:this.handleClick}:{onMouseEnter:this.handleMouseEnter,onDoubleClick:this.handleDoubleClick,onMouseMove:this.handleMouseMove,onMouseLeave:this.handleMouseLeave,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,onTouchEnd:this.handleTouchEnd,onContextMenu:this.handleContextMenu}),Uy(Uy({},$(this.props,this.handleOuterEvent)),n)}},{key:"addListener",value:function(){Ad.on(kd,this.handleReceiveSyncEvent)}},{key:"removeListener",value:function(){Ad.removeListener(kd,this.handleReceiveSyncEvent)}},{key:"filterFormatItem",value:function(t,e,r){for(var n=this.state.formattedGraphicalItems,o=0,i=n.length;o<i;o++){var a=n[o];if(a.item===t||a.props.key===t.key||e===Y(a.item.type)&&r===a.childIndex)return a}return null}},{key:"renderClipPath",value:function(){var t=this.clipPathId,e=this.state.offset,r=e.left,n=e.top,i=e.height,a=e.width;return o().createElement("defs",null,o().createElement("clipPath",{id:t},o().createElement("rect",{x:r,y:n,height:i,width:a})))}},{key:"getXScales",value:function(){var t=this.state.xAxisMap;return t?Object.entries(t).reduce((function(t,e){var r=Ty(e,2),n=r[0],o=r[1];return Uy(Uy({},t),{},$y({},n,o.scale))}),{}):null}},{key:"getYScales",value:function(){var t=this.state.yAxisMap;return t?Object.entries(t).reduce((function(t,e){var r=Ty(e,2),n=r[0],o=r[1];return Uy(Uy({},t),{},$y({},n,o.scale))}),{}):null}},{key:"getXScaleByAxisId",value:function(t){var e;return null===(e=this.state.xAxisMap)||void 0===e||null===(e=e[t])||void 0===e?void 0:e.scale}},{key:"getYScaleByAxisId",value:function(t){var e;return null===(e=this.state.yAxisMap)||void 0===e||null===(e=e[t])||void 0===e?void 0:e.scale}},{key:"getItemByXY",value:function(t){var e=this.state,r=e.formattedGraphicalItems,n=e.activeItem;if(r&&r.length)for(var o=0,i=r.length;o<i;o++){var a=r[o],c=a.props,u=a.item,l=void 0!==u.type.defaultProps?Uy(Uy({},u.type.defaultProps),u.props):u.props,s=Y(u.type);if("Bar"===s){var f=(c.data||[]).find((function(e){return Kn(t,e)}));if(f)return{graphicalItem:a,payload:f}}else if("RadialBar"===s){var p=(c.data||[]).find((function(e){return Bf(t,e)}));if(p)return{graphicalItem:a,payload:p}}else if(Up(a,n)||$p(a,n)||qp(a,n)){var h=Gp({graphicalItem:a,activeTooltipItem:n,itemData:l.data}),d=void 0===l.activeIndex?h:l.activeIndex;return{graphicalItem:Uy(Uy({},a),{},{childIndex:d}),payload:qp(a,n)?l.data[h]:a.props.data[h]}}}return null}},{key:"render",value:function(){var t=this;if(!et(this))return null;var e,r,n=this.props,i=n.children,c=n.className,u=n.width,l=n.height,s=n.style,f=n.compact,p=n.title,h=n.desc,d=Cy(n,ky),y=nt(d,!1);if(f)return o().createElement(Vh,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},o().createElement(xt,My({},y,{width:u,height:l,title:p,desc:h}),this.renderClipPath(),at(i,this.renderMap)));this.props.accessibilityLayer&&(y.tabIndex=null!==(e=this.props.tabIndex)&&void 0!==e?e:0,y.role=null!==(r=this.props.role)&&void 0!==r?r:"application",y.onKeyDown=function(e){t.accessibilityManager.keyboardEvent(e)},y.onFocus=function(){t.accessibilityManager.focus()});var v=this.parseEventsOfWrapper();return o().createElement(Vh,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},o().createElement("div",My({className:a("recharts-wrapper",c),style:Uy({position:"relative",cursor:"default",width:u,height:l},s)},v,{ref:function(e){t.container=e}}),o().createElement(xt,My({},y,{width:u,height:l,title:p,desc:h,style:Xy}),this.renderClipPath(),at(i,this.renderMap)),this.renderLegend(),this.renderTooltip()))}}],l&&Dy(i.prototype,l),Object.defineProperty(i,"prototype",{writable:!1}),i;var i,l}(e.Component);$y(m,"displayName",r),$y(m,"defaultProps",Uy({layout:"horizontal",stackOffset:"none",barCategoryGap:"10%",barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:"index"},y)),$y(m,"getDerivedStateFromProps",(function(t,e){var r=t.dataKey,n=t.data,o=t.children,i=t.width,a=t.height,c=t.layout,u=t.stackOffset,l=t.margin,s=e.dataStartIndex,f=e.dataEndIndex;if(void 0===e.updateId){var p=Qy(t);return Uy(Uy(Uy({},p),{},{updateId:0},v(Uy(Uy({props:t},p),{},{updateId:0}),e)),{},{prevDataKey:r,prevData:n,prevWidth:i,prevHeight:a,prevLayout:c,prevStackOffset:u,prevMargin:l,prevChildren:o})}if(r!==e.prevDataKey||n!==e.prevData||i!==e.prevWidth||a!==e.prevHeight||c!==e.prevLayout||u!==e.prevStackOffset||!B(l,e.prevMargin)){var h=Qy(t),d={chartX:e.chartX,chartY:e.chartY,isTooltipActive:e.isTooltipActive},y=Uy(Uy({},Zy(e,n,c)),{},{updateId:e.updateId+1}),m=Uy(Uy(Uy({},h),d),y);return Uy(Uy(Uy({},m),v(Uy({props:t},m),e)),{},{prevDataKey:r,prevData:n,prevWidth:i,prevHeight:a,prevLayout:c,prevStackOffset:u,prevMargin:l,prevChildren:o})}if(!ot(o,e.prevChildren)){var b,g,x,w,O=tt(o,Af),j=O&&null!==(b=null===(g=O.props)||void 0===g?void 0:g.startIndex)&&void 0!==b?b:s,S=O&&null!==(x=null===(w=O.props)||void 0===w?void 0:w.endIndex)&&void 0!==x?x:f,P=j!==s||S!==f,E=M()(n)||P?e.updateId+1:e.updateId;return Uy(Uy({updateId:E},v(Uy(Uy({props:t},e),{},{updateId:E,dataStartIndex:j,dataEndIndex:S}),e)),{},{prevChildren:o,dataStartIndex:j,dataEndIndex:S})}return null})),$y(m,"renderActiveDot",(function(t,r,n){var i;return i=(0,e.isValidElement)(t)?(0,e.cloneElement)(t,r):C()(t)?t(r):o().createElement(xr,r),o().createElement(jt,{className:"recharts-active-dot",key:n},i)}));var b=(0,e.forwardRef)((function(t,e){return o().createElement(m,My({},t,{ref:e}))}));return b.displayName=m.displayName,b}({chartName:"LineChart",GraphicalChild:mv,axisComponents:[{axisType:"xAxis",AxisComp:Yv},{axisType:"yAxis",AxisComp:im}],formatAxisMap:function(e,r,n,o,i){var a=e.width,c=e.height,u=e.layout,l=e.children,f=Object.keys(r),p={left:n.left,leftMirror:n.left,right:a-n.right,rightMirror:a-n.right,top:n.top,topMirror:n.top,bottom:c-n.bottom,bottomMirror:c-n.bottom},h=!!tt(l,dh);return f.reduce((function(a,c){var l,f,d,y,v,m=r[c],b=m.orientation,g=m.domain,x=m.padding,w=void 0===x?{}:x,O=m.mirror,S=m.reversed,P="".concat(b).concat(O?"Mirror":"");if("number"===m.type&&("gap"===m.padding||"no-gap"===m.padding)){var E=g[1]-g[0],k=1/0,_=m.categoricalDomain.sort(A);if(_.forEach((function(t,e){e>0&&(k=Math.min((t||0)-(_[e-1]||0),k))})),Number.isFinite(k)){var M=k/E,T="vertical"===m.layout?n.height:n.width;if("gap"===m.padding&&(l=M*T/2),"no-gap"===m.padding){var D=j(e.barCategoryGap,M*T),I=M*T/2;l=I-D-(I-D)/T*D}}}f="xAxis"===o?[n.left+(w.left||0)+(l||0),n.left+n.width-(w.right||0)-(l||0)]:"yAxis"===o?"horizontal"===u?[n.top+n.height-(w.bottom||0),n.top+(w.top||0)]:[n.top+(w.top||0)+(l||0),n.top+n.height-(w.bottom||0)-(l||0)]:m.range,S&&(f=[f[1],f[0]]);var N=function(e,r,n){var o=e.scale,i=e.type,a=e.layout,c=e.axisType;if("auto"===o)return"radial"===a&&"radiusAxis"===c?{scale:ao(),realScaleType:"band"}:"radial"===a&&"angleAxis"===c?{scale:Ea(),realScaleType:"linear"}:"category"===i&&r&&(r.indexOf("LineChart")>=0||r.indexOf("AreaChart")>=0||r.indexOf("ComposedChart")>=0&&!n)?{scale:uo(),realScaleType:"point"}:"category"===i?{scale:ao(),realScaleType:"band"}:{scale:Ea(),realScaleType:"linear"};if(s()(o)){var u="scale".concat(se()(o));return{scale:(t[u]||uo)(),realScaleType:t[u]?u:"point"}}return C()(o)?{scale:o}:{scale:uo(),realScaleType:"point"}}(m,i,h),B=N.scale,R=N.realScaleType;B.domain(g).range(f),function(t){var e=t.domain();if(e&&!(e.length<=2)){var r=e.length,n=t.range(),o=Math.min(n[0],n[1])-Js,i=Math.max(n[0],n[1])+Js,a=t(e[0]),c=t(e[r-1]);(a<o||a>i||c<o||c>i)&&t.domain([e[0],e[r-1]])}}(B);var L=function(t,e){var r=e.realScaleType,n=e.type,o=e.tickCount,i=e.originalDomain,a=e.allowDecimals,c=r||e.scale;if("auto"!==c&&"linear"!==c)return null;if(o&&"number"===n&&i&&("auto"===i[0]||"auto"===i[1])){var u=t.domain();if(!u.length)return null;var l=bs(u,o,a);return t.domain([ql()(l),Ul()(l)]),{niceTicks:l}}if(o&&"number"===n){var s=t.domain();return{niceTicks:gs(s,o,a)}}return null}(B,bh(bh({},m),{},{realScaleType:R}));"xAxis"===o?(v="top"===b&&!O||"bottom"===b&&O,d=n.left,y=p[P]-v*m.height):"yAxis"===o&&(v="left"===b&&!O||"right"===b&&O,d=p[P]-v*m.width,y=n.top);var z=bh(bh(bh({},m),L),{},{realScaleType:R,x:d,y,scale:B,width:"xAxis"===o?n.width:m.width,height:"yAxis"===o?n.height:m.height});return z.bandSize=uf(z,L),m.hide||"xAxis"!==o?m.hide||(p[P]+=(v?-1:1)*z.width):p[P]+=(v?-1:1)*z.height,bh(bh({},a),{},gh({},c,z))}),{})}}),cm=["x1","y1","x2","y2","key"],um=["offset"];function lm(t){return lm="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},lm(t)}function sm(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function fm(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?sm(Object(r),!0).forEach((function(e){pm(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):sm(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function pm(t,e,r){var n;return n=function(t){if("object"!=lm(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=lm(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==lm(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function hm(){return hm=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},hm.apply(this,arguments)}function dm(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}var ym=function(t){var e=t.fill;if(!e||"none"===e)return null;var r=t.fillOpacity,n=t.x,i=t.y,a=t.width,c=t.height,u=t.ry;return o().createElement("rect",{x:n,y:i,ry:u,width:a,height:c,stroke:"none",fill:e,fillOpacity:r,className:"recharts-cartesian-grid-bg"})};function vm(t,e){var r;if(o().isValidElement(t))r=o().cloneElement(t,e);else if(C()(t))r=t(e);else{var n=e.x1,i=e.y1,a=e.x2,c=e.y2,u=e.key,l=dm(e,cm),s=nt(l,!1),f=(s.offset,dm(s,um));r=o().createElement("line",hm({},f,{x1:n,y1:i,x2:a,y2:c,fill:"none",key:u}))}return r}function mm(t){var e=t.x,r=t.width,n=t.horizontal,i=void 0===n||n,a=t.horizontalPoints;if(!i||!a||!a.length)return null;var c=a.map((function(n,o){var a=fm(fm({},t),{},{x1:e,y1:n,x2:e+r,y2:n,key:"line-".concat(o),index:o});return vm(i,a)}));return o().createElement("g",{className:"recharts-cartesian-grid-horizontal"},c)}function bm(t){var e=t.y,r=t.height,n=t.vertical,i=void 0===n||n,a=t.verticalPoints;if(!i||!a||!a.length)return null;var c=a.map((function(n,o){var a=fm(fm({},t),{},{x1:n,y1:e,x2:n,y2:e+r,key:"line-".concat(o),index:o});return vm(i,a)}));return o().createElement("g",{className:"recharts-cartesian-grid-vertical"},c)}function gm(t){var e=t.horizontalFill,r=t.fillOpacity,n=t.x,i=t.y,a=t.width,c=t.height,u=t.horizontalPoints,l=t.horizontal;if(void 0!==l&&!l||!e||!e.length)return null;var s=u.map((function(t){return Math.round(t+i-i)})).sort((function(t,e){return t-e}));i!==s[0]&&s.unshift(0);var f=s.map((function(t,u){var l=s[u+1]?s[u+1]-t:i+c-t;if(l<=0)return null;var f=u%e.length;return o().createElement("rect",{key:"react-".concat(u),y:t,x:n,height:l,width:a,stroke:"none",fill:e[f],fillOpacity:r,className:"recharts-cartesian-grid-bg"})}));return o().createElement("g",{className:"recharts-cartesian-gridstripes-horizontal"},f)}function xm(t){var e=t.vertical,r=void 0===e||e,n=t.verticalFill,i=t.fillOpacity,a=t.x,c=t.y,u=t.width,l=t.height,s=t.verticalPoints;if(!r||!n||!n.length)return null;var f=s.map((function(t){return Math.round(t+a-a)})).sort((function(t,e){return t-e}));a!==f[0]&&f.unshift(0);var p=f.map((function(t,e){var r=f[e+1]?f[e+1]-t:a+u-t;if(r<=0)return null;var s=e%n.length;return o().createElement("rect",{key:"react-".concat(e),x:t,y:c,width:r,height:l,stroke:"none",fill:n[s],fillOpacity:i,className:"recharts-cartesian-grid-bg"})}));return o().createElement("g",{className:"recharts-cartesian-gridstripes-vertical"},p)}var wm=function(t,e){var r=t.xAxis,n=t.width,o=t.height,i=t.offset;return Vs(Sv(fm(fm(fm({},zv.defaultProps),r),{},{ticks:Ys(r,!0),viewBox:{x:0,y:0,width:n,height:o}})),i.left,i.left+i.width,e)},Om=function(t,e){var r=t.yAxis,n=t.width,o=t.height,i=t.offset;return Vs(Sv(fm(fm(fm({},zv.defaultProps),r),{},{ticks:Ys(r,!0),viewBox:{x:0,y:0,width:n,height:o}})),i.top,i.top+i.height,e)},jm={horizontal:!0,vertical:!0,horizontalPoints:[],verticalPoints:[],stroke:"#ccc",fill:"none",verticalFill:[],horizontalFill:[]};function Sm(t){var r,n,i,a,c,u,l,s,f=Zh(),p=Jh(),h=(0,e.useContext)(Wh),d=fm(fm({},t),{},{stroke:null!==(r=t.stroke)&&void 0!==r?r:jm.stroke,fill:null!==(n=t.fill)&&void 0!==n?n:jm.fill,horizontal:null!==(i=t.horizontal)&&void 0!==i?i:jm.horizontal,horizontalFill:null!==(a=t.horizontalFill)&&void 0!==a?a:jm.horizontalFill,vertical:null!==(c=t.vertical)&&void 0!==c?c:jm.vertical,verticalFill:null!==(u=t.verticalFill)&&void 0!==u?u:jm.verticalFill,x:g(t.x)?t.x:h.left,y:g(t.y)?t.y:h.top,width:g(t.width)?t.width:h.width,height:g(t.height)?t.height:h.height}),y=d.x,v=d.y,m=d.width,b=d.height,x=d.syncWithTicks,w=d.horizontalValues,O=d.verticalValues,j=(l=(0,e.useContext)(Uh),S(l)),P=(s=(0,e.useContext)($h),Lh()(s,(function(t){return Kf()(t.domain,Number.isFinite)}))||S(s));if(!g(m)||m<=0||!g(b)||b<=0||!g(y)||y!==+y||!g(v)||v!==+v)return null;var E=d.verticalCoordinatesGenerator||wm,A=d.horizontalCoordinatesGenerator||Om,_=d.horizontalPoints,M=d.verticalPoints;if((!_||!_.length)&&C()(A)){var T=w&&w.length,D=A({yAxis:P?fm(fm({},P),{},{ticks:T?w:P.ticks}):void 0,width:f,height:p,offset:h},!!T||x);k(Array.isArray(D),"horizontalCoordinatesGenerator should return Array but instead it returned [".concat(lm(D),"]")),Array.isArray(D)&&(_=D)}if((!M||!M.length)&&C()(E)){var I=O&&O.length,N=E({xAxis:j?fm(fm({},j),{},{ticks:I?O:j.ticks}):void 0,width:f,height:p,offset:h},!!I||x);k(Array.isArray(N),"verticalCoordinatesGenerator should return Array but instead it returned [".concat(lm(N),"]")),Array.isArray(N)&&(M=N)}return o().createElement("g",{className:"recharts-cartesian-grid"},o().createElement(ym,{fill:d.fill,fillOpacity:d.fillOpacity,x:d.x,y:d.y,width:d.width,height:d.height,ry:d.ry}),o().createElement(mm,hm({},d,{offset:h,horizontalPoints:_,xAxis:j,yAxis:P})),o().createElement(bm,hm({},d,{offset:h,verticalPoints:M,xAxis:j,yAxis:P})),o().createElement(gm,hm({},d,{horizontalPoints:_})),o().createElement(xm,hm({},d,{verticalPoints:M})))}function Pm(t){return Pm="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Pm(t)}function Em(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return Am(t,e);var r={}.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Am(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Am(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=Array(e);r<e;r++)n[r]=t[r];return n}function km(){km=function(){return e};var t,e={},r=Object.prototype,n=r.hasOwnProperty,o="function"==typeof Symbol?Symbol:{},i=o.iterator||"@@iterator",a=o.asyncIterator||"@@asyncIterator",c=o.toStringTag||"@@toStringTag";function u(t,e,r,n){return Object.defineProperty(t,e,{value:r,enumerable:!n,configurable:!n,writable:!n})}try{u({},"")}catch(t){u=function(t,e,r){return t[e]=r}}function l(e,r,n,o){var i=r&&r.prototype instanceof p?r:p,a=Object.create(i.prototype);return u(a,"_invoke",function(e,r,n){var o=1;return function(i,a){if(3===o)throw Error("Generator is already running");if(4===o){if("throw"===i)throw a;return{value:t,done:!0}}for(n.method=i,n.arg=a;;){var c=n.delegate;if(c){var u=w(c,n);if(u){if(u===f)continue;return u}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(1===o)throw o=4,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);o=3;var l=s(e,r,n);if("normal"===l.type){if(o=n.done?4:2,l.arg===f)continue;return{value:l.arg,done:n.done}}"throw"===l.type&&(o=4,n.method="throw",n.arg=l.arg)}}}(e,n,new S(o||[])),!0),a}function s(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=l;var f={};function p(){}function h(){}function d(){}var y={};u(y,i,(function(){return this}));var v=Object.getPrototypeOf,m=v&&v(v(P([])));m&&m!==r&&n.call(m,i)&&(y=m);var b=d.prototype=p.prototype=Object.create(y);function g(t){["next","throw","return"].forEach((function(e){u(t,e,(function(t){return this._invoke(e,t)}))}))}function x(t,e){function r(o,i,a,c){var u=s(t[o],t,i);if("throw"!==u.type){var l=u.arg,f=l.value;return f&&"object"==Pm(f)&&n.call(f,"__await")?e.resolve(f.__await).then((function(t){r("next",t,a,c)}),(function(t){r("throw",t,a,c)})):e.resolve(f).then((function(t){l.value=t,a(l)}),(function(t){return r("throw",t,a,c)}))}c(u.arg)}var o;u(this,"_invoke",(function(t,n){function i(){return new e((function(e,o){r(t,n,e,o)}))}return o=o?o.then(i,i):i()}),!0)}function w(e,r){var n=r.method,o=e.i[n];if(o===t)return r.delegate=null,"throw"===n&&e.i.return&&(r.method="return",r.arg=t,w(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),f;var i=s(o,e.i,r.arg);if("throw"===i.type)return r.method="throw",r.arg=i.arg,r.delegate=null,f;var a=i.arg;return a?a.done?(r[e.r]=a.value,r.next=e.n,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,f):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,f)}function O(t){this.tryEntries.push(t)}function j(e){var r=e[4]||{};r.type="normal",r.arg=t,e[4]=r}function S(t){this.tryEntries=[[-1]],t.forEach(O,this),this.reset(!0)}function P(e){if(null!=e){var r=e[i];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function r(){for(;++o<e.length;)if(n.call(e,o))return r.value=e[o],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(Pm(e)+" is not iterable")}return h.prototype=d,u(b,"constructor",d),u(d,"constructor",h),h.displayName=u(d,c,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===h||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,d):(t.__proto__=d,u(t,c,"GeneratorFunction")),t.prototype=Object.create(b),t},e.awrap=function(t){return{__await:t}},g(x.prototype),u(x.prototype,a,(function(){return this})),e.AsyncIterator=x,e.async=function(t,r,n,o,i){void 0===i&&(i=Promise);var a=new x(l(t,r,n,o),i);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},g(b),u(b,c,"Generator"),u(b,i,(function(){return this})),u(b,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.unshift(n);return function t(){for(;r.length;)if((n=r.pop())in e)return t.value=n,t.done=!1,t;return t.done=!0,t}},e.values=P,S.prototype={constructor:S,reset:function(e){if(this.prev=this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var r in this)"t"===r.charAt(0)&&n.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0][4];if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(t){a.type="throw",a.arg=e,r.next=t}for(var o=r.tryEntries.length-1;o>=0;--o){var i=this.tryEntries[o],a=i[4],c=this.prev,u=i[1],l=i[2];if(-1===i[0])return n("end"),!1;if(!u&&!l)throw Error("try statement without catch or finally");if(null!=i[0]&&i[0]<=c){if(c<u)return this.method="next",this.arg=t,n(u),!0;if(c<l)return n(l),!1}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n[0]>-1&&n[0]<=this.prev&&this.prev<n[2]){var o=n;break}}o&&("break"===t||"continue"===t)&&o[0]<=e&&e<=o[2]&&(o=null);var i=o?o[4]:{};return i.type=t,i.arg=e,o?(this.method="next",this.next=o[2],f):this.complete(i)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),f},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r[2]===t)return this.complete(r[4],r[3]),j(r),f}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r[0]===t){var n=r[4];if("throw"===n.type){var o=n.arg;j(r)}return o}}throw Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={i:P(e),r,n},"next"===this.method&&(this.arg=t),f}},e}function _m(t,e,r,n,o,i,a){try{var c=t[i](a),u=c.value}catch(t){return void r(t)}c.done?e(u):Promise.resolve(u).then(n,o)}function Mm(t){return function(){var e=this,r=arguments;return new Promise((function(n,o){var i=t.apply(e,r);function a(t){_m(i,n,o,a,c,"next",t)}function c(t){_m(i,n,o,a,c,"throw",t)}a(void 0)}))}}Sm.displayName="CartesianGrid";var Tm=function(t){return Mm(km().mark((function e(){var r;return km().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.prev=0,e.next=3,fetch("/api/results/".concat(t));case 3:return r=e.sent,e.next=6,r.json();case 6:return e.abrupt("return",e.sent);case 9:throw e.prev=9,e.t0=e.catch(0),console.error("Results Fetch Error:",e.t0),e.t0;case 13:case"end":return e.stop()}}),e,null,[[0,9]])})))()},Cm=function(t){var e=t.videoId;return o().createElement("div",{className:"p-4 bg-gray-100 rounded"},o().createElement("p",null,"Frame Analysis Component for video: ",e))},Dm=function(t){return t.videoData,t.heatmapData,o().createElement("div",{className:"p-4 bg-gray-100 rounded"},o().createElement("p",null,"Heatmap Component for video"))};const Im=function(t){var r,n,i=t.videoId,a=Em((0,e.useState)(!0),2),c=a[0],u=a[1],l=Em((0,e.useState)(null),2),s=l[0],f=l[1],p=Em((0,e.useState)(null),2),h=p[0],d=p[1],y=Em((0,e.useState)("overview"),2),v=y[0],m=y[1];if((0,e.useEffect)((function(){function t(){return(t=Mm(km().mark((function t(){var e;return km().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.prev=0,u(!0),t.next=4,Tm(i);case 4:"success"===(e=t.sent).status?(d(e.result),u(!1)):(f("Failed to load analysis results"),u(!1)),t.next=12;break;case 8:t.prev=8,t.t0=t.catch(0),f("Error loading results: ".concat(t.t0.message)),u(!1);case 12:case"end":return t.stop()}}),t,null,[[0,8]])})))).apply(this,arguments)}i&&function(){t.apply(this,arguments)}()}),[i]),c)return o().createElement("div",{className:"flex items-center justify-center h-64"},o().createElement("div",{className:"animate-spin rounded-full h-12 w-12 border-b-2 border-purple-600"}));if(s)return o().createElement("div",{className:"bg-red-100 text-red-700 p-4 rounded-lg"},o().createElement("p",null,s));if(!h)return o().createElement("div",{className:"bg-yellow-100 text-yellow-800 p-4 rounded-lg"},o().createElement("p",null,"No analysis results found for video ID: ",i));var b=h&&h.frame_analysis?h.frame_analysis.map((function(t,e){return{name:"Frame ".concat(e+1),fake:100*t.probability_fake,real:100*(1-t.probability_fake)}})):[];return o().createElement("div",{className:"space-y-6"},o().createElement("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-4"},o().createElement("div",{className:"p-6 rounded-lg shadow-md ".concat("Deepfake"===h.prediction?"bg-red-600 text-white":"bg-green-600 text-white")},o().createElement("h3",{className:"text-lg font-semibold"},"Result"),o().createElement("p",{className:"text-3xl font-bold mt-2"},h.prediction),o().createElement("p",{className:"mt-1 text-sm opacity-80"},"Deepfake"===h.prediction?"AI manipulation detected":"No manipulation detected")),o().createElement("div",{className:"bg-white p-6 rounded-lg shadow-md"},o().createElement("h3",{className:"text-lg font-semibold text-gray-700"},"Confidence"),o().createElement("p",{className:"text-3xl font-bold mt-2"},(100*h.confidence).toFixed(1),"%"),o().createElement("p",{className:"mt-1 text-sm text-gray-500"},h.confidence>.9?"Very high confidence":h.confidence>.8?"High confidence":"Moderate confidence")),o().createElement("div",{className:"bg-white p-6 rounded-lg shadow-md"},o().createElement("h3",{className:"text-lg font-semibold text-gray-700"},"Peak Detection"),o().createElement("p",{className:"text-3xl font-bold mt-2"},(100*h.max_fake_probability).toFixed(1),"%"),o().createElement("p",{className:"mt-1 text-sm text-gray-500"},"Maximum manipulation score detected")),o().createElement("div",{className:"bg-white p-6 rounded-lg shadow-md"},o().createElement("h3",{className:"text-lg font-semibold text-gray-700"},"Suspicious Frames"),o().createElement("p",{className:"text-3xl font-bold mt-2"},(null===(r=h.frame_analysis)||void 0===r?void 0:r.filter((function(t){return t.probability_fake>.5})).length)||0,o().createElement("span",{className:"text-lg text-gray-500"},"/",(null===(n=h.frame_analysis)||void 0===n?void 0:n.length)||0)),o().createElement("p",{className:"mt-1 text-sm text-gray-500"},"Frames with high manipulation scores"))),o().createElement("div",{className:"bg-white rounded-lg shadow-md overflow-hidden"},o().createElement("div",{className:"border-b"},o().createElement("div",{className:"flex"},o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("overview"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("overview")}},"Overview"),o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("frameAnalysis"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("frameAnalysis")}},"Frame Analysis"),o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("heatmap"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("heatmap")}},"Manipulation Heatmap"),o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("technical"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("technical")}},"Technical Details"))),o().createElement("div",{className:"p-6"},"overview"===v&&o().createElement("div",{className:"space-y-6"},o().createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},o().createElement("div",{className:"bg-gray-100 rounded-lg overflow-hidden"},o().createElement("h3",{className:"bg-gray-800 text-white p-3 text-sm font-semibold"},"Video Preview"),o().createElement("div",{className:"aspect-w-16 aspect-h-9 bg-black"},o().createElement("video",{className:"w-full",controls:!0,src:"/api/video/".concat(i)})),o().createElement("div",{className:"p-3 text-sm text-gray-600"},o().createElement("p",null,o().createElement("span",{className:"font-medium"},"Filename:")," ",h.filename),o().createElement("p",null,o().createElement("span",{className:"font-medium"},"Resolution:")," ",h.resolution),o().createElement("p",null,o().createElement("span",{className:"font-medium"},"Duration:")," ",h.duration,"s"))),o().createElement("div",{className:"bg-white rounded-lg shadow-sm"},o().createElement("h3",{className:"p-3 text-sm font-semibold text-gray-700 border-b"},"Manipulation Probability by Frame"),o().createElement("div",{className:"p-3 h-64"},o().createElement(pt,{width:"100%",height:"100%"},o().createElement(am,{data:b,margin:{top:5,right:30,left:20,bottom:5}},o().createElement(Sm,{strokeDasharray:"3 3"}),o().createElement(Yv,{dataKey:"name",tick:{fontSize:10}}),o().createElement(im,{domain:[0,100],tick:{fontSize:10}}),o().createElement(ue,null),o().createElement(br,null),o().createElement(mv,{type:"monotone",dataKey:"fake",stroke:"#EF4444",activeDot:{r:8},name:"Fake Probability (%)"}),o().createElement(mv,{type:"monotone",dataKey:"real",stroke:"#10B981",name:"Real Probability (%)"})))))),o().createElement("div",{className:"bg-white rounded-lg shadow-sm"},o().createElement("h3",{className:"p-3 text-sm font-semibold text-gray-700 border-b"},"Probability Distribution"),o().createElement("div",{className:"p-6"},o().createElement("div",{className:"flex items-center mb-6"},o().createElement("div",{className:"w-4 h-4 rounded-full bg-green-500 mr-2"}),o().createElement("div",{className:"flex-1"},o().createElement("div",{className:"flex justify-between mb-1"},o().createElement("span",{className:"text-sm font-medium text-gray-700"},"Real"),o().createElement("span",{className:"text-sm font-medium text-gray-700"},(100*h.probabilities.real).toFixed(1),"%")),o().createElement("div",{className:"w-full bg-gray-200 rounded-full h-2"},o().createElement("div",{className:"bg-green-500 h-2 rounded-full",style:{width:"".concat(100*h.probabilities.real,"%")}})))),o().createElement("div",{className:"flex items-center"},o().createElement("div",{className:"w-4 h-4 rounded-full bg-red-500 mr-2"}),o().createElement("div",{className:"flex-1"},o().createElement("div",{className:"flex justify-between mb-1"},o().createElement("span",{className:"text-sm font-medium text-gray-700"},"Deepfake"),o().createElement("span",{className:"text-sm font-medium text-gray-700"},(100*h.probabilities.fake).toFixed(1),"%")),o().createElement("div",{className:"w-full bg-gray-200 rounded-full h-2"},o().createElement("div",{className:"bg-red-500 h-2 rounded-full",style:{width:"".concat(100*h.probabilities.fake,"%")}}))))))),"frameAnalysis"===v&&o().createElement(Cm,{videoId:i}),"heatmap"===v&&o().createElement(Dm,{videoData:{url:"/api/video/".concat(i)},heatmapData:{frames:h.frame_analysis}}),"technical"===v&&o().createElement("div",{className:"bg-gray-100 rounded-lg p-4 overflow-x-auto"},o().createElement("pre",{className:"text-sm text-gray-700 whitespace-pre-wrap"},JSON.stringify(h,null,2))))))}})(),AnalysisResults=n})();
\ No newline at end of file
+var AnalysisResults;(()=>{var t={2:(t,e,r)=>{var n=r(2199),o=r(4664),i=r(5950);t.exports=function(t){return n(t,i,o)}},14:(t,e,r)=>{var n=r(5389),o=r(5765);t.exports=function(t,e){return t&&t.length?o(t,n(e,2)):[]}},79:(t,e,r)=>{var n=r(3702),o=r(80),i=r(4739),a=r(8655),c=r(1175);function u(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}u.prototype.clear=n,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=c,t.exports=u},80:(t,e,r)=>{var n=r(6025),o=Array.prototype.splice;t.exports=function(t){var e=this.__data__,r=n(e,t);return!(r<0||(r==e.length-1?e.pop():o.call(e,r,1),--this.size,0))}},104:(t,e,r)=>{var n=r(3661);function o(t,e){if("function"!=typeof t||null!=e&&"function"!=typeof e)throw new TypeError("Expected a function");var r=function(){var n=arguments,o=e?e.apply(this,n):n[0],i=r.cache;if(i.has(o))return i.get(o);var a=t.apply(this,n);return r.cache=i.set(o,a)||i,a};return r.cache=new(o.Cache||n),r}o.Cache=n,t.exports=o},124:(t,e,r)=>{var n=r(9325);t.exports=function(){return n.Date.now()}},228:t=>{"use strict";var e=Object.prototype.hasOwnProperty,r="~";function n(){}function o(t,e,r){this.fn=t,this.context=e,this.once=r||!1}function i(t,e,n,i,a){if("function"!=typeof n)throw new TypeError("The listener must be a function");var c=new o(n,i||t,a),u=r?r+e:e;return t._events[u]?t._events[u].fn?t._events[u]=[t._events[u],c]:t._events[u].push(c):(t._events[u]=c,t._eventsCount++),t}function a(t,e){0==--t._eventsCount?t._events=new n:delete t._events[e]}function c(){this._events=new n,this._eventsCount=0}Object.create&&(n.prototype=Object.create(null),(new n).__proto__||(r=!1)),c.prototype.eventNames=function(){var t,n,o=[];if(0===this._eventsCount)return o;for(n in t=this._events)e.call(t,n)&&o.push(r?n.slice(1):n);return Object.getOwnPropertySymbols?o.concat(Object.getOwnPropertySymbols(t)):o},c.prototype.listeners=function(t){var e=r?r+t:t,n=this._events[e];if(!n)return[];if(n.fn)return[n.fn];for(var o=0,i=n.length,a=new Array(i);o<i;o++)a[o]=n[o].fn;return a},c.prototype.listenerCount=function(t){var e=r?r+t:t,n=this._events[e];return n?n.fn?1:n.length:0},c.prototype.emit=function(t,e,n,o,i,a){var c=r?r+t:t;if(!this._events[c])return!1;var u,l,s=this._events[c],f=arguments.length;if(s.fn){switch(s.once&&this.removeListener(t,s.fn,void 0,!0),f){case 1:return s.fn.call(s.context),!0;case 2:return s.fn.call(s.context,e),!0;case 3:return s.fn.call(s.context,e,n),!0;case 4:return s.fn.call(s.context,e,n,o),!0;case 5:return s.fn.call(s.context,e,n,o,i),!0;case 6:return s.fn.call(s.context,e,n,o,i,a),!0}for(l=1,u=new Array(f-1);l<f;l++)u[l-1]=arguments[l];s.fn.apply(s.context,u)}else{var p,h=s.length;for(l=0;l<h;l++)switch(s[l].once&&this.removeListener(t,s[l].fn,void 0,!0),f){case 1:s[l].fn.call(s[l].context);break;case 2:s[l].fn.call(s[l].context,e);break;case 3:s[l].fn.call(s[l].context,e,n);break;case 4:s[l].fn.call(s[l].context,e,n,o);break;default:if(!u)for(p=1,u=new Array(f-1);p<f;p++)u[p-1]=arguments[p];s[l].fn.apply(s[l].context,u)}}return!0},c.prototype.on=function(t,e,r){return i(this,t,e,r,!1)},c.prototype.once=function(t,e,r){return i(this,t,e,r,!0)},c.prototype.removeListener=function(t,e,n,o){var i=r?r+t:t;if(!this._events[i])return this;if(!e)return a(this,i),this;var c=this._events[i];if(c.fn)c.fn!==e||o&&!c.once||n&&c.context!==n||a(this,i);else{for(var u=0,l=[],s=c.length;u<s;u++)(c[u].fn!==e||o&&!c[u].once||n&&c[u].context!==n)&&l.push(c[u]);l.length?this._events[i]=1===l.length?l[0]:l:a(this,i)}return this},c.prototype.removeAllListeners=function(t){var e;return t?(e=r?r+t:t,this._events[e]&&a(this,e)):(this._events=new n,this._eventsCount=0),this},c.prototype.off=c.prototype.removeListener,c.prototype.addListener=c.prototype.on,c.prefixed=r,c.EventEmitter=c,t.exports=c},270:(t,e,r)=>{var n=r(7068),o=r(346);t.exports=function t(e,r,i,a,c){return e===r||(null==e||null==r||!o(e)&&!o(r)?e!=e&&r!=r:n(e,r,i,a,t,c))}},289:(t,e,r)=>{var n=r(2651);t.exports=function(t){return n(this,t).get(t)}},294:t=>{t.exports=function(t){return"number"==typeof t&&t>-1&&t%1==0&&t<=9007199254740991}},317:t=>{t.exports=function(t){var e=-1,r=Array(t.size);return t.forEach((function(t,n){r[++e]=[n,t]})),r}},346:t=>{t.exports=function(t){return null!=t&&"object"==typeof t}},361:t=>{var e=/^(?:0|[1-9]\d*)$/;t.exports=function(t,r){var n=typeof t;return!!(r=null==r?9007199254740991:r)&&("number"==n||"symbol"!=n&&e.test(t))&&t>-1&&t%1==0&&t<r}},392:t=>{t.exports=function(t,e){return null==t?void 0:t[e]}},583:(t,e,r)=>{var n=r(7237),o=r(7255),i=r(8586),a=r(7797);t.exports=function(t){return i(t)?n(a(t)):o(t)}},631:(t,e,r)=>{var n=r(8077),o=r(9326);t.exports=function(t,e){return null!=t&&o(t,e,n)}},641:(t,e,r)=>{var n=r(6649),o=r(5950);t.exports=function(t,e){return t&&n(t,e,o)}},659:(t,e,r)=>{var n=r(1873),o=Object.prototype,i=o.hasOwnProperty,a=o.toString,c=n?n.toStringTag:void 0;t.exports=function(t){var e=i.call(t,c),r=t[c];try{t[c]=void 0;var n=!0}catch(t){}var o=a.call(t);return n&&(e?t[c]=r:delete t[c]),o}},689:(t,e,r)=>{var n=r(2),o=Object.prototype.hasOwnProperty;t.exports=function(t,e,r,i,a,c){var u=1&r,l=n(t),s=l.length;if(s!=n(e).length&&!u)return!1;for(var f=s;f--;){var p=l[f];if(!(u?p in e:o.call(e,p)))return!1}var h=c.get(t),d=c.get(e);if(h&&d)return h==e&&d==t;var y=!0;c.set(t,e),c.set(e,t);for(var v=u;++f<s;){var m=t[p=l[f]],b=e[p];if(i)var g=u?i(b,m,p,e,t,c):i(m,b,p,t,e,c);if(!(void 0===g?m===b||a(m,b,r,i,c):g)){y=!1;break}v||(v="constructor"==p)}if(y&&!v){var x=t.constructor,w=e.constructor;x==w||!("constructor"in t)||!("constructor"in e)||"function"==typeof x&&x instanceof x&&"function"==typeof w&&w instanceof w||(y=!1)}return c.delete(t),c.delete(e),y}},695:(t,e,r)=>{var n=r(8096),o=r(2428),i=r(6449),a=r(3656),c=r(361),u=r(7167),l=Object.prototype.hasOwnProperty;t.exports=function(t,e){var r=i(t),s=!r&&o(t),f=!r&&!s&&a(t),p=!r&&!s&&!f&&u(t),h=r||s||f||p,d=h?n(t.length,String):[],y=d.length;for(var v in t)!e&&!l.call(t,v)||h&&("length"==v||f&&("offset"==v||"parent"==v)||p&&("buffer"==v||"byteLength"==v||"byteOffset"==v)||c(v,y))||d.push(v);return d}},756:(t,e,r)=>{var n=r(3805);t.exports=function(t){return t==t&&!n(t)}},776:(t,e,r)=>{var n=r(756),o=r(5950);t.exports=function(t){for(var e=o(t),r=e.length;r--;){var i=e[r],a=t[i];e[r]=[i,a,n(a)]}return e}},909:(t,e,r)=>{var n=r(641),o=r(8329)(n);t.exports=o},916:(t,e,r)=>{var n=r(909);t.exports=function(t,e){var r;return n(t,(function(t,n,o){return!(r=e(t,n,o))})),!!r}},938:t=>{t.exports=function(t){var e=this.__data__,r=e.delete(t);return this.size=e.size,r}},945:(t,e,r)=>{var n=r(79),o=r(8223),i=r(3661);t.exports=function(t,e){var r=this.__data__;if(r instanceof n){var a=r.__data__;if(!o||a.length<199)return a.push([t,e]),this.size=++r.size,this;r=this.__data__=new i(a)}return r.set(t,e),this.size=r.size,this}},1033:t=>{t.exports=function(t,e,r){switch(r.length){case 0:return t.call(e);case 1:return t.call(e,r[0]);case 2:return t.call(e,r[0],r[1]);case 3:return t.call(e,r[0],r[1],r[2])}return t.apply(e,r)}},1042:(t,e,r)=>{var n=r(6110)(Object,"create");t.exports=n},1074:t=>{t.exports=function(t){return t.split("")}},1175:(t,e,r)=>{var n=r(6025);t.exports=function(t,e){var r=this.__data__,o=n(r,t);return o<0?(++this.size,r.push([t,e])):r[o][1]=e,this}},1331:(t,e,r)=>{var n=r(2552),o=r(8879),i=r(346),a=Function.prototype,c=Object.prototype,u=a.toString,l=c.hasOwnProperty,s=u.call(Object);t.exports=function(t){if(!i(t)||"[object Object]"!=n(t))return!1;var e=o(t);if(null===e)return!0;var r=l.call(e,"constructor")&&e.constructor;return"function"==typeof r&&r instanceof r&&u.call(r)==s}},1380:t=>{t.exports=function(t){return this.__data__.set(t,"__lodash_hash_undefined__"),this}},1420:(t,e,r)=>{var n=r(79);t.exports=function(){this.__data__=new n,this.size=0}},1459:t=>{t.exports=function(t){return this.__data__.has(t)}},1489:(t,e,r)=>{var n=r(7400);t.exports=function(t){var e=n(t),r=e%1;return e==e?r?e-r:e:0}},1549:(t,e,r)=>{var n=r(2032),o=r(3862),i=r(6721),a=r(2749),c=r(5749);function u(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}u.prototype.clear=n,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=c,t.exports=u},1684:(t,e,r)=>{var n=r(3599),o=r(6176),i=r(3488);t.exports=function(t){return t&&t.length?n(t,i,o):void 0}},1741:(t,e,r)=>{var n=r(8023);t.exports=function(t){return n(t)&&t!=+t}},1769:(t,e,r)=>{var n=r(6449),o=r(8586),i=r(1802),a=r(3222);t.exports=function(t,e){return n(t)?t:o(t,e)?[t]:i(a(t))}},1799:(t,e,r)=>{var n=r(7217),o=r(270);t.exports=function(t,e,r,i){var a=r.length,c=a,u=!i;if(null==t)return!c;for(t=Object(t);a--;){var l=r[a];if(u&&l[2]?l[1]!==t[l[0]]:!(l[0]in t))return!1}for(;++a<c;){var s=(l=r[a])[0],f=t[s],p=l[1];if(u&&l[2]){if(void 0===f&&!(s in t))return!1}else{var h=new n;if(i)var d=i(f,p,s,t,e,h);if(!(void 0===d?o(p,f,3,i,h):d))return!1}}return!0}},1800:t=>{var e=/\s/;t.exports=function(t){for(var r=t.length;r--&&e.test(t.charAt(r)););return r}},1802:(t,e,r)=>{var n=r(2224),o=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,i=/\\(\\)?/g,a=n((function(t){var e=[];return 46===t.charCodeAt(0)&&e.push(""),t.replace(o,(function(t,r,n,o){e.push(n?o.replace(i,"$1"):r||t)})),e}));t.exports=a},1811:t=>{var e=Date.now;t.exports=function(t){var r=0,n=0;return function(){var o=e(),i=16-(o-n);if(n=o,i>0){if(++r>=800)return arguments[0]}else r=0;return t.apply(void 0,arguments)}}},1873:(t,e,r)=>{var n=r(9325).Symbol;t.exports=n},1882:(t,e,r)=>{var n=r(2552),o=r(3805);t.exports=function(t){if(!o(t))return!1;var e=n(t);return"[object Function]"==e||"[object GeneratorFunction]"==e||"[object AsyncFunction]"==e||"[object Proxy]"==e}},1986:(t,e,r)=>{var n=r(1873),o=r(7828),i=r(5288),a=r(5911),c=r(317),u=r(4247),l=n?n.prototype:void 0,s=l?l.valueOf:void 0;t.exports=function(t,e,r,n,l,f,p){switch(r){case"[object DataView]":if(t.byteLength!=e.byteLength||t.byteOffset!=e.byteOffset)return!1;t=t.buffer,e=e.buffer;case"[object ArrayBuffer]":return!(t.byteLength!=e.byteLength||!f(new o(t),new o(e)));case"[object Boolean]":case"[object Date]":case"[object Number]":return i(+t,+e);case"[object Error]":return t.name==e.name&&t.message==e.message;case"[object RegExp]":case"[object String]":return t==e+"";case"[object Map]":var h=c;case"[object Set]":var d=1&n;if(h||(h=u),t.size!=e.size&&!d)return!1;var y=p.get(t);if(y)return y==e;n|=2,p.set(t,e);var v=a(h(t),h(e),n,l,f,p);return p.delete(t),v;case"[object Symbol]":if(s)return s.call(t)==s.call(e)}return!1}},2006:(t,e,r)=>{var n=r(5389),o=r(4894),i=r(5950);t.exports=function(t){return function(e,r,a){var c=Object(e);if(!o(e)){var u=n(r,3);e=i(e),r=function(t){return u(c[t],t,c)}}var l=t(e,r,a);return l>-1?c[u?e[l]:l]:void 0}}},2032:(t,e,r)=>{var n=r(1042);t.exports=function(){this.__data__=n?n(null):{},this.size=0}},2054:t=>{var e="\\ud800-\\udfff",r="["+e+"]",n="[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]",o="\\ud83c[\\udffb-\\udfff]",i="[^"+e+"]",a="(?:\\ud83c[\\udde6-\\uddff]){2}",c="[\\ud800-\\udbff][\\udc00-\\udfff]",u="(?:"+n+"|"+o+")?",l="[\\ufe0e\\ufe0f]?",s=l+u+"(?:\\u200d(?:"+[i,a,c].join("|")+")"+l+u+")*",f="(?:"+[i+n+"?",n,a,c,r].join("|")+")",p=RegExp(o+"(?="+o+")|"+f+s,"g");t.exports=function(t){return t.match(p)||[]}},2199:(t,e,r)=>{var n=r(4528),o=r(6449);t.exports=function(t,e,r){var i=e(t);return o(t)?i:n(i,r(t))}},2224:(t,e,r)=>{var n=r(104);t.exports=function(t){var e=n(t,(function(t){return 500===r.size&&r.clear(),t})),r=e.cache;return e}},2404:(t,e,r)=>{var n=r(270);t.exports=function(t,e){return n(t,e)}},2426:(t,e,r)=>{var n=r(4248),o=r(5389),i=r(916),a=r(6449),c=r(6800);t.exports=function(t,e,r){var u=a(t)?n:i;return r&&c(t,e,r)&&(e=void 0),u(t,o(e,3))}},2428:(t,e,r)=>{var n=r(7534),o=r(346),i=Object.prototype,a=i.hasOwnProperty,c=i.propertyIsEnumerable,u=n(function(){return arguments}())?n:function(t){return o(t)&&a.call(t,"callee")&&!c.call(t,"callee")};t.exports=u},2507:(t,e,r)=>{var n=r(8754),o=r(9698),i=r(3912),a=r(3222);t.exports=function(t){return function(e){e=a(e);var r=o(e)?i(e):void 0,c=r?r[0]:e.charAt(0),u=r?n(r,1).join(""):e.slice(1);return c[t]()+u}}},2523:t=>{t.exports=function(t,e,r,n){for(var o=t.length,i=r+(n?1:-1);n?i--:++i<o;)if(e(t[i],i,t))return i;return-1}},2552:(t,e,r)=>{var n=r(1873),o=r(659),i=r(9350),a=n?n.toStringTag:void 0;t.exports=function(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":a&&a in Object(t)?o(t):i(t)}},2651:(t,e,r)=>{var n=r(4218);t.exports=function(t,e){var r=t.__data__;return n(e)?r["string"==typeof e?"string":"hash"]:r.map}},2694:(t,e,r)=>{"use strict";var n=r(6925);function o(){}function i(){}i.resetWarningCache=o,t.exports=function(){function t(t,e,r,o,i,a){if(a!==n){var c=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw c.name="Invariant Violation",c}}function e(){return t}t.isRequired=t;var r={array:t,bigint:t,bool:t,func:t,number:t,object:t,string:t,symbol:t,any:t,arrayOf:e,element:t,elementType:t,instanceOf:e,node:t,objectOf:e,oneOf:e,oneOfType:e,shape:e,exact:e,checkPropTypes:i,resetWarningCache:o};return r.PropTypes=r,r}},2749:(t,e,r)=>{var n=r(1042),o=Object.prototype.hasOwnProperty;t.exports=function(t){var e=this.__data__;return n?void 0!==e[t]:o.call(e,t)}},2799:(t,e)=>{"use strict";var r=Symbol.for("react.element"),n=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),i=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),c=Symbol.for("react.provider"),u=Symbol.for("react.context"),l=Symbol.for("react.server_context"),s=Symbol.for("react.forward_ref"),f=Symbol.for("react.suspense"),p=Symbol.for("react.suspense_list"),h=Symbol.for("react.memo"),d=Symbol.for("react.lazy");Symbol.for("react.offscreen");Symbol.for("react.module.reference"),e.isFragment=function(t){return function(t){if("object"==typeof t&&null!==t){var e=t.$$typeof;switch(e){case r:switch(t=t.type){case o:case a:case i:case f:case p:return t;default:switch(t=t&&t.$$typeof){case l:case u:case s:case d:case h:case c:return t;default:return e}}case n:return e}}}(t)===o}},2804:(t,e,r)=>{var n=r(6110)(r(9325),"Promise");t.exports=n},2865:(t,e,r)=>{var n=r(9570),o=r(1811)(n);t.exports=o},2949:(t,e,r)=>{var n=r(2651);t.exports=function(t,e){var r=n(this,t),o=r.size;return r.set(t,e),this.size+=r.size==o?0:1,this}},3031:(t,e,r)=>{var n=r(3120),o=r(6155),i=r(9302),a=r(6800),c=i((function(t,e){if(null==t)return[];var r=e.length;return r>1&&a(t,e[0],e[1])?e=[]:r>2&&a(e[0],e[1],e[2])&&(e=[e[0]]),o(t,n(e,1),[])}));t.exports=c},3040:(t,e,r)=>{var n=r(1549),o=r(79),i=r(8223);t.exports=function(){this.size=0,this.__data__={hash:new n,map:new(i||o),string:new n}}},3120:(t,e,r)=>{var n=r(4528),o=r(5891);t.exports=function t(e,r,i,a,c){var u=-1,l=e.length;for(i||(i=o),c||(c=[]);++u<l;){var s=e[u];r>0&&i(s)?r>1?t(s,r-1,i,a,c):n(c,s):a||(c[c.length]=s)}return c}},3181:(t,e,r)=>{var n=r(5508)();t.exports=n},3221:t=>{t.exports=function(t){return function(e,r,n){for(var o=-1,i=Object(e),a=n(e),c=a.length;c--;){var u=a[t?c:++o];if(!1===r(i[u],u,i))break}return e}}},3222:(t,e,r)=>{var n=r(7556);t.exports=function(t){return null==t?"":n(t)}},3243:(t,e,r)=>{var n=r(6110),o=function(){try{var t=n(Object,"defineProperty");return t({},"",{}),t}catch(t){}}();t.exports=o},3335:t=>{t.exports=function(t,e){return t>e}},3345:t=>{t.exports=function(){return[]}},3360:(t,e,r)=>{var n=r(3243);t.exports=function(t,e,r){"__proto__"==e&&n?n(t,e,{configurable:!0,enumerable:!0,value:r,writable:!0}):t[e]=r}},3488:t=>{t.exports=function(t){return t}},3599:(t,e,r)=>{var n=r(4394);t.exports=function(t,e,r){for(var o=-1,i=t.length;++o<i;){var a=t[o],c=e(a);if(null!=c&&(void 0===u?c==c&&!n(c):r(c,u)))var u=c,l=a}return l}},3605:t=>{t.exports=function(t){return this.__data__.get(t)}},3650:(t,e,r)=>{var n=r(4335)(Object.keys,Object);t.exports=n},3656:(t,e,r)=>{t=r.nmd(t);var n=r(9325),o=r(9935),i=e&&!e.nodeType&&e,a=i&&t&&!t.nodeType&&t,c=a&&a.exports===i?n.Buffer:void 0,u=(c?c.isBuffer:void 0)||o;t.exports=u},3661:(t,e,r)=>{var n=r(3040),o=r(7670),i=r(289),a=r(4509),c=r(2949);function u(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}u.prototype.clear=n,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=c,t.exports=u},3663:(t,e,r)=>{var n=r(1799),o=r(776),i=r(7197);t.exports=function(t){var e=o(t);return 1==e.length&&e[0][2]?i(e[0][0],e[0][1]):function(r){return r===t||n(r,t,e)}}},3702:t=>{t.exports=function(){this.__data__=[],this.size=0}},3714:(t,e,r)=>{var n=r(3730);t.exports=function(t,e,r){for(var o=-1,i=t.criteria,a=e.criteria,c=i.length,u=r.length;++o<c;){var l=n(i[o],a[o]);if(l)return o>=u?l:l*("desc"==r[o]?-1:1)}return t.index-e.index}},3730:(t,e,r)=>{var n=r(4394);t.exports=function(t,e){if(t!==e){var r=void 0!==t,o=null===t,i=t==t,a=n(t),c=void 0!==e,u=null===e,l=e==e,s=n(e);if(!u&&!s&&!a&&t>e||a&&c&&l&&!u&&!s||o&&c&&l||!r&&l||!i)return 1;if(!o&&!a&&!s&&t<e||s&&r&&i&&!o&&!a||u&&r&&i||!c&&i||!l)return-1}return 0}},3777:(t,e,r)=>{var n=r(909);t.exports=function(t,e){var r=!0;return n(t,(function(t,n,o){return r=!!e(t,n,o)})),r}},3805:t=>{t.exports=function(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}},3812:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return!0===t||!1===t||o(t)&&"[object Boolean]"==n(t)}},3862:t=>{t.exports=function(t){var e=this.has(t)&&delete this.__data__[t];return this.size-=e?1:0,e}},3912:(t,e,r)=>{var n=r(1074),o=r(9698),i=r(2054);t.exports=function(t){return o(t)?i(t):n(t)}},3916:(t,e,r)=>{var n=r(3360),o=r(641),i=r(5389);t.exports=function(t,e){var r={};return e=i(e,3),o(t,(function(t,o,i){n(r,o,e(t,o,i))})),r}},3937:t=>{t.exports=function(t,e){var r=t.length;for(t.sort(e);r--;)t[r]=t[r].value;return t}},3950:t=>{t.exports=function(){}},4128:(t,e,r)=>{var n=r(1800),o=/^\s+/;t.exports=function(t){return t?t.slice(0,n(t)+1).replace(o,""):t}},4218:t=>{t.exports=function(t){var e=typeof t;return"string"==e||"number"==e||"symbol"==e||"boolean"==e?"__proto__"!==t:null===t}},4247:t=>{t.exports=function(t){var e=-1,r=Array(t.size);return t.forEach((function(t){r[++e]=t})),r}},4248:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length;++r<n;)if(e(t[r],r,t))return!0;return!1}},4335:t=>{t.exports=function(t,e){return function(r){return t(e(r))}}},4363:(t,e,r)=>{"use strict";t.exports=r(2799)},4394:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return"symbol"==typeof t||o(t)&&"[object Symbol]"==n(t)}},4506:(t,e,r)=>{var n=r(3599),o=r(3335),i=r(3488);t.exports=function(t){return t&&t.length?n(t,i,o):void 0}},4509:(t,e,r)=>{var n=r(2651);t.exports=function(t){return n(this,t).has(t)}},4517:(t,e,r)=>{var n=r(6545),o=r(3950),i=r(4247),a=n&&1/i(new n([,-0]))[1]==1/0?function(t){return new n(t)}:o;t.exports=a},4528:t=>{t.exports=function(t,e){for(var r=-1,n=e.length,o=t.length;++r<n;)t[o+r]=e[r];return t}},4664:(t,e,r)=>{var n=r(9770),o=r(3345),i=Object.prototype.propertyIsEnumerable,a=Object.getOwnPropertySymbols,c=a?function(t){return null==t?[]:(t=Object(t),n(a(t),(function(e){return i.call(t,e)})))}:o;t.exports=c},4713:(t,e,r)=>{var n=r(2523),o=r(5389),i=r(1489),a=Math.max;t.exports=function(t,e,r){var c=null==t?0:t.length;if(!c)return-1;var u=null==r?0:i(r);return u<0&&(u=a(c+u,0)),n(t,o(e,3),u)}},4739:(t,e,r)=>{var n=r(6025);t.exports=function(t){var e=this.__data__,r=n(e,t);return r<0?void 0:e[r][1]}},4840:(t,e,r)=>{var n="object"==typeof r.g&&r.g&&r.g.Object===Object&&r.g;t.exports=n},4894:(t,e,r)=>{var n=r(1882),o=r(294);t.exports=function(t){return null!=t&&o(t.length)&&!n(t)}},4901:(t,e,r)=>{var n=r(2552),o=r(294),i=r(346),a={};a["[object Float32Array]"]=a["[object Float64Array]"]=a["[object Int8Array]"]=a["[object Int16Array]"]=a["[object Int32Array]"]=a["[object Uint8Array]"]=a["[object Uint8ClampedArray]"]=a["[object Uint16Array]"]=a["[object Uint32Array]"]=!0,a["[object Arguments]"]=a["[object Array]"]=a["[object ArrayBuffer]"]=a["[object Boolean]"]=a["[object DataView]"]=a["[object Date]"]=a["[object Error]"]=a["[object Function]"]=a["[object Map]"]=a["[object Number]"]=a["[object Object]"]=a["[object RegExp]"]=a["[object Set]"]=a["[object String]"]=a["[object WeakMap]"]=!1,t.exports=function(t){return i(t)&&o(t.length)&&!!a[n(t)]}},4932:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length,o=Array(n);++r<n;)o[r]=e(t[r],r,t);return o}},5015:(t,e,r)=>{var n=r(2552),o=r(6449),i=r(346);t.exports=function(t){return"string"==typeof t||!o(t)&&i(t)&&"[object String]"==n(t)}},5083:(t,e,r)=>{var n=r(1882),o=r(7296),i=r(3805),a=r(7473),c=/^\[object .+?Constructor\]$/,u=Function.prototype,l=Object.prototype,s=u.toString,f=l.hasOwnProperty,p=RegExp("^"+s.call(f).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");t.exports=function(t){return!(!i(t)||o(t))&&(n(t)?p:c).test(a(t))}},5128:(t,e,r)=>{var n=r(909),o=r(4894);t.exports=function(t,e){var r=-1,i=o(t)?Array(t.length):[];return n(t,(function(t,n,o){i[++r]=e(t,n,o)})),i}},5160:t=>{t.exports=function(t,e,r){var n=-1,o=t.length;e<0&&(e=-e>o?0:o+e),(r=r>o?o:r)<0&&(r+=o),o=e>r?0:r-e>>>0,e>>>=0;for(var i=Array(o);++n<o;)i[n]=t[n+e];return i}},5288:t=>{t.exports=function(t,e){return t===e||t!=t&&e!=e}},5325:(t,e,r)=>{var n=r(6131);t.exports=function(t,e){return!(null==t||!t.length)&&n(t,e,0)>-1}},5378:(t,e,r)=>{var n=r(4932),o=r(5389),i=r(5128),a=r(6449);t.exports=function(t,e){return(a(t)?n:i)(t,o(e,3))}},5389:(t,e,r)=>{var n=r(3663),o=r(7978),i=r(3488),a=r(6449),c=r(583);t.exports=function(t){return"function"==typeof t?t:null==t?i:"object"==typeof t?a(t)?o(t[0],t[1]):n(t):c(t)}},5463:t=>{t.exports=function(t){return t!=t}},5481:(t,e,r)=>{var n=r(9325)["__core-js_shared__"];t.exports=n},5508:(t,e,r)=>{var n=r(6151),o=r(6800),i=r(7400);t.exports=function(t){return function(e,r,a){return a&&"number"!=typeof a&&o(e,r,a)&&(r=a=void 0),e=i(e),void 0===r?(r=e,e=0):r=i(r),a=void 0===a?e<r?1:-1:i(a),n(e,r,a,t)}}},5527:t=>{var e=Object.prototype;t.exports=function(t){var r=t&&t.constructor;return t===("function"==typeof r&&r.prototype||e)}},5556:(t,e,r)=>{t.exports=r(2694)()},5580:(t,e,r)=>{var n=r(6110)(r(9325),"DataView");t.exports=n},5749:(t,e,r)=>{var n=r(1042);t.exports=function(t,e){var r=this.__data__;return this.size+=this.has(t)?0:1,r[t]=n&&void 0===e?"__lodash_hash_undefined__":e,this}},5765:(t,e,r)=>{var n=r(8859),o=r(5325),i=r(9905),a=r(9219),c=r(4517),u=r(4247);t.exports=function(t,e,r){var l=-1,s=o,f=t.length,p=!0,h=[],d=h;if(r)p=!1,s=i;else if(f>=200){var y=e?null:c(t);if(y)return u(y);p=!1,s=a,d=new n}else d=e?[]:h;t:for(;++l<f;){var v=t[l],m=e?e(v):v;if(v=r||0!==v?v:0,p&&m==m){for(var b=d.length;b--;)if(d[b]===m)continue t;e&&d.push(m),h.push(v)}else s(d,m,r)||(d!==h&&d.push(m),h.push(v))}return h}},5808:(t,e,r)=>{var n=r(2507)("toUpperCase");t.exports=n},5861:(t,e,r)=>{var n=r(5580),o=r(8223),i=r(2804),a=r(6545),c=r(8303),u=r(2552),l=r(7473),s="[object Map]",f="[object Promise]",p="[object Set]",h="[object WeakMap]",d="[object DataView]",y=l(n),v=l(o),m=l(i),b=l(a),g=l(c),x=u;(n&&x(new n(new ArrayBuffer(1)))!=d||o&&x(new o)!=s||i&&x(i.resolve())!=f||a&&x(new a)!=p||c&&x(new c)!=h)&&(x=function(t){var e=u(t),r="[object Object]"==e?t.constructor:void 0,n=r?l(r):"";if(n)switch(n){case y:return d;case v:return s;case m:return f;case b:return p;case g:return h}return e}),t.exports=x},5891:(t,e,r)=>{var n=r(1873),o=r(2428),i=r(6449),a=n?n.isConcatSpreadable:void 0;t.exports=function(t){return i(t)||o(t)||!!(a&&t&&t[a])}},5911:(t,e,r)=>{var n=r(8859),o=r(4248),i=r(9219);t.exports=function(t,e,r,a,c,u){var l=1&r,s=t.length,f=e.length;if(s!=f&&!(l&&f>s))return!1;var p=u.get(t),h=u.get(e);if(p&&h)return p==e&&h==t;var d=-1,y=!0,v=2&r?new n:void 0;for(u.set(t,e),u.set(e,t);++d<s;){var m=t[d],b=e[d];if(a)var g=l?a(b,m,d,e,t,u):a(m,b,d,t,e,u);if(void 0!==g){if(g)continue;y=!1;break}if(v){if(!o(e,(function(t,e){if(!i(v,e)&&(m===t||c(m,t,r,a,u)))return v.push(e)}))){y=!1;break}}else if(m!==b&&!c(m,b,r,a,u)){y=!1;break}}return u.delete(t),u.delete(e),y}},5950:(t,e,r)=>{var n=r(695),o=r(8984),i=r(4894);t.exports=function(t){return i(t)?n(t):o(t)}},6009:(t,e,r)=>{t=r.nmd(t);var n=r(4840),o=e&&!e.nodeType&&e,i=o&&t&&!t.nodeType&&t,a=i&&i.exports===o&&n.process,c=function(){try{return i&&i.require&&i.require("util").types||a&&a.binding&&a.binding("util")}catch(t){}}();t.exports=c},6025:(t,e,r)=>{var n=r(5288);t.exports=function(t,e){for(var r=t.length;r--;)if(n(t[r][0],e))return r;return-1}},6110:(t,e,r)=>{var n=r(5083),o=r(392);t.exports=function(t,e){var r=o(t,e);return n(r)?r:void 0}},6131:(t,e,r)=>{var n=r(2523),o=r(5463),i=r(6959);t.exports=function(t,e,r){return e==e?i(t,e,r):n(t,o,r)}},6151:t=>{var e=Math.ceil,r=Math.max;t.exports=function(t,n,o,i){for(var a=-1,c=r(e((n-t)/(o||1)),0),u=Array(c);c--;)u[i?c:++a]=t,t+=o;return u}},6155:(t,e,r)=>{var n=r(4932),o=r(7422),i=r(5389),a=r(5128),c=r(3937),u=r(7301),l=r(3714),s=r(3488),f=r(6449);t.exports=function(t,e,r){e=e.length?n(e,(function(t){return f(t)?function(e){return o(e,1===t.length?t[0]:t)}:t})):[s];var p=-1;e=n(e,u(i));var h=a(t,(function(t,r,o){return{criteria:n(e,(function(e){return e(t)})),index:++p,value:t}}));return c(h,(function(t,e){return l(t,e,r)}))}},6176:t=>{t.exports=function(t,e){return t<e}},6449:t=>{var e=Array.isArray;t.exports=e},6545:(t,e,r)=>{var n=r(6110)(r(9325),"Set");t.exports=n},6649:(t,e,r)=>{var n=r(3221)();t.exports=n},6721:(t,e,r)=>{var n=r(1042),o=Object.prototype.hasOwnProperty;t.exports=function(t){var e=this.__data__;if(n){var r=e[t];return"__lodash_hash_undefined__"===r?void 0:r}return o.call(e,t)?e[t]:void 0}},6757:(t,e,r)=>{var n=r(1033),o=Math.max;t.exports=function(t,e,r){return e=o(void 0===e?t.length-1:e,0),function(){for(var i=arguments,a=-1,c=o(i.length-e,0),u=Array(c);++a<c;)u[a]=i[e+a];a=-1;for(var l=Array(e+1);++a<e;)l[a]=i[a];return l[e]=r(u),n(t,this,l)}}},6800:(t,e,r)=>{var n=r(5288),o=r(4894),i=r(361),a=r(3805);t.exports=function(t,e,r){if(!a(r))return!1;var c=typeof e;return!!("number"==c?o(r)&&i(e,r.length):"string"==c&&e in r)&&n(r[e],t)}},6925:t=>{"use strict";t.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},6959:t=>{t.exports=function(t,e,r){for(var n=r-1,o=t.length;++n<o;)if(t[n]===e)return n;return-1}},7068:(t,e,r)=>{var n=r(7217),o=r(5911),i=r(1986),a=r(689),c=r(5861),u=r(6449),l=r(3656),s=r(7167),f="[object Arguments]",p="[object Array]",h="[object Object]",d=Object.prototype.hasOwnProperty;t.exports=function(t,e,r,y,v,m){var b=u(t),g=u(e),x=b?p:c(t),w=g?p:c(e),O=(x=x==f?h:x)==h,j=(w=w==f?h:w)==h,S=x==w;if(S&&l(t)){if(!l(e))return!1;b=!0,O=!1}if(S&&!O)return m||(m=new n),b||s(t)?o(t,e,r,y,v,m):i(t,e,x,r,y,v,m);if(!(1&r)){var P=O&&d.call(t,"__wrapped__"),E=j&&d.call(e,"__wrapped__");if(P||E){var A=P?t.value():t,k=E?e.value():e;return m||(m=new n),v(A,k,r,y,m)}}return!!S&&(m||(m=new n),a(t,e,r,y,v,m))}},7167:(t,e,r)=>{var n=r(4901),o=r(7301),i=r(6009),a=i&&i.isTypedArray,c=a?o(a):n;t.exports=c},7197:t=>{t.exports=function(t,e){return function(r){return null!=r&&r[t]===e&&(void 0!==e||t in Object(r))}}},7217:(t,e,r)=>{var n=r(79),o=r(1420),i=r(938),a=r(3605),c=r(9817),u=r(945);function l(t){var e=this.__data__=new n(t);this.size=e.size}l.prototype.clear=o,l.prototype.delete=i,l.prototype.get=a,l.prototype.has=c,l.prototype.set=u,t.exports=l},7237:t=>{t.exports=function(t){return function(e){return null==e?void 0:e[t]}}},7255:(t,e,r)=>{var n=r(7422);t.exports=function(t){return function(e){return n(e,t)}}},7277:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length;++r<n;)if(!e(t[r],r,t))return!1;return!0}},7296:(t,e,r)=>{var n,o=r(5481),i=(n=/[^.]+$/.exec(o&&o.keys&&o.keys.IE_PROTO||""))?"Symbol(src)_1."+n:"";t.exports=function(t){return!!i&&i in t}},7301:t=>{t.exports=function(t){return function(e){return t(e)}}},7307:(t,e,r)=>{var n=r(3120),o=r(5378);t.exports=function(t,e){return n(o(t,e),1)}},7309:(t,e,r)=>{var n=r(2006)(r(4713));t.exports=n},7334:t=>{t.exports=function(t){return function(){return t}}},7350:(t,e,r)=>{var n=r(8221),o=r(3805);t.exports=function(t,e,r){var i=!0,a=!0;if("function"!=typeof t)throw new TypeError("Expected a function");return o(r)&&(i="leading"in r?!!r.leading:i,a="trailing"in r?!!r.trailing:a),n(t,e,{leading:i,maxWait:e,trailing:a})}},7400:(t,e,r)=>{var n=r(9374),o=1/0;t.exports=function(t){return t?(t=n(t))===o||t===-1/0?17976931348623157e292*(t<0?-1:1):t==t?t:0:0===t?t:0}},7422:(t,e,r)=>{var n=r(1769),o=r(7797);t.exports=function(t,e){for(var r=0,i=(e=n(e,t)).length;null!=t&&r<i;)t=t[o(e[r++])];return r&&r==i?t:void 0}},7473:t=>{var e=Function.prototype.toString;t.exports=function(t){if(null!=t){try{return e.call(t)}catch(t){}try{return t+""}catch(t){}}return""}},7534:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return o(t)&&"[object Arguments]"==n(t)}},7556:(t,e,r)=>{var n=r(1873),o=r(4932),i=r(6449),a=r(4394),c=n?n.prototype:void 0,u=c?c.toString:void 0;t.exports=function t(e){if("string"==typeof e)return e;if(i(e))return o(e,t)+"";if(a(e))return u?u.call(e):"";var r=e+"";return"0"==r&&1/e==-1/0?"-0":r}},7670:(t,e,r)=>{var n=r(2651);t.exports=function(t){var e=n(this,t).delete(t);return this.size-=e?1:0,e}},7797:(t,e,r)=>{var n=r(4394);t.exports=function(t){if("string"==typeof t||n(t))return t;var e=t+"";return"0"==e&&1/t==-1/0?"-0":e}},7828:(t,e,r)=>{var n=r(9325).Uint8Array;t.exports=n},7978:(t,e,r)=>{var n=r(270),o=r(8156),i=r(631),a=r(8586),c=r(756),u=r(7197),l=r(7797);t.exports=function(t,e){return a(t)&&c(e)?u(l(t),e):function(r){var a=o(r,t);return void 0===a&&a===e?i(r,t):n(e,a,3)}}},8023:(t,e,r)=>{var n=r(2552),o=r(346);t.exports=function(t){return"number"==typeof t||o(t)&&"[object Number]"==n(t)}},8077:t=>{t.exports=function(t,e){return null!=t&&e in Object(t)}},8090:t=>{t.exports=function(t){var e=null==t?0:t.length;return e?t[e-1]:void 0}},8096:t=>{t.exports=function(t,e){for(var r=-1,n=Array(t);++r<t;)n[r]=e(r);return n}},8156:(t,e,r)=>{var n=r(7422);t.exports=function(t,e,r){var o=null==t?void 0:n(t,e);return void 0===o?r:o}},8221:(t,e,r)=>{var n=r(3805),o=r(124),i=r(9374),a=Math.max,c=Math.min;t.exports=function(t,e,r){var u,l,s,f,p,h,d=0,y=!1,v=!1,m=!0;if("function"!=typeof t)throw new TypeError("Expected a function");function b(e){var r=u,n=l;return u=l=void 0,d=e,f=t.apply(n,r)}function g(t){var r=t-h;return void 0===h||r>=e||r<0||v&&t-d>=s}function x(){var t=o();if(g(t))return w(t);p=setTimeout(x,function(t){var r=e-(t-h);return v?c(r,s-(t-d)):r}(t))}function w(t){return p=void 0,m&&u?b(t):(u=l=void 0,f)}function O(){var t=o(),r=g(t);if(u=arguments,l=this,h=t,r){if(void 0===p)return function(t){return d=t,p=setTimeout(x,e),y?b(t):f}(h);if(v)return clearTimeout(p),p=setTimeout(x,e),b(h)}return void 0===p&&(p=setTimeout(x,e)),f}return e=i(e)||0,n(r)&&(y=!!r.leading,s=(v="maxWait"in r)?a(i(r.maxWait)||0,e):s,m="trailing"in r?!!r.trailing:m),O.cancel=function(){void 0!==p&&clearTimeout(p),d=0,u=h=l=p=void 0},O.flush=function(){return void 0===p?f:w(o())},O}},8223:(t,e,r)=>{var n=r(6110)(r(9325),"Map");t.exports=n},8303:(t,e,r)=>{var n=r(6110)(r(9325),"WeakMap");t.exports=n},8329:(t,e,r)=>{var n=r(4894);t.exports=function(t,e){return function(r,o){if(null==r)return r;if(!n(r))return t(r,o);for(var i=r.length,a=e?i:-1,c=Object(r);(e?a--:++a<i)&&!1!==o(c[a],a,c););return r}}},8351:function(t,e,r){var n;!function(){"use strict";var o,i=1e9,a={precision:20,rounding:4,toExpNeg:-7,toExpPos:21,LN10:"2.302585092994045684017991454684364207601101488628772976033327900967572609677352480235997205089598298341967784042286"},c=!0,u="[DecimalError] ",l=u+"Invalid argument: ",s=u+"Exponent out of range: ",f=Math.floor,p=Math.pow,h=/^(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i,d=1e7,y=f(1286742750677284.5),v={};function m(t,e){var r,n,o,i,a,u,l,s,f=t.constructor,p=f.precision;if(!t.s||!e.s)return e.s||(e=new f(t)),c?A(e,p):e;if(l=t.d,s=e.d,a=t.e,o=e.e,l=l.slice(),i=a-o){for(i<0?(n=l,i=-i,u=s.length):(n=s,o=a,u=l.length),i>(u=(a=Math.ceil(p/7))>u?a+1:u+1)&&(i=u,n.length=1),n.reverse();i--;)n.push(0);n.reverse()}for((u=l.length)-(i=s.length)<0&&(i=u,n=s,s=l,l=n),r=0;i;)r=(l[--i]=l[i]+s[i]+r)/d|0,l[i]%=d;for(r&&(l.unshift(r),++o),u=l.length;0==l[--u];)l.pop();return e.d=l,e.e=o,c?A(e,p):e}function b(t,e,r){if(t!==~~t||t<e||t>r)throw Error(l+t)}function g(t){var e,r,n,o=t.length-1,i="",a=t[0];if(o>0){for(i+=a,e=1;e<o;e++)(r=7-(n=t[e]+"").length)&&(i+=S(r)),i+=n;(r=7-(n=(a=t[e])+"").length)&&(i+=S(r))}else if(0===a)return"0";for(;a%10==0;)a/=10;return i+a}v.absoluteValue=v.abs=function(){var t=new this.constructor(this);return t.s&&(t.s=1),t},v.comparedTo=v.cmp=function(t){var e,r,n,o,i=this;if(t=new i.constructor(t),i.s!==t.s)return i.s||-t.s;if(i.e!==t.e)return i.e>t.e^i.s<0?1:-1;for(e=0,r=(n=i.d.length)<(o=t.d.length)?n:o;e<r;++e)if(i.d[e]!==t.d[e])return i.d[e]>t.d[e]^i.s<0?1:-1;return n===o?0:n>o^i.s<0?1:-1},v.decimalPlaces=v.dp=function(){var t=this,e=t.d.length-1,r=7*(e-t.e);if(e=t.d[e])for(;e%10==0;e/=10)r--;return r<0?0:r},v.dividedBy=v.div=function(t){return x(this,new this.constructor(t))},v.dividedToIntegerBy=v.idiv=function(t){var e=this.constructor;return A(x(this,new e(t),0,1),e.precision)},v.equals=v.eq=function(t){return!this.cmp(t)},v.exponent=function(){return O(this)},v.greaterThan=v.gt=function(t){return this.cmp(t)>0},v.greaterThanOrEqualTo=v.gte=function(t){return this.cmp(t)>=0},v.isInteger=v.isint=function(){return this.e>this.d.length-2},v.isNegative=v.isneg=function(){return this.s<0},v.isPositive=v.ispos=function(){return this.s>0},v.isZero=function(){return 0===this.s},v.lessThan=v.lt=function(t){return this.cmp(t)<0},v.lessThanOrEqualTo=v.lte=function(t){return this.cmp(t)<1},v.logarithm=v.log=function(t){var e,r=this,n=r.constructor,i=n.precision,a=i+5;if(void 0===t)t=new n(10);else if((t=new n(t)).s<1||t.eq(o))throw Error(u+"NaN");if(r.s<1)throw Error(u+(r.s?"NaN":"-Infinity"));return r.eq(o)?new n(0):(c=!1,e=x(P(r,a),P(t,a),a),c=!0,A(e,i))},v.minus=v.sub=function(t){var e=this;return t=new e.constructor(t),e.s==t.s?k(e,t):m(e,(t.s=-t.s,t))},v.modulo=v.mod=function(t){var e,r=this,n=r.constructor,o=n.precision;if(!(t=new n(t)).s)throw Error(u+"NaN");return r.s?(c=!1,e=x(r,t,0,1).times(t),c=!0,r.minus(e)):A(new n(r),o)},v.naturalExponential=v.exp=function(){return w(this)},v.naturalLogarithm=v.ln=function(){return P(this)},v.negated=v.neg=function(){var t=new this.constructor(this);return t.s=-t.s||0,t},v.plus=v.add=function(t){var e=this;return t=new e.constructor(t),e.s==t.s?m(e,t):k(e,(t.s=-t.s,t))},v.precision=v.sd=function(t){var e,r,n,o=this;if(void 0!==t&&t!==!!t&&1!==t&&0!==t)throw Error(l+t);if(e=O(o)+1,r=7*(n=o.d.length-1)+1,n=o.d[n]){for(;n%10==0;n/=10)r--;for(n=o.d[0];n>=10;n/=10)r++}return t&&e>r?e:r},v.squareRoot=v.sqrt=function(){var t,e,r,n,o,i,a,l=this,s=l.constructor;if(l.s<1){if(!l.s)return new s(0);throw Error(u+"NaN")}for(t=O(l),c=!1,0==(o=Math.sqrt(+l))||o==1/0?(((e=g(l.d)).length+t)%2==0&&(e+="0"),o=Math.sqrt(e),t=f((t+1)/2)-(t<0||t%2),n=new s(e=o==1/0?"5e"+t:(e=o.toExponential()).slice(0,e.indexOf("e")+1)+t)):n=new s(o.toString()),o=a=(r=s.precision)+3;;)if(n=(i=n).plus(x(l,i,a+2)).times(.5),g(i.d).slice(0,a)===(e=g(n.d)).slice(0,a)){if(e=e.slice(a-3,a+1),o==a&&"4999"==e){if(A(i,r+1,0),i.times(i).eq(l)){n=i;break}}else if("9999"!=e)break;a+=4}return c=!0,A(n,r)},v.times=v.mul=function(t){var e,r,n,o,i,a,u,l,s,f=this,p=f.constructor,h=f.d,y=(t=new p(t)).d;if(!f.s||!t.s)return new p(0);for(t.s*=f.s,r=f.e+t.e,(l=h.length)<(s=y.length)&&(i=h,h=y,y=i,a=l,l=s,s=a),i=[],n=a=l+s;n--;)i.push(0);for(n=s;--n>=0;){for(e=0,o=l+n;o>n;)u=i[o]+y[n]*h[o-n-1]+e,i[o--]=u%d|0,e=u/d|0;i[o]=(i[o]+e)%d|0}for(;!i[--a];)i.pop();return e?++r:i.shift(),t.d=i,t.e=r,c?A(t,p.precision):t},v.toDecimalPlaces=v.todp=function(t,e){var r=this,n=r.constructor;return r=new n(r),void 0===t?r:(b(t,0,i),void 0===e?e=n.rounding:b(e,0,8),A(r,t+O(r)+1,e))},v.toExponential=function(t,e){var r,n=this,o=n.constructor;return void 0===t?r=_(n,!0):(b(t,0,i),void 0===e?e=o.rounding:b(e,0,8),r=_(n=A(new o(n),t+1,e),!0,t+1)),r},v.toFixed=function(t,e){var r,n,o=this,a=o.constructor;return void 0===t?_(o):(b(t,0,i),void 0===e?e=a.rounding:b(e,0,8),r=_((n=A(new a(o),t+O(o)+1,e)).abs(),!1,t+O(n)+1),o.isneg()&&!o.isZero()?"-"+r:r)},v.toInteger=v.toint=function(){var t=this,e=t.constructor;return A(new e(t),O(t)+1,e.rounding)},v.toNumber=function(){return+this},v.toPower=v.pow=function(t){var e,r,n,i,a,l,s=this,p=s.constructor,h=+(t=new p(t));if(!t.s)return new p(o);if(!(s=new p(s)).s){if(t.s<1)throw Error(u+"Infinity");return s}if(s.eq(o))return s;if(n=p.precision,t.eq(o))return A(s,n);if(l=(e=t.e)>=(r=t.d.length-1),a=s.s,l){if((r=h<0?-h:h)<=9007199254740991){for(i=new p(o),e=Math.ceil(n/7+4),c=!1;r%2&&M((i=i.times(s)).d,e),0!==(r=f(r/2));)M((s=s.times(s)).d,e);return c=!0,t.s<0?new p(o).div(i):A(i,n)}}else if(a<0)throw Error(u+"NaN");return a=a<0&&1&t.d[Math.max(e,r)]?-1:1,s.s=1,c=!1,i=t.times(P(s,n+12)),c=!0,(i=w(i)).s=a,i},v.toPrecision=function(t,e){var r,n,o=this,a=o.constructor;return void 0===t?n=_(o,(r=O(o))<=a.toExpNeg||r>=a.toExpPos):(b(t,1,i),void 0===e?e=a.rounding:b(e,0,8),n=_(o=A(new a(o),t,e),t<=(r=O(o))||r<=a.toExpNeg,t)),n},v.toSignificantDigits=v.tosd=function(t,e){var r=this.constructor;return void 0===t?(t=r.precision,e=r.rounding):(b(t,1,i),void 0===e?e=r.rounding:b(e,0,8)),A(new r(this),t,e)},v.toString=v.valueOf=v.val=v.toJSON=function(){var t=this,e=O(t),r=t.constructor;return _(t,e<=r.toExpNeg||e>=r.toExpPos)};var x=function(){function t(t,e){var r,n=0,o=t.length;for(t=t.slice();o--;)r=t[o]*e+n,t[o]=r%d|0,n=r/d|0;return n&&t.unshift(n),t}function e(t,e,r,n){var o,i;if(r!=n)i=r>n?1:-1;else for(o=i=0;o<r;o++)if(t[o]!=e[o]){i=t[o]>e[o]?1:-1;break}return i}function r(t,e,r){for(var n=0;r--;)t[r]-=n,n=t[r]<e[r]?1:0,t[r]=n*d+t[r]-e[r];for(;!t[0]&&t.length>1;)t.shift()}return function(n,o,i,a){var c,l,s,f,p,h,y,v,m,b,g,x,w,j,S,P,E,k,_=n.constructor,M=n.s==o.s?1:-1,T=n.d,C=o.d;if(!n.s)return new _(n);if(!o.s)throw Error(u+"Division by zero");for(l=n.e-o.e,E=C.length,S=T.length,v=(y=new _(M)).d=[],s=0;C[s]==(T[s]||0);)++s;if(C[s]>(T[s]||0)&&--l,(x=null==i?i=_.precision:a?i+(O(n)-O(o))+1:i)<0)return new _(0);if(x=x/7+2|0,s=0,1==E)for(f=0,C=C[0],x++;(s<S||f)&&x--;s++)w=f*d+(T[s]||0),v[s]=w/C|0,f=w%C|0;else{for((f=d/(C[0]+1)|0)>1&&(C=t(C,f),T=t(T,f),E=C.length,S=T.length),j=E,b=(m=T.slice(0,E)).length;b<E;)m[b++]=0;(k=C.slice()).unshift(0),P=C[0],C[1]>=d/2&&++P;do{f=0,(c=e(C,m,E,b))<0?(g=m[0],E!=b&&(g=g*d+(m[1]||0)),(f=g/P|0)>1?(f>=d&&(f=d-1),1==(c=e(p=t(C,f),m,h=p.length,b=m.length))&&(f--,r(p,E<h?k:C,h))):(0==f&&(c=f=1),p=C.slice()),(h=p.length)<b&&p.unshift(0),r(m,p,b),-1==c&&(c=e(C,m,E,b=m.length))<1&&(f++,r(m,E<b?k:C,b)),b=m.length):0===c&&(f++,m=[0]),v[s++]=f,c&&m[0]?m[b++]=T[j]||0:(m=[T[j]],b=1)}while((j++<S||void 0!==m[0])&&x--)}return v[0]||v.shift(),y.e=l,A(y,a?i+O(y)+1:i)}}();function w(t,e){var r,n,i,a,u,l=0,f=0,h=t.constructor,d=h.precision;if(O(t)>16)throw Error(s+O(t));if(!t.s)return new h(o);for(null==e?(c=!1,u=d):u=e,a=new h(.03125);t.abs().gte(.1);)t=t.times(a),f+=5;for(u+=Math.log(p(2,f))/Math.LN10*2+5|0,r=n=i=new h(o),h.precision=u;;){if(n=A(n.times(t),u),r=r.times(++l),g((a=i.plus(x(n,r,u))).d).slice(0,u)===g(i.d).slice(0,u)){for(;f--;)i=A(i.times(i),u);return h.precision=d,null==e?(c=!0,A(i,d)):i}i=a}}function O(t){for(var e=7*t.e,r=t.d[0];r>=10;r/=10)e++;return e}function j(t,e,r){if(e>t.LN10.sd())throw c=!0,r&&(t.precision=r),Error(u+"LN10 precision limit exceeded");return A(new t(t.LN10),e)}function S(t){for(var e="";t--;)e+="0";return e}function P(t,e){var r,n,i,a,l,s,f,p,h,d=1,y=t,v=y.d,m=y.constructor,b=m.precision;if(y.s<1)throw Error(u+(y.s?"NaN":"-Infinity"));if(y.eq(o))return new m(0);if(null==e?(c=!1,p=b):p=e,y.eq(10))return null==e&&(c=!0),j(m,p);if(p+=10,m.precision=p,n=(r=g(v)).charAt(0),a=O(y),!(Math.abs(a)<15e14))return f=j(m,p+2,b).times(a+""),y=P(new m(n+"."+r.slice(1)),p-10).plus(f),m.precision=b,null==e?(c=!0,A(y,b)):y;for(;n<7&&1!=n||1==n&&r.charAt(1)>3;)n=(r=g((y=y.times(t)).d)).charAt(0),d++;for(a=O(y),n>1?(y=new m("0."+r),a++):y=new m(n+"."+r.slice(1)),s=l=y=x(y.minus(o),y.plus(o),p),h=A(y.times(y),p),i=3;;){if(l=A(l.times(h),p),g((f=s.plus(x(l,new m(i),p))).d).slice(0,p)===g(s.d).slice(0,p))return s=s.times(2),0!==a&&(s=s.plus(j(m,p+2,b).times(a+""))),s=x(s,new m(d),p),m.precision=b,null==e?(c=!0,A(s,b)):s;s=f,i+=2}}function E(t,e){var r,n,o;for((r=e.indexOf("."))>-1&&(e=e.replace(".","")),(n=e.search(/e/i))>0?(r<0&&(r=n),r+=+e.slice(n+1),e=e.substring(0,n)):r<0&&(r=e.length),n=0;48===e.charCodeAt(n);)++n;for(o=e.length;48===e.charCodeAt(o-1);)--o;if(e=e.slice(n,o)){if(o-=n,r=r-n-1,t.e=f(r/7),t.d=[],n=(r+1)%7,r<0&&(n+=7),n<o){for(n&&t.d.push(+e.slice(0,n)),o-=7;n<o;)t.d.push(+e.slice(n,n+=7));n=7-(e=e.slice(n)).length}else n-=o;for(;n--;)e+="0";if(t.d.push(+e),c&&(t.e>y||t.e<-y))throw Error(s+r)}else t.s=0,t.e=0,t.d=[0];return t}function A(t,e,r){var n,o,i,a,u,l,h,v,m=t.d;for(a=1,i=m[0];i>=10;i/=10)a++;if((n=e-a)<0)n+=7,o=e,h=m[v=0];else{if((v=Math.ceil((n+1)/7))>=(i=m.length))return t;for(h=i=m[v],a=1;i>=10;i/=10)a++;o=(n%=7)-7+a}if(void 0!==r&&(u=h/(i=p(10,a-o-1))%10|0,l=e<0||void 0!==m[v+1]||h%i,l=r<4?(u||l)&&(0==r||r==(t.s<0?3:2)):u>5||5==u&&(4==r||l||6==r&&(n>0?o>0?h/p(10,a-o):0:m[v-1])%10&1||r==(t.s<0?8:7))),e<1||!m[0])return l?(i=O(t),m.length=1,e=e-i-1,m[0]=p(10,(7-e%7)%7),t.e=f(-e/7)||0):(m.length=1,m[0]=t.e=t.s=0),t;if(0==n?(m.length=v,i=1,v--):(m.length=v+1,i=p(10,7-n),m[v]=o>0?(h/p(10,a-o)%p(10,o)|0)*i:0),l)for(;;){if(0==v){(m[0]+=i)==d&&(m[0]=1,++t.e);break}if(m[v]+=i,m[v]!=d)break;m[v--]=0,i=1}for(n=m.length;0===m[--n];)m.pop();if(c&&(t.e>y||t.e<-y))throw Error(s+O(t));return t}function k(t,e){var r,n,o,i,a,u,l,s,f,p,h=t.constructor,y=h.precision;if(!t.s||!e.s)return e.s?e.s=-e.s:e=new h(t),c?A(e,y):e;if(l=t.d,p=e.d,n=e.e,s=t.e,l=l.slice(),a=s-n){for((f=a<0)?(r=l,a=-a,u=p.length):(r=p,n=s,u=l.length),a>(o=Math.max(Math.ceil(y/7),u)+2)&&(a=o,r.length=1),r.reverse(),o=a;o--;)r.push(0);r.reverse()}else{for((f=(o=l.length)<(u=p.length))&&(u=o),o=0;o<u;o++)if(l[o]!=p[o]){f=l[o]<p[o];break}a=0}for(f&&(r=l,l=p,p=r,e.s=-e.s),u=l.length,o=p.length-u;o>0;--o)l[u++]=0;for(o=p.length;o>a;){if(l[--o]<p[o]){for(i=o;i&&0===l[--i];)l[i]=d-1;--l[i],l[o]+=d}l[o]-=p[o]}for(;0===l[--u];)l.pop();for(;0===l[0];l.shift())--n;return l[0]?(e.d=l,e.e=n,c?A(e,y):e):new h(0)}function _(t,e,r){var n,o=O(t),i=g(t.d),a=i.length;return e?(r&&(n=r-a)>0?i=i.charAt(0)+"."+i.slice(1)+S(n):a>1&&(i=i.charAt(0)+"."+i.slice(1)),i=i+(o<0?"e":"e+")+o):o<0?(i="0."+S(-o-1)+i,r&&(n=r-a)>0&&(i+=S(n))):o>=a?(i+=S(o+1-a),r&&(n=r-o-1)>0&&(i=i+"."+S(n))):((n=o+1)<a&&(i=i.slice(0,n)+"."+i.slice(n)),r&&(n=r-a)>0&&(o+1===a&&(i+="."),i+=S(n))),t.s<0?"-"+i:i}function M(t,e){if(t.length>e)return t.length=e,!0}function T(t){if(!t||"object"!=typeof t)throw Error(u+"Object expected");var e,r,n,o=["precision",1,i,"rounding",0,8,"toExpNeg",-1/0,0,"toExpPos",0,1/0];for(e=0;e<o.length;e+=3)if(void 0!==(n=t[r=o[e]])){if(!(f(n)===n&&n>=o[e+1]&&n<=o[e+2]))throw Error(l+r+": "+n);this[r]=n}if(void 0!==(n=t[r="LN10"])){if(n!=Math.LN10)throw Error(l+r+": "+n);this[r]=new this(n)}return this}(a=function t(e){var r,n,o;function i(t){var e=this;if(!(e instanceof i))return new i(t);if(e.constructor=i,t instanceof i)return e.s=t.s,e.e=t.e,void(e.d=(t=t.d)?t.slice():t);if("number"==typeof t){if(0*t!=0)throw Error(l+t);if(t>0)e.s=1;else{if(!(t<0))return e.s=0,e.e=0,void(e.d=[0]);t=-t,e.s=-1}return t===~~t&&t<1e7?(e.e=0,void(e.d=[t])):E(e,t.toString())}if("string"!=typeof t)throw Error(l+t);if(45===t.charCodeAt(0)?(t=t.slice(1),e.s=-1):e.s=1,!h.test(t))throw Error(l+t);E(e,t)}if(i.prototype=v,i.ROUND_UP=0,i.ROUND_DOWN=1,i.ROUND_CEIL=2,i.ROUND_FLOOR=3,i.ROUND_HALF_UP=4,i.ROUND_HALF_DOWN=5,i.ROUND_HALF_EVEN=6,i.ROUND_HALF_CEIL=7,i.ROUND_HALF_FLOOR=8,i.clone=t,i.config=i.set=T,void 0===e&&(e={}),e)for(o=["precision","rounding","toExpNeg","toExpPos","LN10"],r=0;r<o.length;)e.hasOwnProperty(n=o[r++])||(e[n]=this[n]);return i.config(e),i}(a)).default=a.Decimal=a,o=new a(1),void 0===(n=function(){return a}.call(e,r,e,t))||(t.exports=n)}()},8586:(t,e,r)=>{var n=r(6449),o=r(4394),i=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,a=/^\w*$/;t.exports=function(t,e){if(n(t))return!1;var r=typeof t;return!("number"!=r&&"symbol"!=r&&"boolean"!=r&&null!=t&&!o(t))||a.test(t)||!i.test(t)||null!=e&&t in Object(e)}},8655:(t,e,r)=>{var n=r(6025);t.exports=function(t){return n(this.__data__,t)>-1}},8754:(t,e,r)=>{var n=r(5160);t.exports=function(t,e,r){var o=t.length;return r=void 0===r?o:r,!e&&r>=o?t:n(t,e,r)}},8859:(t,e,r)=>{var n=r(3661),o=r(1380),i=r(1459);function a(t){var e=-1,r=null==t?0:t.length;for(this.__data__=new n;++e<r;)this.add(t[e])}a.prototype.add=a.prototype.push=o,a.prototype.has=i,t.exports=a},8879:(t,e,r)=>{var n=r(4335)(Object.getPrototypeOf,Object);t.exports=n},8984:(t,e,r)=>{var n=r(5527),o=r(3650),i=Object.prototype.hasOwnProperty;t.exports=function(t){if(!n(t))return o(t);var e=[];for(var r in Object(t))i.call(t,r)&&"constructor"!=r&&e.push(r);return e}},9219:t=>{t.exports=function(t,e){return t.has(e)}},9302:(t,e,r)=>{var n=r(3488),o=r(6757),i=r(2865);t.exports=function(t,e){return i(o(t,e,n),t+"")}},9325:(t,e,r)=>{var n=r(4840),o="object"==typeof self&&self&&self.Object===Object&&self,i=n||o||Function("return this")();t.exports=i},9326:(t,e,r)=>{var n=r(1769),o=r(2428),i=r(6449),a=r(361),c=r(294),u=r(7797);t.exports=function(t,e,r){for(var l=-1,s=(e=n(e,t)).length,f=!1;++l<s;){var p=u(e[l]);if(!(f=null!=t&&r(t,p)))break;t=t[p]}return f||++l!=s?f:!!(s=null==t?0:t.length)&&c(s)&&a(p,s)&&(i(t)||o(t))}},9350:t=>{var e=Object.prototype.toString;t.exports=function(t){return e.call(t)}},9374:(t,e,r)=>{var n=r(4128),o=r(3805),i=r(4394),a=/^[-+]0x[0-9a-f]+$/i,c=/^0b[01]+$/i,u=/^0o[0-7]+$/i,l=parseInt;t.exports=function(t){if("number"==typeof t)return t;if(i(t))return NaN;if(o(t)){var e="function"==typeof t.valueOf?t.valueOf():t;t=o(e)?e+"":e}if("string"!=typeof t)return 0===t?t:+t;t=n(t);var r=c.test(t);return r||u.test(t)?l(t.slice(2),r?2:8):a.test(t)?NaN:+t}},9570:(t,e,r)=>{var n=r(7334),o=r(3243),i=r(3488),a=o?function(t,e){return o(t,"toString",{configurable:!0,enumerable:!1,value:n(e),writable:!0})}:i;t.exports=a},9698:t=>{var e=RegExp("[\\u200d\\ud800-\\udfff\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff\\ufe0e\\ufe0f]");t.exports=function(t){return e.test(t)}},9747:(t,e,r)=>{var n=r(7277),o=r(3777),i=r(5389),a=r(6449),c=r(6800);t.exports=function(t,e,r){var u=a(t)?n:o;return r&&c(t,e,r)&&(e=void 0),u(t,i(e,3))}},9770:t=>{t.exports=function(t,e){for(var r=-1,n=null==t?0:t.length,o=0,i=[];++r<n;){var a=t[r];e(a,r,t)&&(i[o++]=a)}return i}},9817:t=>{t.exports=function(t){return this.__data__.has(t)}},9843:t=>{t.exports=function(t){return null==t}},9905:t=>{t.exports=function(t,e,r){for(var n=-1,o=null==t?0:t.length;++n<o;)if(r(e,t[n]))return!0;return!1}},9935:t=>{t.exports=function(){return!1}}},e={};function r(n){var o=e[n];if(void 0!==o)return o.exports;var i=e[n]={id:n,loaded:!1,exports:{}};return t[n].call(i.exports,i,i.exports,r),i.loaded=!0,i.exports}r.n=t=>{var e=t&&t.__esModule?()=>t.default:()=>t;return r.d(e,{a:e}),e},r.d=(t,e)=>{for(var n in e)r.o(e,n)&&!r.o(t,n)&&Object.defineProperty(t,n,{enumerable:!0,get:e[n]})},r.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),r.o=(t,e)=>Object.prototype.hasOwnProperty.call(t,e),r.r=t=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},r.nmd=t=>(t.paths=[],t.children||(t.children=[]),t);var n={};(()=>{"use strict";r.r(n),r.d(n,{default:()=>Im});var t={};r.r(t),r.d(t,{scaleBand:()=>ao,scaleDiverging:()=>Ml,scaleDivergingLog:()=>Tl,scaleDivergingPow:()=>Dl,scaleDivergingSqrt:()=>Il,scaleDivergingSymlog:()=>Cl,scaleIdentity:()=>Aa,scaleImplicit:()=>oo,scaleLinear:()=>Ea,scaleLog:()=>Ba,scaleOrdinal:()=>io,scalePoint:()=>uo,scalePow:()=>Xa,scaleQuantile:()=>ec,scaleQuantize:()=>rc,scaleRadial:()=>Va,scaleSequential:()=>jl,scaleSequentialLog:()=>Sl,scaleSequentialPow:()=>El,scaleSequentialQuantile:()=>kl,scaleSequentialSqrt:()=>Al,scaleSequentialSymlog:()=>Pl,scaleSqrt:()=>Ha,scaleSymlog:()=>Fa,scaleThreshold:()=>nc,scaleTime:()=>gl,scaleUtc:()=>xl,tickFormat:()=>Sa});const e=React;var o=r.n(e);function i(t){var e,r,n="";if("string"==typeof t||"number"==typeof t)n+=t;else if("object"==typeof t)if(Array.isArray(t)){var o=t.length;for(e=0;e<o;e++)t[e]&&(r=i(t[e]))&&(n&&(n+=" "),n+=r)}else for(r in t)t[r]&&(n&&(n+=" "),n+=r);return n}const a=function(){for(var t,e,r=0,n="",o=arguments.length;r<o;r++)(t=arguments[r])&&(e=i(t))&&(n&&(n+=" "),n+=e);return n};var c=r(7350),u=r.n(c),l=r(5015),s=r.n(l),f=r(1741),p=r.n(f),h=r(8156),d=r.n(h),y=r(8023),v=r.n(y),m=function(t){return 0===t?0:t>0?1:-1},b=function(t){return s()(t)&&t.indexOf("%")===t.length-1},g=function(t){return v()(t)&&!p()(t)},x=function(t){return g(t)||s()(t)},w=0,O=function(t){var e=++w;return"".concat(t||"").concat(e)},j=function(t,e){var r,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];if(!g(t)&&!s()(t))return n;if(b(t)){var i=t.indexOf("%");r=e*parseFloat(t.slice(0,i))/100}else r=+t;return p()(r)&&(r=n),o&&r>e&&(r=e),r},S=function(t){if(!t)return null;var e=Object.keys(t);return e&&e.length?t[e[0]]:null},P=function(t,e){return g(t)&&g(e)?function(r){return t+r*(e-t)}:function(){return e}};function E(t,e,r){return t&&t.length?t.find((function(t){return t&&("function"==typeof e?e(t):d()(t,e))===r})):null}var A=function(t,e){return g(t)&&g(e)?t-e:s()(t)&&s()(e)?t.localeCompare(e):t instanceof Date&&e instanceof Date?t.getTime()-e.getTime():String(t).localeCompare(String(e))},k=function(t,e){for(var r=arguments.length,n=new Array(r>2?r-2:0),o=2;o<r;o++)n[o-2]=arguments[o]},_=r(9843),M=r.n(_),T=r(1882),C=r.n(T),D=r(3805),I=r.n(D),N=r(4363);function B(t,e){for(var r in t)if({}.hasOwnProperty.call(t,r)&&(!{}.hasOwnProperty.call(e,r)||t[r]!==e[r]))return!1;for(var n in e)if({}.hasOwnProperty.call(e,n)&&!{}.hasOwnProperty.call(t,n))return!1;return!0}function R(t){return R="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},R(t)}var L=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],z=["points","pathLength"],F={svg:["viewBox","children"],polygon:z,polyline:z},U=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"],$=function(t,r){if(!t||"function"==typeof t||"boolean"==typeof t)return null;var n=t;if((0,e.isValidElement)(t)&&(n=t.props),!I()(n))return null;var o={};return Object.keys(n).forEach((function(t){U.includes(t)&&(o[t]=r||function(e){return n[t](n,e)})})),o},q=function(t,e,r){if(!I()(t)||"object"!==R(t))return null;var n=null;return Object.keys(t).forEach((function(o){var i=t[o];U.includes(o)&&"function"==typeof i&&(n||(n={}),n[o]=function(t,e,r){return function(n){return t(e,r,n),null}}(i,e,r))})),n},W=["children"],X=["children"];function H(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function G(t){return G="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},G(t)}var V={click:"onClick",mousedown:"onMouseDown",mouseup:"onMouseUp",mouseover:"onMouseOver",mousemove:"onMouseMove",mouseout:"onMouseOut",mouseenter:"onMouseEnter",mouseleave:"onMouseLeave",touchcancel:"onTouchCancel",touchend:"onTouchEnd",touchmove:"onTouchMove",touchstart:"onTouchStart",contextmenu:"onContextMenu",dblclick:"onDoubleClick"},Y=function(t){return"string"==typeof t?t:t?t.displayName||t.name||"Component":""},K=null,Z=null,J=function t(r){if(r===K&&Array.isArray(Z))return Z;var n=[];return e.Children.forEach(r,(function(e){M()(e)||((0,N.isFragment)(e)?n=n.concat(t(e.props.children)):n.push(e))})),Z=n,K=r,n};function Q(t,e){var r=[],n=[];return n=Array.isArray(e)?e.map((function(t){return Y(t)})):[Y(e)],J(t).forEach((function(t){var e=d()(t,"type.displayName")||d()(t,"type.name");-1!==n.indexOf(e)&&r.push(t)})),r}function tt(t,e){var r=Q(t,e);return r&&r[0]}var et=function(t){if(!t||!t.props)return!1;var e=t.props,r=e.width,n=e.height;return!(!g(r)||r<=0||!g(n)||n<=0)},rt=["a","altGlyph","altGlyphDef","altGlyphItem","animate","animateColor","animateMotion","animateTransform","circle","clipPath","color-profile","cursor","defs","desc","ellipse","feBlend","feColormatrix","feComponentTransfer","feComposite","feConvolveMatrix","feDiffuseLighting","feDisplacementMap","feDistantLight","feFlood","feFuncA","feFuncB","feFuncG","feFuncR","feGaussianBlur","feImage","feMerge","feMergeNode","feMorphology","feOffset","fePointLight","feSpecularLighting","feSpotLight","feTile","feTurbulence","filter","font","font-face","font-face-format","font-face-name","font-face-url","foreignObject","g","glyph","glyphRef","hkern","image","line","lineGradient","marker","mask","metadata","missing-glyph","mpath","path","pattern","polygon","polyline","radialGradient","rect","script","set","stop","style","svg","switch","symbol","text","textPath","title","tref","tspan","use","view","vkern"],nt=function(t,r,n){if(!t||"function"==typeof t||"boolean"==typeof t)return null;var o=t;if((0,e.isValidElement)(t)&&(o=t.props),!I()(o))return null;var i={};return Object.keys(o).forEach((function(t){var e;(function(t,e,r,n){var o,i=null!==(o=null==F?void 0:F[n])&&void 0!==o?o:[];return e.startsWith("data-")||!C()(t)&&(n&&i.includes(e)||L.includes(e))||r&&U.includes(e)})(null===(e=o)||void 0===e?void 0:e[t],t,r,n)&&(i[t]=o[t])})),i},ot=function t(r,n){if(r===n)return!0;var o=e.Children.count(r);if(o!==e.Children.count(n))return!1;if(0===o)return!0;if(1===o)return it(Array.isArray(r)?r[0]:r,Array.isArray(n)?n[0]:n);for(var i=0;i<o;i++){var a=r[i],c=n[i];if(Array.isArray(a)||Array.isArray(c)){if(!t(a,c))return!1}else if(!it(a,c))return!1}return!0},it=function(t,e){if(M()(t)&&M()(e))return!0;if(!M()(t)&&!M()(e)){var r=t.props||{},n=r.children,o=H(r,W),i=e.props||{},a=i.children,c=H(i,X);return n&&a?B(o,c)&&ot(n,a):!n&&!a&&B(o,c)}return!1},at=function(t,e){var r=[],n={};return J(t).forEach((function(t,o){if(function(t){return t&&t.type&&s()(t.type)&&rt.indexOf(t.type)>=0}(t))r.push(t);else if(t){var i=Y(t.type),a=e[i]||{},c=a.handler,u=a.once;if(c&&(!u||!n[i])){var l=c(t,i,o);r.push(l),n[i]=!0}}})),r};function ct(t){return ct="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ct(t)}function ut(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function lt(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?ut(Object(r),!0).forEach((function(e){st(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):ut(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function st(t,e,r){var n;return n=function(t){if("object"!=ct(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ct(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==ct(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function ft(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var pt=(0,e.forwardRef)((function(t,r){var n=t.aspect,i=t.initialDimension,c=void 0===i?{width:-1,height:-1}:i,l=t.width,s=void 0===l?"100%":l,f=t.height,p=void 0===f?"100%":f,h=t.minWidth,d=void 0===h?0:h,y=t.minHeight,v=t.maxHeight,m=t.children,g=t.debounce,x=void 0===g?0:g,w=t.id,O=t.className,j=t.onResize,S=t.style,P=void 0===S?{}:S,E=(0,e.useRef)(null),A=(0,e.useRef)();A.current=j,(0,e.useImperativeHandle)(r,(function(){return Object.defineProperty(E.current,"current",{get:function(){return console.warn("The usage of ref.current.current is deprecated and will no longer be supported."),E.current},configurable:!0})}));var _,M,T=(_=(0,e.useState)({containerWidth:c.width,containerHeight:c.height}),M=2,function(t){if(Array.isArray(t))return t}(_)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(_,M)||function(t,e){if(t){if("string"==typeof t)return ft(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?ft(t,e):void 0}}(_,M)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),C=T[0],D=T[1],I=(0,e.useCallback)((function(t,e){D((function(r){var n=Math.round(t),o=Math.round(e);return r.containerWidth===n&&r.containerHeight===o?r:{containerWidth:n,containerHeight:o}}))}),[]);(0,e.useEffect)((function(){var t=function(t){var e,r=t[0].contentRect,n=r.width,o=r.height;I(n,o),null===(e=A.current)||void 0===e||e.call(A,n,o)};x>0&&(t=u()(t,x,{trailing:!0,leading:!1}));var e=new ResizeObserver(t),r=E.current.getBoundingClientRect(),n=r.width,o=r.height;return I(n,o),e.observe(E.current),function(){e.disconnect()}}),[I,x]);var N=(0,e.useMemo)((function(){var t=C.containerWidth,r=C.containerHeight;if(t<0||r<0)return null;k(b(s)||b(p),"The width(%s) and height(%s) are both fixed numbers,\n       maybe you don't need to use a ResponsiveContainer.",s,p),k(!n||n>0,"The aspect(%s) must be greater than zero.",n);var i=b(s)?t:s,a=b(p)?r:p;n&&n>0&&(i?a=i/n:a&&(i=a*n),v&&a>v&&(a=v)),k(i>0||a>0,"The width(%s) and height(%s) of chart should be greater than 0,\n       please check the style of container, or the props width(%s) and height(%s),\n       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the\n       height and width.",i,a,s,p,d,y,n);var c=!Array.isArray(m)&&Y(m.type).endsWith("Chart");return o().Children.map(m,(function(t){return o().isValidElement(t)?(0,e.cloneElement)(t,lt({width:i,height:a},c?{style:lt({height:"100%",width:"100%",maxHeight:a,maxWidth:i},t.props.style)}:{})):t}))}),[n,m,p,v,y,d,C,s]);return o().createElement("div",{id:w?"".concat(w):void 0,className:a("recharts-responsive-container",O),style:lt(lt({},P),{},{width:s,height:p,minWidth:d,minHeight:y,maxHeight:v}),ref:E},N)})),ht=r(3181),dt=r.n(ht),yt=r(3031),vt=r.n(yt);function mt(t,e){if(!t)throw new Error("Invariant failed")}var bt=["children","width","height","viewBox","className","style","title","desc"];function gt(){return gt=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},gt.apply(this,arguments)}function xt(t){var e=t.children,r=t.width,n=t.height,i=t.viewBox,c=t.className,u=t.style,l=t.title,s=t.desc,f=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,bt),p=i||{width:r,height:n,x:0,y:0},h=a("recharts-surface",c);return o().createElement("svg",gt({},nt(f,!0,"svg"),{className:h,width:r,height:n,style:u,viewBox:"".concat(p.x," ").concat(p.y," ").concat(p.width," ").concat(p.height)}),o().createElement("title",null,l),o().createElement("desc",null,s),e)}var wt=["children","className"];function Ot(){return Ot=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Ot.apply(this,arguments)}var jt=o().forwardRef((function(t,e){var r=t.children,n=t.className,i=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,wt),c=a("recharts-layer",n);return o().createElement("g",Ot({className:c},nt(i,!0),{ref:e}),r)}));function St(t){return St="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},St(t)}function Pt(){return Pt=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Pt.apply(this,arguments)}function Et(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function At(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function kt(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?At(Object(r),!0).forEach((function(e){_t(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):At(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function _t(t,e,r){var n;return n=function(t){if("object"!=St(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=St(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==St(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Mt(t){return Array.isArray(t)&&x(t[0])&&x(t[1])?t.join(" ~ "):t}var Tt=function(t){var e=t.separator,r=void 0===e?" : ":e,n=t.contentStyle,i=void 0===n?{}:n,c=t.itemStyle,u=void 0===c?{}:c,l=t.labelStyle,s=void 0===l?{}:l,f=t.payload,p=t.formatter,h=t.itemSorter,d=t.wrapperClassName,y=t.labelClassName,v=t.label,m=t.labelFormatter,b=t.accessibilityLayer,g=void 0!==b&&b,w=kt({margin:0,padding:10,backgroundColor:"#fff",border:"1px solid #ccc",whiteSpace:"nowrap"},i),O=kt({margin:0},s),j=!M()(v),S=j?v:"",P=a("recharts-default-tooltip",d),E=a("recharts-tooltip-label",y);j&&m&&null!=f&&(S=m(v,f));var A=g?{role:"status","aria-live":"assertive"}:{};return o().createElement("div",Pt({className:P,style:w},A),o().createElement("p",{className:E,style:O},o().isValidElement(S)?S:"".concat(S)),function(){if(f&&f.length){var t=(h?vt()(f,h):f).map((function(t,e){if("none"===t.type)return null;var n=kt({display:"block",paddingTop:4,paddingBottom:4,color:t.color||"#000"},u),i=t.formatter||p||Mt,a=t.value,c=t.name,l=a,s=c;if(i&&null!=l&&null!=s){var h=i(a,c,t,e,f);if(Array.isArray(h)){var d=function(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return Et(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Et(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(h,2);l=d[0],s=d[1]}else l=h}return o().createElement("li",{className:"recharts-tooltip-item",key:"tooltip-item-".concat(e),style:n},x(s)?o().createElement("span",{className:"recharts-tooltip-item-name"},s):null,x(s)?o().createElement("span",{className:"recharts-tooltip-item-separator"},r):null,o().createElement("span",{className:"recharts-tooltip-item-value"},l),o().createElement("span",{className:"recharts-tooltip-item-unit"},t.unit||""))}));return o().createElement("ul",{className:"recharts-tooltip-item-list",style:{padding:0,margin:0}},t)}return null}())};function Ct(t){return Ct="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ct(t)}function Dt(t,e,r){var n;return n=function(t){if("object"!=Ct(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ct(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ct(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var It="recharts-tooltip-wrapper",Nt={visibility:"hidden"};function Bt(t){var e=t.coordinate,r=t.translateX,n=t.translateY;return a(It,Dt(Dt(Dt(Dt({},"".concat(It,"-right"),g(r)&&e&&g(e.x)&&r>=e.x),"".concat(It,"-left"),g(r)&&e&&g(e.x)&&r<e.x),"".concat(It,"-bottom"),g(n)&&e&&g(e.y)&&n>=e.y),"".concat(It,"-top"),g(n)&&e&&g(e.y)&&n<e.y))}function Rt(t){var e=t.allowEscapeViewBox,r=t.coordinate,n=t.key,o=t.offsetTopLeft,i=t.position,a=t.reverseDirection,c=t.tooltipDimension,u=t.viewBox,l=t.viewBoxDimension;if(i&&g(i[n]))return i[n];var s=r[n]-c-o,f=r[n]+o;return e[n]?a[n]?s:f:a[n]?s<u[n]?Math.max(f,u[n]):Math.max(s,u[n]):f+c>u[n]+l?Math.max(s,u[n]):Math.max(f,u[n])}function Lt(t){return Lt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Lt(t)}function zt(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ft(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?zt(Object(r),!0).forEach((function(e){Xt(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):zt(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Ut(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Ht(n.key),n)}}function $t(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return($t=function(){return!!t})()}function qt(t){return qt=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},qt(t)}function Wt(t,e){return Wt=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Wt(t,e)}function Xt(t,e,r){return(e=Ht(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Ht(t){var e=function(t){if("object"!=Lt(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Lt(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Lt(e)?e:e+""}var Gt=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return Xt((r=this,n=e,o=[].concat(a),n=qt(n),t=function(t,e){if(e&&("object"===Lt(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,$t()?Reflect.construct(n,o||[],qt(r).constructor):n.apply(r,o))),"state",{dismissed:!1,dismissedAtCoordinate:{x:0,y:0},lastBoundingBox:{width:-1,height:-1}}),Xt(t,"handleKeyDown",(function(e){var r,n,o,i;"Escape"===e.key&&t.setState({dismissed:!0,dismissedAtCoordinate:{x:null!==(r=null===(n=t.props.coordinate)||void 0===n?void 0:n.x)&&void 0!==r?r:0,y:null!==(o=null===(i=t.props.coordinate)||void 0===i?void 0:i.y)&&void 0!==o?o:0}})})),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Wt(t,e)}(e,t),r=e,(n=[{key:"updateBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var t=this.wrapperNode.getBoundingClientRect();(Math.abs(t.width-this.state.lastBoundingBox.width)>1||Math.abs(t.height-this.state.lastBoundingBox.height)>1)&&this.setState({lastBoundingBox:{width:t.width,height:t.height}})}else-1===this.state.lastBoundingBox.width&&-1===this.state.lastBoundingBox.height||this.setState({lastBoundingBox:{width:-1,height:-1}})}},{key:"componentDidMount",value:function(){document.addEventListener("keydown",this.handleKeyDown),this.updateBBox()}},{key:"componentWillUnmount",value:function(){document.removeEventListener("keydown",this.handleKeyDown)}},{key:"componentDidUpdate",value:function(){var t,e;this.props.active&&this.updateBBox(),this.state.dismissed&&((null===(t=this.props.coordinate)||void 0===t?void 0:t.x)===this.state.dismissedAtCoordinate.x&&(null===(e=this.props.coordinate)||void 0===e?void 0:e.y)===this.state.dismissedAtCoordinate.y||(this.state.dismissed=!1))}},{key:"render",value:function(){var t=this,e=this.props,r=e.active,n=e.allowEscapeViewBox,i=e.animationDuration,a=e.animationEasing,c=e.children,u=e.coordinate,l=e.hasPayload,s=e.isAnimationActive,f=e.offset,p=e.position,h=e.reverseDirection,d=e.useTranslate3d,y=e.viewBox,v=e.wrapperStyle,m=function(t){var e,r,n=t.allowEscapeViewBox,o=t.coordinate,i=t.offsetTopLeft,a=t.position,c=t.reverseDirection,u=t.tooltipBox,l=t.useTranslate3d,s=t.viewBox;return{cssProperties:u.height>0&&u.width>0&&o?function(t){var e=t.translateX,r=t.translateY;return{transform:t.useTranslate3d?"translate3d(".concat(e,"px, ").concat(r,"px, 0)"):"translate(".concat(e,"px, ").concat(r,"px)")}}({translateX:e=Rt({allowEscapeViewBox:n,coordinate:o,key:"x",offsetTopLeft:i,position:a,reverseDirection:c,tooltipDimension:u.width,viewBox:s,viewBoxDimension:s.width}),translateY:r=Rt({allowEscapeViewBox:n,coordinate:o,key:"y",offsetTopLeft:i,position:a,reverseDirection:c,tooltipDimension:u.height,viewBox:s,viewBoxDimension:s.height}),useTranslate3d:l}):Nt,cssClasses:Bt({translateX:e,translateY:r,coordinate:o})}}({allowEscapeViewBox:n,coordinate:u,offsetTopLeft:f,position:p,reverseDirection:h,tooltipBox:this.state.lastBoundingBox,useTranslate3d:d,viewBox:y}),b=m.cssClasses,g=m.cssProperties,x=Ft(Ft({transition:s&&r?"transform ".concat(i,"ms ").concat(a):void 0},g),{},{pointerEvents:"none",visibility:!this.state.dismissed&&r&&l?"visible":"hidden",position:"absolute",top:0,left:0},v);return o().createElement("div",{tabIndex:-1,className:b,style:x,ref:function(e){t.wrapperNode=e}},c)}}])&&Ut(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(e.PureComponent),Vt={isSsr:!("undefined"!=typeof window&&window.document&&window.document.createElement&&window.setTimeout),get:function(t){return Vt[t]},set:function(t,e){if("string"==typeof t)Vt[t]=e;else{var r=Object.keys(t);r&&r.length&&r.forEach((function(e){Vt[e]=t[e]}))}}},Yt=r(14),Kt=r.n(Yt);function Zt(t,e,r){return!0===e?Kt()(t,r):C()(e)?Kt()(t,e):t}function Jt(t){return Jt="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Jt(t)}function Qt(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function te(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Qt(Object(r),!0).forEach((function(e){ie(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Qt(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function ee(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,ae(n.key),n)}}function re(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(re=function(){return!!t})()}function ne(t){return ne=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},ne(t)}function oe(t,e){return oe=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},oe(t,e)}function ie(t,e,r){return(e=ae(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function ae(t){var e=function(t){if("object"!=Jt(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Jt(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Jt(e)?e:e+""}function ce(t){return t.dataKey}var ue=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=ne(r=e),function(t,e){if(e&&("object"===Jt(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,re()?Reflect.construct(r,n||[],ne(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&oe(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){var t=this,e=this.props,r=e.active,n=e.allowEscapeViewBox,i=e.animationDuration,a=e.animationEasing,c=e.content,u=e.coordinate,l=e.filterNull,s=e.isAnimationActive,f=e.offset,p=e.payload,h=e.payloadUniqBy,d=e.position,y=e.reverseDirection,v=e.useTranslate3d,m=e.viewBox,b=e.wrapperStyle,g=null!=p?p:[];l&&g.length&&(g=Zt(p.filter((function(e){return null!=e.value&&(!0!==e.hide||t.props.includeHidden)})),h,ce));var x=g.length>0;return o().createElement(Gt,{allowEscapeViewBox:n,animationDuration:i,animationEasing:a,isAnimationActive:s,active:r,coordinate:u,hasPayload:x,offset:f,position:d,reverseDirection:y,useTranslate3d:v,viewBox:m,wrapperStyle:b},function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):"function"==typeof t?o().createElement(t,e):o().createElement(Tt,e)}(c,te(te({},this.props),{},{payload:g})))}}])&&ee(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(e.PureComponent);ie(ue,"displayName","Tooltip"),ie(ue,"defaultProps",{accessibilityLayer:!1,allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:"ease",contentStyle:{},coordinate:{x:0,y:0},cursor:!0,cursorStyle:{},filterNull:!0,isAnimationActive:!Vt.isSsr,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:" : ",trigger:"hover",useTranslate3d:!1,viewBox:{x:0,y:0,height:0,width:0},wrapperStyle:{}});var le=r(5808),se=r.n(le);Math.abs,Math.atan2;const fe=Math.cos,pe=(Math.max,Math.min,Math.sin),he=Math.sqrt,de=Math.PI,ye=2*de,ve={draw(t,e){const r=he(e/de);t.moveTo(r,0),t.arc(0,0,r,0,ye)}},me={draw(t,e){const r=he(e/5)/2;t.moveTo(-3*r,-r),t.lineTo(-r,-r),t.lineTo(-r,-3*r),t.lineTo(r,-3*r),t.lineTo(r,-r),t.lineTo(3*r,-r),t.lineTo(3*r,r),t.lineTo(r,r),t.lineTo(r,3*r),t.lineTo(-r,3*r),t.lineTo(-r,r),t.lineTo(-3*r,r),t.closePath()}},be=he(1/3),ge=2*be,xe={draw(t,e){const r=he(e/ge),n=r*be;t.moveTo(0,-r),t.lineTo(n,0),t.lineTo(0,r),t.lineTo(-n,0),t.closePath()}},we={draw(t,e){const r=he(e),n=-r/2;t.rect(n,n,r,r)}},Oe=pe(de/10)/pe(7*de/10),je=pe(ye/10)*Oe,Se=-fe(ye/10)*Oe,Pe={draw(t,e){const r=he(.8908130915292852*e),n=je*r,o=Se*r;t.moveTo(0,-r),t.lineTo(n,o);for(let e=1;e<5;++e){const i=ye*e/5,a=fe(i),c=pe(i);t.lineTo(c*r,-a*r),t.lineTo(a*n-c*o,c*n+a*o)}t.closePath()}},Ee=he(3),Ae={draw(t,e){const r=-he(e/(3*Ee));t.moveTo(0,2*r),t.lineTo(-Ee*r,-r),t.lineTo(Ee*r,-r),t.closePath()}},ke=-.5,_e=he(3)/2,Me=1/he(12),Te=3*(Me/2+1),Ce={draw(t,e){const r=he(e/Te),n=r/2,o=r*Me,i=n,a=r*Me+r,c=-i,u=a;t.moveTo(n,o),t.lineTo(i,a),t.lineTo(c,u),t.lineTo(ke*n-_e*o,_e*n+ke*o),t.lineTo(ke*i-_e*a,_e*i+ke*a),t.lineTo(ke*c-_e*u,_e*c+ke*u),t.lineTo(ke*n+_e*o,ke*o-_e*n),t.lineTo(ke*i+_e*a,ke*a-_e*i),t.lineTo(ke*c+_e*u,ke*u-_e*c),t.closePath()}};function De(t){return function(){return t}}const Ie=Math.PI,Ne=2*Ie,Be=1e-6,Re=Ne-Be;function Le(t){this._+=t[0];for(let e=1,r=t.length;e<r;++e)this._+=arguments[e]+t[e]}class ze{constructor(t){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==t?Le:function(t){let e=Math.floor(t);if(!(e>=0))throw new Error(`invalid digits: ${t}`);if(e>15)return Le;const r=10**e;return function(t){this._+=t[0];for(let e=1,n=t.length;e<n;++e)this._+=Math.round(arguments[e]*r)/r+t[e]}}(t)}moveTo(t,e){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+e}`}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(t,e){this._append`L${this._x1=+t},${this._y1=+e}`}quadraticCurveTo(t,e,r,n){this._append`Q${+t},${+e},${this._x1=+r},${this._y1=+n}`}bezierCurveTo(t,e,r,n,o,i){this._append`C${+t},${+e},${+r},${+n},${this._x1=+o},${this._y1=+i}`}arcTo(t,e,r,n,o){if(t=+t,e=+e,r=+r,n=+n,(o=+o)<0)throw new Error(`negative radius: ${o}`);let i=this._x1,a=this._y1,c=r-t,u=n-e,l=i-t,s=a-e,f=l*l+s*s;if(null===this._x1)this._append`M${this._x1=t},${this._y1=e}`;else if(f>Be)if(Math.abs(s*c-u*l)>Be&&o){let p=r-i,h=n-a,d=c*c+u*u,y=p*p+h*h,v=Math.sqrt(d),m=Math.sqrt(f),b=o*Math.tan((Ie-Math.acos((d+f-y)/(2*v*m)))/2),g=b/m,x=b/v;Math.abs(g-1)>Be&&this._append`L${t+g*l},${e+g*s}`,this._append`A${o},${o},0,0,${+(s*p>l*h)},${this._x1=t+x*c},${this._y1=e+x*u}`}else this._append`L${this._x1=t},${this._y1=e}`}arc(t,e,r,n,o,i){if(t=+t,e=+e,i=!!i,(r=+r)<0)throw new Error(`negative radius: ${r}`);let a=r*Math.cos(n),c=r*Math.sin(n),u=t+a,l=e+c,s=1^i,f=i?n-o:o-n;null===this._x1?this._append`M${u},${l}`:(Math.abs(this._x1-u)>Be||Math.abs(this._y1-l)>Be)&&this._append`L${u},${l}`,r&&(f<0&&(f=f%Ne+Ne),f>Re?this._append`A${r},${r},0,1,${s},${t-a},${e-c}A${r},${r},0,1,${s},${this._x1=u},${this._y1=l}`:f>Be&&this._append`A${r},${r},0,${+(f>=Ie)},${s},${this._x1=t+r*Math.cos(o)},${this._y1=e+r*Math.sin(o)}`)}rect(t,e,r,n){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+e}h${r=+r}v${+n}h${-r}Z`}toString(){return this._}}function Fe(t){let e=3;return t.digits=function(r){if(!arguments.length)return e;if(null==r)e=null;else{const t=Math.floor(r);if(!(t>=0))throw new RangeError(`invalid digits: ${r}`);e=t}return t},()=>new ze(e)}function Ue(t){return Ue="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ue(t)}he(3),he(3);var $e=["type","size","sizeType"];function qe(){return qe=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},qe.apply(this,arguments)}function We(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Xe(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?We(Object(r),!0).forEach((function(e){He(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):We(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function He(t,e,r){var n;return n=function(t){if("object"!=Ue(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ue(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ue(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var Ge={symbolCircle:ve,symbolCross:me,symbolDiamond:xe,symbolSquare:we,symbolStar:Pe,symbolTriangle:Ae,symbolWye:Ce},Ve=Math.PI/180,Ye=function(t){var e,r,n=t.type,i=void 0===n?"circle":n,c=t.size,u=void 0===c?64:c,l=t.sizeType,s=void 0===l?"area":l,f=Xe(Xe({},function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,$e)),{},{type:i,size:u,sizeType:s}),p=f.className,h=f.cx,d=f.cy,y=nt(f,!0);return h===+h&&d===+d&&u===+u?o().createElement("path",qe({},y,{className:a("recharts-symbols",p),transform:"translate(".concat(h,", ").concat(d,")"),d:(e=function(t){var e="symbol".concat(se()(t));return Ge[e]||ve}(i),r=function(t,e){let r=null,n=Fe(o);function o(){let o;if(r||(r=o=n()),t.apply(this,arguments).draw(r,+e.apply(this,arguments)),o)return r=null,o+""||null}return t="function"==typeof t?t:De(t||ve),e="function"==typeof e?e:De(void 0===e?64:+e),o.type=function(e){return arguments.length?(t="function"==typeof e?e:De(e),o):t},o.size=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),o):e},o.context=function(t){return arguments.length?(r=null==t?null:t,o):r},o}().type(e).size(function(t,e,r){if("area"===e)return t;switch(r){case"cross":return 5*t*t/9;case"diamond":return.5*t*t/Math.sqrt(3);case"square":return t*t;case"star":var n=18*Ve;return 1.25*t*t*(Math.tan(n)-Math.tan(2*n)*Math.pow(Math.tan(n),2));case"triangle":return Math.sqrt(3)*t*t/4;case"wye":return(21-10*Math.sqrt(3))*t*t/8;default:return Math.PI*t*t/4}}(u,s,i)),r())})):null};function Ke(t){return Ke="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ke(t)}function Ze(){return Ze=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Ze.apply(this,arguments)}function Je(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Qe(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,or(n.key),n)}}function tr(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(tr=function(){return!!t})()}function er(t){return er=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},er(t)}function rr(t,e){return rr=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},rr(t,e)}function nr(t,e,r){return(e=or(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function or(t){var e=function(t){if("object"!=Ke(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ke(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Ke(e)?e:e+""}Ye.registerSymbol=function(t,e){Ge["symbol".concat(se()(t))]=e};var ir=32,ar=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=er(r=e),function(t,e){if(e&&("object"===Ke(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,tr()?Reflect.construct(r,n||[],er(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&rr(t,e)}(e,t),r=e,n=[{key:"renderIcon",value:function(t){var e=this.props.inactiveColor,r=16,n=ir/6,i=ir/3,a=t.inactive?e:t.color;if("plainline"===t.type)return o().createElement("line",{strokeWidth:4,fill:"none",stroke:a,strokeDasharray:t.payload.strokeDasharray,x1:0,y1:r,x2:ir,y2:r,className:"recharts-legend-icon"});if("line"===t.type)return o().createElement("path",{strokeWidth:4,fill:"none",stroke:a,d:"M0,".concat(r,"h").concat(i,"\n            A").concat(n,",").concat(n,",0,1,1,").concat(2*i,",").concat(r,"\n            H").concat(ir,"M").concat(2*i,",").concat(r,"\n            A").concat(n,",").concat(n,",0,1,1,").concat(i,",").concat(r),className:"recharts-legend-icon"});if("rect"===t.type)return o().createElement("path",{stroke:"none",fill:a,d:"M0,".concat(4,"h").concat(ir,"v").concat(24,"h").concat(-32,"z"),className:"recharts-legend-icon"});if(o().isValidElement(t.legendIcon)){var c=function(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Je(Object(r),!0).forEach((function(e){nr(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Je(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}({},t);return delete c.legendIcon,o().cloneElement(t.legendIcon,c)}return o().createElement(Ye,{fill:a,cx:r,cy:r,size:ir,sizeType:"diameter",type:t.type})}},{key:"renderItems",value:function(){var t=this,e=this.props,r=e.payload,n=e.iconSize,i=e.layout,c=e.formatter,u=e.inactiveColor,l={x:0,y:0,width:ir,height:ir},s={display:"horizontal"===i?"inline-block":"block",marginRight:10},f={display:"inline-block",verticalAlign:"middle",marginRight:4};return r.map((function(e,r){var i=e.formatter||c,p=a(nr(nr({"recharts-legend-item":!0},"legend-item-".concat(r),!0),"inactive",e.inactive));if("none"===e.type)return null;var h=C()(e.value)?null:e.value;k(!C()(e.value),'The name property is also required when using a function for the dataKey of a chart\'s cartesian components. Ex: <Bar name="Name of my Data"/>');var d=e.inactive?u:e.color;return o().createElement("li",Ze({className:p,style:s,key:"legend-item-".concat(r)},q(t.props,e,r)),o().createElement(xt,{width:n,height:n,viewBox:l,style:f},t.renderIcon(e)),o().createElement("span",{className:"recharts-legend-item-text",style:{color:d}},i?i(h,e,r):h))}))}},{key:"render",value:function(){var t=this.props,e=t.payload,r=t.layout,n=t.align;if(!e||!e.length)return null;var i={padding:0,margin:0,textAlign:"horizontal"===r?n:"left"};return o().createElement("ul",{className:"recharts-default-legend",style:i},this.renderItems())}}],n&&Qe(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(e.PureComponent);function cr(t){return cr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},cr(t)}nr(ar,"displayName","Legend"),nr(ar,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"middle",inactiveColor:"#ccc"});var ur=["ref"];function lr(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function sr(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?lr(Object(r),!0).forEach((function(e){yr(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):lr(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function fr(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,vr(n.key),n)}}function pr(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(pr=function(){return!!t})()}function hr(t){return hr=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},hr(t)}function dr(t,e){return dr=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},dr(t,e)}function yr(t,e,r){return(e=vr(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function vr(t){var e=function(t){if("object"!=cr(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=cr(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==cr(e)?e:e+""}function mr(t){return t.value}var br=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return yr((r=this,n=e,o=[].concat(a),n=hr(n),t=function(t,e){if(e&&("object"===cr(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,pr()?Reflect.construct(n,o||[],hr(r).constructor):n.apply(r,o))),"lastBoundingBox",{width:-1,height:-1}),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&dr(t,e)}(e,t),r=e,i=[{key:"getWithHeight",value:function(t,e){var r=sr(sr({},this.defaultProps),t.props).layout;return"vertical"===r&&g(t.props.height)?{height:t.props.height}:"horizontal"===r?{width:t.props.width||e}:null}}],(n=[{key:"componentDidMount",value:function(){this.updateBBox()}},{key:"componentDidUpdate",value:function(){this.updateBBox()}},{key:"getBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var t=this.wrapperNode.getBoundingClientRect();return t.height=this.wrapperNode.offsetHeight,t.width=this.wrapperNode.offsetWidth,t}return null}},{key:"updateBBox",value:function(){var t=this.props.onBBoxUpdate,e=this.getBBox();e?(Math.abs(e.width-this.lastBoundingBox.width)>1||Math.abs(e.height-this.lastBoundingBox.height)>1)&&(this.lastBoundingBox.width=e.width,this.lastBoundingBox.height=e.height,t&&t(e)):-1===this.lastBoundingBox.width&&-1===this.lastBoundingBox.height||(this.lastBoundingBox.width=-1,this.lastBoundingBox.height=-1,t&&t(null))}},{key:"getBBoxSnapshot",value:function(){return this.lastBoundingBox.width>=0&&this.lastBoundingBox.height>=0?sr({},this.lastBoundingBox):{width:0,height:0}}},{key:"getDefaultPosition",value:function(t){var e,r,n=this.props,o=n.layout,i=n.align,a=n.verticalAlign,c=n.margin,u=n.chartWidth,l=n.chartHeight;return t&&(void 0!==t.left&&null!==t.left||void 0!==t.right&&null!==t.right)||(e="center"===i&&"vertical"===o?{left:((u||0)-this.getBBoxSnapshot().width)/2}:"right"===i?{right:c&&c.right||0}:{left:c&&c.left||0}),t&&(void 0!==t.top&&null!==t.top||void 0!==t.bottom&&null!==t.bottom)||(r="middle"===a?{top:((l||0)-this.getBBoxSnapshot().height)/2}:"bottom"===a?{bottom:c&&c.bottom||0}:{top:c&&c.top||0}),sr(sr({},e),r)}},{key:"render",value:function(){var t=this,e=this.props,r=e.content,n=e.width,i=e.height,a=e.wrapperStyle,c=e.payloadUniqBy,u=e.payload,l=sr(sr({position:"absolute",width:n||"auto",height:i||"auto"},this.getDefaultPosition(a)),a);return o().createElement("div",{className:"recharts-legend-wrapper",style:l,ref:function(e){t.wrapperNode=e}},function(t,e){if(o().isValidElement(t))return o().cloneElement(t,e);if("function"==typeof t)return o().createElement(t,e);e.ref;var r=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(e,ur);return o().createElement(ar,r)}(r,sr(sr({},this.props),{},{payload:Zt(u,c,mr)})))}}])&&fr(r.prototype,n),i&&fr(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.PureComponent);function gr(){return gr=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},gr.apply(this,arguments)}yr(br,"displayName","Legend"),yr(br,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"bottom"});var xr=function(t){var e=t.cx,r=t.cy,n=t.r,i=t.className,c=a("recharts-dot",i);return e===+e&&r===+r&&n===+n?o().createElement("circle",gr({},nt(t,!1),$(t),{className:c,cx:e,cy:r,r:n})):null},wr=r(5556),Or=r.n(wr),jr=Object.getOwnPropertyNames,Sr=Object.getOwnPropertySymbols,Pr=Object.prototype.hasOwnProperty;function Er(t,e){return function(r,n,o){return t(r,n,o)&&e(r,n,o)}}function Ar(t){return function(e,r,n){if(!e||!r||"object"!=typeof e||"object"!=typeof r)return t(e,r,n);var o=n.cache,i=o.get(e),a=o.get(r);if(i&&a)return i===r&&a===e;o.set(e,r),o.set(r,e);var c=t(e,r,n);return o.delete(e),o.delete(r),c}}function kr(t){return jr(t).concat(Sr(t))}var _r=Object.hasOwn||function(t,e){return Pr.call(t,e)};function Mr(t,e){return t===e||!t&&!e&&t!=t&&e!=e}var Tr=Object.getOwnPropertyDescriptor,Cr=Object.keys;function Dr(t,e,r){var n=t.length;if(e.length!==n)return!1;for(;n-- >0;)if(!r.equals(t[n],e[n],n,n,t,e,r))return!1;return!0}function Ir(t,e){return Mr(t.getTime(),e.getTime())}function Nr(t,e){return t.name===e.name&&t.message===e.message&&t.cause===e.cause&&t.stack===e.stack}function Br(t,e){return t===e}function Rr(t,e,r){var n=t.size;if(n!==e.size)return!1;if(!n)return!0;for(var o,i,a=new Array(n),c=t.entries(),u=0;(o=c.next())&&!o.done;){for(var l=e.entries(),s=!1,f=0;(i=l.next())&&!i.done;)if(a[f])f++;else{var p=o.value,h=i.value;if(r.equals(p[0],h[0],u,f,t,e,r)&&r.equals(p[1],h[1],p[0],h[0],t,e,r)){s=a[f]=!0;break}f++}if(!s)return!1;u++}return!0}var Lr=Mr;function zr(t,e,r){var n=Cr(t),o=n.length;if(Cr(e).length!==o)return!1;for(;o-- >0;)if(!Hr(t,e,r,n[o]))return!1;return!0}function Fr(t,e,r){var n,o,i,a=kr(t),c=a.length;if(kr(e).length!==c)return!1;for(;c-- >0;){if(!Hr(t,e,r,n=a[c]))return!1;if(o=Tr(t,n),i=Tr(e,n),(o||i)&&(!o||!i||o.configurable!==i.configurable||o.enumerable!==i.enumerable||o.writable!==i.writable))return!1}return!0}function Ur(t,e){return Mr(t.valueOf(),e.valueOf())}function $r(t,e){return t.source===e.source&&t.flags===e.flags}function qr(t,e,r){var n=t.size;if(n!==e.size)return!1;if(!n)return!0;for(var o,i,a=new Array(n),c=t.values();(o=c.next())&&!o.done;){for(var u=e.values(),l=!1,s=0;(i=u.next())&&!i.done;){if(!a[s]&&r.equals(o.value,i.value,o.value,i.value,t,e,r)){l=a[s]=!0;break}s++}if(!l)return!1}return!0}function Wr(t,e){var r=t.length;if(e.length!==r)return!1;for(;r-- >0;)if(t[r]!==e[r])return!1;return!0}function Xr(t,e){return t.hostname===e.hostname&&t.pathname===e.pathname&&t.protocol===e.protocol&&t.port===e.port&&t.hash===e.hash&&t.username===e.username&&t.password===e.password}function Hr(t,e,r,n){return!("_owner"!==n&&"__o"!==n&&"__v"!==n||!t.$$typeof&&!e.$$typeof)||_r(e,n)&&r.equals(t[n],e[n],n,n,t,e,r)}var Gr=Array.isArray,Vr="function"==typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView:null,Yr=Object.assign,Kr=Object.prototype.toString.call.bind(Object.prototype.toString),Zr=Jr();function Jr(t){void 0===t&&(t={});var e,r=t.circular,n=void 0!==r&&r,o=t.createInternalComparator,i=t.createState,a=t.strict,c=void 0!==a&&a,u=function(t){var e=t.circular,r=t.createCustomConfig,n=t.strict,o={areArraysEqual:n?Fr:Dr,areDatesEqual:Ir,areErrorsEqual:Nr,areFunctionsEqual:Br,areMapsEqual:n?Er(Rr,Fr):Rr,areNumbersEqual:Lr,areObjectsEqual:n?Fr:zr,arePrimitiveWrappersEqual:Ur,areRegExpsEqual:$r,areSetsEqual:n?Er(qr,Fr):qr,areTypedArraysEqual:n?Fr:Wr,areUrlsEqual:Xr};if(r&&(o=Yr({},o,r(o))),e){var i=Ar(o.areArraysEqual),a=Ar(o.areMapsEqual),c=Ar(o.areObjectsEqual),u=Ar(o.areSetsEqual);o=Yr({},o,{areArraysEqual:i,areMapsEqual:a,areObjectsEqual:c,areSetsEqual:u})}return o}(t),l=function(t){var e=t.areArraysEqual,r=t.areDatesEqual,n=t.areErrorsEqual,o=t.areFunctionsEqual,i=t.areMapsEqual,a=t.areNumbersEqual,c=t.areObjectsEqual,u=t.arePrimitiveWrappersEqual,l=t.areRegExpsEqual,s=t.areSetsEqual,f=t.areTypedArraysEqual,p=t.areUrlsEqual;return function(t,h,d){if(t===h)return!0;if(null==t||null==h)return!1;var y=typeof t;if(y!==typeof h)return!1;if("object"!==y)return"number"===y?a(t,h,d):"function"===y&&o(t,h,d);var v=t.constructor;if(v!==h.constructor)return!1;if(v===Object)return c(t,h,d);if(Gr(t))return e(t,h,d);if(null!=Vr&&Vr(t))return f(t,h,d);if(v===Date)return r(t,h,d);if(v===RegExp)return l(t,h,d);if(v===Map)return i(t,h,d);if(v===Set)return s(t,h,d);var m=Kr(t);return"[object Date]"===m?r(t,h,d):"[object RegExp]"===m?l(t,h,d):"[object Map]"===m?i(t,h,d):"[object Set]"===m?s(t,h,d):"[object Object]"===m?"function"!=typeof t.then&&"function"!=typeof h.then&&c(t,h,d):"[object URL]"===m?p(t,h,d):"[object Error]"===m?n(t,h,d):"[object Arguments]"===m?c(t,h,d):("[object Boolean]"===m||"[object Number]"===m||"[object String]"===m)&&u(t,h,d)}}(u),s=o?o(l):(e=l,function(t,r,n,o,i,a,c){return e(t,r,c)});return function(t){var e=t.circular,r=t.comparator,n=t.createState,o=t.equals,i=t.strict;if(n)return function(t,a){var c=n(),u=c.cache,l=void 0===u?e?new WeakMap:void 0:u,s=c.meta;return r(t,a,{cache:l,equals:o,meta:s,strict:i})};if(e)return function(t,e){return r(t,e,{cache:new WeakMap,equals:o,meta:void 0,strict:i})};var a={cache:void 0,equals:o,meta:void 0,strict:i};return function(t,e){return r(t,e,a)}}({circular:n,comparator:l,createState:i,equals:s,strict:c})}function Qr(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,r=-1;requestAnimationFrame((function n(o){r<0&&(r=o),o-r>e?(t(o),r=-1):function(t){"undefined"!=typeof requestAnimationFrame&&requestAnimationFrame(t)}(n)}))}function tn(t){return tn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},tn(t)}function en(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function rn(){var t=function(){return null},e=!1,r=function r(n){if(!e){if(Array.isArray(n)){if(!n.length)return;var o=function(t){if(Array.isArray(t))return t}(c=n)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(c)||function(t,e){if(t){if("string"==typeof t)return en(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?en(t,e):void 0}}(c)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}(),i=o[0],a=o.slice(1);return"number"==typeof i?void Qr(r.bind(null,a),i):(r(i),void Qr(r.bind(null,a)))}"object"===tn(n)&&t(n),"function"==typeof n&&n()}var c};return{stop:function(){e=!0},start:function(t){e=!1,r(t)},subscribe:function(e){return t=e,function(){t=function(){return null}}}}}function nn(t){return nn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},nn(t)}function on(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function an(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?on(Object(r),!0).forEach((function(e){cn(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):on(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function cn(t,e,r){return(e=function(t){var e=function(t){if("object"!==nn(t)||null===t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!==nn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"===nn(e)?e:String(e)}(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Jr({strict:!0}),Jr({circular:!0}),Jr({circular:!0,strict:!0}),Jr({createInternalComparator:function(){return Mr}}),Jr({strict:!0,createInternalComparator:function(){return Mr}}),Jr({circular:!0,createInternalComparator:function(){return Mr}}),Jr({circular:!0,createInternalComparator:function(){return Mr},strict:!0});var un=function(t){return t},ln=function(t,e){return Object.keys(e).reduce((function(r,n){return an(an({},r),{},cn({},n,t(n,e[n])))}),{})},sn=function(t,e,r){return t.map((function(t){return"".concat((n=t,n.replace(/([A-Z])/g,(function(t){return"-".concat(t.toLowerCase())})))," ").concat(e,"ms ").concat(r);var n})).join(",")};function fn(t,e){if(t){if("string"==typeof t)return pn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?pn(t,e):void 0}}function pn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var hn=1e-4,dn=function(t,e){return[0,3*t,3*e-6*t,3*t-3*e+1]},yn=function(t,e){return t.map((function(t,r){return t*Math.pow(e,r)})).reduce((function(t,e){return t+e}))},vn=function(t,e){return function(r){var n=dn(t,e);return yn(n,r)}},mn=function(){for(var t=arguments.length,e=new Array(t),r=0;r<t;r++)e[r]=arguments[r];var n,o,i=e[0],a=e[1],c=e[2],u=e[3];if(1===e.length)switch(e[0]){case"linear":i=0,a=0,c=1,u=1;break;case"ease":i=.25,a=.1,c=.25,u=1;break;case"ease-in":i=.42,a=0,c=1,u=1;break;case"ease-out":i=.42,a=0,c=.58,u=1;break;case"ease-in-out":i=0,a=0,c=.58,u=1;break;default:var l=e[0].split("(");if("cubic-bezier"===l[0]&&4===l[1].split(")")[0].split(",").length){var s=(n=l[1].split(")")[0].split(",").map((function(t){return parseFloat(t)})),o=4,function(t){if(Array.isArray(t))return t}(n)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(n,o)||fn(n,o)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}());i=s[0],a=s[1],c=s[2],u=s[3]}}[i,c,a,u].every((function(t){return"number"==typeof t&&t>=0&&t<=1}));var f,p,h=vn(i,c),d=vn(a,u),y=(f=i,p=c,function(t){var e=dn(f,p),r=[].concat(function(t){return function(t){if(Array.isArray(t))return pn(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||fn(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(e.map((function(t,e){return t*e})).slice(1)),[0]);return yn(r,t)}),v=function(t){return t>1?1:t<0?0:t},m=function(t){for(var e=t>1?1:t,r=e,n=0;n<8;++n){var o=h(r)-e,i=y(r);if(Math.abs(o-e)<hn||i<hn)return d(r);r=v(r-o/i)}return d(r)};return m.isStepper=!1,m};function bn(t){return bn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},bn(t)}function gn(t){return function(t){if(Array.isArray(t))return Sn(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||jn(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function xn(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function wn(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?xn(Object(r),!0).forEach((function(e){On(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):xn(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function On(t,e,r){return(e=function(t){var e=function(t){if("object"!==bn(t)||null===t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!==bn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"===bn(e)?e:String(e)}(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function jn(t,e){if(t){if("string"==typeof t)return Sn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Sn(t,e):void 0}}function Sn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var Pn=function(t,e,r){return t+(e-t)*r},En=function(t){return t.from!==t.to},An=function t(e,r,n){var o=ln((function(t,r){if(En(r)){var n=(a=e(r.from,r.to,r.velocity),c=2,function(t){if(Array.isArray(t))return t}(a)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(a,c)||jn(a,c)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),o=n[0],i=n[1];return wn(wn({},r),{},{from:o,velocity:i})}var a,c;return r}),r);return n<1?ln((function(t,e){return En(e)?wn(wn({},e),{},{velocity:Pn(e.velocity,o[t].velocity,n),from:Pn(e.from,o[t].from,n)}):e}),r):t(e,o,n-1)};function kn(t){return kn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},kn(t)}var _n=["children","begin","duration","attributeName","easing","isActive","steps","from","to","canBegin","onAnimationEnd","shouldReAnimate","onAnimationReStart"];function Mn(t){return function(t){if(Array.isArray(t))return Tn(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return Tn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Tn(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Cn(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Dn(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Cn(Object(r),!0).forEach((function(e){In(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Cn(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function In(t,e,r){return(e=Bn(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Nn(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Bn(n.key),n)}}function Bn(t){var e=function(t){if("object"!==kn(t)||null===t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!==kn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"===kn(e)?e:String(e)}function Rn(t,e){return Rn=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Rn(t,e)}function Ln(t,e){if(e&&("object"===kn(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return zn(t)}function zn(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}function Fn(t){return Fn=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Fn(t)}var Un=function(t){!function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Rn(t,e)}(u,t);var r,n,i,a,c=(i=u,a=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(t){return!1}}(),function(){var t,e=Fn(i);if(a){var r=Fn(this).constructor;t=Reflect.construct(e,arguments,r)}else t=e.apply(this,arguments);return Ln(this,t)});function u(t,e){var r;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,u);var n=(r=c.call(this,t,e)).props,o=n.isActive,i=n.attributeName,a=n.from,l=n.to,s=n.steps,f=n.children,p=n.duration;if(r.handleStyleChange=r.handleStyleChange.bind(zn(r)),r.changeStyle=r.changeStyle.bind(zn(r)),!o||p<=0)return r.state={style:{}},"function"==typeof f&&(r.state={style:l}),Ln(r);if(s&&s.length)r.state={style:s[0].style};else if(a){if("function"==typeof f)return r.state={style:a},Ln(r);r.state={style:i?In({},i,a):a}}else r.state={style:{}};return r}return r=u,(n=[{key:"componentDidMount",value:function(){var t=this.props,e=t.isActive,r=t.canBegin;this.mounted=!0,e&&r&&this.runAnimation(this.props)}},{key:"componentDidUpdate",value:function(t){var e=this.props,r=e.isActive,n=e.canBegin,o=e.attributeName,i=e.shouldReAnimate,a=e.to,c=e.from,u=this.state.style;if(n)if(r){if(!(Zr(t.to,a)&&t.canBegin&&t.isActive)){var l=!t.canBegin||!t.isActive;this.manager&&this.manager.stop(),this.stopJSAnimation&&this.stopJSAnimation();var s=l||i?c:t.to;if(this.state&&u){var f={style:o?In({},o,s):s};(o&&u[o]!==s||!o&&u!==s)&&this.setState(f)}this.runAnimation(Dn(Dn({},this.props),{},{from:s,begin:0}))}}else{var p={style:o?In({},o,a):a};this.state&&u&&(o&&u[o]!==a||!o&&u!==a)&&this.setState(p)}}},{key:"componentWillUnmount",value:function(){this.mounted=!1;var t=this.props.onAnimationEnd;this.unSubscribe&&this.unSubscribe(),this.manager&&(this.manager.stop(),this.manager=null),this.stopJSAnimation&&this.stopJSAnimation(),t&&t()}},{key:"handleStyleChange",value:function(t){this.changeStyle(t)}},{key:"changeStyle",value:function(t){this.mounted&&this.setState({style:t})}},{key:"runJSAnimation",value:function(t){var e=this,r=t.from,n=t.to,o=t.duration,i=t.easing,a=t.begin,c=t.onAnimationEnd,u=t.onAnimationStart,l=function(t,e,r,n,o){var i,a,c,u,l=(i=t,a=e,[Object.keys(i),Object.keys(a)].reduce((function(t,e){return t.filter((function(t){return e.includes(t)}))}))),s=l.reduce((function(r,n){return wn(wn({},r),{},On({},n,[t[n],e[n]]))}),{}),f=l.reduce((function(r,n){return wn(wn({},r),{},On({},n,{from:t[n],velocity:0,to:e[n]}))}),{}),p=-1,h=function(){return null};return h=r.isStepper?function(n){c||(c=n);var i=(n-c)/r.dt;f=An(r,f,i),o(wn(wn(wn({},t),e),ln((function(t,e){return e.from}),f))),c=n,Object.values(f).filter(En).length&&(p=requestAnimationFrame(h))}:function(i){u||(u=i);var a=(i-u)/n,c=ln((function(t,e){return Pn.apply(void 0,gn(e).concat([r(a)]))}),s);if(o(wn(wn(wn({},t),e),c)),a<1)p=requestAnimationFrame(h);else{var l=ln((function(t,e){return Pn.apply(void 0,gn(e).concat([r(1)]))}),s);o(wn(wn(wn({},t),e),l))}},function(){return requestAnimationFrame(h),function(){cancelAnimationFrame(p)}}}(r,n,function(){for(var t=arguments.length,e=new Array(t),r=0;r<t;r++)e[r]=arguments[r];var n=e[0];if("string"==typeof n)switch(n){case"ease":case"ease-in-out":case"ease-out":case"ease-in":case"linear":return mn(n);case"spring":return function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},e=t.stiff,r=void 0===e?100:e,n=t.damping,o=void 0===n?8:n,i=t.dt,a=void 0===i?17:i,c=function(t,e,n){var i=n+(-(t-e)*r-n*o)*a/1e3,c=n*a/1e3+t;return Math.abs(c-e)<hn&&Math.abs(i)<hn?[e,0]:[c,i]};return c.isStepper=!0,c.dt=a,c}();default:if("cubic-bezier"===n.split("(")[0])return mn(n)}return"function"==typeof n?n:null}(i),o,this.changeStyle);this.manager.start([u,a,function(){e.stopJSAnimation=l()},o,c])}},{key:"runStepAnimation",value:function(t){var e=this,r=t.steps,n=t.begin,o=t.onAnimationStart,i=r[0],a=i.style,c=i.duration,u=void 0===c?0:c;return this.manager.start([o].concat(Mn(r.reduce((function(t,n,o){if(0===o)return t;var i=n.duration,a=n.easing,c=void 0===a?"ease":a,u=n.style,l=n.properties,s=n.onAnimationEnd,f=o>0?r[o-1]:n,p=l||Object.keys(u);if("function"==typeof c||"spring"===c)return[].concat(Mn(t),[e.runJSAnimation.bind(e,{from:f.style,to:u,duration:i,easing:c}),i]);var h=sn(p,i,c),d=Dn(Dn(Dn({},f.style),u),{},{transition:h});return[].concat(Mn(t),[d,i,s]).filter(un)}),[a,Math.max(u,n)])),[t.onAnimationEnd]))}},{key:"runAnimation",value:function(t){this.manager||(this.manager=rn());var e=t.begin,r=t.duration,n=t.attributeName,o=t.to,i=t.easing,a=t.onAnimationStart,c=t.onAnimationEnd,u=t.steps,l=t.children,s=this.manager;if(this.unSubscribe=s.subscribe(this.handleStyleChange),"function"!=typeof i&&"function"!=typeof l&&"spring"!==i)if(u.length>1)this.runStepAnimation(t);else{var f=n?In({},n,o):o,p=sn(Object.keys(f),r,i);s.start([a,e,Dn(Dn({},f),{},{transition:p}),r,c])}else this.runJSAnimation(t)}},{key:"render",value:function(){var t=this.props,r=t.children,n=(t.begin,t.duration),i=(t.attributeName,t.easing,t.isActive),a=(t.steps,t.from,t.to,t.canBegin,t.onAnimationEnd,t.shouldReAnimate,t.onAnimationReStart,function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r,n,o={},i=Object.keys(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||(o[r]=t[r]);return o}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,_n)),c=e.Children.count(r),u=this.state.style;if("function"==typeof r)return r(u);if(!i||0===c||n<=0)return r;var l=function(t){var r=t.props,n=r.style,o=void 0===n?{}:n,i=r.className;return(0,e.cloneElement)(t,Dn(Dn({},a),{},{style:Dn(Dn({},o),u),className:i}))};return 1===c?l(e.Children.only(r)):o().createElement("div",null,e.Children.map(r,(function(t){return l(t)})))}}])&&Nn(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),u}(e.PureComponent);Un.displayName="Animate",Un.defaultProps={begin:0,duration:1e3,from:"",to:"",attributeName:"",easing:"ease",isActive:!0,canBegin:!0,steps:[],onAnimationEnd:function(){},onAnimationStart:function(){}},Un.propTypes={from:Or().oneOfType([Or().object,Or().string]),to:Or().oneOfType([Or().object,Or().string]),attributeName:Or().string,duration:Or().number,begin:Or().number,easing:Or().oneOfType([Or().string,Or().func]),steps:Or().arrayOf(Or().shape({duration:Or().number.isRequired,style:Or().object.isRequired,easing:Or().oneOfType([Or().oneOf(["ease","ease-in","ease-out","ease-in-out","linear"]),Or().func]),properties:Or().arrayOf("string"),onAnimationEnd:Or().func})),children:Or().oneOfType([Or().node,Or().func]),isActive:Or().bool,canBegin:Or().bool,onAnimationEnd:Or().func,shouldReAnimate:Or().bool,onAnimationStart:Or().func,onAnimationReStart:Or().func};const $n=Un;function qn(t){return qn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},qn(t)}function Wn(){return Wn=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Wn.apply(this,arguments)}function Xn(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Hn(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Gn(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Hn(Object(r),!0).forEach((function(e){Vn(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Hn(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Vn(t,e,r){var n;return n=function(t){if("object"!=qn(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=qn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==qn(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var Yn=function(t,e,r,n,o){var i,a=Math.min(Math.abs(r)/2,Math.abs(n)/2),c=n>=0?1:-1,u=r>=0?1:-1,l=n>=0&&r>=0||n<0&&r<0?1:0;if(a>0&&o instanceof Array){for(var s=[0,0,0,0],f=0;f<4;f++)s[f]=o[f]>a?a:o[f];i="M".concat(t,",").concat(e+c*s[0]),s[0]>0&&(i+="A ".concat(s[0],",").concat(s[0],",0,0,").concat(l,",").concat(t+u*s[0],",").concat(e)),i+="L ".concat(t+r-u*s[1],",").concat(e),s[1]>0&&(i+="A ".concat(s[1],",").concat(s[1],",0,0,").concat(l,",\n        ").concat(t+r,",").concat(e+c*s[1])),i+="L ".concat(t+r,",").concat(e+n-c*s[2]),s[2]>0&&(i+="A ".concat(s[2],",").concat(s[2],",0,0,").concat(l,",\n        ").concat(t+r-u*s[2],",").concat(e+n)),i+="L ".concat(t+u*s[3],",").concat(e+n),s[3]>0&&(i+="A ".concat(s[3],",").concat(s[3],",0,0,").concat(l,",\n        ").concat(t,",").concat(e+n-c*s[3])),i+="Z"}else if(a>0&&o===+o&&o>0){var p=Math.min(a,o);i="M ".concat(t,",").concat(e+c*p,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t+u*p,",").concat(e,"\n            L ").concat(t+r-u*p,",").concat(e,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t+r,",").concat(e+c*p,"\n            L ").concat(t+r,",").concat(e+n-c*p,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t+r-u*p,",").concat(e+n,"\n            L ").concat(t+u*p,",").concat(e+n,"\n            A ").concat(p,",").concat(p,",0,0,").concat(l,",").concat(t,",").concat(e+n-c*p," Z")}else i="M ".concat(t,",").concat(e," h ").concat(r," v ").concat(n," h ").concat(-r," Z");return i},Kn=function(t,e){if(!t||!e)return!1;var r=t.x,n=t.y,o=e.x,i=e.y,a=e.width,c=e.height;if(Math.abs(a)>0&&Math.abs(c)>0){var u=Math.min(o,o+a),l=Math.max(o,o+a),s=Math.min(i,i+c),f=Math.max(i,i+c);return r>=u&&r<=l&&n>=s&&n<=f}return!1},Zn={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},Jn=function(t){var r,n,i=Gn(Gn({},Zn),t),c=(0,e.useRef)(),u=(r=(0,e.useState)(-1),n=2,function(t){if(Array.isArray(t))return t}(r)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(r,n)||function(t,e){if(t){if("string"==typeof t)return Xn(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Xn(t,e):void 0}}(r,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),l=u[0],s=u[1];(0,e.useEffect)((function(){if(c.current&&c.current.getTotalLength)try{var t=c.current.getTotalLength();t&&s(t)}catch(t){}}),[]);var f=i.x,p=i.y,h=i.width,d=i.height,y=i.radius,v=i.className,m=i.animationEasing,b=i.animationDuration,g=i.animationBegin,x=i.isAnimationActive,w=i.isUpdateAnimationActive;if(f!==+f||p!==+p||h!==+h||d!==+d||0===h||0===d)return null;var O=a("recharts-rectangle",v);return w?o().createElement($n,{canBegin:l>0,from:{width:h,height:d,x:f,y:p},to:{width:h,height:d,x:f,y:p},duration:b,animationEasing:m,isActive:w},(function(t){var e=t.width,r=t.height,n=t.x,a=t.y;return o().createElement($n,{canBegin:l>0,from:"0px ".concat(-1===l?1:l,"px"),to:"".concat(l,"px 0px"),attributeName:"strokeDasharray",begin:g,duration:b,isActive:x,easing:m},o().createElement("path",Wn({},nt(i,!0),{className:O,d:Yn(n,a,e,r,y),ref:c})))})):o().createElement("path",Wn({},nt(i,!0),{className:O,d:Yn(f,p,h,d,y)}))};function Qn(t,e){switch(arguments.length){case 0:break;case 1:this.range(t);break;default:this.range(e).domain(t)}return this}function to(t,e){switch(arguments.length){case 0:break;case 1:"function"==typeof t?this.interpolator(t):this.range(t);break;default:this.domain(t),"function"==typeof e?this.interpolator(e):this.range(e)}return this}class eo extends Map{constructor(t,e=no){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:e}}),null!=t)for(const[e,r]of t)this.set(e,r)}get(t){return super.get(ro(this,t))}has(t){return super.has(ro(this,t))}set(t,e){return super.set(function({_intern:t,_key:e},r){const n=e(r);return t.has(n)?t.get(n):(t.set(n,r),r)}(this,t),e)}delete(t){return super.delete(function({_intern:t,_key:e},r){const n=e(r);return t.has(n)&&(r=t.get(n),t.delete(n)),r}(this,t))}}function ro({_intern:t,_key:e},r){const n=e(r);return t.has(n)?t.get(n):r}function no(t){return null!==t&&"object"==typeof t?t.valueOf():t}Set;const oo=Symbol("implicit");function io(){var t=new eo,e=[],r=[],n=oo;function o(o){let i=t.get(o);if(void 0===i){if(n!==oo)return n;t.set(o,i=e.push(o)-1)}return r[i%r.length]}return o.domain=function(r){if(!arguments.length)return e.slice();e=[],t=new eo;for(const n of r)t.has(n)||t.set(n,e.push(n)-1);return o},o.range=function(t){return arguments.length?(r=Array.from(t),o):r.slice()},o.unknown=function(t){return arguments.length?(n=t,o):n},o.copy=function(){return io(e,r).unknown(n)},Qn.apply(o,arguments),o}function ao(){var t,e,r=io().unknown(void 0),n=r.domain,o=r.range,i=0,a=1,c=!1,u=0,l=0,s=.5;function f(){var r=n().length,f=a<i,p=f?a:i,h=f?i:a;t=(h-p)/Math.max(1,r-u+2*l),c&&(t=Math.floor(t)),p+=(h-p-t*(r-u))*s,e=t*(1-u),c&&(p=Math.round(p),e=Math.round(e));var d=function(t,e,r){t=+t,e=+e,r=(o=arguments.length)<2?(e=t,t=0,1):o<3?1:+r;for(var n=-1,o=0|Math.max(0,Math.ceil((e-t)/r)),i=new Array(o);++n<o;)i[n]=t+n*r;return i}(r).map((function(e){return p+t*e}));return o(f?d.reverse():d)}return delete r.unknown,r.domain=function(t){return arguments.length?(n(t),f()):n()},r.range=function(t){return arguments.length?([i,a]=t,i=+i,a=+a,f()):[i,a]},r.rangeRound=function(t){return[i,a]=t,i=+i,a=+a,c=!0,f()},r.bandwidth=function(){return e},r.step=function(){return t},r.round=function(t){return arguments.length?(c=!!t,f()):c},r.padding=function(t){return arguments.length?(u=Math.min(1,l=+t),f()):u},r.paddingInner=function(t){return arguments.length?(u=Math.min(1,t),f()):u},r.paddingOuter=function(t){return arguments.length?(l=+t,f()):l},r.align=function(t){return arguments.length?(s=Math.max(0,Math.min(1,t)),f()):s},r.copy=function(){return ao(n(),[i,a]).round(c).paddingInner(u).paddingOuter(l).align(s)},Qn.apply(f(),arguments)}function co(t){var e=t.copy;return t.padding=t.paddingOuter,delete t.paddingInner,delete t.paddingOuter,t.copy=function(){return co(e())},t}function uo(){return co(ao.apply(null,arguments).paddingInner(1))}function lo(t){return lo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},lo(t)}function so(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function fo(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?so(Object(r),!0).forEach((function(e){po(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):so(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function po(t,e,r){var n;return n=function(t){if("object"!=lo(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=lo(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==lo(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var ho={widthCache:{},cacheCount:0},yo={position:"absolute",top:"-20000px",left:0,padding:0,margin:0,border:"none",whiteSpace:"pre"},vo="recharts_measurement_span",mo=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(null==t||Vt.isSsr)return{width:0,height:0};var r,n=(r=fo({},e),Object.keys(r).forEach((function(t){r[t]||delete r[t]})),r),o=JSON.stringify({text:t,copyStyle:n});if(ho.widthCache[o])return ho.widthCache[o];try{var i=document.getElementById(vo);i||((i=document.createElement("span")).setAttribute("id",vo),i.setAttribute("aria-hidden","true"),document.body.appendChild(i));var a=fo(fo({},yo),n);Object.assign(i.style,a),i.textContent="".concat(t);var c=i.getBoundingClientRect(),u={width:c.width,height:c.height};return ho.widthCache[o]=u,++ho.cacheCount>2e3&&(ho.cacheCount=0,ho.widthCache={}),u}catch(t){return{width:0,height:0}}};function bo(t){return bo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},bo(t)}function go(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return xo(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?xo(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function xo(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function wo(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Oo(n.key),n)}}function Oo(t){var e=function(t){if("object"!=bo(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=bo(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==bo(e)?e:e+""}var jo=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,So=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,Po=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,Eo=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,Ao={cm:96/2.54,mm:96/25.4,pt:96/72,pc:16,in:96,Q:96/101.6,px:1},ko=Object.keys(Ao),_o="NaN",Mo=function(){function t(e,r){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.num=e,this.unit=r,this.num=e,this.unit=r,Number.isNaN(e)&&(this.unit=""),""===r||Po.test(r)||(this.num=NaN,this.unit=""),ko.includes(r)&&(this.num=function(t,e){return t*Ao[e]}(e,r),this.unit="px")}return e=t,n=[{key:"parse",value:function(e){var r,n=go(null!==(r=Eo.exec(e))&&void 0!==r?r:[],3),o=n[1],i=n[2];return new t(parseFloat(o),null!=i?i:"")}}],(r=[{key:"add",value:function(e){return this.unit!==e.unit?new t(NaN,""):new t(this.num+e.num,this.unit)}},{key:"subtract",value:function(e){return this.unit!==e.unit?new t(NaN,""):new t(this.num-e.num,this.unit)}},{key:"multiply",value:function(e){return""!==this.unit&&""!==e.unit&&this.unit!==e.unit?new t(NaN,""):new t(this.num*e.num,this.unit||e.unit)}},{key:"divide",value:function(e){return""!==this.unit&&""!==e.unit&&this.unit!==e.unit?new t(NaN,""):new t(this.num/e.num,this.unit||e.unit)}},{key:"toString",value:function(){return"".concat(this.num).concat(this.unit)}},{key:"isNaN",value:function(){return Number.isNaN(this.num)}}])&&wo(e.prototype,r),n&&wo(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,r,n}();function To(t){if(t.includes(_o))return _o;for(var e=t;e.includes("*")||e.includes("/");){var r,n=go(null!==(r=jo.exec(e))&&void 0!==r?r:[],4),o=n[1],i=n[2],a=n[3],c=Mo.parse(null!=o?o:""),u=Mo.parse(null!=a?a:""),l="*"===i?c.multiply(u):c.divide(u);if(l.isNaN())return _o;e=e.replace(jo,l.toString())}for(;e.includes("+")||/.-\d+(?:\.\d+)?/.test(e);){var s,f=go(null!==(s=So.exec(e))&&void 0!==s?s:[],4),p=f[1],h=f[2],d=f[3],y=Mo.parse(null!=p?p:""),v=Mo.parse(null!=d?d:""),m="+"===h?y.add(v):y.subtract(v);if(m.isNaN())return _o;e=e.replace(So,m.toString())}return e}var Co=/\(([^()]*)\)/;function Do(t){var e=function(t){try{return function(t){var e=t.replace(/\s+/g,"");return e=function(t){for(var e=t;e.includes("(");){var r=go(Co.exec(e),2)[1];e=e.replace(Co,To(r))}return e}(e),To(e)}(t)}catch(t){return _o}}(t.slice(5,-1));return e===_o?"":e}var Io=["x","y","lineHeight","capHeight","scaleToFit","textAnchor","verticalAnchor","fill"],No=["dx","dy","angle","className","breakAll"];function Bo(){return Bo=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Bo.apply(this,arguments)}function Ro(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function Lo(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return zo(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?zo(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function zo(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var Fo=/[ \f\n\r\t\v\u2028\u2029]+/,Uo=function(t){var e=t.children,r=t.breakAll,n=t.style;try{var o=[];return M()(e)||(o=r?e.toString().split(""):e.toString().split(Fo)),{wordsWithComputedWidth:o.map((function(t){return{word:t,width:mo(t,n).width}})),spaceWidth:r?0:mo(" ",n).width}}catch(t){return null}},$o=function(t){return[{words:M()(t)?[]:t.toString().split(Fo)}]},qo="#808080",Wo=function(t){var r=t.x,n=void 0===r?0:r,i=t.y,c=void 0===i?0:i,u=t.lineHeight,l=void 0===u?"1em":u,s=t.capHeight,f=void 0===s?"0.71em":s,p=t.scaleToFit,h=void 0!==p&&p,d=t.textAnchor,y=void 0===d?"start":d,v=t.verticalAnchor,m=void 0===v?"end":v,b=t.fill,w=void 0===b?qo:b,O=Ro(t,Io),j=(0,e.useMemo)((function(){return function(t){var e=t.width,r=t.scaleToFit,n=t.children,o=t.style,i=t.breakAll,a=t.maxLines;if((e||r)&&!Vt.isSsr){var c=Uo({breakAll:i,children:n,style:o});return c?function(t,e,r,n,o){var i=t.maxLines,a=t.children,c=t.style,u=t.breakAll,l=g(i),s=a,f=function(){return(arguments.length>0&&void 0!==arguments[0]?arguments[0]:[]).reduce((function(t,e){var i=e.word,a=e.width,c=t[t.length-1];if(c&&(null==n||o||c.width+a+r<Number(n)))c.words.push(i),c.width+=a+r;else{var u={words:[i],width:a};t.push(u)}return t}),[])},p=f(e);if(!l)return p;for(var h,d=function(t){var e=s.slice(0,t),r=Uo({breakAll:u,style:c,children:e+"…"}).wordsWithComputedWidth,o=f(r),a=o.length>i||function(t){return t.reduce((function(t,e){return t.width>e.width?t:e}))}(o).width>Number(n);return[a,o]},y=0,v=s.length-1,m=0;y<=v&&m<=s.length-1;){var b=Math.floor((y+v)/2),x=Lo(d(b-1),2),w=x[0],O=x[1],j=Lo(d(b),1)[0];if(w||j||(y=b+1),w&&j&&(v=b-1),!w&&j){h=O;break}m++}return h||p}({breakAll:i,children:n,maxLines:a,style:o},c.wordsWithComputedWidth,c.spaceWidth,e,r):$o(n)}return $o(n)}({breakAll:O.breakAll,children:O.children,maxLines:O.maxLines,scaleToFit:h,style:O.style,width:O.width})}),[O.breakAll,O.children,O.maxLines,h,O.style,O.width]),S=O.dx,P=O.dy,E=O.angle,A=O.className,k=O.breakAll,_=Ro(O,No);if(!x(n)||!x(c))return null;var M,T=n+(g(S)?S:0),C=c+(g(P)?P:0);switch(m){case"start":M=Do("calc(".concat(f,")"));break;case"middle":M=Do("calc(".concat((j.length-1)/2," * -").concat(l," + (").concat(f," / 2))"));break;default:M=Do("calc(".concat(j.length-1," * -").concat(l,")"))}var D=[];if(h){var I=j[0].width,N=O.width;D.push("scale(".concat((g(N)?N/I:1)/I,")"))}return E&&D.push("rotate(".concat(E,", ").concat(T,", ").concat(C,")")),D.length&&(_.transform=D.join(" ")),o().createElement("text",Bo({},nt(_,!0),{x:T,y:C,className:a("recharts-text",A),textAnchor:y,fill:w.includes("url")?qo:w}),j.map((function(t,e){var r=t.words.join(k?"":" ");return o().createElement("tspan",{x:T,dy:0===e?M:l,key:"".concat(r,"-").concat(e)},r)})))};const Xo=Math.sqrt(50),Ho=Math.sqrt(10),Go=Math.sqrt(2);function Vo(t,e,r){const n=(e-t)/Math.max(0,r),o=Math.floor(Math.log10(n)),i=n/Math.pow(10,o),a=i>=Xo?10:i>=Ho?5:i>=Go?2:1;let c,u,l;return o<0?(l=Math.pow(10,-o)/a,c=Math.round(t*l),u=Math.round(e*l),c/l<t&&++c,u/l>e&&--u,l=-l):(l=Math.pow(10,o)*a,c=Math.round(t/l),u=Math.round(e/l),c*l<t&&++c,u*l>e&&--u),u<c&&.5<=r&&r<2?Vo(t,e,2*r):[c,u,l]}function Yo(t,e,r){if(!((r=+r)>0))return[];if((t=+t)==(e=+e))return[t];const n=e<t,[o,i,a]=n?Vo(e,t,r):Vo(t,e,r);if(!(i>=o))return[];const c=i-o+1,u=new Array(c);if(n)if(a<0)for(let t=0;t<c;++t)u[t]=(i-t)/-a;else for(let t=0;t<c;++t)u[t]=(i-t)*a;else if(a<0)for(let t=0;t<c;++t)u[t]=(o+t)/-a;else for(let t=0;t<c;++t)u[t]=(o+t)*a;return u}function Ko(t,e,r){return Vo(t=+t,e=+e,r=+r)[2]}function Zo(t,e,r){r=+r;const n=(e=+e)<(t=+t),o=n?Ko(e,t,r):Ko(t,e,r);return(n?-1:1)*(o<0?1/-o:o)}function Jo(t,e){return null==t||null==e?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Qo(t,e){return null==t||null==e?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function ti(t){let e,r,n;function o(t,n,o=0,i=t.length){if(o<i){if(0!==e(n,n))return i;do{const e=o+i>>>1;r(t[e],n)<0?o=e+1:i=e}while(o<i)}return o}return 2!==t.length?(e=Jo,r=(e,r)=>Jo(t(e),r),n=(e,r)=>t(e)-r):(e=t===Jo||t===Qo?t:ei,r=t,n=t),{left:o,center:function(t,e,r=0,i=t.length){const a=o(t,e,r,i-1);return a>r&&n(t[a-1],e)>-n(t[a],e)?a-1:a},right:function(t,n,o=0,i=t.length){if(o<i){if(0!==e(n,n))return i;do{const e=o+i>>>1;r(t[e],n)<=0?o=e+1:i=e}while(o<i)}return o}}}function ei(){return 0}function ri(t){return null===t?NaN:+t}const ni=ti(Jo),oi=ni.right,ii=(ni.left,ti(ri).center,oi);function ai(t,e,r){t.prototype=e.prototype=r,r.constructor=t}function ci(t,e){var r=Object.create(t.prototype);for(var n in e)r[n]=e[n];return r}function ui(){}var li=.7,si=1/li,fi="\\s*([+-]?\\d+)\\s*",pi="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",hi="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",di=/^#([0-9a-f]{3,8})$/,yi=new RegExp(`^rgb\\(${fi},${fi},${fi}\\)$`),vi=new RegExp(`^rgb\\(${hi},${hi},${hi}\\)$`),mi=new RegExp(`^rgba\\(${fi},${fi},${fi},${pi}\\)$`),bi=new RegExp(`^rgba\\(${hi},${hi},${hi},${pi}\\)$`),gi=new RegExp(`^hsl\\(${pi},${hi},${hi}\\)$`),xi=new RegExp(`^hsla\\(${pi},${hi},${hi},${pi}\\)$`),wi={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function Oi(){return this.rgb().formatHex()}function ji(){return this.rgb().formatRgb()}function Si(t){var e,r;return t=(t+"").trim().toLowerCase(),(e=di.exec(t))?(r=e[1].length,e=parseInt(e[1],16),6===r?Pi(e):3===r?new ki(e>>8&15|e>>4&240,e>>4&15|240&e,(15&e)<<4|15&e,1):8===r?Ei(e>>24&255,e>>16&255,e>>8&255,(255&e)/255):4===r?Ei(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|240&e,((15&e)<<4|15&e)/255):null):(e=yi.exec(t))?new ki(e[1],e[2],e[3],1):(e=vi.exec(t))?new ki(255*e[1]/100,255*e[2]/100,255*e[3]/100,1):(e=mi.exec(t))?Ei(e[1],e[2],e[3],e[4]):(e=bi.exec(t))?Ei(255*e[1]/100,255*e[2]/100,255*e[3]/100,e[4]):(e=gi.exec(t))?Ii(e[1],e[2]/100,e[3]/100,1):(e=xi.exec(t))?Ii(e[1],e[2]/100,e[3]/100,e[4]):wi.hasOwnProperty(t)?Pi(wi[t]):"transparent"===t?new ki(NaN,NaN,NaN,0):null}function Pi(t){return new ki(t>>16&255,t>>8&255,255&t,1)}function Ei(t,e,r,n){return n<=0&&(t=e=r=NaN),new ki(t,e,r,n)}function Ai(t,e,r,n){return 1===arguments.length?((o=t)instanceof ui||(o=Si(o)),o?new ki((o=o.rgb()).r,o.g,o.b,o.opacity):new ki):new ki(t,e,r,null==n?1:n);var o}function ki(t,e,r,n){this.r=+t,this.g=+e,this.b=+r,this.opacity=+n}function _i(){return`#${Di(this.r)}${Di(this.g)}${Di(this.b)}`}function Mi(){const t=Ti(this.opacity);return`${1===t?"rgb(":"rgba("}${Ci(this.r)}, ${Ci(this.g)}, ${Ci(this.b)}${1===t?")":`, ${t})`}`}function Ti(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function Ci(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function Di(t){return((t=Ci(t))<16?"0":"")+t.toString(16)}function Ii(t,e,r,n){return n<=0?t=e=r=NaN:r<=0||r>=1?t=e=NaN:e<=0&&(t=NaN),new Bi(t,e,r,n)}function Ni(t){if(t instanceof Bi)return new Bi(t.h,t.s,t.l,t.opacity);if(t instanceof ui||(t=Si(t)),!t)return new Bi;if(t instanceof Bi)return t;var e=(t=t.rgb()).r/255,r=t.g/255,n=t.b/255,o=Math.min(e,r,n),i=Math.max(e,r,n),a=NaN,c=i-o,u=(i+o)/2;return c?(a=e===i?(r-n)/c+6*(r<n):r===i?(n-e)/c+2:(e-r)/c+4,c/=u<.5?i+o:2-i-o,a*=60):c=u>0&&u<1?0:a,new Bi(a,c,u,t.opacity)}function Bi(t,e,r,n){this.h=+t,this.s=+e,this.l=+r,this.opacity=+n}function Ri(t){return(t=(t||0)%360)<0?t+360:t}function Li(t){return Math.max(0,Math.min(1,t||0))}function zi(t,e,r){return 255*(t<60?e+(r-e)*t/60:t<180?r:t<240?e+(r-e)*(240-t)/60:e)}function Fi(t,e,r,n,o){var i=t*t,a=i*t;return((1-3*t+3*i-a)*e+(4-6*i+3*a)*r+(1+3*t+3*i-3*a)*n+a*o)/6}ai(ui,Si,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:Oi,formatHex:Oi,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return Ni(this).formatHsl()},formatRgb:ji,toString:ji}),ai(ki,Ai,ci(ui,{brighter(t){return t=null==t?si:Math.pow(si,t),new ki(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=null==t?li:Math.pow(li,t),new ki(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new ki(Ci(this.r),Ci(this.g),Ci(this.b),Ti(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:_i,formatHex:_i,formatHex8:function(){return`#${Di(this.r)}${Di(this.g)}${Di(this.b)}${Di(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:Mi,toString:Mi})),ai(Bi,(function(t,e,r,n){return 1===arguments.length?Ni(t):new Bi(t,e,r,null==n?1:n)}),ci(ui,{brighter(t){return t=null==t?si:Math.pow(si,t),new Bi(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=null==t?li:Math.pow(li,t),new Bi(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+360*(this.h<0),e=isNaN(t)||isNaN(this.s)?0:this.s,r=this.l,n=r+(r<.5?r:1-r)*e,o=2*r-n;return new ki(zi(t>=240?t-240:t+120,o,n),zi(t,o,n),zi(t<120?t+240:t-120,o,n),this.opacity)},clamp(){return new Bi(Ri(this.h),Li(this.s),Li(this.l),Ti(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const t=Ti(this.opacity);return`${1===t?"hsl(":"hsla("}${Ri(this.h)}, ${100*Li(this.s)}%, ${100*Li(this.l)}%${1===t?")":`, ${t})`}`}}));const Ui=t=>()=>t;function $i(t,e){var r=e-t;return r?function(t,e){return function(r){return t+r*e}}(t,r):Ui(isNaN(t)?e:t)}const qi=function t(e){var r=function(t){return 1==(t=+t)?$i:function(e,r){return r-e?function(t,e,r){return t=Math.pow(t,r),e=Math.pow(e,r)-t,r=1/r,function(n){return Math.pow(t+n*e,r)}}(e,r,t):Ui(isNaN(e)?r:e)}}(e);function n(t,e){var n=r((t=Ai(t)).r,(e=Ai(e)).r),o=r(t.g,e.g),i=r(t.b,e.b),a=$i(t.opacity,e.opacity);return function(e){return t.r=n(e),t.g=o(e),t.b=i(e),t.opacity=a(e),t+""}}return n.gamma=t,n}(1);function Wi(t){return function(e){var r,n,o=e.length,i=new Array(o),a=new Array(o),c=new Array(o);for(r=0;r<o;++r)n=Ai(e[r]),i[r]=n.r||0,a[r]=n.g||0,c[r]=n.b||0;return i=t(i),a=t(a),c=t(c),n.opacity=1,function(t){return n.r=i(t),n.g=a(t),n.b=c(t),n+""}}}function Xi(t,e){var r,n=e?e.length:0,o=t?Math.min(n,t.length):0,i=new Array(o),a=new Array(n);for(r=0;r<o;++r)i[r]=Qi(t[r],e[r]);for(;r<n;++r)a[r]=e[r];return function(t){for(r=0;r<o;++r)a[r]=i[r](t);return a}}function Hi(t,e){var r=new Date;return t=+t,e=+e,function(n){return r.setTime(t*(1-n)+e*n),r}}function Gi(t,e){return t=+t,e=+e,function(r){return t*(1-r)+e*r}}function Vi(t,e){var r,n={},o={};for(r in null!==t&&"object"==typeof t||(t={}),null!==e&&"object"==typeof e||(e={}),e)r in t?n[r]=Qi(t[r],e[r]):o[r]=e[r];return function(t){for(r in n)o[r]=n[r](t);return o}}Wi((function(t){var e=t.length-1;return function(r){var n=r<=0?r=0:r>=1?(r=1,e-1):Math.floor(r*e),o=t[n],i=t[n+1],a=n>0?t[n-1]:2*o-i,c=n<e-1?t[n+2]:2*i-o;return Fi((r-n/e)*e,a,o,i,c)}})),Wi((function(t){var e=t.length;return function(r){var n=Math.floor(((r%=1)<0?++r:r)*e),o=t[(n+e-1)%e],i=t[n%e],a=t[(n+1)%e],c=t[(n+2)%e];return Fi((r-n/e)*e,o,i,a,c)}}));var Yi=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Ki=new RegExp(Yi.source,"g");function Zi(t,e){var r,n,o,i=Yi.lastIndex=Ki.lastIndex=0,a=-1,c=[],u=[];for(t+="",e+="";(r=Yi.exec(t))&&(n=Ki.exec(e));)(o=n.index)>i&&(o=e.slice(i,o),c[a]?c[a]+=o:c[++a]=o),(r=r[0])===(n=n[0])?c[a]?c[a]+=n:c[++a]=n:(c[++a]=null,u.push({i:a,x:Gi(r,n)})),i=Ki.lastIndex;return i<e.length&&(o=e.slice(i),c[a]?c[a]+=o:c[++a]=o),c.length<2?u[0]?function(t){return function(e){return t(e)+""}}(u[0].x):function(t){return function(){return t}}(e):(e=u.length,function(t){for(var r,n=0;n<e;++n)c[(r=u[n]).i]=r.x(t);return c.join("")})}function Ji(t,e){e||(e=[]);var r,n=t?Math.min(e.length,t.length):0,o=e.slice();return function(i){for(r=0;r<n;++r)o[r]=t[r]*(1-i)+e[r]*i;return o}}function Qi(t,e){var r,n,o=typeof e;return null==e||"boolean"===o?Ui(e):("number"===o?Gi:"string"===o?(r=Si(e))?(e=r,qi):Zi:e instanceof Si?qi:e instanceof Date?Hi:(n=e,!ArrayBuffer.isView(n)||n instanceof DataView?Array.isArray(e)?Xi:"function"!=typeof e.valueOf&&"function"!=typeof e.toString||isNaN(e)?Vi:Gi:Ji))(t,e)}function ta(t,e){return t=+t,e=+e,function(r){return Math.round(t*(1-r)+e*r)}}function ea(t){return+t}var ra=[0,1];function na(t){return t}function oa(t,e){return(e-=t=+t)?function(r){return(r-t)/e}:(r=isNaN(e)?NaN:.5,function(){return r});var r}function ia(t,e,r){var n=t[0],o=t[1],i=e[0],a=e[1];return o<n?(n=oa(o,n),i=r(a,i)):(n=oa(n,o),i=r(i,a)),function(t){return i(n(t))}}function aa(t,e,r){var n=Math.min(t.length,e.length)-1,o=new Array(n),i=new Array(n),a=-1;for(t[n]<t[0]&&(t=t.slice().reverse(),e=e.slice().reverse());++a<n;)o[a]=oa(t[a],t[a+1]),i[a]=r(e[a],e[a+1]);return function(e){var r=ii(t,e,1,n)-1;return i[r](o[r](e))}}function ca(t,e){return e.domain(t.domain()).range(t.range()).interpolate(t.interpolate()).clamp(t.clamp()).unknown(t.unknown())}function ua(){var t,e,r,n,o,i,a=ra,c=ra,u=Qi,l=na;function s(){var t=Math.min(a.length,c.length);return l!==na&&(l=function(t,e){var r;return t>e&&(r=t,t=e,e=r),function(r){return Math.max(t,Math.min(e,r))}}(a[0],a[t-1])),n=t>2?aa:ia,o=i=null,f}function f(e){return null==e||isNaN(e=+e)?r:(o||(o=n(a.map(t),c,u)))(t(l(e)))}return f.invert=function(r){return l(e((i||(i=n(c,a.map(t),Gi)))(r)))},f.domain=function(t){return arguments.length?(a=Array.from(t,ea),s()):a.slice()},f.range=function(t){return arguments.length?(c=Array.from(t),s()):c.slice()},f.rangeRound=function(t){return c=Array.from(t),u=ta,s()},f.clamp=function(t){return arguments.length?(l=!!t||na,s()):l!==na},f.interpolate=function(t){return arguments.length?(u=t,s()):u},f.unknown=function(t){return arguments.length?(r=t,f):r},function(r,n){return t=r,e=n,s()}}function la(){return ua()(na,na)}var sa,fa=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function pa(t){if(!(e=fa.exec(t)))throw new Error("invalid format: "+t);var e;return new ha({fill:e[1],align:e[2],sign:e[3],symbol:e[4],zero:e[5],width:e[6],comma:e[7],precision:e[8]&&e[8].slice(1),trim:e[9],type:e[10]})}function ha(t){this.fill=void 0===t.fill?" ":t.fill+"",this.align=void 0===t.align?">":t.align+"",this.sign=void 0===t.sign?"-":t.sign+"",this.symbol=void 0===t.symbol?"":t.symbol+"",this.zero=!!t.zero,this.width=void 0===t.width?void 0:+t.width,this.comma=!!t.comma,this.precision=void 0===t.precision?void 0:+t.precision,this.trim=!!t.trim,this.type=void 0===t.type?"":t.type+""}function da(t,e){if((r=(t=e?t.toExponential(e-1):t.toExponential()).indexOf("e"))<0)return null;var r,n=t.slice(0,r);return[n.length>1?n[0]+n.slice(2):n,+t.slice(r+1)]}function ya(t){return(t=da(Math.abs(t)))?t[1]:NaN}function va(t,e){var r=da(t,e);if(!r)return t+"";var n=r[0],o=r[1];return o<0?"0."+new Array(-o).join("0")+n:n.length>o+1?n.slice(0,o+1)+"."+n.slice(o+1):n+new Array(o-n.length+2).join("0")}pa.prototype=ha.prototype,ha.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};const ma={"%":(t,e)=>(100*t).toFixed(e),b:t=>Math.round(t).toString(2),c:t=>t+"",d:function(t){return Math.abs(t=Math.round(t))>=1e21?t.toLocaleString("en").replace(/,/g,""):t.toString(10)},e:(t,e)=>t.toExponential(e),f:(t,e)=>t.toFixed(e),g:(t,e)=>t.toPrecision(e),o:t=>Math.round(t).toString(8),p:(t,e)=>va(100*t,e),r:va,s:function(t,e){var r=da(t,e);if(!r)return t+"";var n=r[0],o=r[1],i=o-(sa=3*Math.max(-8,Math.min(8,Math.floor(o/3))))+1,a=n.length;return i===a?n:i>a?n+new Array(i-a+1).join("0"):i>0?n.slice(0,i)+"."+n.slice(i):"0."+new Array(1-i).join("0")+da(t,Math.max(0,e+i-1))[0]},X:t=>Math.round(t).toString(16).toUpperCase(),x:t=>Math.round(t).toString(16)};function ba(t){return t}var ga,xa,wa,Oa=Array.prototype.map,ja=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];function Sa(t,e,r,n){var o,i=Zo(t,e,r);switch((n=pa(null==n?",f":n)).type){case"s":var a=Math.max(Math.abs(t),Math.abs(e));return null!=n.precision||isNaN(o=function(t,e){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(ya(e)/3)))-ya(Math.abs(t)))}(i,a))||(n.precision=o),wa(n,a);case"":case"e":case"g":case"p":case"r":null!=n.precision||isNaN(o=function(t,e){return t=Math.abs(t),e=Math.abs(e)-t,Math.max(0,ya(e)-ya(t))+1}(i,Math.max(Math.abs(t),Math.abs(e))))||(n.precision=o-("e"===n.type));break;case"f":case"%":null!=n.precision||isNaN(o=function(t){return Math.max(0,-ya(Math.abs(t)))}(i))||(n.precision=o-2*("%"===n.type))}return xa(n)}function Pa(t){var e=t.domain;return t.ticks=function(t){var r=e();return Yo(r[0],r[r.length-1],null==t?10:t)},t.tickFormat=function(t,r){var n=e();return Sa(n[0],n[n.length-1],null==t?10:t,r)},t.nice=function(r){null==r&&(r=10);var n,o,i=e(),a=0,c=i.length-1,u=i[a],l=i[c],s=10;for(l<u&&(o=u,u=l,l=o,o=a,a=c,c=o);s-- >0;){if((o=Ko(u,l,r))===n)return i[a]=u,i[c]=l,e(i);if(o>0)u=Math.floor(u/o)*o,l=Math.ceil(l/o)*o;else{if(!(o<0))break;u=Math.ceil(u*o)/o,l=Math.floor(l*o)/o}n=o}return t},t}function Ea(){var t=la();return t.copy=function(){return ca(t,Ea())},Qn.apply(t,arguments),Pa(t)}function Aa(t){var e;function r(t){return null==t||isNaN(t=+t)?e:t}return r.invert=r,r.domain=r.range=function(e){return arguments.length?(t=Array.from(e,ea),r):t.slice()},r.unknown=function(t){return arguments.length?(e=t,r):e},r.copy=function(){return Aa(t).unknown(e)},t=arguments.length?Array.from(t,ea):[0,1],Pa(r)}function ka(t,e){var r,n=0,o=(t=t.slice()).length-1,i=t[n],a=t[o];return a<i&&(r=n,n=o,o=r,r=i,i=a,a=r),t[n]=e.floor(i),t[o]=e.ceil(a),t}function _a(t){return Math.log(t)}function Ma(t){return Math.exp(t)}function Ta(t){return-Math.log(-t)}function Ca(t){return-Math.exp(-t)}function Da(t){return isFinite(t)?+("1e"+t):t<0?0:t}function Ia(t){return(e,r)=>-t(-e,r)}function Na(t){const e=t(_a,Ma),r=e.domain;let n,o,i=10;function a(){return n=function(t){return t===Math.E?Math.log:10===t&&Math.log10||2===t&&Math.log2||(t=Math.log(t),e=>Math.log(e)/t)}(i),o=function(t){return 10===t?Da:t===Math.E?Math.exp:e=>Math.pow(t,e)}(i),r()[0]<0?(n=Ia(n),o=Ia(o),t(Ta,Ca)):t(_a,Ma),e}return e.base=function(t){return arguments.length?(i=+t,a()):i},e.domain=function(t){return arguments.length?(r(t),a()):r()},e.ticks=t=>{const e=r();let a=e[0],c=e[e.length-1];const u=c<a;u&&([a,c]=[c,a]);let l,s,f=n(a),p=n(c);const h=null==t?10:+t;let d=[];if(!(i%1)&&p-f<h){if(f=Math.floor(f),p=Math.ceil(p),a>0){for(;f<=p;++f)for(l=1;l<i;++l)if(s=f<0?l/o(-f):l*o(f),!(s<a)){if(s>c)break;d.push(s)}}else for(;f<=p;++f)for(l=i-1;l>=1;--l)if(s=f>0?l/o(-f):l*o(f),!(s<a)){if(s>c)break;d.push(s)}2*d.length<h&&(d=Yo(a,c,h))}else d=Yo(f,p,Math.min(p-f,h)).map(o);return u?d.reverse():d},e.tickFormat=(t,r)=>{if(null==t&&(t=10),null==r&&(r=10===i?"s":","),"function"!=typeof r&&(i%1||null!=(r=pa(r)).precision||(r.trim=!0),r=xa(r)),t===1/0)return r;const a=Math.max(1,i*t/e.ticks().length);return t=>{let e=t/o(Math.round(n(t)));return e*i<i-.5&&(e*=i),e<=a?r(t):""}},e.nice=()=>r(ka(r(),{floor:t=>o(Math.floor(n(t))),ceil:t=>o(Math.ceil(n(t)))})),e}function Ba(){const t=Na(ua()).domain([1,10]);return t.copy=()=>ca(t,Ba()).base(t.base()),Qn.apply(t,arguments),t}function Ra(t){return function(e){return Math.sign(e)*Math.log1p(Math.abs(e/t))}}function La(t){return function(e){return Math.sign(e)*Math.expm1(Math.abs(e))*t}}function za(t){var e=1,r=t(Ra(e),La(e));return r.constant=function(r){return arguments.length?t(Ra(e=+r),La(e)):e},Pa(r)}function Fa(){var t=za(ua());return t.copy=function(){return ca(t,Fa()).constant(t.constant())},Qn.apply(t,arguments)}function Ua(t){return function(e){return e<0?-Math.pow(-e,t):Math.pow(e,t)}}function $a(t){return t<0?-Math.sqrt(-t):Math.sqrt(t)}function qa(t){return t<0?-t*t:t*t}function Wa(t){var e=t(na,na),r=1;return e.exponent=function(e){return arguments.length?1==(r=+e)?t(na,na):.5===r?t($a,qa):t(Ua(r),Ua(1/r)):r},Pa(e)}function Xa(){var t=Wa(ua());return t.copy=function(){return ca(t,Xa()).exponent(t.exponent())},Qn.apply(t,arguments),t}function Ha(){return Xa.apply(null,arguments).exponent(.5)}function Ga(t){return Math.sign(t)*t*t}function Va(){var t,e=la(),r=[0,1],n=!1;function o(r){var o=function(t){return Math.sign(t)*Math.sqrt(Math.abs(t))}(e(r));return isNaN(o)?t:n?Math.round(o):o}return o.invert=function(t){return e.invert(Ga(t))},o.domain=function(t){return arguments.length?(e.domain(t),o):e.domain()},o.range=function(t){return arguments.length?(e.range((r=Array.from(t,ea)).map(Ga)),o):r.slice()},o.rangeRound=function(t){return o.range(t).round(!0)},o.round=function(t){return arguments.length?(n=!!t,o):n},o.clamp=function(t){return arguments.length?(e.clamp(t),o):e.clamp()},o.unknown=function(e){return arguments.length?(t=e,o):t},o.copy=function(){return Va(e.domain(),r).round(n).clamp(e.clamp()).unknown(t)},Qn.apply(o,arguments),Pa(o)}function Ya(t,e){let r;if(void 0===e)for(const e of t)null!=e&&(r<e||void 0===r&&e>=e)&&(r=e);else{let n=-1;for(let o of t)null!=(o=e(o,++n,t))&&(r<o||void 0===r&&o>=o)&&(r=o)}return r}function Ka(t,e){let r;if(void 0===e)for(const e of t)null!=e&&(r>e||void 0===r&&e>=e)&&(r=e);else{let n=-1;for(let o of t)null!=(o=e(o,++n,t))&&(r>o||void 0===r&&o>=o)&&(r=o)}return r}function Za(t,e){return(null==t||!(t>=t))-(null==e||!(e>=e))||(t<e?-1:t>e?1:0)}function Ja(t,e,r=0,n=1/0,o){if(e=Math.floor(e),r=Math.floor(Math.max(0,r)),n=Math.floor(Math.min(t.length-1,n)),!(r<=e&&e<=n))return t;for(o=void 0===o?Za:function(t=Jo){if(t===Jo)return Za;if("function"!=typeof t)throw new TypeError("compare is not a function");return(e,r)=>{const n=t(e,r);return n||0===n?n:(0===t(r,r))-(0===t(e,e))}}(o);n>r;){if(n-r>600){const i=n-r+1,a=e-r+1,c=Math.log(i),u=.5*Math.exp(2*c/3),l=.5*Math.sqrt(c*u*(i-u)/i)*(a-i/2<0?-1:1);Ja(t,e,Math.max(r,Math.floor(e-a*u/i+l)),Math.min(n,Math.floor(e+(i-a)*u/i+l)),o)}const i=t[e];let a=r,c=n;for(Qa(t,r,e),o(t[n],i)>0&&Qa(t,r,n);a<c;){for(Qa(t,a,c),++a,--c;o(t[a],i)<0;)++a;for(;o(t[c],i)>0;)--c}0===o(t[r],i)?Qa(t,r,c):(++c,Qa(t,c,n)),c<=e&&(r=c+1),e<=c&&(n=c-1)}return t}function Qa(t,e,r){const n=t[e];t[e]=t[r],t[r]=n}function tc(t,e,r=ri){if((n=t.length)&&!isNaN(e=+e)){if(e<=0||n<2)return+r(t[0],0,t);if(e>=1)return+r(t[n-1],n-1,t);var n,o=(n-1)*e,i=Math.floor(o),a=+r(t[i],i,t);return a+(+r(t[i+1],i+1,t)-a)*(o-i)}}function ec(){var t,e=[],r=[],n=[];function o(){var t=0,o=Math.max(1,r.length);for(n=new Array(o-1);++t<o;)n[t-1]=tc(e,t/o);return i}function i(e){return null==e||isNaN(e=+e)?t:r[ii(n,e)]}return i.invertExtent=function(t){var o=r.indexOf(t);return o<0?[NaN,NaN]:[o>0?n[o-1]:e[0],o<n.length?n[o]:e[e.length-1]]},i.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let r of t)null==r||isNaN(r=+r)||e.push(r);return e.sort(Jo),o()},i.range=function(t){return arguments.length?(r=Array.from(t),o()):r.slice()},i.unknown=function(e){return arguments.length?(t=e,i):t},i.quantiles=function(){return n.slice()},i.copy=function(){return ec().domain(e).range(r).unknown(t)},Qn.apply(i,arguments)}function rc(){var t,e=0,r=1,n=1,o=[.5],i=[0,1];function a(e){return null!=e&&e<=e?i[ii(o,e,0,n)]:t}function c(){var t=-1;for(o=new Array(n);++t<n;)o[t]=((t+1)*r-(t-n)*e)/(n+1);return a}return a.domain=function(t){return arguments.length?([e,r]=t,e=+e,r=+r,c()):[e,r]},a.range=function(t){return arguments.length?(n=(i=Array.from(t)).length-1,c()):i.slice()},a.invertExtent=function(t){var a=i.indexOf(t);return a<0?[NaN,NaN]:a<1?[e,o[0]]:a>=n?[o[n-1],r]:[o[a-1],o[a]]},a.unknown=function(e){return arguments.length?(t=e,a):a},a.thresholds=function(){return o.slice()},a.copy=function(){return rc().domain([e,r]).range(i).unknown(t)},Qn.apply(Pa(a),arguments)}function nc(){var t,e=[.5],r=[0,1],n=1;function o(o){return null!=o&&o<=o?r[ii(e,o,0,n)]:t}return o.domain=function(t){return arguments.length?(e=Array.from(t),n=Math.min(e.length,r.length-1),o):e.slice()},o.range=function(t){return arguments.length?(r=Array.from(t),n=Math.min(e.length,r.length-1),o):r.slice()},o.invertExtent=function(t){var n=r.indexOf(t);return[e[n-1],e[n]]},o.unknown=function(e){return arguments.length?(t=e,o):t},o.copy=function(){return nc().domain(e).range(r).unknown(t)},Qn.apply(o,arguments)}ga=function(t){var e,r,n=void 0===t.grouping||void 0===t.thousands?ba:(e=Oa.call(t.grouping,Number),r=t.thousands+"",function(t,n){for(var o=t.length,i=[],a=0,c=e[0],u=0;o>0&&c>0&&(u+c+1>n&&(c=Math.max(1,n-u)),i.push(t.substring(o-=c,o+c)),!((u+=c+1)>n));)c=e[a=(a+1)%e.length];return i.reverse().join(r)}),o=void 0===t.currency?"":t.currency[0]+"",i=void 0===t.currency?"":t.currency[1]+"",a=void 0===t.decimal?".":t.decimal+"",c=void 0===t.numerals?ba:function(t){return function(e){return e.replace(/[0-9]/g,(function(e){return t[+e]}))}}(Oa.call(t.numerals,String)),u=void 0===t.percent?"%":t.percent+"",l=void 0===t.minus?"−":t.minus+"",s=void 0===t.nan?"NaN":t.nan+"";function f(t){var e=(t=pa(t)).fill,r=t.align,f=t.sign,p=t.symbol,h=t.zero,d=t.width,y=t.comma,v=t.precision,m=t.trim,b=t.type;"n"===b?(y=!0,b="g"):ma[b]||(void 0===v&&(v=12),m=!0,b="g"),(h||"0"===e&&"="===r)&&(h=!0,e="0",r="=");var g="$"===p?o:"#"===p&&/[boxX]/.test(b)?"0"+b.toLowerCase():"",x="$"===p?i:/[%p]/.test(b)?u:"",w=ma[b],O=/[defgprs%]/.test(b);function j(t){var o,i,u,p=g,j=x;if("c"===b)j=w(t)+j,t="";else{var S=(t=+t)<0||1/t<0;if(t=isNaN(t)?s:w(Math.abs(t),v),m&&(t=function(t){t:for(var e,r=t.length,n=1,o=-1;n<r;++n)switch(t[n]){case".":o=e=n;break;case"0":0===o&&(o=n),e=n;break;default:if(!+t[n])break t;o>0&&(o=0)}return o>0?t.slice(0,o)+t.slice(e+1):t}(t)),S&&0==+t&&"+"!==f&&(S=!1),p=(S?"("===f?f:l:"-"===f||"("===f?"":f)+p,j=("s"===b?ja[8+sa/3]:"")+j+(S&&"("===f?")":""),O)for(o=-1,i=t.length;++o<i;)if(48>(u=t.charCodeAt(o))||u>57){j=(46===u?a+t.slice(o+1):t.slice(o))+j,t=t.slice(0,o);break}}y&&!h&&(t=n(t,1/0));var P=p.length+t.length+j.length,E=P<d?new Array(d-P+1).join(e):"";switch(y&&h&&(t=n(E+t,E.length?d-j.length:1/0),E=""),r){case"<":t=p+t+j+E;break;case"=":t=p+E+t+j;break;case"^":t=E.slice(0,P=E.length>>1)+p+t+j+E.slice(P);break;default:t=E+p+t+j}return c(t)}return v=void 0===v?6:/[gprs]/.test(b)?Math.max(1,Math.min(21,v)):Math.max(0,Math.min(20,v)),j.toString=function(){return t+""},j}return{format:f,formatPrefix:function(t,e){var r=f(((t=pa(t)).type="f",t)),n=3*Math.max(-8,Math.min(8,Math.floor(ya(e)/3))),o=Math.pow(10,-n),i=ja[8+n/3];return function(t){return r(o*t)+i}}}}({thousands:",",grouping:[3],currency:["$",""]}),xa=ga.format,wa=ga.formatPrefix;const oc=1e3,ic=6e4,ac=36e5,cc=864e5,uc=6048e5,lc=31536e6,sc=new Date,fc=new Date;function pc(t,e,r,n){function o(e){return t(e=0===arguments.length?new Date:new Date(+e)),e}return o.floor=e=>(t(e=new Date(+e)),e),o.ceil=r=>(t(r=new Date(r-1)),e(r,1),t(r),r),o.round=t=>{const e=o(t),r=o.ceil(t);return t-e<r-t?e:r},o.offset=(t,r)=>(e(t=new Date(+t),null==r?1:Math.floor(r)),t),o.range=(r,n,i)=>{const a=[];if(r=o.ceil(r),i=null==i?1:Math.floor(i),!(r<n&&i>0))return a;let c;do{a.push(c=new Date(+r)),e(r,i),t(r)}while(c<r&&r<n);return a},o.filter=r=>pc((e=>{if(e>=e)for(;t(e),!r(e);)e.setTime(e-1)}),((t,n)=>{if(t>=t)if(n<0)for(;++n<=0;)for(;e(t,-1),!r(t););else for(;--n>=0;)for(;e(t,1),!r(t););})),r&&(o.count=(e,n)=>(sc.setTime(+e),fc.setTime(+n),t(sc),t(fc),Math.floor(r(sc,fc))),o.every=t=>(t=Math.floor(t),isFinite(t)&&t>0?t>1?o.filter(n?e=>n(e)%t==0:e=>o.count(0,e)%t==0):o:null)),o}const hc=pc((()=>{}),((t,e)=>{t.setTime(+t+e)}),((t,e)=>e-t));hc.every=t=>(t=Math.floor(t),isFinite(t)&&t>0?t>1?pc((e=>{e.setTime(Math.floor(e/t)*t)}),((e,r)=>{e.setTime(+e+r*t)}),((e,r)=>(r-e)/t)):hc:null),hc.range;const dc=pc((t=>{t.setTime(t-t.getMilliseconds())}),((t,e)=>{t.setTime(+t+e*oc)}),((t,e)=>(e-t)/oc),(t=>t.getUTCSeconds())),yc=(dc.range,pc((t=>{t.setTime(t-t.getMilliseconds()-t.getSeconds()*oc)}),((t,e)=>{t.setTime(+t+e*ic)}),((t,e)=>(e-t)/ic),(t=>t.getMinutes()))),vc=(yc.range,pc((t=>{t.setUTCSeconds(0,0)}),((t,e)=>{t.setTime(+t+e*ic)}),((t,e)=>(e-t)/ic),(t=>t.getUTCMinutes()))),mc=(vc.range,pc((t=>{t.setTime(t-t.getMilliseconds()-t.getSeconds()*oc-t.getMinutes()*ic)}),((t,e)=>{t.setTime(+t+e*ac)}),((t,e)=>(e-t)/ac),(t=>t.getHours()))),bc=(mc.range,pc((t=>{t.setUTCMinutes(0,0,0)}),((t,e)=>{t.setTime(+t+e*ac)}),((t,e)=>(e-t)/ac),(t=>t.getUTCHours()))),gc=(bc.range,pc((t=>t.setHours(0,0,0,0)),((t,e)=>t.setDate(t.getDate()+e)),((t,e)=>(e-t-(e.getTimezoneOffset()-t.getTimezoneOffset())*ic)/cc),(t=>t.getDate()-1))),xc=(gc.range,pc((t=>{t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCDate(t.getUTCDate()+e)}),((t,e)=>(e-t)/cc),(t=>t.getUTCDate()-1))),wc=(xc.range,pc((t=>{t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCDate(t.getUTCDate()+e)}),((t,e)=>(e-t)/cc),(t=>Math.floor(t/cc))));function Oc(t){return pc((e=>{e.setDate(e.getDate()-(e.getDay()+7-t)%7),e.setHours(0,0,0,0)}),((t,e)=>{t.setDate(t.getDate()+7*e)}),((t,e)=>(e-t-(e.getTimezoneOffset()-t.getTimezoneOffset())*ic)/uc))}wc.range;const jc=Oc(0),Sc=Oc(1),Pc=Oc(2),Ec=Oc(3),Ac=Oc(4),kc=Oc(5),_c=Oc(6);function Mc(t){return pc((e=>{e.setUTCDate(e.getUTCDate()-(e.getUTCDay()+7-t)%7),e.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCDate(t.getUTCDate()+7*e)}),((t,e)=>(e-t)/uc))}jc.range,Sc.range,Pc.range,Ec.range,Ac.range,kc.range,_c.range;const Tc=Mc(0),Cc=Mc(1),Dc=Mc(2),Ic=Mc(3),Nc=Mc(4),Bc=Mc(5),Rc=Mc(6),Lc=(Tc.range,Cc.range,Dc.range,Ic.range,Nc.range,Bc.range,Rc.range,pc((t=>{t.setDate(1),t.setHours(0,0,0,0)}),((t,e)=>{t.setMonth(t.getMonth()+e)}),((t,e)=>e.getMonth()-t.getMonth()+12*(e.getFullYear()-t.getFullYear())),(t=>t.getMonth()))),zc=(Lc.range,pc((t=>{t.setUTCDate(1),t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCMonth(t.getUTCMonth()+e)}),((t,e)=>e.getUTCMonth()-t.getUTCMonth()+12*(e.getUTCFullYear()-t.getUTCFullYear())),(t=>t.getUTCMonth()))),Fc=(zc.range,pc((t=>{t.setMonth(0,1),t.setHours(0,0,0,0)}),((t,e)=>{t.setFullYear(t.getFullYear()+e)}),((t,e)=>e.getFullYear()-t.getFullYear()),(t=>t.getFullYear())));Fc.every=t=>isFinite(t=Math.floor(t))&&t>0?pc((e=>{e.setFullYear(Math.floor(e.getFullYear()/t)*t),e.setMonth(0,1),e.setHours(0,0,0,0)}),((e,r)=>{e.setFullYear(e.getFullYear()+r*t)})):null,Fc.range;const Uc=pc((t=>{t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)}),((t,e)=>{t.setUTCFullYear(t.getUTCFullYear()+e)}),((t,e)=>e.getUTCFullYear()-t.getUTCFullYear()),(t=>t.getUTCFullYear()));function $c(t,e,r,n,o,i){const a=[[dc,1,oc],[dc,5,5e3],[dc,15,15e3],[dc,30,3e4],[i,1,ic],[i,5,3e5],[i,15,9e5],[i,30,18e5],[o,1,ac],[o,3,108e5],[o,6,216e5],[o,12,432e5],[n,1,cc],[n,2,1728e5],[r,1,uc],[e,1,2592e6],[e,3,7776e6],[t,1,lc]];function c(e,r,n){const o=Math.abs(r-e)/n,i=ti((([,,t])=>t)).right(a,o);if(i===a.length)return t.every(Zo(e/lc,r/lc,n));if(0===i)return hc.every(Math.max(Zo(e,r,n),1));const[c,u]=a[o/a[i-1][2]<a[i][2]/o?i-1:i];return c.every(u)}return[function(t,e,r){const n=e<t;n&&([t,e]=[e,t]);const o=r&&"function"==typeof r.range?r:c(t,e,r),i=o?o.range(t,+e+1):[];return n?i.reverse():i},c]}Uc.every=t=>isFinite(t=Math.floor(t))&&t>0?pc((e=>{e.setUTCFullYear(Math.floor(e.getUTCFullYear()/t)*t),e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)}),((e,r)=>{e.setUTCFullYear(e.getUTCFullYear()+r*t)})):null,Uc.range;const[qc,Wc]=$c(Uc,zc,Tc,wc,bc,vc),[Xc,Hc]=$c(Fc,Lc,jc,gc,mc,yc);function Gc(t){if(0<=t.y&&t.y<100){var e=new Date(-1,t.m,t.d,t.H,t.M,t.S,t.L);return e.setFullYear(t.y),e}return new Date(t.y,t.m,t.d,t.H,t.M,t.S,t.L)}function Vc(t){if(0<=t.y&&t.y<100){var e=new Date(Date.UTC(-1,t.m,t.d,t.H,t.M,t.S,t.L));return e.setUTCFullYear(t.y),e}return new Date(Date.UTC(t.y,t.m,t.d,t.H,t.M,t.S,t.L))}function Yc(t,e,r){return{y:t,m:e,d:r,H:0,M:0,S:0,L:0}}var Kc,Zc,Jc,Qc={"-":"",_:" ",0:"0"},tu=/^\s*\d+/,eu=/^%/,ru=/[\\^$*+?|[\]().{}]/g;function nu(t,e,r){var n=t<0?"-":"",o=(n?-t:t)+"",i=o.length;return n+(i<r?new Array(r-i+1).join(e)+o:o)}function ou(t){return t.replace(ru,"\\$&")}function iu(t){return new RegExp("^(?:"+t.map(ou).join("|")+")","i")}function au(t){return new Map(t.map(((t,e)=>[t.toLowerCase(),e])))}function cu(t,e,r){var n=tu.exec(e.slice(r,r+1));return n?(t.w=+n[0],r+n[0].length):-1}function uu(t,e,r){var n=tu.exec(e.slice(r,r+1));return n?(t.u=+n[0],r+n[0].length):-1}function lu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.U=+n[0],r+n[0].length):-1}function su(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.V=+n[0],r+n[0].length):-1}function fu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.W=+n[0],r+n[0].length):-1}function pu(t,e,r){var n=tu.exec(e.slice(r,r+4));return n?(t.y=+n[0],r+n[0].length):-1}function hu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.y=+n[0]+(+n[0]>68?1900:2e3),r+n[0].length):-1}function du(t,e,r){var n=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(e.slice(r,r+6));return n?(t.Z=n[1]?0:-(n[2]+(n[3]||"00")),r+n[0].length):-1}function yu(t,e,r){var n=tu.exec(e.slice(r,r+1));return n?(t.q=3*n[0]-3,r+n[0].length):-1}function vu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.m=n[0]-1,r+n[0].length):-1}function mu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.d=+n[0],r+n[0].length):-1}function bu(t,e,r){var n=tu.exec(e.slice(r,r+3));return n?(t.m=0,t.d=+n[0],r+n[0].length):-1}function gu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.H=+n[0],r+n[0].length):-1}function xu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.M=+n[0],r+n[0].length):-1}function wu(t,e,r){var n=tu.exec(e.slice(r,r+2));return n?(t.S=+n[0],r+n[0].length):-1}function Ou(t,e,r){var n=tu.exec(e.slice(r,r+3));return n?(t.L=+n[0],r+n[0].length):-1}function ju(t,e,r){var n=tu.exec(e.slice(r,r+6));return n?(t.L=Math.floor(n[0]/1e3),r+n[0].length):-1}function Su(t,e,r){var n=eu.exec(e.slice(r,r+1));return n?r+n[0].length:-1}function Pu(t,e,r){var n=tu.exec(e.slice(r));return n?(t.Q=+n[0],r+n[0].length):-1}function Eu(t,e,r){var n=tu.exec(e.slice(r));return n?(t.s=+n[0],r+n[0].length):-1}function Au(t,e){return nu(t.getDate(),e,2)}function ku(t,e){return nu(t.getHours(),e,2)}function _u(t,e){return nu(t.getHours()%12||12,e,2)}function Mu(t,e){return nu(1+gc.count(Fc(t),t),e,3)}function Tu(t,e){return nu(t.getMilliseconds(),e,3)}function Cu(t,e){return Tu(t,e)+"000"}function Du(t,e){return nu(t.getMonth()+1,e,2)}function Iu(t,e){return nu(t.getMinutes(),e,2)}function Nu(t,e){return nu(t.getSeconds(),e,2)}function Bu(t){var e=t.getDay();return 0===e?7:e}function Ru(t,e){return nu(jc.count(Fc(t)-1,t),e,2)}function Lu(t){var e=t.getDay();return e>=4||0===e?Ac(t):Ac.ceil(t)}function zu(t,e){return t=Lu(t),nu(Ac.count(Fc(t),t)+(4===Fc(t).getDay()),e,2)}function Fu(t){return t.getDay()}function Uu(t,e){return nu(Sc.count(Fc(t)-1,t),e,2)}function $u(t,e){return nu(t.getFullYear()%100,e,2)}function qu(t,e){return nu((t=Lu(t)).getFullYear()%100,e,2)}function Wu(t,e){return nu(t.getFullYear()%1e4,e,4)}function Xu(t,e){var r=t.getDay();return nu((t=r>=4||0===r?Ac(t):Ac.ceil(t)).getFullYear()%1e4,e,4)}function Hu(t){var e=t.getTimezoneOffset();return(e>0?"-":(e*=-1,"+"))+nu(e/60|0,"0",2)+nu(e%60,"0",2)}function Gu(t,e){return nu(t.getUTCDate(),e,2)}function Vu(t,e){return nu(t.getUTCHours(),e,2)}function Yu(t,e){return nu(t.getUTCHours()%12||12,e,2)}function Ku(t,e){return nu(1+xc.count(Uc(t),t),e,3)}function Zu(t,e){return nu(t.getUTCMilliseconds(),e,3)}function Ju(t,e){return Zu(t,e)+"000"}function Qu(t,e){return nu(t.getUTCMonth()+1,e,2)}function tl(t,e){return nu(t.getUTCMinutes(),e,2)}function el(t,e){return nu(t.getUTCSeconds(),e,2)}function rl(t){var e=t.getUTCDay();return 0===e?7:e}function nl(t,e){return nu(Tc.count(Uc(t)-1,t),e,2)}function ol(t){var e=t.getUTCDay();return e>=4||0===e?Nc(t):Nc.ceil(t)}function il(t,e){return t=ol(t),nu(Nc.count(Uc(t),t)+(4===Uc(t).getUTCDay()),e,2)}function al(t){return t.getUTCDay()}function cl(t,e){return nu(Cc.count(Uc(t)-1,t),e,2)}function ul(t,e){return nu(t.getUTCFullYear()%100,e,2)}function ll(t,e){return nu((t=ol(t)).getUTCFullYear()%100,e,2)}function sl(t,e){return nu(t.getUTCFullYear()%1e4,e,4)}function fl(t,e){var r=t.getUTCDay();return nu((t=r>=4||0===r?Nc(t):Nc.ceil(t)).getUTCFullYear()%1e4,e,4)}function pl(){return"+0000"}function hl(){return"%"}function dl(t){return+t}function yl(t){return Math.floor(+t/1e3)}function vl(t){return new Date(t)}function ml(t){return t instanceof Date?+t:+new Date(+t)}function bl(t,e,r,n,o,i,a,c,u,l){var s=la(),f=s.invert,p=s.domain,h=l(".%L"),d=l(":%S"),y=l("%I:%M"),v=l("%I %p"),m=l("%a %d"),b=l("%b %d"),g=l("%B"),x=l("%Y");function w(t){return(u(t)<t?h:c(t)<t?d:a(t)<t?y:i(t)<t?v:n(t)<t?o(t)<t?m:b:r(t)<t?g:x)(t)}return s.invert=function(t){return new Date(f(t))},s.domain=function(t){return arguments.length?p(Array.from(t,ml)):p().map(vl)},s.ticks=function(e){var r=p();return t(r[0],r[r.length-1],null==e?10:e)},s.tickFormat=function(t,e){return null==e?w:l(e)},s.nice=function(t){var r=p();return t&&"function"==typeof t.range||(t=e(r[0],r[r.length-1],null==t?10:t)),t?p(ka(r,t)):s},s.copy=function(){return ca(s,bl(t,e,r,n,o,i,a,c,u,l))},s}function gl(){return Qn.apply(bl(Xc,Hc,Fc,Lc,jc,gc,mc,yc,dc,Zc).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function xl(){return Qn.apply(bl(qc,Wc,Uc,zc,Tc,xc,bc,vc,dc,Jc).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function wl(){var t,e,r,n,o,i=0,a=1,c=na,u=!1;function l(e){return null==e||isNaN(e=+e)?o:c(0===r?.5:(e=(n(e)-t)*r,u?Math.max(0,Math.min(1,e)):e))}function s(t){return function(e){var r,n;return arguments.length?([r,n]=e,c=t(r,n),l):[c(0),c(1)]}}return l.domain=function(o){return arguments.length?([i,a]=o,t=n(i=+i),e=n(a=+a),r=t===e?0:1/(e-t),l):[i,a]},l.clamp=function(t){return arguments.length?(u=!!t,l):u},l.interpolator=function(t){return arguments.length?(c=t,l):c},l.range=s(Qi),l.rangeRound=s(ta),l.unknown=function(t){return arguments.length?(o=t,l):o},function(o){return n=o,t=o(i),e=o(a),r=t===e?0:1/(e-t),l}}function Ol(t,e){return e.domain(t.domain()).interpolator(t.interpolator()).clamp(t.clamp()).unknown(t.unknown())}function jl(){var t=Pa(wl()(na));return t.copy=function(){return Ol(t,jl())},to.apply(t,arguments)}function Sl(){var t=Na(wl()).domain([1,10]);return t.copy=function(){return Ol(t,Sl()).base(t.base())},to.apply(t,arguments)}function Pl(){var t=za(wl());return t.copy=function(){return Ol(t,Pl()).constant(t.constant())},to.apply(t,arguments)}function El(){var t=Wa(wl());return t.copy=function(){return Ol(t,El()).exponent(t.exponent())},to.apply(t,arguments)}function Al(){return El.apply(null,arguments).exponent(.5)}function kl(){var t=[],e=na;function r(r){if(null!=r&&!isNaN(r=+r))return e((ii(t,r,1)-1)/(t.length-1))}return r.domain=function(e){if(!arguments.length)return t.slice();t=[];for(let r of e)null==r||isNaN(r=+r)||t.push(r);return t.sort(Jo),r},r.interpolator=function(t){return arguments.length?(e=t,r):e},r.range=function(){return t.map(((r,n)=>e(n/(t.length-1))))},r.quantiles=function(e){return Array.from({length:e+1},((r,n)=>function(t,e,r){if(t=Float64Array.from(function*(t,e){if(void 0===e)for(let e of t)null!=e&&(e=+e)>=e&&(yield e);else{let r=-1;for(let n of t)null!=(n=e(n,++r,t))&&(n=+n)>=n&&(yield n)}}(t,r)),(n=t.length)&&!isNaN(e=+e)){if(e<=0||n<2)return Ka(t);if(e>=1)return Ya(t);var n,o=(n-1)*e,i=Math.floor(o),a=Ya(Ja(t,i).subarray(0,i+1));return a+(Ka(t.subarray(i+1))-a)*(o-i)}}(t,n/e)))},r.copy=function(){return kl(e).domain(t)},to.apply(r,arguments)}function _l(){var t,e,r,n,o,i,a,c=0,u=.5,l=1,s=1,f=na,p=!1;function h(t){return isNaN(t=+t)?a:(t=.5+((t=+i(t))-e)*(s*t<s*e?n:o),f(p?Math.max(0,Math.min(1,t)):t))}function d(t){return function(e){var r,n,o;return arguments.length?([r,n,o]=e,f=function(t,e){void 0===e&&(e=t,t=Qi);for(var r=0,n=e.length-1,o=e[0],i=new Array(n<0?0:n);r<n;)i[r]=t(o,o=e[++r]);return function(t){var e=Math.max(0,Math.min(n-1,Math.floor(t*=n)));return i[e](t-e)}}(t,[r,n,o]),h):[f(0),f(.5),f(1)]}}return h.domain=function(a){return arguments.length?([c,u,l]=a,t=i(c=+c),e=i(u=+u),r=i(l=+l),n=t===e?0:.5/(e-t),o=e===r?0:.5/(r-e),s=e<t?-1:1,h):[c,u,l]},h.clamp=function(t){return arguments.length?(p=!!t,h):p},h.interpolator=function(t){return arguments.length?(f=t,h):f},h.range=d(Qi),h.rangeRound=d(ta),h.unknown=function(t){return arguments.length?(a=t,h):a},function(a){return i=a,t=a(c),e=a(u),r=a(l),n=t===e?0:.5/(e-t),o=e===r?0:.5/(r-e),s=e<t?-1:1,h}}function Ml(){var t=Pa(_l()(na));return t.copy=function(){return Ol(t,Ml())},to.apply(t,arguments)}function Tl(){var t=Na(_l()).domain([.1,1,10]);return t.copy=function(){return Ol(t,Tl()).base(t.base())},to.apply(t,arguments)}function Cl(){var t=za(_l());return t.copy=function(){return Ol(t,Cl()).constant(t.constant())},to.apply(t,arguments)}function Dl(){var t=Wa(_l());return t.copy=function(){return Ol(t,Dl()).exponent(t.exponent())},to.apply(t,arguments)}function Il(){return Dl.apply(null,arguments).exponent(.5)}function Nl(t,e){if((o=t.length)>1)for(var r,n,o,i=1,a=t[e[0]],c=a.length;i<o;++i)for(n=a,a=t[e[i]],r=0;r<c;++r)a[r][1]+=a[r][0]=isNaN(n[r][1])?n[r][0]:n[r][1]}function Bl(t){return"object"==typeof t&&"length"in t?t:Array.from(t)}function Rl(t){for(var e=t.length,r=new Array(e);--e>=0;)r[e]=e;return r}function Ll(t,e){return t[e]}function zl(t){const e=[];return e.key=t,e}Kc=function(t){var e=t.dateTime,r=t.date,n=t.time,o=t.periods,i=t.days,a=t.shortDays,c=t.months,u=t.shortMonths,l=iu(o),s=au(o),f=iu(i),p=au(i),h=iu(a),d=au(a),y=iu(c),v=au(c),m=iu(u),b=au(u),g={a:function(t){return a[t.getDay()]},A:function(t){return i[t.getDay()]},b:function(t){return u[t.getMonth()]},B:function(t){return c[t.getMonth()]},c:null,d:Au,e:Au,f:Cu,g:qu,G:Xu,H:ku,I:_u,j:Mu,L:Tu,m:Du,M:Iu,p:function(t){return o[+(t.getHours()>=12)]},q:function(t){return 1+~~(t.getMonth()/3)},Q:dl,s:yl,S:Nu,u:Bu,U:Ru,V:zu,w:Fu,W:Uu,x:null,X:null,y:$u,Y:Wu,Z:Hu,"%":hl},x={a:function(t){return a[t.getUTCDay()]},A:function(t){return i[t.getUTCDay()]},b:function(t){return u[t.getUTCMonth()]},B:function(t){return c[t.getUTCMonth()]},c:null,d:Gu,e:Gu,f:Ju,g:ll,G:fl,H:Vu,I:Yu,j:Ku,L:Zu,m:Qu,M:tl,p:function(t){return o[+(t.getUTCHours()>=12)]},q:function(t){return 1+~~(t.getUTCMonth()/3)},Q:dl,s:yl,S:el,u:rl,U:nl,V:il,w:al,W:cl,x:null,X:null,y:ul,Y:sl,Z:pl,"%":hl},w={a:function(t,e,r){var n=h.exec(e.slice(r));return n?(t.w=d.get(n[0].toLowerCase()),r+n[0].length):-1},A:function(t,e,r){var n=f.exec(e.slice(r));return n?(t.w=p.get(n[0].toLowerCase()),r+n[0].length):-1},b:function(t,e,r){var n=m.exec(e.slice(r));return n?(t.m=b.get(n[0].toLowerCase()),r+n[0].length):-1},B:function(t,e,r){var n=y.exec(e.slice(r));return n?(t.m=v.get(n[0].toLowerCase()),r+n[0].length):-1},c:function(t,r,n){return S(t,e,r,n)},d:mu,e:mu,f:ju,g:hu,G:pu,H:gu,I:gu,j:bu,L:Ou,m:vu,M:xu,p:function(t,e,r){var n=l.exec(e.slice(r));return n?(t.p=s.get(n[0].toLowerCase()),r+n[0].length):-1},q:yu,Q:Pu,s:Eu,S:wu,u:uu,U:lu,V:su,w:cu,W:fu,x:function(t,e,n){return S(t,r,e,n)},X:function(t,e,r){return S(t,n,e,r)},y:hu,Y:pu,Z:du,"%":Su};function O(t,e){return function(r){var n,o,i,a=[],c=-1,u=0,l=t.length;for(r instanceof Date||(r=new Date(+r));++c<l;)37===t.charCodeAt(c)&&(a.push(t.slice(u,c)),null!=(o=Qc[n=t.charAt(++c)])?n=t.charAt(++c):o="e"===n?" ":"0",(i=e[n])&&(n=i(r,o)),a.push(n),u=c+1);return a.push(t.slice(u,c)),a.join("")}}function j(t,e){return function(r){var n,o,i=Yc(1900,void 0,1);if(S(i,t,r+="",0)!=r.length)return null;if("Q"in i)return new Date(i.Q);if("s"in i)return new Date(1e3*i.s+("L"in i?i.L:0));if(e&&!("Z"in i)&&(i.Z=0),"p"in i&&(i.H=i.H%12+12*i.p),void 0===i.m&&(i.m="q"in i?i.q:0),"V"in i){if(i.V<1||i.V>53)return null;"w"in i||(i.w=1),"Z"in i?(o=(n=Vc(Yc(i.y,0,1))).getUTCDay(),n=o>4||0===o?Cc.ceil(n):Cc(n),n=xc.offset(n,7*(i.V-1)),i.y=n.getUTCFullYear(),i.m=n.getUTCMonth(),i.d=n.getUTCDate()+(i.w+6)%7):(o=(n=Gc(Yc(i.y,0,1))).getDay(),n=o>4||0===o?Sc.ceil(n):Sc(n),n=gc.offset(n,7*(i.V-1)),i.y=n.getFullYear(),i.m=n.getMonth(),i.d=n.getDate()+(i.w+6)%7)}else("W"in i||"U"in i)&&("w"in i||(i.w="u"in i?i.u%7:"W"in i?1:0),o="Z"in i?Vc(Yc(i.y,0,1)).getUTCDay():Gc(Yc(i.y,0,1)).getDay(),i.m=0,i.d="W"in i?(i.w+6)%7+7*i.W-(o+5)%7:i.w+7*i.U-(o+6)%7);return"Z"in i?(i.H+=i.Z/100|0,i.M+=i.Z%100,Vc(i)):Gc(i)}}function S(t,e,r,n){for(var o,i,a=0,c=e.length,u=r.length;a<c;){if(n>=u)return-1;if(37===(o=e.charCodeAt(a++))){if(o=e.charAt(a++),!(i=w[o in Qc?e.charAt(a++):o])||(n=i(t,r,n))<0)return-1}else if(o!=r.charCodeAt(n++))return-1}return n}return g.x=O(r,g),g.X=O(n,g),g.c=O(e,g),x.x=O(r,x),x.X=O(n,x),x.c=O(e,x),{format:function(t){var e=O(t+="",g);return e.toString=function(){return t},e},parse:function(t){var e=j(t+="",!1);return e.toString=function(){return t},e},utcFormat:function(t){var e=O(t+="",x);return e.toString=function(){return t},e},utcParse:function(t){var e=j(t+="",!0);return e.toString=function(){return t},e}}}({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]}),Zc=Kc.format,Kc.parse,Jc=Kc.utcFormat,Kc.utcParse,Array.prototype.slice;var Fl=r(4506),Ul=r.n(Fl),$l=r(1684),ql=r.n($l),Wl=r(7307),Xl=r.n(Wl),Hl=r(2404),Gl=r.n(Hl),Vl=r(8351),Yl=r.n(Vl);function Kl(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}var Zl=function(t){return t},Jl={"@@functional/placeholder":!0},Ql=function(t){return t===Jl},ts=function(t){return function e(){return 0===arguments.length||1===arguments.length&&Ql(arguments.length<=0?void 0:arguments[0])?e:t.apply(void 0,arguments)}},es=function t(e,r){return 1===e?r:ts((function(){for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];var a=o.filter((function(t){return t!==Jl})).length;return a>=e?r.apply(void 0,o):t(e-a,ts((function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];var i,a=o.map((function(t){return Ql(t)?e.shift():t}));return r.apply(void 0,(i=a,function(t){if(Array.isArray(t))return Kl(t)}(i)||function(t){if("undefined"!=typeof Symbol&&Symbol.iterator in Object(t))return Array.from(t)}(i)||function(t,e){if(t){if("string"==typeof t)return Kl(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Kl(t,e):void 0}}(i)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()).concat(e))})))}))},rs=function(t){return es(t.length,t)},ns=function(t,e){for(var r=[],n=t;n<e;++n)r[n-t]=n;return r},os=rs((function(t,e){return Array.isArray(e)?e.map(t):Object.keys(e).map((function(t){return e[t]})).map(t)})),is=function(){for(var t=arguments.length,e=new Array(t),r=0;r<t;r++)e[r]=arguments[r];if(!e.length)return Zl;var n=e.reverse(),o=n[0],i=n.slice(1);return function(){return i.reduce((function(t,e){return e(t)}),o.apply(void 0,arguments))}},as=function(t){return Array.isArray(t)?t.reverse():t.split("").reverse.join("")},cs=function(t){var e=null,r=null;return function(){for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e&&o.every((function(t,r){return t===e[r]}))?r:(e=o,r=t.apply(void 0,o))}};rs((function(t,e,r){var n=+t;return n+r*(+e-n)})),rs((function(t,e,r){var n=e-+t;return(r-t)/(n||1/0)})),rs((function(t,e,r){var n=e-+t;return n=n||1/0,Math.max(0,Math.min(1,(r-t)/n))}));const us=function(t,e,r){for(var n=new(Yl())(t),o=0,i=[];n.lt(e)&&o<1e5;)i.push(n.toNumber()),n=n.add(r),o++;return i},ls=function(t){return 0===t?1:Math.floor(new(Yl())(t).abs().log(10).toNumber())+1};function ss(t){return function(t){if(Array.isArray(t))return hs(t)}(t)||function(t){if("undefined"!=typeof Symbol&&Symbol.iterator in Object(t))return Array.from(t)}(t)||ps(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function fs(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){if("undefined"!=typeof Symbol&&Symbol.iterator in Object(t)){var r=[],n=!0,o=!1,i=void 0;try{for(var a,c=t[Symbol.iterator]();!(n=(a=c.next()).done)&&(r.push(a.value),!e||r.length!==e);n=!0);}catch(t){o=!0,i=t}finally{try{n||null==c.return||c.return()}finally{if(o)throw i}}return r}}(t,e)||ps(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ps(t,e){if(t){if("string"==typeof t)return hs(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?hs(t,e):void 0}}function hs(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function ds(t){var e=fs(t,2),r=e[0],n=e[1],o=r,i=n;return r>n&&(o=n,i=r),[o,i]}function ys(t,e,r){if(t.lte(0))return new(Yl())(0);var n=ls(t.toNumber()),o=new(Yl())(10).pow(n),i=t.div(o),a=1!==n?.05:.1,c=new(Yl())(Math.ceil(i.div(a).toNumber())).add(r).mul(a).mul(o);return e?c:new(Yl())(Math.ceil(c))}function vs(t,e,r){var n=1,o=new(Yl())(t);if(!o.isint()&&r){var i=Math.abs(t);i<1?(n=new(Yl())(10).pow(ls(t)-1),o=new(Yl())(Math.floor(o.div(n).toNumber())).mul(n)):i>1&&(o=new(Yl())(Math.floor(t)))}else 0===t?o=new(Yl())(Math.floor((e-1)/2)):r||(o=new(Yl())(Math.floor(t)));var a=Math.floor((e-1)/2);return is(os((function(t){return o.add(new(Yl())(t-a).mul(n)).toNumber()})),ns)(0,e)}function ms(t,e,r,n){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:0;if(!Number.isFinite((e-t)/(r-1)))return{step:new(Yl())(0),tickMin:new(Yl())(0),tickMax:new(Yl())(0)};var i,a=ys(new(Yl())(e).sub(t).div(r-1),n,o);i=t<=0&&e>=0?new(Yl())(0):(i=new(Yl())(t).add(e).div(2)).sub(new(Yl())(i).mod(a));var c=Math.ceil(i.sub(t).div(a).toNumber()),u=Math.ceil(new(Yl())(e).sub(i).div(a).toNumber()),l=c+u+1;return l>r?ms(t,e,r,n,o+1):(l<r&&(u=e>0?u+(r-l):u,c=e>0?c:c+(r-l)),{step:a,tickMin:i.sub(new(Yl())(c).mul(a)),tickMax:i.add(new(Yl())(u).mul(a))})}var bs=cs((function(t){var e=fs(t,2),r=e[0],n=e[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),c=fs(ds([r,n]),2),u=c[0],l=c[1];if(u===-1/0||l===1/0){var s=l===1/0?[u].concat(ss(ns(0,o-1).map((function(){return 1/0})))):[].concat(ss(ns(0,o-1).map((function(){return-1/0}))),[l]);return r>n?as(s):s}if(u===l)return vs(u,o,i);var f=ms(u,l,a,i),p=f.step,h=f.tickMin,d=f.tickMax,y=us(h,d.add(new(Yl())(.1).mul(p)),p);return r>n?as(y):y})),gs=(cs((function(t){var e=fs(t,2),r=e[0],n=e[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),c=fs(ds([r,n]),2),u=c[0],l=c[1];if(u===-1/0||l===1/0)return[r,n];if(u===l)return vs(u,o,i);var s=ys(new(Yl())(l).sub(u).div(a-1),i,0),f=is(os((function(t){return new(Yl())(u).add(new(Yl())(t).mul(s)).toNumber()})),ns)(0,a).filter((function(t){return t>=u&&t<=l}));return r>n?as(f):f})),cs((function(t,e){var r=fs(t,2),n=r[0],o=r[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=fs(ds([n,o]),2),c=a[0],u=a[1];if(c===-1/0||u===1/0)return[n,o];if(c===u)return[c];var l=Math.max(e,2),s=ys(new(Yl())(u).sub(c).div(l-1),i,0),f=[].concat(ss(us(new(Yl())(c),new(Yl())(u).sub(new(Yl())(.99).mul(s)),s)),[u]);return n>o?as(f):f}))),xs=["offset","layout","width","dataKey","data","dataPointFormatter","xAxis","yAxis"];function ws(t){return ws="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ws(t)}function Os(){return Os=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Os.apply(this,arguments)}function js(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Ss(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,_s(n.key),n)}}function Ps(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Ps=function(){return!!t})()}function Es(t){return Es=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Es(t)}function As(t,e){return As=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},As(t,e)}function ks(t,e,r){return(e=_s(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function _s(t){var e=function(t){if("object"!=ws(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ws(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==ws(e)?e:e+""}var Ms=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=Es(r=e),function(t,e){if(e&&("object"===ws(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,Ps()?Reflect.construct(r,n||[],Es(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&As(t,e)}(e,t),r=e,n=[{key:"render",value:function(){var t=this.props,e=t.offset,r=t.layout,n=t.width,i=t.dataKey,a=t.data,c=t.dataPointFormatter,u=t.xAxis,l=t.yAxis,s=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,xs),f=nt(s,!1);"x"===this.props.direction&&"number"!==u.type&&mt(!1);var p=a.map((function(t){var a=c(t,i),s=a.x,p=a.y,h=a.value,d=a.errorVal;if(!d)return null;var y,v,m,b,g=[];if(Array.isArray(d)){var x=(b=2,function(t){if(Array.isArray(t))return t}(m=d)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(m,b)||function(t,e){if(t){if("string"==typeof t)return js(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?js(t,e):void 0}}(m,b)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}());y=x[0],v=x[1]}else y=v=d;if("vertical"===r){var w=u.scale,O=p+e,j=O+n,S=O-n,P=w(h-y),E=w(h+v);g.push({x1:E,y1:j,x2:E,y2:S}),g.push({x1:P,y1:O,x2:E,y2:O}),g.push({x1:P,y1:j,x2:P,y2:S})}else if("horizontal"===r){var A=l.scale,k=s+e,_=k-n,M=k+n,T=A(h-y),C=A(h+v);g.push({x1:_,y1:C,x2:M,y2:C}),g.push({x1:k,y1:T,x2:k,y2:C}),g.push({x1:_,y1:T,x2:M,y2:T})}return o().createElement(jt,Os({className:"recharts-errorBar",key:"bar-".concat(g.map((function(t){return"".concat(t.x1,"-").concat(t.x2,"-").concat(t.y1,"-").concat(t.y2)})))},f),g.map((function(t){return o().createElement("line",Os({},t,{key:"line-".concat(t.x1,"-").concat(t.x2,"-").concat(t.y1,"-").concat(t.y2)}))})))}));return o().createElement(jt,{className:"recharts-errorBars"},p)}}],n&&Ss(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function Ts(t){return Ts="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ts(t)}function Cs(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ds(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Cs(Object(r),!0).forEach((function(e){Is(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Cs(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Is(t,e,r){var n;return n=function(t){if("object"!=Ts(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ts(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ts(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}ks(Ms,"defaultProps",{stroke:"black",strokeWidth:1.5,width:5,offset:0,layout:"horizontal"}),ks(Ms,"displayName","ErrorBar");var Ns=function(t){var e=t.children,r=t.formattedGraphicalItems,n=t.legendWidth,o=t.legendContent,i=tt(e,br);if(!i)return null;var a,c=br.defaultProps,u=void 0!==c?Ds(Ds({},c),i.props):{};return a=i.props&&i.props.payload?i.props&&i.props.payload:"children"===o?(r||[]).reduce((function(t,e){var r=e.item,n=e.props,o=n.sectors||n.data||[];return t.concat(o.map((function(t){return{type:i.props.iconType||r.props.legendType,value:t.name,color:t.fill,payload:t}})))}),[]):(r||[]).map((function(t){var e=t.item,r=e.type.defaultProps,n=void 0!==r?Ds(Ds({},r),e.props):{},o=n.dataKey,i=n.name,a=n.legendType;return{inactive:n.hide,dataKey:o,type:u.iconType||a||"square",color:Ws(e),value:i||o,payload:n}})),Ds(Ds(Ds({},u),br.getWithHeight(i,n)),{},{payload:a,item:i})};function Bs(t){return Bs="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Bs(t)}function Rs(t){return function(t){if(Array.isArray(t))return Ls(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return Ls(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Ls(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ls(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function zs(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Fs(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?zs(Object(r),!0).forEach((function(e){Us(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):zs(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Us(t,e,r){var n;return n=function(t){if("object"!=Bs(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Bs(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Bs(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function $s(t,e,r){return M()(t)||M()(e)?r:x(e)?d()(t,e,r):C()(e)?e(t):r}function qs(t,e,r,n){var o=Xl()(t,(function(t){return $s(t,e)}));if("number"===r){var i=o.filter((function(t){return g(t)||parseFloat(t)}));return i.length?[ql()(i),Ul()(i)]:[1/0,-1/0]}return(n?o.filter((function(t){return!M()(t)})):o).map((function(t){return x(t)||t instanceof Date?t:""}))}var Ws=function(t){var e,r,n=t.type.displayName,o=null!==(e=t.type)&&void 0!==e&&e.defaultProps?Fs(Fs({},t.type.defaultProps),t.props):t.props,i=o.stroke,a=o.fill;switch(n){case"Line":r=i;break;case"Area":case"Radar":r=i&&"none"!==i?i:a;break;default:r=a}return r},Xs=function(t,e,r,n,o){var i=Q(e.props.children,Ms).filter((function(t){return function(t,e,r){return!!M()(e)||("horizontal"===t?"yAxis"===e:"vertical"===t||"x"===r?"xAxis"===e:"y"!==r||"yAxis"===e)}(n,o,t.props.direction)}));if(i&&i.length){var a=i.map((function(t){return t.props.dataKey}));return t.reduce((function(t,e){var n=$s(e,r);if(M()(n))return t;var o=Array.isArray(n)?[ql()(n),Ul()(n)]:[n,n],i=a.reduce((function(t,r){var n=$s(e,r,0),i=o[0]-Math.abs(Array.isArray(n)?n[0]:n),a=o[1]+Math.abs(Array.isArray(n)?n[1]:n);return[Math.min(i,t[0]),Math.max(a,t[1])]}),[1/0,-1/0]);return[Math.min(i[0],t[0]),Math.max(i[1],t[1])]}),[1/0,-1/0])}return null},Hs=function(t,e,r,n,o){var i=e.map((function(e){var i=e.props.dataKey;return"number"===r&&i&&Xs(t,e,i,n)||qs(t,i,r,o)}));if("number"===r)return i.reduce((function(t,e){return[Math.min(t[0],e[0]),Math.max(t[1],e[1])]}),[1/0,-1/0]);var a={};return i.reduce((function(t,e){for(var r=0,n=e.length;r<n;r++)a[e[r]]||(a[e[r]]=!0,t.push(e[r]));return t}),[])},Gs=function(t,e){return"horizontal"===t&&"xAxis"===e||"vertical"===t&&"yAxis"===e||"centric"===t&&"angleAxis"===e||"radial"===t&&"radiusAxis"===e},Vs=function(t,e,r,n){if(n)return t.map((function(t){return t.coordinate}));var o,i,a=t.map((function(t){return t.coordinate===e&&(o=!0),t.coordinate===r&&(i=!0),t.coordinate}));return o||a.push(e),i||a.push(r),a},Ys=function(t,e,r){if(!t)return null;var n=t.scale,o=t.duplicateDomain,i=t.type,a=t.range,c="scaleBand"===t.realScaleType?n.bandwidth()/2:2,u=(e||r)&&"category"===i&&n.bandwidth?n.bandwidth()/c:0;return u="angleAxis"===t.axisType&&(null==a?void 0:a.length)>=2?2*m(a[0]-a[1])*u:u,e&&(t.ticks||t.niceTicks)?(t.ticks||t.niceTicks).map((function(t){var e=o?o.indexOf(t):t;return{coordinate:n(e)+u,value:t,offset:u}})).filter((function(t){return!p()(t.coordinate)})):t.isCategorical&&t.categoricalDomain?t.categoricalDomain.map((function(t,e){return{coordinate:n(t)+u,value:t,index:e,offset:u}})):n.ticks&&!r?n.ticks(t.tickCount).map((function(t){return{coordinate:n(t)+u,value:t,offset:u}})):n.domain().map((function(t,e){return{coordinate:n(t)+u,value:o?o[t]:t,index:e,offset:u}}))},Ks=new WeakMap,Zs=function(t,e){if("function"!=typeof e)return t;Ks.has(t)||Ks.set(t,new WeakMap);var r=Ks.get(t);if(r.has(e))return r.get(e);var n=function(){t.apply(void 0,arguments),e.apply(void 0,arguments)};return r.set(e,n),n},Js=1e-4,Qs={sign:function(t){var e=t.length;if(!(e<=0))for(var r=0,n=t[0].length;r<n;++r)for(var o=0,i=0,a=0;a<e;++a){var c=p()(t[a][r][1])?t[a][r][0]:t[a][r][1];c>=0?(t[a][r][0]=o,t[a][r][1]=o+c,o=t[a][r][1]):(t[a][r][0]=i,t[a][r][1]=i+c,i=t[a][r][1])}},expand:function(t,e){if((n=t.length)>0){for(var r,n,o,i=0,a=t[0].length;i<a;++i){for(o=r=0;r<n;++r)o+=t[r][i][1]||0;if(o)for(r=0;r<n;++r)t[r][i][1]/=o}Nl(t,e)}},none:Nl,silhouette:function(t,e){if((r=t.length)>0){for(var r,n=0,o=t[e[0]],i=o.length;n<i;++n){for(var a=0,c=0;a<r;++a)c+=t[a][n][1]||0;o[n][1]+=o[n][0]=-c/2}Nl(t,e)}},wiggle:function(t,e){if((o=t.length)>0&&(n=(r=t[e[0]]).length)>0){for(var r,n,o,i=0,a=1;a<n;++a){for(var c=0,u=0,l=0;c<o;++c){for(var s=t[e[c]],f=s[a][1]||0,p=(f-(s[a-1][1]||0))/2,h=0;h<c;++h){var d=t[e[h]];p+=(d[a][1]||0)-(d[a-1][1]||0)}u+=f,l+=p*f}r[a-1][1]+=r[a-1][0]=i,u&&(i-=l/u)}r[a-1][1]+=r[a-1][0]=i,Nl(t,e)}},positive:function(t){var e=t.length;if(!(e<=0))for(var r=0,n=t[0].length;r<n;++r)for(var o=0,i=0;i<e;++i){var a=p()(t[i][r][1])?t[i][r][0]:t[i][r][1];a>=0?(t[i][r][0]=o,t[i][r][1]=o+a,o=t[i][r][1]):(t[i][r][0]=0,t[i][r][1]=0)}}},tf=function(t,e,r){var n=e.map((function(t){return t.props.dataKey})),o=Qs[r],i=function(){var t=De([]),e=Rl,r=Nl,n=Ll;function o(o){var i,a,c=Array.from(t.apply(this,arguments),zl),u=c.length,l=-1;for(const t of o)for(i=0,++l;i<u;++i)(c[i][l]=[0,+n(t,c[i].key,l,o)]).data=t;for(i=0,a=Bl(e(c));i<u;++i)c[a[i]].index=i;return r(c,a),c}return o.keys=function(e){return arguments.length?(t="function"==typeof e?e:De(Array.from(e)),o):t},o.value=function(t){return arguments.length?(n="function"==typeof t?t:De(+t),o):n},o.order=function(t){return arguments.length?(e=null==t?Rl:"function"==typeof t?t:De(Array.from(t)),o):e},o.offset=function(t){return arguments.length?(r=null==t?Nl:t,o):r},o}().keys(n).value((function(t,e){return+$s(t,e,0)})).order(Rl).offset(o);return i(t)};function ef(t){var e=t.axis,r=t.ticks,n=t.bandSize,o=t.entry,i=t.index,a=t.dataKey;if("category"===e.type){if(!e.allowDuplicatedCategory&&e.dataKey&&!M()(o[e.dataKey])){var c=E(r,"value",o[e.dataKey]);if(c)return c.coordinate+n/2}return r[i]?r[i].coordinate+n/2:null}var u=$s(o,M()(a)?e.dataKey:a);return M()(u)?null:e.scale(u)}var rf=function(t){var e=t.axis,r=t.ticks,n=t.offset,o=t.bandSize,i=t.entry,a=t.index;if("category"===e.type)return r[a]?r[a].coordinate+n:null;var c=$s(i,e.dataKey,e.domain[a]);return M()(c)?null:e.scale(c)-o/2+n},nf=function(t,e,r){return Object.keys(t).reduce((function(n,o){var i=t[o].stackedData.reduce((function(t,n){var o=n.slice(e,r+1).reduce((function(t,e){return[ql()(e.concat([t[0]]).filter(g)),Ul()(e.concat([t[1]]).filter(g))]}),[1/0,-1/0]);return[Math.min(t[0],o[0]),Math.max(t[1],o[1])]}),[1/0,-1/0]);return[Math.min(i[0],n[0]),Math.max(i[1],n[1])]}),[1/0,-1/0]).map((function(t){return t===1/0||t===-1/0?0:t}))},of=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,af=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,cf=function(t,e,r){if(C()(t))return t(e,r);if(!Array.isArray(t))return e;var n=[];if(g(t[0]))n[0]=r?t[0]:Math.min(t[0],e[0]);else if(of.test(t[0])){var o=+of.exec(t[0])[1];n[0]=e[0]-o}else C()(t[0])?n[0]=t[0](e[0]):n[0]=e[0];if(g(t[1]))n[1]=r?t[1]:Math.max(t[1],e[1]);else if(af.test(t[1])){var i=+af.exec(t[1])[1];n[1]=e[1]+i}else C()(t[1])?n[1]=t[1](e[1]):n[1]=e[1];return n},uf=function(t,e,r){if(t&&t.scale&&t.scale.bandwidth){var n=t.scale.bandwidth();if(!r||n>0)return n}if(t&&e&&e.length>=2){for(var o=vt()(e,(function(t){return t.coordinate})),i=1/0,a=1,c=o.length;a<c;a++){var u=o[a],l=o[a-1];i=Math.min((u.coordinate||0)-(l.coordinate||0),i)}return i===1/0?0:i}return r?void 0:0},lf=function(t,e,r){return t&&t.length?Gl()(t,d()(r,"type.defaultProps.domain"))?e:t:e},sf=function(t,e){var r=t.type.defaultProps?Fs(Fs({},t.type.defaultProps),t.props):t.props,n=r.dataKey,o=r.name,i=r.unit,a=r.formatter,c=r.tooltipType,u=r.chartType,l=r.hide;return Fs(Fs({},nt(t,!1)),{},{dataKey:n,unit:i,formatter:a,name:o||n,color:Ws(t),value:$s(e,n),type:c,payload:e,chartType:u,hide:l})};function ff(t){return ff="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ff(t)}function pf(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function hf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?pf(Object(r),!0).forEach((function(e){df(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):pf(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function df(t,e,r){var n;return n=function(t){if("object"!=ff(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ff(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==ff(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var yf=["Webkit","Moz","O","ms"];function vf(t){return vf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},vf(t)}function mf(){return mf=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},mf.apply(this,arguments)}function bf(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function gf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?bf(Object(r),!0).forEach((function(e){Sf(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):bf(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function xf(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Pf(n.key),n)}}function wf(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(wf=function(){return!!t})()}function Of(t){return Of=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Of(t)}function jf(t,e){return jf=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},jf(t,e)}function Sf(t,e,r){return(e=Pf(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Pf(t){var e=function(t){if("object"!=vf(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=vf(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==vf(e)?e:e+""}var Ef=function(t){return t.changedTouches&&!!t.changedTouches.length},Af=function(t){function r(t){var e,n,o,i;return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,r),Sf((n=this,i=[t],o=Of(o=r),e=function(t,e){if(e&&("object"===vf(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(n,wf()?Reflect.construct(o,i||[],Of(n).constructor):o.apply(n,i))),"handleDrag",(function(t){e.leaveTimer&&(clearTimeout(e.leaveTimer),e.leaveTimer=null),e.state.isTravellerMoving?e.handleTravellerMove(t):e.state.isSlideMoving&&e.handleSlideDrag(t)})),Sf(e,"handleTouchMove",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&e.handleDrag(t.changedTouches[0])})),Sf(e,"handleDragEnd",(function(){e.setState({isTravellerMoving:!1,isSlideMoving:!1},(function(){var t=e.props,r=t.endIndex,n=t.onDragEnd,o=t.startIndex;null==n||n({endIndex:r,startIndex:o})})),e.detachDragEndListener()})),Sf(e,"handleLeaveWrapper",(function(){(e.state.isTravellerMoving||e.state.isSlideMoving)&&(e.leaveTimer=window.setTimeout(e.handleDragEnd,e.props.leaveTimeOut))})),Sf(e,"handleEnterSlideOrTraveller",(function(){e.setState({isTextActive:!0})})),Sf(e,"handleLeaveSlideOrTraveller",(function(){e.setState({isTextActive:!1})})),Sf(e,"handleSlideDragStart",(function(t){var r=Ef(t)?t.changedTouches[0]:t;e.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:r.pageX}),e.attachDragEndListener()})),e.travellerDragStartHandlers={startX:e.handleTravellerDragStart.bind(e,"startX"),endX:e.handleTravellerDragStart.bind(e,"endX")},e.state={},e}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&jf(t,e)}(r,t),n=r,i=[{key:"componentWillUnmount",value:function(){this.leaveTimer&&(clearTimeout(this.leaveTimer),this.leaveTimer=null),this.detachDragEndListener()}},{key:"getIndex",value:function(t){var e=t.startX,n=t.endX,o=this.state.scaleValues,i=this.props,a=i.gap,c=i.data.length-1,u=Math.min(e,n),l=Math.max(e,n),s=r.getIndexInRange(o,u),f=r.getIndexInRange(o,l);return{startIndex:s-s%a,endIndex:f===c?c:f-f%a}}},{key:"getTextOfTick",value:function(t){var e=this.props,r=e.data,n=e.tickFormatter,o=e.dataKey,i=$s(r[t],o,t);return C()(n)?n(i,t):i}},{key:"attachDragEndListener",value:function(){window.addEventListener("mouseup",this.handleDragEnd,!0),window.addEventListener("touchend",this.handleDragEnd,!0),window.addEventListener("mousemove",this.handleDrag,!0)}},{key:"detachDragEndListener",value:function(){window.removeEventListener("mouseup",this.handleDragEnd,!0),window.removeEventListener("touchend",this.handleDragEnd,!0),window.removeEventListener("mousemove",this.handleDrag,!0)}},{key:"handleSlideDrag",value:function(t){var e=this.state,r=e.slideMoveStartX,n=e.startX,o=e.endX,i=this.props,a=i.x,c=i.width,u=i.travellerWidth,l=i.startIndex,s=i.endIndex,f=i.onChange,p=t.pageX-r;p>0?p=Math.min(p,a+c-u-o,a+c-u-n):p<0&&(p=Math.max(p,a-n,a-o));var h=this.getIndex({startX:n+p,endX:o+p});h.startIndex===l&&h.endIndex===s||!f||f(h),this.setState({startX:n+p,endX:o+p,slideMoveStartX:t.pageX})}},{key:"handleTravellerDragStart",value:function(t,e){var r=Ef(e)?e.changedTouches[0]:e;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:t,brushMoveStartX:r.pageX}),this.attachDragEndListener()}},{key:"handleTravellerMove",value:function(t){var e=this.state,r=e.brushMoveStartX,n=e.movingTravellerId,o=e.endX,i=e.startX,a=this.state[n],c=this.props,u=c.x,l=c.width,s=c.travellerWidth,f=c.onChange,p=c.gap,h=c.data,d={startX:this.state.startX,endX:this.state.endX},y=t.pageX-r;y>0?y=Math.min(y,u+l-s-a):y<0&&(y=Math.max(y,u-a)),d[n]=a+y;var v=this.getIndex(d),m=v.startIndex,b=v.endIndex;this.setState(Sf(Sf({},n,a+y),"brushMoveStartX",t.pageX),(function(){var t;f&&(t=h.length-1,("startX"===n&&(o>i?m%p==0:b%p==0)||o<i&&b===t||"endX"===n&&(o>i?b%p==0:m%p==0)||o>i&&b===t)&&f(v))}))}},{key:"handleTravellerMoveKeyboard",value:function(t,e){var r=this,n=this.state,o=n.scaleValues,i=n.startX,a=n.endX,c=this.state[e],u=o.indexOf(c);if(-1!==u){var l=u+t;if(!(-1===l||l>=o.length)){var s=o[l];"startX"===e&&s>=a||"endX"===e&&s<=i||this.setState(Sf({},e,s),(function(){r.props.onChange(r.getIndex({startX:r.state.startX,endX:r.state.endX}))}))}}}},{key:"renderBackground",value:function(){var t=this.props,e=t.x,r=t.y,n=t.width,i=t.height,a=t.fill,c=t.stroke;return o().createElement("rect",{stroke:c,fill:a,x:e,y:r,width:n,height:i})}},{key:"renderPanorama",value:function(){var t=this.props,r=t.x,n=t.y,i=t.width,a=t.height,c=t.data,u=t.children,l=t.padding,s=e.Children.only(u);return s?o().cloneElement(s,{x:r,y:n,width:i,height:a,margin:l,compact:!0,data:c}):null}},{key:"renderTravellerLayer",value:function(t,e){var n,i,a=this,c=this.props,u=c.y,l=c.travellerWidth,s=c.height,f=c.traveller,p=c.ariaLabel,h=c.data,d=c.startIndex,y=c.endIndex,v=Math.max(t,this.props.x),m=gf(gf({},nt(this.props,!1)),{},{x:v,y:u,width:l,height:s}),b=p||"Min value: ".concat(null===(n=h[d])||void 0===n?void 0:n.name,", Max value: ").concat(null===(i=h[y])||void 0===i?void 0:i.name);return o().createElement(jt,{tabIndex:0,role:"slider","aria-label":b,"aria-valuenow":t,className:"recharts-brush-traveller",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers[e],onTouchStart:this.travellerDragStartHandlers[e],onKeyDown:function(t){["ArrowLeft","ArrowRight"].includes(t.key)&&(t.preventDefault(),t.stopPropagation(),a.handleTravellerMoveKeyboard("ArrowRight"===t.key?1:-1,e))},onFocus:function(){a.setState({isTravellerFocused:!0})},onBlur:function(){a.setState({isTravellerFocused:!1})},style:{cursor:"col-resize"}},r.renderTraveller(f,m))}},{key:"renderSlide",value:function(t,e){var r=this.props,n=r.y,i=r.height,a=r.stroke,c=r.travellerWidth,u=Math.min(t,e)+c,l=Math.max(Math.abs(e-t)-c,0);return o().createElement("rect",{className:"recharts-brush-slide",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart,style:{cursor:"move"},stroke:"none",fill:a,fillOpacity:.2,x:u,y:n,width:l,height:i})}},{key:"renderText",value:function(){var t=this.props,e=t.startIndex,r=t.endIndex,n=t.y,i=t.height,a=t.travellerWidth,c=t.stroke,u=this.state,l=u.startX,s=u.endX,f={pointerEvents:"none",fill:c};return o().createElement(jt,{className:"recharts-brush-texts"},o().createElement(Wo,mf({textAnchor:"end",verticalAnchor:"middle",x:Math.min(l,s)-5,y:n+i/2},f),this.getTextOfTick(e)),o().createElement(Wo,mf({textAnchor:"start",verticalAnchor:"middle",x:Math.max(l,s)+a+5,y:n+i/2},f),this.getTextOfTick(r)))}},{key:"render",value:function(){var t=this.props,e=t.data,r=t.className,n=t.children,i=t.x,c=t.y,u=t.width,l=t.height,s=t.alwaysShowText,f=this.state,p=f.startX,h=f.endX,d=f.isTextActive,y=f.isSlideMoving,v=f.isTravellerMoving,m=f.isTravellerFocused;if(!e||!e.length||!g(i)||!g(c)||!g(u)||!g(l)||u<=0||l<=0)return null;var b=a("recharts-brush",r),x=1===o().Children.count(n),w=function(t,e){var r=t.replace(/(\w)/,(function(t){return t.toUpperCase()})),n=yf.reduce((function(t,n){return hf(hf({},t),{},df({},n+r,e))}),{});return n[t]=e,n}("userSelect","none");return o().createElement(jt,{className:b,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:w},this.renderBackground(),x&&this.renderPanorama(),this.renderSlide(p,h),this.renderTravellerLayer(p,"startX"),this.renderTravellerLayer(h,"endX"),(d||y||v||m||s)&&this.renderText())}}],c=[{key:"renderDefaultTraveller",value:function(t){var e=t.x,r=t.y,n=t.width,i=t.height,a=t.stroke,c=Math.floor(r+i/2)-1;return o().createElement(o().Fragment,null,o().createElement("rect",{x:e,y:r,width:n,height:i,fill:a,stroke:"none"}),o().createElement("line",{x1:e+1,y1:c,x2:e+n-1,y2:c,fill:"none",stroke:"#fff"}),o().createElement("line",{x1:e+1,y1:c+2,x2:e+n-1,y2:c+2,fill:"none",stroke:"#fff"}))}},{key:"renderTraveller",value:function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):r.renderDefaultTraveller(e)}},{key:"getDerivedStateFromProps",value:function(t,e){var r=t.data,n=t.width,o=t.x,i=t.travellerWidth,a=t.updateId,c=t.startIndex,u=t.endIndex;if(r!==e.prevData||a!==e.prevUpdateId)return gf({prevData:r,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:n},r&&r.length?function(t){var e=t.data,r=t.startIndex,n=t.endIndex,o=t.x,i=t.width,a=t.travellerWidth;if(!e||!e.length)return{};var c=e.length,u=uo().domain(dt()(0,c)).range([o,o+i-a]),l=u.domain().map((function(t){return u(t)}));return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:u(r),endX:u(n),scale:u,scaleValues:l}}({data:r,width:n,x:o,travellerWidth:i,startIndex:c,endIndex:u}):{scale:null,scaleValues:null});if(e.scale&&(n!==e.prevWidth||o!==e.prevX||i!==e.prevTravellerWidth)){e.scale.range([o,o+n-i]);var l=e.scale.domain().map((function(t){return e.scale(t)}));return{prevData:r,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:n,startX:e.scale(t.startIndex),endX:e.scale(t.endIndex),scaleValues:l}}return null}},{key:"getIndexInRange",value:function(t,e){for(var r=0,n=t.length-1;n-r>1;){var o=Math.floor((r+n)/2);t[o]>e?n=o:r=o}return e>=t[n]?n:r}}],i&&xf(n.prototype,i),c&&xf(n,c),Object.defineProperty(n,"prototype",{writable:!1}),n;var n,i,c}(e.PureComponent);function kf(t){return kf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},kf(t)}function _f(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Mf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?_f(Object(r),!0).forEach((function(e){Tf(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):_f(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Tf(t,e,r){var n;return n=function(t){if("object"!=kf(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=kf(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==kf(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Sf(Af,"displayName","Brush"),Sf(Af,"defaultProps",{height:40,travellerWidth:5,gap:1,fill:"#fff",stroke:"#666",padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1});var Cf=Math.PI/180,Df=function(t){return 180*t/Math.PI},If=function(t,e,r,n){return{x:t+Math.cos(-Cf*n)*r,y:e+Math.sin(-Cf*n)*r}},Nf=function(t,e){var r=e.startAngle,n=e.endAngle,o=Math.floor(r/360),i=Math.floor(n/360);return t+360*Math.min(o,i)},Bf=function(t,e){var r=function(t,e){var r=t.x,n=t.y,o=e.cx,i=e.cy,a=function(t,e){var r=t.x,n=t.y,o=e.x,i=e.y;return Math.sqrt(Math.pow(r-o,2)+Math.pow(n-i,2))}({x:r,y:n},{x:o,y:i});if(a<=0)return{radius:a};var c=(r-o)/a,u=Math.acos(c);return n>i&&(u=2*Math.PI-u),{radius:a,angle:Df(u),angleInRadian:u}}({x:t.x,y:t.y},e),n=r.radius,o=r.angle,i=e.innerRadius,a=e.outerRadius;if(n<i||n>a)return!1;if(0===n)return!0;var c,u=function(t){var e=t.startAngle,r=t.endAngle,n=Math.floor(e/360),o=Math.floor(r/360),i=Math.min(n,o);return{startAngle:e-360*i,endAngle:r-360*i}}(e),l=u.startAngle,s=u.endAngle,f=o;if(l<=s){for(;f>s;)f-=360;for(;f<l;)f+=360;c=f>=l&&f<=s}else{for(;f>l;)f-=360;for(;f<s;)f+=360;c=f>=s&&f<=l}return c?Mf(Mf({},e),{},{radius:n,angle:Nf(f,e)}):null};function Rf(t){return Rf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Rf(t)}var Lf=["offset"];function zf(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Ff(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Uf(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Ff(Object(r),!0).forEach((function(e){$f(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Ff(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function $f(t,e,r){var n;return n=function(t){if("object"!=Rf(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Rf(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Rf(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function qf(){return qf=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},qf.apply(this,arguments)}function Wf(t){var r,n=t.offset,i=Uf({offset:void 0===n?5:n},function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,Lf)),c=i.viewBox,u=i.position,l=i.value,s=i.children,f=i.content,p=i.className,h=void 0===p?"":p,d=i.textBreakAll;if(!c||M()(l)&&M()(s)&&!(0,e.isValidElement)(f)&&!C()(f))return null;if((0,e.isValidElement)(f))return(0,e.cloneElement)(f,i);if(C()(f)){if(r=(0,e.createElement)(f,i),(0,e.isValidElement)(r))return r}else r=function(t){var e=t.value,r=t.formatter,n=M()(t.children)?e:t.children;return C()(r)?r(n):n}(i);var y=function(t){return"cx"in t&&g(t.cx)}(c),v=nt(i,!0);if(y&&("insideStart"===u||"insideEnd"===u||"end"===u))return function(t,e,r){var n,i,c=t.position,u=t.viewBox,l=t.offset,s=t.className,f=u,p=f.cx,h=f.cy,d=f.innerRadius,y=f.outerRadius,v=f.startAngle,b=f.endAngle,g=f.clockWise,x=(d+y)/2,w=function(t,e){return m(e-t)*Math.min(Math.abs(e-t),360)}(v,b),j=w>=0?1:-1;"insideStart"===c?(n=v+j*l,i=g):"insideEnd"===c?(n=b-j*l,i=!g):"end"===c&&(n=b+j*l,i=g),i=w<=0?i:!i;var S=If(p,h,x,n),P=If(p,h,x,n+359*(i?1:-1)),E="M".concat(S.x,",").concat(S.y,"\n    A").concat(x,",").concat(x,",0,1,").concat(i?0:1,",\n    ").concat(P.x,",").concat(P.y),A=M()(t.id)?O("recharts-radial-line-"):t.id;return o().createElement("text",qf({},r,{dominantBaseline:"central",className:a("recharts-radial-bar-label",s)}),o().createElement("defs",null,o().createElement("path",{id:A,d:E})),o().createElement("textPath",{xlinkHref:"#".concat(A)},e))}(i,r,v);var x=y?function(t){var e=t.viewBox,r=t.offset,n=t.position,o=e,i=o.cx,a=o.cy,c=o.innerRadius,u=o.outerRadius,l=(o.startAngle+o.endAngle)/2;if("outside"===n){var s=If(i,a,u+r,l),f=s.x;return{x:f,y:s.y,textAnchor:f>=i?"start":"end",verticalAnchor:"middle"}}if("center"===n)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"middle"};if("centerTop"===n)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"start"};if("centerBottom"===n)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"end"};var p=If(i,a,(c+u)/2,l);return{x:p.x,y:p.y,textAnchor:"middle",verticalAnchor:"middle"}}(i):function(t){var e=t.viewBox,r=t.parentViewBox,n=t.offset,o=t.position,i=e,a=i.x,c=i.y,u=i.width,l=i.height,s=l>=0?1:-1,f=s*n,p=s>0?"end":"start",h=s>0?"start":"end",d=u>=0?1:-1,y=d*n,v=d>0?"end":"start",m=d>0?"start":"end";if("top"===o)return Uf(Uf({},{x:a+u/2,y:c-s*n,textAnchor:"middle",verticalAnchor:p}),r?{height:Math.max(c-r.y,0),width:u}:{});if("bottom"===o)return Uf(Uf({},{x:a+u/2,y:c+l+f,textAnchor:"middle",verticalAnchor:h}),r?{height:Math.max(r.y+r.height-(c+l),0),width:u}:{});if("left"===o){var x={x:a-y,y:c+l/2,textAnchor:v,verticalAnchor:"middle"};return Uf(Uf({},x),r?{width:Math.max(x.x-r.x,0),height:l}:{})}if("right"===o){var w={x:a+u+y,y:c+l/2,textAnchor:m,verticalAnchor:"middle"};return Uf(Uf({},w),r?{width:Math.max(r.x+r.width-w.x,0),height:l}:{})}var O=r?{width:u,height:l}:{};return"insideLeft"===o?Uf({x:a+y,y:c+l/2,textAnchor:m,verticalAnchor:"middle"},O):"insideRight"===o?Uf({x:a+u-y,y:c+l/2,textAnchor:v,verticalAnchor:"middle"},O):"insideTop"===o?Uf({x:a+u/2,y:c+f,textAnchor:"middle",verticalAnchor:h},O):"insideBottom"===o?Uf({x:a+u/2,y:c+l-f,textAnchor:"middle",verticalAnchor:p},O):"insideTopLeft"===o?Uf({x:a+y,y:c+f,textAnchor:m,verticalAnchor:h},O):"insideTopRight"===o?Uf({x:a+u-y,y:c+f,textAnchor:v,verticalAnchor:h},O):"insideBottomLeft"===o?Uf({x:a+y,y:c+l-f,textAnchor:m,verticalAnchor:p},O):"insideBottomRight"===o?Uf({x:a+u-y,y:c+l-f,textAnchor:v,verticalAnchor:p},O):I()(o)&&(g(o.x)||b(o.x))&&(g(o.y)||b(o.y))?Uf({x:a+j(o.x,u),y:c+j(o.y,l),textAnchor:"end",verticalAnchor:"end"},O):Uf({x:a+u/2,y:c+l/2,textAnchor:"middle",verticalAnchor:"middle"},O)}(i);return o().createElement(Wo,qf({className:a("recharts-label",h)},v,x,{breakAll:d}),r)}Wf.displayName="Label";var Xf=function(t){var e=t.cx,r=t.cy,n=t.angle,o=t.startAngle,i=t.endAngle,a=t.r,c=t.radius,u=t.innerRadius,l=t.outerRadius,s=t.x,f=t.y,p=t.top,h=t.left,d=t.width,y=t.height,v=t.clockWise,m=t.labelViewBox;if(m)return m;if(g(d)&&g(y)){if(g(s)&&g(f))return{x:s,y:f,width:d,height:y};if(g(p)&&g(h))return{x:p,y:h,width:d,height:y}}return g(s)&&g(f)?{x:s,y:f,width:0,height:0}:g(e)&&g(r)?{cx:e,cy:r,startAngle:o||n||0,endAngle:i||n||0,innerRadius:u||0,outerRadius:l||c||a||0,clockWise:v}:t.viewBox?t.viewBox:{}};Wf.parseViewBox=Xf,Wf.renderCallByParent=function(t,r){var n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!t||!t.children&&n&&!t.label)return null;var i=t.children,a=Xf(t),c=Q(i,Wf).map((function(t,n){return(0,e.cloneElement)(t,{viewBox:r||a,key:"label-".concat(n)})}));if(!n)return c;var u,l=function(t,r){return t?!0===t?o().createElement(Wf,{key:"label-implicit",viewBox:r}):x(t)?o().createElement(Wf,{key:"label-implicit",viewBox:r,value:t}):(0,e.isValidElement)(t)?t.type===Wf?(0,e.cloneElement)(t,{key:"label-implicit",viewBox:r}):o().createElement(Wf,{key:"label-implicit",content:t,viewBox:r}):C()(t)?o().createElement(Wf,{key:"label-implicit",content:t,viewBox:r}):I()(t)?o().createElement(Wf,qf({viewBox:r},t,{key:"label-implicit"})):null:null}(t.label,r||a);return[l].concat(function(t){if(Array.isArray(t))return zf(t)}(u=c)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(u)||function(t,e){if(t){if("string"==typeof t)return zf(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?zf(t,e):void 0}}(u)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}())};var Hf=function(t,e){var r=t.alwaysShow,n=t.ifOverflow;return r&&(n="extendDomain"),n===e},Gf=r(3916),Vf=r.n(Gf),Yf=r(9747),Kf=r.n(Yf),Zf=function(t){return null};Zf.displayName="Cell";var Jf=r(8090),Qf=r.n(Jf);function tp(t){return tp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},tp(t)}var ep=["valueAccessor"],rp=["data","dataKey","clockWise","id","textBreakAll"];function np(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function op(){return op=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},op.apply(this,arguments)}function ip(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function ap(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?ip(Object(r),!0).forEach((function(e){cp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):ip(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function cp(t,e,r){var n;return n=function(t){if("object"!=tp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=tp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==tp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function up(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}var lp=function(t){return Array.isArray(t.value)?Qf()(t.value):t.value};function sp(t){var e=t.valueAccessor,r=void 0===e?lp:e,n=up(t,ep),i=n.data,a=n.dataKey,c=n.clockWise,u=n.id,l=n.textBreakAll,s=up(n,rp);return i&&i.length?o().createElement(jt,{className:"recharts-label-list"},i.map((function(t,e){var n=M()(a)?r(t,e):$s(t&&t.payload,a),i=M()(u)?{}:{id:"".concat(u,"-").concat(e)};return o().createElement(Wf,op({},nt(t,!0),s,i,{parentViewBox:t.parentViewBox,value:n,textBreakAll:l,viewBox:Wf.parseViewBox(M()(c)?t:ap(ap({},t),{},{clockWise:c})),key:"label-".concat(e),index:e}))}))):null}sp.displayName="LabelList",sp.renderCallByParent=function(t,r){var n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!t||!t.children&&n&&!t.label)return null;var i,a=Q(t.children,sp).map((function(t,n){return(0,e.cloneElement)(t,{data:r,key:"labelList-".concat(n)})}));return n?[function(t,e){return t?!0===t?o().createElement(sp,{key:"labelList-implicit",data:e}):o().isValidElement(t)||C()(t)?o().createElement(sp,{key:"labelList-implicit",data:e,content:t}):I()(t)?o().createElement(sp,op({data:e},t,{key:"labelList-implicit"})):null:null}(t.label,r)].concat(function(t){if(Array.isArray(t))return np(t)}(i=a)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(i)||function(t,e){if(t){if("string"==typeof t)return np(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?np(t,e):void 0}}(i)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()):a};var fp=r(1331),pp=r.n(fp),hp=r(3812),dp=r.n(hp);function yp(t){return yp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},yp(t)}function vp(){return vp=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},vp.apply(this,arguments)}function mp(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function bp(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function gp(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?bp(Object(r),!0).forEach((function(e){xp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):bp(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function xp(t,e,r){var n;return n=function(t){if("object"!=yp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=yp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==yp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var wp=function(t,e,r,n,o){var i,a=r-n;return i="M ".concat(t,",").concat(e),i+="L ".concat(t+r,",").concat(e),i+="L ".concat(t+r-a/2,",").concat(e+o),(i+="L ".concat(t+r-a/2-n,",").concat(e+o))+"L ".concat(t,",").concat(e," Z")},Op={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},jp=function(t){var r,n,i=gp(gp({},Op),t),c=(0,e.useRef)(),u=(r=(0,e.useState)(-1),n=2,function(t){if(Array.isArray(t))return t}(r)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(r,n)||function(t,e){if(t){if("string"==typeof t)return mp(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?mp(t,e):void 0}}(r,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),l=u[0],s=u[1];(0,e.useEffect)((function(){if(c.current&&c.current.getTotalLength)try{var t=c.current.getTotalLength();t&&s(t)}catch(t){}}),[]);var f=i.x,p=i.y,h=i.upperWidth,d=i.lowerWidth,y=i.height,v=i.className,m=i.animationEasing,b=i.animationDuration,g=i.animationBegin,x=i.isUpdateAnimationActive;if(f!==+f||p!==+p||h!==+h||d!==+d||y!==+y||0===h&&0===d||0===y)return null;var w=a("recharts-trapezoid",v);return x?o().createElement($n,{canBegin:l>0,from:{upperWidth:0,lowerWidth:0,height:y,x:f,y:p},to:{upperWidth:h,lowerWidth:d,height:y,x:f,y:p},duration:b,animationEasing:m,isActive:x},(function(t){var e=t.upperWidth,r=t.lowerWidth,n=t.height,a=t.x,u=t.y;return o().createElement($n,{canBegin:l>0,from:"0px ".concat(-1===l?1:l,"px"),to:"".concat(l,"px 0px"),attributeName:"strokeDasharray",begin:g,duration:b,easing:m},o().createElement("path",vp({},nt(i,!0),{className:w,d:wp(a,u,e,r,n),ref:c})))})):o().createElement("g",null,o().createElement("path",vp({},nt(i,!0),{className:w,d:wp(f,p,h,d,y)})))};function Sp(t){return Sp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Sp(t)}function Pp(){return Pp=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Pp.apply(this,arguments)}function Ep(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ap(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Ep(Object(r),!0).forEach((function(e){kp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Ep(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function kp(t,e,r){var n;return n=function(t){if("object"!=Sp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Sp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Sp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var _p=function(t){var e=t.cx,r=t.cy,n=t.radius,o=t.angle,i=t.sign,a=t.isExternal,c=t.cornerRadius,u=t.cornerIsExternal,l=c*(a?1:-1)+n,s=Math.asin(c/l)/Cf,f=u?o:o+i*s,p=u?o-i*s:o;return{center:If(e,r,l,f),circleTangency:If(e,r,n,f),lineTangency:If(e,r,l*Math.cos(s*Cf),p),theta:s}},Mp=function(t){var e=t.cx,r=t.cy,n=t.innerRadius,o=t.outerRadius,i=t.startAngle,a=function(t,e){return m(e-t)*Math.min(Math.abs(e-t),359.999)}(i,t.endAngle),c=i+a,u=If(e,r,o,i),l=If(e,r,o,c),s="M ".concat(u.x,",").concat(u.y,"\n    A ").concat(o,",").concat(o,",0,\n    ").concat(+(Math.abs(a)>180),",").concat(+(i>c),",\n    ").concat(l.x,",").concat(l.y,"\n  ");if(n>0){var f=If(e,r,n,i),p=If(e,r,n,c);s+="L ".concat(p.x,",").concat(p.y,"\n            A ").concat(n,",").concat(n,",0,\n            ").concat(+(Math.abs(a)>180),",").concat(+(i<=c),",\n            ").concat(f.x,",").concat(f.y," Z")}else s+="L ".concat(e,",").concat(r," Z");return s},Tp={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},Cp=function(t){var e=Ap(Ap({},Tp),t),r=e.cx,n=e.cy,i=e.innerRadius,c=e.outerRadius,u=e.cornerRadius,l=e.forceCornerRadius,s=e.cornerIsExternal,f=e.startAngle,p=e.endAngle,h=e.className;if(c<i||f===p)return null;var d,y=a("recharts-sector",h),v=c-i,b=j(u,v,0,!0);return d=b>0&&Math.abs(f-p)<360?function(t){var e=t.cx,r=t.cy,n=t.innerRadius,o=t.outerRadius,i=t.cornerRadius,a=t.forceCornerRadius,c=t.cornerIsExternal,u=t.startAngle,l=t.endAngle,s=m(l-u),f=_p({cx:e,cy:r,radius:o,angle:u,sign:s,cornerRadius:i,cornerIsExternal:c}),p=f.circleTangency,h=f.lineTangency,d=f.theta,y=_p({cx:e,cy:r,radius:o,angle:l,sign:-s,cornerRadius:i,cornerIsExternal:c}),v=y.circleTangency,b=y.lineTangency,g=y.theta,x=c?Math.abs(u-l):Math.abs(u-l)-d-g;if(x<0)return a?"M ".concat(h.x,",").concat(h.y,"\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*i,",0\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*-i,",0\n      "):Mp({cx:e,cy:r,innerRadius:n,outerRadius:o,startAngle:u,endAngle:l});var w="M ".concat(h.x,",").concat(h.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(p.x,",").concat(p.y,"\n    A").concat(o,",").concat(o,",0,").concat(+(x>180),",").concat(+(s<0),",").concat(v.x,",").concat(v.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(b.x,",").concat(b.y,"\n  ");if(n>0){var O=_p({cx:e,cy:r,radius:n,angle:u,sign:s,isExternal:!0,cornerRadius:i,cornerIsExternal:c}),j=O.circleTangency,S=O.lineTangency,P=O.theta,E=_p({cx:e,cy:r,radius:n,angle:l,sign:-s,isExternal:!0,cornerRadius:i,cornerIsExternal:c}),A=E.circleTangency,k=E.lineTangency,_=E.theta,M=c?Math.abs(u-l):Math.abs(u-l)-P-_;if(M<0&&0===i)return"".concat(w,"L").concat(e,",").concat(r,"Z");w+="L".concat(k.x,",").concat(k.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(A.x,",").concat(A.y,"\n      A").concat(n,",").concat(n,",0,").concat(+(M>180),",").concat(+(s>0),",").concat(j.x,",").concat(j.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(S.x,",").concat(S.y,"Z")}else w+="L".concat(e,",").concat(r,"Z");return w}({cx:r,cy:n,innerRadius:i,outerRadius:c,cornerRadius:Math.min(b,v/2),forceCornerRadius:l,cornerIsExternal:s,startAngle:f,endAngle:p}):Mp({cx:r,cy:n,innerRadius:i,outerRadius:c,startAngle:f,endAngle:p}),o().createElement("path",Pp({},nt(e,!0),{className:y,d,role:"img"}))},Dp=["option","shapeType","propTransformer","activeClassName","isActive"];function Ip(t){return Ip="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ip(t)}function Np(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Bp(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Np(Object(r),!0).forEach((function(e){Rp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Np(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Rp(t,e,r){var n;return n=function(t){if("object"!=Ip(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ip(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Ip(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Lp(t,e){return Bp(Bp({},e),t)}function zp(t){var e=t.shapeType,r=t.elementProps;switch(e){case"rectangle":return o().createElement(Jn,r);case"trapezoid":return o().createElement(jp,r);case"sector":return o().createElement(Cp,r);case"symbols":if(function(t){return"symbols"===t}(e))return o().createElement(Ye,r);break;default:return null}}function Fp(t){var r,n=t.option,i=t.shapeType,a=t.propTransformer,c=void 0===a?Lp:a,u=t.activeClassName,l=void 0===u?"recharts-active-shape":u,s=t.isActive,f=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,Dp);if((0,e.isValidElement)(n))r=(0,e.cloneElement)(n,Bp(Bp({},f),function(t){return(0,e.isValidElement)(t)?t.props:t}(n)));else if(C()(n))r=n(f);else if(pp()(n)&&!dp()(n)){var p=c(n,f);r=o().createElement(zp,{shapeType:i,elementProps:p})}else{var h=f;r=o().createElement(zp,{shapeType:i,elementProps:h})}return s?o().createElement(jt,{className:l},r):r}function Up(t,e){return null!=e&&"trapezoids"in t.props}function $p(t,e){return null!=e&&"sectors"in t.props}function qp(t,e){return null!=e&&"points"in t.props}function Wp(t,e){var r,n,o=t.x===(null==e||null===(r=e.labelViewBox)||void 0===r?void 0:r.x)||t.x===e.x,i=t.y===(null==e||null===(n=e.labelViewBox)||void 0===n?void 0:n.y)||t.y===e.y;return o&&i}function Xp(t,e){var r=t.endAngle===e.endAngle,n=t.startAngle===e.startAngle;return r&&n}function Hp(t,e){var r=t.x===e.x,n=t.y===e.y,o=t.z===e.z;return r&&n&&o}function Gp(t){var e=t.activeTooltipItem,r=t.graphicalItem,n=t.itemData,o=function(t,e){var r;return Up(t,e)?r="trapezoids":$p(t,e)?r="sectors":qp(t,e)&&(r="points"),r}(r,e),i=function(t,e){var r,n;return Up(t,e)?null===(r=e.tooltipPayload)||void 0===r||null===(r=r[0])||void 0===r||null===(r=r.payload)||void 0===r?void 0:r.payload:$p(t,e)?null===(n=e.tooltipPayload)||void 0===n||null===(n=n[0])||void 0===n||null===(n=n.payload)||void 0===n?void 0:n.payload:qp(t,e)?e.payload:{}}(r,e),a=n.filter((function(t,n){var a=Gl()(i,t),c=r.props[o].filter((function(t){var n=function(t,e){var r;return Up(t,e)?r=Wp:$p(t,e)?r=Xp:qp(t,e)&&(r=Hp),r}(r,e);return n(t,e)})),u=r.props[o].indexOf(c[c.length-1]);return a&&n===u}));return n.indexOf(a[a.length-1])}var Vp=["x","y"];function Yp(t){return Yp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Yp(t)}function Kp(){return Kp=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Kp.apply(this,arguments)}function Zp(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Jp(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Zp(Object(r),!0).forEach((function(e){Qp(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Zp(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Qp(t,e,r){var n;return n=function(t){if("object"!=Yp(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Yp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Yp(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function th(t,e){var r=t.x,n=t.y,o=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,Vp),i="".concat(r),a=parseInt(i,10),c="".concat(n),u=parseInt(c,10),l="".concat(e.height||o.height),s=parseInt(l,10),f="".concat(e.width||o.width),p=parseInt(f,10);return Jp(Jp(Jp(Jp(Jp({},e),o),a?{x:a}:{}),u?{y:u}:{}),{},{height:s,width:p,name:e.name,radius:e.radius})}function eh(t){return o().createElement(Fp,Kp({shapeType:"rectangle",propTransformer:th,activeClassName:"recharts-active-bar"},t))}var rh,nh=["value","background"];function oh(t){return oh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},oh(t)}function ih(){return ih=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},ih.apply(this,arguments)}function ah(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function ch(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?ah(Object(r),!0).forEach((function(e){ph(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):ah(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function uh(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,hh(n.key),n)}}function lh(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(lh=function(){return!!t})()}function sh(t){return sh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},sh(t)}function fh(t,e){return fh=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},fh(t,e)}function ph(t,e,r){return(e=hh(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function hh(t){var e=function(t){if("object"!=oh(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=oh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==oh(e)?e:e+""}var dh=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return ph((r=this,n=e,o=[].concat(a),n=sh(n),t=function(t,e){if(e&&("object"===oh(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,lh()?Reflect.construct(n,o||[],sh(r).constructor):n.apply(r,o))),"state",{isAnimationFinished:!1}),ph(t,"id",O("recharts-bar-")),ph(t,"handleAnimationEnd",(function(){var e=t.props.onAnimationEnd;t.setState({isAnimationFinished:!0}),e&&e()})),ph(t,"handleAnimationStart",(function(){var e=t.props.onAnimationStart;t.setState({isAnimationFinished:!1}),e&&e()})),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&fh(t,e)}(e,t),r=e,n=[{key:"renderRectanglesStatically",value:function(t){var e=this,r=this.props,n=r.shape,i=r.dataKey,a=r.activeIndex,c=r.activeBar,u=nt(this.props,!1);return t&&t.map((function(t,r){var l=r===a,s=l?c:n,f=ch(ch(ch({},u),t),{},{isActive:l,option:s,index:r,dataKey:i,onAnimationStart:e.handleAnimationStart,onAnimationEnd:e.handleAnimationEnd});return o().createElement(jt,ih({className:"recharts-bar-rectangle"},q(e.props,t,r),{key:"rectangle-".concat(null==t?void 0:t.x,"-").concat(null==t?void 0:t.y,"-").concat(null==t?void 0:t.value,"-").concat(r)}),o().createElement(eh,f))}))}},{key:"renderRectanglesWithAnimation",value:function(){var t=this,e=this.props,r=e.data,n=e.layout,i=e.isAnimationActive,a=e.animationBegin,c=e.animationDuration,u=e.animationEasing,l=e.animationId,s=this.state.prevData;return o().createElement($n,{begin:a,duration:c,isActive:i,easing:u,from:{t:0},to:{t:1},key:"bar-".concat(l),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},(function(e){var i=e.t,a=r.map((function(t,e){var r=s&&s[e];if(r){var o=P(r.x,t.x),a=P(r.y,t.y),c=P(r.width,t.width),u=P(r.height,t.height);return ch(ch({},t),{},{x:o(i),y:a(i),width:c(i),height:u(i)})}if("horizontal"===n){var l=P(0,t.height)(i);return ch(ch({},t),{},{y:t.y+t.height-l,height:l})}var f=P(0,t.width)(i);return ch(ch({},t),{},{width:f})}));return o().createElement(jt,null,t.renderRectanglesStatically(a))}))}},{key:"renderRectangles",value:function(){var t=this.props,e=t.data,r=t.isAnimationActive,n=this.state.prevData;return!(r&&e&&e.length)||n&&Gl()(n,e)?this.renderRectanglesStatically(e):this.renderRectanglesWithAnimation()}},{key:"renderBackground",value:function(){var t=this,e=this.props,r=e.data,n=e.dataKey,i=e.activeIndex,a=nt(this.props.background,!1);return r.map((function(e,r){e.value;var c=e.background,u=function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(e,nh);if(!c)return null;var l=ch(ch(ch(ch(ch({},u),{},{fill:"#eee"},c),a),q(t.props,e,r)),{},{onAnimationStart:t.handleAnimationStart,onAnimationEnd:t.handleAnimationEnd,dataKey:n,index:r,className:"recharts-bar-background-rectangle"});return o().createElement(eh,ih({key:"background-bar-".concat(r),option:t.props.background,isActive:r===i},l))}))}},{key:"renderErrorBar",value:function(t,e){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,n=r.data,i=r.xAxis,a=r.yAxis,c=r.layout,u=Q(r.children,Ms);if(!u)return null;var l="vertical"===c?n[0].height/2:n[0].width/2,s=function(t,e){var r=Array.isArray(t.value)?t.value[1]:t.value;return{x:t.x,y:t.y,value:r,errorVal:$s(t,e)}},f={clipPath:t?"url(#clipPath-".concat(e,")"):null};return o().createElement(jt,f,u.map((function(t){return o().cloneElement(t,{key:"error-bar-".concat(e,"-").concat(t.props.dataKey),data:n,xAxis:i,yAxis:a,layout:c,offset:l,dataPointFormatter:s})})))}},{key:"render",value:function(){var t=this.props,e=t.hide,r=t.data,n=t.className,i=t.xAxis,c=t.yAxis,u=t.left,l=t.top,s=t.width,f=t.height,p=t.isAnimationActive,h=t.background,d=t.id;if(e||!r||!r.length)return null;var y=this.state.isAnimationFinished,v=a("recharts-bar",n),m=i&&i.allowDataOverflow,b=c&&c.allowDataOverflow,g=m||b,x=M()(d)?this.id:d;return o().createElement(jt,{className:v},m||b?o().createElement("defs",null,o().createElement("clipPath",{id:"clipPath-".concat(x)},o().createElement("rect",{x:m?u:u-s/2,y:b?l:l-f/2,width:m?s:2*s,height:b?f:2*f}))):null,o().createElement(jt,{className:"recharts-bar-rectangles",clipPath:g?"url(#clipPath-".concat(x,")"):null},h?this.renderBackground():null,this.renderRectangles()),this.renderErrorBar(g,x),(!p||y)&&sp.renderCallByParent(this.props,r))}}],i=[{key:"getDerivedStateFromProps",value:function(t,e){return t.animationId!==e.prevAnimationId?{prevAnimationId:t.animationId,curData:t.data,prevData:e.curData}:t.data!==e.curData?{curData:t.data}:null}}],n&&uh(r.prototype,n),i&&uh(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.PureComponent);function yh(t){return yh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},yh(t)}function vh(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,xh(n.key),n)}}function mh(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function bh(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?mh(Object(r),!0).forEach((function(e){gh(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):mh(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function gh(t,e,r){return(e=xh(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function xh(t){var e=function(t){if("object"!=yh(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=yh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==yh(e)?e:e+""}rh=dh,ph(dh,"displayName","Bar"),ph(dh,"defaultProps",{xAxisId:0,yAxisId:0,legendType:"rect",minPointSize:0,hide:!1,data:[],layout:"vertical",activeBar:!1,isAnimationActive:!Vt.isSsr,animationBegin:0,animationDuration:400,animationEasing:"ease"}),ph(dh,"getComposedData",(function(t){var e=t.props,r=t.item,n=t.barPosition,o=t.bandSize,i=t.xAxis,a=t.yAxis,c=t.xAxisTicks,u=t.yAxisTicks,l=t.stackedData,s=t.dataStartIndex,f=t.displayedData,p=t.offset,h=function(t,e){if(!t)return null;for(var r=0,n=t.length;r<n;r++)if(t[r].item===e)return t[r].position;return null}(n,r);if(!h)return null;var d=e.layout,y=r.type.defaultProps,v=void 0!==y?ch(ch({},y),r.props):r.props,b=v.dataKey,x=v.children,w=v.minPointSize,O="horizontal"===d?a:i,j=l?O.scale.domain():null,S=function(t){var e=t.numericAxis,r=e.scale.domain();if("number"===e.type){var n=Math.min(r[0],r[1]),o=Math.max(r[0],r[1]);return n<=0&&o>=0?0:o<0?o:n}return r[0]}({numericAxis:O}),P=Q(x,Zf),E=f.map((function(t,e){var n,f,p,y,v,x;l?n=function(t,e){if(!e||2!==e.length||!g(e[0])||!g(e[1]))return t;var r=Math.min(e[0],e[1]),n=Math.max(e[0],e[1]),o=[t[0],t[1]];return(!g(t[0])||t[0]<r)&&(o[0]=r),(!g(t[1])||t[1]>n)&&(o[1]=n),o[0]>n&&(o[0]=n),o[1]<r&&(o[1]=r),o}(l[s+e],j):(n=$s(t,b),Array.isArray(n)||(n=[S,n]));var O=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return function(r,n){if("number"==typeof t)return t;var o="number"==typeof r;return o?t(r,n):(o||mt(!1),e)}}(w,rh.defaultProps.minPointSize)(n[1],e);if("horizontal"===d){var E,A=[a.scale(n[0]),a.scale(n[1])],k=A[0],_=A[1];f=rf({axis:i,ticks:c,bandSize:o,offset:h.offset,entry:t,index:e}),p=null!==(E=null!=_?_:k)&&void 0!==E?E:void 0,y=h.size;var M=k-_;if(v=Number.isNaN(M)?0:M,x={x:f,y:a.y,width:y,height:a.height},Math.abs(O)>0&&Math.abs(v)<Math.abs(O)){var T=m(v||O)*(Math.abs(O)-Math.abs(v));p-=T,v+=T}}else{var C=[i.scale(n[0]),i.scale(n[1])],D=C[0],I=C[1];f=D,p=rf({axis:a,ticks:u,bandSize:o,offset:h.offset,entry:t,index:e}),y=I-D,v=h.size,x={x:i.x,y:p,width:i.width,height:v},Math.abs(O)>0&&Math.abs(y)<Math.abs(O)&&(y+=m(y||O)*(Math.abs(O)-Math.abs(y)))}return ch(ch(ch({},t),{},{x:f,y:p,width:y,height:v,value:l?n:n[1],payload:t,background:x},P&&P[e]&&P[e].props),{},{tooltipPayload:[sf(r,t)],tooltipPosition:{x:f+y/2,y:p+v/2}})}));return ch({data:E,layout:d},p)}));var wh=function(t,e){var r=t.x,n=t.y,o=e.x,i=e.y;return{x:Math.min(r,o),y:Math.min(n,i),width:Math.abs(o-r),height:Math.abs(i-n)}},Oh=function(){function t(e){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.scale=e}return e=t,r=[{key:"domain",get:function(){return this.scale.domain}},{key:"range",get:function(){return this.scale.range}},{key:"rangeMin",get:function(){return this.range()[0]}},{key:"rangeMax",get:function(){return this.range()[1]}},{key:"bandwidth",get:function(){return this.scale.bandwidth}},{key:"apply",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=e.bandAware,n=e.position;if(void 0!==t){if(n)switch(n){case"start":default:return this.scale(t);case"middle":var o=this.bandwidth?this.bandwidth()/2:0;return this.scale(t)+o;case"end":var i=this.bandwidth?this.bandwidth():0;return this.scale(t)+i}if(r){var a=this.bandwidth?this.bandwidth()/2:0;return this.scale(t)+a}return this.scale(t)}}},{key:"isInRange",value:function(t){var e=this.range(),r=e[0],n=e[e.length-1];return r<=n?t>=r&&t<=n:t>=n&&t<=r}}],n=[{key:"create",value:function(e){return new t(e)}}],r&&vh(e.prototype,r),n&&vh(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,r,n}();gh(Oh,"EPS",1e-4);var jh=function(t){var e=Object.keys(t).reduce((function(e,r){return bh(bh({},e),{},gh({},r,Oh.create(t[r])))}),{});return bh(bh({},e),{},{apply:function(t){var r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=r.bandAware,o=r.position;return Vf()(t,(function(t,r){return e[r].apply(t,{bandAware:n,position:o})}))},isInRange:function(t){return Kf()(t,(function(t,r){return e[r].isInRange(t)}))}})};function Sh(){return Sh=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Sh.apply(this,arguments)}function Ph(t){return Ph="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ph(t)}function Eh(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ah(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Eh(Object(r),!0).forEach((function(e){Ch(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Eh(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function kh(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Dh(n.key),n)}}function _h(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(_h=function(){return!!t})()}function Mh(t){return Mh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Mh(t)}function Th(t,e){return Th=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Th(t,e)}function Ch(t,e,r){return(e=Dh(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Dh(t){var e=function(t){if("object"!=Ph(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Ph(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Ph(e)?e:e+""}var Ih=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=Mh(r=e),function(t,e){if(e&&("object"===Ph(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,_h()?Reflect.construct(r,n||[],Mh(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Th(t,e)}(e,t),r=e,n=[{key:"render",value:function(){var t=this.props,r=t.x,n=t.y,i=t.r,c=t.alwaysShow,u=t.clipPathId,l=x(r),s=x(n);if(k(void 0===c,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.'),!l||!s)return null;var f=function(t){var e=t.x,r=t.y,n=t.xAxis,o=t.yAxis,i=jh({x:n.scale,y:o.scale}),a=i.apply({x:e,y:r},{bandAware:!0});return Hf(t,"discard")&&!i.isInRange(a)?null:a}(this.props);if(!f)return null;var p=f.x,h=f.y,d=this.props,y=d.shape,v=d.className,m=Ah(Ah({clipPath:Hf(this.props,"hidden")?"url(#".concat(u,")"):void 0},nt(this.props,!0)),{},{cx:p,cy:h});return o().createElement(jt,{className:a("recharts-reference-dot",v)},e.renderDot(y,m),Wf.renderCallByParent(this.props,{x:p-i,y:h-i,width:2*i,height:2*i}))}}],n&&kh(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);Ch(Ih,"displayName","ReferenceDot"),Ch(Ih,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#fff",stroke:"#ccc",fillOpacity:1,strokeWidth:1}),Ch(Ih,"renderDot",(function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement(xr,Sh({},e,{cx:e.cx,cy:e.cy,className:"recharts-reference-dot-dot"}))}));var Nh=r(2426),Bh=r.n(Nh),Rh=r(7309),Lh=r.n(Rh),zh=r(104),Fh=r.n(zh)()((function(t){return{x:t.left,y:t.top,width:t.width,height:t.height}}),(function(t){return["l",t.left,"t",t.top,"w",t.width,"h",t.height].join("")})),Uh=(0,e.createContext)(void 0),$h=(0,e.createContext)(void 0),qh=(0,e.createContext)(void 0),Wh=(0,e.createContext)({}),Xh=(0,e.createContext)(void 0),Hh=(0,e.createContext)(0),Gh=(0,e.createContext)(0),Vh=function(t){var e=t.state,r=e.xAxisMap,n=e.yAxisMap,i=e.offset,a=t.clipPathId,c=t.children,u=t.width,l=t.height,s=Fh(i);return o().createElement(Uh.Provider,{value:r},o().createElement($h.Provider,{value:n},o().createElement(Wh.Provider,{value:i},o().createElement(qh.Provider,{value:s},o().createElement(Xh.Provider,{value:a},o().createElement(Hh.Provider,{value:l},o().createElement(Gh.Provider,{value:u},c)))))))},Yh=function(t){var r=(0,e.useContext)(Uh);null==r&&mt(!1);var n=r[t];return null==n&&mt(!1),n},Kh=function(t){var r=(0,e.useContext)($h);null==r&&mt(!1);var n=r[t];return null==n&&mt(!1),n},Zh=function(){return(0,e.useContext)(Gh)},Jh=function(){return(0,e.useContext)(Hh)};function Qh(t){return Qh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Qh(t)}function td(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,cd(n.key),n)}}function ed(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(ed=function(){return!!t})()}function rd(t){return rd=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},rd(t)}function nd(t,e){return nd=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},nd(t,e)}function od(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function id(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?od(Object(r),!0).forEach((function(e){ad(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):od(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function ad(t,e,r){return(e=cd(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function cd(t){var e=function(t){if("object"!=Qh(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Qh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Qh(e)?e:e+""}function ud(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function ld(){return ld=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},ld.apply(this,arguments)}function sd(t){var r=t.x,n=t.y,i=t.segment,c=t.xAxisId,u=t.yAxisId,l=t.shape,s=t.className,f=t.alwaysShow,p=(0,e.useContext)(Xh),h=Yh(c),d=Kh(u),y=(0,e.useContext)(qh);if(!p||!y)return null;k(void 0===f,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var v=function(t,e,r,n,o,i,a,c,u){var l=o.x,s=o.y,f=o.width,p=o.height;if(r){var h=u.y,d=t.y.apply(h,{position:i});if(Hf(u,"discard")&&!t.y.isInRange(d))return null;var y=[{x:l+f,y:d},{x:l,y:d}];return"left"===c?y.reverse():y}if(e){var v=u.x,m=t.x.apply(v,{position:i});if(Hf(u,"discard")&&!t.x.isInRange(m))return null;var b=[{x:m,y:s+p},{x:m,y:s}];return"top"===a?b.reverse():b}if(n){var g=u.segment.map((function(e){return t.apply(e,{position:i})}));return Hf(u,"discard")&&Bh()(g,(function(e){return!t.isInRange(e)}))?null:g}return null}(jh({x:h.scale,y:d.scale}),x(r),x(n),i&&2===i.length,y,t.position,h.orientation,d.orientation,t);if(!v)return null;var m,b,g,w=(b=2,function(t){if(Array.isArray(t))return t}(m=v)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(m,b)||function(t,e){if(t){if("string"==typeof t)return ud(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?ud(t,e):void 0}}(m,b)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),O=w[0],j=O.x,S=O.y,P=w[1],E=P.x,A=P.y,_=id(id({clipPath:Hf(t,"hidden")?"url(#".concat(p,")"):void 0},nt(t,!0)),{},{x1:j,y1:S,x2:E,y2:A});return o().createElement(jt,{className:a("recharts-reference-line",s)},function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement("line",ld({},e,{className:"recharts-reference-line-line"}))}(l,_),Wf.renderCallByParent(t,wh({x:(g={x1:j,y1:S,x2:E,y2:A}).x1,y:g.y1},{x:g.x2,y:g.y2})))}var fd=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=rd(r=e),function(t,e){if(e&&("object"===Qh(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,ed()?Reflect.construct(r,n||[],rd(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&nd(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){return o().createElement(sd,this.props)}}])&&td(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function pd(){return pd=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},pd.apply(this,arguments)}function hd(t){return hd="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},hd(t)}function dd(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function yd(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?dd(Object(r),!0).forEach((function(e){xd(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):dd(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function vd(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,wd(n.key),n)}}function md(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(md=function(){return!!t})()}function bd(t){return bd=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},bd(t)}function gd(t,e){return gd=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},gd(t,e)}function xd(t,e,r){return(e=wd(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function wd(t){var e=function(t){if("object"!=hd(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=hd(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==hd(e)?e:e+""}ad(fd,"displayName","ReferenceLine"),ad(fd,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,fill:"none",stroke:"#ccc",fillOpacity:1,strokeWidth:1,position:"middle"});var Od=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=bd(r=e),function(t,e){if(e&&("object"===hd(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,md()?Reflect.construct(r,n||[],bd(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&gd(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){var t=this.props,r=t.x1,n=t.x2,i=t.y1,c=t.y2,u=t.className,l=t.alwaysShow,s=t.clipPathId;k(void 0===l,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var f=x(r),p=x(n),h=x(i),d=x(c),y=this.props.shape;if(!(f||p||h||d||y))return null;var v=function(t,e,r,n,o){var i=o.x1,a=o.x2,c=o.y1,u=o.y2,l=o.xAxis,s=o.yAxis;if(!l||!s)return null;var f=jh({x:l.scale,y:s.scale}),p={x:t?f.x.apply(i,{position:"start"}):f.x.rangeMin,y:r?f.y.apply(c,{position:"start"}):f.y.rangeMin},h={x:e?f.x.apply(a,{position:"end"}):f.x.rangeMax,y:n?f.y.apply(u,{position:"end"}):f.y.rangeMax};return!Hf(o,"discard")||f.isInRange(p)&&f.isInRange(h)?wh(p,h):null}(f,p,h,d,this.props);if(!v&&!y)return null;var m=Hf(this.props,"hidden")?"url(#".concat(s,")"):void 0;return o().createElement(jt,{className:a("recharts-reference-area",u)},e.renderRect(y,yd(yd({clipPath:m},nt(this.props,!0)),v)),Wf.renderCallByParent(this.props,v))}}])&&vd(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function jd(t){return function(t){if(Array.isArray(t))return Sd(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return Sd(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Sd(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Sd(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}xd(Od,"displayName","ReferenceArea"),xd(Od,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#ccc",fillOpacity:.5,stroke:"none",strokeWidth:1}),xd(Od,"renderRect",(function(t,e){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement(Jn,pd({},e,{className:"recharts-reference-area-rect"}))}));var Pd=function(t,e,r,n,o){var i=Q(t,fd),a=Q(t,Ih),c=[].concat(jd(i),jd(a)),u=Q(t,Od),l="".concat(n,"Id"),s=n[0],f=e;if(c.length&&(f=c.reduce((function(t,e){if(e.props[l]===r&&Hf(e.props,"extendDomain")&&g(e.props[s])){var n=e.props[s];return[Math.min(t[0],n),Math.max(t[1],n)]}return t}),f)),u.length){var p="".concat(s,"1"),h="".concat(s,"2");f=u.reduce((function(t,e){if(e.props[l]===r&&Hf(e.props,"extendDomain")&&g(e.props[p])&&g(e.props[h])){var n=e.props[p],o=e.props[h];return[Math.min(t[0],n,o),Math.max(t[1],n,o)]}return t}),f)}return o&&o.length&&(f=o.reduce((function(t,e){return g(e)?[Math.min(t[0],e),Math.max(t[1],e)]:t}),f)),f},Ed=r(228),Ad=new(r.n(Ed)()),kd="recharts.syncMouseEvents";function _d(t){return _d="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},_d(t)}function Md(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Cd(n.key),n)}}function Td(t,e,r){return(e=Cd(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Cd(t){var e=function(t){if("object"!=_d(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=_d(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==_d(e)?e:e+""}var Dd=function(){return t=function t(){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),Td(this,"activeIndex",0),Td(this,"coordinateList",[]),Td(this,"layout","horizontal")},(e=[{key:"setDetails",value:function(t){var e,r=t.coordinateList,n=void 0===r?null:r,o=t.container,i=void 0===o?null:o,a=t.layout,c=void 0===a?null:a,u=t.offset,l=void 0===u?null:u,s=t.mouseHandlerCallback,f=void 0===s?null:s;this.coordinateList=null!==(e=null!=n?n:this.coordinateList)&&void 0!==e?e:[],this.container=null!=i?i:this.container,this.layout=null!=c?c:this.layout,this.offset=null!=l?l:this.offset,this.mouseHandlerCallback=null!=f?f:this.mouseHandlerCallback,this.activeIndex=Math.min(Math.max(this.activeIndex,0),this.coordinateList.length-1)}},{key:"focus",value:function(){this.spoofMouse()}},{key:"keyboardEvent",value:function(t){if(0!==this.coordinateList.length)switch(t.key){case"ArrowRight":if("horizontal"!==this.layout)return;this.activeIndex=Math.min(this.activeIndex+1,this.coordinateList.length-1),this.spoofMouse();break;case"ArrowLeft":if("horizontal"!==this.layout)return;this.activeIndex=Math.max(this.activeIndex-1,0),this.spoofMouse()}}},{key:"setIndex",value:function(t){this.activeIndex=t}},{key:"spoofMouse",value:function(){var t,e;if("horizontal"===this.layout&&0!==this.coordinateList.length){var r=this.container.getBoundingClientRect(),n=r.x,o=r.y,i=r.height,a=this.coordinateList[this.activeIndex].coordinate,c=(null===(t=window)||void 0===t?void 0:t.scrollX)||0,u=(null===(e=window)||void 0===e?void 0:e.scrollY)||0,l=n+a+c,s=o+this.offset.top+i/2+u;this.mouseHandlerCallback({pageX:l,pageY:s})}}}])&&Md(t.prototype,e),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,e}();function Id(){}function Nd(t,e,r){t._context.bezierCurveTo((2*t._x0+t._x1)/3,(2*t._y0+t._y1)/3,(t._x0+2*t._x1)/3,(t._y0+2*t._y1)/3,(t._x0+4*t._x1+e)/6,(t._y0+4*t._y1+r)/6)}function Bd(t){this._context=t}function Rd(t){this._context=t}function Ld(t){this._context=t}Bd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:Nd(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:Nd(this,t,e)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e}},Rd.prototype={areaStart:Id,areaEnd:Id,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._x2=t,this._y2=e;break;case 1:this._point=2,this._x3=t,this._y3=e;break;case 2:this._point=3,this._x4=t,this._y4=e,this._context.moveTo((this._x0+4*this._x1+t)/6,(this._y0+4*this._y1+e)/6);break;default:Nd(this,t,e)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e}},Ld.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var r=(this._x0+4*this._x1+t)/6,n=(this._y0+4*this._y1+e)/6;this._line?this._context.lineTo(r,n):this._context.moveTo(r,n);break;case 3:this._point=4;default:Nd(this,t,e)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e}};class zd{constructor(t,e){this._context=t,this._x=e}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line}point(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+t)/2,this._y0,this._x0,e,t,e):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+e)/2,t,this._y0,t,e)}this._x0=t,this._y0=e}}function Fd(t){this._context=t}function Ud(t){this._context=t}function $d(t){return new Ud(t)}function qd(t){return t<0?-1:1}function Wd(t,e,r){var n=t._x1-t._x0,o=e-t._x1,i=(t._y1-t._y0)/(n||o<0&&-0),a=(r-t._y1)/(o||n<0&&-0),c=(i*o+a*n)/(n+o);return(qd(i)+qd(a))*Math.min(Math.abs(i),Math.abs(a),.5*Math.abs(c))||0}function Xd(t,e){var r=t._x1-t._x0;return r?(3*(t._y1-t._y0)/r-e)/2:e}function Hd(t,e,r){var n=t._x0,o=t._y0,i=t._x1,a=t._y1,c=(i-n)/3;t._context.bezierCurveTo(n+c,o+c*e,i-c,a-c*r,i,a)}function Gd(t){this._context=t}function Vd(t){this._context=new Yd(t)}function Yd(t){this._context=t}function Kd(t){this._context=t}function Zd(t){var e,r,n=t.length-1,o=new Array(n),i=new Array(n),a=new Array(n);for(o[0]=0,i[0]=2,a[0]=t[0]+2*t[1],e=1;e<n-1;++e)o[e]=1,i[e]=4,a[e]=4*t[e]+2*t[e+1];for(o[n-1]=2,i[n-1]=7,a[n-1]=8*t[n-1]+t[n],e=1;e<n;++e)r=o[e]/i[e-1],i[e]-=r,a[e]-=r*a[e-1];for(o[n-1]=a[n-1]/i[n-1],e=n-2;e>=0;--e)o[e]=(a[e]-o[e+1])/i[e];for(i[n-1]=(t[n]+o[n-1])/2,e=0;e<n-1;++e)i[e]=2*t[e+1]-o[e+1];return[o,i]}function Jd(t,e){this._context=t,this._t=e}function Qd(t){return t[0]}function ty(t){return t[1]}function ey(t,e){var r=De(!0),n=null,o=$d,i=null,a=Fe(c);function c(c){var u,l,s,f=(c=Bl(c)).length,p=!1;for(null==n&&(i=o(s=a())),u=0;u<=f;++u)!(u<f&&r(l=c[u],u,c))===p&&((p=!p)?i.lineStart():i.lineEnd()),p&&i.point(+t(l,u,c),+e(l,u,c));if(s)return i=null,s+""||null}return t="function"==typeof t?t:void 0===t?Qd:De(t),e="function"==typeof e?e:void 0===e?ty:De(e),c.x=function(e){return arguments.length?(t="function"==typeof e?e:De(+e),c):t},c.y=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),c):e},c.defined=function(t){return arguments.length?(r="function"==typeof t?t:De(!!t),c):r},c.curve=function(t){return arguments.length?(o=t,null!=n&&(i=o(n)),c):o},c.context=function(t){return arguments.length?(null==t?n=i=null:i=o(n=t),c):n},c}function ry(t,e,r){var n=null,o=De(!0),i=null,a=$d,c=null,u=Fe(l);function l(l){var s,f,p,h,d,y=(l=Bl(l)).length,v=!1,m=new Array(y),b=new Array(y);for(null==i&&(c=a(d=u())),s=0;s<=y;++s){if(!(s<y&&o(h=l[s],s,l))===v)if(v=!v)f=s,c.areaStart(),c.lineStart();else{for(c.lineEnd(),c.lineStart(),p=s-1;p>=f;--p)c.point(m[p],b[p]);c.lineEnd(),c.areaEnd()}v&&(m[s]=+t(h,s,l),b[s]=+e(h,s,l),c.point(n?+n(h,s,l):m[s],r?+r(h,s,l):b[s]))}if(d)return c=null,d+""||null}function s(){return ey().defined(o).curve(a).context(i)}return t="function"==typeof t?t:void 0===t?Qd:De(+t),e="function"==typeof e?e:De(void 0===e?0:+e),r="function"==typeof r?r:void 0===r?ty:De(+r),l.x=function(e){return arguments.length?(t="function"==typeof e?e:De(+e),n=null,l):t},l.x0=function(e){return arguments.length?(t="function"==typeof e?e:De(+e),l):t},l.x1=function(t){return arguments.length?(n=null==t?null:"function"==typeof t?t:De(+t),l):n},l.y=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),r=null,l):e},l.y0=function(t){return arguments.length?(e="function"==typeof t?t:De(+t),l):e},l.y1=function(t){return arguments.length?(r=null==t?null:"function"==typeof t?t:De(+t),l):r},l.lineX0=l.lineY0=function(){return s().x(t).y(e)},l.lineY1=function(){return s().x(t).y(r)},l.lineX1=function(){return s().x(n).y(e)},l.defined=function(t){return arguments.length?(o="function"==typeof t?t:De(!!t),l):o},l.curve=function(t){return arguments.length?(a=t,null!=i&&(c=a(i)),l):a},l.context=function(t){return arguments.length?(null==t?i=c=null:c=a(i=t),l):i},l}function ny(t){return ny="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ny(t)}function oy(){return oy=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},oy.apply(this,arguments)}function iy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function ay(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?iy(Object(r),!0).forEach((function(e){cy(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):iy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function cy(t,e,r){var n;return n=function(t){if("object"!=ny(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ny(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==ny(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Fd.prototype={areaStart:Id,areaEnd:Id,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(t,e){t=+t,e=+e,this._point?this._context.lineTo(t,e):(this._point=1,this._context.moveTo(t,e))}},Ud.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;default:this._context.lineTo(t,e)}}},Gd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:Hd(this,this._t0,Xd(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,e){var r=NaN;if(e=+e,(t=+t)!==this._x1||e!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;break;case 2:this._point=3,Hd(this,Xd(this,r=Wd(this,t,e)),r);break;default:Hd(this,this._t0,r=Wd(this,t,e))}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=e,this._t0=r}}},(Vd.prototype=Object.create(Gd.prototype)).point=function(t,e){Gd.prototype.point.call(this,e,t)},Yd.prototype={moveTo:function(t,e){this._context.moveTo(e,t)},closePath:function(){this._context.closePath()},lineTo:function(t,e){this._context.lineTo(e,t)},bezierCurveTo:function(t,e,r,n,o,i){this._context.bezierCurveTo(e,t,n,r,i,o)}},Kd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var t=this._x,e=this._y,r=t.length;if(r)if(this._line?this._context.lineTo(t[0],e[0]):this._context.moveTo(t[0],e[0]),2===r)this._context.lineTo(t[1],e[1]);else for(var n=Zd(t),o=Zd(e),i=0,a=1;a<r;++i,++a)this._context.bezierCurveTo(n[0][i],o[0][i],n[1][i],o[1][i],t[a],e[a]);(this._line||0!==this._line&&1===r)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(t,e){this._x.push(+t),this._y.push(+e)}},Jd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(t,e){switch(t=+t,e=+e,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,e):this._context.moveTo(t,e);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,e),this._context.lineTo(t,e);else{var r=this._x*(1-this._t)+t*this._t;this._context.lineTo(r,this._y),this._context.lineTo(r,e)}}this._x=t,this._y=e}};var uy={curveBasisClosed:function(t){return new Rd(t)},curveBasisOpen:function(t){return new Ld(t)},curveBasis:function(t){return new Bd(t)},curveBumpX:function(t){return new zd(t,!0)},curveBumpY:function(t){return new zd(t,!1)},curveLinearClosed:function(t){return new Fd(t)},curveLinear:$d,curveMonotoneX:function(t){return new Gd(t)},curveMonotoneY:function(t){return new Vd(t)},curveNatural:function(t){return new Kd(t)},curveStep:function(t){return new Jd(t,.5)},curveStepAfter:function(t){return new Jd(t,1)},curveStepBefore:function(t){return new Jd(t,0)}},ly=function(t){return t.x===+t.x&&t.y===+t.y},sy=function(t){return t.x},fy=function(t){return t.y},py=function(t){var e=t.className,r=t.points,n=t.path,i=t.pathRef;if(!(r&&r.length||n))return null;var c=r&&r.length?function(t){var e,r=t.type,n=void 0===r?"linear":r,o=t.points,i=void 0===o?[]:o,a=t.baseLine,c=t.layout,u=t.connectNulls,l=void 0!==u&&u,s=function(t,e){if(C()(t))return t;var r="curve".concat(se()(t));return"curveMonotone"!==r&&"curveBump"!==r||!e?uy[r]||$d:uy["".concat(r).concat("vertical"===e?"Y":"X")]}(n,c),f=l?i.filter((function(t){return ly(t)})):i;if(Array.isArray(a)){var p=l?a.filter((function(t){return ly(t)})):a,h=f.map((function(t,e){return ay(ay({},t),{},{base:p[e]})}));return(e="vertical"===c?ry().y(fy).x1(sy).x0((function(t){return t.base.x})):ry().x(sy).y1(fy).y0((function(t){return t.base.y}))).defined(ly).curve(s),e(h)}return(e="vertical"===c&&g(a)?ry().y(fy).x1(sy).x0(a):g(a)?ry().x(sy).y1(fy).y0(a):ey().x(sy).y(fy)).defined(ly).curve(s),e(f)}(t):n;return o().createElement("path",oy({},nt(t,!1),$(t),{className:a("recharts-curve",e),d:c,ref:i}))};function hy(t){return hy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},hy(t)}var dy=["x","y","top","left","width","height","className"];function yy(){return yy=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},yy.apply(this,arguments)}function vy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function my(t,e,r){var n;return n=function(t){if("object"!=hy(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=hy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==hy(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}var by=function(t,e,r,n,o,i){return"M".concat(t,",").concat(o,"v").concat(n,"M").concat(i,",").concat(e,"h").concat(r)},gy=function(t){var e=t.x,r=void 0===e?0:e,n=t.y,i=void 0===n?0:n,c=t.top,u=void 0===c?0:c,l=t.left,s=void 0===l?0:l,f=t.width,p=void 0===f?0:f,h=t.height,d=void 0===h?0:h,y=t.className,v=function(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?vy(Object(r),!0).forEach((function(e){my(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):vy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}({x:r,y:i,top:u,left:s,width:p,height:d},function(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}(t,dy));return g(r)&&g(i)&&g(p)&&g(d)&&g(u)&&g(s)?o().createElement("path",yy({},nt(v,!0),{className:a("recharts-cross",y),d:by(r,i,p,d,u,s)})):null};function xy(t){var e=t.cx,r=t.cy,n=t.radius,o=t.startAngle,i=t.endAngle;return{points:[If(e,r,n,o),If(e,r,n,i)],cx:e,cy:r,radius:n,startAngle:o,endAngle:i}}function wy(t,e,r){var n,o,i,a;if("horizontal"===t)i=n=e.x,o=r.top,a=r.top+r.height;else if("vertical"===t)a=o=e.y,n=r.left,i=r.left+r.width;else if(null!=e.cx&&null!=e.cy){if("centric"!==t)return xy(e);var c=e.cx,u=e.cy,l=e.innerRadius,s=e.outerRadius,f=e.angle,p=If(c,u,l,f),h=If(c,u,s,f);n=p.x,o=p.y,i=h.x,a=h.y}return[{x:n,y:o},{x:i,y:a}]}function Oy(t){return Oy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Oy(t)}function jy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Sy(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?jy(Object(r),!0).forEach((function(e){Py(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):jy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Py(t,e,r){var n;return n=function(t){if("object"!=Oy(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Oy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==Oy(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Ey(t){var r,n,o,i=t.element,c=t.tooltipEventType,u=t.isActive,l=t.activeCoordinate,s=t.activePayload,f=t.offset,p=t.activeTooltipIndex,h=t.tooltipAxisBandSize,d=t.layout,y=t.chartName,v=null!==(r=i.props.cursor)&&void 0!==r?r:null===(n=i.type.defaultProps)||void 0===n?void 0:n.cursor;if(!i||!v||!u||!l||"ScatterChart"!==y&&"axis"!==c)return null;var m=py;if("ScatterChart"===y)o=l,m=gy;else if("BarChart"===y)o=function(t,e,r,n){var o=n/2;return{stroke:"none",fill:"#ccc",x:"horizontal"===t?e.x-o:r.left+.5,y:"horizontal"===t?r.top+.5:e.y-o,width:"horizontal"===t?n:r.width-1,height:"horizontal"===t?r.height-1:n}}(d,l,f,h),m=Jn;else if("radial"===d){var b=xy(l),g=b.cx,x=b.cy,w=b.radius;o={cx:g,cy:x,startAngle:b.startAngle,endAngle:b.endAngle,innerRadius:w,outerRadius:w},m=Cp}else o={points:wy(d,l,f)},m=py;var O=Sy(Sy(Sy(Sy({stroke:"#ccc",pointerEvents:"none"},f),o),nt(v,!1)),{},{payload:s,payloadIndex:p,className:a("recharts-tooltip-cursor",v.className)});return(0,e.isValidElement)(v)?(0,e.cloneElement)(v,O):(0,e.createElement)(m,O)}var Ay=["item"],ky=["children","className","width","height","style","compact","title","desc"];function _y(t){return _y="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},_y(t)}function My(){return My=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},My.apply(this,arguments)}function Ty(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||Ly(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Cy(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function Dy(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,qy(n.key),n)}}function Iy(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Iy=function(){return!!t})()}function Ny(t){return Ny=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Ny(t)}function By(t,e){return By=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},By(t,e)}function Ry(t){return function(t){if(Array.isArray(t))return zy(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||Ly(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ly(t,e){if(t){if("string"==typeof t)return zy(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?zy(t,e):void 0}}function zy(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function Fy(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Uy(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Fy(Object(r),!0).forEach((function(e){$y(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Fy(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function $y(t,e,r){return(e=qy(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function qy(t){var e=function(t){if("object"!=_y(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=_y(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==_y(e)?e:e+""}var Wy={xAxis:["bottom","top"],yAxis:["left","right"]},Xy={width:"100%",height:"100%"},Hy={x:0,y:0};function Gy(t){return t}var Vy=function(t,e){var r=e.graphicalItems,n=e.dataStartIndex,o=e.dataEndIndex,i=(null!=r?r:[]).reduce((function(t,e){var r=e.props.data;return r&&r.length?[].concat(Ry(t),Ry(r)):t}),[]);return i.length>0?i:t&&t.length&&g(n)&&g(o)?t.slice(n,o+1):[]};function Yy(t){return"number"===t?[0,"auto"]:void 0}var Ky=function(t,e,r,n){var o=t.graphicalItems,i=t.tooltipAxis,a=Vy(e,t);return r<0||!o||!o.length||r>=a.length?null:o.reduce((function(o,c){var u,l,s=null!==(u=c.props.data)&&void 0!==u?u:e;return s&&t.dataStartIndex+t.dataEndIndex!==0&&t.dataEndIndex-t.dataStartIndex>=r&&(s=s.slice(t.dataStartIndex,t.dataEndIndex+1)),(l=i.dataKey&&!i.allowDuplicatedCategory?E(void 0===s?a:s,i.dataKey,n):s&&s[r]||a[r])?[].concat(Ry(o),[sf(c,l)]):o}),[])},Zy=function(t,e,r,n){var o=n||{x:t.chartX,y:t.chartY},i=function(t,e){return"horizontal"===e?t.x:"vertical"===e?t.y:"centric"===e?t.angle:t.radius}(o,r),a=t.orderedTooltipTicks,c=t.tooltipAxis,u=t.tooltipTicks,l=function(t){var e,r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2?arguments[2]:void 0,o=arguments.length>3?arguments[3]:void 0,i=-1,a=null!==(e=null==r?void 0:r.length)&&void 0!==e?e:0;if(a<=1)return 0;if(o&&"angleAxis"===o.axisType&&Math.abs(Math.abs(o.range[1]-o.range[0])-360)<=1e-6)for(var c=o.range,u=0;u<a;u++){var l=u>0?n[u-1].coordinate:n[a-1].coordinate,s=n[u].coordinate,f=u>=a-1?n[0].coordinate:n[u+1].coordinate,p=void 0;if(m(s-l)!==m(f-s)){var h=[];if(m(f-s)===m(c[1]-c[0])){p=f;var d=s+c[1]-c[0];h[0]=Math.min(d,(d+l)/2),h[1]=Math.max(d,(d+l)/2)}else{p=l;var y=f+c[1]-c[0];h[0]=Math.min(s,(y+s)/2),h[1]=Math.max(s,(y+s)/2)}var v=[Math.min(s,(p+s)/2),Math.max(s,(p+s)/2)];if(t>v[0]&&t<=v[1]||t>=h[0]&&t<=h[1]){i=n[u].index;break}}else{var b=Math.min(l,f),g=Math.max(l,f);if(t>(b+s)/2&&t<=(g+s)/2){i=n[u].index;break}}}else for(var x=0;x<a;x++)if(0===x&&t<=(r[x].coordinate+r[x+1].coordinate)/2||x>0&&x<a-1&&t>(r[x].coordinate+r[x-1].coordinate)/2&&t<=(r[x].coordinate+r[x+1].coordinate)/2||x===a-1&&t>(r[x].coordinate+r[x-1].coordinate)/2){i=r[x].index;break}return i}(i,a,u,c);if(l>=0&&u){var s=u[l]&&u[l].value,f=Ky(t,e,l,s),p=function(t,e,r,n){var o=e.find((function(t){return t&&t.index===r}));if(o){if("horizontal"===t)return{x:o.coordinate,y:n.y};if("vertical"===t)return{x:n.x,y:o.coordinate};if("centric"===t){var i=o.coordinate,a=n.radius;return Uy(Uy(Uy({},n),If(n.cx,n.cy,a,i)),{},{angle:i,radius:a})}var c=o.coordinate,u=n.angle;return Uy(Uy(Uy({},n),If(n.cx,n.cy,c,u)),{},{angle:u,radius:c})}return Hy}(r,a,l,o);return{activeTooltipIndex:l,activeLabel:s,activePayload:f,activeCoordinate:p}}return null},Jy=function(t,e){var r=e.axisType,n=void 0===r?"xAxis":r,o=e.AxisComp,i=e.graphicalItems,a=e.stackGroups,c=e.dataStartIndex,u=e.dataEndIndex,l=t.children,s="".concat(n,"Id"),f=Q(l,o),p={};return f&&f.length?p=function(t,e){var r=e.axes,n=e.graphicalItems,o=e.axisType,i=e.axisIdKey,a=e.stackGroups,c=e.dataStartIndex,u=e.dataEndIndex,l=t.layout,s=t.children,f=t.stackOffset,p=Gs(l,o);return r.reduce((function(e,r){var h,d=void 0!==r.type.defaultProps?Uy(Uy({},r.type.defaultProps),r.props):r.props,y=d.type,v=d.dataKey,m=d.allowDataOverflow,b=d.allowDuplicatedCategory,x=d.scale,w=d.ticks,O=d.includeHidden,j=d[i];if(e[j])return e;var S,P,E,A=Vy(t.data,{graphicalItems:n.filter((function(t){var e;return(i in t.props?t.props[i]:null===(e=t.type.defaultProps)||void 0===e?void 0:e[i])===j})),dataStartIndex:c,dataEndIndex:u}),k=A.length;(function(t,e,r){if("number"===r&&!0===e&&Array.isArray(t)){var n=null==t?void 0:t[0],o=null==t?void 0:t[1];if(n&&o&&g(n)&&g(o))return!0}return!1})(d.domain,m,y)&&(S=cf(d.domain,null,m),!p||"number"!==y&&"auto"===x||(E=qs(A,v,"category")));var _=Yy(y);if(!S||0===S.length){var T,C=null!==(T=d.domain)&&void 0!==T?T:_;if(v){if(S=qs(A,v,y),"category"===y&&p){var D=function(t){if(!Array.isArray(t))return!1;for(var e=t.length,r={},n=0;n<e;n++){if(r[t[n]])return!0;r[t[n]]=!0}return!1}(S);b&&D?(P=S,S=dt()(0,k)):b||(S=lf(C,S,r).reduce((function(t,e){return t.indexOf(e)>=0?t:[].concat(Ry(t),[e])}),[]))}else if("category"===y)S=b?S.filter((function(t){return""!==t&&!M()(t)})):lf(C,S,r).reduce((function(t,e){return t.indexOf(e)>=0||""===e||M()(e)?t:[].concat(Ry(t),[e])}),[]);else if("number"===y){var I=function(t,e,r,n,o){var i=e.map((function(e){return Xs(t,e,r,o,n)})).filter((function(t){return!M()(t)}));return i&&i.length?i.reduce((function(t,e){return[Math.min(t[0],e[0]),Math.max(t[1],e[1])]}),[1/0,-1/0]):null}(A,n.filter((function(t){var e,r,n=i in t.props?t.props[i]:null===(e=t.type.defaultProps)||void 0===e?void 0:e[i],o="hide"in t.props?t.props.hide:null===(r=t.type.defaultProps)||void 0===r?void 0:r.hide;return n===j&&(O||!o)})),v,o,l);I&&(S=I)}!p||"number"!==y&&"auto"===x||(E=qs(A,v,"category"))}else S=p?dt()(0,k):a&&a[j]&&a[j].hasStack&&"number"===y?"expand"===f?[0,1]:nf(a[j].stackGroups,c,u):Hs(A,n.filter((function(t){var e=i in t.props?t.props[i]:t.type.defaultProps[i],r="hide"in t.props?t.props.hide:t.type.defaultProps.hide;return e===j&&(O||!r)})),y,l,!0);if("number"===y)S=Pd(s,S,j,o,w),C&&(S=cf(C,S,m));else if("category"===y&&C){var N=C;S.every((function(t){return N.indexOf(t)>=0}))&&(S=N)}}return Uy(Uy({},e),{},$y({},j,Uy(Uy({},d),{},{axisType:o,domain:S,categoricalDomain:E,duplicateDomain:P,originalDomain:null!==(h=d.domain)&&void 0!==h?h:_,isCategorical:p,layout:l})))}),{})}(t,{axes:f,graphicalItems:i,axisType:n,axisIdKey:s,stackGroups:a,dataStartIndex:c,dataEndIndex:u}):i&&i.length&&(p=function(t,e){var r=e.graphicalItems,n=e.Axis,o=e.axisType,i=e.axisIdKey,a=e.stackGroups,c=e.dataStartIndex,u=e.dataEndIndex,l=t.layout,s=t.children,f=Vy(t.data,{graphicalItems:r,dataStartIndex:c,dataEndIndex:u}),p=f.length,h=Gs(l,o),y=-1;return r.reduce((function(t,e){var v,m=(void 0!==e.type.defaultProps?Uy(Uy({},e.type.defaultProps),e.props):e.props)[i],b=Yy("number");return t[m]?t:(y++,h?v=dt()(0,p):a&&a[m]&&a[m].hasStack?(v=nf(a[m].stackGroups,c,u),v=Pd(s,v,m,o)):(v=cf(b,Hs(f,r.filter((function(t){var e,r,n=i in t.props?t.props[i]:null===(e=t.type.defaultProps)||void 0===e?void 0:e[i],o="hide"in t.props?t.props.hide:null===(r=t.type.defaultProps)||void 0===r?void 0:r.hide;return n===m&&!o})),"number",l),n.defaultProps.allowDataOverflow),v=Pd(s,v,m,o)),Uy(Uy({},t),{},$y({},m,Uy(Uy({axisType:o},n.defaultProps),{},{hide:!0,orientation:d()(Wy,"".concat(o,".").concat(y%2),null),domain:v,originalDomain:b,isCategorical:h,layout:l}))))}),{})}(t,{Axis:o,graphicalItems:i,axisType:n,axisIdKey:s,stackGroups:a,dataStartIndex:c,dataEndIndex:u})),p},Qy=function(t){var e=t.children,r=t.defaultShowTooltip,n=tt(e,Af),o=0,i=0;return t.data&&0!==t.data.length&&(i=t.data.length-1),n&&n.props&&(n.props.startIndex>=0&&(o=n.props.startIndex),n.props.endIndex>=0&&(i=n.props.endIndex)),{chartX:0,chartY:0,dataStartIndex:o,dataEndIndex:i,activeTooltipIndex:-1,isTooltipActive:Boolean(r)}},tv=function(t){return"horizontal"===t?{numericAxisName:"yAxis",cateAxisName:"xAxis"}:"vertical"===t?{numericAxisName:"xAxis",cateAxisName:"yAxis"}:"centric"===t?{numericAxisName:"radiusAxis",cateAxisName:"angleAxis"}:{numericAxisName:"angleAxis",cateAxisName:"radiusAxis"}},ev=function(t,e){return"xAxis"===e?t[e].width:"yAxis"===e?t[e].height:void 0},rv=["type","layout","connectNulls","ref"],nv=["key"];function ov(t){return ov="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ov(t)}function iv(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function av(){return av=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},av.apply(this,arguments)}function cv(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function uv(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?cv(Object(r),!0).forEach((function(e){yv(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):cv(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function lv(t){return function(t){if(Array.isArray(t))return sv(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return sv(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?sv(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function sv(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function fv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,vv(n.key),n)}}function pv(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(pv=function(){return!!t})()}function hv(t){return hv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},hv(t)}function dv(t,e){return dv=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},dv(t,e)}function yv(t,e,r){return(e=vv(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function vv(t){var e=function(t){if("object"!=ov(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=ov(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==ov(e)?e:e+""}var mv=function(t){function e(){var t,r,n,o;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e);for(var i=arguments.length,a=new Array(i),c=0;c<i;c++)a[c]=arguments[c];return yv((r=this,n=e,o=[].concat(a),n=hv(n),t=function(t,e){if(e&&("object"===ov(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(r,pv()?Reflect.construct(n,o||[],hv(r).constructor):n.apply(r,o))),"state",{isAnimationFinished:!0,totalLength:0}),yv(t,"generateSimpleStrokeDasharray",(function(t,e){return"".concat(e,"px ").concat(t-e,"px")})),yv(t,"getStrokeDasharray",(function(r,n,o){var i=o.reduce((function(t,e){return t+e}));if(!i)return t.generateSimpleStrokeDasharray(n,r);for(var a=Math.floor(r/i),c=r%i,u=n-r,l=[],s=0,f=0;s<o.length;f+=o[s],++s)if(f+o[s]>c){l=[].concat(lv(o.slice(0,s)),[c-f]);break}var p=l.length%2==0?[0,u]:[u];return[].concat(lv(e.repeat(o,a)),lv(l),p).map((function(t){return"".concat(t,"px")})).join(", ")})),yv(t,"id",O("recharts-line-")),yv(t,"pathRef",(function(e){t.mainCurve=e})),yv(t,"handleAnimationEnd",(function(){t.setState({isAnimationFinished:!0}),t.props.onAnimationEnd&&t.props.onAnimationEnd()})),yv(t,"handleAnimationStart",(function(){t.setState({isAnimationFinished:!1}),t.props.onAnimationStart&&t.props.onAnimationStart()})),t}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&dv(t,e)}(e,t),r=e,n=[{key:"componentDidMount",value:function(){if(this.props.isAnimationActive){var t=this.getTotalLength();this.setState({totalLength:t})}}},{key:"componentDidUpdate",value:function(){if(this.props.isAnimationActive){var t=this.getTotalLength();t!==this.state.totalLength&&this.setState({totalLength:t})}}},{key:"getTotalLength",value:function(){var t=this.mainCurve;try{return t&&t.getTotalLength&&t.getTotalLength()||0}catch(t){return 0}}},{key:"renderErrorBar",value:function(t,e){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,n=r.points,i=r.xAxis,a=r.yAxis,c=r.layout,u=Q(r.children,Ms);if(!u)return null;var l=function(t,e){return{x:t.x,y:t.y,value:t.value,errorVal:$s(t.payload,e)}},s={clipPath:t?"url(#clipPath-".concat(e,")"):null};return o().createElement(jt,s,u.map((function(t){return o().cloneElement(t,{key:"bar-".concat(t.props.dataKey),data:n,xAxis:i,yAxis:a,layout:c,dataPointFormatter:l})})))}},{key:"renderDots",value:function(t,r,n){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var i=this.props,a=i.dot,c=i.points,u=i.dataKey,l=nt(this.props,!1),s=nt(a,!0),f=c.map((function(t,r){var n=uv(uv(uv({key:"dot-".concat(r),r:3},l),s),{},{index:r,cx:t.x,cy:t.y,value:t.value,dataKey:u,payload:t.payload,points:c});return e.renderDotItem(a,n)})),p={clipPath:t?"url(#clipPath-".concat(r?"":"dots-").concat(n,")"):null};return o().createElement(jt,av({className:"recharts-line-dots",key:"dots"},p),f)}},{key:"renderCurveStatically",value:function(t,e,r,n){var i=this.props,a=i.type,c=i.layout,u=i.connectNulls,l=(i.ref,iv(i,rv)),s=uv(uv(uv({},nt(l,!0)),{},{fill:"none",className:"recharts-line-curve",clipPath:e?"url(#clipPath-".concat(r,")"):null,points:t},n),{},{type:a,layout:c,connectNulls:u});return o().createElement(py,av({},s,{pathRef:this.pathRef}))}},{key:"renderCurveWithAnimation",value:function(t,e){var r=this,n=this.props,i=n.points,a=n.strokeDasharray,c=n.isAnimationActive,u=n.animationBegin,l=n.animationDuration,s=n.animationEasing,f=n.animationId,p=n.animateNewValues,h=n.width,d=n.height,y=this.state,v=y.prevPoints,m=y.totalLength;return o().createElement($n,{begin:u,duration:l,isActive:c,easing:s,from:{t:0},to:{t:1},key:"line-".concat(f),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},(function(n){var o=n.t;if(v){var c=v.length/i.length,u=i.map((function(t,e){var r=Math.floor(e*c);if(v[r]){var n=v[r],i=P(n.x,t.x),a=P(n.y,t.y);return uv(uv({},t),{},{x:i(o),y:a(o)})}if(p){var u=P(2*h,t.x),l=P(d/2,t.y);return uv(uv({},t),{},{x:u(o),y:l(o)})}return uv(uv({},t),{},{x:t.x,y:t.y})}));return r.renderCurveStatically(u,t,e)}var l,s=P(0,m)(o);if(a){var f="".concat(a).split(/[,\s]+/gim).map((function(t){return parseFloat(t)}));l=r.getStrokeDasharray(s,m,f)}else l=r.generateSimpleStrokeDasharray(m,s);return r.renderCurveStatically(i,t,e,{strokeDasharray:l})}))}},{key:"renderCurve",value:function(t,e){var r=this.props,n=r.points,o=r.isAnimationActive,i=this.state,a=i.prevPoints,c=i.totalLength;return o&&n&&n.length&&(!a&&c>0||!Gl()(a,n))?this.renderCurveWithAnimation(t,e):this.renderCurveStatically(n,t,e)}},{key:"render",value:function(){var t,e=this.props,r=e.hide,n=e.dot,i=e.points,c=e.className,u=e.xAxis,l=e.yAxis,s=e.top,f=e.left,p=e.width,h=e.height,d=e.isAnimationActive,y=e.id;if(r||!i||!i.length)return null;var v=this.state.isAnimationFinished,m=1===i.length,b=a("recharts-line",c),g=u&&u.allowDataOverflow,x=l&&l.allowDataOverflow,w=g||x,O=M()(y)?this.id:y,j=null!==(t=nt(n,!1))&&void 0!==t?t:{r:3,strokeWidth:2},S=j.r,P=void 0===S?3:S,E=j.strokeWidth,A=void 0===E?2:E,k=(function(t){return t&&"object"===G(t)&&"clipDot"in t}(n)?n:{}).clipDot,_=void 0===k||k,T=2*P+A;return o().createElement(jt,{className:b},g||x?o().createElement("defs",null,o().createElement("clipPath",{id:"clipPath-".concat(O)},o().createElement("rect",{x:g?f:f-p/2,y:x?s:s-h/2,width:g?p:2*p,height:x?h:2*h})),!_&&o().createElement("clipPath",{id:"clipPath-dots-".concat(O)},o().createElement("rect",{x:f-T/2,y:s-T/2,width:p+T,height:h+T}))):null,!m&&this.renderCurve(w,O),this.renderErrorBar(w,O),(m||n)&&this.renderDots(w,_,O),(!d||v)&&sp.renderCallByParent(this.props,i))}}],i=[{key:"getDerivedStateFromProps",value:function(t,e){return t.animationId!==e.prevAnimationId?{prevAnimationId:t.animationId,curPoints:t.points,prevPoints:e.curPoints}:t.points!==e.curPoints?{curPoints:t.points}:null}},{key:"repeat",value:function(t,e){for(var r=t.length%2!=0?[].concat(lv(t),[0]):t,n=[],o=0;o<e;++o)n=[].concat(lv(n),lv(r));return n}},{key:"renderDotItem",value:function(t,e){var r;if(o().isValidElement(t))r=o().cloneElement(t,e);else if(C()(t))r=t(e);else{var n=e.key,i=iv(e,nv),c=a("recharts-line-dot","boolean"!=typeof t?t.className:"");r=o().createElement(xr,av({key:n},i,{className:c}))}return r}}],n&&fv(r.prototype,n),i&&fv(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.PureComponent);function bv(t,e,r){if(e<1)return[];if(1===e&&void 0===r)return t;for(var n=[],o=0;o<t.length;o+=e){if(void 0!==r&&!0!==r(t[o]))return;n.push(t[o])}return n}function gv(t,e,r,n,o){if(t*e<t*n||t*e>t*o)return!1;var i=r();return t*(e-t*i/2-n)>=0&&t*(e+t*i/2-o)<=0}function xv(t){return xv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},xv(t)}function wv(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Ov(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?wv(Object(r),!0).forEach((function(e){jv(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):wv(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function jv(t,e,r){var n;return n=function(t){if("object"!=xv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=xv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==xv(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Sv(t,e,r){var n=t.tick,o=t.ticks,i=t.viewBox,a=t.minTickGap,c=t.orientation,u=t.interval,l=t.tickFormatter,s=t.unit,f=t.angle;if(!o||!o.length||!n)return[];if(g(u)||Vt.isSsr)return function(t,e){return bv(t,e+1)}(o,"number"==typeof u&&g(u)?u:0);var p=[],h="top"===c||"bottom"===c?"width":"height",d=s&&"width"===h?mo(s,{fontSize:e,letterSpacing:r}):{width:0,height:0},y=function(t,n){var o=C()(l)?l(t.value,n):t.value;return"width"===h?function(t,e,r){return function(t){var e=t.width,r=t.height,n=function(t){return(t%180+180)%180}(arguments.length>1&&void 0!==arguments[1]?arguments[1]:0),o=n*Math.PI/180,i=Math.atan(r/e),a=o>i&&o<Math.PI-i?r/Math.sin(o):e/Math.cos(o);return Math.abs(a)}({width:t.width+e.width,height:t.height+e.height},r)}(mo(o,{fontSize:e,letterSpacing:r}),d,f):mo(o,{fontSize:e,letterSpacing:r})[h]},v=o.length>=2?m(o[1].coordinate-o[0].coordinate):1,b=function(t,e,r){var n="width"===r,o=t.x,i=t.y,a=t.width,c=t.height;return 1===e?{start:n?o:i,end:n?o+a:i+c}:{start:n?o+a:i+c,end:n?o:i}}(i,v,h);return"equidistantPreserveStart"===u?function(t,e,r,n,o){for(var i,a=(n||[]).slice(),c=e.start,u=e.end,l=0,s=1,f=c,p=function(){var e=null==n?void 0:n[l];if(void 0===e)return{v:bv(n,s)};var i,a=l,p=function(){return void 0===i&&(i=r(e,a)),i},h=e.coordinate,d=0===l||gv(t,h,p,f,u);d||(l=0,f=c,s+=1),d&&(f=h+t*(p()/2+o),l+=s)};s<=a.length;)if(i=p())return i.v;return[]}(v,b,y,o,a):(p="preserveStart"===u||"preserveStartEnd"===u?function(t,e,r,n,o,i){var a=(n||[]).slice(),c=a.length,u=e.start,l=e.end;if(i){var s=n[c-1],f=r(s,c-1),p=t*(s.coordinate+t*f/2-l);a[c-1]=s=Ov(Ov({},s),{},{tickCoord:p>0?s.coordinate-p*t:s.coordinate}),gv(t,s.tickCoord,(function(){return f}),u,l)&&(l=s.tickCoord-t*(f/2+o),a[c-1]=Ov(Ov({},s),{},{isShow:!0}))}for(var h=i?c-1:c,d=function(e){var n,i=a[e],c=function(){return void 0===n&&(n=r(i,e)),n};if(0===e){var s=t*(i.coordinate-t*c()/2-u);a[e]=i=Ov(Ov({},i),{},{tickCoord:s<0?i.coordinate-s*t:i.coordinate})}else a[e]=i=Ov(Ov({},i),{},{tickCoord:i.coordinate});gv(t,i.tickCoord,c,u,l)&&(u=i.tickCoord+t*(c()/2+o),a[e]=Ov(Ov({},i),{},{isShow:!0}))},y=0;y<h;y++)d(y);return a}(v,b,y,o,a,"preserveStartEnd"===u):function(t,e,r,n,o){for(var i=(n||[]).slice(),a=i.length,c=e.start,u=e.end,l=function(e){var n,l=i[e],s=function(){return void 0===n&&(n=r(l,e)),n};if(e===a-1){var f=t*(l.coordinate+t*s()/2-u);i[e]=l=Ov(Ov({},l),{},{tickCoord:f>0?l.coordinate-f*t:l.coordinate})}else i[e]=l=Ov(Ov({},l),{},{tickCoord:l.coordinate});gv(t,l.tickCoord,s,c,u)&&(u=l.tickCoord-t*(s()/2+o),i[e]=Ov(Ov({},l),{},{isShow:!0}))},s=a-1;s>=0;s--)l(s);return i}(v,b,y,o,a),p.filter((function(t){return t.isShow})))}yv(mv,"displayName","Line"),yv(mv,"defaultProps",{xAxisId:0,yAxisId:0,connectNulls:!1,activeDot:!0,dot:!0,legendType:"line",stroke:"#3182bd",strokeWidth:1,fill:"#fff",points:[],isAnimationActive:!Vt.isSsr,animateNewValues:!0,animationBegin:0,animationDuration:1500,animationEasing:"ease",hide:!1,label:!1}),yv(mv,"getComposedData",(function(t){var e=t.props,r=t.xAxis,n=t.yAxis,o=t.xAxisTicks,i=t.yAxisTicks,a=t.dataKey,c=t.bandSize,u=t.displayedData,l=t.offset,s=e.layout,f=u.map((function(t,e){var u=$s(t,a);return"horizontal"===s?{x:ef({axis:r,ticks:o,bandSize:c,entry:t,index:e}),y:M()(u)?null:n.scale(u),value:u,payload:t}:{x:M()(u)?null:r.scale(u),y:ef({axis:n,ticks:i,bandSize:c,entry:t,index:e}),value:u,payload:t}}));return uv({points:f,layout:s},l)}));var Pv=["viewBox"],Ev=["viewBox"],Av=["ticks"];function kv(t){return kv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},kv(t)}function _v(){return _v=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},_v.apply(this,arguments)}function Mv(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function Tv(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?Mv(Object(r),!0).forEach((function(e){Rv(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):Mv(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function Cv(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}function Dv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Lv(n.key),n)}}function Iv(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Iv=function(){return!!t})()}function Nv(t){return Nv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Nv(t)}function Bv(t,e){return Bv=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Bv(t,e)}function Rv(t,e,r){return(e=Lv(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Lv(t){var e=function(t){if("object"!=kv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=kv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==kv(e)?e:e+""}var zv=function(t){function e(t){var r,n,o,i;return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),(n=this,o=e,i=[t],o=Nv(o),r=function(t,e){if(e&&("object"===kv(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(n,Iv()?Reflect.construct(o,i||[],Nv(n).constructor):o.apply(n,i))).state={fontSize:"",letterSpacing:""},r}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Bv(t,e)}(e,t),r=e,n=[{key:"shouldComponentUpdate",value:function(t,e){var r=t.viewBox,n=Cv(t,Pv),o=this.props,i=o.viewBox,a=Cv(o,Ev);return!B(r,i)||!B(n,a)||!B(e,this.state)}},{key:"componentDidMount",value:function(){var t=this.layerReference;if(t){var e=t.getElementsByClassName("recharts-cartesian-axis-tick-value")[0];e&&this.setState({fontSize:window.getComputedStyle(e).fontSize,letterSpacing:window.getComputedStyle(e).letterSpacing})}}},{key:"getTickLineCoord",value:function(t){var e,r,n,o,i,a,c=this.props,u=c.x,l=c.y,s=c.width,f=c.height,p=c.orientation,h=c.tickSize,d=c.mirror,y=c.tickMargin,v=d?-1:1,m=t.tickSize||h,b=g(t.tickCoord)?t.tickCoord:t.coordinate;switch(p){case"top":e=r=t.coordinate,a=(n=(o=l+ +!d*f)-v*m)-v*y,i=b;break;case"left":n=o=t.coordinate,i=(e=(r=u+ +!d*s)-v*m)-v*y,a=b;break;case"right":n=o=t.coordinate,i=(e=(r=u+ +d*s)+v*m)+v*y,a=b;break;default:e=r=t.coordinate,a=(n=(o=l+ +d*f)+v*m)+v*y,i=b}return{line:{x1:e,y1:n,x2:r,y2:o},tick:{x:i,y:a}}}},{key:"getTickTextAnchor",value:function(){var t,e=this.props,r=e.orientation,n=e.mirror;switch(r){case"left":t=n?"start":"end";break;case"right":t=n?"end":"start";break;default:t="middle"}return t}},{key:"getTickVerticalAnchor",value:function(){var t=this.props,e=t.orientation,r=t.mirror,n="end";switch(e){case"left":case"right":n="middle";break;case"top":n=r?"start":"end";break;default:n=r?"end":"start"}return n}},{key:"renderAxisLine",value:function(){var t=this.props,e=t.x,r=t.y,n=t.width,i=t.height,c=t.orientation,u=t.mirror,l=t.axisLine,s=Tv(Tv(Tv({},nt(this.props,!1)),nt(l,!1)),{},{fill:"none"});if("top"===c||"bottom"===c){var f=+("top"===c&&!u||"bottom"===c&&u);s=Tv(Tv({},s),{},{x1:e,y1:r+f*i,x2:e+n,y2:r+f*i})}else{var p=+("left"===c&&!u||"right"===c&&u);s=Tv(Tv({},s),{},{x1:e+p*n,y1:r,x2:e+p*n,y2:r+i})}return o().createElement("line",_v({},s,{className:a("recharts-cartesian-axis-line",d()(l,"className"))}))}},{key:"renderTicks",value:function(t,r,n){var i=this,c=this.props,u=c.tickLine,l=c.stroke,s=c.tick,f=c.tickFormatter,p=c.unit,h=Sv(Tv(Tv({},this.props),{},{ticks:t}),r,n),y=this.getTickTextAnchor(),v=this.getTickVerticalAnchor(),m=nt(this.props,!1),b=nt(s,!1),g=Tv(Tv({},m),{},{fill:"none"},nt(u,!1)),x=h.map((function(t,r){var n=i.getTickLineCoord(t),c=n.line,x=n.tick,w=Tv(Tv(Tv(Tv({textAnchor:y,verticalAnchor:v},m),{},{stroke:"none",fill:l},b),x),{},{index:r,payload:t,visibleTicksCount:h.length,tickFormatter:f});return o().createElement(jt,_v({className:"recharts-cartesian-axis-tick",key:"tick-".concat(t.value,"-").concat(t.coordinate,"-").concat(t.tickCoord)},q(i.props,t,r)),u&&o().createElement("line",_v({},g,c,{className:a("recharts-cartesian-axis-tick-line",d()(u,"className"))})),s&&e.renderTickItem(s,w,"".concat(C()(f)?f(t.value,r):t.value).concat(p||"")))}));return o().createElement("g",{className:"recharts-cartesian-axis-ticks"},x)}},{key:"render",value:function(){var t=this,e=this.props,r=e.axisLine,n=e.width,i=e.height,c=e.ticksGenerator,u=e.className;if(e.hide)return null;var l=this.props,s=l.ticks,f=Cv(l,Av),p=s;return C()(c)&&(p=s&&s.length>0?c(this.props):c(f)),n<=0||i<=0||!p||!p.length?null:o().createElement(jt,{className:a("recharts-cartesian-axis",u),ref:function(e){t.layerReference=e}},r&&this.renderAxisLine(),this.renderTicks(p,this.state.fontSize,this.state.letterSpacing),Wf.renderCallByParent(this.props))}}],i=[{key:"renderTickItem",value:function(t,e,r){return o().isValidElement(t)?o().cloneElement(t,e):C()(t)?t(e):o().createElement(Wo,_v({},e,{className:"recharts-cartesian-axis-tick-value"}),r)}}],n&&Dv(r.prototype,n),i&&Dv(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n,i}(e.Component);function Fv(t){return Fv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Fv(t)}function Uv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,Hv(n.key),n)}}function $v(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return($v=function(){return!!t})()}function qv(t){return qv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},qv(t)}function Wv(t,e){return Wv=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},Wv(t,e)}function Xv(t,e,r){return(e=Hv(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function Hv(t){var e=function(t){if("object"!=Fv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Fv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Fv(e)?e:e+""}function Gv(){return Gv=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},Gv.apply(this,arguments)}function Vv(t){var e=t.xAxisId,r=Zh(),n=Jh(),i=Yh(e);return null==i?null:o().createElement(zv,Gv({},i,{className:a("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:n},ticksGenerator:function(t){return Ys(t,!0)}}))}Rv(zv,"displayName","CartesianAxis"),Rv(zv,"defaultProps",{x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:"bottom",ticks:[],stroke:"#666",tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:"preserveEnd"});var Yv=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=qv(r=e),function(t,e){if(e&&("object"===Fv(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,$v()?Reflect.construct(r,n||[],qv(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&Wv(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){return o().createElement(Vv,this.props)}}])&&Uv(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);function Kv(t){return Kv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Kv(t)}function Zv(t,e){for(var r=0;r<e.length;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,rm(n.key),n)}}function Jv(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(Jv=function(){return!!t})()}function Qv(t){return Qv=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},Qv(t)}function tm(t,e){return tm=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},tm(t,e)}function em(t,e,r){return(e=rm(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function rm(t){var e=function(t){if("object"!=Kv(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=Kv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(t);return"symbol"==Kv(e)?e:e+""}function nm(){return nm=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},nm.apply(this,arguments)}Xv(Yv,"displayName","XAxis"),Xv(Yv,"defaultProps",{allowDecimals:!0,hide:!1,orientation:"bottom",width:0,height:30,mirror:!1,xAxisId:0,tickCount:5,type:"category",padding:{left:0,right:0},allowDataOverflow:!1,scale:"auto",reversed:!1,allowDuplicatedCategory:!0});var om=function(t){var e=t.yAxisId,r=Zh(),n=Jh(),i=Kh(e);return null==i?null:o().createElement(zv,nm({},i,{className:a("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:n},ticksGenerator:function(t){return Ys(t,!0)}}))},im=function(t){function e(){return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t=this,n=arguments,r=Qv(r=e),function(t,e){if(e&&("object"===Kv(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(t,Jv()?Reflect.construct(r,n||[],Qv(t).constructor):r.apply(t,n));var t,r,n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&tm(t,e)}(e,t),r=e,(n=[{key:"render",value:function(){return o().createElement(om,this.props)}}])&&Zv(r.prototype,n),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,n}(o().Component);em(im,"displayName","YAxis"),em(im,"defaultProps",{allowDuplicatedCategory:!0,allowDecimals:!0,hide:!1,orientation:"left",width:60,height:0,mirror:!1,yAxisId:0,tickCount:5,type:"number",padding:{top:0,bottom:0},allowDataOverflow:!1,scale:"auto",reversed:!1});var am=function(t){var r=t.chartName,n=t.GraphicalChild,i=t.defaultTooltipEventType,c=void 0===i?"axis":i,l=t.validateTooltipEventTypes,s=void 0===l?["axis"]:l,f=t.axisComponents,p=t.legendContent,h=t.formatAxisMap,y=t.defaultProps,v=function(t,e){var o=t.props,i=t.dataStartIndex,a=t.dataEndIndex,c=t.updateId;if(!et({props:o}))return null;var u=o.children,l=o.layout,s=o.stackOffset,p=o.data,y=o.reverseStackOrder,v=tv(l),m=v.numericAxisName,b=v.cateAxisName,w=Q(u,n),P=function(t,e,r,n,o,i){if(!t)return null;var a=(i?e.reverse():e).reduce((function(t,e){var o,i=null!==(o=e.type)&&void 0!==o&&o.defaultProps?Fs(Fs({},e.type.defaultProps),e.props):e.props,a=i.stackId;if(i.hide)return t;var c=i[r],u=t[c]||{hasStack:!1,stackGroups:{}};if(x(a)){var l=u.stackGroups[a]||{numericAxisId:r,cateAxisId:n,items:[]};l.items.push(e),u.hasStack=!0,u.stackGroups[a]=l}else u.stackGroups[O("_stackId_")]={numericAxisId:r,cateAxisId:n,items:[e]};return Fs(Fs({},t),{},Us({},c,u))}),{});return Object.keys(a).reduce((function(e,i){var c=a[i];return c.hasStack&&(c.stackGroups=Object.keys(c.stackGroups).reduce((function(e,i){var a=c.stackGroups[i];return Fs(Fs({},e),{},Us({},i,{numericAxisId:r,cateAxisId:n,items:a.items,stackedData:tf(t,a.items,o)}))}),{})),Fs(Fs({},e),{},Us({},i,c))}),{})}(p,w,"".concat(m,"Id"),"".concat(b,"Id"),s,y),E=f.reduce((function(t,e){var r="".concat(e.axisType,"Map");return Uy(Uy({},t),{},$y({},r,Jy(o,Uy(Uy({},e),{},{graphicalItems:w,stackGroups:e.axisType===m&&P,dataStartIndex:i,dataEndIndex:a}))))}),{}),A=function(t,e){var r=t.props,n=(t.graphicalItems,t.xAxisMap),o=void 0===n?{}:n,i=t.yAxisMap,a=void 0===i?{}:i,c=r.width,u=r.height,l=r.children,s=r.margin||{},f=tt(l,Af),p=tt(l,br),h=Object.keys(a).reduce((function(t,e){var r=a[e],n=r.orientation;return r.mirror||r.hide?t:Uy(Uy({},t),{},$y({},n,t[n]+r.width))}),{left:s.left||0,right:s.right||0}),y=Object.keys(o).reduce((function(t,e){var r=o[e],n=r.orientation;return r.mirror||r.hide?t:Uy(Uy({},t),{},$y({},n,d()(t,"".concat(n))+r.height))}),{top:s.top||0,bottom:s.bottom||0}),v=Uy(Uy({},y),h),m=v.bottom;f&&(v.bottom+=f.props.height||Af.defaultProps.height),p&&e&&(v=function(t,e,r,n){var o=r.children,i=r.width,a=r.margin,c=i-(a.left||0)-(a.right||0),u=Ns({children:o,legendWidth:c});if(u){var l=n||{},s=l.width,f=l.height,p=u.align,h=u.verticalAlign,d=u.layout;if(("vertical"===d||"horizontal"===d&&"middle"===h)&&"center"!==p&&g(t[p]))return Fs(Fs({},t),{},Us({},p,t[p]+(s||0)));if(("horizontal"===d||"vertical"===d&&"center"===p)&&"middle"!==h&&g(t[h]))return Fs(Fs({},t),{},Us({},h,t[h]+(f||0)))}return t}(v,0,r,e));var b=c-v.left-v.right,x=u-v.top-v.bottom;return Uy(Uy({brushBottom:m},v),{},{width:Math.max(b,0),height:Math.max(x,0)})}(Uy(Uy({},E),{},{props:o,graphicalItems:w}),null==e?void 0:e.legendBBox);Object.keys(E).forEach((function(t){E[t]=h(o,E[t],A,t.replace("Map",""),r)}));var k,_,T=E["".concat(b,"Map")],C=(k=S(T),{tooltipTicks:_=Ys(k,!1,!0),orderedTooltipTicks:vt()(_,(function(t){return t.coordinate})),tooltipAxis:k,tooltipAxisBandSize:uf(k,_)}),D=function(t,e){var r=e.graphicalItems,n=e.stackGroups,o=e.offset,i=e.updateId,a=e.dataStartIndex,c=e.dataEndIndex,u=t.barSize,l=t.layout,s=t.barGap,p=t.barCategoryGap,h=t.maxBarSize,d=tv(l),y=d.numericAxisName,v=d.cateAxisName,m=function(t){return!(!t||!t.length)&&t.some((function(t){var e=Y(t&&t.type);return e&&e.indexOf("Bar")>=0}))}(r),b=[];return r.forEach((function(r,d){var g=Vy(t.data,{graphicalItems:[r],dataStartIndex:a,dataEndIndex:c}),w=void 0!==r.type.defaultProps?Uy(Uy({},r.type.defaultProps),r.props):r.props,O=w.dataKey,S=w.maxBarSize,P=w["".concat(y,"Id")],E=w["".concat(v,"Id")],A=f.reduce((function(t,r){var n=e["".concat(r.axisType,"Map")],o=w["".concat(r.axisType,"Id")];n&&n[o]||"zAxis"===r.axisType||mt(!1);var i=n[o];return Uy(Uy({},t),{},$y($y({},r.axisType,i),"".concat(r.axisType,"Ticks"),Ys(i)))}),{}),k=A[v],_=A["".concat(v,"Ticks")],T=n&&n[P]&&n[P].hasStack&&function(t,e){var r,n=(null!==(r=t.type)&&void 0!==r&&r.defaultProps?Fs(Fs({},t.type.defaultProps),t.props):t.props).stackId;if(x(n)){var o=e[n];if(o){var i=o.items.indexOf(t);return i>=0?o.stackedData[i]:null}}return null}(r,n[P].stackGroups),C=Y(r.type).indexOf("Bar")>=0,D=uf(k,_),I=[],N=m&&function(t){var e=t.barSize,r=t.totalSize,n=t.stackGroups,o=void 0===n?{}:n;if(!o)return{};for(var i={},a=Object.keys(o),c=0,u=a.length;c<u;c++)for(var l=o[a[c]].stackGroups,s=Object.keys(l),f=0,p=s.length;f<p;f++){var h=l[s[f]],d=h.items,y=h.cateAxisId,v=d.filter((function(t){return Y(t.type).indexOf("Bar")>=0}));if(v&&v.length){var m=v[0].type.defaultProps,b=void 0!==m?Fs(Fs({},m),v[0].props):v[0].props,g=b.barSize,x=b[y];i[x]||(i[x]=[]);var w=M()(g)?e:g;i[x].push({item:v[0],stackList:v.slice(1),barSize:M()(w)?void 0:j(w,r,0)})}}return i}({barSize:u,stackGroups:n,totalSize:ev(A,v)});if(C){var B,R,L=M()(S)?h:S,z=null!==(B=null!==(R=uf(k,_,!0))&&void 0!==R?R:L)&&void 0!==B?B:0;I=function(t){var e=t.barGap,r=t.barCategoryGap,n=t.bandSize,o=t.sizeList,i=void 0===o?[]:o,a=t.maxBarSize,c=i.length;if(c<1)return null;var u,l=j(e,n,0,!0),s=[];if(i[0].barSize===+i[0].barSize){var f=!1,p=n/c,h=i.reduce((function(t,e){return t+e.barSize||0}),0);(h+=(c-1)*l)>=n&&(h-=(c-1)*l,l=0),h>=n&&p>0&&(f=!0,h=c*(p*=.9));var d={offset:((n-h)/2|0)-l,size:0};u=i.reduce((function(t,e){var r={item:e.item,position:{offset:d.offset+d.size+l,size:f?p:e.barSize}},n=[].concat(Rs(t),[r]);return d=n[n.length-1].position,e.stackList&&e.stackList.length&&e.stackList.forEach((function(t){n.push({item:t,position:d})})),n}),s)}else{var y=j(r,n,0,!0);n-2*y-(c-1)*l<=0&&(l=0);var v=(n-2*y-(c-1)*l)/c;v>1&&(v>>=0);var m=a===+a?Math.min(v,a):v;u=i.reduce((function(t,e,r){var n=[].concat(Rs(t),[{item:e.item,position:{offset:y+(v+l)*r+(v-m)/2,size:m}}]);return e.stackList&&e.stackList.length&&e.stackList.forEach((function(t){n.push({item:t,position:n[n.length-1].position})})),n}),s)}return u}({barGap:s,barCategoryGap:p,bandSize:z!==D?z:D,sizeList:N[E],maxBarSize:L}),z!==D&&(I=I.map((function(t){return Uy(Uy({},t),{},{position:Uy(Uy({},t.position),{},{offset:t.position.offset-z/2})})})))}var F,U,$=r&&r.type&&r.type.getComposedData;$&&b.push({props:Uy(Uy({},$(Uy(Uy({},A),{},{displayedData:g,props:t,dataKey:O,item:r,bandSize:D,barPosition:I,offset:o,stackedData:T,layout:l,dataStartIndex:a,dataEndIndex:c}))),{},$y($y($y({key:r.key||"item-".concat(d)},y,A[y]),v,A[v]),"animationId",i)),childIndex:(F=r,U=t.children,J(U).indexOf(F)),item:r})})),b}(o,Uy(Uy({},E),{},{dataStartIndex:i,dataEndIndex:a,updateId:c,graphicalItems:w,stackGroups:P,offset:A}));return Uy(Uy({formattedGraphicalItems:D,graphicalItems:w,offset:A,stackGroups:P},C),E)},m=function(t){function n(t){var i,c,l,s,f,h;return function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,n),$y((s=this,h=[t],f=Ny(f=n),l=function(t,e){if(e&&("object"===_y(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}(s,Iy()?Reflect.construct(f,h||[],Ny(s).constructor):f.apply(s,h))),"eventEmitterSymbol",Symbol("rechartsEventEmitter")),$y(l,"accessibilityManager",new Dd),$y(l,"handleLegendBBoxUpdate",(function(t){if(t){var e=l.state,r=e.dataStartIndex,n=e.dataEndIndex,o=e.updateId;l.setState(Uy({legendBBox:t},v({props:l.props,dataStartIndex:r,dataEndIndex:n,updateId:o},Uy(Uy({},l.state),{},{legendBBox:t}))))}})),$y(l,"handleReceiveSyncEvent",(function(t,e,r){if(l.props.syncId===t){if(r===l.eventEmitterSymbol&&"function"!=typeof l.props.syncMethod)return;l.applySyncEvent(e)}})),$y(l,"handleBrushChange",(function(t){var e=t.startIndex,r=t.endIndex;if(e!==l.state.dataStartIndex||r!==l.state.dataEndIndex){var n=l.state.updateId;l.setState((function(){return Uy({dataStartIndex:e,dataEndIndex:r},v({props:l.props,dataStartIndex:e,dataEndIndex:r,updateId:n},l.state))})),l.triggerSyncEvent({dataStartIndex:e,dataEndIndex:r})}})),$y(l,"handleMouseEnter",(function(t){var e=l.getMouseInfo(t);if(e){var r=Uy(Uy({},e),{},{isTooltipActive:!0});l.setState(r),l.triggerSyncEvent(r);var n=l.props.onMouseEnter;C()(n)&&n(r,t)}})),$y(l,"triggeredAfterMouseMove",(function(t){var e=l.getMouseInfo(t),r=e?Uy(Uy({},e),{},{isTooltipActive:!0}):{isTooltipActive:!1};l.setState(r),l.triggerSyncEvent(r);var n=l.props.onMouseMove;C()(n)&&n(r,t)})),$y(l,"handleItemMouseEnter",(function(t){l.setState((function(){return{isTooltipActive:!0,activeItem:t,activePayload:t.tooltipPayload,activeCoordinate:t.tooltipPosition||{x:t.cx,y:t.cy}}}))})),$y(l,"handleItemMouseLeave",(function(){l.setState((function(){return{isTooltipActive:!1}}))})),$y(l,"handleMouseMove",(function(t){t.persist(),l.throttleTriggeredAfterMouseMove(t)})),$y(l,"handleMouseLeave",(function(t){l.throttleTriggeredAfterMouseMove.cancel();var e={isTooltipActive:!1};l.setState(e),l.triggerSyncEvent(e);var r=l.props.onMouseLeave;C()(r)&&r(e,t)})),$y(l,"handleOuterEvent",(function(t){var e,r=function(t){var e=t&&t.type;return e&&V[e]?V[e]:null}(t),n=d()(l.props,"".concat(r));r&&C()(n)&&n(null!==(e=/.*touch.*/i.test(r)?l.getMouseInfo(t.changedTouches[0]):l.getMouseInfo(t))&&void 0!==e?e:{},t)})),$y(l,"handleClick",(function(t){var e=l.getMouseInfo(t);if(e){var r=Uy(Uy({},e),{},{isTooltipActive:!0});l.setState(r),l.triggerSyncEvent(r);var n=l.props.onClick;C()(n)&&n(r,t)}})),$y(l,"handleMouseDown",(function(t){var e=l.props.onMouseDown;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"handleMouseUp",(function(t){var e=l.props.onMouseUp;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"handleTouchMove",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&l.throttleTriggeredAfterMouseMove(t.changedTouches[0])})),$y(l,"handleTouchStart",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&l.handleMouseDown(t.changedTouches[0])})),$y(l,"handleTouchEnd",(function(t){null!=t.changedTouches&&t.changedTouches.length>0&&l.handleMouseUp(t.changedTouches[0])})),$y(l,"handleDoubleClick",(function(t){var e=l.props.onDoubleClick;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"handleContextMenu",(function(t){var e=l.props.onContextMenu;C()(e)&&e(l.getMouseInfo(t),t)})),$y(l,"triggerSyncEvent",(function(t){void 0!==l.props.syncId&&Ad.emit(kd,l.props.syncId,t,l.eventEmitterSymbol)})),$y(l,"applySyncEvent",(function(t){var e=l.props,r=e.layout,n=e.syncMethod,o=l.state.updateId,i=t.dataStartIndex,a=t.dataEndIndex;if(void 0!==t.dataStartIndex||void 0!==t.dataEndIndex)l.setState(Uy({dataStartIndex:i,dataEndIndex:a},v({props:l.props,dataStartIndex:i,dataEndIndex:a,updateId:o},l.state)));else if(void 0!==t.activeTooltipIndex){var c=t.chartX,u=t.chartY,s=t.activeTooltipIndex,f=l.state,p=f.offset,h=f.tooltipTicks;if(!p)return;if("function"==typeof n)s=n(h,t);else if("value"===n){s=-1;for(var d=0;d<h.length;d++)if(h[d].value===t.activeLabel){s=d;break}}var y=Uy(Uy({},p),{},{x:p.left,y:p.top}),m=Math.min(c,y.x+y.width),b=Math.min(u,y.y+y.height),g=h[s]&&h[s].value,x=Ky(l.state,l.props.data,s),w=h[s]?{x:"horizontal"===r?h[s].coordinate:m,y:"horizontal"===r?b:h[s].coordinate}:Hy;l.setState(Uy(Uy({},t),{},{activeLabel:g,activeCoordinate:w,activePayload:x,activeTooltipIndex:s}))}else l.setState(t)})),$y(l,"renderCursor",(function(t){var e,n=l.state,i=n.isTooltipActive,a=n.activeCoordinate,c=n.activePayload,u=n.offset,s=n.activeTooltipIndex,f=n.tooltipAxisBandSize,p=l.getTooltipEventType(),h=null!==(e=t.props.active)&&void 0!==e?e:i,d=l.props.layout,y=t.key||"_recharts-cursor";return o().createElement(Ey,{key:y,activeCoordinate:a,activePayload:c,activeTooltipIndex:s,chartName:r,element:t,isActive:h,layout:d,offset:u,tooltipAxisBandSize:f,tooltipEventType:p})})),$y(l,"renderPolarAxis",(function(t,r,n){var o=d()(t,"type.axisType"),i=d()(l.state,"".concat(o,"Map")),c=t.type.defaultProps,u=void 0!==c?Uy(Uy({},c),t.props):t.props,s=i&&i[u["".concat(o,"Id")]];return(0,e.cloneElement)(t,Uy(Uy({},s),{},{className:a(o,s.className),key:t.key||"".concat(r,"-").concat(n),ticks:Ys(s,!0)}))})),$y(l,"renderPolarGrid",(function(t){var r=t.props,n=r.radialLines,o=r.polarAngles,i=r.polarRadius,a=l.state,c=a.radiusAxisMap,u=a.angleAxisMap,s=S(c),f=S(u),p=f.cx,h=f.cy,d=f.innerRadius,y=f.outerRadius;return(0,e.cloneElement)(t,{polarAngles:Array.isArray(o)?o:Ys(f,!0).map((function(t){return t.coordinate})),polarRadius:Array.isArray(i)?i:Ys(s,!0).map((function(t){return t.coordinate})),cx:p,cy:h,innerRadius:d,outerRadius:y,key:t.key||"polar-grid",radialLines:n})})),$y(l,"renderLegend",(function(){var t=l.state.formattedGraphicalItems,r=l.props,n=r.children,o=r.width,i=r.height,a=l.props.margin||{},c=o-(a.left||0)-(a.right||0),u=Ns({children:n,formattedGraphicalItems:t,legendWidth:c,legendContent:p});if(!u)return null;var s=u.item,f=Cy(u,Ay);return(0,e.cloneElement)(s,Uy(Uy({},f),{},{chartWidth:o,chartHeight:i,margin:a,onBBoxUpdate:l.handleLegendBBoxUpdate}))})),$y(l,"renderTooltip",(function(){var t,r=l.props,n=r.children,o=r.accessibilityLayer,i=tt(n,ue);if(!i)return null;var a=l.state,c=a.isTooltipActive,u=a.activeCoordinate,s=a.activePayload,f=a.activeLabel,p=a.offset,h=null!==(t=i.props.active)&&void 0!==t?t:c;return(0,e.cloneElement)(i,{viewBox:Uy(Uy({},p),{},{x:p.left,y:p.top}),active:h,label:f,payload:h?s:[],coordinate:u,accessibilityLayer:o})})),$y(l,"renderBrush",(function(t){var r=l.props,n=r.margin,o=r.data,i=l.state,a=i.offset,c=i.dataStartIndex,u=i.dataEndIndex,s=i.updateId;return(0,e.cloneElement)(t,{key:t.key||"_recharts-brush",onChange:Zs(l.handleBrushChange,t.props.onChange),data:o,x:g(t.props.x)?t.props.x:a.left,y:g(t.props.y)?t.props.y:a.top+a.height+a.brushBottom-(n.bottom||0),width:g(t.props.width)?t.props.width:a.width,startIndex:c,endIndex:u,updateId:"brush-".concat(s)})})),$y(l,"renderReferenceElement",(function(t,r,n){if(!t)return null;var o=l.clipPathId,i=l.state,a=i.xAxisMap,c=i.yAxisMap,u=i.offset,s=t.type.defaultProps||{},f=t.props,p=f.xAxisId,h=void 0===p?s.xAxisId:p,d=f.yAxisId,y=void 0===d?s.yAxisId:d;return(0,e.cloneElement)(t,{key:t.key||"".concat(r,"-").concat(n),xAxis:a[h],yAxis:c[y],viewBox:{x:u.left,y:u.top,width:u.width,height:u.height},clipPathId:o})})),$y(l,"renderActivePoints",(function(t){var e=t.item,r=t.activePoint,o=t.basePoint,i=t.childIndex,a=t.isRange,c=[],u=e.props.key,l=void 0!==e.item.type.defaultProps?Uy(Uy({},e.item.type.defaultProps),e.item.props):e.item.props,s=l.activeDot,f=Uy(Uy({index:i,dataKey:l.dataKey,cx:r.x,cy:r.y,r:4,fill:Ws(e.item),strokeWidth:2,stroke:"#fff",payload:r.payload,value:r.value},nt(s,!1)),$(s));return c.push(n.renderActiveDot(s,f,"".concat(u,"-activePoint-").concat(i))),o?c.push(n.renderActiveDot(s,Uy(Uy({},f),{},{cx:o.x,cy:o.y}),"".concat(u,"-basePoint-").concat(i))):a&&c.push(null),c})),$y(l,"renderGraphicChild",(function(t,r,n){var o=l.filterFormatItem(t,r,n);if(!o)return null;var i=l.getTooltipEventType(),a=l.state,c=a.isTooltipActive,u=a.tooltipAxis,s=a.activeTooltipIndex,f=a.activeLabel,p=tt(l.props.children,ue),h=o.props,d=h.points,y=h.isRange,v=h.baseLine,m=void 0!==o.item.type.defaultProps?Uy(Uy({},o.item.type.defaultProps),o.item.props):o.item.props,b=m.activeDot,g=m.hide,x=m.activeBar,w=m.activeShape,O=Boolean(!g&&c&&p&&(b||x||w)),j={};"axis"!==i&&p&&"click"===p.props.trigger?j={onClick:Zs(l.handleItemMouseEnter,t.props.onClick)}:"axis"!==i&&(j={onMouseLeave:Zs(l.handleItemMouseLeave,t.props.onMouseLeave),onMouseEnter:Zs(l.handleItemMouseEnter,t.props.onMouseEnter)});var S=(0,e.cloneElement)(t,Uy(Uy({},o.props),j));if(O){if(!(s>=0)){var P,A=(null!==(P=l.getItemByXY(l.state.activeCoordinate))&&void 0!==P?P:{graphicalItem:S}).graphicalItem,k=A.item,_=void 0===k?t:k,T=A.childIndex,C=Uy(Uy(Uy({},o.props),j),{},{activeIndex:T});return[(0,e.cloneElement)(_,C),null,null]}var D,I;if(u.dataKey&&!u.allowDuplicatedCategory){var N="function"==typeof u.dataKey?function(t){return"function"==typeof u.dataKey?u.dataKey(t.payload):null}:"payload.".concat(u.dataKey.toString());D=E(d,N,f),I=y&&v&&E(v,N,f)}else D=null==d?void 0:d[s],I=y&&v&&v[s];if(w||x){var B=void 0!==t.props.activeIndex?t.props.activeIndex:s;return[(0,e.cloneElement)(t,Uy(Uy(Uy({},o.props),j),{},{activeIndex:B})),null,null]}if(!M()(D))return[S].concat(Ry(l.renderActivePoints({item:o,activePoint:D,basePoint:I,childIndex:s,isRange:y})))}return y?[S,null,null]:[S,null]})),$y(l,"renderCustomized",(function(t,r,n){return(0,e.cloneElement)(t,Uy(Uy({key:"recharts-customized-".concat(n)},l.props),l.state))})),$y(l,"renderMap",{CartesianGrid:{handler:Gy,once:!0},ReferenceArea:{handler:l.renderReferenceElement},ReferenceLine:{handler:Gy},ReferenceDot:{handler:l.renderReferenceElement},XAxis:{handler:Gy},YAxis:{handler:Gy},Brush:{handler:l.renderBrush,once:!0},Bar:{handler:l.renderGraphicChild},Line:{handler:l.renderGraphicChild},Area:{handler:l.renderGraphicChild},Radar:{handler:l.renderGraphicChild},RadialBar:{handler:l.renderGraphicChild},Scatter:{handler:l.renderGraphicChild},Pie:{handler:l.renderGraphicChild},Funnel:{handler:l.renderGraphicChild},Tooltip:{handler:l.renderCursor,once:!0},PolarGrid:{handler:l.renderPolarGrid,once:!0},PolarAngleAxis:{handler:l.renderPolarAxis},PolarRadiusAxis:{handler:l.renderPolarAxis},Customized:{handler:l.renderCustomized}}),l.clipPathId="".concat(null!==(i=t.id)&&void 0!==i?i:O("recharts"),"-clip"),l.throttleTriggeredAfterMouseMove=u()(l.triggeredAfterMouseMove,null!==(c=t.throttleDelay)&&void 0!==c?c:1e3/60),l.state={},l}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&By(t,e)}(n,t),i=n,l=[{key:"componentDidMount",value:function(){var t,e;this.addListener(),this.accessibilityManager.setDetails({container:this.container,offset:{left:null!==(t=this.props.margin.left)&&void 0!==t?t:0,top:null!==(e=this.props.margin.top)&&void 0!==e?e:0},coordinateList:this.state.tooltipTicks,mouseHandlerCallback:this.triggeredAfterMouseMove,layout:this.props.layout}),this.displayDefaultTooltip()}},{key:"displayDefaultTooltip",value:function(){var t=this.props,e=t.children,r=t.data,n=t.height,o=t.layout,i=tt(e,ue);if(i){var a=i.props.defaultIndex;if(!("number"!=typeof a||a<0||a>this.state.tooltipTicks.length-1)){var c=this.state.tooltipTicks[a]&&this.state.tooltipTicks[a].value,u=Ky(this.state,r,a,c),l=this.state.tooltipTicks[a].coordinate,s=(this.state.offset.top+n)/2,f="horizontal"===o?{x:l,y:s}:{y:l,x:s},p=this.state.formattedGraphicalItems.find((function(t){return"Scatter"===t.item.type.name}));p&&(f=Uy(Uy({},f),p.props.points[a].tooltipPosition),u=p.props.points[a].tooltipPayload);var h={activeTooltipIndex:a,isTooltipActive:!0,activeLabel:c,activePayload:u,activeCoordinate:f};this.setState(h),this.renderCursor(i),this.accessibilityManager.setIndex(a)}}}},{key:"getSnapshotBeforeUpdate",value:function(t,e){return this.props.accessibilityLayer?(this.state.tooltipTicks!==e.tooltipTicks&&this.accessibilityManager.setDetails({coordinateList:this.state.tooltipTicks}),this.props.layout!==t.layout&&this.accessibilityManager.setDetails({layout:this.props.layout}),this.props.margin!==t.margin&&this.accessibilityManager.setDetails({offset:{left:null!==(r=this.props.margin.left)&&void 0!==r?r:0,top:null!==(n=this.props.margin.top)&&void 0!==n?n:0}}),null):null;var r,n}},{key:"componentDidUpdate",value:function(t){ot([tt(t.children,ue)],[tt(this.props.children,ue)])||this.displayDefaultTooltip()}},{key:"componentWillUnmount",value:function(){this.removeListener(),this.throttleTriggeredAfterMouseMove.cancel()}},{key:"getTooltipEventType",value:function(){var t=tt(this.props.children,ue);if(t&&"boolean"==typeof t.props.shared){var e=t.props.shared?"axis":"item";return s.indexOf(e)>=0?e:c}return c}},{key:"getMouseInfo",value:function(t){if(!this.container)return null;var e,r=this.container,n=r.getBoundingClientRect(),o=(e=n).top+window.scrollY-document.documentElement.clientTop,i=e.left+window.scrollX-document.documentElement.clientLeft,a={chartX:Math.round(t.pageX-i),chartY:Math.round(t.pageY-o)},c=n.width/r.offsetWidth||1,u=this.inRange(a.chartX,a.chartY,c);if(!u)return null;var l=this.state,s=l.xAxisMap,f=l.yAxisMap,p=this.getTooltipEventType(),h=Zy(this.state,this.props.data,this.props.layout,u);if("axis"!==p&&s&&f){var d=S(s).scale,y=S(f).scale,v=d&&d.invert?d.invert(a.chartX):null,m=y&&y.invert?y.invert(a.chartY):null;return Uy(Uy({},a),{},{xValue:v,yValue:m},h)}return h?Uy(Uy({},a),h):null}},{key:"inRange",value:function(t,e){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,n=this.props.layout,o=t/r,i=e/r;if("horizontal"===n||"vertical"===n){var a=this.state.offset;return o>=a.left&&o<=a.left+a.width&&i>=a.top&&i<=a.top+a.height?{x:o,y:i}:null}var c=this.state,u=c.angleAxisMap,l=c.radiusAxisMap;if(u&&l){var s=S(u);return Bf({x:o,y:i},s)}return null}},{key:"parseEventsOfWrapper",value:function(){var t=this.props.children,e=this.getTooltipEventType(),r=tt(t,ue),n={};return r&&"axis"===e&&(n="click"===r.props.trigger?{onClick:this.handleClick}:{onMouseEnter:this.handleMouseEnter,onDoubleClick:this.handleDoubleClick,onMouseMove:this.handleMouseMove,onMouseLeave:this.handleMouseLeave,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,onTouchEnd:this.handleTouchEnd,onContextMenu:this.handleContextMenu}),Uy(Uy({},$(this.props,this.handleOuterEvent)),n)}},{key:"addListener",value:function(){Ad.on(kd,this.handleReceiveSyncEvent)}},{key:"removeListener",value:function(){Ad.removeListener(kd,this.handleReceiveSyncEvent)}},{key:"filterFormatItem",value:function(t,e,r){for(var n=this.state.formattedGraphicalItems,o=0,i=n.length;o<i;o++){var a=n[o];if(a.item===t||a.props.key===t.key||e===Y(a.item.type)&&r===a.childIndex)return a}return null}},{key:"renderClipPath",value:function(){var t=this.clipPathId,e=this.state.offset,r=e.left,n=e.top,i=e.height,a=e.width;return o().createElement("defs",null,o().createElement("clipPath",{id:t},o().createElement("rect",{x:r,y:n,height:i,width:a})))}},{key:"getXScales",value:function(){var t=this.state.xAxisMap;return t?Object.entries(t).reduce((function(t,e){var r=Ty(e,2),n=r[0],o=r[1];return Uy(Uy({},t),{},$y({},n,o.scale))}),{}):null}},{key:"getYScales",value:function(){var t=this.state.yAxisMap;return t?Object.entries(t).reduce((function(t,e){var r=Ty(e,2),n=r[0],o=r[1];return Uy(Uy({},t),{},$y({},n,o.scale))}),{}):null}},{key:"getXScaleByAxisId",value:function(t){var e;return null===(e=this.state.xAxisMap)||void 0===e||null===(e=e[t])||void 0===e?void 0:e.scale}},{key:"getYScaleByAxisId",value:function(t){var e;return null===(e=this.state.yAxisMap)||void 0===e||null===(e=e[t])||void 0===e?void 0:e.scale}},{key:"getItemByXY",value:function(t){var e=this.state,r=e.formattedGraphicalItems,n=e.activeItem;if(r&&r.length)for(var o=0,i=r.length;o<i;o++){var a=r[o],c=a.props,u=a.item,l=void 0!==u.type.defaultProps?Uy(Uy({},u.type.defaultProps),u.props):u.props,s=Y(u.type);if("Bar"===s){var f=(c.data||[]).find((function(e){return Kn(t,e)}));if(f)return{graphicalItem:a,payload:f}}else if("RadialBar"===s){var p=(c.data||[]).find((function(e){return Bf(t,e)}));if(p)return{graphicalItem:a,payload:p}}else if(Up(a,n)||$p(a,n)||qp(a,n)){var h=Gp({graphicalItem:a,activeTooltipItem:n,itemData:l.data}),d=void 0===l.activeIndex?h:l.activeIndex;return{graphicalItem:Uy(Uy({},a),{},{childIndex:d}),payload:qp(a,n)?l.data[h]:a.props.data[h]}}}return null}},{key:"render",value:function(){var t=this;if(!et(this))return null;var e,r,n=this.props,i=n.children,c=n.className,u=n.width,l=n.height,s=n.style,f=n.compact,p=n.title,h=n.desc,d=Cy(n,ky),y=nt(d,!1);if(f)return o().createElement(Vh,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},o().createElement(xt,My({},y,{width:u,height:l,title:p,desc:h}),this.renderClipPath(),at(i,this.renderMap)));this.props.accessibilityLayer&&(y.tabIndex=null!==(e=this.props.tabIndex)&&void 0!==e?e:0,y.role=null!==(r=this.props.role)&&void 0!==r?r:"application",y.onKeyDown=function(e){t.accessibilityManager.keyboardEvent(e)},y.onFocus=function(){t.accessibilityManager.focus()});var v=this.parseEventsOfWrapper();return o().createElement(Vh,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},o().createElement("div",My({className:a("recharts-wrapper",c),style:Uy({position:"relative",cursor:"default",width:u,height:l},s)},v,{ref:function(e){t.container=e}}),o().createElement(xt,My({},y,{width:u,height:l,title:p,desc:h,style:Xy}),this.renderClipPath(),at(i,this.renderMap)),this.renderLegend(),this.renderTooltip()))}}],l&&Dy(i.prototype,l),Object.defineProperty(i,"prototype",{writable:!1}),i;var i,l}(e.Component);$y(m,"displayName",r),$y(m,"defaultProps",Uy({layout:"horizontal",stackOffset:"none",barCategoryGap:"10%",barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:"index"},y)),$y(m,"getDerivedStateFromProps",(function(t,e){var r=t.dataKey,n=t.data,o=t.children,i=t.width,a=t.height,c=t.layout,u=t.stackOffset,l=t.margin,s=e.dataStartIndex,f=e.dataEndIndex;if(void 0===e.updateId){var p=Qy(t);return Uy(Uy(Uy({},p),{},{updateId:0},v(Uy(Uy({props:t},p),{},{updateId:0}),e)),{},{prevDataKey:r,prevData:n,prevWidth:i,prevHeight:a,prevLayout:c,prevStackOffset:u,prevMargin:l,prevChildren:o})}if(r!==e.prevDataKey||n!==e.prevData||i!==e.prevWidth||a!==e.prevHeight||c!==e.prevLayout||u!==e.prevStackOffset||!B(l,e.prevMargin)){var h=Qy(t),d={chartX:e.chartX,chartY:e.chartY,isTooltipActive:e.isTooltipActive},y=Uy(Uy({},Zy(e,n,c)),{},{updateId:e.updateId+1}),m=Uy(Uy(Uy({},h),d),y);return Uy(Uy(Uy({},m),v(Uy({props:t},m),e)),{},{prevDataKey:r,prevData:n,prevWidth:i,prevHeight:a,prevLayout:c,prevStackOffset:u,prevMargin:l,prevChildren:o})}if(!ot(o,e.prevChildren)){var b,g,x,w,O=tt(o,Af),j=O&&null!==(b=null===(g=O.props)||void 0===g?void 0:g.startIndex)&&void 0!==b?b:s,S=O&&null!==(x=null===(w=O.props)||void 0===w?void 0:w.endIndex)&&void 0!==x?x:f,P=j!==s||S!==f,E=M()(n)||P?e.updateId+1:e.updateId;return Uy(Uy({updateId:E},v(Uy(Uy({props:t},e),{},{updateId:E,dataStartIndex:j,dataEndIndex:S}),e)),{},{prevChildren:o,dataStartIndex:j,dataEndIndex:S})}return null})),$y(m,"renderActiveDot",(function(t,r,n){var i;return i=(0,e.isValidElement)(t)?(0,e.cloneElement)(t,r):C()(t)?t(r):o().createElement(xr,r),o().createElement(jt,{className:"recharts-active-dot",key:n},i)}));var b=(0,e.forwardRef)((function(t,e){return o().createElement(m,My({},t,{ref:e}))}));return b.displayName=m.displayName,b}({chartName:"LineChart",GraphicalChild:mv,axisComponents:[{axisType:"xAxis",AxisComp:Yv},{axisType:"yAxis",AxisComp:im}],formatAxisMap:function(e,r,n,o,i){var a=e.width,c=e.height,u=e.layout,l=e.children,f=Object.keys(r),p={left:n.left,leftMirror:n.left,right:a-n.right,rightMirror:a-n.right,top:n.top,topMirror:n.top,bottom:c-n.bottom,bottomMirror:c-n.bottom},h=!!tt(l,dh);return f.reduce((function(a,c){var l,f,d,y,v,m=r[c],b=m.orientation,g=m.domain,x=m.padding,w=void 0===x?{}:x,O=m.mirror,S=m.reversed,P="".concat(b).concat(O?"Mirror":"");if("number"===m.type&&("gap"===m.padding||"no-gap"===m.padding)){var E=g[1]-g[0],k=1/0,_=m.categoricalDomain.sort(A);if(_.forEach((function(t,e){e>0&&(k=Math.min((t||0)-(_[e-1]||0),k))})),Number.isFinite(k)){var M=k/E,T="vertical"===m.layout?n.height:n.width;if("gap"===m.padding&&(l=M*T/2),"no-gap"===m.padding){var D=j(e.barCategoryGap,M*T),I=M*T/2;l=I-D-(I-D)/T*D}}}f="xAxis"===o?[n.left+(w.left||0)+(l||0),n.left+n.width-(w.right||0)-(l||0)]:"yAxis"===o?"horizontal"===u?[n.top+n.height-(w.bottom||0),n.top+(w.top||0)]:[n.top+(w.top||0)+(l||0),n.top+n.height-(w.bottom||0)-(l||0)]:m.range,S&&(f=[f[1],f[0]]);var N=function(e,r,n){var o=e.scale,i=e.type,a=e.layout,c=e.axisType;if("auto"===o)return"radial"===a&&"radiusAxis"===c?{scale:ao(),realScaleType:"band"}:"radial"===a&&"angleAxis"===c?{scale:Ea(),realScaleType:"linear"}:"category"===i&&r&&(r.indexOf("LineChart")>=0||r.indexOf("AreaChart")>=0||r.indexOf("ComposedChart")>=0&&!n)?{scale:uo(),realScaleType:"point"}:"category"===i?{scale:ao(),realScaleType:"band"}:{scale:Ea(),realScaleType:"linear"};if(s()(o)){var u="scale".concat(se()(o));return{scale:(t[u]||uo)(),realScaleType:t[u]?u:"point"}}return C()(o)?{scale:o}:{scale:uo(),realScaleType:"point"}}(m,i,h),B=N.scale,R=N.realScaleType;B.domain(g).range(f),function(t){var e=t.domain();if(e&&!(e.length<=2)){var r=e.length,n=t.range(),o=Math.min(n[0],n[1])-Js,i=Math.max(n[0],n[1])+Js,a=t(e[0]),c=t(e[r-1]);(a<o||a>i||c<o||c>i)&&t.domain([e[0],e[r-1]])}}(B);var L=function(t,e){var r=e.realScaleType,n=e.type,o=e.tickCount,i=e.originalDomain,a=e.allowDecimals,c=r||e.scale;if("auto"!==c&&"linear"!==c)return null;if(o&&"number"===n&&i&&("auto"===i[0]||"auto"===i[1])){var u=t.domain();if(!u.length)return null;var l=bs(u,o,a);return t.domain([ql()(l),Ul()(l)]),{niceTicks:l}}if(o&&"number"===n){var s=t.domain();return{niceTicks:gs(s,o,a)}}return null}(B,bh(bh({},m),{},{realScaleType:R}));"xAxis"===o?(v="top"===b&&!O||"bottom"===b&&O,d=n.left,y=p[P]-v*m.height):"yAxis"===o&&(v="left"===b&&!O||"right"===b&&O,d=p[P]-v*m.width,y=n.top);var z=bh(bh(bh({},m),L),{},{realScaleType:R,x:d,y,scale:B,width:"xAxis"===o?n.width:m.width,height:"yAxis"===o?n.height:m.height});return z.bandSize=uf(z,L),m.hide||"xAxis"!==o?m.hide||(p[P]+=(v?-1:1)*z.width):p[P]+=(v?-1:1)*z.height,bh(bh({},a),{},gh({},c,z))}),{})}}),cm=["x1","y1","x2","y2","key"],um=["offset"];function lm(t){return lm="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},lm(t)}function sm(t,e){var r=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),r.push.apply(r,n)}return r}function fm(t){for(var e=1;e<arguments.length;e++){var r=null!=arguments[e]?arguments[e]:{};e%2?sm(Object(r),!0).forEach((function(e){pm(t,e,r[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(r)):sm(Object(r)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(r,e))}))}return t}function pm(t,e,r){var n;return n=function(t){if("object"!=lm(t)||!t)return t;var e=t[Symbol.toPrimitive];if(void 0!==e){var r=e.call(t,"string");if("object"!=lm(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(t)}(e),(e="symbol"==lm(n)?n:n+"")in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}function hm(){return hm=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},hm.apply(this,arguments)}function dm(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r={};for(var n in t)if(Object.prototype.hasOwnProperty.call(t,n)){if(e.indexOf(n)>=0)continue;r[n]=t[n]}return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}var ym=function(t){var e=t.fill;if(!e||"none"===e)return null;var r=t.fillOpacity,n=t.x,i=t.y,a=t.width,c=t.height,u=t.ry;return o().createElement("rect",{x:n,y:i,ry:u,width:a,height:c,stroke:"none",fill:e,fillOpacity:r,className:"recharts-cartesian-grid-bg"})};function vm(t,e){var r;if(o().isValidElement(t))r=o().cloneElement(t,e);else if(C()(t))r=t(e);else{var n=e.x1,i=e.y1,a=e.x2,c=e.y2,u=e.key,l=dm(e,cm),s=nt(l,!1),f=(s.offset,dm(s,um));r=o().createElement("line",hm({},f,{x1:n,y1:i,x2:a,y2:c,fill:"none",key:u}))}return r}function mm(t){var e=t.x,r=t.width,n=t.horizontal,i=void 0===n||n,a=t.horizontalPoints;if(!i||!a||!a.length)return null;var c=a.map((function(n,o){var a=fm(fm({},t),{},{x1:e,y1:n,x2:e+r,y2:n,key:"line-".concat(o),index:o});return vm(i,a)}));return o().createElement("g",{className:"recharts-cartesian-grid-horizontal"},c)}function bm(t){var e=t.y,r=t.height,n=t.vertical,i=void 0===n||n,a=t.verticalPoints;if(!i||!a||!a.length)return null;var c=a.map((function(n,o){var a=fm(fm({},t),{},{x1:n,y1:e,x2:n,y2:e+r,key:"line-".concat(o),index:o});return vm(i,a)}));return o().createElement("g",{className:"recharts-cartesian-grid-vertical"},c)}function gm(t){var e=t.horizontalFill,r=t.fillOpacity,n=t.x,i=t.y,a=t.width,c=t.height,u=t.horizontalPoints,l=t.horizontal;if(void 0!==l&&!l||!e||!e.length)return null;var s=u.map((function(t){return Math.round(t+i-i)})).sort((function(t,e){return t-e}));i!==s[0]&&s.unshift(0);var f=s.map((function(t,u){var l=s[u+1]?s[u+1]-t:i+c-t;if(l<=0)return null;var f=u%e.length;return o().createElement("rect",{key:"react-".concat(u),y:t,x:n,height:l,width:a,stroke:"none",fill:e[f],fillOpacity:r,className:"recharts-cartesian-grid-bg"})}));return o().createElement("g",{className:"recharts-cartesian-gridstripes-horizontal"},f)}function xm(t){var e=t.vertical,r=void 0===e||e,n=t.verticalFill,i=t.fillOpacity,a=t.x,c=t.y,u=t.width,l=t.height,s=t.verticalPoints;if(!r||!n||!n.length)return null;var f=s.map((function(t){return Math.round(t+a-a)})).sort((function(t,e){return t-e}));a!==f[0]&&f.unshift(0);var p=f.map((function(t,e){var r=f[e+1]?f[e+1]-t:a+u-t;if(r<=0)return null;var s=e%n.length;return o().createElement("rect",{key:"react-".concat(e),x:t,y:c,width:r,height:l,stroke:"none",fill:n[s],fillOpacity:i,className:"recharts-cartesian-grid-bg"})}));return o().createElement("g",{className:"recharts-cartesian-gridstripes-vertical"},p)}var wm=function(t,e){var r=t.xAxis,n=t.width,o=t.height,i=t.offset;return Vs(Sv(fm(fm(fm({},zv.defaultProps),r),{},{ticks:Ys(r,!0),viewBox:{x:0,y:0,width:n,height:o}})),i.left,i.left+i.width,e)},Om=function(t,e){var r=t.yAxis,n=t.width,o=t.height,i=t.offset;return Vs(Sv(fm(fm(fm({},zv.defaultProps),r),{},{ticks:Ys(r,!0),viewBox:{x:0,y:0,width:n,height:o}})),i.top,i.top+i.height,e)},jm={horizontal:!0,vertical:!0,horizontalPoints:[],verticalPoints:[],stroke:"#ccc",fill:"none",verticalFill:[],horizontalFill:[]};function Sm(t){var r,n,i,a,c,u,l,s,f=Zh(),p=Jh(),h=(0,e.useContext)(Wh),d=fm(fm({},t),{},{stroke:null!==(r=t.stroke)&&void 0!==r?r:jm.stroke,fill:null!==(n=t.fill)&&void 0!==n?n:jm.fill,horizontal:null!==(i=t.horizontal)&&void 0!==i?i:jm.horizontal,horizontalFill:null!==(a=t.horizontalFill)&&void 0!==a?a:jm.horizontalFill,vertical:null!==(c=t.vertical)&&void 0!==c?c:jm.vertical,verticalFill:null!==(u=t.verticalFill)&&void 0!==u?u:jm.verticalFill,x:g(t.x)?t.x:h.left,y:g(t.y)?t.y:h.top,width:g(t.width)?t.width:h.width,height:g(t.height)?t.height:h.height}),y=d.x,v=d.y,m=d.width,b=d.height,x=d.syncWithTicks,w=d.horizontalValues,O=d.verticalValues,j=(l=(0,e.useContext)(Uh),S(l)),P=(s=(0,e.useContext)($h),Lh()(s,(function(t){return Kf()(t.domain,Number.isFinite)}))||S(s));if(!g(m)||m<=0||!g(b)||b<=0||!g(y)||y!==+y||!g(v)||v!==+v)return null;var E=d.verticalCoordinatesGenerator||wm,A=d.horizontalCoordinatesGenerator||Om,_=d.horizontalPoints,M=d.verticalPoints;if((!_||!_.length)&&C()(A)){var T=w&&w.length,D=A({yAxis:P?fm(fm({},P),{},{ticks:T?w:P.ticks}):void 0,width:f,height:p,offset:h},!!T||x);k(Array.isArray(D),"horizontalCoordinatesGenerator should return Array but instead it returned [".concat(lm(D),"]")),Array.isArray(D)&&(_=D)}if((!M||!M.length)&&C()(E)){var I=O&&O.length,N=E({xAxis:j?fm(fm({},j),{},{ticks:I?O:j.ticks}):void 0,width:f,height:p,offset:h},!!I||x);k(Array.isArray(N),"verticalCoordinatesGenerator should return Array but instead it returned [".concat(lm(N),"]")),Array.isArray(N)&&(M=N)}return o().createElement("g",{className:"recharts-cartesian-grid"},o().createElement(ym,{fill:d.fill,fillOpacity:d.fillOpacity,x:d.x,y:d.y,width:d.width,height:d.height,ry:d.ry}),o().createElement(mm,hm({},d,{offset:h,horizontalPoints:_,xAxis:j,yAxis:P})),o().createElement(bm,hm({},d,{offset:h,verticalPoints:M,xAxis:j,yAxis:P})),o().createElement(gm,hm({},d,{horizontalPoints:_})),o().createElement(xm,hm({},d,{verticalPoints:M})))}function Pm(t){return Pm="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Pm(t)}function Em(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,c=[],u=!0,l=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;u=!1}else for(;!(u=(n=i.call(r)).done)&&(c.push(n.value),c.length!==e);u=!0);}catch(t){l=!0,o=t}finally{try{if(!u&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(l)throw o}}return c}}(t,e)||function(t,e){if(t){if("string"==typeof t)return Am(t,e);var r={}.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?Am(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Am(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=Array(e);r<e;r++)n[r]=t[r];return n}function km(){km=function(){return e};var t,e={},r=Object.prototype,n=r.hasOwnProperty,o="function"==typeof Symbol?Symbol:{},i=o.iterator||"@@iterator",a=o.asyncIterator||"@@asyncIterator",c=o.toStringTag||"@@toStringTag";function u(t,e,r,n){return Object.defineProperty(t,e,{value:r,enumerable:!n,configurable:!n,writable:!n})}try{u({},"")}catch(t){u=function(t,e,r){return t[e]=r}}function l(e,r,n,o){var i=r&&r.prototype instanceof p?r:p,a=Object.create(i.prototype);return u(a,"_invoke",function(e,r,n){var o=1;return function(i,a){if(3===o)throw Error("Generator is already running");if(4===o){if("throw"===i)throw a;return{value:t,done:!0}}for(n.method=i,n.arg=a;;){var c=n.delegate;if(c){var u=w(c,n);if(u){if(u===f)continue;return u}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(1===o)throw o=4,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);o=3;var l=s(e,r,n);if("normal"===l.type){if(o=n.done?4:2,l.arg===f)continue;return{value:l.arg,done:n.done}}"throw"===l.type&&(o=4,n.method="throw",n.arg=l.arg)}}}(e,n,new S(o||[])),!0),a}function s(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=l;var f={};function p(){}function h(){}function d(){}var y={};u(y,i,(function(){return this}));var v=Object.getPrototypeOf,m=v&&v(v(P([])));m&&m!==r&&n.call(m,i)&&(y=m);var b=d.prototype=p.prototype=Object.create(y);function g(t){["next","throw","return"].forEach((function(e){u(t,e,(function(t){return this._invoke(e,t)}))}))}function x(t,e){function r(o,i,a,c){var u=s(t[o],t,i);if("throw"!==u.type){var l=u.arg,f=l.value;return f&&"object"==Pm(f)&&n.call(f,"__await")?e.resolve(f.__await).then((function(t){r("next",t,a,c)}),(function(t){r("throw",t,a,c)})):e.resolve(f).then((function(t){l.value=t,a(l)}),(function(t){return r("throw",t,a,c)}))}c(u.arg)}var o;u(this,"_invoke",(function(t,n){function i(){return new e((function(e,o){r(t,n,e,o)}))}return o=o?o.then(i,i):i()}),!0)}function w(e,r){var n=r.method,o=e.i[n];if(o===t)return r.delegate=null,"throw"===n&&e.i.return&&(r.method="return",r.arg=t,w(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),f;var i=s(o,e.i,r.arg);if("throw"===i.type)return r.method="throw",r.arg=i.arg,r.delegate=null,f;var a=i.arg;return a?a.done?(r[e.r]=a.value,r.next=e.n,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,f):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,f)}function O(t){this.tryEntries.push(t)}function j(e){var r=e[4]||{};r.type="normal",r.arg=t,e[4]=r}function S(t){this.tryEntries=[[-1]],t.forEach(O,this),this.reset(!0)}function P(e){if(null!=e){var r=e[i];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function r(){for(;++o<e.length;)if(n.call(e,o))return r.value=e[o],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(Pm(e)+" is not iterable")}return h.prototype=d,u(b,"constructor",d),u(d,"constructor",h),h.displayName=u(d,c,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===h||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,d):(t.__proto__=d,u(t,c,"GeneratorFunction")),t.prototype=Object.create(b),t},e.awrap=function(t){return{__await:t}},g(x.prototype),u(x.prototype,a,(function(){return this})),e.AsyncIterator=x,e.async=function(t,r,n,o,i){void 0===i&&(i=Promise);var a=new x(l(t,r,n,o),i);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},g(b),u(b,c,"Generator"),u(b,i,(function(){return this})),u(b,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.unshift(n);return function t(){for(;r.length;)if((n=r.pop())in e)return t.value=n,t.done=!1,t;return t.done=!0,t}},e.values=P,S.prototype={constructor:S,reset:function(e){if(this.prev=this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var r in this)"t"===r.charAt(0)&&n.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0][4];if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(t){a.type="throw",a.arg=e,r.next=t}for(var o=r.tryEntries.length-1;o>=0;--o){var i=this.tryEntries[o],a=i[4],c=this.prev,u=i[1],l=i[2];if(-1===i[0])return n("end"),!1;if(!u&&!l)throw Error("try statement without catch or finally");if(null!=i[0]&&i[0]<=c){if(c<u)return this.method="next",this.arg=t,n(u),!0;if(c<l)return n(l),!1}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n[0]>-1&&n[0]<=this.prev&&this.prev<n[2]){var o=n;break}}o&&("break"===t||"continue"===t)&&o[0]<=e&&e<=o[2]&&(o=null);var i=o?o[4]:{};return i.type=t,i.arg=e,o?(this.method="next",this.next=o[2],f):this.complete(i)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),f},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r[2]===t)return this.complete(r[4],r[3]),j(r),f}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r[0]===t){var n=r[4];if("throw"===n.type){var o=n.arg;j(r)}return o}}throw Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={i:P(e),r,n},"next"===this.method&&(this.arg=t),f}},e}function _m(t,e,r,n,o,i,a){try{var c=t[i](a),u=c.value}catch(t){return void r(t)}c.done?e(u):Promise.resolve(u).then(n,o)}function Mm(t){return function(){var e=this,r=arguments;return new Promise((function(n,o){var i=t.apply(e,r);function a(t){_m(i,n,o,a,c,"next",t)}function c(t){_m(i,n,o,a,c,"throw",t)}a(void 0)}))}}Sm.displayName="CartesianGrid";var Tm=function(t){return Mm(km().mark((function e(){var r;return km().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.prev=0,e.next=3,fetch("/api/results/".concat(t,"?include=frame_analysis"));case 3:return r=e.sent,e.next=6,r.json();case 6:return e.abrupt("return",e.sent);case 9:throw e.prev=9,e.t0=e.catch(0),console.error("Results Fetch Error:",e.t0),e.t0;case 13:case"end":return e.stop()}}),e,null,[[0,9]])})))()},Cm=function(t){var e=t.videoId;return o().createElement("div",{className:"p-4 bg-gray-100 rounded"},o().createElement("p",null,"Frame Analysis Component for video: ",e))},Dm=function(t){return t.videoData,t.heatmapData,o().createElement("div",{className:"p-4 bg-gray-100 rounded"},o().createElement("p",null,"Heatmap Component for video"))};const Im=function(t){var r,n,i=t.videoId,a=Em((0,e.useState)(!0),2),c=a[0],u=a[1],l=Em((0,e.useState)(null),2),s=l[0],f=l[1],p=Em((0,e.useState)(null),2),h=p[0],d=p[1],y=Em((0,e.useState)("overview"),2),v=y[0],m=y[1];if((0,e.useEffect)((function(){function t(){return(t=Mm(km().mark((function t(){var e;return km().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.prev=0,u(!0),t.next=4,Tm(i);case 4:"success"===(e=t.sent).status?(d(e.result),u(!1)):(f("Failed to load analysis results"),u(!1)),t.next=12;break;case 8:t.prev=8,t.t0=t.catch(0),f("Error loading results: ".concat(t.t0.message)),u(!1);case 12:case"end":return t.stop()}}),t,null,[[0,8]])})))).apply(this,arguments)}i&&function(){t.apply(this,arguments)}()}),[i]),c)return o().createElement("div",{className:"flex items-center justify-center h-64"},o().createElement("div",{className:"animate-spin rounded-full h-12 w-12 border-b-2 border-purple-600"}));if(s)return o().createElement("div",{className:"bg-red-100 text-red-700 p-4 rounded-lg"},o().createElement("p",null,s));if(!h)return o().createElement("div",{className:"bg-yellow-100 text-yellow-800 p-4 rounded-lg"},o().createElement("p",null,"No analysis results found for video ID: ",i));var b=h&&h.frame_analysis?h.frame_analysis.map((function(t,e){return{name:"Frame ".concat(e+1),fake:100*t.probability_fake,real:100*(1-t.probability_fake)}})):[];return o().createElement("div",{className:"space-y-6"},o().createElement("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-4"},o().createElement("div",{className:"p-6 rounded-lg shadow-md ".concat("Deepfake"===h.prediction?"bg-red-600 text-white":"bg-green-600 text-white")},o().createElement("h3",{className:"text-lg font-semibold"},"Result"),o().createElement("p",{className:"text-3xl font-bold mt-2"},h.prediction),o().createElement("p",{className:"mt-1 text-sm opacity-80"},"Deepfake"===h.prediction?"AI manipulation detected":"No manipulation detected")),o().createElement("div",{className:"bg-white p-6 rounded-lg shadow-md"},o().createElement("h3",{className:"text-lg font-semibold text-gray-700"},"Confidence"),o().createElement("p",{className:"text-3xl font-bold mt-2"},(100*h.confidence).toFixed(1),"%"),o().createElement("p",{className:"mt-1 text-sm text-gray-500"},h.confidence>.9?"Very high confidence":h.confidence>.8?"High confidence":"Moderate confidence")),o().createElement("div",{className:"bg-white p-6 rounded-lg shadow-md"},o().createElement("h3",{className:"text-lg font-semibold text-gray-700"},"Peak Detection"),o().createElement("p",{className:"text-3xl font-bold mt-2"},(100*h.max_fake_probability).toFixed(1),"%"),o().createElement("p",{className:"mt-1 text-sm text-gray-500"},"Maximum manipulation score detected")),o().createElement("div",{className:"bg-white p-6 rounded-lg shadow-md"},o().createElement("h3",{className:"text-lg font-semibold text-gray-700"},"Suspicious Frames"),o().createElement("p",{className:"text-3xl font-bold mt-2"},(null===(r=h.frame_analysis)||void 0===r?void 0:r.filter((function(t){return t.probability_fake>.5})).length)||0,o().createElement("span",{className:"text-lg text-gray-500"},"/",(null===(n=h.frame_analysis)||void 0===n?void 0:n.length)||0)),o().createElement("p",{className:"mt-1 text-sm text-gray-500"},"Frames with high manipulation scores"))),o().createElement("div",{className:"bg-white rounded-lg shadow-md overflow-hidden"},o().createElement("div",{className:"border-b"},o().createElement("div",{className:"flex"},o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("overview"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("overview")}},"Overview"),o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("frameAnalysis"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("frameAnalysis")}},"Frame Analysis"),o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("heatmap"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("heatmap")}},"Manipulation Heatmap"),o().createElement("button",{className:"px-6 py-4 text-gray-700 font-medium focus:outline-none ".concat("technical"===v?"border-b-2 border-purple-600 text-purple-600":""),onClick:function(){return m("technical")}},"Technical Details"))),o().createElement("div",{className:"p-6"},"overview"===v&&o().createElement("div",{className:"space-y-6"},o().createElement("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6"},o().createElement("div",{className:"bg-gray-100 rounded-lg overflow-hidden"},o().createElement("h3",{className:"bg-gray-800 text-white p-3 text-sm font-semibold"},"Video Preview"),o().createElement("div",{className:"aspect-w-16 aspect-h-9 bg-black"},o().createElement("video",{className:"w-full",controls:!0,src:"/api/video/".concat(i)})),o().createElement("div",{className:"p-3 text-sm text-gray-600"},o().createElement("p",null,o().createElement("span",{className:"font-medium"},"Filename:")," ",h.filename),o().createElement("p",null,o().createElement("span",{className:"font-medium"},"Resolution:")," ",h.resolution),o().createElement("p",null,o().createElement("span",{className:"font-medium"},"Duration:")," ",h.duration,"s"))),o().createElement("div",{className:"bg-white rounded-lg shadow-sm"},o().createElement("h3",{className:"p-3 text-sm font-semibold text-gray-700 border-b"},"Manipulation Probability by Frame"),o().createElement("div",{className:"p-3 h-64"},o().createElement(pt,{width:"100%",height:"100%"},o().createElement(am,{data:b,margin:{top:5,right:30,left:20,bottom:5}},o().createElement(Sm,{strokeDasharray:"3 3"}),o().createElement(Yv,{dataKey:"name",tick:{fontSize:10}}),o().createElement(im,{domain:[0,100],tick:{fontSize:10}}),o().createElement(ue,null),o().createElement(br,null),o().createElement(mv,{type:"monotone",dataKey:"fake",stroke:"#EF4444",activeDot:{r:8},name:"Fake Probability (%)"}),o().createElement(mv,{type:"monotone",dataKey:"real",stroke:"#10B981",name:"Real Probability (%)"})))))),o().createElement("div",{className:"bg-white rounded-lg shadow-sm"},o().createElement("h3",{className:"p-3 text-sm font-semibold text-gray-700 border-b"},"Probability Distribution"),o().createElement("div",{className:"p-6"},o().createElement("div",{className:"flex items-center mb-6"},o().createElement("div",{className:"w-4 h-4 rounded-full bg-green-500 mr-2"}),o().createElement("div",{className:"flex-1"},o().createElement("div",{className:"flex justify-between mb-1"},o().createElement("span",{className:"text-sm font-medium text-gray-700"},"Real"),o().createElement("span",{className:"text-sm font-medium text-gray-700"},(100*h.probabilities.real).toFixed(1),"%")),o().createElement("div",{className:"w-full bg-gray-200 rounded-full h-2"},o().createElement("div",{className:"bg-green-500 h-2 rounded-full",style:{width:"".concat(100*h.probabilities.real,"%")}})))),o().createElement("div",{className:"flex items-center"},o().createElement("div",{className:"w-4 h-4 rounded-full bg-red-500 mr-2"}),o().createElement("div",{className:"flex-1"},o().createElement("div",{className:"flex justify-between mb-1"},o().createElement("span",{className:"text-sm font-medium text-gray-700"},"Deepfake"),o().createElement("span",{className:"text-sm font-medium text-gray-700"},(100*h.probabilities.fake).toFixed(1),"%")),o().createElement("div",{className:"w-full bg-gray-200 rounded-full h-2"},o().createElement("div",{className:"bg-red-500 h-2 rounded-full",style:{width:"".concat(100*h.probabilities.fake,"%")}}))))))),"frameAnalysis"===v&&o().createElement(Cm,{videoId:i}),"heatmap"===v&&o().createElement(Dm,{videoData:{url:"/api/video/".concat(i)},heatmapData:{frames:h.frame_analysis}}),"technical"===v&&o().createElement("div",{className:"bg-gray-100 rounded-lg p-4 overflow-x-auto"},o().createElement("pre",{className:"text-sm text-gray-700 whitespace-pre-wrap"},JSON.stringify(h,null,2))))))}})(),AnalysisResults=n})();
\ No newline at end of file
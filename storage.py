@@ -0,0 +1,355 @@
+# storage.py
+# Storage lifecycle management for VisionShield upload artifacts
+
+import os
+import time
+import fcntl
+import shutil
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Artifact kinds the janitor knows about. Result records are small and back
+# the history, so quota eviction never touches them.
+ARTIFACT_KINDS = ('video', 'heatmaps', 'profile', 'report', 'export', 'resumable', 'temp_frames', 'result')
+EVICTABLE_KINDS = ('video', 'heatmaps', 'profile', 'report', 'export')
+
+
+@dataclass
+class Artifact:
+    """A file or group of files that is kept or deleted as a unit"""
+    
+    kind: str
+    paths: List[str]
+    size: int
+    last_used: float
+    video_id: Optional[str] = None
+    in_flight: bool = False  # videos whose analysis has not written a result yet
+
+
+def touch_artifact(path):
+    """
+    Mark an artifact as used now, for LRU eviction
+    
+    Files only get a new access time, so the modification time served in
+    Last-Modified headers stays put. Directories get both, since listing a
+    directory (as the janitor does) already bumps its access time.
+    """
+    try:
+        now = time.time_ns()
+        if os.path.isdir(path):
+            os.utime(path, ns=(now, now))
+        else:
+            os.utime(path, ns=(now, os.stat(path).st_mtime_ns))
+    except OSError:
+        pass
+
+
+def _last_used(stat):
+    """Last use of a file: explicit touches set the access time, which can lead the mtime"""
+    return max(stat.st_atime, stat.st_mtime)
+
+
+def _tree_usage(path):
+    """Total size and newest modification time of a directory tree (directory atimes are ignored)"""
+    size = 0
+    newest = os.stat(path).st_mtime
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            size += stat.st_size
+            newest = max(newest, stat.st_mtime)
+    return size, newest
+
+
+def scan_artifacts(upload_dir, video_extensions, resumable_dir=None, export_dir=None):
+    """
+    List the artifacts stored for analyzed videos
+    
+    Args:
+        upload_dir: UPLOAD_FOLDER holding videos, results, heatmaps and temp frames
+        video_extensions: Extensions of uploaded videos (e.g. {'mp4', 'webm'})
+        resumable_dir: Folder of resumable upload sessions, if any
+        export_dir: Folder of bulk report archives, if any
+        
+    Returns:
+        List of Artifact
+    """
+    artifacts = []
+    entries = {}
+    for entry in os.scandir(upload_dir):
+        entries[entry.name] = entry
+    result_ids = {name[:-len('_results.json')] for name in entries if name.endswith('_results.json')}
+    skip = {os.path.abspath(d) for d in (resumable_dir, export_dir) if d}
+    
+    for name, entry in entries.items():
+        path = entry.path
+        if os.path.abspath(path) in skip:
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if name.startswith('temp_frames_'):
+                    kind, video_id = 'temp_frames', None
+                elif name.endswith('_heatmaps'):
+                    kind, video_id = 'heatmaps', name[:-len('_heatmaps')]
+                elif name.endswith('_profile'):
+                    kind, video_id = 'profile', name[:-len('_profile')]
+                else:
+                    continue
+                size, last_used = _tree_usage(path)
+            else:
+                stat = entry.stat(follow_symlinks=False)
+                base, extension = os.path.splitext(name)
+                if name.endswith('_results.json'):
+                    kind, video_id = 'result', name[:-len('_results.json')]
+                elif name.endswith('_frames.npy'):
+                    kind, video_id = 'result', name[:-len('_frames.npy')]
+                elif name.endswith('_progress.jsonl'):
+                    kind, video_id = 'result', name[:-len('_progress.jsonl')]
+                elif name.startswith('visionshield_report_') and extension == '.pdf':
+                    kind, video_id = 'report', base[len('visionshield_report_'):]
+                elif extension[1:].lower() in video_extensions:
+                    kind, video_id = 'video', base
+                else:
+                    continue
+                size, last_used = stat.st_size, _last_used(stat)
+        except OSError:
+            # Deleted while scanning
+            continue
+        artifacts.append(Artifact(kind, [path], size, last_used, video_id,
+                                  in_flight=kind == 'video' and video_id not in result_ids))
+    
+    if resumable_dir and os.path.isdir(resumable_dir):
+        # A session is its manifest, data and lock files (plus a manifest being replaced)
+        sessions = {}
+        for entry in os.scandir(resumable_dir):
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            session = sessions.setdefault(entry.name.split('.', 1)[0], Artifact('resumable', [], 0, 0.0))
+            session.paths.append(entry.path)
+            session.size += stat.st_size
+            session.last_used = max(session.last_used, stat.st_mtime)
+        artifacts.extend(sessions.values())
+        
+    if export_dir and os.path.isdir(export_dir):
+        # A bulk report job is its archive and state file (plus ones being written)
+        jobs = {}
+        for entry in os.scandir(export_dir):
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if entry.is_file(follow_symlinks=False):
+                job = jobs.setdefault(entry.name.split('.', 1)[0], Artifact('export', [], 0, 0.0))
+                job.paths.append(entry.path)
+                job.size += stat.st_size
+                job.last_used = max(job.last_used, _last_used(stat))
+        artifacts.extend(jobs.values())
+        
+    return artifacts
+
+
+def _delete(artifact):
+    """Remove every path of an artifact, ignoring ones already gone"""
+    for path in artifact.paths:
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class StorageJanitor:
+    """
+    Delete expired artifacts and keep UPLOAD_FOLDER under a disk quota
+    
+    Each pass removes artifacts unused for longer than their kind's retention,
+    then, if the folder is still above the quota, evicts the least recently
+    used videos, heatmaps, profiles, reports and export archives until usage
+    drops below the low watermark. Nothing used within the grace period is
+    touched, which protects analyses and uploads in progress. Passes take an
+    exclusive file lock, so with several worker processes only one cleans at
+    a time. Videos whose result record is deleted are also dropped from the
+    near-duplicate fingerprint index, so it never points at a missing result.
+    """
+    
+    def __init__(self, upload_dir, video_extensions, retention_days=None, quota_bytes=0,
+                 resumable_dir=None, export_dir=None, grace_period=900, low_watermark=0.9,
+                 fingerprint_index_path=None):
+        """
+        Args:
+            upload_dir: UPLOAD_FOLDER to manage
+            video_extensions: Extensions of uploaded videos
+            retention_days: Dict of artifact kind -> days to keep (0 or missing keeps forever)
+            quota_bytes: Size UPLOAD_FOLDER may grow to before LRU eviction (0 disables)
+            resumable_dir: Folder of resumable upload sessions
+            export_dir: Folder of bulk report archives
+            grace_period: Seconds since last modification before anything may be deleted
+            low_watermark: Fraction of the quota eviction frees down to
+            fingerprint_index_path: Near-duplicate index to prune of deleted results
+        """
+        self.upload_dir = upload_dir
+        self.video_extensions = {extension.lower() for extension in video_extensions}
+        self.retention_days = dict(retention_days or {})
+        self.quota_bytes = quota_bytes
+        self.resumable_dir = resumable_dir
+        self.export_dir = export_dir
+        self.grace_period = grace_period
+        self.low_watermark = low_watermark
+        self.fingerprint_index_path = fingerprint_index_path
+        self.last_run = None
+        self._stop = threading.Event()
+        self._thread = None
+        
+    def _scan(self):
+        return scan_artifacts(self.upload_dir, self.video_extensions, self.resumable_dir, self.export_dir)
+        
+    def _locked(self):
+        """Open and lock the janitor lock file, or return None if another process holds it"""
+        lock_file = open(os.path.join(self.upload_dir, '.janitor.lock'), 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        return lock_file
+        
+    def _prune_fingerprints(self, video_ids):
+        """Remove deleted results from the fingerprint index"""
+        if not video_ids or not self.fingerprint_index_path or not os.path.exists(self.fingerprint_index_path):
+            return
+        from models.fingerprint import get_fingerprint_index
+        
+        try:
+            removed = get_fingerprint_index(self.fingerprint_index_path).remove(sorted(video_ids))
+        except OSError as e:
+            print(f"Storage janitor could not prune the fingerprint index: {e}")
+            return
+        if removed:
+            print(f"Storage janitor removed {removed} deleted results from the fingerprint index")
+            
+    def cleanup_temp_frames(self, now=None):
+        """
+        Remove frame folders left behind by analyses that crashed
+        
+        Returns:
+            Number of folders removed
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        for artifact in self._scan():
+            if artifact.kind == 'temp_frames' and now - artifact.last_used > self.grace_period:
+                _delete(artifact)
+                removed += 1
+        if removed:
+            print(f"Storage janitor removed {removed} orphaned temp frame folders")
+        return removed
+        
+    def run_once(self, now=None):
+        """
+        Run one retention and quota pass
+        
+        Returns:
+            Dict with deleted counts per kind, freed bytes and usage after the
+            pass, or None if another process was already cleaning
+        """
+        lock_file = self._locked()
+        if lock_file is None:
+            return None
+            
+        try:
+            now = time.time() if now is None else now
+            artifacts = self._scan()
+            deleted = {}
+            freed = 0
+            kept = []
+            deleted_results = set()
+            
+            for artifact in artifacts:
+                age = now - artifact.last_used
+                retention = self.retention_days.get(artifact.kind) or 0
+                expired = retention > 0 and age > retention * 86400
+                orphaned = artifact.kind == 'temp_frames'
+                if (expired or orphaned) and age > self.grace_period:
+                    _delete(artifact)
+                    deleted[artifact.kind] = deleted.get(artifact.kind, 0) + 1
+                    freed += artifact.size
+                    if artifact.kind == 'result' and artifact.paths[0].endswith('_results.json'):
+                        deleted_results.add(artifact.video_id)
+                else:
+                    kept.append(artifact)
+                    
+            usage = sum(artifact.size for artifact in kept)
+            if self.quota_bytes and usage > self.quota_bytes:
+                target = self.quota_bytes * self.low_watermark
+                candidates = sorted(
+                    (a for a in kept if a.kind in EVICTABLE_KINDS and not a.in_flight
+                     and now - a.last_used > self.grace_period),
+                    key=lambda a: a.last_used
+                )
+                for artifact in candidates:
+                    if usage <= target:
+                        break
+                    _delete(artifact)
+                    deleted[artifact.kind] = deleted.get(artifact.kind, 0) + 1
+                    freed += artifact.size
+                    usage -= artifact.size
+                if usage > self.quota_bytes:
+                    print(f"Storage janitor could not get below the quota: {usage} bytes in use")
+                    
+            self._prune_fingerprints(deleted_results)
+            if deleted:
+                print(f"Storage janitor deleted {deleted}, freeing {freed / (1024 * 1024):.1f} MB")
+            self.last_run = {'timestamp': int(now * 1000), 'deleted': deleted,
+                             'freed_bytes': freed, 'usage_bytes': usage}
+            return self.last_run
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+            
+    def start(self, interval):
+        """Run passes every interval seconds on a daemon thread"""
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.run_once()
+                except Exception as e:
+                    print(f"Storage janitor pass failed: {e}")
+                    
+        self._thread = threading.Thread(target=loop, name='visionshield-janitor', daemon=True)
+        self._thread.start()
+        
+    def stop(self):
+        self._stop.set()
+
+
+def start_janitor(config):
+    """
+    Clean up after crashed analyses and start the periodic janitor
+    
+    Args:
+        config: VisionShield config object
+        
+    Returns:
+        The StorageJanitor (not started if JANITOR_INTERVAL is 0)
+    """
+    janitor = StorageJanitor(
+        upload_dir=config.UPLOAD_FOLDER,
+        video_extensions=config.ALLOWED_EXTENSIONS,
+        retention_days=config.RETENTION_DAYS,
+        quota_bytes=config.STORAGE_QUOTA_MB * 1024 * 1024,
+        resumable_dir=config.RESUMABLE_FOLDER,
+        export_dir=config.EXPORT_FOLDER,
+        fingerprint_index_path=config.FINGERPRINT_INDEX_PATH
+    )
+    janitor.cleanup_temp_frames()
+    if config.JANITOR_INTERVAL > 0:
+        janitor.start(config.JANITOR_INTERVAL)
+    return janitor
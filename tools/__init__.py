@@ -0,0 +1,2 @@
+# tools/__init__.py
+# Developer tools for VisionShield (benchmarks and load tests), run with python -m tools.<name>
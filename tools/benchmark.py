@@ -0,0 +1,296 @@
+# tools/benchmark.py
+# Reproducible benchmarks for the VisionShield analysis pipeline
+#
+# Usage (from the repository root):
+#   python -m tools.benchmark --quick
+#   python -m tools.benchmark --scenarios 720p,1080p --repeats 10 --output bench.json
+#
+# Compare two commits by running the same command on each and diffing the JSON.
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+import contextlib
+
+import cv2
+import numpy as np
+import torch
+import torchvision
+import torchvision.transforms as transforms
+from PIL import Image
+
+from models.visionshield import VisionShield
+from models.decode import probe_video
+from models.utils import extract_frames, analyze_video, generate_heatmap
+from pdf_generator import generate_analysis_report
+from tools.synthetic import make_video
+
+# name -> synthetic video parameters
+SCENARIOS = {
+    '360p': dict(width=640, height=360, seconds=10, fps=30, codec='mp4v'),
+    '720p': dict(width=1280, height=720, seconds=10, fps=30, codec='mp4v'),
+    '1080p': dict(width=1920, height=1080, seconds=10, fps=30, codec='mp4v'),
+    '720p-long': dict(width=1280, height=720, seconds=30, fps=30, codec='mp4v'),
+    '720p-mjpg': dict(width=1280, height=720, seconds=10, fps=30, codec='MJPG'),
+}
+QUICK_SCENARIOS = ['360p']
+
+STAGES = ('extract_frames', 'preprocess', 'forward', 'heatmap', 'report', 'end_to_end')
+
+
+def _reset_peak_rss():
+    """Reset the kernel's peak RSS counter (Linux only), so each stage reports its own peak"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    # ru_maxrss is in KB on Linux and bytes on macOS, and is never reset
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+
+
+def measure(fn, repeats=5, warmup=1, items=1):
+    """
+    Time repeated calls of fn
+
+    Args:
+        fn: Callable to benchmark
+        repeats: Number of timed runs
+        warmup: Untimed runs before measuring
+        items: Units of work per call (frames, videos...), for throughput
+
+    Returns:
+        Dict with latency percentiles in seconds, throughput in items/s and peak RSS in MB
+    """
+    for _ in range(warmup):
+        fn()
+
+    _reset_peak_rss()
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+
+    latencies = np.array(latencies)
+    return {
+        'runs': int(repeats),
+        'mean': float(latencies.mean()),
+        'p50': float(np.percentile(latencies, 50)),
+        'p95': float(np.percentile(latencies, 95)),
+        'min': float(latencies.min()),
+        'max': float(latencies.max()),
+        'items_per_run': items,
+        'throughput': float(items / latencies.mean()) if latencies.mean() > 0 else None,
+        'peak_rss_mb': round(_peak_rss_mb(), 1)
+    }
+
+
+def _default_transform():
+    """The preprocessing analyze_video applies by default"""
+    return transforms.Compose([
+        transforms.Resize((224, 224)),
+        transforms.ToTensor(),
+        transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
+    ])
+
+
+def build_model(device, weights=None):
+    """VisionShield with the production head sizes, random-init unless weights are given"""
+    torch.manual_seed(0)
+    model = VisionShield(hidden_size=128, num_layers=1, dropout=0.5, pretrained_backbone=False)
+    if weights:
+        model.load_state_dict(torch.load(weights, map_location=device))
+    return model.to(device).eval()
+
+
+def benchmark_scenario(name, spec, model, device, args, workdir):
+    """Run every selected stage on one synthetic video"""
+    video_path = make_video(os.path.join(workdir, 'videos'), **spec)
+    video_info = probe_video(video_path)
+    frames_dir = os.path.join(workdir, 'frames')
+    output_dir = os.path.join(workdir, 'output')
+    os.makedirs(output_dir, exist_ok=True)
+    transform = _default_transform()
+    stages = {}
+
+    def run_extract():
+        shutil.rmtree(frames_dir, ignore_errors=True)
+        return extract_frames(video_path, frames_dir, args.frame_skip, max_frames=args.seq_length,
+                              max_dimension=args.max_dimension, decode_backend=args.decode_backend,
+                              video_info=video_info)
+
+    frame_paths = run_extract()
+    if 'extract_frames' in args.stages:
+        stages['extract_frames'] = measure(run_extract, args.repeats, args.warmup, items=len(frame_paths))
+
+    # Pad like analyze_video so the model always sees seq_length frames
+    padded = (frame_paths + [frame_paths[-1]] * args.seq_length)[:args.seq_length]
+
+    def run_preprocess():
+        return torch.stack([transform(Image.open(p).convert('RGB')) for p in padded]).unsqueeze(0)
+
+    frames_tensor = run_preprocess().to(device)
+    if 'preprocess' in args.stages:
+        stages['preprocess'] = measure(run_preprocess, args.repeats, args.warmup, items=len(padded))
+
+    def run_forward():
+        with torch.no_grad():
+            return model(frames_tensor)
+
+    if 'forward' in args.stages:
+        stages['forward'] = measure(run_forward, args.repeats, args.warmup, items=len(padded))
+
+    def run_analyze():
+        result = analyze_video(model, video_path, device, frame_skip=args.frame_skip,
+                               seq_length=args.seq_length, video_info=video_info,
+                               decode_backend=args.decode_backend,
+                               decode_max_dimension=args.max_dimension)
+        result.update({'filename': os.path.basename(video_path), 'timestamp': int(time.time() * 1000)})
+        return result
+
+    result = run_analyze()
+    heatmap_dir = os.path.join(output_dir, f"{name}_heatmaps")
+
+    def run_heatmap():
+        return generate_heatmap(video_path, result['frame_analysis'], heatmap_dir,
+                                video_info=video_info, video_hash=result['video_hash'])
+
+    if 'heatmap' in args.stages:
+        stages['heatmap'] = measure(run_heatmap, args.repeats, args.warmup)
+    result['heatmaps'] = [
+        {'frame_index': h['frame_index'], 'probability_fake': h['probability_fake'],
+         'path': os.path.basename(h['image_path'])} for h in run_heatmap()
+    ]
+
+    report_path = os.path.join(output_dir, f"{name}_report.pdf")
+
+    def run_report():
+        return generate_analysis_report(result, report_path, chart_backend=args.chart_backend)
+
+    if 'report' in args.stages:
+        stages['report'] = measure(run_report, args.repeats, args.warmup)
+
+    def run_end_to_end():
+        end_to_end_result = run_analyze()
+        generate_heatmap(video_path, end_to_end_result['frame_analysis'], heatmap_dir,
+                         video_info=video_info, video_hash=end_to_end_result['video_hash'])
+        end_to_end_result['heatmaps'] = result['heatmaps']
+        generate_analysis_report(end_to_end_result, report_path, chart_backend=args.chart_backend)
+
+    if 'end_to_end' in args.stages:
+        stages['end_to_end'] = measure(run_end_to_end, args.repeats, args.warmup)
+
+    return {
+        'name': name,
+        'video': {**spec, 'frames': video_info.frame_count, 'size_bytes': os.path.getsize(video_path)},
+        'stages': stages
+    }
+
+
+def environment():
+    """Describe the machine and code version the numbers were taken on"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        'commit': commit or None,
+        'timestamp': int(time.time() * 1000),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'torch': torch.__version__,
+        'torchvision': torchvision.__version__,
+        'opencv': cv2.__version__,
+        'torch_threads': torch.get_num_threads()
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the VisionShield analysis pipeline')
+    parser.add_argument('--scenarios', help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('--quick', action='store_true', help=f"Only run {', '.join(QUICK_SCENARIOS)} with 3 repeats")
+    parser.add_argument('--stages', help=f"Comma-separated stages (default: all of {', '.join(STAGES)})")
+    parser.add_argument('--repeats', type=int, default=5, help='Timed runs per stage')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed runs per stage')
+    parser.add_argument('--device', default='cpu', help='Torch device, e.g. cpu or cuda:0')
+    parser.add_argument('--threads', type=int, help='torch.set_num_threads value')
+    parser.add_argument('--weights', help='Model checkpoint to load (default: random-init weights)')
+    parser.add_argument('--frame-skip', type=int, default=30)
+    parser.add_argument('--seq-length', type=int, default=20)
+    parser.add_argument('--max-dimension', type=int, default=480, help='Decode size limit (0 for full size)')
+    parser.add_argument('--decode-backend', default='auto')
+    parser.add_argument('--chart-backend', default='native')
+    parser.add_argument('--workdir', help='Where synthetic videos are cached (default: a temp folder)')
+    parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.repeats = min(args.repeats, 3)
+    names = args.scenarios.split(',') if args.scenarios else (QUICK_SCENARIOS if args.quick else list(SCENARIOS))
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+    args.scenarios = names
+    args.stages = args.stages.split(',') if args.stages else list(STAGES)
+    unknown = [s for s in args.stages if s not in STAGES]
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(unknown)}")
+    args.max_dimension = args.max_dimension or None
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    device = torch.device(args.device)
+    workdir = args.workdir or os.path.join(tempfile.gettempdir(), 'visionshield-benchmark')
+    os.makedirs(workdir, exist_ok=True)
+
+    report = {'environment': environment(), 'settings': {
+        'repeats': args.repeats, 'warmup': args.warmup, 'device': args.device,
+        'frame_skip': args.frame_skip, 'seq_length': args.seq_length,
+        'max_dimension': args.max_dimension, 'decode_backend': args.decode_backend,
+        'chart_backend': args.chart_backend, 'weights': args.weights or 'random'
+    }, 'scenarios': []}
+
+    # The pipeline logs with print(); keep stdout for the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        model = build_model(device, args.weights)
+        for name in args.scenarios:
+            print(f"Benchmarking {name}...")
+            report['scenarios'].append(benchmark_scenario(name, SCENARIOS[name], model, device, args, workdir))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,351 @@
+# tools/bulk_analyze.py
+# Offline bulk analysis of local video files
+#
+# Usage (from the repository root):
+#   python -m tools.bulk_analyze /data/videos --output results.jsonl
+#   python -m tools.bulk_analyze manifest.txt --output results.jsonl --workers 8 --batch-size 4
+#
+# Inputs are directories (walked recursively for video files) or manifest files
+# listing one video path per line. A pool of worker processes hashes, decodes
+# and preprocesses videos while the parent runs the one loaded model on batches
+# of them. Every finished video is appended to the JSON Lines output, which is
+# also the checkpoint: rerunning the same command skips files already recorded,
+# matching them by path, size and mtime, or by get_video_hash for moved copies.
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+import torch
+
+from config_production import Config
+from models.artifacts import ensure_model_weights
+from models.decode import probe_video
+from models.utils import (
+    default_transform, extract_frames, fit_sequence, get_video_hash, load_model,
+    summarize_prediction, video_metadata
+)
+
+# Per-process state for pool workers, set up once by _init_worker
+_worker_settings = None
+_worker_done_hashes = frozenset()
+_worker_transform = None
+
+
+def _init_worker(settings, done_hashes):
+    """Set up preprocessing once per worker process"""
+    global _worker_settings, _worker_done_hashes, _worker_transform
+    # Decoding runs in parallel processes; keep each one from spawning a full thread pool
+    torch.set_num_threads(1)
+    _worker_settings = settings
+    _worker_done_hashes = frozenset(done_hashes)
+    _worker_transform = default_transform()
+
+
+def _prepare_video(path):
+    """
+    Hash, decode and preprocess one video inside a pool worker
+
+    Returns:
+        Dict with the file identity and either 'frames' (float32 array of shape
+        [seq_length, c, h, w]) plus result metadata, 'done' if the content was
+        analyzed by an earlier run, or 'error'
+    """
+    from PIL import Image
+
+    settings = _worker_settings
+    item = {'path': path}
+    temp_dir = None
+    try:
+        stat = os.stat(path)
+        item.update({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns})
+        item['video_hash'] = video_hash = get_video_hash(path)
+        if video_hash in _worker_done_hashes:
+            item['done'] = True
+            return item
+
+        video_info = probe_video(path)
+        temp_dir = tempfile.mkdtemp(prefix='visionshield-bulk-')
+        fingerprint = []
+        frame_paths, source_indices = extract_frames(
+            path, temp_dir, settings['frame_skip'], max_frames=settings['seq_length'],
+            sampling=settings['sampling'], return_indices=True, fingerprints=fingerprint,
+            max_dimension=settings['max_dimension'], decode_backend=settings['decode_backend'],
+            decode_threads=settings['decode_threads'], video_info=video_info
+        )
+        if not frame_paths:
+            raise ValueError(f"No frames could be extracted from the video {path}")
+
+        frame_paths, source_indices = fit_sequence(frame_paths, source_indices, settings['seq_length'])
+        frames = torch.stack([_worker_transform(Image.open(p).convert('RGB')) for p in frame_paths])
+        item.update({
+            'frames': frames.numpy(),
+            'source_indices': source_indices,
+            'fingerprint': fingerprint,
+            'metadata': video_metadata(video_info)
+        })
+    except Exception as e:
+        item['error'] = str(e)
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    return item
+
+
+def iter_video_paths(inputs, extensions):
+    """
+    Yield absolute video paths from directories and manifest files
+
+    Args:
+        inputs: Directories, video files or manifests (one path per line,
+            '#' starts a comment, relative paths are resolved against the manifest)
+        extensions: Lower-case file extensions treated as videos when walking directories
+    """
+    def is_video(name):
+        return '.' in name and name.rsplit('.', 1)[1].lower() in extensions
+
+    for entry in inputs:
+        if os.path.isdir(entry):
+            for root, dirs, files in os.walk(entry):
+                dirs.sort()
+                for name in sorted(files):
+                    if is_video(name):
+                        yield os.path.abspath(os.path.join(root, name))
+        elif is_video(entry):
+            yield os.path.abspath(entry)
+        else:
+            base_dir = os.path.dirname(os.path.abspath(entry))
+            with open(entry, 'r') as f:
+                for line in f:
+                    line = line.split('#', 1)[0].strip()
+                    if line:
+                        yield os.path.abspath(os.path.join(base_dir, line))
+
+
+def load_checkpoint(output_path):
+    """
+    Read the finished records of an earlier run from its JSONL output
+
+    A partially written last line (from an interrupted run) is cut off so
+    new records start on a fresh line.
+
+    Returns:
+        Tuple of ({path: (size, mtime_ns)}, {video_hash: path}) for videos
+        that completed; failed videos are retried
+    """
+    done_files = {}
+    done_hashes = {}
+    if not os.path.exists(output_path):
+        return done_files, done_hashes
+
+    with open(output_path, 'rb+') as f:
+        data = f.read()
+        complete = data.rfind(b'\n') + 1
+        if complete < len(data):
+            f.truncate(complete)
+
+    for line in data[:complete].splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if record.get('status') in ('completed', 'duplicate'):
+            done_files[record['path']] = (record['size'], record['mtime_ns'])
+            done_hashes.setdefault(record['video_hash'], record['path'])
+    return done_files, done_hashes
+
+
+def score_batch(model, items, device):
+    """Run the model once on the preprocessed frames of several videos"""
+    batch = torch.from_numpy(np.stack([item['frames'] for item in items])).to(device)
+    with torch.no_grad():
+        batch_size, seq_len = batch.shape[:2]
+        features = model.extract_features(batch.flatten(0, 1)).reshape(batch_size, seq_len, -1)
+        return torch.softmax(model.classify_features(features), dim=1)
+
+
+class BulkAnalysis:
+    """
+    Analyze many local videos with one model and append results to a JSONL file
+
+    Each output line holds the file identity (path, size, mtime_ns,
+    video_hash), a status ('completed', 'duplicate' or 'error') and, for
+    completed videos, a result shaped like the /api/analyze response.
+    """
+
+    def __init__(self, model, device, output_path, settings, workers=2, batch_size=4):
+        self.model = model
+        self.device = device
+        self.output_path = output_path
+        self.settings = settings
+        self.workers = workers
+        self.batch_size = batch_size
+        self.counts = {'completed': 0, 'duplicate': 0, 'error': 0, 'skipped': 0}
+
+    def run(self, paths):
+        """Process every path not already recorded in the output"""
+        done_files, done_hashes = load_checkpoint(self.output_path)
+        seen_hashes = dict(done_hashes)
+        window = self.workers * 2 + self.batch_size
+        pending = []
+        started = time.perf_counter()
+
+        # Spawned workers start clean instead of inheriting the parent's torch threads
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.settings, list(done_hashes))
+        )
+        with executor, open(self.output_path, 'a') as output:
+            in_flight = set()
+            paths = iter(paths)
+            exhausted = False
+
+            while in_flight or not exhausted:
+                while not exhausted and len(in_flight) < window:
+                    path = next(paths, None)
+                    if path is None:
+                        exhausted = True
+                        break
+                    try:
+                        stat = os.stat(path)
+                    except OSError as e:
+                        self._write(output, {'path': path, 'status': 'error', 'error': str(e)})
+                        continue
+                    if done_files.get(path) == (stat.st_size, stat.st_mtime_ns):
+                        self.counts['skipped'] += 1
+                        continue
+                    in_flight.add(executor.submit(_prepare_video, path))
+
+                if not in_flight:
+                    break
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    item = future.result()
+                    record = {key: item[key] for key in ('path', 'size', 'mtime_ns') if key in item}
+                    record['video_hash'] = item.get('video_hash')
+                    if 'error' in item:
+                        self._write(output, {**record, 'status': 'error', 'error': item['error']})
+                    elif item.get('done') or item['video_hash'] in seen_hashes:
+                        self._write(output, {**record, 'status': 'duplicate',
+                                             'duplicate_of': seen_hashes[item['video_hash']]})
+                    else:
+                        seen_hashes[item['video_hash']] = item['path']
+                        pending.append(item)
+
+                if len(pending) >= self.batch_size or (exhausted and not in_flight and pending):
+                    self._flush(output, pending)
+                    pending = []
+                    print(f"{sum(self.counts.values())} videos processed "
+                          f"({time.perf_counter() - started:.0f}s)", file=sys.stderr)
+
+        return self.counts
+
+    def _flush(self, output, items):
+        """Score a batch of prepared videos and write their records"""
+        try:
+            probs = score_batch(self.model, items, self.device)
+        except Exception as e:
+            for item in items:
+                self._write(output, {
+                    'path': item['path'], 'size': item['size'], 'mtime_ns': item['mtime_ns'],
+                    'video_hash': item['video_hash'], 'status': 'error', 'error': f"Inference failed: {e}"
+                })
+            return
+
+        for item, video_probs in zip(items, probs):
+            source_indices = item['source_indices']
+            result = {
+                **summarize_prediction(video_probs, item['video_hash'], list(range(len(source_indices))),
+                                       source_indices),
+                "frames_analyzed": len(source_indices),
+                "frames_used": len(source_indices),
+                "inference_mode": "full",
+                "face_crop": False,
+                "sampling": self.settings['sampling'],
+                **item['metadata'],
+                "video_hash": item['video_hash'],
+                "fingerprint": item['fingerprint'],
+                "filename": os.path.basename(item['path']),
+                "timestamp": int(time.time() * 1000)
+            }
+            self._write(output, {
+                'path': item['path'], 'size': item['size'], 'mtime_ns': item['mtime_ns'],
+                'video_hash': item['video_hash'], 'status': 'completed', 'result': result
+            })
+
+    def _write(self, output, record):
+        """Append one record and flush it, so an interrupted run keeps it"""
+        output.write(json.dumps(record) + '\n')
+        output.flush()
+        self.counts[record['status']] += 1
+
+
+def parse_args(argv=None, config=None):
+    config = config or Config()
+    parser = argparse.ArgumentParser(description='Analyze local video files in bulk')
+    parser.add_argument('inputs', nargs='+', help='Directories, video files or manifest files (one path per line)')
+    parser.add_argument('--output', required=True, help='JSON Lines file results are appended to (also the resume checkpoint)')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='Decode worker processes')
+    parser.add_argument('--batch-size', type=int, default=4, help='Videos scored per model call')
+    parser.add_argument('--device', default=config.DEVICE, help='Torch device, e.g. cpu or cuda:0')
+    parser.add_argument('--weights', default=config.MODEL_SAVE_PATH, help='Model checkpoint')
+    parser.add_argument('--frame-skip', type=int, default=config.FRAME_SKIP)
+    parser.add_argument('--seq-length', type=int, default=config.SEQ_LENGTH)
+    parser.add_argument('--sampling', choices=['uniform', 'adaptive'], default=config.FRAME_SAMPLING)
+    parser.add_argument('--max-dimension', type=int, default=config.DECODE_MAX_DIMENSION,
+                        help='Decode size limit (0 for full size)')
+    parser.add_argument('--decode-backend', default=config.DECODE_BACKEND)
+    parser.add_argument('--decode-threads', type=int, default=1,
+                        help='Decoder threads per worker (0 lets the decoder choose)')
+    args = parser.parse_args(argv)
+    args.extensions = config.ALLOWED_EXTENSIONS
+    args.model_config = {
+        'HIDDEN_SIZE': config.HIDDEN_SIZE,
+        'NUM_LSTM_LAYERS': config.NUM_LSTM_LAYERS,
+        'DROPOUT': config.DROPOUT
+    }
+    return args
+
+
+def main(argv=None):
+    config = Config()
+    args = parse_args(argv, config)
+    device = torch.device(args.device)
+    settings = {
+        'frame_skip': args.frame_skip,
+        'seq_length': args.seq_length,
+        'sampling': args.sampling,
+        'max_dimension': args.max_dimension or None,
+        'decode_backend': args.decode_backend,
+        'decode_threads': args.decode_threads
+    }
+
+    # The pipeline logs with print(); keep stdout quiet for scripting
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.weights == config.MODEL_SAVE_PATH:
+            ensure_model_weights(config)
+        model = load_model(args.weights, device, args.model_config)
+        bulk = BulkAnalysis(model, device, args.output, settings, workers=args.workers,
+                            batch_size=args.batch_size)
+        try:
+            counts = bulk.run(iter_video_paths(args.inputs, args.extensions))
+        except KeyboardInterrupt:
+            print(f"Interrupted; rerun the same command to resume from {args.output}")
+            sys.exit(130)
+
+    print(json.dumps(counts))
+
+
+if __name__ == '__main__':
+    main()
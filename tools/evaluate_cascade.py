@@ -0,0 +1,230 @@
+# tools/evaluate_cascade.py
+# Throughput and verdict agreement of cascade inference on labelled local videos
+#
+# Usage (from the repository root):
+#   python -m tools.evaluate_cascade samples/ --screening-weights models/weights/visionshield_screening.pth
+#   python -m tools.evaluate_cascade samples/ --bands 0.1,0.9 0.2,0.8 0.3,0.7 --output cascade.json
+#
+# The sample directory holds videos under real/ and fake/ subdirectories (any
+# depth below them); the folder name is the label. Every video is decoded once
+# and scored by both the screening and the full model, so any number of
+# cascade bands can be compared from the same scores: a video counts as
+# escalated when its screening fake probability falls inside the band, and
+# then costs screening plus full model time.
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+import torch
+from PIL import Image
+
+from config_production import Config
+from models.artifacts import ensure_model_weights
+from models.decode import probe_video
+from models.utils import default_transform, extract_frames, fit_sequence, load_model
+from tools.bulk_analyze import iter_video_paths, score_batch
+
+LABELS = ('real', 'fake')
+
+
+def label_of(path, sample_dir):
+    """Label of a sample from the first real/ or fake/ folder in its path, or None"""
+    parts = os.path.relpath(path, os.path.abspath(sample_dir)).lower().split(os.sep)[:-1]
+    for part in parts:
+        if part in LABELS:
+            return part
+    return None
+
+
+def prepare_clip(path, settings, transform):
+    """Decode and preprocess a video into a [seq_length, c, h, w] tensor"""
+    temp_dir = tempfile.mkdtemp(prefix='visionshield-cascade-')
+    try:
+        video_info = probe_video(path)
+        frame_paths, source_indices = extract_frames(
+            path, temp_dir, settings['frame_skip'], max_frames=settings['seq_length'],
+            sampling=settings['sampling'], return_indices=True,
+            max_dimension=settings['max_dimension'], decode_backend=settings['decode_backend'],
+            video_info=video_info
+        )
+        if not frame_paths:
+            raise ValueError(f"No frames could be extracted from the video {path}")
+        frame_paths, _ = fit_sequence(frame_paths, source_indices, settings['seq_length'])
+        return torch.stack([transform(Image.open(p).convert('RGB')) for p in frame_paths])
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def timed_score(model, frames, device):
+    """Fake probability of one clip and the seconds the model took"""
+    start = time.perf_counter()
+    probs = score_batch(model, [{'frames': frames.numpy()}], device)
+    return probs[0][1].item(), time.perf_counter() - start
+
+
+def score_samples(paths, sample_dir, screening_model, full_model, device, settings):
+    """
+    Decode every labelled sample once and score it with both models
+
+    Returns:
+        List of per-video dicts with label, decode/screening/full seconds and
+        both fake probabilities; unreadable videos carry 'error' instead
+    """
+    transform = default_transform()
+    samples = []
+    warmed_up = False
+    for path in paths:
+        label = label_of(path, sample_dir)
+        if label is None:
+            continue
+        sample = {'path': path, 'label': label}
+        try:
+            start = time.perf_counter()
+            frames = prepare_clip(path, settings, transform)
+            sample['decode_seconds'] = time.perf_counter() - start
+            if not warmed_up:
+                # Keep one-off allocation costs out of the first sample's timings
+                timed_score(screening_model, frames, device)
+                timed_score(full_model, frames, device)
+                warmed_up = True
+            sample['screening_fake'], sample['screening_seconds'] = timed_score(screening_model, frames, device)
+            sample['full_fake'], sample['full_seconds'] = timed_score(full_model, frames, device)
+        except Exception as e:
+            sample['error'] = str(e)
+        samples.append(sample)
+        print(f"{len(samples)}: {os.path.basename(path)} ({label}) "
+              f"{'error: ' + sample['error'] if 'error' in sample else 'scored'}")
+    return samples
+
+
+def evaluate_band(samples, band):
+    """
+    Cascade metrics for one band, relative to always running the full model
+
+    Args:
+        samples: Scored samples from score_samples (errors excluded)
+        band: (low, high) screening fake probabilities that are escalated
+    """
+    low, high = band
+    full_model_time = cascade_model_time = 0.0
+    full_total_time = cascade_total_time = 0.0
+    escalated = agreements = cascade_correct = 0
+    for sample in samples:
+        is_escalated = low < sample['screening_fake'] < high
+        cascade_fake = sample['full_fake'] if is_escalated else sample['screening_fake']
+        model_time = sample['screening_seconds'] + (sample['full_seconds'] if is_escalated else 0.0)
+
+        escalated += is_escalated
+        agreements += (cascade_fake > 0.5) == (sample['full_fake'] > 0.5)
+        cascade_correct += (cascade_fake > 0.5) == (sample['label'] == 'fake')
+        full_model_time += sample['full_seconds']
+        cascade_model_time += model_time
+        full_total_time += sample['decode_seconds'] + sample['full_seconds']
+        cascade_total_time += sample['decode_seconds'] + model_time
+
+    count = len(samples)
+    return {
+        'band': [low, high],
+        'escalation_rate': escalated / count,
+        'agreement_with_full': agreements / count,
+        'cascade_accuracy': cascade_correct / count,
+        'model_videos_per_second': {'full': count / full_model_time, 'cascade': count / cascade_model_time},
+        'model_speedup': full_model_time / cascade_model_time,
+        'end_to_end_videos_per_second': {'full': count / full_total_time, 'cascade': count / cascade_total_time},
+        'end_to_end_speedup': full_total_time / cascade_total_time
+    }
+
+
+def summarize(samples, bands):
+    """Accuracy of each model alone plus metrics for every cascade band"""
+    scored = [s for s in samples if 'error' not in s]
+    if not scored:
+        raise ValueError("No labelled sample could be scored")
+
+    def accuracy(key):
+        return sum((s[key] > 0.5) == (s['label'] == 'fake') for s in scored) / len(scored)
+
+    return {
+        'videos': len(scored),
+        'errors': len(samples) - len(scored),
+        'labels': {label: sum(s['label'] == label for s in scored) for label in LABELS},
+        'accuracy': {'screening': accuracy('screening_fake'), 'full': accuracy('full_fake')},
+        'mean_seconds': {
+            key: sum(s[f'{key}_seconds'] for s in scored) / len(scored)
+            for key in ('decode', 'screening', 'full')
+        },
+        'bands': [evaluate_band(scored, band) for band in bands]
+    }
+
+
+def parse_band(value):
+    low, high = (float(part) for part in value.split(','))
+    if not 0 <= low <= high <= 1:
+        raise argparse.ArgumentTypeError(f"Band {value} must be low,high within 0-1")
+    return low, high
+
+
+def parse_args(argv=None, config=None):
+    config = config or Config()
+    parser = argparse.ArgumentParser(description='Evaluate cascade inference on labelled local videos')
+    parser.add_argument('sample_dir', help='Directory with real/ and fake/ video subdirectories')
+    parser.add_argument('--weights', default=config.MODEL_SAVE_PATH, help='Full model checkpoint')
+    parser.add_argument('--screening-weights', default=config.SCREENING_MODEL_PATH, help='Screening model checkpoint')
+    parser.add_argument('--screening-backbone', default=config.SCREENING_BACKBONE)
+    parser.add_argument('--bands', nargs='+', type=parse_band, default=[config.CASCADE_BAND],
+                        help='Escalation bands to compare, as low,high')
+    parser.add_argument('--device', default=config.DEVICE, help='Torch device, e.g. cpu or cuda:0')
+    parser.add_argument('--frame-skip', type=int, default=config.FRAME_SKIP)
+    parser.add_argument('--seq-length', type=int, default=config.SEQ_LENGTH)
+    parser.add_argument('--sampling', choices=['uniform', 'adaptive'], default=config.FRAME_SAMPLING)
+    parser.add_argument('--max-dimension', type=int, default=config.DECODE_MAX_DIMENSION,
+                        help='Decode size limit (0 for full size)')
+    parser.add_argument('--decode-backend', default=config.DECODE_BACKEND)
+    parser.add_argument('--output', help='Also write the report and per-video scores to this JSON file')
+    args = parser.parse_args(argv)
+    args.extensions = config.ALLOWED_EXTENSIONS
+    args.model_config = {
+        'HIDDEN_SIZE': config.HIDDEN_SIZE,
+        'NUM_LSTM_LAYERS': config.NUM_LSTM_LAYERS,
+        'DROPOUT': config.DROPOUT
+    }
+    return args
+
+
+def main(argv=None):
+    config = Config()
+    args = parse_args(argv, config)
+    device = torch.device(args.device)
+    settings = {
+        'frame_skip': args.frame_skip,
+        'seq_length': args.seq_length,
+        'sampling': args.sampling,
+        'max_dimension': args.max_dimension or None,
+        'decode_backend': args.decode_backend
+    }
+
+    # The pipeline logs with print(); keep stdout for the report
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.weights == config.MODEL_SAVE_PATH:
+            ensure_model_weights(config)
+        full_model = load_model(args.weights, device, args.model_config)
+        screening_model = load_model(args.screening_weights, device,
+                                     {**args.model_config, 'BACKBONE': args.screening_backbone})
+        samples = score_samples(iter_video_paths([args.sample_dir], args.extensions), args.sample_dir,
+                                screening_model, full_model, device, settings)
+        report = summarize(samples, args.bands)
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'report': report, 'samples': samples}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+# tools/import_time.py
+# Import-time regression check for the web app entry point
+#
+# Usage (from the repository root):
+#   python -m tools.import_time
+#   python -m tools.import_time --module app_production --budget-ms 600 --top 20
+#
+# Imports the module in a fresh interpreter under `python -X importtime` and
+# fails (exit status 1) when a heavy package is imported eagerly or the total
+# import time exceeds the budget. Torch, OpenCV, ReportLab and friends must
+# only load on first use of the subsystem that needs them, so workers boot
+# without them and processes that only serve history or static pages never
+# pay for them.
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Top-level packages that must not be imported by the app entry point
+HEAVY_PACKAGES = ('torch', 'torchvision', 'cv2', 'av', 'numpy', 'PIL', 'reportlab', 'matplotlib')
+
+
+def measure_imports(module, python=sys.executable):
+    """
+    Import a module in a fresh interpreter and collect -X importtime output
+
+    Returns:
+        List of (name, self_us, cumulative_us) in import order
+    """
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = [field.strip() for field in line[len('import time:'):].split('|')]
+        if not fields[0].isdigit():
+            continue  # column header
+        imports.append((fields[2], int(fields[0]), int(fields[1])))
+    return imports
+
+
+def check_imports(imports, module, budget_ms, heavy_packages=HEAVY_PACKAGES, top=15):
+    """
+    Summarize the import profile of a module and list budget violations
+
+    Args:
+        imports: Output of measure_imports
+        module: Name of the imported module
+        budget_ms: Allowed cumulative import time of the module, or None
+        heavy_packages: Top-level packages that must not be imported
+        top: Number of slowest modules to report
+
+    Returns:
+        dict with total_ms, the slowest modules, heavy packages that were
+        imported and a list of failures (empty when the check passes)
+    """
+    total_us = next((cumulative for name, _, cumulative in imports if name == module), 0)
+    heavy = sorted({name.split('.')[0] for name, _, _ in imports if name.split('.')[0] in heavy_packages})
+    slowest = sorted(imports, key=lambda entry: entry[2], reverse=True)[:top]
+
+    failures = [f"{package} is imported eagerly" for package in heavy]
+    if budget_ms is not None and total_us / 1000 > budget_ms:
+        failures.append(f"importing {module} took {total_us / 1000:.0f} ms, over the {budget_ms} ms budget")
+    return {
+        'module': module,
+        'total_ms': round(total_us / 1000, 1),
+        'modules_imported': len(imports),
+        'slowest': [{'module': name, 'self_ms': round(self_us / 1000, 1), 'cumulative_ms': round(cumulative / 1000, 1)}
+                    for name, self_us, cumulative in slowest],
+        'heavy_packages': heavy,
+        'failures': failures
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Check the import time of the VisionShield web app')
+    parser.add_argument('--module', default='app_production', help='Module to import')
+    parser.add_argument('--budget-ms', type=float, help='Fail when the cumulative import time exceeds this')
+    parser.add_argument('--repeats', type=int, default=3, help='Fresh interpreters to run; the fastest counts')
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest modules to report')
+    parser.add_argument('--allow', action='append', default=[], help='Heavy package allowed to be imported')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    heavy_packages = tuple(p for p in HEAVY_PACKAGES if p not in args.allow)
+
+    # The first run also warms the bytecode and file system caches
+    runs = [measure_imports(args.module) for _ in range(max(args.repeats, 1))]
+    imports = min(runs, key=lambda run: next((c for name, _, c in run if name == args.module), 0))
+    report = check_imports(imports, args.module, args.budget_ms, heavy_packages, args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import {report['module']}: {report['total_ms']:.1f} ms, {report['modules_imported']} modules")
+        for entry in report['slowest']:
+            print(f"  {entry['cumulative_ms']:8.1f} ms  {entry['self_ms']:8.1f} ms  {entry['module']}")
+        for failure in report['failures']:
+            print(f"FAIL: {failure}")
+    return 1 if report['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
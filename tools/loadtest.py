@@ -0,0 +1,331 @@
+# tools/loadtest.py
+# HTTP load test of the VisionShield app with a lightweight stand-in model
+#
+# Usage (from the repository root):
+#   python -m tools.loadtest --quick
+#   python -m tools.loadtest --workers 1,2 --threads 2,4 --concurrency 1,2,4,8 --duration 20 --output load.json
+#
+# Each workers x threads combination starts gunicorn (the Procfile server) on a
+# free local port, seeds a few analyses, then drives a weighted mix of
+# /api/analyze, /api/history, /api/results and /api/download-report traffic at
+# each concurrency level and reports throughput and latency percentiles.
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import tempfile
+import threading
+import contextlib
+import multiprocessing
+
+import numpy as np
+import requests
+import torch
+import torch.nn as nn
+
+import config_production
+from tools.synthetic import make_video
+
+DEFAULT_MIX = 'analyze=1,history=3,results=3,report=1'
+REQUEST_KINDS = ('analyze', 'history', 'results', 'report')
+
+
+class StubModel(nn.Module):
+    """
+    Stand-in for VisionShield with the same inference interface
+
+    'tiny' runs a small pooled linear model, so the CPU cost is dominated by
+    decoding and request handling. 'sleep' adds a fixed delay per scored
+    frame sequence to mimic a slower model without using CPU.
+    """
+
+    def __init__(self, mode='tiny', latency=0.0, feature_size=64):
+        super(StubModel, self).__init__()
+        self.mode = mode
+        self.latency = latency
+        self.pool = nn.AdaptiveAvgPool2d(8)
+        self.fusion = nn.Linear(3 * 8 * 8, feature_size)
+        self.classifier = nn.Linear(feature_size, 2)
+
+    def extract_features(self, frames):
+        return self.fusion(self.pool(frames).flatten(1))
+
+    def classify_features(self, fused_features):
+        if self.mode == 'sleep' and self.latency:
+            time.sleep(self.latency)
+        return self.classifier(fused_features.mean(dim=1))
+
+    def forward(self, x):
+        batch_size, seq_len = x.shape[:2]
+        features = self.extract_features(x.flatten(0, 1)).reshape(batch_size, seq_len, -1)
+        return self.classify_features(features)
+
+
+class LoadTestConfig(config_production.Config):
+    """Production config with all storage moved to a scratch folder"""
+
+    upload_folder = None
+
+    def __init__(self):
+        super().__init__()
+        production_uploads = self.UPLOAD_FOLDER
+        for name, value in list(vars(self).items()):
+            if isinstance(value, str) and value.startswith(production_uploads):
+                setattr(self, name, self.upload_folder + value[len(production_uploads):])
+        os.makedirs(self.UPLOAD_FOLDER, exist_ok=True)
+
+
+def build_app(upload_folder, model_mode, model_latency):
+    """Create the production app with the stand-in model installed"""
+    LoadTestConfig.upload_folder = upload_folder
+    import app_production
+    import api.routes
+
+    app = app_production.create_app(LoadTestConfig)
+    torch.manual_seed(0)
+    with app.app_context():
+        api.routes.get_model_registry().install('stub', StubModel(model_mode, model_latency).eval())
+    return app
+
+
+def _serve(app, port, workers, threads, timeout):
+    """Run the app under gunicorn with the Procfile's worker model"""
+    from gunicorn.app.base import BaseApplication
+
+    class LoadTestServer(BaseApplication):
+        def load_config(self):
+            for key, value in {
+                'bind': f'127.0.0.1:{port}', 'workers': workers, 'threads': threads,
+                'worker_class': 'gthread', 'timeout': timeout, 'loglevel': 'warning',
+                'accesslog': None
+            }.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    LoadTestServer().run()
+
+
+def _free_port():
+    with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def running_server(app, workers, threads, timeout=300):
+    """Start gunicorn in a child process and yield its base URL"""
+    port = _free_port()
+    process = multiprocessing.get_context('fork').Process(
+        target=_serve, args=(app, port, workers, threads, timeout), daemon=True
+    )
+    process.start()
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        deadline = time.time() + 60
+        while True:
+            try:
+                if requests.get(f'{base_url}/api/health', timeout=5).ok:
+                    break
+            except requests.ConnectionError:
+                pass
+            if time.time() > deadline or not process.is_alive():
+                raise RuntimeError('Load test server did not start')
+            time.sleep(0.2)
+        yield base_url
+    finally:
+        process.terminate()
+        process.join(10)
+
+
+class TrafficGenerator:
+    """Issue one weighted-random request at a time against a running server"""
+
+    def __init__(self, base_url, mix, videos, video_ids, seed):
+        self.base_url = base_url
+        self.kinds = [kind for kind, weight in mix.items() if weight > 0]
+        self.weights = [mix[kind] for kind in self.kinds]
+        self.videos = videos
+        self.video_ids = video_ids
+        self.random = random.Random(seed)
+        self.session = requests.Session()
+
+    def request(self):
+        """Send one request and return (kind, latency seconds, HTTP status or None)"""
+        kind = self.random.choices(self.kinds, self.weights)[0]
+        start = time.perf_counter()
+        try:
+            if kind == 'analyze':
+                video = self.random.choice(self.videos)
+                with open(video, 'rb') as f:
+                    response = self.session.post(f'{self.base_url}/api/analyze',
+                                                 files={'video': (os.path.basename(video), f, 'video/mp4')})
+            elif kind == 'history':
+                response = self.session.get(f'{self.base_url}/api/history')
+            elif kind == 'results':
+                response = self.session.get(f'{self.base_url}/api/results/{self.random.choice(self.video_ids)}')
+            else:
+                response = self.session.get(f'{self.base_url}/api/download-report/{self.random.choice(self.video_ids)}')
+            response.content
+            status = response.status_code
+        except requests.RequestException:
+            status = None
+        return kind, time.perf_counter() - start, status
+
+
+def seed_analyses(base_url, videos):
+    """Analyze each synthetic video once so result and report requests have targets"""
+    video_ids = []
+    for video in videos:
+        with open(video, 'rb') as f:
+            response = requests.post(f'{base_url}/api/analyze', files={'video': (os.path.basename(video), f)})
+        response.raise_for_status()
+        video_ids.append(response.json()['video_id'])
+    return video_ids
+
+
+def run_level(base_url, concurrency, duration, mix, videos, video_ids, seed):
+    """Drive the server with concurrency clients for duration seconds"""
+    samples = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(index):
+        generator = TrafficGenerator(base_url, mix, videos, video_ids, seed + index)
+        while time.perf_counter() < deadline:
+            sample = generator.request()
+            with lock:
+                samples.append(sample)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'concurrency': concurrency,
+        'elapsed': elapsed,
+        'requests': len(samples),
+        'throughput': len(samples) / elapsed if elapsed else 0.0,
+        'errors': sum(1 for _, _, status in samples if status is None or status >= 500),
+        'latency': _latency_stats([latency for _, latency, _ in samples]),
+        'by_kind': {
+            kind: {
+                'requests': len(kind_samples),
+                'throughput': len(kind_samples) / elapsed if elapsed else 0.0,
+                'errors': sum(1 for _, _, status in kind_samples if status is None or status >= 500),
+                'latency': _latency_stats([latency for _, latency, _ in kind_samples])
+            }
+            for kind in REQUEST_KINDS
+            for kind_samples in [[s for s in samples if s[0] == kind]]
+            if kind_samples
+        }
+    }
+
+
+def _latency_stats(latencies):
+    if not latencies:
+        return None
+    values = np.array(latencies)
+    return {
+        'mean': float(values.mean()),
+        'p50': float(np.percentile(values, 50)),
+        'p95': float(np.percentile(values, 95)),
+        'p99': float(np.percentile(values, 99)),
+        'max': float(values.max())
+    }
+
+
+def _parse_int_list(value):
+    return [int(v) for v in value.split(',') if v]
+
+
+def _parse_mix(value):
+    mix = {}
+    for part in value.split(','):
+        kind, _, weight = part.partition('=')
+        if kind not in REQUEST_KINDS:
+            raise argparse.ArgumentTypeError(f"Unknown request kind '{kind}'")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Load test the VisionShield app with a stand-in model')
+    parser.add_argument('--workers', type=_parse_int_list, default=[1], help='Comma-separated gunicorn worker counts')
+    parser.add_argument('--threads', type=_parse_int_list, default=[2], help='Comma-separated gunicorn thread counts')
+    parser.add_argument('--concurrency', type=_parse_int_list, default=[1, 2, 4, 8],
+                        help='Comma-separated numbers of concurrent clients')
+    parser.add_argument('--duration', type=float, default=15.0, help='Seconds per concurrency level')
+    parser.add_argument('--mix', type=_parse_mix, default=_parse_mix(DEFAULT_MIX),
+                        help=f'Request weights (default: {DEFAULT_MIX})')
+    parser.add_argument('--model', choices=['tiny', 'sleep'], default='tiny', help='Stand-in model type')
+    parser.add_argument('--model-latency', type=float, default=0.5,
+                        help="Seconds per inference for --model sleep")
+    parser.add_argument('--videos', type=int, default=3, help='Number of distinct synthetic videos')
+    parser.add_argument('--video-size', default='640x360', help='Synthetic video size, WIDTHxHEIGHT')
+    parser.add_argument('--video-seconds', type=float, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quick', action='store_true', help='One configuration, concurrency 1,2 for 5 s each')
+    parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.workers, args.threads, args.concurrency, args.duration = [1], [2], [1, 2], 5.0
+    args.width, args.height = (int(v) for v in args.video_size.lower().split('x'))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix='visionshield-loadtest-')
+    report = {'settings': {
+        'duration': args.duration, 'mix': args.mix, 'model': args.model,
+        'model_latency': args.model_latency if args.model == 'sleep' else None,
+        'videos': args.videos, 'video_size': args.video_size, 'video_seconds': args.video_seconds,
+        'cpu_count': os.cpu_count()
+    }, 'configurations': []}
+
+    # The app logs with print(); keep stdout for the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        videos = [
+            make_video(os.path.join(workdir, 'videos'), width=args.width, height=args.height,
+                       seconds=args.video_seconds, seed=args.seed + i)
+            for i in range(args.videos)
+        ]
+
+        for workers in args.workers:
+            for threads in args.threads:
+                print(f"Starting gunicorn with {workers} worker(s) x {threads} thread(s)")
+                upload_folder = os.path.join(workdir, f'uploads_{workers}x{threads}')
+                app = build_app(upload_folder, args.model, args.model_latency)
+                configuration = {'workers': workers, 'threads': threads, 'levels': []}
+                with running_server(app, workers, threads) as base_url:
+                    video_ids = seed_analyses(base_url, videos)
+                    for concurrency in args.concurrency:
+                        level = run_level(base_url, concurrency, args.duration, args.mix,
+                                          videos, video_ids, args.seed)
+                        print(f"  concurrency {concurrency}: {level['throughput']:.1f} req/s, "
+                              f"p50 {level['latency']['p50'] * 1000:.0f} ms, "
+                              f"p95 {level['latency']['p95'] * 1000:.0f} ms, errors {level['errors']}")
+                        configuration['levels'].append(level)
+                report['configurations'].append(configuration)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# tools/synthetic.py
+# Deterministic synthetic test videos for benchmarks and load tests
+
+import os
+
+import cv2
+import numpy as np
+
+# Container extension for each FourCC the benchmarks use
+CODEC_EXTENSIONS = {
+    'mp4v': '.mp4',
+    'avc1': '.mp4',
+    'MJPG': '.avi',
+    'XVID': '.avi'
+}
+
+
+def make_video(output_dir, width=1280, height=720, seconds=10, fps=30, codec='mp4v', seed=0,
+               scene_length=3.0):
+    """
+    Write a synthetic video with moving shapes, texture noise and scene cuts
+
+    The content is fully determined by the arguments, so repeated runs and
+    different machines encode the same frames.
+
+    Args:
+        output_dir: Folder to write the video to
+        width, height: Frame size in pixels
+        seconds: Duration in seconds
+        fps: Frame rate
+        codec: FourCC passed to cv2.VideoWriter (see CODEC_EXTENSIONS)
+        seed: Random seed for colours, shapes and noise
+        scene_length: Seconds between hard cuts to a new background
+
+    Returns:
+        Path to the written video
+
+    Raises:
+        RuntimeError: If OpenCV has no encoder for the codec
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    extension = CODEC_EXTENSIONS.get(codec, '.avi')
+    path = os.path.join(output_dir, f"synthetic_{width}x{height}_{seconds}s_{fps}fps_{codec}_{seed}{extension}")
+    if os.path.exists(path):
+        return path
+
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*codec), fps, (width, height))
+    if not writer.isOpened():
+        raise RuntimeError(f"OpenCV cannot encode codec {codec}")
+
+    rng = np.random.RandomState(seed)
+    noise = rng.randint(0, 40, size=(height, width, 3), dtype=np.uint8)
+    frames_per_scene = max(1, int(scene_length * fps))
+    scale = min(width, height)
+
+    try:
+        for index in range(int(seconds * fps)):
+            if index % frames_per_scene == 0:
+                # Hard cut: new background colour and set of moving shapes
+                background = rng.randint(0, 200, size=3)
+                shapes = [
+                    (rng.rand(2), rng.uniform(-0.01, 0.01, size=2), rng.randint(20, 255, size=3),
+                     int(scale * rng.uniform(0.05, 0.2)))
+                    for _ in range(4)
+                ]
+
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            frame[:] = background
+            frame = cv2.add(frame, np.roll(noise, index * 3, axis=1))
+            step = index % frames_per_scene
+            for position, velocity, color, radius in shapes:
+                x, y = (position + velocity * step) % 1.0
+                cv2.circle(frame, (int(x * width), int(y * height)), radius,
+                           tuple(int(c) for c in color), -1, cv2.LINE_AA)
+            writer.write(frame)
+    finally:
+        writer.release()
+
+    return path